@@ -0,0 +1,116 @@
+"""
+
+raylib [benchmarks] example - cached layer
+
+The buildings of core_2d_camera, drawn every frame with 100 draw_rectangle_rec() calls, and then from a cached_layer()
+that records them into a render texture only when the camera turned, zoomed or panned past its margin. Shows the
+layer renders and the WebGL draw calls of a frame from the profiler. Press SPACE to switch.
+
+"""
+
+# Declaration / Initialization
+# ------------------------------------------------------------------------------------
+MAX_BUILDINGS = 100
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 450
+
+player = Rectangle(400, 280, 40, 40)
+buildings = []
+build_colors = []
+
+spacing = 0
+
+camera = None
+use_layer = False
+counts = {}  # "draw calls" or "cached layer" -> gpu counts of the last frame drawn that way
+# ------------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------------
+# Web main entry point
+# ------------------------------------------------------------------------------------
+def init():
+    global spacing, camera
+    init_window(SCREEN_WIDTH, SCREEN_HEIGHT, "raylib [benchmarks] example - cached layer")
+
+    for i in range(MAX_BUILDINGS):
+        width = get_random_value(50, 200)
+        height = get_random_value(100, 800)
+        buildings.append(Rectangle(-6000.0 + spacing, SCREEN_HEIGHT - 130.0 - height, width, height))
+        build_colors.append(Color(get_random_value(200, 240), get_random_value(200, 240), get_random_value(200, 250),
+                                  255))
+        spacing += width
+
+    camera = Camera2D()
+    camera.target = Vector2(player.x + 20.0, player.y + 20.0)
+    camera.offset = Vector2(SCREEN_WIDTH / 2.0, SCREEN_HEIGHT / 2.0)
+    camera.rotation = 0.0
+    camera.zoom = 1.0
+
+    enable_profiling()
+    set_target_fps(60)  # Set our game to run at 60 frames-per-second
+    # ------------------------------------------------------------------------------------
+
+
+def draw_buildings():
+    draw_rectangle(-6000, 320, 13000, 8000, DARKGRAY)
+    for i in range(MAX_BUILDINGS): draw_rectangle_rec(buildings[i], build_colors[i])
+
+
+# ------------------------------------------------------------------------------------
+# Web main loop
+# ------------------------------------------------------------------------------------
+def update():
+    global use_layer
+    # Update
+    # ----------------------------------------------------------------------------------
+    gpu = get_profile()["last_frame"].get("gpu")  # of the previous frame, drawn before SPACE switches
+    if gpu:
+        counts["cached layer" if use_layer else "draw calls"] = gpu
+    if is_key_pressed(KeyboardKey.KEY_SPACE):
+        use_layer = not use_layer
+
+    if is_key_down(KeyboardKey.KEY_RIGHT): player.x += 2
+    if is_key_down(KeyboardKey.KEY_LEFT): player.x -= 2
+    camera.target = Vector2(player.x + 20, player.y + 20)
+
+    if is_key_down(KeyboardKey.KEY_A):
+        camera.rotation = max(camera.rotation - 1, -40)
+    elif is_key_down(KeyboardKey.KEY_S):
+        camera.rotation = min(camera.rotation + 1, 40)
+
+    camera.zoom = min(max(camera.zoom + get_mouse_wheel_move() * 0.05, 0.1), 3.0)
+    # ----------------------------------------------------------------------------------
+
+    # Draw
+    # ----------------------------------------------------------------------------------
+    begin_drawing()
+
+    clear_background(RAYWHITE)
+
+    if use_layer:
+        # outside begin_mode_2d(), the layer draws with the camera itself
+        with cached_layer("buildings", camera, margin=200) as layer:
+            if layer.recording:
+                draw_buildings()
+    else:
+        begin_mode_2d(camera)
+        draw_buildings()
+        end_mode_2d()
+
+    begin_mode_2d(camera)
+    draw_rectangle_rec(player, RED)
+    end_mode_2d()
+
+    draw_rectangle(10, 10, 420, 110, fade(SKYBLUE, 0.9))
+    draw_text(f"{MAX_BUILDINGS} buildings {'from a cached layer' if use_layer else 'drawn each frame'}, "
+              f"SPACE to switch", 20, 20, 10, BLACK)
+    for i, name in enumerate(["draw calls", "cached layer"]):
+        gpu = counts.get(name)
+        text = f"{gpu['draw_calls']} WebGL draw calls, {gpu['batches']} batches" if gpu else "-"
+        draw_text(f"{name}: {text}", 20, 40 + i * 20, 10, DARKGRAY)
+    renders = cached_layer("buildings", camera, margin=200).renders
+    draw_text(f"layer renders: {renders}, arrows to move, A / S to rotate, wheel to zoom", 20, 80, 10, DARKGRAY)
+
+    end_drawing()
+    # ----------------------------------------------------------------------------------
@@ -0,0 +1,80 @@
+"""
+
+raylib [benchmarks] example - draw calls per frame
+
+Ramps up the number of draw_rectangle() calls per frame until the python side of the frame
+no longer fits in 1/60 of a second, first calling wasm directly and then with the command buffer.
+
+"""
+import time
+
+# Declaration / Initialization
+# ------------------------------------------------------------------------------------
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 450
+
+FRAME_BUDGET = 1.0 / 60.0  # seconds a frame can take to keep 60 frames-per-second
+FRAMES_PER_STEP = 30  # frames averaged before changing the number of calls
+
+MODES = ["direct", "command buffer"]
+
+mode = 0
+calls_per_frame = 100
+frames = 0
+elapsed = 0.0
+results = {}  # mode -> most calls per frame that fit in FRAME_BUDGET
+# ------------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------------
+# Web main entry point
+# ------------------------------------------------------------------------------------
+def init():
+    init_window(SCREEN_WIDTH, SCREEN_HEIGHT, "raylib [benchmarks] example - draw calls per frame")
+    # ------------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------------
+# Web main loop
+# ------------------------------------------------------------------------------------
+def update():
+    global mode, calls_per_frame, frames, elapsed
+    # Update
+    # ----------------------------------------------------------------------------------
+    if frames == FRAMES_PER_STEP and mode < len(MODES):
+        if elapsed / frames < FRAME_BUDGET:
+            results[MODES[mode]] = calls_per_frame
+            calls_per_frame = int(calls_per_frame * 1.25)
+        else:
+            # over budget, move on to the next mode and start the ramp again
+            mode += 1
+            calls_per_frame = 100
+            if mode < len(MODES) and MODES[mode] == "command buffer":
+                enable_command_buffer()
+        frames = 0
+        elapsed = 0.0
+    # ----------------------------------------------------------------------------------
+
+    # Draw
+    # ----------------------------------------------------------------------------------
+    start = time.perf_counter()
+
+    begin_drawing()
+
+    clear_background(RAYWHITE)
+
+    if mode < len(MODES):
+        for i in range(calls_per_frame):
+            draw_rectangle((i * 13) % SCREEN_WIDTH, (i * 7) % SCREEN_HEIGHT, 8, 8, MAROON)
+
+    draw_rectangle(10, 10, 330, 90, fade(SKYBLUE, 0.9))
+    if mode < len(MODES):
+        draw_text(f"mode: {MODES[mode]}, calls per frame: {calls_per_frame}", 20, 20, 10, BLACK)
+    for i, name in enumerate(MODES):
+        draw_text(f"{name}: {results.get(name, '-')} calls fit in a 60 fps frame", 20, 40 + i * 20, 10, DARKGRAY)
+
+    end_drawing()
+
+    elapsed += time.perf_counter() - start
+    frames += 1
+    # ----------------------------------------------------------------------------------
@@ -0,0 +1,121 @@
+"""
+
+raylib [benchmarks] example - sprites per frame
+
+Ramps up the number of moving sprites per frame until the frame no longer fits in 1/60 of a second,
+first with a draw_texture_pro() call per sprite and then with a SpriteBatch updated with numpy.
+
+"""
+import time
+
+import numpy
+
+# Declaration / Initialization
+# ------------------------------------------------------------------------------------
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 450
+
+FRAME_BUDGET = 1.0 / 60.0  # seconds a frame can take to keep 60 frames-per-second
+FRAMES_PER_STEP = 30  # frames averaged before changing the number of sprites
+MAX_SPRITES = 200000
+
+SPRITE_SIZE = 8
+
+MODES = ["draw_texture_pro", "sprite batch"]
+
+mode = 0
+sprites_per_frame = 1000
+frames = 0
+elapsed = 0.0
+results = {}  # mode -> most sprites per frame that fit in FRAME_BUDGET
+
+texture = None
+batch = None
+sprites = None
+velocities = None
+# ------------------------------------------------------------------------------------
+
+
+def new_sprites(count: int):
+    global sprites, velocities
+    sprites = SpriteBatch.new_sprites(count)
+    sprites["source_width"] = SPRITE_SIZE
+    sprites["source_height"] = SPRITE_SIZE
+    sprites["width"] = SPRITE_SIZE
+    sprites["height"] = SPRITE_SIZE
+    sprites["x"] = numpy.random.uniform(0, SCREEN_WIDTH - SPRITE_SIZE, count)
+    sprites["y"] = numpy.random.uniform(0, SCREEN_HEIGHT - SPRITE_SIZE, count)
+    sprites["tint"] = numpy.random.randint(50, 240, (count, 4))
+    sprites["tint"][:, 3] = 255
+    velocities = numpy.random.uniform(-2.0, 2.0, (count, 2)).astype(numpy.float32)
+
+
+# ------------------------------------------------------------------------------------
+# Web main entry point
+# ------------------------------------------------------------------------------------
+def init():
+    global texture, batch
+    init_window(SCREEN_WIDTH, SCREEN_HEIGHT, "raylib [benchmarks] example - sprites per frame")
+
+    image = gen_image_checked(SPRITE_SIZE, SPRITE_SIZE, SPRITE_SIZE // 2, SPRITE_SIZE // 2, WHITE, LIGHTGRAY)
+    texture = load_texture_from_image(image)
+    unload_image(image)
+
+    batch = SpriteBatch(texture, MAX_SPRITES)
+    new_sprites(sprites_per_frame)
+    # ------------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------------
+# Web main loop
+# ------------------------------------------------------------------------------------
+def update():
+    global mode, sprites_per_frame, frames, elapsed
+    # Update
+    # ----------------------------------------------------------------------------------
+    if frames == FRAMES_PER_STEP and mode < len(MODES):
+        if elapsed / frames < FRAME_BUDGET and sprites_per_frame < MAX_SPRITES:
+            results[MODES[mode]] = sprites_per_frame
+            sprites_per_frame = min(int(sprites_per_frame * 1.25), MAX_SPRITES)
+        else:
+            # over budget, move on to the next mode and start the ramp again
+            mode += 1
+            sprites_per_frame = 1000
+        new_sprites(sprites_per_frame)
+        frames = 0
+        elapsed = 0.0
+
+    start = time.perf_counter()
+
+    # bounce the sprites on the edges of the screen, all of them at once
+    sprites["x"] += velocities[:, 0]
+    sprites["y"] += velocities[:, 1]
+    velocities[(sprites["x"] < 0) | (sprites["x"] > SCREEN_WIDTH - SPRITE_SIZE), 0] *= -1
+    velocities[(sprites["y"] < 0) | (sprites["y"] > SCREEN_HEIGHT - SPRITE_SIZE), 1] *= -1
+    # ----------------------------------------------------------------------------------
+
+    # Draw
+    # ----------------------------------------------------------------------------------
+    begin_drawing()
+
+    clear_background(RAYWHITE)
+
+    if mode < len(MODES) and MODES[mode] == "draw_texture_pro":
+        source = Rectangle(0, 0, SPRITE_SIZE, SPRITE_SIZE)
+        origin = Vector2(0, 0)
+        for x, y, tint in zip(sprites["x"].tolist(), sprites["y"].tolist(), sprites["tint"].tolist()):
+            draw_texture_pro(texture, source, Rectangle(x, y, SPRITE_SIZE, SPRITE_SIZE), origin, 0.0, Color(*tint))
+    elif mode < len(MODES):
+        batch.draw(sprites)
+
+    draw_rectangle(10, 10, 330, 90, fade(SKYBLUE, 0.9))
+    if mode < len(MODES):
+        draw_text(f"mode: {MODES[mode]}, sprites per frame: {sprites_per_frame}", 20, 20, 10, BLACK)
+    for i, name in enumerate(MODES):
+        draw_text(f"{name}: {results.get(name, '-')} sprites fit in a 60 fps frame", 20, 40 + i * 20, 10, DARKGRAY)
+
+    end_drawing()
+
+    elapsed += time.perf_counter() - start
+    frames += 1
+    # ----------------------------------------------------------------------------------
@@ -0,0 +1,91 @@
+"""
+
+raylib [benchmarks] example - struct field access
+
+Compares struct field reads and writes through the cached heap views (what the generated
+struct properties use) with the DataView proxy calls the properties used before.
+
+"""
+import time
+
+# Declaration / Initialization
+# ------------------------------------------------------------------------------------
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 450
+
+ACCESSES_PER_FRAME = 2000
+
+vector = None
+totals = {}  # name -> (accesses, seconds)
+# ------------------------------------------------------------------------------------
+
+
+def dataview_read():
+    for i in range(ACCESSES_PER_FRAME):
+        _mod.mem.getFloat32(vector._address, True)
+
+
+def dataview_write():
+    for i in range(ACCESSES_PER_FRAME):
+        _mod.mem.setFloat32(vector._address, i, True)
+
+
+def heap_view_read():
+    for i in range(ACCESSES_PER_FRAME):
+        vector.x
+
+
+def heap_view_write():
+    for i in range(ACCESSES_PER_FRAME):
+        vector.x = i
+
+
+BENCHMARKS = [
+    ("DataView read", dataview_read),
+    ("DataView write", dataview_write),
+    ("heap view read", heap_view_read),
+    ("heap view write", heap_view_write),
+]
+
+
+# ------------------------------------------------------------------------------------
+# Web main entry point
+# ------------------------------------------------------------------------------------
+def init():
+    global vector
+    init_window(SCREEN_WIDTH, SCREEN_HEIGHT, "raylib [benchmarks] example - struct field access")
+
+    vector = Vector2(1.0, 2.0)
+    for name, benchmark in BENCHMARKS:
+        totals[name] = (0, 0.0)
+
+    set_target_fps(60)  # Set our game to run at 60 frames-per-second
+    # ------------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------------
+# Web main loop
+# ------------------------------------------------------------------------------------
+def update():
+    # Update
+    # ----------------------------------------------------------------------------------
+    for name, benchmark in BENCHMARKS:
+        start = time.perf_counter()
+        benchmark()
+        accesses, seconds = totals[name]
+        totals[name] = (accesses + ACCESSES_PER_FRAME, seconds + time.perf_counter() - start)
+    # ----------------------------------------------------------------------------------
+
+    # Draw
+    # ----------------------------------------------------------------------------------
+    begin_drawing()
+
+    clear_background(RAYWHITE)
+
+    draw_text("Vector2.x accesses per second", 20, 20, 20, BLACK)
+    for i, (name, benchmark) in enumerate(BENCHMARKS):
+        accesses, seconds = totals[name]
+        draw_text(f"{name}: {accesses / seconds:,.0f}", 40, 60 + i * 30, 20, DARKGRAY)
+
+    end_drawing()
+    # ----------------------------------------------------------------------------------
@@ -0,0 +1,129 @@
+"""
+
+raylib [benchmarks] example - struct instance memory
+
+Compares the __slots__ struct classes the wrapper generates with the same class
+keeping its attributes in a __dict__ (how the struct classes used to be generated):
+python memory per live instance, and attribute reads and writes per second.
+
+"""
+import time
+import tracemalloc
+
+# Declaration / Initialization
+# ------------------------------------------------------------------------------------
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 450
+
+INSTANCES = 10000
+ACCESSES_PER_FRAME = 2000
+
+memory = {}  # name -> bytes per instance
+totals = {}  # name -> (accesses, seconds)
+slots_vector = None
+dict_vector = None
+# ------------------------------------------------------------------------------------
+
+
+class DictVector2:
+    """Vector2 with its attributes in a __dict__, like the struct classes before __slots__"""
+
+    _size: int = 8
+
+    def __init__(self, x: float = 0.0, y: float = 0.0):
+        self._frozen = False
+        self._address = _struct_pool.alloc(8)
+        self._to_free = True
+        _heap.f32[self._address >> 2] = x
+        _heap.f32[(self._address + 4) >> 2] = y
+
+    @property
+    def x(self):
+        return _heap.f32[self._address >> 2]
+
+    @x.setter
+    def x(self, value):
+        if not self._frozen:
+            _heap.f32[self._address >> 2] = value
+
+    def __del__(self):
+        if self._to_free:
+            _struct_pool.release(self._address, 8)
+
+
+def bytes_per_instance(stype) -> float:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [stype(1.0, 2.0) for i in range(INSTANCES)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(instances)
+
+
+def read(vector):
+    for i in range(ACCESSES_PER_FRAME):
+        vector.x
+
+
+def write(vector):
+    for i in range(ACCESSES_PER_FRAME):
+        vector.x = i
+
+
+BENCHMARKS = [
+    ("__slots__ read", lambda: read(slots_vector)),
+    ("__dict__ read", lambda: read(dict_vector)),
+    ("__slots__ write", lambda: write(slots_vector)),
+    ("__dict__ write", lambda: write(dict_vector)),
+]
+
+
+# ------------------------------------------------------------------------------------
+# Web main entry point
+# ------------------------------------------------------------------------------------
+def init():
+    global slots_vector, dict_vector
+    init_window(SCREEN_WIDTH, SCREEN_HEIGHT, "raylib [benchmarks] example - struct instance memory")
+
+    memory["__slots__"] = bytes_per_instance(Vector2)
+    memory["__dict__"] = bytes_per_instance(DictVector2)
+
+    slots_vector = Vector2(1.0, 2.0)
+    dict_vector = DictVector2(1.0, 2.0)
+    for name, benchmark in BENCHMARKS:
+        totals[name] = (0, 0.0)
+
+    set_target_fps(60)  # Set our game to run at 60 frames-per-second
+    # ------------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------------
+# Web main loop
+# ------------------------------------------------------------------------------------
+def update():
+    # Update
+    # ----------------------------------------------------------------------------------
+    for name, benchmark in BENCHMARKS:
+        start = time.perf_counter()
+        benchmark()
+        accesses, seconds = totals[name]
+        totals[name] = (accesses + ACCESSES_PER_FRAME, seconds + time.perf_counter() - start)
+    # ----------------------------------------------------------------------------------
+
+    # Draw
+    # ----------------------------------------------------------------------------------
+    begin_drawing()
+
+    clear_background(RAYWHITE)
+
+    draw_text(f"python bytes per Vector2 ({INSTANCES} live instances)", 20, 20, 20, BLACK)
+    for i, (name, size) in enumerate(memory.items()):
+        draw_text(f"{name}: {size:.0f}", 40, 60 + i * 30, 20, DARKGRAY)
+
+    draw_text("Vector2.x accesses per second", 20, 140, 20, BLACK)
+    for i, (name, benchmark) in enumerate(BENCHMARKS):
+        accesses, seconds = totals[name]
+        draw_text(f"{name}: {accesses / seconds:,.0f}", 40, 180 + i * 30, 20, DARKGRAY)
+
+    end_drawing()
+    # ----------------------------------------------------------------------------------
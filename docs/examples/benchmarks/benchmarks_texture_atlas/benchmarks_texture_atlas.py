@@ -0,0 +1,86 @@
+"""
+
+raylib [benchmarks] example - texture atlas
+
+Draws the same sprites of 16 images, first each from its own texture and then from a TextureAtlas, and shows the
+WebGL draw calls, texture binds and rlgl batches of a frame from the profiler. Press SPACE to switch.
+
+"""
+
+# Declaration / Initialization
+# ------------------------------------------------------------------------------------
+SCREEN_WIDTH = 800
+SCREEN_HEIGHT = 450
+
+IMAGES = 16
+SPRITES = 2000
+SPRITE_SIZE = 16
+
+COLORS = [RED, ORANGE, GOLD, YELLOW, GREEN, LIME, DARKGREEN, SKYBLUE,
+          BLUE, DARKBLUE, PURPLE, VIOLET, DARKPURPLE, BEIGE, BROWN, MAROON]
+
+use_atlas = False
+textures = []
+regions = []
+counts = {}  # "textures" or "atlas" -> gpu counts of the last frame drawn that way
+# ------------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------------
+# Web main entry point
+# ------------------------------------------------------------------------------------
+def init():
+    init_window(SCREEN_WIDTH, SCREEN_HEIGHT, "raylib [benchmarks] example - texture atlas")
+
+    atlas = TextureAtlas(256, 256)
+    for i in range(IMAGES):
+        image = gen_image_checked(SPRITE_SIZE, SPRITE_SIZE, 4, 4, COLORS[i], WHITE)
+        textures.append(load_texture_from_image(image))
+        regions.append(atlas.add(i, image))
+        unload_image(image)
+    atlas.build()
+
+    enable_profiling()
+    # ------------------------------------------------------------------------------------
+
+
+# ------------------------------------------------------------------------------------
+# Web main loop
+# ------------------------------------------------------------------------------------
+def update():
+    global use_atlas
+    # Update
+    # ----------------------------------------------------------------------------------
+    gpu = get_profile()["last_frame"].get("gpu")  # of the previous frame, drawn before SPACE switches
+    if gpu:
+        counts["atlas" if use_atlas else "textures"] = gpu
+    if is_key_pressed(KeyboardKey.KEY_SPACE):
+        use_atlas = not use_atlas
+    # ----------------------------------------------------------------------------------
+
+    # Draw
+    # ----------------------------------------------------------------------------------
+    begin_drawing()
+
+    clear_background(RAYWHITE)
+
+    # the images alternate, so every sprite from its own texture switches textures
+    for i in range(SPRITES):
+        x = (i * 37) % (SCREEN_WIDTH - SPRITE_SIZE)
+        y = 110 + (i * 53) % (SCREEN_HEIGHT - 110 - SPRITE_SIZE)
+        if use_atlas:
+            regions[i % IMAGES].draw(x, y)
+        else:
+            draw_texture(textures[i % IMAGES], x, y, WHITE)
+
+    draw_rectangle(10, 10, 420, 90, fade(SKYBLUE, 0.9))
+    draw_text(f"{SPRITES} sprites from {'a texture atlas' if use_atlas else 'separate textures'}, SPACE to switch",
+              20, 20, 10, BLACK)
+    for i, name in enumerate(["textures", "atlas"]):
+        gpu = counts.get(name)
+        text = f"{gpu['draw_calls']} draw calls, {gpu['texture_binds']} texture binds, {gpu['batches']} batches" \
+            if gpu else "-"
+        draw_text(f"{name}: {text}", 20, 40 + i * 20, 10, DARKGRAY)
+
+    end_drawing()
+    # ----------------------------------------------------------------------------------
@@ -0,0 +1,1090 @@
+# Generated by tools/code_generation/filesGeneration.py, do not edit by hand
+# raygui.h, from tools/api/raygui.json
+import enum
+from wasmraypy.core import (
+    _heap,
+    _scratch_arena,
+    _struct_pool,
+    _new_struct,
+    Color,
+    Rectangle,
+    Font,
+    _check_int,
+    _check_float,
+    _check_str,
+    _check_struct,
+    _bind_wasm_functions,
+)
+
+
+class GuiStyleProp:
+    """Style property"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 8
+    _dtype_spec: dict = {"names": ["controlId", "propertyId", "propertyValue"], "formats": ["<u2", "<u2", "<u4"], "offsets": [0, 2, 4], "itemsize": 8}
+
+    def __init__(self, controlId: int = 0, propertyId: int = 0, propertyValue: int = 0, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(8)
+            self._to_free = _struct_pool
+            _heap.u16[self._address >> 1] = controlId
+            _heap.u16[(self._address + 2) >> 1] = propertyId
+            _heap.u32[(self._address + 4) >> 2] = propertyValue
+
+    @property
+    def controlId(self):
+        """"""
+        return _heap.u16[self._address >> 1]
+
+    @controlId.setter
+    def controlId(self, value):
+        if not self._frozen:
+            _heap.u16[self._address >> 1] = value
+
+    @property
+    def propertyId(self):
+        """"""
+        return _heap.u16[(self._address + 2) >> 1]
+
+    @propertyId.setter
+    def propertyId(self, value):
+        if not self._frozen:
+            _heap.u16[(self._address + 2) >> 1] = value
+
+    @property
+    def propertyValue(self):
+        """"""
+        return _heap.u32[(self._address + 4) >> 2]
+
+    @propertyValue.setter
+    def propertyValue(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 4) >> 2] = value
+
+    def __str__(self):
+        return f"GuiStyleProp(address={self._address}, {self.controlId}, {self.propertyId}, {self.propertyValue})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 8)
+
+class GuiState(enum.IntEnum):
+    """Gui control state"""
+    STATE_NORMAL: int = 0
+    STATE_FOCUSED: int = 1
+    STATE_PRESSED: int = 2
+    STATE_DISABLED: int = 3
+
+
+class GuiTextAlignment(enum.IntEnum):
+    """Gui control text alignment"""
+    TEXT_ALIGN_LEFT: int = 0
+    TEXT_ALIGN_CENTER: int = 1
+    TEXT_ALIGN_RIGHT: int = 2
+
+
+class GuiControl(enum.IntEnum):
+    """Gui controls"""
+    DEFAULT: int = 0
+    LABEL: int = 1  # Used also for: LABELBUTTON
+    BUTTON: int = 2
+    TOGGLE: int = 3  # Used also for: TOGGLEGROUP
+    SLIDER: int = 4  # Used also for: SLIDERBAR
+    PROGRESSBAR: int = 5
+    CHECKBOX: int = 6
+    COMBOBOX: int = 7
+    DROPDOWNBOX: int = 8
+    TEXTBOX: int = 9  # Used also for: TEXTBOXMULTI
+    VALUEBOX: int = 10
+    SPINNER: int = 11  # Uses: BUTTON, VALUEBOX
+    LISTVIEW: int = 12
+    COLORPICKER: int = 13
+    SCROLLBAR: int = 14
+    STATUSBAR: int = 15
+
+
+class GuiControlProperty(enum.IntEnum):
+    """Gui base properties for every control"""
+    BORDER_COLOR_NORMAL: int = 0
+    BASE_COLOR_NORMAL: int = 1
+    TEXT_COLOR_NORMAL: int = 2
+    BORDER_COLOR_FOCUSED: int = 3
+    BASE_COLOR_FOCUSED: int = 4
+    TEXT_COLOR_FOCUSED: int = 5
+    BORDER_COLOR_PRESSED: int = 6
+    BASE_COLOR_PRESSED: int = 7
+    TEXT_COLOR_PRESSED: int = 8
+    BORDER_COLOR_DISABLED: int = 9
+    BASE_COLOR_DISABLED: int = 10
+    TEXT_COLOR_DISABLED: int = 11
+    BORDER_WIDTH: int = 12
+    TEXT_PADDING: int = 13
+    TEXT_ALIGNMENT: int = 14
+    RESERVED: int = 15
+
+
+class GuiDefaultProperty(enum.IntEnum):
+    """DEFAULT extended properties"""
+    TEXT_SIZE: int = 16  # Text size (glyphs max height)
+    TEXT_SPACING: int = 17  # Text spacing between glyphs
+    LINE_COLOR: int = 18  # Line control color
+    BACKGROUND_COLOR: int = 19  # Background color
+    TEXT_LINE_SPACING: int = 20  # Text spacing between lines
+
+
+class GuiToggleProperty(enum.IntEnum):
+    """Toggle/ToggleGroup"""
+    GROUP_PADDING: int = 16  # ToggleGroup separation between toggles
+
+
+class GuiSliderProperty(enum.IntEnum):
+    """Slider/SliderBar"""
+    SLIDER_WIDTH: int = 16  # Slider size of internal bar
+    SLIDER_PADDING: int = 17  # Slider/SliderBar internal bar padding
+
+
+class GuiProgressBarProperty(enum.IntEnum):
+    """ProgressBar"""
+    PROGRESS_PADDING: int = 16  # ProgressBar internal padding
+
+
+class GuiScrollBarProperty(enum.IntEnum):
+    """ScrollBar"""
+    ARROWS_SIZE: int = 16
+    ARROWS_VISIBLE: int = 17
+    SCROLL_SLIDER_PADDING: int = 18  # (SLIDERBAR, SLIDER_PADDING)
+    SCROLL_SLIDER_SIZE: int = 19
+    SCROLL_PADDING: int = 20
+    SCROLL_SPEED: int = 21
+
+
+class GuiCheckBoxProperty(enum.IntEnum):
+    """CheckBox"""
+    CHECK_PADDING: int = 16  # CheckBox internal check padding
+
+
+class GuiComboBoxProperty(enum.IntEnum):
+    """ComboBox"""
+    COMBO_BUTTON_WIDTH: int = 16  # ComboBox right button width
+    COMBO_BUTTON_SPACING: int = 17  # ComboBox button separation
+
+
+class GuiDropdownBoxProperty(enum.IntEnum):
+    """DropdownBox"""
+    ARROW_PADDING: int = 16  # DropdownBox arrow separation from border and items
+    DROPDOWN_ITEMS_SPACING: int = 17  # DropdownBox items separation
+
+
+class GuiTextBoxProperty(enum.IntEnum):
+    """TextBox/TextBoxMulti/ValueBox/Spinner"""
+    TEXT_INNER_PADDING: int = 16  # TextBox/TextBoxMulti/ValueBox/Spinner inner text padding
+    TEXT_LINES_SPACING: int = 17  # TextBoxMulti lines separation
+    TEXT_ALIGNMENT_VERTICAL: int = 18  # TextBoxMulti vertical alignment: 0-CENTERED, 1-UP, 2-DOWN
+    TEXT_MULTILINE: int = 19  # TextBox supports multiple lines
+    TEXT_WRAP_MODE: int = 20  # TextBox wrap mode for multiline: 0-NO_WRAP, 1-CHAR_WRAP, 2-WORD_WRAP
+
+
+class GuiSpinnerProperty(enum.IntEnum):
+    """Spinner"""
+    SPIN_BUTTON_WIDTH: int = 16  # Spinner left/right buttons width
+    SPIN_BUTTON_SPACING: int = 17  # Spinner buttons separation
+
+
+class GuiListViewProperty(enum.IntEnum):
+    """ListView"""
+    LIST_ITEMS_HEIGHT: int = 16  # ListView items height
+    LIST_ITEMS_SPACING: int = 17  # ListView items separation
+    SCROLLBAR_WIDTH: int = 18  # ListView scrollbar size (usually width)
+    SCROLLBAR_SIDE: int = 19  # ListView scrollbar side (0-left, 1-right)
+
+
+class GuiColorPickerProperty(enum.IntEnum):
+    """ColorPicker"""
+    COLOR_SELECTOR_SIZE: int = 16
+    HUEBAR_WIDTH: int = 17  # ColorPicker right hue bar width
+    HUEBAR_PADDING: int = 18  # ColorPicker right hue bar separation from panel
+    HUEBAR_SELECTOR_HEIGHT: int = 19  # ColorPicker right hue bar selector height
+    HUEBAR_SELECTOR_OVERFLOW: int = 20  # ColorPicker right hue bar selector overflow
+
+
+class GuiIconName(enum.IntEnum):
+    ICON_NONE: int = 0
+    ICON_FOLDER_FILE_OPEN: int = 1
+    ICON_FILE_SAVE_CLASSIC: int = 2
+    ICON_FOLDER_OPEN: int = 3
+    ICON_FOLDER_SAVE: int = 4
+    ICON_FILE_OPEN: int = 5
+    ICON_FILE_SAVE: int = 6
+    ICON_FILE_EXPORT: int = 7
+    ICON_FILE_ADD: int = 8
+    ICON_FILE_DELETE: int = 9
+    ICON_FILETYPE_TEXT: int = 10
+    ICON_FILETYPE_AUDIO: int = 11
+    ICON_FILETYPE_IMAGE: int = 12
+    ICON_FILETYPE_PLAY: int = 13
+    ICON_FILETYPE_VIDEO: int = 14
+    ICON_FILETYPE_INFO: int = 15
+    ICON_FILE_COPY: int = 16
+    ICON_FILE_CUT: int = 17
+    ICON_FILE_PASTE: int = 18
+    ICON_CURSOR_HAND: int = 19
+    ICON_CURSOR_POINTER: int = 20
+    ICON_CURSOR_CLASSIC: int = 21
+    ICON_PENCIL: int = 22
+    ICON_PENCIL_BIG: int = 23
+    ICON_BRUSH_CLASSIC: int = 24
+    ICON_BRUSH_PAINTER: int = 25
+    ICON_WATER_DROP: int = 26
+    ICON_COLOR_PICKER: int = 27
+    ICON_RUBBER: int = 28
+    ICON_COLOR_BUCKET: int = 29
+    ICON_TEXT_T: int = 30
+    ICON_TEXT_A: int = 31
+    ICON_SCALE: int = 32
+    ICON_RESIZE: int = 33
+    ICON_FILTER_POINT: int = 34
+    ICON_FILTER_BILINEAR: int = 35
+    ICON_CROP: int = 36
+    ICON_CROP_ALPHA: int = 37
+    ICON_SQUARE_TOGGLE: int = 38
+    ICON_SYMMETRY: int = 39
+    ICON_SYMMETRY_HORIZONTAL: int = 40
+    ICON_SYMMETRY_VERTICAL: int = 41
+    ICON_LENS: int = 42
+    ICON_LENS_BIG: int = 43
+    ICON_EYE_ON: int = 44
+    ICON_EYE_OFF: int = 45
+    ICON_FILTER_TOP: int = 46
+    ICON_FILTER: int = 47
+    ICON_TARGET_POINT: int = 48
+    ICON_TARGET_SMALL: int = 49
+    ICON_TARGET_BIG: int = 50
+    ICON_TARGET_MOVE: int = 51
+    ICON_CURSOR_MOVE: int = 52
+    ICON_CURSOR_SCALE: int = 53
+    ICON_CURSOR_SCALE_RIGHT: int = 54
+    ICON_CURSOR_SCALE_LEFT: int = 55
+    ICON_UNDO: int = 56
+    ICON_REDO: int = 57
+    ICON_REREDO: int = 58
+    ICON_MUTATE: int = 59
+    ICON_ROTATE: int = 60
+    ICON_REPEAT: int = 61
+    ICON_SHUFFLE: int = 62
+    ICON_EMPTYBOX: int = 63
+    ICON_TARGET: int = 64
+    ICON_TARGET_SMALL_FILL: int = 65
+    ICON_TARGET_BIG_FILL: int = 66
+    ICON_TARGET_MOVE_FILL: int = 67
+    ICON_CURSOR_MOVE_FILL: int = 68
+    ICON_CURSOR_SCALE_FILL: int = 69
+    ICON_CURSOR_SCALE_RIGHT_FILL: int = 70
+    ICON_CURSOR_SCALE_LEFT_FILL: int = 71
+    ICON_UNDO_FILL: int = 72
+    ICON_REDO_FILL: int = 73
+    ICON_REREDO_FILL: int = 74
+    ICON_MUTATE_FILL: int = 75
+    ICON_ROTATE_FILL: int = 76
+    ICON_REPEAT_FILL: int = 77
+    ICON_SHUFFLE_FILL: int = 78
+    ICON_EMPTYBOX_SMALL: int = 79
+    ICON_BOX: int = 80
+    ICON_BOX_TOP: int = 81
+    ICON_BOX_TOP_RIGHT: int = 82
+    ICON_BOX_RIGHT: int = 83
+    ICON_BOX_BOTTOM_RIGHT: int = 84
+    ICON_BOX_BOTTOM: int = 85
+    ICON_BOX_BOTTOM_LEFT: int = 86
+    ICON_BOX_LEFT: int = 87
+    ICON_BOX_TOP_LEFT: int = 88
+    ICON_BOX_CENTER: int = 89
+    ICON_BOX_CIRCLE_MASK: int = 90
+    ICON_POT: int = 91
+    ICON_ALPHA_MULTIPLY: int = 92
+    ICON_ALPHA_CLEAR: int = 93
+    ICON_DITHERING: int = 94
+    ICON_MIPMAPS: int = 95
+    ICON_BOX_GRID: int = 96
+    ICON_GRID: int = 97
+    ICON_BOX_CORNERS_SMALL: int = 98
+    ICON_BOX_CORNERS_BIG: int = 99
+    ICON_FOUR_BOXES: int = 100
+    ICON_GRID_FILL: int = 101
+    ICON_BOX_MULTISIZE: int = 102
+    ICON_ZOOM_SMALL: int = 103
+    ICON_ZOOM_MEDIUM: int = 104
+    ICON_ZOOM_BIG: int = 105
+    ICON_ZOOM_ALL: int = 106
+    ICON_ZOOM_CENTER: int = 107
+    ICON_BOX_DOTS_SMALL: int = 108
+    ICON_BOX_DOTS_BIG: int = 109
+    ICON_BOX_CONCENTRIC: int = 110
+    ICON_BOX_GRID_BIG: int = 111
+    ICON_OK_TICK: int = 112
+    ICON_CROSS: int = 113
+    ICON_ARROW_LEFT: int = 114
+    ICON_ARROW_RIGHT: int = 115
+    ICON_ARROW_DOWN: int = 116
+    ICON_ARROW_UP: int = 117
+    ICON_ARROW_LEFT_FILL: int = 118
+    ICON_ARROW_RIGHT_FILL: int = 119
+    ICON_ARROW_DOWN_FILL: int = 120
+    ICON_ARROW_UP_FILL: int = 121
+    ICON_AUDIO: int = 122
+    ICON_FX: int = 123
+    ICON_WAVE: int = 124
+    ICON_WAVE_SINUS: int = 125
+    ICON_WAVE_SQUARE: int = 126
+    ICON_WAVE_TRIANGULAR: int = 127
+    ICON_CROSS_SMALL: int = 128
+    ICON_PLAYER_PREVIOUS: int = 129
+    ICON_PLAYER_PLAY_BACK: int = 130
+    ICON_PLAYER_PLAY: int = 131
+    ICON_PLAYER_PAUSE: int = 132
+    ICON_PLAYER_STOP: int = 133
+    ICON_PLAYER_NEXT: int = 134
+    ICON_PLAYER_RECORD: int = 135
+    ICON_MAGNET: int = 136
+    ICON_LOCK_CLOSE: int = 137
+    ICON_LOCK_OPEN: int = 138
+    ICON_CLOCK: int = 139
+    ICON_TOOLS: int = 140
+    ICON_GEAR: int = 141
+    ICON_GEAR_BIG: int = 142
+    ICON_BIN: int = 143
+    ICON_HAND_POINTER: int = 144
+    ICON_LASER: int = 145
+    ICON_COIN: int = 146
+    ICON_EXPLOSION: int = 147
+    ICON_1UP: int = 148
+    ICON_PLAYER: int = 149
+    ICON_PLAYER_JUMP: int = 150
+    ICON_KEY: int = 151
+    ICON_DEMON: int = 152
+    ICON_TEXT_POPUP: int = 153
+    ICON_GEAR_EX: int = 154
+    ICON_CRACK: int = 155
+    ICON_CRACK_POINTS: int = 156
+    ICON_STAR: int = 157
+    ICON_DOOR: int = 158
+    ICON_EXIT: int = 159
+    ICON_MODE_2D: int = 160
+    ICON_MODE_3D: int = 161
+    ICON_CUBE: int = 162
+    ICON_CUBE_FACE_TOP: int = 163
+    ICON_CUBE_FACE_LEFT: int = 164
+    ICON_CUBE_FACE_FRONT: int = 165
+    ICON_CUBE_FACE_BOTTOM: int = 166
+    ICON_CUBE_FACE_RIGHT: int = 167
+    ICON_CUBE_FACE_BACK: int = 168
+    ICON_CAMERA: int = 169
+    ICON_SPECIAL: int = 170
+    ICON_LINK_NET: int = 171
+    ICON_LINK_BOXES: int = 172
+    ICON_LINK_MULTI: int = 173
+    ICON_LINK: int = 174
+    ICON_LINK_BROKE: int = 175
+    ICON_TEXT_NOTES: int = 176
+    ICON_NOTEBOOK: int = 177
+    ICON_SUITCASE: int = 178
+    ICON_SUITCASE_ZIP: int = 179
+    ICON_MAILBOX: int = 180
+    ICON_MONITOR: int = 181
+    ICON_PRINTER: int = 182
+    ICON_PHOTO_CAMERA: int = 183
+    ICON_PHOTO_CAMERA_FLASH: int = 184
+    ICON_HOUSE: int = 185
+    ICON_HEART: int = 186
+    ICON_CORNER: int = 187
+    ICON_VERTICAL_BARS: int = 188
+    ICON_VERTICAL_BARS_FILL: int = 189
+    ICON_LIFE_BARS: int = 190
+    ICON_INFO: int = 191
+    ICON_CROSSLINE: int = 192
+    ICON_HELP: int = 193
+    ICON_FILETYPE_ALPHA: int = 194
+    ICON_FILETYPE_HOME: int = 195
+    ICON_LAYERS_VISIBLE: int = 196
+    ICON_LAYERS: int = 197
+    ICON_WINDOW: int = 198
+    ICON_HIDPI: int = 199
+    ICON_FILETYPE_BINARY: int = 200
+    ICON_HEX: int = 201
+    ICON_SHIELD: int = 202
+    ICON_FILE_NEW: int = 203
+    ICON_FOLDER_ADD: int = 204
+    ICON_ALARM: int = 205
+    ICON_CPU: int = 206
+    ICON_ROM: int = 207
+    ICON_STEP_OVER: int = 208
+    ICON_STEP_INTO: int = 209
+    ICON_STEP_OUT: int = 210
+    ICON_RESTART: int = 211
+    ICON_BREAKPOINT_ON: int = 212
+    ICON_BREAKPOINT_OFF: int = 213
+    ICON_BURGER_MENU: int = 214
+    ICON_CASE_SENSITIVE: int = 215
+    ICON_REG_EXP: int = 216
+    ICON_FOLDER: int = 217
+    ICON_FILE: int = 218
+    ICON_SAND_TIMER: int = 219
+    ICON_220: int = 220
+    ICON_221: int = 221
+    ICON_222: int = 222
+    ICON_223: int = 223
+    ICON_224: int = 224
+    ICON_225: int = 225
+    ICON_226: int = 226
+    ICON_227: int = 227
+    ICON_228: int = 228
+    ICON_229: int = 229
+    ICON_230: int = 230
+    ICON_231: int = 231
+    ICON_232: int = 232
+    ICON_233: int = 233
+    ICON_234: int = 234
+    ICON_235: int = 235
+    ICON_236: int = 236
+    ICON_237: int = 237
+    ICON_238: int = 238
+    ICON_239: int = 239
+    ICON_240: int = 240
+    ICON_241: int = 241
+    ICON_242: int = 242
+    ICON_243: int = 243
+    ICON_244: int = 244
+    ICON_245: int = 245
+    ICON_246: int = 246
+    ICON_247: int = 247
+    ICON_248: int = 248
+    ICON_249: int = 249
+    ICON_250: int = 250
+    ICON_251: int = 251
+    ICON_252: int = 252
+    ICON_253: int = 253
+    ICON_254: int = 254
+    ICON_255: int = 255
+
+
+RAYGUI_VERSION_MAJOR: int = 4
+RAYGUI_VERSION_MINOR: int = 0
+RAYGUI_VERSION_PATCH: int = 0
+RAYGUI_VERSION: str = "4.0-dev"
+SCROLLBAR_LEFT_SIDE: int = 0
+SCROLLBAR_RIGHT_SIDE: int = 1
+
+def gui_enable():
+    """Enable gui controls (global state)"""
+    _GuiEnable()
+
+
+def gui_disable():
+    """Disable gui controls (global state)"""
+    _GuiDisable()
+
+
+def gui_lock():
+    """Lock gui controls (global state)"""
+    _GuiLock()
+
+
+def gui_unlock():
+    """Unlock gui controls (global state)"""
+    _GuiUnlock()
+
+
+def gui_is_locked() -> int:
+    """Check if gui is locked (global state)"""
+    return_interface = _GuiIsLocked()
+    return return_interface
+
+
+def gui_fade(alpha: float):
+    """Set gui controls alpha (global state), alpha goes from 0.0f to 1.0f"""
+    if __debug__:
+        _check_float("gui_fade", "alpha", alpha)
+    _GuiFade(alpha)
+
+
+def gui_set_state(state: int):
+    """Set gui state (global state)"""
+    if __debug__:
+        _check_int("gui_set_state", "state", state, -2147483648, 2147483647)
+    _GuiSetState(state)
+
+
+def gui_get_state() -> int:
+    """Get gui state (global state)"""
+    return_interface = _GuiGetState()
+    return return_interface
+
+
+def gui_set_font(font: Font):
+    """Set gui custom font (global state)"""
+    if __debug__:
+        _check_struct("gui_set_font", "font", font, Font)
+    _GuiSetFont(font._address)
+
+
+def gui_get_font(out: Font = None) -> Font:
+    """Get gui custom font (global state)"""
+    if __debug__:
+        if out is not None:
+            _check_struct("gui_get_font", "out", out, Font)
+    Font_ = _new_struct(Font) if out is None or out.__class__ is not Font else out
+    _GuiGetFont(Font_._address)
+    if out is not None and out is not Font_:
+        out._assign(Font_)  # a shadow struct
+        return out
+    return Font_
+
+
+def gui_set_style(control: int, property: int, value: int):
+    """Set one style property"""
+    if __debug__:
+        _check_int("gui_set_style", "control", control, -2147483648, 2147483647)
+        _check_int("gui_set_style", "property", property, -2147483648, 2147483647)
+        _check_int("gui_set_style", "value", value, -2147483648, 2147483647)
+    _GuiSetStyle(control, property, value)
+
+
+def gui_get_style(control: int, property: int) -> int:
+    """Get one style property"""
+    if __debug__:
+        _check_int("gui_get_style", "control", control, -2147483648, 2147483647)
+        _check_int("gui_get_style", "property", property, -2147483648, 2147483647)
+    return_interface = _GuiGetStyle(control, property)
+    return return_interface
+
+
+def gui_load_style(fileName: str):
+    """Load style file over global style variable (.rgs)"""
+    if __debug__:
+        _check_str("gui_load_style", "fileName", fileName)
+    fileName_ = _scratch_arena.string(fileName)
+    _GuiLoadStyle(fileName_)
+
+
+def gui_load_style_default():
+    """Load style default over global style"""
+    _GuiLoadStyleDefault()
+
+
+def gui_enable_tooltip():
+    """Enable gui tooltips (global state)"""
+    _GuiEnableTooltip()
+
+
+def gui_disable_tooltip():
+    """Disable gui tooltips (global state)"""
+    _GuiDisableTooltip()
+
+
+def gui_set_tooltip(tooltip: str):
+    """Set tooltip string"""
+    if __debug__:
+        _check_str("gui_set_tooltip", "tooltip", tooltip)
+    tooltip_ = _scratch_arena.string(tooltip)
+    _GuiSetTooltip(tooltip_)
+
+
+def gui_icon_text(iconId: int, text: str) -> int:
+    """Get text with icon id prepended (if supported)"""
+    if __debug__:
+        _check_int("gui_icon_text", "iconId", iconId, -2147483648, 2147483647)
+        _check_str("gui_icon_text", "text", text)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GuiIconText(iconId, text_)
+    return return_interface
+
+
+def gui_set_icon_scale(scale: int):
+    """Set default icon drawing size"""
+    if __debug__:
+        _check_int("gui_set_icon_scale", "scale", scale, -2147483648, 2147483647)
+    _GuiSetIconScale(scale)
+
+
+def gui_get_icons() -> int:
+    """Get raygui icons data pointer"""
+    return_interface = _GuiGetIcons()
+    return return_interface
+
+
+def gui_load_icons(fileName: str, loadIconsName: int) -> int:
+    """Load raygui icons file (.rgi) into internal icons data"""
+    if __debug__:
+        _check_str("gui_load_icons", "fileName", fileName)
+        _check_int("gui_load_icons", "loadIconsName", loadIconsName, -128, 127)
+    fileName_ = _scratch_arena.string(fileName)
+    return_interface = _GuiLoadIcons(fileName_, loadIconsName)
+    return return_interface
+
+
+def gui_draw_icon(iconId: int, posX: int, posY: int, pixelSize: int, color: Color):
+    """Draw icon using pixel size at specified position"""
+    if __debug__:
+        _check_int("gui_draw_icon", "iconId", iconId, -2147483648, 2147483647)
+        _check_int("gui_draw_icon", "posX", posX, -2147483648, 2147483647)
+        _check_int("gui_draw_icon", "posY", posY, -2147483648, 2147483647)
+        _check_int("gui_draw_icon", "pixelSize", pixelSize, -2147483648, 2147483647)
+        _check_struct("gui_draw_icon", "color", color, Color)
+    _GuiDrawIcon(iconId, posX, posY, pixelSize, color._address)
+
+
+def gui_window_box(bounds: Rectangle, title: str) -> int:
+    """Window Box control, shows a window that can be closed"""
+    if __debug__:
+        _check_struct("gui_window_box", "bounds", bounds, Rectangle)
+        _check_str("gui_window_box", "title", title)
+    title_ = _scratch_arena.string(title)
+    return_interface = _GuiWindowBox(bounds._address, title_)
+    return return_interface
+
+
+def gui_group_box(bounds: Rectangle, text: str) -> int:
+    """Group Box control with text name"""
+    if __debug__:
+        _check_struct("gui_group_box", "bounds", bounds, Rectangle)
+        _check_str("gui_group_box", "text", text)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GuiGroupBox(bounds._address, text_)
+    return return_interface
+
+
+def gui_line(bounds: Rectangle, text: str) -> int:
+    """Line separator control, could contain text"""
+    if __debug__:
+        _check_struct("gui_line", "bounds", bounds, Rectangle)
+        _check_str("gui_line", "text", text)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GuiLine(bounds._address, text_)
+    return return_interface
+
+
+def gui_panel(bounds: Rectangle, text: str) -> int:
+    """Panel control, useful to group controls"""
+    if __debug__:
+        _check_struct("gui_panel", "bounds", bounds, Rectangle)
+        _check_str("gui_panel", "text", text)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GuiPanel(bounds._address, text_)
+    return return_interface
+
+
+def gui_tab_bar(bounds: Rectangle, text: int, count: int, active: int) -> int:
+    """Tab Bar control, returns TAB to be closed or -1"""
+    if __debug__:
+        _check_struct("gui_tab_bar", "bounds", bounds, Rectangle)
+        _check_int("gui_tab_bar", "text", text, 0, 4294967295)
+        _check_int("gui_tab_bar", "count", count, -2147483648, 2147483647)
+        _check_int("gui_tab_bar", "active", active, 0, 4294967295)
+    return_interface = _GuiTabBar(bounds._address, text, count, active)
+    return return_interface
+
+
+def gui_scroll_panel(bounds: Rectangle, text: str, content: Rectangle, scroll: int, view: int) -> int:
+    """Scroll Panel control"""
+    if __debug__:
+        _check_struct("gui_scroll_panel", "bounds", bounds, Rectangle)
+        _check_str("gui_scroll_panel", "text", text)
+        _check_struct("gui_scroll_panel", "content", content, Rectangle)
+        _check_int("gui_scroll_panel", "scroll", scroll, 0, 4294967295)
+        _check_int("gui_scroll_panel", "view", view, 0, 4294967295)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GuiScrollPanel(bounds._address, text_, content._address, scroll, view)
+    return return_interface
+
+
+def gui_label(bounds: Rectangle, text: str) -> int:
+    """Label control, shows text"""
+    if __debug__:
+        _check_struct("gui_label", "bounds", bounds, Rectangle)
+        _check_str("gui_label", "text", text)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GuiLabel(bounds._address, text_)
+    return return_interface
+
+
+def gui_button(bounds: Rectangle, text: str) -> int:
+    """Button control, returns true when clicked"""
+    if __debug__:
+        _check_struct("gui_button", "bounds", bounds, Rectangle)
+        _check_str("gui_button", "text", text)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GuiButton(bounds._address, text_)
+    return return_interface
+
+
+def gui_label_button(bounds: Rectangle, text: str) -> int:
+    """Label button control, show true when clicked"""
+    if __debug__:
+        _check_struct("gui_label_button", "bounds", bounds, Rectangle)
+        _check_str("gui_label_button", "text", text)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GuiLabelButton(bounds._address, text_)
+    return return_interface
+
+
+def gui_toggle(bounds: Rectangle, text: str, active: int) -> int:
+    """Toggle Button control, returns true when active"""
+    if __debug__:
+        _check_struct("gui_toggle", "bounds", bounds, Rectangle)
+        _check_str("gui_toggle", "text", text)
+        _check_int("gui_toggle", "active", active, 0, 4294967295)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GuiToggle(bounds._address, text_, active)
+    return return_interface
+
+
+def gui_toggle_group(bounds: Rectangle, text: str, active: int) -> int:
+    """Toggle Group control, returns active toggle index"""
+    if __debug__:
+        _check_struct("gui_toggle_group", "bounds", bounds, Rectangle)
+        _check_str("gui_toggle_group", "text", text)
+        _check_int("gui_toggle_group", "active", active, 0, 4294967295)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GuiToggleGroup(bounds._address, text_, active)
+    return return_interface
+
+
+def gui_check_box(bounds: Rectangle, text: str, checked: int) -> int:
+    """Check Box control, returns true when active"""
+    if __debug__:
+        _check_struct("gui_check_box", "bounds", bounds, Rectangle)
+        _check_str("gui_check_box", "text", text)
+        _check_int("gui_check_box", "checked", checked, 0, 4294967295)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GuiCheckBox(bounds._address, text_, checked)
+    return return_interface
+
+
+def gui_combo_box(bounds: Rectangle, text: str, active: int) -> int:
+    """Combo Box control, returns selected item index"""
+    if __debug__:
+        _check_struct("gui_combo_box", "bounds", bounds, Rectangle)
+        _check_str("gui_combo_box", "text", text)
+        _check_int("gui_combo_box", "active", active, 0, 4294967295)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GuiComboBox(bounds._address, text_, active)
+    return return_interface
+
+
+def gui_dropdown_box(bounds: Rectangle, text: str, active: int, editMode: int) -> int:
+    """Dropdown Box control, returns selected item"""
+    if __debug__:
+        _check_struct("gui_dropdown_box", "bounds", bounds, Rectangle)
+        _check_str("gui_dropdown_box", "text", text)
+        _check_int("gui_dropdown_box", "active", active, 0, 4294967295)
+        _check_int("gui_dropdown_box", "editMode", editMode, -128, 127)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GuiDropdownBox(bounds._address, text_, active, editMode)
+    return return_interface
+
+
+def gui_spinner(bounds: Rectangle, text: str, value: int, minValue: int, maxValue: int, editMode: int) -> int:
+    """Spinner control, returns selected value"""
+    if __debug__:
+        _check_struct("gui_spinner", "bounds", bounds, Rectangle)
+        _check_str("gui_spinner", "text", text)
+        _check_int("gui_spinner", "value", value, 0, 4294967295)
+        _check_int("gui_spinner", "minValue", minValue, -2147483648, 2147483647)
+        _check_int("gui_spinner", "maxValue", maxValue, -2147483648, 2147483647)
+        _check_int("gui_spinner", "editMode", editMode, -128, 127)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GuiSpinner(bounds._address, text_, value, minValue, maxValue, editMode)
+    return return_interface
+
+
+def gui_value_box(bounds: Rectangle, text: str, value: int, minValue: int, maxValue: int, editMode: int) -> int:
+    """Value Box control, updates input text with numbers"""
+    if __debug__:
+        _check_struct("gui_value_box", "bounds", bounds, Rectangle)
+        _check_str("gui_value_box", "text", text)
+        _check_int("gui_value_box", "value", value, 0, 4294967295)
+        _check_int("gui_value_box", "minValue", minValue, -2147483648, 2147483647)
+        _check_int("gui_value_box", "maxValue", maxValue, -2147483648, 2147483647)
+        _check_int("gui_value_box", "editMode", editMode, -128, 127)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GuiValueBox(bounds._address, text_, value, minValue, maxValue, editMode)
+    return return_interface
+
+
+def gui_text_box(bounds: Rectangle, text: int, textSize: int, editMode: int) -> int:
+    """Text Box control, updates input text"""
+    if __debug__:
+        _check_struct("gui_text_box", "bounds", bounds, Rectangle)
+        _check_int("gui_text_box", "text", text, 0, 4294967295)
+        _check_int("gui_text_box", "textSize", textSize, -2147483648, 2147483647)
+        _check_int("gui_text_box", "editMode", editMode, -128, 127)
+    return_interface = _GuiTextBox(bounds._address, text, textSize, editMode)
+    return return_interface
+
+
+def gui_slider(bounds: Rectangle, textLeft: str, textRight: str, value: int, minValue: float, maxValue: float) -> int:
+    """Slider control, returns selected value"""
+    if __debug__:
+        _check_struct("gui_slider", "bounds", bounds, Rectangle)
+        _check_str("gui_slider", "textLeft", textLeft)
+        _check_str("gui_slider", "textRight", textRight)
+        _check_int("gui_slider", "value", value, 0, 4294967295)
+        _check_float("gui_slider", "minValue", minValue)
+        _check_float("gui_slider", "maxValue", maxValue)
+    textLeft_ = _scratch_arena.string(textLeft)
+    textRight_ = _scratch_arena.string(textRight)
+    return_interface = _GuiSlider(bounds._address, textLeft_, textRight_, value, minValue, maxValue)
+    return return_interface
+
+
+def gui_slider_bar(bounds: Rectangle, textLeft: str, textRight: str, value: int, minValue: float, maxValue: float) -> int:
+    """Slider Bar control, returns selected value"""
+    if __debug__:
+        _check_struct("gui_slider_bar", "bounds", bounds, Rectangle)
+        _check_str("gui_slider_bar", "textLeft", textLeft)
+        _check_str("gui_slider_bar", "textRight", textRight)
+        _check_int("gui_slider_bar", "value", value, 0, 4294967295)
+        _check_float("gui_slider_bar", "minValue", minValue)
+        _check_float("gui_slider_bar", "maxValue", maxValue)
+    textLeft_ = _scratch_arena.string(textLeft)
+    textRight_ = _scratch_arena.string(textRight)
+    return_interface = _GuiSliderBar(bounds._address, textLeft_, textRight_, value, minValue, maxValue)
+    return return_interface
+
+
+def gui_progress_bar(bounds: Rectangle, textLeft: str, textRight: str, value: int, minValue: float, maxValue: float) -> int:
+    """Progress Bar control, shows current progress value"""
+    if __debug__:
+        _check_struct("gui_progress_bar", "bounds", bounds, Rectangle)
+        _check_str("gui_progress_bar", "textLeft", textLeft)
+        _check_str("gui_progress_bar", "textRight", textRight)
+        _check_int("gui_progress_bar", "value", value, 0, 4294967295)
+        _check_float("gui_progress_bar", "minValue", minValue)
+        _check_float("gui_progress_bar", "maxValue", maxValue)
+    textLeft_ = _scratch_arena.string(textLeft)
+    textRight_ = _scratch_arena.string(textRight)
+    return_interface = _GuiProgressBar(bounds._address, textLeft_, textRight_, value, minValue, maxValue)
+    return return_interface
+
+
+def gui_status_bar(bounds: Rectangle, text: str) -> int:
+    """Status Bar control, shows info text"""
+    if __debug__:
+        _check_struct("gui_status_bar", "bounds", bounds, Rectangle)
+        _check_str("gui_status_bar", "text", text)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GuiStatusBar(bounds._address, text_)
+    return return_interface
+
+
+def gui_dummy_rec(bounds: Rectangle, text: str) -> int:
+    """Dummy control for placeholders"""
+    if __debug__:
+        _check_struct("gui_dummy_rec", "bounds", bounds, Rectangle)
+        _check_str("gui_dummy_rec", "text", text)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GuiDummyRec(bounds._address, text_)
+    return return_interface
+
+
+def gui_grid(bounds: Rectangle, text: str, spacing: float, subdivs: int, mouseCell: int) -> int:
+    """Grid control, returns mouse cell position"""
+    if __debug__:
+        _check_struct("gui_grid", "bounds", bounds, Rectangle)
+        _check_str("gui_grid", "text", text)
+        _check_float("gui_grid", "spacing", spacing)
+        _check_int("gui_grid", "subdivs", subdivs, -2147483648, 2147483647)
+        _check_int("gui_grid", "mouseCell", mouseCell, 0, 4294967295)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GuiGrid(bounds._address, text_, spacing, subdivs, mouseCell)
+    return return_interface
+
+
+def gui_list_view(bounds: Rectangle, text: str, scrollIndex: int, active: int) -> int:
+    """List View control, returns selected list item index"""
+    if __debug__:
+        _check_struct("gui_list_view", "bounds", bounds, Rectangle)
+        _check_str("gui_list_view", "text", text)
+        _check_int("gui_list_view", "scrollIndex", scrollIndex, 0, 4294967295)
+        _check_int("gui_list_view", "active", active, 0, 4294967295)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GuiListView(bounds._address, text_, scrollIndex, active)
+    return return_interface
+
+
+def gui_list_view_ex(bounds: Rectangle, text: int, count: int, scrollIndex: int, active: int, focus: int) -> int:
+    """List View with extended parameters"""
+    if __debug__:
+        _check_struct("gui_list_view_ex", "bounds", bounds, Rectangle)
+        _check_int("gui_list_view_ex", "text", text, 0, 4294967295)
+        _check_int("gui_list_view_ex", "count", count, -2147483648, 2147483647)
+        _check_int("gui_list_view_ex", "scrollIndex", scrollIndex, 0, 4294967295)
+        _check_int("gui_list_view_ex", "active", active, 0, 4294967295)
+        _check_int("gui_list_view_ex", "focus", focus, 0, 4294967295)
+    return_interface = _GuiListViewEx(bounds._address, text, count, scrollIndex, active, focus)
+    return return_interface
+
+
+def gui_message_box(bounds: Rectangle, title: str, message: str, buttons: str) -> int:
+    """Message Box control, displays a message"""
+    if __debug__:
+        _check_struct("gui_message_box", "bounds", bounds, Rectangle)
+        _check_str("gui_message_box", "title", title)
+        _check_str("gui_message_box", "message", message)
+        _check_str("gui_message_box", "buttons", buttons)
+    title_ = _scratch_arena.string(title)
+    message_ = _scratch_arena.string(message)
+    buttons_ = _scratch_arena.string(buttons)
+    return_interface = _GuiMessageBox(bounds._address, title_, message_, buttons_)
+    return return_interface
+
+
+def gui_text_input_box(bounds: Rectangle, title: str, message: str, buttons: str, text: int, textMaxSize: int, secretViewActive: int) -> int:
+    """Text Input Box control, ask for text, supports secret"""
+    if __debug__:
+        _check_struct("gui_text_input_box", "bounds", bounds, Rectangle)
+        _check_str("gui_text_input_box", "title", title)
+        _check_str("gui_text_input_box", "message", message)
+        _check_str("gui_text_input_box", "buttons", buttons)
+        _check_int("gui_text_input_box", "text", text, 0, 4294967295)
+        _check_int("gui_text_input_box", "textMaxSize", textMaxSize, -2147483648, 2147483647)
+        _check_int("gui_text_input_box", "secretViewActive", secretViewActive, 0, 4294967295)
+    title_ = _scratch_arena.string(title)
+    message_ = _scratch_arena.string(message)
+    buttons_ = _scratch_arena.string(buttons)
+    return_interface = _GuiTextInputBox(bounds._address, title_, message_, buttons_, text, textMaxSize, secretViewActive)
+    return return_interface
+
+
+def gui_color_picker(bounds: Rectangle, text: str, color: int) -> int:
+    """Color Picker control (multiple color controls)"""
+    if __debug__:
+        _check_struct("gui_color_picker", "bounds", bounds, Rectangle)
+        _check_str("gui_color_picker", "text", text)
+        _check_int("gui_color_picker", "color", color, 0, 4294967295)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GuiColorPicker(bounds._address, text_, color)
+    return return_interface
+
+
+def gui_color_panel(bounds: Rectangle, text: str, color: int) -> int:
+    """Color Panel control"""
+    if __debug__:
+        _check_struct("gui_color_panel", "bounds", bounds, Rectangle)
+        _check_str("gui_color_panel", "text", text)
+        _check_int("gui_color_panel", "color", color, 0, 4294967295)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GuiColorPanel(bounds._address, text_, color)
+    return return_interface
+
+
+def gui_color_bar_alpha(bounds: Rectangle, text: str, alpha: int) -> int:
+    """Color Bar Alpha control"""
+    if __debug__:
+        _check_struct("gui_color_bar_alpha", "bounds", bounds, Rectangle)
+        _check_str("gui_color_bar_alpha", "text", text)
+        _check_int("gui_color_bar_alpha", "alpha", alpha, 0, 4294967295)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GuiColorBarAlpha(bounds._address, text_, alpha)
+    return return_interface
+
+
+def gui_color_bar_hue(bounds: Rectangle, text: str, value: int) -> int:
+    """Color Bar Hue control"""
+    if __debug__:
+        _check_struct("gui_color_bar_hue", "bounds", bounds, Rectangle)
+        _check_str("gui_color_bar_hue", "text", text)
+        _check_int("gui_color_bar_hue", "value", value, 0, 4294967295)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GuiColorBarHue(bounds._address, text_, value)
+    return return_interface
+
+
+def gui_color_picker_hsv(bounds: Rectangle, text: str, colorHsv: int) -> int:
+    """Color Picker control that avoids conversion to RGB on each call (multiple color controls)"""
+    if __debug__:
+        _check_struct("gui_color_picker_hsv", "bounds", bounds, Rectangle)
+        _check_str("gui_color_picker_hsv", "text", text)
+        _check_int("gui_color_picker_hsv", "colorHsv", colorHsv, 0, 4294967295)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GuiColorPickerHSV(bounds._address, text_, colorHsv)
+    return return_interface
+
+
+def gui_color_panel_hsv(bounds: Rectangle, text: str, colorHsv: int) -> int:
+    """Color Panel control that returns HSV color value, used by GuiColorPickerHSV()"""
+    if __debug__:
+        _check_struct("gui_color_panel_hsv", "bounds", bounds, Rectangle)
+        _check_str("gui_color_panel_hsv", "text", text)
+        _check_int("gui_color_panel_hsv", "colorHsv", colorHsv, 0, 4294967295)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GuiColorPanelHSV(bounds._address, text_, colorHsv)
+    return return_interface
+
+
+# the wasm exports called above, fetched once instead of looked up at every call, they are bound
+# again when another context is activated or profiling starts
+_wasm_functions_names = [
+    "_GuiEnable",
+    "_GuiDisable",
+    "_GuiLock",
+    "_GuiUnlock",
+    "_GuiIsLocked",
+    "_GuiFade",
+    "_GuiSetState",
+    "_GuiGetState",
+    "_GuiSetFont",
+    "_GuiGetFont",
+    "_GuiSetStyle",
+    "_GuiGetStyle",
+    "_GuiLoadStyle",
+    "_GuiLoadStyleDefault",
+    "_GuiEnableTooltip",
+    "_GuiDisableTooltip",
+    "_GuiSetTooltip",
+    "_GuiIconText",
+    "_GuiSetIconScale",
+    "_GuiGetIcons",
+    "_GuiLoadIcons",
+    "_GuiDrawIcon",
+    "_GuiWindowBox",
+    "_GuiGroupBox",
+    "_GuiLine",
+    "_GuiPanel",
+    "_GuiTabBar",
+    "_GuiScrollPanel",
+    "_GuiLabel",
+    "_GuiButton",
+    "_GuiLabelButton",
+    "_GuiToggle",
+    "_GuiToggleGroup",
+    "_GuiCheckBox",
+    "_GuiComboBox",
+    "_GuiDropdownBox",
+    "_GuiSpinner",
+    "_GuiValueBox",
+    "_GuiTextBox",
+    "_GuiSlider",
+    "_GuiSliderBar",
+    "_GuiProgressBar",
+    "_GuiStatusBar",
+    "_GuiDummyRec",
+    "_GuiGrid",
+    "_GuiListView",
+    "_GuiListViewEx",
+    "_GuiMessageBox",
+    "_GuiTextInputBox",
+    "_GuiColorPicker",
+    "_GuiColorPanel",
+    "_GuiColorBarAlpha",
+    "_GuiColorBarHue",
+    "_GuiColorPickerHSV",
+    "_GuiColorPanelHSV",
+]
+_bind_wasm_functions(globals())
+
@@ -0,0 +1,2033 @@
+# Generated by tools/code_generation/filesGeneration.py, do not edit by hand
+# raymath.h, from tools/api/raymath.json
+from wasmraypy.core import (
+    struct_clone,
+    _heap,
+    _struct_pool,
+    _new_struct,
+    _import_numpy,
+    StructArray,
+    FloatArray,
+    Vector2,
+    Vector3,
+    Quaternion,
+    Matrix,
+    _check_int,
+    _check_float,
+    _check_struct,
+    _is_wasm_function_exported,
+    _bind_wasm_functions,
+)
+from wasmraypy.models import (
+    Transform,
+)
+
+
+class float3:
+    """NOTE: Helper types to be used instead of array return types for *ToFloat functions"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 12
+    _dtype_spec: dict = {"names": ["v"], "formats": [("<f4", (3,))], "offsets": [0], "itemsize": 12}
+
+    def __init__(self, v: FloatArray = None, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(12)
+            self._to_free = _struct_pool
+            if v is not None:
+                struct_clone(v, self._address + 0)
+            else:
+                _heap.u8.fill(0, self._address + 0, self._address + 12)
+
+    @property
+    def v(self):
+        """"""
+        return FloatArray(3, address=self._address + 0)
+
+    @v.setter
+    def v(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 0)
+
+    def __str__(self):
+        return f"float3(address={self._address}, {self.v})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 12)
+
+class float16:
+    """"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 64
+    _dtype_spec: dict = {"names": ["v"], "formats": [("<f4", (16,))], "offsets": [0], "itemsize": 64}
+
+    def __init__(self, v: FloatArray = None, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(64)
+            self._to_free = _struct_pool
+            if v is not None:
+                struct_clone(v, self._address + 0)
+            else:
+                _heap.u8.fill(0, self._address + 0, self._address + 64)
+
+    @property
+    def v(self):
+        """"""
+        return FloatArray(16, address=self._address + 0)
+
+    @v.setter
+    def v(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 0)
+
+    def __str__(self):
+        return f"float16(address={self._address}, {self.v})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 64)
+
+EPSILON: float = 1e-06
+
+def clamp(value: float, min: float, max: float) -> float:
+    if __debug__:
+        _check_float("clamp", "value", value)
+        _check_float("clamp", "min", min)
+        _check_float("clamp", "max", max)
+    return_interface = _Clamp(value, min, max)
+    return return_interface
+
+
+def lerp(start: float, end: float, amount: float) -> float:
+    if __debug__:
+        _check_float("lerp", "start", start)
+        _check_float("lerp", "end", end)
+        _check_float("lerp", "amount", amount)
+    return_interface = _Lerp(start, end, amount)
+    return return_interface
+
+
+def normalize(value: float, start: float, end: float) -> float:
+    if __debug__:
+        _check_float("normalize", "value", value)
+        _check_float("normalize", "start", start)
+        _check_float("normalize", "end", end)
+    return_interface = _Normalize(value, start, end)
+    return return_interface
+
+
+def remap(value: float, inputStart: float, inputEnd: float, outputStart: float, outputEnd: float) -> float:
+    if __debug__:
+        _check_float("remap", "value", value)
+        _check_float("remap", "inputStart", inputStart)
+        _check_float("remap", "inputEnd", inputEnd)
+        _check_float("remap", "outputStart", outputStart)
+        _check_float("remap", "outputEnd", outputEnd)
+    return_interface = _Remap(value, inputStart, inputEnd, outputStart, outputEnd)
+    return return_interface
+
+
+def wrap(value: float, min: float, max: float) -> float:
+    if __debug__:
+        _check_float("wrap", "value", value)
+        _check_float("wrap", "min", min)
+        _check_float("wrap", "max", max)
+    return_interface = _Wrap(value, min, max)
+    return return_interface
+
+
+def float_equals(x: float, y: float) -> int:
+    if __debug__:
+        _check_float("float_equals", "x", x)
+        _check_float("float_equals", "y", y)
+    return_interface = _FloatEquals(x, y)
+    return return_interface
+
+
+def vector2_zero(out: Vector2 = None) -> Vector2:
+    if __debug__:
+        if out is not None:
+            _check_struct("vector2_zero", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 else out
+    _Vector2Zero(Vector2_._address)
+    if out is not None and out is not Vector2_:
+        out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def vector2_one(out: Vector2 = None) -> Vector2:
+    if __debug__:
+        if out is not None:
+            _check_struct("vector2_one", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 else out
+    _Vector2One(Vector2_._address)
+    if out is not None and out is not Vector2_:
+        out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def vector2_add(v1: Vector2, v2: Vector2, out: Vector2 = None) -> Vector2:
+    if __debug__:
+        _check_struct("vector2_add", "v1", v1, Vector2)
+        _check_struct("vector2_add", "v2", v2, Vector2)
+        if out is not None:
+            _check_struct("vector2_add", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 or out._address in (v1._address, v2._address,) else out
+    _Vector2Add(Vector2_._address, v1._address, v2._address)
+    if out is not None and out is not Vector2_:
+        if out.__class__ is Vector2:
+            _memcpy(out._address, Vector2_._address, Vector2._size)
+        else:
+            out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def vector2_add_value(v: Vector2, add: float, out: Vector2 = None) -> Vector2:
+    if __debug__:
+        _check_struct("vector2_add_value", "v", v, Vector2)
+        _check_float("vector2_add_value", "add", add)
+        if out is not None:
+            _check_struct("vector2_add_value", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 or out._address in (v._address,) else out
+    _Vector2AddValue(Vector2_._address, v._address, add)
+    if out is not None and out is not Vector2_:
+        if out.__class__ is Vector2:
+            _memcpy(out._address, Vector2_._address, Vector2._size)
+        else:
+            out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def vector2_subtract(v1: Vector2, v2: Vector2, out: Vector2 = None) -> Vector2:
+    if __debug__:
+        _check_struct("vector2_subtract", "v1", v1, Vector2)
+        _check_struct("vector2_subtract", "v2", v2, Vector2)
+        if out is not None:
+            _check_struct("vector2_subtract", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 or out._address in (v1._address, v2._address,) else out
+    _Vector2Subtract(Vector2_._address, v1._address, v2._address)
+    if out is not None and out is not Vector2_:
+        if out.__class__ is Vector2:
+            _memcpy(out._address, Vector2_._address, Vector2._size)
+        else:
+            out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def vector2_subtract_value(v: Vector2, sub: float, out: Vector2 = None) -> Vector2:
+    if __debug__:
+        _check_struct("vector2_subtract_value", "v", v, Vector2)
+        _check_float("vector2_subtract_value", "sub", sub)
+        if out is not None:
+            _check_struct("vector2_subtract_value", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 or out._address in (v._address,) else out
+    _Vector2SubtractValue(Vector2_._address, v._address, sub)
+    if out is not None and out is not Vector2_:
+        if out.__class__ is Vector2:
+            _memcpy(out._address, Vector2_._address, Vector2._size)
+        else:
+            out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def vector2_length(v: Vector2) -> float:
+    if __debug__:
+        _check_struct("vector2_length", "v", v, Vector2)
+    return_interface = _Vector2Length(v._address)
+    return return_interface
+
+
+def vector2_length_sqr(v: Vector2) -> float:
+    if __debug__:
+        _check_struct("vector2_length_sqr", "v", v, Vector2)
+    return_interface = _Vector2LengthSqr(v._address)
+    return return_interface
+
+
+def vector2_dot_product(v1: Vector2, v2: Vector2) -> float:
+    if __debug__:
+        _check_struct("vector2_dot_product", "v1", v1, Vector2)
+        _check_struct("vector2_dot_product", "v2", v2, Vector2)
+    return_interface = _Vector2DotProduct(v1._address, v2._address)
+    return return_interface
+
+
+def vector2_distance(v1: Vector2, v2: Vector2) -> float:
+    if __debug__:
+        _check_struct("vector2_distance", "v1", v1, Vector2)
+        _check_struct("vector2_distance", "v2", v2, Vector2)
+    return_interface = _Vector2Distance(v1._address, v2._address)
+    return return_interface
+
+
+def vector2_distance_sqr(v1: Vector2, v2: Vector2) -> float:
+    if __debug__:
+        _check_struct("vector2_distance_sqr", "v1", v1, Vector2)
+        _check_struct("vector2_distance_sqr", "v2", v2, Vector2)
+    return_interface = _Vector2DistanceSqr(v1._address, v2._address)
+    return return_interface
+
+
+def vector2_angle(v1: Vector2, v2: Vector2) -> float:
+    if __debug__:
+        _check_struct("vector2_angle", "v1", v1, Vector2)
+        _check_struct("vector2_angle", "v2", v2, Vector2)
+    return_interface = _Vector2Angle(v1._address, v2._address)
+    return return_interface
+
+
+def vector2_line_angle(start: Vector2, end: Vector2) -> float:
+    if __debug__:
+        _check_struct("vector2_line_angle", "start", start, Vector2)
+        _check_struct("vector2_line_angle", "end", end, Vector2)
+    return_interface = _Vector2LineAngle(start._address, end._address)
+    return return_interface
+
+
+def vector2_scale(v: Vector2, scale: float, out: Vector2 = None) -> Vector2:
+    if __debug__:
+        _check_struct("vector2_scale", "v", v, Vector2)
+        _check_float("vector2_scale", "scale", scale)
+        if out is not None:
+            _check_struct("vector2_scale", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 or out._address in (v._address,) else out
+    _Vector2Scale(Vector2_._address, v._address, scale)
+    if out is not None and out is not Vector2_:
+        if out.__class__ is Vector2:
+            _memcpy(out._address, Vector2_._address, Vector2._size)
+        else:
+            out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def vector2_multiply(v1: Vector2, v2: Vector2, out: Vector2 = None) -> Vector2:
+    if __debug__:
+        _check_struct("vector2_multiply", "v1", v1, Vector2)
+        _check_struct("vector2_multiply", "v2", v2, Vector2)
+        if out is not None:
+            _check_struct("vector2_multiply", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 or out._address in (v1._address, v2._address,) else out
+    _Vector2Multiply(Vector2_._address, v1._address, v2._address)
+    if out is not None and out is not Vector2_:
+        if out.__class__ is Vector2:
+            _memcpy(out._address, Vector2_._address, Vector2._size)
+        else:
+            out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def vector2_negate(v: Vector2, out: Vector2 = None) -> Vector2:
+    if __debug__:
+        _check_struct("vector2_negate", "v", v, Vector2)
+        if out is not None:
+            _check_struct("vector2_negate", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 or out._address in (v._address,) else out
+    _Vector2Negate(Vector2_._address, v._address)
+    if out is not None and out is not Vector2_:
+        if out.__class__ is Vector2:
+            _memcpy(out._address, Vector2_._address, Vector2._size)
+        else:
+            out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def vector2_divide(v1: Vector2, v2: Vector2, out: Vector2 = None) -> Vector2:
+    if __debug__:
+        _check_struct("vector2_divide", "v1", v1, Vector2)
+        _check_struct("vector2_divide", "v2", v2, Vector2)
+        if out is not None:
+            _check_struct("vector2_divide", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 or out._address in (v1._address, v2._address,) else out
+    _Vector2Divide(Vector2_._address, v1._address, v2._address)
+    if out is not None and out is not Vector2_:
+        if out.__class__ is Vector2:
+            _memcpy(out._address, Vector2_._address, Vector2._size)
+        else:
+            out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def vector2_normalize(v: Vector2, out: Vector2 = None) -> Vector2:
+    if __debug__:
+        _check_struct("vector2_normalize", "v", v, Vector2)
+        if out is not None:
+            _check_struct("vector2_normalize", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 or out._address in (v._address,) else out
+    _Vector2Normalize(Vector2_._address, v._address)
+    if out is not None and out is not Vector2_:
+        if out.__class__ is Vector2:
+            _memcpy(out._address, Vector2_._address, Vector2._size)
+        else:
+            out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def vector2_transform(v: Vector2, mat: Matrix, out: Vector2 = None) -> Vector2:
+    if __debug__:
+        _check_struct("vector2_transform", "v", v, Vector2)
+        _check_struct("vector2_transform", "mat", mat, Matrix)
+        if out is not None:
+            _check_struct("vector2_transform", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 or out._address in (v._address, mat._address,) else out
+    _Vector2Transform(Vector2_._address, v._address, mat._address)
+    if out is not None and out is not Vector2_:
+        if out.__class__ is Vector2:
+            _memcpy(out._address, Vector2_._address, Vector2._size)
+        else:
+            out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def vector2_lerp(v1: Vector2, v2: Vector2, amount: float, out: Vector2 = None) -> Vector2:
+    if __debug__:
+        _check_struct("vector2_lerp", "v1", v1, Vector2)
+        _check_struct("vector2_lerp", "v2", v2, Vector2)
+        _check_float("vector2_lerp", "amount", amount)
+        if out is not None:
+            _check_struct("vector2_lerp", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 or out._address in (v1._address, v2._address,) else out
+    _Vector2Lerp(Vector2_._address, v1._address, v2._address, amount)
+    if out is not None and out is not Vector2_:
+        if out.__class__ is Vector2:
+            _memcpy(out._address, Vector2_._address, Vector2._size)
+        else:
+            out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def vector2_reflect(v: Vector2, normal: Vector2, out: Vector2 = None) -> Vector2:
+    if __debug__:
+        _check_struct("vector2_reflect", "v", v, Vector2)
+        _check_struct("vector2_reflect", "normal", normal, Vector2)
+        if out is not None:
+            _check_struct("vector2_reflect", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 or out._address in (v._address, normal._address,) else out
+    _Vector2Reflect(Vector2_._address, v._address, normal._address)
+    if out is not None and out is not Vector2_:
+        if out.__class__ is Vector2:
+            _memcpy(out._address, Vector2_._address, Vector2._size)
+        else:
+            out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def vector2_rotate(v: Vector2, angle: float, out: Vector2 = None) -> Vector2:
+    if __debug__:
+        _check_struct("vector2_rotate", "v", v, Vector2)
+        _check_float("vector2_rotate", "angle", angle)
+        if out is not None:
+            _check_struct("vector2_rotate", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 or out._address in (v._address,) else out
+    _Vector2Rotate(Vector2_._address, v._address, angle)
+    if out is not None and out is not Vector2_:
+        if out.__class__ is Vector2:
+            _memcpy(out._address, Vector2_._address, Vector2._size)
+        else:
+            out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def vector2_move_towards(v: Vector2, target: Vector2, maxDistance: float, out: Vector2 = None) -> Vector2:
+    if __debug__:
+        _check_struct("vector2_move_towards", "v", v, Vector2)
+        _check_struct("vector2_move_towards", "target", target, Vector2)
+        _check_float("vector2_move_towards", "maxDistance", maxDistance)
+        if out is not None:
+            _check_struct("vector2_move_towards", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 or out._address in (v._address, target._address,) else out
+    _Vector2MoveTowards(Vector2_._address, v._address, target._address, maxDistance)
+    if out is not None and out is not Vector2_:
+        if out.__class__ is Vector2:
+            _memcpy(out._address, Vector2_._address, Vector2._size)
+        else:
+            out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def vector2_invert(v: Vector2, out: Vector2 = None) -> Vector2:
+    if __debug__:
+        _check_struct("vector2_invert", "v", v, Vector2)
+        if out is not None:
+            _check_struct("vector2_invert", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 or out._address in (v._address,) else out
+    _Vector2Invert(Vector2_._address, v._address)
+    if out is not None and out is not Vector2_:
+        if out.__class__ is Vector2:
+            _memcpy(out._address, Vector2_._address, Vector2._size)
+        else:
+            out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def vector2_clamp(v: Vector2, min: Vector2, max: Vector2, out: Vector2 = None) -> Vector2:
+    if __debug__:
+        _check_struct("vector2_clamp", "v", v, Vector2)
+        _check_struct("vector2_clamp", "min", min, Vector2)
+        _check_struct("vector2_clamp", "max", max, Vector2)
+        if out is not None:
+            _check_struct("vector2_clamp", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 or out._address in (v._address, min._address, max._address,) else out
+    _Vector2Clamp(Vector2_._address, v._address, min._address, max._address)
+    if out is not None and out is not Vector2_:
+        if out.__class__ is Vector2:
+            _memcpy(out._address, Vector2_._address, Vector2._size)
+        else:
+            out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def vector2_clamp_value(v: Vector2, min: float, max: float, out: Vector2 = None) -> Vector2:
+    if __debug__:
+        _check_struct("vector2_clamp_value", "v", v, Vector2)
+        _check_float("vector2_clamp_value", "min", min)
+        _check_float("vector2_clamp_value", "max", max)
+        if out is not None:
+            _check_struct("vector2_clamp_value", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 or out._address in (v._address,) else out
+    _Vector2ClampValue(Vector2_._address, v._address, min, max)
+    if out is not None and out is not Vector2_:
+        if out.__class__ is Vector2:
+            _memcpy(out._address, Vector2_._address, Vector2._size)
+        else:
+            out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def vector2_equals(p: Vector2, q: Vector2) -> int:
+    if __debug__:
+        _check_struct("vector2_equals", "p", p, Vector2)
+        _check_struct("vector2_equals", "q", q, Vector2)
+    return_interface = _Vector2Equals(p._address, q._address)
+    return return_interface
+
+
+def vector3_zero(out: Vector3 = None) -> Vector3:
+    if __debug__:
+        if out is not None:
+            _check_struct("vector3_zero", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 else out
+    _Vector3Zero(Vector3_._address)
+    if out is not None and out is not Vector3_:
+        out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def vector3_one(out: Vector3 = None) -> Vector3:
+    if __debug__:
+        if out is not None:
+            _check_struct("vector3_one", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 else out
+    _Vector3One(Vector3_._address)
+    if out is not None and out is not Vector3_:
+        out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def vector3_add(v1: Vector3, v2: Vector3, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_struct("vector3_add", "v1", v1, Vector3)
+        _check_struct("vector3_add", "v2", v2, Vector3)
+        if out is not None:
+            _check_struct("vector3_add", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (v1._address, v2._address,) else out
+    _Vector3Add(Vector3_._address, v1._address, v2._address)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def vector3_add_value(v: Vector3, add: float, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_struct("vector3_add_value", "v", v, Vector3)
+        _check_float("vector3_add_value", "add", add)
+        if out is not None:
+            _check_struct("vector3_add_value", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (v._address,) else out
+    _Vector3AddValue(Vector3_._address, v._address, add)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def vector3_subtract(v1: Vector3, v2: Vector3, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_struct("vector3_subtract", "v1", v1, Vector3)
+        _check_struct("vector3_subtract", "v2", v2, Vector3)
+        if out is not None:
+            _check_struct("vector3_subtract", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (v1._address, v2._address,) else out
+    _Vector3Subtract(Vector3_._address, v1._address, v2._address)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def vector3_subtract_value(v: Vector3, sub: float, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_struct("vector3_subtract_value", "v", v, Vector3)
+        _check_float("vector3_subtract_value", "sub", sub)
+        if out is not None:
+            _check_struct("vector3_subtract_value", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (v._address,) else out
+    _Vector3SubtractValue(Vector3_._address, v._address, sub)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def vector3_scale(v: Vector3, scalar: float, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_struct("vector3_scale", "v", v, Vector3)
+        _check_float("vector3_scale", "scalar", scalar)
+        if out is not None:
+            _check_struct("vector3_scale", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (v._address,) else out
+    _Vector3Scale(Vector3_._address, v._address, scalar)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def vector3_multiply(v1: Vector3, v2: Vector3, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_struct("vector3_multiply", "v1", v1, Vector3)
+        _check_struct("vector3_multiply", "v2", v2, Vector3)
+        if out is not None:
+            _check_struct("vector3_multiply", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (v1._address, v2._address,) else out
+    _Vector3Multiply(Vector3_._address, v1._address, v2._address)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def vector3_cross_product(v1: Vector3, v2: Vector3, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_struct("vector3_cross_product", "v1", v1, Vector3)
+        _check_struct("vector3_cross_product", "v2", v2, Vector3)
+        if out is not None:
+            _check_struct("vector3_cross_product", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (v1._address, v2._address,) else out
+    _Vector3CrossProduct(Vector3_._address, v1._address, v2._address)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def vector3_perpendicular(v: Vector3, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_struct("vector3_perpendicular", "v", v, Vector3)
+        if out is not None:
+            _check_struct("vector3_perpendicular", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (v._address,) else out
+    _Vector3Perpendicular(Vector3_._address, v._address)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def vector3_length(v: Vector3) -> float:
+    if __debug__:
+        _check_struct("vector3_length", "v", v, Vector3)
+    return_interface = _Vector3Length(v._address)
+    return return_interface
+
+
+def vector3_length_sqr(v: Vector3) -> float:
+    if __debug__:
+        _check_struct("vector3_length_sqr", "v", v, Vector3)
+    return_interface = _Vector3LengthSqr(v._address)
+    return return_interface
+
+
+def vector3_dot_product(v1: Vector3, v2: Vector3) -> float:
+    if __debug__:
+        _check_struct("vector3_dot_product", "v1", v1, Vector3)
+        _check_struct("vector3_dot_product", "v2", v2, Vector3)
+    return_interface = _Vector3DotProduct(v1._address, v2._address)
+    return return_interface
+
+
+def vector3_distance(v1: Vector3, v2: Vector3) -> float:
+    if __debug__:
+        _check_struct("vector3_distance", "v1", v1, Vector3)
+        _check_struct("vector3_distance", "v2", v2, Vector3)
+    return_interface = _Vector3Distance(v1._address, v2._address)
+    return return_interface
+
+
+def vector3_distance_sqr(v1: Vector3, v2: Vector3) -> float:
+    if __debug__:
+        _check_struct("vector3_distance_sqr", "v1", v1, Vector3)
+        _check_struct("vector3_distance_sqr", "v2", v2, Vector3)
+    return_interface = _Vector3DistanceSqr(v1._address, v2._address)
+    return return_interface
+
+
+def vector3_angle(v1: Vector3, v2: Vector3) -> float:
+    if __debug__:
+        _check_struct("vector3_angle", "v1", v1, Vector3)
+        _check_struct("vector3_angle", "v2", v2, Vector3)
+    return_interface = _Vector3Angle(v1._address, v2._address)
+    return return_interface
+
+
+def vector3_negate(v: Vector3, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_struct("vector3_negate", "v", v, Vector3)
+        if out is not None:
+            _check_struct("vector3_negate", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (v._address,) else out
+    _Vector3Negate(Vector3_._address, v._address)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def vector3_divide(v1: Vector3, v2: Vector3, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_struct("vector3_divide", "v1", v1, Vector3)
+        _check_struct("vector3_divide", "v2", v2, Vector3)
+        if out is not None:
+            _check_struct("vector3_divide", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (v1._address, v2._address,) else out
+    _Vector3Divide(Vector3_._address, v1._address, v2._address)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def vector3_normalize(v: Vector3, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_struct("vector3_normalize", "v", v, Vector3)
+        if out is not None:
+            _check_struct("vector3_normalize", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (v._address,) else out
+    _Vector3Normalize(Vector3_._address, v._address)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def vector3_ortho_normalize(v1: int, v2: int):
+    if __debug__:
+        _check_int("vector3_ortho_normalize", "v1", v1, 0, 4294967295)
+        _check_int("vector3_ortho_normalize", "v2", v2, 0, 4294967295)
+    _Vector3OrthoNormalize(v1, v2)
+
+
+def vector3_transform(v: Vector3, mat: Matrix, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_struct("vector3_transform", "v", v, Vector3)
+        _check_struct("vector3_transform", "mat", mat, Matrix)
+        if out is not None:
+            _check_struct("vector3_transform", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (v._address, mat._address,) else out
+    _Vector3Transform(Vector3_._address, v._address, mat._address)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def vector3_rotate_by_quaternion(v: Vector3, q: Quaternion, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_struct("vector3_rotate_by_quaternion", "v", v, Vector3)
+        _check_struct("vector3_rotate_by_quaternion", "q", q, Quaternion)
+        if out is not None:
+            _check_struct("vector3_rotate_by_quaternion", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (v._address, q._address,) else out
+    _Vector3RotateByQuaternion(Vector3_._address, v._address, q._address)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def vector3_rotate_by_axis_angle(v: Vector3, axis: Vector3, angle: float, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_struct("vector3_rotate_by_axis_angle", "v", v, Vector3)
+        _check_struct("vector3_rotate_by_axis_angle", "axis", axis, Vector3)
+        _check_float("vector3_rotate_by_axis_angle", "angle", angle)
+        if out is not None:
+            _check_struct("vector3_rotate_by_axis_angle", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (v._address, axis._address,) else out
+    _Vector3RotateByAxisAngle(Vector3_._address, v._address, axis._address, angle)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def vector3_lerp(v1: Vector3, v2: Vector3, amount: float, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_struct("vector3_lerp", "v1", v1, Vector3)
+        _check_struct("vector3_lerp", "v2", v2, Vector3)
+        _check_float("vector3_lerp", "amount", amount)
+        if out is not None:
+            _check_struct("vector3_lerp", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (v1._address, v2._address,) else out
+    _Vector3Lerp(Vector3_._address, v1._address, v2._address, amount)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def vector3_reflect(v: Vector3, normal: Vector3, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_struct("vector3_reflect", "v", v, Vector3)
+        _check_struct("vector3_reflect", "normal", normal, Vector3)
+        if out is not None:
+            _check_struct("vector3_reflect", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (v._address, normal._address,) else out
+    _Vector3Reflect(Vector3_._address, v._address, normal._address)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def vector3_min(v1: Vector3, v2: Vector3, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_struct("vector3_min", "v1", v1, Vector3)
+        _check_struct("vector3_min", "v2", v2, Vector3)
+        if out is not None:
+            _check_struct("vector3_min", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (v1._address, v2._address,) else out
+    _Vector3Min(Vector3_._address, v1._address, v2._address)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def vector3_max(v1: Vector3, v2: Vector3, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_struct("vector3_max", "v1", v1, Vector3)
+        _check_struct("vector3_max", "v2", v2, Vector3)
+        if out is not None:
+            _check_struct("vector3_max", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (v1._address, v2._address,) else out
+    _Vector3Max(Vector3_._address, v1._address, v2._address)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def vector3_barycenter(p: Vector3, a: Vector3, b: Vector3, c: Vector3, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_struct("vector3_barycenter", "p", p, Vector3)
+        _check_struct("vector3_barycenter", "a", a, Vector3)
+        _check_struct("vector3_barycenter", "b", b, Vector3)
+        _check_struct("vector3_barycenter", "c", c, Vector3)
+        if out is not None:
+            _check_struct("vector3_barycenter", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (p._address, a._address, b._address, c._address,) else out
+    _Vector3Barycenter(Vector3_._address, p._address, a._address, b._address, c._address)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def vector3_unproject(source: Vector3, projection: Matrix, view: Matrix, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_struct("vector3_unproject", "source", source, Vector3)
+        _check_struct("vector3_unproject", "projection", projection, Matrix)
+        _check_struct("vector3_unproject", "view", view, Matrix)
+        if out is not None:
+            _check_struct("vector3_unproject", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (source._address, projection._address, view._address,) else out
+    _Vector3Unproject(Vector3_._address, source._address, projection._address, view._address)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def vector3_to_float_v(v: Vector3, out: float3 = None) -> float3:
+    if __debug__:
+        _check_struct("vector3_to_float_v", "v", v, Vector3)
+        if out is not None:
+            _check_struct("vector3_to_float_v", "out", out, float3)
+    float3_ = _new_struct(float3) if out is None or out.__class__ is not float3 or out._address in (v._address,) else out
+    _Vector3ToFloatV(float3_._address, v._address)
+    if out is not None and out is not float3_:
+        if out.__class__ is float3:
+            _memcpy(out._address, float3_._address, float3._size)
+        else:
+            out._assign(float3_)  # a shadow struct
+        return out
+    return float3_
+
+
+def vector3_invert(v: Vector3, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_struct("vector3_invert", "v", v, Vector3)
+        if out is not None:
+            _check_struct("vector3_invert", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (v._address,) else out
+    _Vector3Invert(Vector3_._address, v._address)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def vector3_clamp(v: Vector3, min: Vector3, max: Vector3, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_struct("vector3_clamp", "v", v, Vector3)
+        _check_struct("vector3_clamp", "min", min, Vector3)
+        _check_struct("vector3_clamp", "max", max, Vector3)
+        if out is not None:
+            _check_struct("vector3_clamp", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (v._address, min._address, max._address,) else out
+    _Vector3Clamp(Vector3_._address, v._address, min._address, max._address)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def vector3_clamp_value(v: Vector3, min: float, max: float, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_struct("vector3_clamp_value", "v", v, Vector3)
+        _check_float("vector3_clamp_value", "min", min)
+        _check_float("vector3_clamp_value", "max", max)
+        if out is not None:
+            _check_struct("vector3_clamp_value", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (v._address,) else out
+    _Vector3ClampValue(Vector3_._address, v._address, min, max)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def vector3_equals(p: Vector3, q: Vector3) -> int:
+    if __debug__:
+        _check_struct("vector3_equals", "p", p, Vector3)
+        _check_struct("vector3_equals", "q", q, Vector3)
+    return_interface = _Vector3Equals(p._address, q._address)
+    return return_interface
+
+
+def vector3_refract(v: Vector3, n: Vector3, r: float, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_struct("vector3_refract", "v", v, Vector3)
+        _check_struct("vector3_refract", "n", n, Vector3)
+        _check_float("vector3_refract", "r", r)
+        if out is not None:
+            _check_struct("vector3_refract", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (v._address, n._address,) else out
+    _Vector3Refract(Vector3_._address, v._address, n._address, r)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def matrix_determinant(mat: Matrix) -> float:
+    if __debug__:
+        _check_struct("matrix_determinant", "mat", mat, Matrix)
+    return_interface = _MatrixDeterminant(mat._address)
+    return return_interface
+
+
+def matrix_trace(mat: Matrix) -> float:
+    if __debug__:
+        _check_struct("matrix_trace", "mat", mat, Matrix)
+    return_interface = _MatrixTrace(mat._address)
+    return return_interface
+
+
+def matrix_transpose(mat: Matrix, out: Matrix = None) -> Matrix:
+    if __debug__:
+        _check_struct("matrix_transpose", "mat", mat, Matrix)
+        if out is not None:
+            _check_struct("matrix_transpose", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix or out._address in (mat._address,) else out
+    _MatrixTranspose(Matrix_._address, mat._address)
+    if out is not None and out is not Matrix_:
+        if out.__class__ is Matrix:
+            _memcpy(out._address, Matrix_._address, Matrix._size)
+        else:
+            out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def matrix_invert(mat: Matrix, out: Matrix = None) -> Matrix:
+    if __debug__:
+        _check_struct("matrix_invert", "mat", mat, Matrix)
+        if out is not None:
+            _check_struct("matrix_invert", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix or out._address in (mat._address,) else out
+    _MatrixInvert(Matrix_._address, mat._address)
+    if out is not None and out is not Matrix_:
+        if out.__class__ is Matrix:
+            _memcpy(out._address, Matrix_._address, Matrix._size)
+        else:
+            out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def matrix_identity(out: Matrix = None) -> Matrix:
+    if __debug__:
+        if out is not None:
+            _check_struct("matrix_identity", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix else out
+    _MatrixIdentity(Matrix_._address)
+    if out is not None and out is not Matrix_:
+        out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def matrix_add(left: Matrix, right: Matrix, out: Matrix = None) -> Matrix:
+    if __debug__:
+        _check_struct("matrix_add", "left", left, Matrix)
+        _check_struct("matrix_add", "right", right, Matrix)
+        if out is not None:
+            _check_struct("matrix_add", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix or out._address in (left._address, right._address,) else out
+    _MatrixAdd(Matrix_._address, left._address, right._address)
+    if out is not None and out is not Matrix_:
+        if out.__class__ is Matrix:
+            _memcpy(out._address, Matrix_._address, Matrix._size)
+        else:
+            out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def matrix_subtract(left: Matrix, right: Matrix, out: Matrix = None) -> Matrix:
+    if __debug__:
+        _check_struct("matrix_subtract", "left", left, Matrix)
+        _check_struct("matrix_subtract", "right", right, Matrix)
+        if out is not None:
+            _check_struct("matrix_subtract", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix or out._address in (left._address, right._address,) else out
+    _MatrixSubtract(Matrix_._address, left._address, right._address)
+    if out is not None and out is not Matrix_:
+        if out.__class__ is Matrix:
+            _memcpy(out._address, Matrix_._address, Matrix._size)
+        else:
+            out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def matrix_multiply(left: Matrix, right: Matrix, out: Matrix = None) -> Matrix:
+    if __debug__:
+        _check_struct("matrix_multiply", "left", left, Matrix)
+        _check_struct("matrix_multiply", "right", right, Matrix)
+        if out is not None:
+            _check_struct("matrix_multiply", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix or out._address in (left._address, right._address,) else out
+    _MatrixMultiply(Matrix_._address, left._address, right._address)
+    if out is not None and out is not Matrix_:
+        if out.__class__ is Matrix:
+            _memcpy(out._address, Matrix_._address, Matrix._size)
+        else:
+            out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def matrix_translate(x: float, y: float, z: float, out: Matrix = None) -> Matrix:
+    if __debug__:
+        _check_float("matrix_translate", "x", x)
+        _check_float("matrix_translate", "y", y)
+        _check_float("matrix_translate", "z", z)
+        if out is not None:
+            _check_struct("matrix_translate", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix else out
+    _MatrixTranslate(Matrix_._address, x, y, z)
+    if out is not None and out is not Matrix_:
+        out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def matrix_rotate(axis: Vector3, angle: float, out: Matrix = None) -> Matrix:
+    if __debug__:
+        _check_struct("matrix_rotate", "axis", axis, Vector3)
+        _check_float("matrix_rotate", "angle", angle)
+        if out is not None:
+            _check_struct("matrix_rotate", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix or out._address in (axis._address,) else out
+    _MatrixRotate(Matrix_._address, axis._address, angle)
+    if out is not None and out is not Matrix_:
+        if out.__class__ is Matrix:
+            _memcpy(out._address, Matrix_._address, Matrix._size)
+        else:
+            out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def matrix_rotate_x(angle: float, out: Matrix = None) -> Matrix:
+    if __debug__:
+        _check_float("matrix_rotate_x", "angle", angle)
+        if out is not None:
+            _check_struct("matrix_rotate_x", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix else out
+    _MatrixRotateX(Matrix_._address, angle)
+    if out is not None and out is not Matrix_:
+        out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def matrix_rotate_y(angle: float, out: Matrix = None) -> Matrix:
+    if __debug__:
+        _check_float("matrix_rotate_y", "angle", angle)
+        if out is not None:
+            _check_struct("matrix_rotate_y", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix else out
+    _MatrixRotateY(Matrix_._address, angle)
+    if out is not None and out is not Matrix_:
+        out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def matrix_rotate_z(angle: float, out: Matrix = None) -> Matrix:
+    if __debug__:
+        _check_float("matrix_rotate_z", "angle", angle)
+        if out is not None:
+            _check_struct("matrix_rotate_z", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix else out
+    _MatrixRotateZ(Matrix_._address, angle)
+    if out is not None and out is not Matrix_:
+        out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def matrix_rotate_xyz(angle: Vector3, out: Matrix = None) -> Matrix:
+    if __debug__:
+        _check_struct("matrix_rotate_xyz", "angle", angle, Vector3)
+        if out is not None:
+            _check_struct("matrix_rotate_xyz", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix or out._address in (angle._address,) else out
+    _MatrixRotateXYZ(Matrix_._address, angle._address)
+    if out is not None and out is not Matrix_:
+        if out.__class__ is Matrix:
+            _memcpy(out._address, Matrix_._address, Matrix._size)
+        else:
+            out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def matrix_rotate_zyx(angle: Vector3, out: Matrix = None) -> Matrix:
+    if __debug__:
+        _check_struct("matrix_rotate_zyx", "angle", angle, Vector3)
+        if out is not None:
+            _check_struct("matrix_rotate_zyx", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix or out._address in (angle._address,) else out
+    _MatrixRotateZYX(Matrix_._address, angle._address)
+    if out is not None and out is not Matrix_:
+        if out.__class__ is Matrix:
+            _memcpy(out._address, Matrix_._address, Matrix._size)
+        else:
+            out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def matrix_scale(x: float, y: float, z: float, out: Matrix = None) -> Matrix:
+    if __debug__:
+        _check_float("matrix_scale", "x", x)
+        _check_float("matrix_scale", "y", y)
+        _check_float("matrix_scale", "z", z)
+        if out is not None:
+            _check_struct("matrix_scale", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix else out
+    _MatrixScale(Matrix_._address, x, y, z)
+    if out is not None and out is not Matrix_:
+        out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def matrix_frustum(left: float, right: float, bottom: float, top: float, near: float, far: float, out: Matrix = None) -> Matrix:
+    if __debug__:
+        _check_float("matrix_frustum", "left", left)
+        _check_float("matrix_frustum", "right", right)
+        _check_float("matrix_frustum", "bottom", bottom)
+        _check_float("matrix_frustum", "top", top)
+        _check_float("matrix_frustum", "near", near)
+        _check_float("matrix_frustum", "far", far)
+        if out is not None:
+            _check_struct("matrix_frustum", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix else out
+    _MatrixFrustum(Matrix_._address, left, right, bottom, top, near, far)
+    if out is not None and out is not Matrix_:
+        out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def matrix_perspective(fovY: float, aspect: float, nearPlane: float, farPlane: float, out: Matrix = None) -> Matrix:
+    if __debug__:
+        _check_float("matrix_perspective", "fovY", fovY)
+        _check_float("matrix_perspective", "aspect", aspect)
+        _check_float("matrix_perspective", "nearPlane", nearPlane)
+        _check_float("matrix_perspective", "farPlane", farPlane)
+        if out is not None:
+            _check_struct("matrix_perspective", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix else out
+    _MatrixPerspective(Matrix_._address, fovY, aspect, nearPlane, farPlane)
+    if out is not None and out is not Matrix_:
+        out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def matrix_ortho(left: float, right: float, bottom: float, top: float, nearPlane: float, farPlane: float, out: Matrix = None) -> Matrix:
+    if __debug__:
+        _check_float("matrix_ortho", "left", left)
+        _check_float("matrix_ortho", "right", right)
+        _check_float("matrix_ortho", "bottom", bottom)
+        _check_float("matrix_ortho", "top", top)
+        _check_float("matrix_ortho", "nearPlane", nearPlane)
+        _check_float("matrix_ortho", "farPlane", farPlane)
+        if out is not None:
+            _check_struct("matrix_ortho", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix else out
+    _MatrixOrtho(Matrix_._address, left, right, bottom, top, nearPlane, farPlane)
+    if out is not None and out is not Matrix_:
+        out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def matrix_look_at(eye: Vector3, target: Vector3, up: Vector3, out: Matrix = None) -> Matrix:
+    if __debug__:
+        _check_struct("matrix_look_at", "eye", eye, Vector3)
+        _check_struct("matrix_look_at", "target", target, Vector3)
+        _check_struct("matrix_look_at", "up", up, Vector3)
+        if out is not None:
+            _check_struct("matrix_look_at", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix or out._address in (eye._address, target._address, up._address,) else out
+    _MatrixLookAt(Matrix_._address, eye._address, target._address, up._address)
+    if out is not None and out is not Matrix_:
+        if out.__class__ is Matrix:
+            _memcpy(out._address, Matrix_._address, Matrix._size)
+        else:
+            out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def matrix_to_float_v(mat: Matrix, out: float16 = None) -> float16:
+    if __debug__:
+        _check_struct("matrix_to_float_v", "mat", mat, Matrix)
+        if out is not None:
+            _check_struct("matrix_to_float_v", "out", out, float16)
+    float16_ = _new_struct(float16) if out is None or out.__class__ is not float16 or out._address in (mat._address,) else out
+    _MatrixToFloatV(float16_._address, mat._address)
+    if out is not None and out is not float16_:
+        if out.__class__ is float16:
+            _memcpy(out._address, float16_._address, float16._size)
+        else:
+            out._assign(float16_)  # a shadow struct
+        return out
+    return float16_
+
+
+def quaternion_add(q1: Quaternion, q2: Quaternion, out: Quaternion = None) -> Quaternion:
+    if __debug__:
+        _check_struct("quaternion_add", "q1", q1, Quaternion)
+        _check_struct("quaternion_add", "q2", q2, Quaternion)
+        if out is not None:
+            _check_struct("quaternion_add", "out", out, Quaternion)
+    Quaternion_ = _new_struct(Quaternion) if out is None or out.__class__ is not Quaternion or out._address in (q1._address, q2._address,) else out
+    _QuaternionAdd(Quaternion_._address, q1._address, q2._address)
+    if out is not None and out is not Quaternion_:
+        if out.__class__ is Quaternion:
+            _memcpy(out._address, Quaternion_._address, Quaternion._size)
+        else:
+            out._assign(Quaternion_)  # a shadow struct
+        return out
+    return Quaternion_
+
+
+def quaternion_add_value(q: Quaternion, add: float, out: Quaternion = None) -> Quaternion:
+    if __debug__:
+        _check_struct("quaternion_add_value", "q", q, Quaternion)
+        _check_float("quaternion_add_value", "add", add)
+        if out is not None:
+            _check_struct("quaternion_add_value", "out", out, Quaternion)
+    Quaternion_ = _new_struct(Quaternion) if out is None or out.__class__ is not Quaternion or out._address in (q._address,) else out
+    _QuaternionAddValue(Quaternion_._address, q._address, add)
+    if out is not None and out is not Quaternion_:
+        if out.__class__ is Quaternion:
+            _memcpy(out._address, Quaternion_._address, Quaternion._size)
+        else:
+            out._assign(Quaternion_)  # a shadow struct
+        return out
+    return Quaternion_
+
+
+def quaternion_subtract(q1: Quaternion, q2: Quaternion, out: Quaternion = None) -> Quaternion:
+    if __debug__:
+        _check_struct("quaternion_subtract", "q1", q1, Quaternion)
+        _check_struct("quaternion_subtract", "q2", q2, Quaternion)
+        if out is not None:
+            _check_struct("quaternion_subtract", "out", out, Quaternion)
+    Quaternion_ = _new_struct(Quaternion) if out is None or out.__class__ is not Quaternion or out._address in (q1._address, q2._address,) else out
+    _QuaternionSubtract(Quaternion_._address, q1._address, q2._address)
+    if out is not None and out is not Quaternion_:
+        if out.__class__ is Quaternion:
+            _memcpy(out._address, Quaternion_._address, Quaternion._size)
+        else:
+            out._assign(Quaternion_)  # a shadow struct
+        return out
+    return Quaternion_
+
+
+def quaternion_subtract_value(q: Quaternion, sub: float, out: Quaternion = None) -> Quaternion:
+    if __debug__:
+        _check_struct("quaternion_subtract_value", "q", q, Quaternion)
+        _check_float("quaternion_subtract_value", "sub", sub)
+        if out is not None:
+            _check_struct("quaternion_subtract_value", "out", out, Quaternion)
+    Quaternion_ = _new_struct(Quaternion) if out is None or out.__class__ is not Quaternion or out._address in (q._address,) else out
+    _QuaternionSubtractValue(Quaternion_._address, q._address, sub)
+    if out is not None and out is not Quaternion_:
+        if out.__class__ is Quaternion:
+            _memcpy(out._address, Quaternion_._address, Quaternion._size)
+        else:
+            out._assign(Quaternion_)  # a shadow struct
+        return out
+    return Quaternion_
+
+
+def quaternion_identity(out: Quaternion = None) -> Quaternion:
+    if __debug__:
+        if out is not None:
+            _check_struct("quaternion_identity", "out", out, Quaternion)
+    Quaternion_ = _new_struct(Quaternion) if out is None or out.__class__ is not Quaternion else out
+    _QuaternionIdentity(Quaternion_._address)
+    if out is not None and out is not Quaternion_:
+        out._assign(Quaternion_)  # a shadow struct
+        return out
+    return Quaternion_
+
+
+def quaternion_length(q: Quaternion) -> float:
+    if __debug__:
+        _check_struct("quaternion_length", "q", q, Quaternion)
+    return_interface = _QuaternionLength(q._address)
+    return return_interface
+
+
+def quaternion_normalize(q: Quaternion, out: Quaternion = None) -> Quaternion:
+    if __debug__:
+        _check_struct("quaternion_normalize", "q", q, Quaternion)
+        if out is not None:
+            _check_struct("quaternion_normalize", "out", out, Quaternion)
+    Quaternion_ = _new_struct(Quaternion) if out is None or out.__class__ is not Quaternion or out._address in (q._address,) else out
+    _QuaternionNormalize(Quaternion_._address, q._address)
+    if out is not None and out is not Quaternion_:
+        if out.__class__ is Quaternion:
+            _memcpy(out._address, Quaternion_._address, Quaternion._size)
+        else:
+            out._assign(Quaternion_)  # a shadow struct
+        return out
+    return Quaternion_
+
+
+def quaternion_invert(q: Quaternion, out: Quaternion = None) -> Quaternion:
+    if __debug__:
+        _check_struct("quaternion_invert", "q", q, Quaternion)
+        if out is not None:
+            _check_struct("quaternion_invert", "out", out, Quaternion)
+    Quaternion_ = _new_struct(Quaternion) if out is None or out.__class__ is not Quaternion or out._address in (q._address,) else out
+    _QuaternionInvert(Quaternion_._address, q._address)
+    if out is not None and out is not Quaternion_:
+        if out.__class__ is Quaternion:
+            _memcpy(out._address, Quaternion_._address, Quaternion._size)
+        else:
+            out._assign(Quaternion_)  # a shadow struct
+        return out
+    return Quaternion_
+
+
+def quaternion_multiply(q1: Quaternion, q2: Quaternion, out: Quaternion = None) -> Quaternion:
+    if __debug__:
+        _check_struct("quaternion_multiply", "q1", q1, Quaternion)
+        _check_struct("quaternion_multiply", "q2", q2, Quaternion)
+        if out is not None:
+            _check_struct("quaternion_multiply", "out", out, Quaternion)
+    Quaternion_ = _new_struct(Quaternion) if out is None or out.__class__ is not Quaternion or out._address in (q1._address, q2._address,) else out
+    _QuaternionMultiply(Quaternion_._address, q1._address, q2._address)
+    if out is not None and out is not Quaternion_:
+        if out.__class__ is Quaternion:
+            _memcpy(out._address, Quaternion_._address, Quaternion._size)
+        else:
+            out._assign(Quaternion_)  # a shadow struct
+        return out
+    return Quaternion_
+
+
+def quaternion_scale(q: Quaternion, mul: float, out: Quaternion = None) -> Quaternion:
+    if __debug__:
+        _check_struct("quaternion_scale", "q", q, Quaternion)
+        _check_float("quaternion_scale", "mul", mul)
+        if out is not None:
+            _check_struct("quaternion_scale", "out", out, Quaternion)
+    Quaternion_ = _new_struct(Quaternion) if out is None or out.__class__ is not Quaternion or out._address in (q._address,) else out
+    _QuaternionScale(Quaternion_._address, q._address, mul)
+    if out is not None and out is not Quaternion_:
+        if out.__class__ is Quaternion:
+            _memcpy(out._address, Quaternion_._address, Quaternion._size)
+        else:
+            out._assign(Quaternion_)  # a shadow struct
+        return out
+    return Quaternion_
+
+
+def quaternion_divide(q1: Quaternion, q2: Quaternion, out: Quaternion = None) -> Quaternion:
+    if __debug__:
+        _check_struct("quaternion_divide", "q1", q1, Quaternion)
+        _check_struct("quaternion_divide", "q2", q2, Quaternion)
+        if out is not None:
+            _check_struct("quaternion_divide", "out", out, Quaternion)
+    Quaternion_ = _new_struct(Quaternion) if out is None or out.__class__ is not Quaternion or out._address in (q1._address, q2._address,) else out
+    _QuaternionDivide(Quaternion_._address, q1._address, q2._address)
+    if out is not None and out is not Quaternion_:
+        if out.__class__ is Quaternion:
+            _memcpy(out._address, Quaternion_._address, Quaternion._size)
+        else:
+            out._assign(Quaternion_)  # a shadow struct
+        return out
+    return Quaternion_
+
+
+def quaternion_lerp(q1: Quaternion, q2: Quaternion, amount: float, out: Quaternion = None) -> Quaternion:
+    if __debug__:
+        _check_struct("quaternion_lerp", "q1", q1, Quaternion)
+        _check_struct("quaternion_lerp", "q2", q2, Quaternion)
+        _check_float("quaternion_lerp", "amount", amount)
+        if out is not None:
+            _check_struct("quaternion_lerp", "out", out, Quaternion)
+    Quaternion_ = _new_struct(Quaternion) if out is None or out.__class__ is not Quaternion or out._address in (q1._address, q2._address,) else out
+    _QuaternionLerp(Quaternion_._address, q1._address, q2._address, amount)
+    if out is not None and out is not Quaternion_:
+        if out.__class__ is Quaternion:
+            _memcpy(out._address, Quaternion_._address, Quaternion._size)
+        else:
+            out._assign(Quaternion_)  # a shadow struct
+        return out
+    return Quaternion_
+
+
+def quaternion_nlerp(q1: Quaternion, q2: Quaternion, amount: float, out: Quaternion = None) -> Quaternion:
+    if __debug__:
+        _check_struct("quaternion_nlerp", "q1", q1, Quaternion)
+        _check_struct("quaternion_nlerp", "q2", q2, Quaternion)
+        _check_float("quaternion_nlerp", "amount", amount)
+        if out is not None:
+            _check_struct("quaternion_nlerp", "out", out, Quaternion)
+    Quaternion_ = _new_struct(Quaternion) if out is None or out.__class__ is not Quaternion or out._address in (q1._address, q2._address,) else out
+    _QuaternionNlerp(Quaternion_._address, q1._address, q2._address, amount)
+    if out is not None and out is not Quaternion_:
+        if out.__class__ is Quaternion:
+            _memcpy(out._address, Quaternion_._address, Quaternion._size)
+        else:
+            out._assign(Quaternion_)  # a shadow struct
+        return out
+    return Quaternion_
+
+
+def quaternion_slerp(q1: Quaternion, q2: Quaternion, amount: float, out: Quaternion = None) -> Quaternion:
+    if __debug__:
+        _check_struct("quaternion_slerp", "q1", q1, Quaternion)
+        _check_struct("quaternion_slerp", "q2", q2, Quaternion)
+        _check_float("quaternion_slerp", "amount", amount)
+        if out is not None:
+            _check_struct("quaternion_slerp", "out", out, Quaternion)
+    Quaternion_ = _new_struct(Quaternion) if out is None or out.__class__ is not Quaternion or out._address in (q1._address, q2._address,) else out
+    _QuaternionSlerp(Quaternion_._address, q1._address, q2._address, amount)
+    if out is not None and out is not Quaternion_:
+        if out.__class__ is Quaternion:
+            _memcpy(out._address, Quaternion_._address, Quaternion._size)
+        else:
+            out._assign(Quaternion_)  # a shadow struct
+        return out
+    return Quaternion_
+
+
+def quaternion_from_vector3_to_vector3(from_: Vector3, to: Vector3, out: Quaternion = None) -> Quaternion:
+    if __debug__:
+        _check_struct("quaternion_from_vector3_to_vector3", "from_", from_, Vector3)
+        _check_struct("quaternion_from_vector3_to_vector3", "to", to, Vector3)
+        if out is not None:
+            _check_struct("quaternion_from_vector3_to_vector3", "out", out, Quaternion)
+    Quaternion_ = _new_struct(Quaternion) if out is None or out.__class__ is not Quaternion or out._address in (from_._address, to._address,) else out
+    _QuaternionFromVector3ToVector3(Quaternion_._address, from_._address, to._address)
+    if out is not None and out is not Quaternion_:
+        if out.__class__ is Quaternion:
+            _memcpy(out._address, Quaternion_._address, Quaternion._size)
+        else:
+            out._assign(Quaternion_)  # a shadow struct
+        return out
+    return Quaternion_
+
+
+def quaternion_from_matrix(mat: Matrix, out: Quaternion = None) -> Quaternion:
+    if __debug__:
+        _check_struct("quaternion_from_matrix", "mat", mat, Matrix)
+        if out is not None:
+            _check_struct("quaternion_from_matrix", "out", out, Quaternion)
+    Quaternion_ = _new_struct(Quaternion) if out is None or out.__class__ is not Quaternion or out._address in (mat._address,) else out
+    _QuaternionFromMatrix(Quaternion_._address, mat._address)
+    if out is not None and out is not Quaternion_:
+        if out.__class__ is Quaternion:
+            _memcpy(out._address, Quaternion_._address, Quaternion._size)
+        else:
+            out._assign(Quaternion_)  # a shadow struct
+        return out
+    return Quaternion_
+
+
+def quaternion_to_matrix(q: Quaternion, out: Matrix = None) -> Matrix:
+    if __debug__:
+        _check_struct("quaternion_to_matrix", "q", q, Quaternion)
+        if out is not None:
+            _check_struct("quaternion_to_matrix", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix or out._address in (q._address,) else out
+    _QuaternionToMatrix(Matrix_._address, q._address)
+    if out is not None and out is not Matrix_:
+        if out.__class__ is Matrix:
+            _memcpy(out._address, Matrix_._address, Matrix._size)
+        else:
+            out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def quaternion_from_axis_angle(axis: Vector3, angle: float, out: Quaternion = None) -> Quaternion:
+    if __debug__:
+        _check_struct("quaternion_from_axis_angle", "axis", axis, Vector3)
+        _check_float("quaternion_from_axis_angle", "angle", angle)
+        if out is not None:
+            _check_struct("quaternion_from_axis_angle", "out", out, Quaternion)
+    Quaternion_ = _new_struct(Quaternion) if out is None or out.__class__ is not Quaternion or out._address in (axis._address,) else out
+    _QuaternionFromAxisAngle(Quaternion_._address, axis._address, angle)
+    if out is not None and out is not Quaternion_:
+        if out.__class__ is Quaternion:
+            _memcpy(out._address, Quaternion_._address, Quaternion._size)
+        else:
+            out._assign(Quaternion_)  # a shadow struct
+        return out
+    return Quaternion_
+
+
+def quaternion_to_axis_angle(q: Quaternion, outAxis: int, outAngle: int):
+    if __debug__:
+        _check_struct("quaternion_to_axis_angle", "q", q, Quaternion)
+        _check_int("quaternion_to_axis_angle", "outAxis", outAxis, 0, 4294967295)
+        _check_int("quaternion_to_axis_angle", "outAngle", outAngle, 0, 4294967295)
+    _QuaternionToAxisAngle(q._address, outAxis, outAngle)
+
+
+def quaternion_from_euler(pitch: float, yaw: float, roll: float, out: Quaternion = None) -> Quaternion:
+    if __debug__:
+        _check_float("quaternion_from_euler", "pitch", pitch)
+        _check_float("quaternion_from_euler", "yaw", yaw)
+        _check_float("quaternion_from_euler", "roll", roll)
+        if out is not None:
+            _check_struct("quaternion_from_euler", "out", out, Quaternion)
+    Quaternion_ = _new_struct(Quaternion) if out is None or out.__class__ is not Quaternion else out
+    _QuaternionFromEuler(Quaternion_._address, pitch, yaw, roll)
+    if out is not None and out is not Quaternion_:
+        out._assign(Quaternion_)  # a shadow struct
+        return out
+    return Quaternion_
+
+
+def quaternion_to_euler(q: Quaternion, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_struct("quaternion_to_euler", "q", q, Quaternion)
+        if out is not None:
+            _check_struct("quaternion_to_euler", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (q._address,) else out
+    _QuaternionToEuler(Vector3_._address, q._address)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def quaternion_transform(q: Quaternion, mat: Matrix, out: Quaternion = None) -> Quaternion:
+    if __debug__:
+        _check_struct("quaternion_transform", "q", q, Quaternion)
+        _check_struct("quaternion_transform", "mat", mat, Matrix)
+        if out is not None:
+            _check_struct("quaternion_transform", "out", out, Quaternion)
+    Quaternion_ = _new_struct(Quaternion) if out is None or out.__class__ is not Quaternion or out._address in (q._address, mat._address,) else out
+    _QuaternionTransform(Quaternion_._address, q._address, mat._address)
+    if out is not None and out is not Quaternion_:
+        if out.__class__ is Quaternion:
+            _memcpy(out._address, Quaternion_._address, Quaternion._size)
+        else:
+            out._assign(Quaternion_)  # a shadow struct
+        return out
+    return Quaternion_
+
+
+def quaternion_equals(p: Quaternion, q: Quaternion) -> int:
+    if __debug__:
+        _check_struct("quaternion_equals", "p", p, Quaternion)
+        _check_struct("quaternion_equals", "q", q, Quaternion)
+    return_interface = _QuaternionEquals(p._address, q._address)
+    return return_interface
+
+
+# the wasm exports called above, fetched once instead of looked up at every call, they are bound
+# again when another context is activated or profiling starts
+_wasm_functions_names = [
+    "_Clamp",
+    "_Lerp",
+    "_Normalize",
+    "_Remap",
+    "_Wrap",
+    "_FloatEquals",
+    "_Vector2Zero",
+    "_Vector2One",
+    "_Vector2Add",
+    "_memcpy",
+    "_Vector2AddValue",
+    "_Vector2Subtract",
+    "_Vector2SubtractValue",
+    "_Vector2Length",
+    "_Vector2LengthSqr",
+    "_Vector2DotProduct",
+    "_Vector2Distance",
+    "_Vector2DistanceSqr",
+    "_Vector2Angle",
+    "_Vector2LineAngle",
+    "_Vector2Scale",
+    "_Vector2Multiply",
+    "_Vector2Negate",
+    "_Vector2Divide",
+    "_Vector2Normalize",
+    "_Vector2Transform",
+    "_Vector2Lerp",
+    "_Vector2Reflect",
+    "_Vector2Rotate",
+    "_Vector2MoveTowards",
+    "_Vector2Invert",
+    "_Vector2Clamp",
+    "_Vector2ClampValue",
+    "_Vector2Equals",
+    "_Vector3Zero",
+    "_Vector3One",
+    "_Vector3Add",
+    "_Vector3AddValue",
+    "_Vector3Subtract",
+    "_Vector3SubtractValue",
+    "_Vector3Scale",
+    "_Vector3Multiply",
+    "_Vector3CrossProduct",
+    "_Vector3Perpendicular",
+    "_Vector3Length",
+    "_Vector3LengthSqr",
+    "_Vector3DotProduct",
+    "_Vector3Distance",
+    "_Vector3DistanceSqr",
+    "_Vector3Angle",
+    "_Vector3Negate",
+    "_Vector3Divide",
+    "_Vector3Normalize",
+    "_Vector3OrthoNormalize",
+    "_Vector3Transform",
+    "_Vector3RotateByQuaternion",
+    "_Vector3RotateByAxisAngle",
+    "_Vector3Lerp",
+    "_Vector3Reflect",
+    "_Vector3Min",
+    "_Vector3Max",
+    "_Vector3Barycenter",
+    "_Vector3Unproject",
+    "_Vector3ToFloatV",
+    "_Vector3Invert",
+    "_Vector3Clamp",
+    "_Vector3ClampValue",
+    "_Vector3Equals",
+    "_Vector3Refract",
+    "_MatrixDeterminant",
+    "_MatrixTrace",
+    "_MatrixTranspose",
+    "_MatrixInvert",
+    "_MatrixIdentity",
+    "_MatrixAdd",
+    "_MatrixSubtract",
+    "_MatrixMultiply",
+    "_MatrixTranslate",
+    "_MatrixRotate",
+    "_MatrixRotateX",
+    "_MatrixRotateY",
+    "_MatrixRotateZ",
+    "_MatrixRotateXYZ",
+    "_MatrixRotateZYX",
+    "_MatrixScale",
+    "_MatrixFrustum",
+    "_MatrixPerspective",
+    "_MatrixOrtho",
+    "_MatrixLookAt",
+    "_MatrixToFloatV",
+    "_QuaternionAdd",
+    "_QuaternionAddValue",
+    "_QuaternionSubtract",
+    "_QuaternionSubtractValue",
+    "_QuaternionIdentity",
+    "_QuaternionLength",
+    "_QuaternionNormalize",
+    "_QuaternionInvert",
+    "_QuaternionMultiply",
+    "_QuaternionScale",
+    "_QuaternionDivide",
+    "_QuaternionLerp",
+    "_QuaternionNlerp",
+    "_QuaternionSlerp",
+    "_QuaternionFromVector3ToVector3",
+    "_QuaternionFromMatrix",
+    "_QuaternionToMatrix",
+    "_QuaternionFromAxisAngle",
+    "_QuaternionToAxisAngle",
+    "_QuaternionFromEuler",
+    "_QuaternionToEuler",
+    "_QuaternionTransform",
+    "_QuaternionEquals",
+    "_Vector2AddArray",
+    "_Vector3AddArray",
+    "_Vector2ScaleArray",
+    "_Vector3ScaleArray",
+    "_Vector2NormalizeArray",
+    "_Vector3NormalizeArray",
+    "_Vector2LerpArray",
+    "_Vector3LerpArray",
+    "_Vector2TransformArray",
+    "_Vector3TransformArray",
+    "_MatrixMultiplyArray",
+]
+_bind_wasm_functions(globals())
+
+
+# raymath over whole arrays: a StructArray is computed in wasm memory with one call into wasm (the *Array
+# functions of raylib.c), a numpy array (like StructArray.as_numpy() or shaped (count, 2 or 3)) with numpy
+
+
+def _check_struct_array(values: StructArray, stype):
+    if values._stype is not stype:
+        raise TypeError(f"expected a StructArray of {stype.__name__}, not of {values._stype.__name__}")
+
+
+def _struct_array_out(values: StructArray, stype, out: StructArray) -> StructArray:
+    _check_struct_array(values, stype)
+    if out is None:
+        return StructArray(stype, len(values))
+    if out._stype is not stype or len(out) < len(values):
+        raise ValueError(f"out must be a StructArray of at least {len(values)} {stype.__name__}")
+    return out
+
+
+def _in_wasm(kernel, stype, *arrays) -> bool:
+    """Check if arrays are all StructArrays of stype for the wasm kernel, otherwise they are computed with numpy
+    (a StructArray among them copied out of wasm memory), like when the raylib wasm doesn't export the kernel"""
+    struct_arrays = [values for values in arrays if isinstance(values, StructArray)]
+    for values in struct_arrays:
+        _check_struct_array(values, stype)
+    return len(struct_arrays) == len(arrays) and _is_wasm_function_exported(kernel)
+
+
+def _numpy_rows(values, size: int):
+    """values as a (count, size) numpy array, and a function that gives a result the dtype and shape of values"""
+    numpy = _import_numpy()
+    if isinstance(values, StructArray):
+        values = values.as_numpy()
+    values = numpy.asarray(values)
+    if values.dtype.names is not None:  # structured, the fields of the struct are columns
+        dtype = values.dtype
+        rows = numpy.ascontiguousarray(values).view(numpy.float32).reshape(-1, size)
+        return rows, lambda result: numpy.ascontiguousarray(result, dtype=numpy.float32).view(dtype).reshape(-1)
+    return values.reshape(-1, size), lambda result: result.reshape(values.shape)
+
+
+def _numpy_result(result, out, values):
+    """result into out, or a new StructArray if values is one"""
+    if isinstance(out, StructArray):
+        out[:len(result)] = result
+        return out
+    if out is None:
+        if not isinstance(values, StructArray):
+            return result
+        out = StructArray(values._stype, len(result))
+        out.from_numpy(result)
+        return out
+    out[...] = result
+    return out
+
+
+def _matrix_rows(mat):
+    """mat (a Matrix or 16 floats in its field order) as a 4x4 numpy array, row i is the row i of the math"""
+    numpy = _import_numpy()
+    if isinstance(mat, Matrix):
+        rows = numpy.empty(16, dtype=numpy.float32)
+        _heap.u8.subarray(mat._address, mat._address + Matrix._size).assign_to(rows.view(numpy.uint8))
+        return rows.reshape(4, 4)
+    return numpy.asarray(mat, dtype=numpy.float32).reshape(4, 4)
+
+
+def vector2_add_array(v1, v2, out=None):
+    """Add two arrays of Vector2, item by item"""
+    if _in_wasm(_Vector2AddArray, Vector2, v1, v2):
+        out = _struct_array_out(v1, Vector2, out)
+        _Vector2AddArray(v1._address, v2._address, min(len(v1), len(v2)), out._address)
+        return out
+    rows1, shaped = _numpy_rows(v1, 2)
+    rows2, _ = _numpy_rows(v2, 2)
+    return _numpy_result(shaped(rows1 + rows2), out, v1)
+
+
+def vector3_add_array(v1, v2, out=None):
+    """Add two arrays of Vector3, item by item"""
+    if _in_wasm(_Vector3AddArray, Vector3, v1, v2):
+        out = _struct_array_out(v1, Vector3, out)
+        _Vector3AddArray(v1._address, v2._address, min(len(v1), len(v2)), out._address)
+        return out
+    rows1, shaped = _numpy_rows(v1, 3)
+    rows2, _ = _numpy_rows(v2, 3)
+    return _numpy_result(shaped(rows1 + rows2), out, v1)
+
+
+def vector2_scale_array(v, scale: float, out=None):
+    """Multiply every Vector2 of an array by scale"""
+    if _in_wasm(_Vector2ScaleArray, Vector2, v):
+        out = _struct_array_out(v, Vector2, out)
+        _Vector2ScaleArray(v._address, len(v), scale, out._address)
+        return out
+    rows, shaped = _numpy_rows(v, 2)
+    return _numpy_result(shaped(rows * scale), out, v)
+
+
+def vector3_scale_array(v, scale: float, out=None):
+    """Multiply every Vector3 of an array by scale"""
+    if _in_wasm(_Vector3ScaleArray, Vector3, v):
+        out = _struct_array_out(v, Vector3, out)
+        _Vector3ScaleArray(v._address, len(v), scale, out._address)
+        return out
+    rows, shaped = _numpy_rows(v, 3)
+    return _numpy_result(shaped(rows * scale), out, v)
+
+
+def _normalized_rows(rows):
+    numpy = _import_numpy()
+    lengths = numpy.sqrt((rows * rows).sum(axis=1, keepdims=True))
+    return numpy.divide(rows, lengths, out=rows.astype(numpy.result_type(rows, lengths)), where=lengths > 0)
+
+
+def vector2_normalize_array(v, out=None):
+    """Normalize every Vector2 of an array, a zero vector stays zero"""
+    if _in_wasm(_Vector2NormalizeArray, Vector2, v):
+        out = _struct_array_out(v, Vector2, out)
+        _Vector2NormalizeArray(v._address, len(v), out._address)
+        return out
+    rows, shaped = _numpy_rows(v, 2)
+    return _numpy_result(shaped(_normalized_rows(rows)), out, v)
+
+
+def vector3_normalize_array(v, out=None):
+    """Normalize every Vector3 of an array, a zero vector stays zero"""
+    if _in_wasm(_Vector3NormalizeArray, Vector3, v):
+        out = _struct_array_out(v, Vector3, out)
+        _Vector3NormalizeArray(v._address, len(v), out._address)
+        return out
+    rows, shaped = _numpy_rows(v, 3)
+    return _numpy_result(shaped(_normalized_rows(rows)), out, v)
+
+
+def vector2_lerp_array(v1, v2, amount, out=None):
+    """Interpolate between two arrays of Vector2, item by item, amount can be one per item with numpy arrays"""
+    if _in_wasm(_Vector2LerpArray, Vector2, v1, v2):
+        out = _struct_array_out(v1, Vector2, out)
+        _Vector2LerpArray(v1._address, v2._address, min(len(v1), len(v2)), amount, out._address)
+        return out
+    rows1, shaped = _numpy_rows(v1, 2)
+    rows2, _ = _numpy_rows(v2, 2)
+    amount = _import_numpy().asarray(amount).reshape(-1, 1)
+    return _numpy_result(shaped(rows1 + amount * (rows2 - rows1)), out, v1)
+
+
+def vector3_lerp_array(v1, v2, amount, out=None):
+    """Interpolate between two arrays of Vector3, item by item, amount can be one per item with numpy arrays"""
+    if _in_wasm(_Vector3LerpArray, Vector3, v1, v2):
+        out = _struct_array_out(v1, Vector3, out)
+        _Vector3LerpArray(v1._address, v2._address, min(len(v1), len(v2)), amount, out._address)
+        return out
+    rows1, shaped = _numpy_rows(v1, 3)
+    rows2, _ = _numpy_rows(v2, 3)
+    amount = _import_numpy().asarray(amount).reshape(-1, 1)
+    return _numpy_result(shaped(rows1 + amount * (rows2 - rows1)), out, v1)
+
+
+def vector2_transform_array(v, mat, out=None):
+    """Transform every Vector2 of an array by mat, like vector2_transform()"""
+    if _in_wasm(_Vector2TransformArray, Vector2, v) and isinstance(mat, Matrix):
+        out = _struct_array_out(v, Vector2, out)
+        _Vector2TransformArray(v._address, len(v), mat._address, out._address)
+        return out
+    rows, shaped = _numpy_rows(v, 2)
+    matrix = _matrix_rows(mat)
+    return _numpy_result(shaped(rows @ matrix[:2, :2].T + matrix[:2, 3]), out, v)
+
+
+def vector3_transform_array(v, mat, out=None):
+    """Transform every Vector3 of an array by mat, like vector3_transform()"""
+    if _in_wasm(_Vector3TransformArray, Vector3, v) and isinstance(mat, Matrix):
+        out = _struct_array_out(v, Vector3, out)
+        _Vector3TransformArray(v._address, len(v), mat._address, out._address)
+        return out
+    rows, shaped = _numpy_rows(v, 3)
+    matrix = _matrix_rows(mat)
+    return _numpy_result(shaped(rows @ matrix[:3, :3].T + matrix[:3, 3]), out, v)
+
+
+def matrix_multiply_array(left, right, out=None):
+    """matrix_multiply(left[i], right) for every Matrix of left"""
+    if _in_wasm(_MatrixMultiplyArray, Matrix, left) and isinstance(right, Matrix):
+        out = _struct_array_out(left, Matrix, out)
+        _MatrixMultiplyArray(left._address, len(left), right._address, out._address)
+        return out
+    rows, shaped = _numpy_rows(left, 16)
+    # matrix_multiply(left, right) is right @ left in math order
+    return _numpy_result(shaped((_matrix_rows(right) @ rows.reshape(-1, 4, 4)).reshape(-1, 16)), out, left)
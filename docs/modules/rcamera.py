@@ -0,0 +1,164 @@
+# Generated by tools/code_generation/filesGeneration.py, do not edit by hand
+# rcamera.h, from tools/api/rcamera.json
+from wasmraypy.core import (
+    _new_struct,
+    Vector3,
+    Matrix,
+    _check_int,
+    _check_float,
+    _check_struct,
+    _bind_wasm_functions,
+)
+
+
+CAMERA_CULL_DISTANCE_NEAR: float = 0.01
+CAMERA_CULL_DISTANCE_FAR: float = 1000.0
+CAMERA_MOVE_SPEED: float = 0.09
+CAMERA_ROTATION_SPEED: float = 0.03
+CAMERA_MOUSE_MOVE_SENSITIVITY: float = 0.003  # TODO: it should be independant of framerate
+CAMERA_MOUSE_SCROLL_SENSITIVITY: float = 1.5
+CAMERA_ORBITAL_SPEED: float = 0.5  # Radians per second
+CAMERA_FIRST_PERSON_STEP_TRIGONOMETRIC_DIVIDER: float = 8.0
+CAMERA_FIRST_PERSON_STEP_DIVIDER: float = 30.0
+CAMERA_FIRST_PERSON_WAVING_DIVIDER: float = 200.0
+PLAYER_MOVEMENT_SENSITIVITY: float = 20.0
+
+def get_camera_forward(camera: int, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_int("get_camera_forward", "camera", camera, 0, 4294967295)
+        if out is not None:
+            _check_struct("get_camera_forward", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 else out
+    _GetCameraForward(Vector3_._address, camera)
+    if out is not None and out is not Vector3_:
+        out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def get_camera_up(camera: int, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_int("get_camera_up", "camera", camera, 0, 4294967295)
+        if out is not None:
+            _check_struct("get_camera_up", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 else out
+    _GetCameraUp(Vector3_._address, camera)
+    if out is not None and out is not Vector3_:
+        out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def get_camera_right(camera: int, out: Vector3 = None) -> Vector3:
+    if __debug__:
+        _check_int("get_camera_right", "camera", camera, 0, 4294967295)
+        if out is not None:
+            _check_struct("get_camera_right", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 else out
+    _GetCameraRight(Vector3_._address, camera)
+    if out is not None and out is not Vector3_:
+        out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def camera_move_forward(camera: int, distance: float, moveInWorldPlane: int):
+    if __debug__:
+        _check_int("camera_move_forward", "camera", camera, 0, 4294967295)
+        _check_float("camera_move_forward", "distance", distance)
+        _check_int("camera_move_forward", "moveInWorldPlane", moveInWorldPlane, -128, 127)
+    _CameraMoveForward(camera, distance, moveInWorldPlane)
+
+
+def camera_move_up(camera: int, distance: float):
+    if __debug__:
+        _check_int("camera_move_up", "camera", camera, 0, 4294967295)
+        _check_float("camera_move_up", "distance", distance)
+    _CameraMoveUp(camera, distance)
+
+
+def camera_move_right(camera: int, distance: float, moveInWorldPlane: int):
+    if __debug__:
+        _check_int("camera_move_right", "camera", camera, 0, 4294967295)
+        _check_float("camera_move_right", "distance", distance)
+        _check_int("camera_move_right", "moveInWorldPlane", moveInWorldPlane, -128, 127)
+    _CameraMoveRight(camera, distance, moveInWorldPlane)
+
+
+def camera_move_to_target(camera: int, delta: float):
+    if __debug__:
+        _check_int("camera_move_to_target", "camera", camera, 0, 4294967295)
+        _check_float("camera_move_to_target", "delta", delta)
+    _CameraMoveToTarget(camera, delta)
+
+
+def camera_yaw(camera: int, angle: float, rotateAroundTarget: int):
+    if __debug__:
+        _check_int("camera_yaw", "camera", camera, 0, 4294967295)
+        _check_float("camera_yaw", "angle", angle)
+        _check_int("camera_yaw", "rotateAroundTarget", rotateAroundTarget, -128, 127)
+    _CameraYaw(camera, angle, rotateAroundTarget)
+
+
+def camera_pitch(camera: int, angle: float, lockView: int, rotateAroundTarget: int, rotateUp: int):
+    if __debug__:
+        _check_int("camera_pitch", "camera", camera, 0, 4294967295)
+        _check_float("camera_pitch", "angle", angle)
+        _check_int("camera_pitch", "lockView", lockView, -128, 127)
+        _check_int("camera_pitch", "rotateAroundTarget", rotateAroundTarget, -128, 127)
+        _check_int("camera_pitch", "rotateUp", rotateUp, -128, 127)
+    _CameraPitch(camera, angle, lockView, rotateAroundTarget, rotateUp)
+
+
+def camera_roll(camera: int, angle: float):
+    if __debug__:
+        _check_int("camera_roll", "camera", camera, 0, 4294967295)
+        _check_float("camera_roll", "angle", angle)
+    _CameraRoll(camera, angle)
+
+
+def get_camera_view_matrix(camera: int, out: Matrix = None) -> Matrix:
+    if __debug__:
+        _check_int("get_camera_view_matrix", "camera", camera, 0, 4294967295)
+        if out is not None:
+            _check_struct("get_camera_view_matrix", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix else out
+    _GetCameraViewMatrix(Matrix_._address, camera)
+    if out is not None and out is not Matrix_:
+        out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def get_camera_projection_matrix(camera: int, aspect: float, out: Matrix = None) -> Matrix:
+    if __debug__:
+        _check_int("get_camera_projection_matrix", "camera", camera, 0, 4294967295)
+        _check_float("get_camera_projection_matrix", "aspect", aspect)
+        if out is not None:
+            _check_struct("get_camera_projection_matrix", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix else out
+    _GetCameraProjectionMatrix(Matrix_._address, camera, aspect)
+    if out is not None and out is not Matrix_:
+        out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+# the wasm exports called above, fetched once instead of looked up at every call, they are bound
+# again when another context is activated or profiling starts
+_wasm_functions_names = [
+    "_GetCameraForward",
+    "_GetCameraUp",
+    "_GetCameraRight",
+    "_CameraMoveForward",
+    "_CameraMoveUp",
+    "_CameraMoveRight",
+    "_CameraMoveToTarget",
+    "_CameraYaw",
+    "_CameraPitch",
+    "_CameraRoll",
+    "_GetCameraViewMatrix",
+    "_GetCameraProjectionMatrix",
+]
+_bind_wasm_functions(globals())
+
@@ -0,0 +1,351 @@
+# Generated by tools/code_generation/filesGeneration.py, do not edit by hand
+# reasings.h, from tools/api/reasings.json
+from wasmraypy.core import (
+    _check_float,
+    _bind_wasm_functions,
+)
+
+
+
+def ease_linear_none(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Linear"""
+    if __debug__:
+        _check_float("ease_linear_none", "t", t)
+        _check_float("ease_linear_none", "b", b)
+        _check_float("ease_linear_none", "c", c)
+        _check_float("ease_linear_none", "d", d)
+    return_interface = _EaseLinearNone(t, b, c, d)
+    return return_interface
+
+
+def ease_linear_in(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Linear In"""
+    if __debug__:
+        _check_float("ease_linear_in", "t", t)
+        _check_float("ease_linear_in", "b", b)
+        _check_float("ease_linear_in", "c", c)
+        _check_float("ease_linear_in", "d", d)
+    return_interface = _EaseLinearIn(t, b, c, d)
+    return return_interface
+
+
+def ease_linear_out(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Linear Out"""
+    if __debug__:
+        _check_float("ease_linear_out", "t", t)
+        _check_float("ease_linear_out", "b", b)
+        _check_float("ease_linear_out", "c", c)
+        _check_float("ease_linear_out", "d", d)
+    return_interface = _EaseLinearOut(t, b, c, d)
+    return return_interface
+
+
+def ease_linear_in_out(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Linear In Out"""
+    if __debug__:
+        _check_float("ease_linear_in_out", "t", t)
+        _check_float("ease_linear_in_out", "b", b)
+        _check_float("ease_linear_in_out", "c", c)
+        _check_float("ease_linear_in_out", "d", d)
+    return_interface = _EaseLinearInOut(t, b, c, d)
+    return return_interface
+
+
+def ease_sine_in(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Sine In"""
+    if __debug__:
+        _check_float("ease_sine_in", "t", t)
+        _check_float("ease_sine_in", "b", b)
+        _check_float("ease_sine_in", "c", c)
+        _check_float("ease_sine_in", "d", d)
+    return_interface = _EaseSineIn(t, b, c, d)
+    return return_interface
+
+
+def ease_sine_out(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Sine Out"""
+    if __debug__:
+        _check_float("ease_sine_out", "t", t)
+        _check_float("ease_sine_out", "b", b)
+        _check_float("ease_sine_out", "c", c)
+        _check_float("ease_sine_out", "d", d)
+    return_interface = _EaseSineOut(t, b, c, d)
+    return return_interface
+
+
+def ease_sine_in_out(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Sine Out"""
+    if __debug__:
+        _check_float("ease_sine_in_out", "t", t)
+        _check_float("ease_sine_in_out", "b", b)
+        _check_float("ease_sine_in_out", "c", c)
+        _check_float("ease_sine_in_out", "d", d)
+    return_interface = _EaseSineInOut(t, b, c, d)
+    return return_interface
+
+
+def ease_circ_in(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Circular In"""
+    if __debug__:
+        _check_float("ease_circ_in", "t", t)
+        _check_float("ease_circ_in", "b", b)
+        _check_float("ease_circ_in", "c", c)
+        _check_float("ease_circ_in", "d", d)
+    return_interface = _EaseCircIn(t, b, c, d)
+    return return_interface
+
+
+def ease_circ_out(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Circular Out"""
+    if __debug__:
+        _check_float("ease_circ_out", "t", t)
+        _check_float("ease_circ_out", "b", b)
+        _check_float("ease_circ_out", "c", c)
+        _check_float("ease_circ_out", "d", d)
+    return_interface = _EaseCircOut(t, b, c, d)
+    return return_interface
+
+
+def ease_circ_in_out(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Circular In Out"""
+    if __debug__:
+        _check_float("ease_circ_in_out", "t", t)
+        _check_float("ease_circ_in_out", "b", b)
+        _check_float("ease_circ_in_out", "c", c)
+        _check_float("ease_circ_in_out", "d", d)
+    return_interface = _EaseCircInOut(t, b, c, d)
+    return return_interface
+
+
+def ease_cubic_in(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Cubic In"""
+    if __debug__:
+        _check_float("ease_cubic_in", "t", t)
+        _check_float("ease_cubic_in", "b", b)
+        _check_float("ease_cubic_in", "c", c)
+        _check_float("ease_cubic_in", "d", d)
+    return_interface = _EaseCubicIn(t, b, c, d)
+    return return_interface
+
+
+def ease_cubic_out(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Cubic Out"""
+    if __debug__:
+        _check_float("ease_cubic_out", "t", t)
+        _check_float("ease_cubic_out", "b", b)
+        _check_float("ease_cubic_out", "c", c)
+        _check_float("ease_cubic_out", "d", d)
+    return_interface = _EaseCubicOut(t, b, c, d)
+    return return_interface
+
+
+def ease_cubic_in_out(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Cubic In Out"""
+    if __debug__:
+        _check_float("ease_cubic_in_out", "t", t)
+        _check_float("ease_cubic_in_out", "b", b)
+        _check_float("ease_cubic_in_out", "c", c)
+        _check_float("ease_cubic_in_out", "d", d)
+    return_interface = _EaseCubicInOut(t, b, c, d)
+    return return_interface
+
+
+def ease_quad_in(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Quadratic In"""
+    if __debug__:
+        _check_float("ease_quad_in", "t", t)
+        _check_float("ease_quad_in", "b", b)
+        _check_float("ease_quad_in", "c", c)
+        _check_float("ease_quad_in", "d", d)
+    return_interface = _EaseQuadIn(t, b, c, d)
+    return return_interface
+
+
+def ease_quad_out(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Quadratic Out"""
+    if __debug__:
+        _check_float("ease_quad_out", "t", t)
+        _check_float("ease_quad_out", "b", b)
+        _check_float("ease_quad_out", "c", c)
+        _check_float("ease_quad_out", "d", d)
+    return_interface = _EaseQuadOut(t, b, c, d)
+    return return_interface
+
+
+def ease_quad_in_out(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Quadratic In Out"""
+    if __debug__:
+        _check_float("ease_quad_in_out", "t", t)
+        _check_float("ease_quad_in_out", "b", b)
+        _check_float("ease_quad_in_out", "c", c)
+        _check_float("ease_quad_in_out", "d", d)
+    return_interface = _EaseQuadInOut(t, b, c, d)
+    return return_interface
+
+
+def ease_expo_in(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Exponential In"""
+    if __debug__:
+        _check_float("ease_expo_in", "t", t)
+        _check_float("ease_expo_in", "b", b)
+        _check_float("ease_expo_in", "c", c)
+        _check_float("ease_expo_in", "d", d)
+    return_interface = _EaseExpoIn(t, b, c, d)
+    return return_interface
+
+
+def ease_expo_out(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Exponential Out"""
+    if __debug__:
+        _check_float("ease_expo_out", "t", t)
+        _check_float("ease_expo_out", "b", b)
+        _check_float("ease_expo_out", "c", c)
+        _check_float("ease_expo_out", "d", d)
+    return_interface = _EaseExpoOut(t, b, c, d)
+    return return_interface
+
+
+def ease_expo_in_out(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Exponential In Out"""
+    if __debug__:
+        _check_float("ease_expo_in_out", "t", t)
+        _check_float("ease_expo_in_out", "b", b)
+        _check_float("ease_expo_in_out", "c", c)
+        _check_float("ease_expo_in_out", "d", d)
+    return_interface = _EaseExpoInOut(t, b, c, d)
+    return return_interface
+
+
+def ease_back_in(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Back In"""
+    if __debug__:
+        _check_float("ease_back_in", "t", t)
+        _check_float("ease_back_in", "b", b)
+        _check_float("ease_back_in", "c", c)
+        _check_float("ease_back_in", "d", d)
+    return_interface = _EaseBackIn(t, b, c, d)
+    return return_interface
+
+
+def ease_back_out(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Back Out"""
+    if __debug__:
+        _check_float("ease_back_out", "t", t)
+        _check_float("ease_back_out", "b", b)
+        _check_float("ease_back_out", "c", c)
+        _check_float("ease_back_out", "d", d)
+    return_interface = _EaseBackOut(t, b, c, d)
+    return return_interface
+
+
+def ease_back_in_out(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Back In Out"""
+    if __debug__:
+        _check_float("ease_back_in_out", "t", t)
+        _check_float("ease_back_in_out", "b", b)
+        _check_float("ease_back_in_out", "c", c)
+        _check_float("ease_back_in_out", "d", d)
+    return_interface = _EaseBackInOut(t, b, c, d)
+    return return_interface
+
+
+def ease_bounce_out(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Bounce Out"""
+    if __debug__:
+        _check_float("ease_bounce_out", "t", t)
+        _check_float("ease_bounce_out", "b", b)
+        _check_float("ease_bounce_out", "c", c)
+        _check_float("ease_bounce_out", "d", d)
+    return_interface = _EaseBounceOut(t, b, c, d)
+    return return_interface
+
+
+def ease_bounce_in(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Bounce In"""
+    if __debug__:
+        _check_float("ease_bounce_in", "t", t)
+        _check_float("ease_bounce_in", "b", b)
+        _check_float("ease_bounce_in", "c", c)
+        _check_float("ease_bounce_in", "d", d)
+    return_interface = _EaseBounceIn(t, b, c, d)
+    return return_interface
+
+
+def ease_bounce_in_out(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Bounce In Out"""
+    if __debug__:
+        _check_float("ease_bounce_in_out", "t", t)
+        _check_float("ease_bounce_in_out", "b", b)
+        _check_float("ease_bounce_in_out", "c", c)
+        _check_float("ease_bounce_in_out", "d", d)
+    return_interface = _EaseBounceInOut(t, b, c, d)
+    return return_interface
+
+
+def ease_elastic_in(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Elastic In"""
+    if __debug__:
+        _check_float("ease_elastic_in", "t", t)
+        _check_float("ease_elastic_in", "b", b)
+        _check_float("ease_elastic_in", "c", c)
+        _check_float("ease_elastic_in", "d", d)
+    return_interface = _EaseElasticIn(t, b, c, d)
+    return return_interface
+
+
+def ease_elastic_out(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Elastic Out"""
+    if __debug__:
+        _check_float("ease_elastic_out", "t", t)
+        _check_float("ease_elastic_out", "b", b)
+        _check_float("ease_elastic_out", "c", c)
+        _check_float("ease_elastic_out", "d", d)
+    return_interface = _EaseElasticOut(t, b, c, d)
+    return return_interface
+
+
+def ease_elastic_in_out(t: float, b: float, c: float, d: float) -> float:
+    """Ease: Elastic In Out"""
+    if __debug__:
+        _check_float("ease_elastic_in_out", "t", t)
+        _check_float("ease_elastic_in_out", "b", b)
+        _check_float("ease_elastic_in_out", "c", c)
+        _check_float("ease_elastic_in_out", "d", d)
+    return_interface = _EaseElasticInOut(t, b, c, d)
+    return return_interface
+
+
+# the wasm exports called above, fetched once instead of looked up at every call, they are bound
+# again when another context is activated or profiling starts
+_wasm_functions_names = [
+    "_EaseLinearNone",
+    "_EaseLinearIn",
+    "_EaseLinearOut",
+    "_EaseLinearInOut",
+    "_EaseSineIn",
+    "_EaseSineOut",
+    "_EaseSineInOut",
+    "_EaseCircIn",
+    "_EaseCircOut",
+    "_EaseCircInOut",
+    "_EaseCubicIn",
+    "_EaseCubicOut",
+    "_EaseCubicInOut",
+    "_EaseQuadIn",
+    "_EaseQuadOut",
+    "_EaseQuadInOut",
+    "_EaseExpoIn",
+    "_EaseExpoOut",
+    "_EaseExpoInOut",
+    "_EaseBackIn",
+    "_EaseBackOut",
+    "_EaseBackInOut",
+    "_EaseBounceOut",
+    "_EaseBounceIn",
+    "_EaseBounceInOut",
+    "_EaseElasticIn",
+    "_EaseElasticOut",
+    "_EaseElasticInOut",
+]
+_bind_wasm_functions(globals())
+
@@ -0,0 +1,1708 @@
+# Generated by tools/code_generation/filesGeneration.py, do not edit by hand
+# rlgl.h, from tools/api/rlgl.json
+import enum
+from wasmraypy.core import (
+    _heap,
+    _scratch_arena,
+    _struct_pool,
+    _new_struct,
+    Matrix,
+    Color,
+    Texture,
+    Shader,
+    _check_int,
+    _check_float,
+    _check_str,
+    _check_struct,
+    _bind_wasm_functions,
+)
+
+
+class rlDrawCall:
+    """of those state-change happens (this is done in core module)"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 16
+    _dtype_spec: dict = {"names": ["mode", "vertexCount", "vertexAlignment", "textureId"], "formats": ["<i4", "<i4", "<i4", "<u4"], "offsets": [0, 4, 8, 12], "itemsize": 16}
+
+    def __init__(self, mode: int = 0, vertexCount: int = 0, vertexAlignment: int = 0, textureId: int = 0, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(16)
+            self._to_free = _struct_pool
+            _heap.i32[self._address >> 2] = mode
+            _heap.i32[(self._address + 4) >> 2] = vertexCount
+            _heap.i32[(self._address + 8) >> 2] = vertexAlignment
+            _heap.u32[(self._address + 12) >> 2] = textureId
+
+    @property
+    def mode(self):
+        """Drawing mode: LINES, TRIANGLES, QUADS"""
+        return _heap.i32[self._address >> 2]
+
+    @mode.setter
+    def mode(self, value):
+        if not self._frozen:
+            _heap.i32[self._address >> 2] = value
+
+    @property
+    def vertexCount(self):
+        """Number of vertex of the draw"""
+        return _heap.i32[(self._address + 4) >> 2]
+
+    @vertexCount.setter
+    def vertexCount(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 4) >> 2] = value
+
+    @property
+    def vertexAlignment(self):
+        """Number of vertex required for index alignment (LINES, TRIANGLES)"""
+        return _heap.i32[(self._address + 8) >> 2]
+
+    @vertexAlignment.setter
+    def vertexAlignment(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 8) >> 2] = value
+
+    @property
+    def textureId(self):
+        """Texture id to be used on the draw -> Use to create new draw call if changes"""
+        return _heap.u32[(self._address + 12) >> 2]
+
+    @textureId.setter
+    def textureId(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 12) >> 2] = value
+
+    def __str__(self):
+        return f"rlDrawCall(address={self._address}, {self.mode}, {self.vertexCount}, {self.vertexAlignment}, {self.textureId})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 16)
+
+class rlRenderBatch:
+    """rlRenderBatch type"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 24
+    _dtype_spec: dict = {"names": ["bufferCount", "currentBuffer", "vertexBuffer", "draws", "drawCounter", "currentDepth"], "formats": ["<i4", "<i4", "<u4", "<u4", "<i4", "<f4"], "offsets": [0, 4, 8, 12, 16, 20], "itemsize": 24}
+
+    def __init__(self, bufferCount: int = 0, currentBuffer: int = 0, vertexBuffer: int = 0, draws: int = 0, drawCounter: int = 0, currentDepth: float = 0.0, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(24)
+            self._to_free = _struct_pool
+            _heap.i32[self._address >> 2] = bufferCount
+            _heap.i32[(self._address + 4) >> 2] = currentBuffer
+            _heap.u32[(self._address + 8) >> 2] = vertexBuffer
+            _heap.u32[(self._address + 12) >> 2] = draws
+            _heap.i32[(self._address + 16) >> 2] = drawCounter
+            _heap.f32[(self._address + 20) >> 2] = currentDepth
+
+    @property
+    def bufferCount(self):
+        """Number of vertex buffers (multi-buffering support)"""
+        return _heap.i32[self._address >> 2]
+
+    @bufferCount.setter
+    def bufferCount(self, value):
+        if not self._frozen:
+            _heap.i32[self._address >> 2] = value
+
+    @property
+    def currentBuffer(self):
+        """Current buffer tracking in case of multi-buffering"""
+        return _heap.i32[(self._address + 4) >> 2]
+
+    @currentBuffer.setter
+    def currentBuffer(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 4) >> 2] = value
+
+    @property
+    def vertexBuffer(self):
+        """Dynamic buffer(s) for vertex data"""
+        return _heap.u32[(self._address + 8) >> 2]
+
+    @vertexBuffer.setter
+    def vertexBuffer(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 8) >> 2] = value
+
+    @property
+    def draws(self):
+        """Draw calls array, depends on textureId"""
+        return _heap.u32[(self._address + 12) >> 2]
+
+    @draws.setter
+    def draws(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 12) >> 2] = value
+
+    @property
+    def drawCounter(self):
+        """Draw calls counter"""
+        return _heap.i32[(self._address + 16) >> 2]
+
+    @drawCounter.setter
+    def drawCounter(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 16) >> 2] = value
+
+    @property
+    def currentDepth(self):
+        """Current depth value for next draw"""
+        return _heap.f32[(self._address + 20) >> 2]
+
+    @currentDepth.setter
+    def currentDepth(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 20) >> 2] = value
+
+    def __str__(self):
+        return f"rlRenderBatch(address={self._address}, {self.bufferCount}, {self.currentBuffer}, {self.vertexBuffer}, {self.draws}, {self.drawCounter}, {self.currentDepth})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 24)
+
+class rlGlVersion(enum.IntEnum):
+    """OpenGL version"""
+    RL_OPENGL_11: int = 1  # OpenGL 1.1
+    RL_OPENGL_21: int = 2  # OpenGL 2.1 (GLSL 120)
+    RL_OPENGL_33: int = 3  # OpenGL 3.3 (GLSL 330)
+    RL_OPENGL_43: int = 4  # OpenGL 4.3 (using GLSL 330)
+    RL_OPENGL_ES_20: int = 5  # OpenGL ES 2.0 (GLSL 100)
+    RL_OPENGL_ES_30: int = 6  # OpenGL ES 3.0 (GLSL 300 es)
+
+
+class rlTraceLogLevel(enum.IntEnum):
+    """Trace log level"""
+    RL_LOG_ALL: int = 0  # Display all logs
+    RL_LOG_TRACE: int = 1  # Trace logging, intended for internal use only
+    RL_LOG_DEBUG: int = 2  # Debug logging, used for internal debugging, it should be disabled on release builds
+    RL_LOG_INFO: int = 3  # Info logging, used for program execution info
+    RL_LOG_WARNING: int = 4  # Warning logging, used on recoverable failures
+    RL_LOG_ERROR: int = 5  # Error logging, used on unrecoverable failures
+    RL_LOG_FATAL: int = 6  # Fatal logging, used to abort program: exit(EXIT_FAILURE)
+    RL_LOG_NONE: int = 7  # Disable logging
+
+
+class rlPixelFormat(enum.IntEnum):
+    """Texture pixel formats"""
+    RL_PIXELFORMAT_UNCOMPRESSED_GRAYSCALE: int = 1  # 8 bit per pixel (no alpha)
+    RL_PIXELFORMAT_UNCOMPRESSED_GRAY_ALPHA: int = 2  # 8*2 bpp (2 channels)
+    RL_PIXELFORMAT_UNCOMPRESSED_R5G6B5: int = 3  # 16 bpp
+    RL_PIXELFORMAT_UNCOMPRESSED_R8G8B8: int = 4  # 24 bpp
+    RL_PIXELFORMAT_UNCOMPRESSED_R5G5B5A1: int = 5  # 16 bpp (1 bit alpha)
+    RL_PIXELFORMAT_UNCOMPRESSED_R4G4B4A4: int = 6  # 16 bpp (4 bit alpha)
+    RL_PIXELFORMAT_UNCOMPRESSED_R8G8B8A8: int = 7  # 32 bpp
+    RL_PIXELFORMAT_UNCOMPRESSED_R32: int = 8  # 32 bpp (1 channel - float)
+    RL_PIXELFORMAT_UNCOMPRESSED_R32G32B32: int = 9  # 32*3 bpp (3 channels - float)
+    RL_PIXELFORMAT_UNCOMPRESSED_R32G32B32A32: int = 10  # 32*4 bpp (4 channels - float)
+    RL_PIXELFORMAT_COMPRESSED_DXT1_RGB: int = 11  # 4 bpp (no alpha)
+    RL_PIXELFORMAT_COMPRESSED_DXT1_RGBA: int = 12  # 4 bpp (1 bit alpha)
+    RL_PIXELFORMAT_COMPRESSED_DXT3_RGBA: int = 13  # 8 bpp
+    RL_PIXELFORMAT_COMPRESSED_DXT5_RGBA: int = 14  # 8 bpp
+    RL_PIXELFORMAT_COMPRESSED_ETC1_RGB: int = 15  # 4 bpp
+    RL_PIXELFORMAT_COMPRESSED_ETC2_RGB: int = 16  # 4 bpp
+    RL_PIXELFORMAT_COMPRESSED_ETC2_EAC_RGBA: int = 17  # 8 bpp
+    RL_PIXELFORMAT_COMPRESSED_PVRT_RGB: int = 18  # 4 bpp
+    RL_PIXELFORMAT_COMPRESSED_PVRT_RGBA: int = 19  # 4 bpp
+    RL_PIXELFORMAT_COMPRESSED_ASTC_4x4_RGBA: int = 20  # 8 bpp
+    RL_PIXELFORMAT_COMPRESSED_ASTC_8x8_RGBA: int = 21  # 2 bpp
+
+
+class rlTextureFilter(enum.IntEnum):
+    """Texture parameters: filter mode"""
+    RL_TEXTURE_FILTER_POINT: int = 0  # No filter, just pixel approximation
+    RL_TEXTURE_FILTER_BILINEAR: int = 1  # Linear filtering
+    RL_TEXTURE_FILTER_TRILINEAR: int = 2  # Trilinear filtering (linear with mipmaps)
+    RL_TEXTURE_FILTER_ANISOTROPIC_4X: int = 3  # Anisotropic filtering 4x
+    RL_TEXTURE_FILTER_ANISOTROPIC_8X: int = 4  # Anisotropic filtering 8x
+    RL_TEXTURE_FILTER_ANISOTROPIC_16X: int = 5  # Anisotropic filtering 16x
+
+
+class rlBlendMode(enum.IntEnum):
+    """Color blending modes (pre-defined)"""
+    RL_BLEND_ALPHA: int = 0  # Blend textures considering alpha (default)
+    RL_BLEND_ADDITIVE: int = 1  # Blend textures adding colors
+    RL_BLEND_MULTIPLIED: int = 2  # Blend textures multiplying colors
+    RL_BLEND_ADD_COLORS: int = 3  # Blend textures adding colors (alternative)
+    RL_BLEND_SUBTRACT_COLORS: int = 4  # Blend textures subtracting colors (alternative)
+    RL_BLEND_ALPHA_PREMULTIPLY: int = 5  # Blend premultiplied textures considering alpha
+    RL_BLEND_CUSTOM: int = 6  # Blend textures using custom src/dst factors (use rlSetBlendFactors())
+    RL_BLEND_CUSTOM_SEPARATE: int = 7  # Blend textures using custom src/dst factors (use rlSetBlendFactorsSeparate())
+
+
+class rlShaderLocationIndex(enum.IntEnum):
+    """Shader location point type"""
+    RL_SHADER_LOC_VERTEX_POSITION: int = 0  # Shader location: vertex attribute: position
+    RL_SHADER_LOC_VERTEX_TEXCOORD01: int = 1  # Shader location: vertex attribute: texcoord01
+    RL_SHADER_LOC_VERTEX_TEXCOORD02: int = 2  # Shader location: vertex attribute: texcoord02
+    RL_SHADER_LOC_VERTEX_NORMAL: int = 3  # Shader location: vertex attribute: normal
+    RL_SHADER_LOC_VERTEX_TANGENT: int = 4  # Shader location: vertex attribute: tangent
+    RL_SHADER_LOC_VERTEX_COLOR: int = 5  # Shader location: vertex attribute: color
+    RL_SHADER_LOC_MATRIX_MVP: int = 6  # Shader location: matrix uniform: model-view-projection
+    RL_SHADER_LOC_MATRIX_VIEW: int = 7  # Shader location: matrix uniform: view (camera transform)
+    RL_SHADER_LOC_MATRIX_PROJECTION: int = 8  # Shader location: matrix uniform: projection
+    RL_SHADER_LOC_MATRIX_MODEL: int = 9  # Shader location: matrix uniform: model (transform)
+    RL_SHADER_LOC_MATRIX_NORMAL: int = 10  # Shader location: matrix uniform: normal
+    RL_SHADER_LOC_VECTOR_VIEW: int = 11  # Shader location: vector uniform: view
+    RL_SHADER_LOC_COLOR_DIFFUSE: int = 12  # Shader location: vector uniform: diffuse color
+    RL_SHADER_LOC_COLOR_SPECULAR: int = 13  # Shader location: vector uniform: specular color
+    RL_SHADER_LOC_COLOR_AMBIENT: int = 14  # Shader location: vector uniform: ambient color
+    RL_SHADER_LOC_MAP_ALBEDO: int = 15  # Shader location: sampler2d texture: albedo (same as: RL_SHADER_LOC_MAP_DIFFUSE)
+    RL_SHADER_LOC_MAP_METALNESS: int = 16  # Shader location: sampler2d texture: metalness (same as: RL_SHADER_LOC_MAP_SPECULAR)
+    RL_SHADER_LOC_MAP_NORMAL: int = 17  # Shader location: sampler2d texture: normal
+    RL_SHADER_LOC_MAP_ROUGHNESS: int = 18  # Shader location: sampler2d texture: roughness
+    RL_SHADER_LOC_MAP_OCCLUSION: int = 19  # Shader location: sampler2d texture: occlusion
+    RL_SHADER_LOC_MAP_EMISSION: int = 20  # Shader location: sampler2d texture: emission
+    RL_SHADER_LOC_MAP_HEIGHT: int = 21  # Shader location: sampler2d texture: height
+    RL_SHADER_LOC_MAP_CUBEMAP: int = 22  # Shader location: samplerCube texture: cubemap
+    RL_SHADER_LOC_MAP_IRRADIANCE: int = 23  # Shader location: samplerCube texture: irradiance
+    RL_SHADER_LOC_MAP_PREFILTER: int = 24  # Shader location: samplerCube texture: prefilter
+    RL_SHADER_LOC_MAP_BRDF: int = 25  # Shader location: sampler2d texture: brdf
+
+
+class rlShaderUniformDataType(enum.IntEnum):
+    """Shader uniform data type"""
+    RL_SHADER_UNIFORM_FLOAT: int = 0  # Shader uniform type: float
+    RL_SHADER_UNIFORM_VEC2: int = 1  # Shader uniform type: vec2 (2 float)
+    RL_SHADER_UNIFORM_VEC3: int = 2  # Shader uniform type: vec3 (3 float)
+    RL_SHADER_UNIFORM_VEC4: int = 3  # Shader uniform type: vec4 (4 float)
+    RL_SHADER_UNIFORM_INT: int = 4  # Shader uniform type: int
+    RL_SHADER_UNIFORM_IVEC2: int = 5  # Shader uniform type: ivec2 (2 int)
+    RL_SHADER_UNIFORM_IVEC3: int = 6  # Shader uniform type: ivec3 (3 int)
+    RL_SHADER_UNIFORM_IVEC4: int = 7  # Shader uniform type: ivec4 (4 int)
+    RL_SHADER_UNIFORM_SAMPLER2D: int = 8  # Shader uniform type: sampler2d
+
+
+class rlShaderAttributeDataType(enum.IntEnum):
+    """Shader attribute data types"""
+    RL_SHADER_ATTRIB_FLOAT: int = 0  # Shader attribute type: float
+    RL_SHADER_ATTRIB_VEC2: int = 1  # Shader attribute type: vec2 (2 float)
+    RL_SHADER_ATTRIB_VEC3: int = 2  # Shader attribute type: vec3 (3 float)
+    RL_SHADER_ATTRIB_VEC4: int = 3  # Shader attribute type: vec4 (4 float)
+
+
+class rlFramebufferAttachType(enum.IntEnum):
+    """Framebuffer attachment type"""
+    RL_ATTACHMENT_COLOR_CHANNEL0: int = 0  # Framebuffer attachment type: color 0
+    RL_ATTACHMENT_COLOR_CHANNEL1: int = 1  # Framebuffer attachment type: color 1
+    RL_ATTACHMENT_COLOR_CHANNEL2: int = 2  # Framebuffer attachment type: color 2
+    RL_ATTACHMENT_COLOR_CHANNEL3: int = 3  # Framebuffer attachment type: color 3
+    RL_ATTACHMENT_COLOR_CHANNEL4: int = 4  # Framebuffer attachment type: color 4
+    RL_ATTACHMENT_COLOR_CHANNEL5: int = 5  # Framebuffer attachment type: color 5
+    RL_ATTACHMENT_COLOR_CHANNEL6: int = 6  # Framebuffer attachment type: color 6
+    RL_ATTACHMENT_COLOR_CHANNEL7: int = 7  # Framebuffer attachment type: color 7
+    RL_ATTACHMENT_DEPTH: int = 100  # Framebuffer attachment type: depth
+    RL_ATTACHMENT_STENCIL: int = 200  # Framebuffer attachment type: stencil
+
+
+class rlFramebufferAttachTextureType(enum.IntEnum):
+    """Framebuffer texture attachment type"""
+    RL_ATTACHMENT_CUBEMAP_POSITIVE_X: int = 0  # Framebuffer texture attachment type: cubemap, +X side
+    RL_ATTACHMENT_CUBEMAP_NEGATIVE_X: int = 1  # Framebuffer texture attachment type: cubemap, -X side
+    RL_ATTACHMENT_CUBEMAP_POSITIVE_Y: int = 2  # Framebuffer texture attachment type: cubemap, +Y side
+    RL_ATTACHMENT_CUBEMAP_NEGATIVE_Y: int = 3  # Framebuffer texture attachment type: cubemap, -Y side
+    RL_ATTACHMENT_CUBEMAP_POSITIVE_Z: int = 4  # Framebuffer texture attachment type: cubemap, +Z side
+    RL_ATTACHMENT_CUBEMAP_NEGATIVE_Z: int = 5  # Framebuffer texture attachment type: cubemap, -Z side
+    RL_ATTACHMENT_TEXTURE2D: int = 100  # Framebuffer texture attachment type: texture2d
+    RL_ATTACHMENT_RENDERBUFFER: int = 200  # Framebuffer texture attachment type: renderbuffer
+
+
+class rlCullMode(enum.IntEnum):
+    """Face culling mode"""
+    RL_CULL_FACE_FRONT: int = 0
+    RL_CULL_FACE_BACK: int = 1
+
+
+RLGL_VERSION: str = "4.5"
+RL_DEFAULT_BATCH_BUFFER_ELEMENTS: int = 8192
+RL_DEFAULT_BATCH_BUFFERS: int = 1  # Default number of batch buffers (multi-buffering)
+RL_DEFAULT_BATCH_DRAWCALLS: int = 256  # Default number of batch draw calls (by state changes: mode, texture)
+RL_DEFAULT_BATCH_MAX_TEXTURE_UNITS: int = 4  # Maximum number of textures units that can be activated on batch drawing (SetShaderValueTexture())
+RL_MAX_MATRIX_STACK_SIZE: int = 32  # Maximum size of Matrix stack
+RL_MAX_SHADER_LOCATIONS: int = 32  # Maximum number of shader locations supported
+RL_CULL_DISTANCE_NEAR: float = 0.01  # Default near cull distance
+RL_CULL_DISTANCE_FAR: float = 1000.0  # Default far cull distance
+RL_TEXTURE_WRAP_S: int = 10242  # GL_TEXTURE_WRAP_S
+RL_TEXTURE_WRAP_T: int = 10243  # GL_TEXTURE_WRAP_T
+RL_TEXTURE_MAG_FILTER: int = 10240  # GL_TEXTURE_MAG_FILTER
+RL_TEXTURE_MIN_FILTER: int = 10241  # GL_TEXTURE_MIN_FILTER
+RL_TEXTURE_FILTER_NEAREST: int = 9728  # GL_NEAREST
+RL_TEXTURE_FILTER_LINEAR: int = 9729  # GL_LINEAR
+RL_TEXTURE_FILTER_MIP_NEAREST: int = 9984  # GL_NEAREST_MIPMAP_NEAREST
+RL_TEXTURE_FILTER_NEAREST_MIP_LINEAR: int = 9986  # GL_NEAREST_MIPMAP_LINEAR
+RL_TEXTURE_FILTER_LINEAR_MIP_NEAREST: int = 9985  # GL_LINEAR_MIPMAP_NEAREST
+RL_TEXTURE_FILTER_MIP_LINEAR: int = 9987  # GL_LINEAR_MIPMAP_LINEAR
+RL_TEXTURE_FILTER_ANISOTROPIC: int = 12288  # Anisotropic filter (custom identifier)
+RL_TEXTURE_MIPMAP_BIAS_RATIO: int = 16384  # Texture mipmap bias, percentage ratio (custom identifier)
+RL_TEXTURE_WRAP_REPEAT: int = 10497  # GL_REPEAT
+RL_TEXTURE_WRAP_CLAMP: int = 33071  # GL_CLAMP_TO_EDGE
+RL_TEXTURE_WRAP_MIRROR_REPEAT: int = 33648  # GL_MIRRORED_REPEAT
+RL_TEXTURE_WRAP_MIRROR_CLAMP: int = 34626  # GL_MIRROR_CLAMP_EXT
+RL_MODELVIEW: int = 5888  # GL_MODELVIEW
+RL_PROJECTION: int = 5889  # GL_PROJECTION
+RL_TEXTURE: int = 5890  # GL_TEXTURE
+RL_LINES: int = 1  # GL_LINES
+RL_TRIANGLES: int = 4  # GL_TRIANGLES
+RL_QUADS: int = 7  # GL_QUADS
+RL_UNSIGNED_BYTE: int = 5121  # GL_UNSIGNED_BYTE
+RL_FLOAT: int = 5126  # GL_FLOAT
+RL_STREAM_DRAW: int = 35040  # GL_STREAM_DRAW
+RL_STREAM_READ: int = 35041  # GL_STREAM_READ
+RL_STREAM_COPY: int = 35042  # GL_STREAM_COPY
+RL_STATIC_DRAW: int = 35044  # GL_STATIC_DRAW
+RL_STATIC_READ: int = 35045  # GL_STATIC_READ
+RL_STATIC_COPY: int = 35046  # GL_STATIC_COPY
+RL_DYNAMIC_DRAW: int = 35048  # GL_DYNAMIC_DRAW
+RL_DYNAMIC_READ: int = 35049  # GL_DYNAMIC_READ
+RL_DYNAMIC_COPY: int = 35050  # GL_DYNAMIC_COPY
+RL_FRAGMENT_SHADER: int = 35632  # GL_FRAGMENT_SHADER
+RL_VERTEX_SHADER: int = 35633  # GL_VERTEX_SHADER
+RL_COMPUTE_SHADER: int = 37305  # GL_COMPUTE_SHADER
+RL_ZERO: int = 0  # GL_ZERO
+RL_ONE: int = 1  # GL_ONE
+RL_SRC_COLOR: int = 768  # GL_SRC_COLOR
+RL_ONE_MINUS_SRC_COLOR: int = 769  # GL_ONE_MINUS_SRC_COLOR
+RL_SRC_ALPHA: int = 770  # GL_SRC_ALPHA
+RL_ONE_MINUS_SRC_ALPHA: int = 771  # GL_ONE_MINUS_SRC_ALPHA
+RL_DST_ALPHA: int = 772  # GL_DST_ALPHA
+RL_ONE_MINUS_DST_ALPHA: int = 773  # GL_ONE_MINUS_DST_ALPHA
+RL_DST_COLOR: int = 774  # GL_DST_COLOR
+RL_ONE_MINUS_DST_COLOR: int = 775  # GL_ONE_MINUS_DST_COLOR
+RL_SRC_ALPHA_SATURATE: int = 776  # GL_SRC_ALPHA_SATURATE
+RL_CONSTANT_COLOR: int = 32769  # GL_CONSTANT_COLOR
+RL_ONE_MINUS_CONSTANT_COLOR: int = 32770  # GL_ONE_MINUS_CONSTANT_COLOR
+RL_CONSTANT_ALPHA: int = 32771  # GL_CONSTANT_ALPHA
+RL_ONE_MINUS_CONSTANT_ALPHA: int = 32772  # GL_ONE_MINUS_CONSTANT_ALPHA
+RL_FUNC_ADD: int = 32774  # GL_FUNC_ADD
+RL_MIN: int = 32775  # GL_MIN
+RL_MAX: int = 32776  # GL_MAX
+RL_FUNC_SUBTRACT: int = 32778  # GL_FUNC_SUBTRACT
+RL_FUNC_REVERSE_SUBTRACT: int = 32779  # GL_FUNC_REVERSE_SUBTRACT
+RL_BLEND_EQUATION: int = 32777  # GL_BLEND_EQUATION
+RL_BLEND_EQUATION_RGB: int = 32777  # GL_BLEND_EQUATION_RGB   // (Same as BLEND_EQUATION)
+RL_BLEND_EQUATION_ALPHA: int = 34877  # GL_BLEND_EQUATION_ALPHA
+RL_BLEND_DST_RGB: int = 32968  # GL_BLEND_DST_RGB
+RL_BLEND_SRC_RGB: int = 32969  # GL_BLEND_SRC_RGB
+RL_BLEND_DST_ALPHA: int = 32970  # GL_BLEND_DST_ALPHA
+RL_BLEND_SRC_ALPHA: int = 32971  # GL_BLEND_SRC_ALPHA
+RL_BLEND_COLOR: int = 32773  # GL_BLEND_COLOR
+
+def rl_matrix_mode(mode: int):
+    """Choose the current matrix to be transformed"""
+    if __debug__:
+        _check_int("rl_matrix_mode", "mode", mode, -2147483648, 2147483647)
+    _rlMatrixMode(mode)
+
+
+def rl_push_matrix():
+    """Push the current matrix to stack"""
+    _rlPushMatrix()
+
+
+def rl_pop_matrix():
+    """Pop latest inserted matrix from stack"""
+    _rlPopMatrix()
+
+
+def rl_load_identity():
+    """Reset current matrix to identity matrix"""
+    _rlLoadIdentity()
+
+
+def rl_translatef(x: float, y: float, z: float):
+    """Multiply the current matrix by a translation matrix"""
+    if __debug__:
+        _check_float("rl_translatef", "x", x)
+        _check_float("rl_translatef", "y", y)
+        _check_float("rl_translatef", "z", z)
+    _rlTranslatef(x, y, z)
+
+
+def rl_rotatef(angle: float, x: float, y: float, z: float):
+    """Multiply the current matrix by a rotation matrix"""
+    if __debug__:
+        _check_float("rl_rotatef", "angle", angle)
+        _check_float("rl_rotatef", "x", x)
+        _check_float("rl_rotatef", "y", y)
+        _check_float("rl_rotatef", "z", z)
+    _rlRotatef(angle, x, y, z)
+
+
+def rl_scalef(x: float, y: float, z: float):
+    """Multiply the current matrix by a scaling matrix"""
+    if __debug__:
+        _check_float("rl_scalef", "x", x)
+        _check_float("rl_scalef", "y", y)
+        _check_float("rl_scalef", "z", z)
+    _rlScalef(x, y, z)
+
+
+def rl_mult_matrixf(matf: int):
+    """Multiply the current matrix by another matrix"""
+    if __debug__:
+        _check_int("rl_mult_matrixf", "matf", matf, 0, 4294967295)
+    _rlMultMatrixf(matf)
+
+
+def rl_frustum(left: float, right: float, bottom: float, top: float, znear: float, zfar: float):
+    if __debug__:
+        _check_float("rl_frustum", "left", left)
+        _check_float("rl_frustum", "right", right)
+        _check_float("rl_frustum", "bottom", bottom)
+        _check_float("rl_frustum", "top", top)
+        _check_float("rl_frustum", "znear", znear)
+        _check_float("rl_frustum", "zfar", zfar)
+    _rlFrustum(left, right, bottom, top, znear, zfar)
+
+
+def rl_ortho(left: float, right: float, bottom: float, top: float, znear: float, zfar: float):
+    if __debug__:
+        _check_float("rl_ortho", "left", left)
+        _check_float("rl_ortho", "right", right)
+        _check_float("rl_ortho", "bottom", bottom)
+        _check_float("rl_ortho", "top", top)
+        _check_float("rl_ortho", "znear", znear)
+        _check_float("rl_ortho", "zfar", zfar)
+    _rlOrtho(left, right, bottom, top, znear, zfar)
+
+
+def rl_viewport(x: int, y: int, width: int, height: int):
+    """Set the viewport area"""
+    if __debug__:
+        _check_int("rl_viewport", "x", x, -2147483648, 2147483647)
+        _check_int("rl_viewport", "y", y, -2147483648, 2147483647)
+        _check_int("rl_viewport", "width", width, -2147483648, 2147483647)
+        _check_int("rl_viewport", "height", height, -2147483648, 2147483647)
+    _rlViewport(x, y, width, height)
+
+
+def rl_begin(mode: int):
+    """Initialize drawing mode (how to organize vertex)"""
+    if __debug__:
+        _check_int("rl_begin", "mode", mode, -2147483648, 2147483647)
+    _rlBegin(mode)
+
+
+def rl_end():
+    """Finish vertex providing"""
+    _rlEnd()
+
+
+def rl_vertex2i(x: int, y: int):
+    """Define one vertex (position) - 2 int"""
+    if __debug__:
+        _check_int("rl_vertex2i", "x", x, -2147483648, 2147483647)
+        _check_int("rl_vertex2i", "y", y, -2147483648, 2147483647)
+    _rlVertex2i(x, y)
+
+
+def rl_vertex2f(x: float, y: float):
+    """Define one vertex (position) - 2 float"""
+    if __debug__:
+        _check_float("rl_vertex2f", "x", x)
+        _check_float("rl_vertex2f", "y", y)
+    _rlVertex2f(x, y)
+
+
+def rl_vertex3f(x: float, y: float, z: float):
+    """Define one vertex (position) - 3 float"""
+    if __debug__:
+        _check_float("rl_vertex3f", "x", x)
+        _check_float("rl_vertex3f", "y", y)
+        _check_float("rl_vertex3f", "z", z)
+    _rlVertex3f(x, y, z)
+
+
+def rl_tex_coord2f(x: float, y: float):
+    """Define one vertex (texture coordinate) - 2 float"""
+    if __debug__:
+        _check_float("rl_tex_coord2f", "x", x)
+        _check_float("rl_tex_coord2f", "y", y)
+    _rlTexCoord2f(x, y)
+
+
+def rl_normal3f(x: float, y: float, z: float):
+    """Define one vertex (normal) - 3 float"""
+    if __debug__:
+        _check_float("rl_normal3f", "x", x)
+        _check_float("rl_normal3f", "y", y)
+        _check_float("rl_normal3f", "z", z)
+    _rlNormal3f(x, y, z)
+
+
+def rl_color4ub(r: int, g: int, b: int, a: int):
+    """Define one vertex (color) - 4 byte"""
+    if __debug__:
+        _check_int("rl_color4ub", "r", r, 0, 255)
+        _check_int("rl_color4ub", "g", g, 0, 255)
+        _check_int("rl_color4ub", "b", b, 0, 255)
+        _check_int("rl_color4ub", "a", a, 0, 255)
+    _rlColor4ub(r, g, b, a)
+
+
+def rl_color3f(x: float, y: float, z: float):
+    """Define one vertex (color) - 3 float"""
+    if __debug__:
+        _check_float("rl_color3f", "x", x)
+        _check_float("rl_color3f", "y", y)
+        _check_float("rl_color3f", "z", z)
+    _rlColor3f(x, y, z)
+
+
+def rl_color4f(x: float, y: float, z: float, w: float):
+    """Define one vertex (color) - 4 float"""
+    if __debug__:
+        _check_float("rl_color4f", "x", x)
+        _check_float("rl_color4f", "y", y)
+        _check_float("rl_color4f", "z", z)
+        _check_float("rl_color4f", "w", w)
+    _rlColor4f(x, y, z, w)
+
+
+def rl_enable_vertex_array(vaoId: int) -> int:
+    """Enable vertex array (VAO, if supported)"""
+    if __debug__:
+        _check_int("rl_enable_vertex_array", "vaoId", vaoId, 0, 4294967295)
+    return_interface = _rlEnableVertexArray(vaoId)
+    return return_interface
+
+
+def rl_disable_vertex_array():
+    """Disable vertex array (VAO, if supported)"""
+    _rlDisableVertexArray()
+
+
+def rl_enable_vertex_buffer(id: int):
+    """Enable vertex buffer (VBO)"""
+    if __debug__:
+        _check_int("rl_enable_vertex_buffer", "id", id, 0, 4294967295)
+    _rlEnableVertexBuffer(id)
+
+
+def rl_disable_vertex_buffer():
+    """Disable vertex buffer (VBO)"""
+    _rlDisableVertexBuffer()
+
+
+def rl_enable_vertex_buffer_element(id: int):
+    """Enable vertex buffer element (VBO element)"""
+    if __debug__:
+        _check_int("rl_enable_vertex_buffer_element", "id", id, 0, 4294967295)
+    _rlEnableVertexBufferElement(id)
+
+
+def rl_disable_vertex_buffer_element():
+    """Disable vertex buffer element (VBO element)"""
+    _rlDisableVertexBufferElement()
+
+
+def rl_enable_vertex_attribute(index: int):
+    """Enable vertex attribute index"""
+    if __debug__:
+        _check_int("rl_enable_vertex_attribute", "index", index, 0, 4294967295)
+    _rlEnableVertexAttribute(index)
+
+
+def rl_disable_vertex_attribute(index: int):
+    """Disable vertex attribute index"""
+    if __debug__:
+        _check_int("rl_disable_vertex_attribute", "index", index, 0, 4294967295)
+    _rlDisableVertexAttribute(index)
+
+
+def rl_enable_state_pointer(vertexAttribType: int, buffer: int):
+    """Enable attribute state pointer"""
+    if __debug__:
+        _check_int("rl_enable_state_pointer", "vertexAttribType", vertexAttribType, -2147483648, 2147483647)
+        _check_int("rl_enable_state_pointer", "buffer", buffer, 0, 4294967295)
+    _rlEnableStatePointer(vertexAttribType, buffer)
+
+
+def rl_disable_state_pointer(vertexAttribType: int):
+    """Disable attribute state pointer"""
+    if __debug__:
+        _check_int("rl_disable_state_pointer", "vertexAttribType", vertexAttribType, -2147483648, 2147483647)
+    _rlDisableStatePointer(vertexAttribType)
+
+
+def rl_active_texture_slot(slot: int):
+    """Select and active a texture slot"""
+    if __debug__:
+        _check_int("rl_active_texture_slot", "slot", slot, -2147483648, 2147483647)
+    _rlActiveTextureSlot(slot)
+
+
+def rl_enable_texture(id: int):
+    """Enable texture"""
+    if __debug__:
+        _check_int("rl_enable_texture", "id", id, 0, 4294967295)
+    _rlEnableTexture(id)
+
+
+def rl_disable_texture():
+    """Disable texture"""
+    _rlDisableTexture()
+
+
+def rl_enable_texture_cubemap(id: int):
+    """Enable texture cubemap"""
+    if __debug__:
+        _check_int("rl_enable_texture_cubemap", "id", id, 0, 4294967295)
+    _rlEnableTextureCubemap(id)
+
+
+def rl_disable_texture_cubemap():
+    """Disable texture cubemap"""
+    _rlDisableTextureCubemap()
+
+
+def rl_texture_parameters(id: int, param: int, value: int):
+    """Set texture parameters (filter, wrap)"""
+    if __debug__:
+        _check_int("rl_texture_parameters", "id", id, 0, 4294967295)
+        _check_int("rl_texture_parameters", "param", param, -2147483648, 2147483647)
+        _check_int("rl_texture_parameters", "value", value, -2147483648, 2147483647)
+    _rlTextureParameters(id, param, value)
+
+
+def rl_cubemap_parameters(id: int, param: int, value: int):
+    """Set cubemap parameters (filter, wrap)"""
+    if __debug__:
+        _check_int("rl_cubemap_parameters", "id", id, 0, 4294967295)
+        _check_int("rl_cubemap_parameters", "param", param, -2147483648, 2147483647)
+        _check_int("rl_cubemap_parameters", "value", value, -2147483648, 2147483647)
+    _rlCubemapParameters(id, param, value)
+
+
+def rl_enable_shader(id: int):
+    """Enable shader program"""
+    if __debug__:
+        _check_int("rl_enable_shader", "id", id, 0, 4294967295)
+    _rlEnableShader(id)
+
+
+def rl_disable_shader():
+    """Disable shader program"""
+    _rlDisableShader()
+
+
+def rl_enable_framebuffer(id: int):
+    """Enable render texture (fbo)"""
+    if __debug__:
+        _check_int("rl_enable_framebuffer", "id", id, 0, 4294967295)
+    _rlEnableFramebuffer(id)
+
+
+def rl_disable_framebuffer():
+    """Disable render texture (fbo), return to default framebuffer"""
+    _rlDisableFramebuffer()
+
+
+def rl_active_draw_buffers(count: int):
+    """Activate multiple draw color buffers"""
+    if __debug__:
+        _check_int("rl_active_draw_buffers", "count", count, -2147483648, 2147483647)
+    _rlActiveDrawBuffers(count)
+
+
+def rl_enable_color_blend():
+    """Enable color blending"""
+    _rlEnableColorBlend()
+
+
+def rl_disable_color_blend():
+    """Disable color blending"""
+    _rlDisableColorBlend()
+
+
+def rl_enable_depth_test():
+    """Enable depth test"""
+    _rlEnableDepthTest()
+
+
+def rl_disable_depth_test():
+    """Disable depth test"""
+    _rlDisableDepthTest()
+
+
+def rl_enable_depth_mask():
+    """Enable depth write"""
+    _rlEnableDepthMask()
+
+
+def rl_disable_depth_mask():
+    """Disable depth write"""
+    _rlDisableDepthMask()
+
+
+def rl_enable_backface_culling():
+    """Enable backface culling"""
+    _rlEnableBackfaceCulling()
+
+
+def rl_disable_backface_culling():
+    """Disable backface culling"""
+    _rlDisableBackfaceCulling()
+
+
+def rl_set_cull_face(mode: int):
+    """Set face culling mode"""
+    if __debug__:
+        _check_int("rl_set_cull_face", "mode", mode, -2147483648, 2147483647)
+    _rlSetCullFace(mode)
+
+
+def rl_enable_scissor_test():
+    """Enable scissor test"""
+    _rlEnableScissorTest()
+
+
+def rl_disable_scissor_test():
+    """Disable scissor test"""
+    _rlDisableScissorTest()
+
+
+def rl_scissor(x: int, y: int, width: int, height: int):
+    """Scissor test"""
+    if __debug__:
+        _check_int("rl_scissor", "x", x, -2147483648, 2147483647)
+        _check_int("rl_scissor", "y", y, -2147483648, 2147483647)
+        _check_int("rl_scissor", "width", width, -2147483648, 2147483647)
+        _check_int("rl_scissor", "height", height, -2147483648, 2147483647)
+    _rlScissor(x, y, width, height)
+
+
+def rl_enable_wire_mode():
+    """Enable wire mode"""
+    _rlEnableWireMode()
+
+
+def rl_disable_wire_mode():
+    """Disable wire mode"""
+    _rlDisableWireMode()
+
+
+def rl_set_line_width(width: float):
+    """Set the line drawing width"""
+    if __debug__:
+        _check_float("rl_set_line_width", "width", width)
+    _rlSetLineWidth(width)
+
+
+def rl_get_line_width() -> float:
+    """Get the line drawing width"""
+    return_interface = _rlGetLineWidth()
+    return return_interface
+
+
+def rl_enable_smooth_lines():
+    """Enable line aliasing"""
+    _rlEnableSmoothLines()
+
+
+def rl_disable_smooth_lines():
+    """Disable line aliasing"""
+    _rlDisableSmoothLines()
+
+
+def rl_enable_stereo_render():
+    """Enable stereo rendering"""
+    _rlEnableStereoRender()
+
+
+def rl_disable_stereo_render():
+    """Disable stereo rendering"""
+    _rlDisableStereoRender()
+
+
+def rl_is_stereo_render_enabled() -> int:
+    """Check if stereo render is enabled"""
+    return_interface = _rlIsStereoRenderEnabled()
+    return return_interface
+
+
+def rl_clear_color(r: int, g: int, b: int, a: int):
+    """Clear color buffer with color"""
+    if __debug__:
+        _check_int("rl_clear_color", "r", r, 0, 255)
+        _check_int("rl_clear_color", "g", g, 0, 255)
+        _check_int("rl_clear_color", "b", b, 0, 255)
+        _check_int("rl_clear_color", "a", a, 0, 255)
+    _rlClearColor(r, g, b, a)
+
+
+def rl_clear_screen_buffers():
+    """Clear used screen buffers (color and depth)"""
+    _rlClearScreenBuffers()
+
+
+def rl_check_errors():
+    """Check and log OpenGL error codes"""
+    _rlCheckErrors()
+
+
+def rl_set_blend_mode(mode: int):
+    """Set blending mode"""
+    if __debug__:
+        _check_int("rl_set_blend_mode", "mode", mode, -2147483648, 2147483647)
+    _rlSetBlendMode(mode)
+
+
+def rl_set_blend_factors(glSrcFactor: int, glDstFactor: int, glEquation: int):
+    """Set blending mode factor and equation (using OpenGL factors)"""
+    if __debug__:
+        _check_int("rl_set_blend_factors", "glSrcFactor", glSrcFactor, -2147483648, 2147483647)
+        _check_int("rl_set_blend_factors", "glDstFactor", glDstFactor, -2147483648, 2147483647)
+        _check_int("rl_set_blend_factors", "glEquation", glEquation, -2147483648, 2147483647)
+    _rlSetBlendFactors(glSrcFactor, glDstFactor, glEquation)
+
+
+def rl_set_blend_factors_separate(glSrcRGB: int, glDstRGB: int, glSrcAlpha: int, glDstAlpha: int, glEqRGB: int, glEqAlpha: int):
+    """Set blending mode factors and equations separately (using OpenGL factors)"""
+    if __debug__:
+        _check_int("rl_set_blend_factors_separate", "glSrcRGB", glSrcRGB, -2147483648, 2147483647)
+        _check_int("rl_set_blend_factors_separate", "glDstRGB", glDstRGB, -2147483648, 2147483647)
+        _check_int("rl_set_blend_factors_separate", "glSrcAlpha", glSrcAlpha, -2147483648, 2147483647)
+        _check_int("rl_set_blend_factors_separate", "glDstAlpha", glDstAlpha, -2147483648, 2147483647)
+        _check_int("rl_set_blend_factors_separate", "glEqRGB", glEqRGB, -2147483648, 2147483647)
+        _check_int("rl_set_blend_factors_separate", "glEqAlpha", glEqAlpha, -2147483648, 2147483647)
+    _rlSetBlendFactorsSeparate(glSrcRGB, glDstRGB, glSrcAlpha, glDstAlpha, glEqRGB, glEqAlpha)
+
+
+def rlgl_init(width: int, height: int):
+    """Initialize rlgl (buffers, shaders, textures, states)"""
+    if __debug__:
+        _check_int("rlgl_init", "width", width, -2147483648, 2147483647)
+        _check_int("rlgl_init", "height", height, -2147483648, 2147483647)
+    _rlglInit(width, height)
+
+
+def rlgl_close():
+    """De-initialize rlgl (buffers, shaders, textures)"""
+    _rlglClose()
+
+
+def rl_load_extensions(loader: int):
+    """Load OpenGL extensions (loader function required)"""
+    if __debug__:
+        _check_int("rl_load_extensions", "loader", loader, 0, 4294967295)
+    _rlLoadExtensions(loader)
+
+
+def rl_get_version() -> int:
+    """Get current OpenGL version"""
+    return_interface = _rlGetVersion()
+    return return_interface
+
+
+def rl_set_framebuffer_width(width: int):
+    """Set current framebuffer width"""
+    if __debug__:
+        _check_int("rl_set_framebuffer_width", "width", width, -2147483648, 2147483647)
+    _rlSetFramebufferWidth(width)
+
+
+def rl_get_framebuffer_width() -> int:
+    """Get default framebuffer width"""
+    return_interface = _rlGetFramebufferWidth()
+    return return_interface
+
+
+def rl_set_framebuffer_height(height: int):
+    """Set current framebuffer height"""
+    if __debug__:
+        _check_int("rl_set_framebuffer_height", "height", height, -2147483648, 2147483647)
+    _rlSetFramebufferHeight(height)
+
+
+def rl_get_framebuffer_height() -> int:
+    """Get default framebuffer height"""
+    return_interface = _rlGetFramebufferHeight()
+    return return_interface
+
+
+def rl_get_texture_id_default() -> int:
+    """Get default texture id"""
+    return_interface = _rlGetTextureIdDefault()
+    return return_interface
+
+
+def rl_get_shader_id_default() -> int:
+    """Get default shader id"""
+    return_interface = _rlGetShaderIdDefault()
+    return return_interface
+
+
+def rl_get_shader_locs_default() -> int:
+    """Get default shader locations"""
+    return_interface = _rlGetShaderLocsDefault()
+    return return_interface
+
+
+def rl_load_render_batch(numBuffers: int, bufferElements: int, out: rlRenderBatch = None) -> rlRenderBatch:
+    """Load a render batch system"""
+    if __debug__:
+        _check_int("rl_load_render_batch", "numBuffers", numBuffers, -2147483648, 2147483647)
+        _check_int("rl_load_render_batch", "bufferElements", bufferElements, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("rl_load_render_batch", "out", out, rlRenderBatch)
+    rlRenderBatch_ = _new_struct(rlRenderBatch) if out is None or out.__class__ is not rlRenderBatch else out
+    _rlLoadRenderBatch(rlRenderBatch_._address, numBuffers, bufferElements)
+    if out is not None and out is not rlRenderBatch_:
+        out._assign(rlRenderBatch_)  # a shadow struct
+        return out
+    return rlRenderBatch_
+
+
+def rl_unload_render_batch(batch: rlRenderBatch):
+    """Unload render batch system"""
+    if __debug__:
+        _check_struct("rl_unload_render_batch", "batch", batch, rlRenderBatch)
+    _rlUnloadRenderBatch(batch._address)
+
+
+def rl_draw_render_batch(batch: int):
+    """Draw render batch data (Update->Draw->Reset)"""
+    if __debug__:
+        _check_int("rl_draw_render_batch", "batch", batch, 0, 4294967295)
+    _rlDrawRenderBatch(batch)
+
+
+def rl_set_render_batch_active(batch: int):
+    """Set the active render batch for rlgl (NULL for default internal)"""
+    if __debug__:
+        _check_int("rl_set_render_batch_active", "batch", batch, 0, 4294967295)
+    _rlSetRenderBatchActive(batch)
+
+
+def rl_draw_render_batch_active():
+    """Update and draw internal render batch"""
+    _rlDrawRenderBatchActive()
+
+
+def rl_check_render_batch_limit(vCount: int) -> int:
+    """Check internal buffer overflow for a given number of vertex"""
+    if __debug__:
+        _check_int("rl_check_render_batch_limit", "vCount", vCount, -2147483648, 2147483647)
+    return_interface = _rlCheckRenderBatchLimit(vCount)
+    return return_interface
+
+
+def rl_set_texture(id: int):
+    """Set current texture for render batch and check buffers limits"""
+    if __debug__:
+        _check_int("rl_set_texture", "id", id, 0, 4294967295)
+    _rlSetTexture(id)
+
+
+def rl_load_vertex_array() -> int:
+    """Load vertex array (vao) if supported"""
+    return_interface = _rlLoadVertexArray()
+    return return_interface
+
+
+def rl_load_vertex_buffer(buffer: int, size: int, dynamic: int) -> int:
+    """Load a vertex buffer attribute"""
+    if __debug__:
+        _check_int("rl_load_vertex_buffer", "buffer", buffer, 0, 4294967295)
+        _check_int("rl_load_vertex_buffer", "size", size, -2147483648, 2147483647)
+        _check_int("rl_load_vertex_buffer", "dynamic", dynamic, -128, 127)
+    return_interface = _rlLoadVertexBuffer(buffer, size, dynamic)
+    return return_interface
+
+
+def rl_load_vertex_buffer_element(buffer: int, size: int, dynamic: int) -> int:
+    """Load a new attributes element buffer"""
+    if __debug__:
+        _check_int("rl_load_vertex_buffer_element", "buffer", buffer, 0, 4294967295)
+        _check_int("rl_load_vertex_buffer_element", "size", size, -2147483648, 2147483647)
+        _check_int("rl_load_vertex_buffer_element", "dynamic", dynamic, -128, 127)
+    return_interface = _rlLoadVertexBufferElement(buffer, size, dynamic)
+    return return_interface
+
+
+def rl_update_vertex_buffer(bufferId: int, data: int, dataSize: int, offset: int):
+    """Update GPU buffer with new data"""
+    if __debug__:
+        _check_int("rl_update_vertex_buffer", "bufferId", bufferId, 0, 4294967295)
+        _check_int("rl_update_vertex_buffer", "data", data, 0, 4294967295)
+        _check_int("rl_update_vertex_buffer", "dataSize", dataSize, -2147483648, 2147483647)
+        _check_int("rl_update_vertex_buffer", "offset", offset, -2147483648, 2147483647)
+    _rlUpdateVertexBuffer(bufferId, data, dataSize, offset)
+
+
+def rl_update_vertex_buffer_elements(id: int, data: int, dataSize: int, offset: int):
+    """Update vertex buffer elements with new data"""
+    if __debug__:
+        _check_int("rl_update_vertex_buffer_elements", "id", id, 0, 4294967295)
+        _check_int("rl_update_vertex_buffer_elements", "data", data, 0, 4294967295)
+        _check_int("rl_update_vertex_buffer_elements", "dataSize", dataSize, -2147483648, 2147483647)
+        _check_int("rl_update_vertex_buffer_elements", "offset", offset, -2147483648, 2147483647)
+    _rlUpdateVertexBufferElements(id, data, dataSize, offset)
+
+
+def rl_unload_vertex_array(vaoId: int):
+    if __debug__:
+        _check_int("rl_unload_vertex_array", "vaoId", vaoId, 0, 4294967295)
+    _rlUnloadVertexArray(vaoId)
+
+
+def rl_unload_vertex_buffer(vboId: int):
+    if __debug__:
+        _check_int("rl_unload_vertex_buffer", "vboId", vboId, 0, 4294967295)
+    _rlUnloadVertexBuffer(vboId)
+
+
+def rl_set_vertex_attribute(index: int, compSize: int, type: int, normalized: int, stride: int, pointer: int):
+    if __debug__:
+        _check_int("rl_set_vertex_attribute", "index", index, 0, 4294967295)
+        _check_int("rl_set_vertex_attribute", "compSize", compSize, -2147483648, 2147483647)
+        _check_int("rl_set_vertex_attribute", "type", type, -2147483648, 2147483647)
+        _check_int("rl_set_vertex_attribute", "normalized", normalized, -128, 127)
+        _check_int("rl_set_vertex_attribute", "stride", stride, -2147483648, 2147483647)
+        _check_int("rl_set_vertex_attribute", "pointer", pointer, 0, 4294967295)
+    _rlSetVertexAttribute(index, compSize, type, normalized, stride, pointer)
+
+
+def rl_set_vertex_attribute_divisor(index: int, divisor: int):
+    if __debug__:
+        _check_int("rl_set_vertex_attribute_divisor", "index", index, 0, 4294967295)
+        _check_int("rl_set_vertex_attribute_divisor", "divisor", divisor, -2147483648, 2147483647)
+    _rlSetVertexAttributeDivisor(index, divisor)
+
+
+def rl_set_vertex_attribute_default(locIndex: int, value: int, attribType: int, count: int):
+    """Set vertex attribute default value"""
+    if __debug__:
+        _check_int("rl_set_vertex_attribute_default", "locIndex", locIndex, -2147483648, 2147483647)
+        _check_int("rl_set_vertex_attribute_default", "value", value, 0, 4294967295)
+        _check_int("rl_set_vertex_attribute_default", "attribType", attribType, -2147483648, 2147483647)
+        _check_int("rl_set_vertex_attribute_default", "count", count, -2147483648, 2147483647)
+    _rlSetVertexAttributeDefault(locIndex, value, attribType, count)
+
+
+def rl_draw_vertex_array(offset: int, count: int):
+    if __debug__:
+        _check_int("rl_draw_vertex_array", "offset", offset, -2147483648, 2147483647)
+        _check_int("rl_draw_vertex_array", "count", count, -2147483648, 2147483647)
+    _rlDrawVertexArray(offset, count)
+
+
+def rl_draw_vertex_array_elements(offset: int, count: int, buffer: int):
+    if __debug__:
+        _check_int("rl_draw_vertex_array_elements", "offset", offset, -2147483648, 2147483647)
+        _check_int("rl_draw_vertex_array_elements", "count", count, -2147483648, 2147483647)
+        _check_int("rl_draw_vertex_array_elements", "buffer", buffer, 0, 4294967295)
+    _rlDrawVertexArrayElements(offset, count, buffer)
+
+
+def rl_draw_vertex_array_instanced(offset: int, count: int, instances: int):
+    if __debug__:
+        _check_int("rl_draw_vertex_array_instanced", "offset", offset, -2147483648, 2147483647)
+        _check_int("rl_draw_vertex_array_instanced", "count", count, -2147483648, 2147483647)
+        _check_int("rl_draw_vertex_array_instanced", "instances", instances, -2147483648, 2147483647)
+    _rlDrawVertexArrayInstanced(offset, count, instances)
+
+
+def rl_draw_vertex_array_elements_instanced(offset: int, count: int, buffer: int, instances: int):
+    if __debug__:
+        _check_int("rl_draw_vertex_array_elements_instanced", "offset", offset, -2147483648, 2147483647)
+        _check_int("rl_draw_vertex_array_elements_instanced", "count", count, -2147483648, 2147483647)
+        _check_int("rl_draw_vertex_array_elements_instanced", "buffer", buffer, 0, 4294967295)
+        _check_int("rl_draw_vertex_array_elements_instanced", "instances", instances, -2147483648, 2147483647)
+    _rlDrawVertexArrayElementsInstanced(offset, count, buffer, instances)
+
+
+def rl_load_texture(data: int, width: int, height: int, format: int, mipmapCount: int) -> int:
+    """Load texture in GPU"""
+    if __debug__:
+        _check_int("rl_load_texture", "data", data, 0, 4294967295)
+        _check_int("rl_load_texture", "width", width, -2147483648, 2147483647)
+        _check_int("rl_load_texture", "height", height, -2147483648, 2147483647)
+        _check_int("rl_load_texture", "format", format, -2147483648, 2147483647)
+        _check_int("rl_load_texture", "mipmapCount", mipmapCount, -2147483648, 2147483647)
+    return_interface = _rlLoadTexture(data, width, height, format, mipmapCount)
+    return return_interface
+
+
+def rl_load_texture_depth(width: int, height: int, useRenderBuffer: int) -> int:
+    """Load depth texture/renderbuffer (to be attached to fbo)"""
+    if __debug__:
+        _check_int("rl_load_texture_depth", "width", width, -2147483648, 2147483647)
+        _check_int("rl_load_texture_depth", "height", height, -2147483648, 2147483647)
+        _check_int("rl_load_texture_depth", "useRenderBuffer", useRenderBuffer, -128, 127)
+    return_interface = _rlLoadTextureDepth(width, height, useRenderBuffer)
+    return return_interface
+
+
+def rl_load_texture_cubemap(data: int, size: int, format: int) -> int:
+    """Load texture cubemap"""
+    if __debug__:
+        _check_int("rl_load_texture_cubemap", "data", data, 0, 4294967295)
+        _check_int("rl_load_texture_cubemap", "size", size, -2147483648, 2147483647)
+        _check_int("rl_load_texture_cubemap", "format", format, -2147483648, 2147483647)
+    return_interface = _rlLoadTextureCubemap(data, size, format)
+    return return_interface
+
+
+def rl_update_texture(id: int, offsetX: int, offsetY: int, width: int, height: int, format: int, data: int):
+    """Update GPU texture with new data"""
+    if __debug__:
+        _check_int("rl_update_texture", "id", id, 0, 4294967295)
+        _check_int("rl_update_texture", "offsetX", offsetX, -2147483648, 2147483647)
+        _check_int("rl_update_texture", "offsetY", offsetY, -2147483648, 2147483647)
+        _check_int("rl_update_texture", "width", width, -2147483648, 2147483647)
+        _check_int("rl_update_texture", "height", height, -2147483648, 2147483647)
+        _check_int("rl_update_texture", "format", format, -2147483648, 2147483647)
+        _check_int("rl_update_texture", "data", data, 0, 4294967295)
+    _rlUpdateTexture(id, offsetX, offsetY, width, height, format, data)
+
+
+def rl_get_gl_texture_formats(format: int, glInternalFormat: int, glFormat: int, glType: int):
+    """Get OpenGL internal formats"""
+    if __debug__:
+        _check_int("rl_get_gl_texture_formats", "format", format, -2147483648, 2147483647)
+        _check_int("rl_get_gl_texture_formats", "glInternalFormat", glInternalFormat, 0, 4294967295)
+        _check_int("rl_get_gl_texture_formats", "glFormat", glFormat, 0, 4294967295)
+        _check_int("rl_get_gl_texture_formats", "glType", glType, 0, 4294967295)
+    _rlGetGlTextureFormats(format, glInternalFormat, glFormat, glType)
+
+
+def rl_get_pixel_format_name(format: int) -> int:
+    """Get name string for pixel format"""
+    if __debug__:
+        _check_int("rl_get_pixel_format_name", "format", format, 0, 4294967295)
+    return_interface = _rlGetPixelFormatName(format)
+    return return_interface
+
+
+def rl_unload_texture(id: int):
+    """Unload texture from GPU memory"""
+    if __debug__:
+        _check_int("rl_unload_texture", "id", id, 0, 4294967295)
+    _rlUnloadTexture(id)
+
+
+def rl_gen_texture_mipmaps(id: int, width: int, height: int, format: int, mipmaps: int):
+    """Generate mipmap data for selected texture"""
+    if __debug__:
+        _check_int("rl_gen_texture_mipmaps", "id", id, 0, 4294967295)
+        _check_int("rl_gen_texture_mipmaps", "width", width, -2147483648, 2147483647)
+        _check_int("rl_gen_texture_mipmaps", "height", height, -2147483648, 2147483647)
+        _check_int("rl_gen_texture_mipmaps", "format", format, -2147483648, 2147483647)
+        _check_int("rl_gen_texture_mipmaps", "mipmaps", mipmaps, 0, 4294967295)
+    _rlGenTextureMipmaps(id, width, height, format, mipmaps)
+
+
+def rl_read_texture_pixels(id: int, width: int, height: int, format: int) -> int:
+    """Read texture pixel data"""
+    if __debug__:
+        _check_int("rl_read_texture_pixels", "id", id, 0, 4294967295)
+        _check_int("rl_read_texture_pixels", "width", width, -2147483648, 2147483647)
+        _check_int("rl_read_texture_pixels", "height", height, -2147483648, 2147483647)
+        _check_int("rl_read_texture_pixels", "format", format, -2147483648, 2147483647)
+    return_interface = _rlReadTexturePixels(id, width, height, format)
+    return return_interface
+
+
+def rl_read_screen_pixels(width: int, height: int) -> int:
+    """Read screen pixel data (color buffer)"""
+    if __debug__:
+        _check_int("rl_read_screen_pixels", "width", width, -2147483648, 2147483647)
+        _check_int("rl_read_screen_pixels", "height", height, -2147483648, 2147483647)
+    return_interface = _rlReadScreenPixels(width, height)
+    return return_interface
+
+
+def rl_load_framebuffer(width: int, height: int) -> int:
+    """Load an empty framebuffer"""
+    if __debug__:
+        _check_int("rl_load_framebuffer", "width", width, -2147483648, 2147483647)
+        _check_int("rl_load_framebuffer", "height", height, -2147483648, 2147483647)
+    return_interface = _rlLoadFramebuffer(width, height)
+    return return_interface
+
+
+def rl_framebuffer_attach(fboId: int, texId: int, attachType: int, texType: int, mipLevel: int):
+    """Attach texture/renderbuffer to a framebuffer"""
+    if __debug__:
+        _check_int("rl_framebuffer_attach", "fboId", fboId, 0, 4294967295)
+        _check_int("rl_framebuffer_attach", "texId", texId, 0, 4294967295)
+        _check_int("rl_framebuffer_attach", "attachType", attachType, -2147483648, 2147483647)
+        _check_int("rl_framebuffer_attach", "texType", texType, -2147483648, 2147483647)
+        _check_int("rl_framebuffer_attach", "mipLevel", mipLevel, -2147483648, 2147483647)
+    _rlFramebufferAttach(fboId, texId, attachType, texType, mipLevel)
+
+
+def rl_framebuffer_complete(id: int) -> int:
+    """Verify framebuffer is complete"""
+    if __debug__:
+        _check_int("rl_framebuffer_complete", "id", id, 0, 4294967295)
+    return_interface = _rlFramebufferComplete(id)
+    return return_interface
+
+
+def rl_unload_framebuffer(id: int):
+    """Delete framebuffer from GPU"""
+    if __debug__:
+        _check_int("rl_unload_framebuffer", "id", id, 0, 4294967295)
+    _rlUnloadFramebuffer(id)
+
+
+def rl_load_shader_code(vsCode: str, fsCode: str) -> int:
+    """Load shader from code strings"""
+    if __debug__:
+        _check_str("rl_load_shader_code", "vsCode", vsCode)
+        _check_str("rl_load_shader_code", "fsCode", fsCode)
+    vsCode_ = _scratch_arena.string(vsCode)
+    fsCode_ = _scratch_arena.string(fsCode)
+    return_interface = _rlLoadShaderCode(vsCode_, fsCode_)
+    return return_interface
+
+
+def rl_compile_shader(shaderCode: str, type: int) -> int:
+    """Compile custom shader and return shader id (type: RL_VERTEX_SHADER, RL_FRAGMENT_SHADER, RL_COMPUTE_SHADER)"""
+    if __debug__:
+        _check_str("rl_compile_shader", "shaderCode", shaderCode)
+        _check_int("rl_compile_shader", "type", type, -2147483648, 2147483647)
+    shaderCode_ = _scratch_arena.string(shaderCode)
+    return_interface = _rlCompileShader(shaderCode_, type)
+    return return_interface
+
+
+def rl_load_shader_program(vShaderId: int, fShaderId: int) -> int:
+    """Load custom shader program"""
+    if __debug__:
+        _check_int("rl_load_shader_program", "vShaderId", vShaderId, 0, 4294967295)
+        _check_int("rl_load_shader_program", "fShaderId", fShaderId, 0, 4294967295)
+    return_interface = _rlLoadShaderProgram(vShaderId, fShaderId)
+    return return_interface
+
+
+def rl_unload_shader_program(id: int):
+    """Unload shader program"""
+    if __debug__:
+        _check_int("rl_unload_shader_program", "id", id, 0, 4294967295)
+    _rlUnloadShaderProgram(id)
+
+
+def rl_get_location_uniform(shaderId: int, uniformName: str) -> int:
+    """Get shader location uniform"""
+    if __debug__:
+        _check_int("rl_get_location_uniform", "shaderId", shaderId, 0, 4294967295)
+        _check_str("rl_get_location_uniform", "uniformName", uniformName)
+    uniformName_ = _scratch_arena.string(uniformName)
+    return_interface = _rlGetLocationUniform(shaderId, uniformName_)
+    return return_interface
+
+
+def rl_get_location_attrib(shaderId: int, attribName: str) -> int:
+    """Get shader location attribute"""
+    if __debug__:
+        _check_int("rl_get_location_attrib", "shaderId", shaderId, 0, 4294967295)
+        _check_str("rl_get_location_attrib", "attribName", attribName)
+    attribName_ = _scratch_arena.string(attribName)
+    return_interface = _rlGetLocationAttrib(shaderId, attribName_)
+    return return_interface
+
+
+def rl_set_uniform(locIndex: int, value: int, uniformType: int, count: int):
+    """Set shader value uniform"""
+    if __debug__:
+        _check_int("rl_set_uniform", "locIndex", locIndex, -2147483648, 2147483647)
+        _check_int("rl_set_uniform", "value", value, 0, 4294967295)
+        _check_int("rl_set_uniform", "uniformType", uniformType, -2147483648, 2147483647)
+        _check_int("rl_set_uniform", "count", count, -2147483648, 2147483647)
+    _rlSetUniform(locIndex, value, uniformType, count)
+
+
+def rl_set_uniform_matrix(locIndex: int, mat: Matrix):
+    """Set shader value matrix"""
+    if __debug__:
+        _check_int("rl_set_uniform_matrix", "locIndex", locIndex, -2147483648, 2147483647)
+        _check_struct("rl_set_uniform_matrix", "mat", mat, Matrix)
+    _rlSetUniformMatrix(locIndex, mat._address)
+
+
+def rl_set_uniform_sampler(locIndex: int, textureId: int):
+    """Set shader value sampler"""
+    if __debug__:
+        _check_int("rl_set_uniform_sampler", "locIndex", locIndex, -2147483648, 2147483647)
+        _check_int("rl_set_uniform_sampler", "textureId", textureId, 0, 4294967295)
+    _rlSetUniformSampler(locIndex, textureId)
+
+
+def rl_set_shader(id: int, locs: int):
+    """Set shader currently active (id and locations)"""
+    if __debug__:
+        _check_int("rl_set_shader", "id", id, 0, 4294967295)
+        _check_int("rl_set_shader", "locs", locs, 0, 4294967295)
+    _rlSetShader(id, locs)
+
+
+def rl_load_compute_shader_program(shaderId: int) -> int:
+    """Load compute shader program"""
+    if __debug__:
+        _check_int("rl_load_compute_shader_program", "shaderId", shaderId, 0, 4294967295)
+    return_interface = _rlLoadComputeShaderProgram(shaderId)
+    return return_interface
+
+
+def rl_compute_shader_dispatch(groupX: int, groupY: int, groupZ: int):
+    """Dispatch compute shader (equivalent to *draw* for graphics pipeline)"""
+    if __debug__:
+        _check_int("rl_compute_shader_dispatch", "groupX", groupX, 0, 4294967295)
+        _check_int("rl_compute_shader_dispatch", "groupY", groupY, 0, 4294967295)
+        _check_int("rl_compute_shader_dispatch", "groupZ", groupZ, 0, 4294967295)
+    _rlComputeShaderDispatch(groupX, groupY, groupZ)
+
+
+def rl_load_shader_buffer(size: int, data: int, usageHint: int) -> int:
+    """Load shader storage buffer object (SSBO)"""
+    if __debug__:
+        _check_int("rl_load_shader_buffer", "size", size, 0, 4294967295)
+        _check_int("rl_load_shader_buffer", "data", data, 0, 4294967295)
+        _check_int("rl_load_shader_buffer", "usageHint", usageHint, -2147483648, 2147483647)
+    return_interface = _rlLoadShaderBuffer(size, data, usageHint)
+    return return_interface
+
+
+def rl_unload_shader_buffer(ssboId: int):
+    """Unload shader storage buffer object (SSBO)"""
+    if __debug__:
+        _check_int("rl_unload_shader_buffer", "ssboId", ssboId, 0, 4294967295)
+    _rlUnloadShaderBuffer(ssboId)
+
+
+def rl_update_shader_buffer(id: int, data: int, dataSize: int, offset: int):
+    """Update SSBO buffer data"""
+    if __debug__:
+        _check_int("rl_update_shader_buffer", "id", id, 0, 4294967295)
+        _check_int("rl_update_shader_buffer", "data", data, 0, 4294967295)
+        _check_int("rl_update_shader_buffer", "dataSize", dataSize, 0, 4294967295)
+        _check_int("rl_update_shader_buffer", "offset", offset, 0, 4294967295)
+    _rlUpdateShaderBuffer(id, data, dataSize, offset)
+
+
+def rl_bind_shader_buffer(id: int, index: int):
+    """Bind SSBO buffer"""
+    if __debug__:
+        _check_int("rl_bind_shader_buffer", "id", id, 0, 4294967295)
+        _check_int("rl_bind_shader_buffer", "index", index, 0, 4294967295)
+    _rlBindShaderBuffer(id, index)
+
+
+def rl_read_shader_buffer(id: int, dest: int, count: int, offset: int):
+    """Read SSBO buffer data (GPU->CPU)"""
+    if __debug__:
+        _check_int("rl_read_shader_buffer", "id", id, 0, 4294967295)
+        _check_int("rl_read_shader_buffer", "dest", dest, 0, 4294967295)
+        _check_int("rl_read_shader_buffer", "count", count, 0, 4294967295)
+        _check_int("rl_read_shader_buffer", "offset", offset, 0, 4294967295)
+    _rlReadShaderBuffer(id, dest, count, offset)
+
+
+def rl_copy_shader_buffer(destId: int, srcId: int, destOffset: int, srcOffset: int, count: int):
+    """Copy SSBO data between buffers"""
+    if __debug__:
+        _check_int("rl_copy_shader_buffer", "destId", destId, 0, 4294967295)
+        _check_int("rl_copy_shader_buffer", "srcId", srcId, 0, 4294967295)
+        _check_int("rl_copy_shader_buffer", "destOffset", destOffset, 0, 4294967295)
+        _check_int("rl_copy_shader_buffer", "srcOffset", srcOffset, 0, 4294967295)
+        _check_int("rl_copy_shader_buffer", "count", count, 0, 4294967295)
+    _rlCopyShaderBuffer(destId, srcId, destOffset, srcOffset, count)
+
+
+def rl_get_shader_buffer_size(id: int) -> int:
+    """Get SSBO buffer size"""
+    if __debug__:
+        _check_int("rl_get_shader_buffer_size", "id", id, 0, 4294967295)
+    return_interface = _rlGetShaderBufferSize(id)
+    return return_interface
+
+
+def rl_bind_image_texture(id: int, index: int, format: int, readonly: int):
+    """Bind image texture"""
+    if __debug__:
+        _check_int("rl_bind_image_texture", "id", id, 0, 4294967295)
+        _check_int("rl_bind_image_texture", "index", index, 0, 4294967295)
+        _check_int("rl_bind_image_texture", "format", format, -2147483648, 2147483647)
+        _check_int("rl_bind_image_texture", "readonly", readonly, -128, 127)
+    _rlBindImageTexture(id, index, format, readonly)
+
+
+def rl_get_matrix_modelview(out: Matrix = None) -> Matrix:
+    """Get internal modelview matrix"""
+    if __debug__:
+        if out is not None:
+            _check_struct("rl_get_matrix_modelview", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix else out
+    _rlGetMatrixModelview(Matrix_._address)
+    if out is not None and out is not Matrix_:
+        out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def rl_get_matrix_projection(out: Matrix = None) -> Matrix:
+    """Get internal projection matrix"""
+    if __debug__:
+        if out is not None:
+            _check_struct("rl_get_matrix_projection", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix else out
+    _rlGetMatrixProjection(Matrix_._address)
+    if out is not None and out is not Matrix_:
+        out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def rl_get_matrix_transform(out: Matrix = None) -> Matrix:
+    """Get internal accumulated transform matrix"""
+    if __debug__:
+        if out is not None:
+            _check_struct("rl_get_matrix_transform", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix else out
+    _rlGetMatrixTransform(Matrix_._address)
+    if out is not None and out is not Matrix_:
+        out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def rl_get_matrix_projection_stereo(eye: int, out: Matrix = None) -> Matrix:
+    """Get internal projection matrix for stereo render (selected eye)"""
+    if __debug__:
+        _check_int("rl_get_matrix_projection_stereo", "eye", eye, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("rl_get_matrix_projection_stereo", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix else out
+    _rlGetMatrixProjectionStereo(Matrix_._address, eye)
+    if out is not None and out is not Matrix_:
+        out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def rl_get_matrix_view_offset_stereo(eye: int, out: Matrix = None) -> Matrix:
+    """Get internal view offset matrix for stereo render (selected eye)"""
+    if __debug__:
+        _check_int("rl_get_matrix_view_offset_stereo", "eye", eye, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("rl_get_matrix_view_offset_stereo", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix else out
+    _rlGetMatrixViewOffsetStereo(Matrix_._address, eye)
+    if out is not None and out is not Matrix_:
+        out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def rl_set_matrix_projection(proj: Matrix):
+    """Set a custom projection matrix (replaces internal projection matrix)"""
+    if __debug__:
+        _check_struct("rl_set_matrix_projection", "proj", proj, Matrix)
+    _rlSetMatrixProjection(proj._address)
+
+
+def rl_set_matrix_modelview(view: Matrix):
+    """Set a custom modelview matrix (replaces internal modelview matrix)"""
+    if __debug__:
+        _check_struct("rl_set_matrix_modelview", "view", view, Matrix)
+    _rlSetMatrixModelview(view._address)
+
+
+def rl_set_matrix_projection_stereo(right: Matrix, left: Matrix):
+    """Set eyes projection matrices for stereo rendering"""
+    if __debug__:
+        _check_struct("rl_set_matrix_projection_stereo", "right", right, Matrix)
+        _check_struct("rl_set_matrix_projection_stereo", "left", left, Matrix)
+    _rlSetMatrixProjectionStereo(right._address, left._address)
+
+
+def rl_set_matrix_view_offset_stereo(right: Matrix, left: Matrix):
+    """Set eyes view offsets matrices for stereo rendering"""
+    if __debug__:
+        _check_struct("rl_set_matrix_view_offset_stereo", "right", right, Matrix)
+        _check_struct("rl_set_matrix_view_offset_stereo", "left", left, Matrix)
+    _rlSetMatrixViewOffsetStereo(right._address, left._address)
+
+
+def rl_load_draw_cube():
+    """Load and draw a cube"""
+    _rlLoadDrawCube()
+
+
+def rl_load_draw_quad():
+    """Load and draw a quad"""
+    _rlLoadDrawQuad()
+
+
+# the wasm exports called above, fetched once instead of looked up at every call, they are bound
+# again when another context is activated or profiling starts
+_wasm_functions_names = [
+    "_rlMatrixMode",
+    "_rlPushMatrix",
+    "_rlPopMatrix",
+    "_rlLoadIdentity",
+    "_rlTranslatef",
+    "_rlRotatef",
+    "_rlScalef",
+    "_rlMultMatrixf",
+    "_rlFrustum",
+    "_rlOrtho",
+    "_rlViewport",
+    "_rlBegin",
+    "_rlEnd",
+    "_rlVertex2i",
+    "_rlVertex2f",
+    "_rlVertex3f",
+    "_rlTexCoord2f",
+    "_rlNormal3f",
+    "_rlColor4ub",
+    "_rlColor3f",
+    "_rlColor4f",
+    "_rlEnableVertexArray",
+    "_rlDisableVertexArray",
+    "_rlEnableVertexBuffer",
+    "_rlDisableVertexBuffer",
+    "_rlEnableVertexBufferElement",
+    "_rlDisableVertexBufferElement",
+    "_rlEnableVertexAttribute",
+    "_rlDisableVertexAttribute",
+    "_rlEnableStatePointer",
+    "_rlDisableStatePointer",
+    "_rlActiveTextureSlot",
+    "_rlEnableTexture",
+    "_rlDisableTexture",
+    "_rlEnableTextureCubemap",
+    "_rlDisableTextureCubemap",
+    "_rlTextureParameters",
+    "_rlCubemapParameters",
+    "_rlEnableShader",
+    "_rlDisableShader",
+    "_rlEnableFramebuffer",
+    "_rlDisableFramebuffer",
+    "_rlActiveDrawBuffers",
+    "_rlEnableColorBlend",
+    "_rlDisableColorBlend",
+    "_rlEnableDepthTest",
+    "_rlDisableDepthTest",
+    "_rlEnableDepthMask",
+    "_rlDisableDepthMask",
+    "_rlEnableBackfaceCulling",
+    "_rlDisableBackfaceCulling",
+    "_rlSetCullFace",
+    "_rlEnableScissorTest",
+    "_rlDisableScissorTest",
+    "_rlScissor",
+    "_rlEnableWireMode",
+    "_rlDisableWireMode",
+    "_rlSetLineWidth",
+    "_rlGetLineWidth",
+    "_rlEnableSmoothLines",
+    "_rlDisableSmoothLines",
+    "_rlEnableStereoRender",
+    "_rlDisableStereoRender",
+    "_rlIsStereoRenderEnabled",
+    "_rlClearColor",
+    "_rlClearScreenBuffers",
+    "_rlCheckErrors",
+    "_rlSetBlendMode",
+    "_rlSetBlendFactors",
+    "_rlSetBlendFactorsSeparate",
+    "_rlglInit",
+    "_rlglClose",
+    "_rlLoadExtensions",
+    "_rlGetVersion",
+    "_rlSetFramebufferWidth",
+    "_rlGetFramebufferWidth",
+    "_rlSetFramebufferHeight",
+    "_rlGetFramebufferHeight",
+    "_rlGetTextureIdDefault",
+    "_rlGetShaderIdDefault",
+    "_rlGetShaderLocsDefault",
+    "_rlLoadRenderBatch",
+    "_rlUnloadRenderBatch",
+    "_rlDrawRenderBatch",
+    "_rlSetRenderBatchActive",
+    "_rlDrawRenderBatchActive",
+    "_rlCheckRenderBatchLimit",
+    "_rlSetTexture",
+    "_rlLoadVertexArray",
+    "_rlLoadVertexBuffer",
+    "_rlLoadVertexBufferElement",
+    "_rlUpdateVertexBuffer",
+    "_rlUpdateVertexBufferElements",
+    "_rlUnloadVertexArray",
+    "_rlUnloadVertexBuffer",
+    "_rlSetVertexAttribute",
+    "_rlSetVertexAttributeDivisor",
+    "_rlSetVertexAttributeDefault",
+    "_rlDrawVertexArray",
+    "_rlDrawVertexArrayElements",
+    "_rlDrawVertexArrayInstanced",
+    "_rlDrawVertexArrayElementsInstanced",
+    "_rlLoadTexture",
+    "_rlLoadTextureDepth",
+    "_rlLoadTextureCubemap",
+    "_rlUpdateTexture",
+    "_rlGetGlTextureFormats",
+    "_rlGetPixelFormatName",
+    "_rlUnloadTexture",
+    "_rlGenTextureMipmaps",
+    "_rlReadTexturePixels",
+    "_rlReadScreenPixels",
+    "_rlLoadFramebuffer",
+    "_rlFramebufferAttach",
+    "_rlFramebufferComplete",
+    "_rlUnloadFramebuffer",
+    "_rlLoadShaderCode",
+    "_rlCompileShader",
+    "_rlLoadShaderProgram",
+    "_rlUnloadShaderProgram",
+    "_rlGetLocationUniform",
+    "_rlGetLocationAttrib",
+    "_rlSetUniform",
+    "_rlSetUniformMatrix",
+    "_rlSetUniformSampler",
+    "_rlSetShader",
+    "_rlLoadComputeShaderProgram",
+    "_rlComputeShaderDispatch",
+    "_rlLoadShaderBuffer",
+    "_rlUnloadShaderBuffer",
+    "_rlUpdateShaderBuffer",
+    "_rlBindShaderBuffer",
+    "_rlReadShaderBuffer",
+    "_rlCopyShaderBuffer",
+    "_rlGetShaderBufferSize",
+    "_rlBindImageTexture",
+    "_rlGetMatrixModelview",
+    "_rlGetMatrixProjection",
+    "_rlGetMatrixTransform",
+    "_rlGetMatrixProjectionStereo",
+    "_rlGetMatrixViewOffsetStereo",
+    "_rlSetMatrixProjection",
+    "_rlSetMatrixModelview",
+    "_rlSetMatrixProjectionStereo",
+    "_rlSetMatrixViewOffsetStereo",
+    "_rlLoadDrawCube",
+    "_rlLoadDrawQuad",
+]
+_bind_wasm_functions(globals())
+
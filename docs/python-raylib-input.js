@@ -0,0 +1,172 @@
+// input of a canvas whose game runs in a worker (python-raylib-worker.js):
+// the page writes its events into a ring buffer in shared memory, the worker reads them before every frame
+// and hands them to the listeners emscripten registered on its window, document and canvas stand-ins
+
+const KEY_DOWN = 1
+const KEY_UP = 2
+const KEY_PRESS = 3
+const MOUSE_MOVE = 4
+const MOUSE_DOWN = 5
+const MOUSE_UP = 6
+const WHEEL = 7
+const RESIZE = 8
+
+const eventTypes = {
+  [KEY_DOWN]: 'keydown',
+  [KEY_UP]: 'keyup',
+  [KEY_PRESS]: 'keypress',
+  [MOUSE_MOVE]: 'mousemove',
+  [MOUSE_DOWN]: 'mousedown',
+  [MOUSE_UP]: 'mouseup',
+  [WHEEL]: 'wheel',
+  [RESIZE]: 'resize'
+}
+
+// 4 int32 per event: type and 3 values, after a header with the write and read counts
+const RECORD_SIZE = 4
+const HEADER_SIZE = 4
+
+export class InputRing {
+  constructor (buffer = new SharedArrayBuffer(4 * (HEADER_SIZE + RECORD_SIZE * 256))) {
+    this.buffer = buffer
+    this.data = new Int32Array(buffer)
+    this.capacity = (this.data.length - HEADER_SIZE) / RECORD_SIZE
+  }
+
+  // page side, events that don't fit are dropped until the worker catches up
+  push (type, a = 0, b = 0, c = 0) {
+    const written = Atomics.load(this.data, 0)
+    if (written - Atomics.load(this.data, 1) >= this.capacity) {
+      return
+    }
+    const index = HEADER_SIZE + (written % this.capacity) * RECORD_SIZE
+    this.data[index] = type
+    this.data[index + 1] = a
+    this.data[index + 2] = b
+    this.data[index + 3] = c
+    Atomics.store(this.data, 0, written + 1)
+  }
+
+  // worker side, calls callback(type, a, b, c) for each event written since the last read
+  read (callback) {
+    const written = Atomics.load(this.data, 0)
+    let read = Atomics.load(this.data, 1)
+    for (; read !== written; read++) {
+      const index = HEADER_SIZE + (read % this.capacity) * RECORD_SIZE
+      callback(this.data[index], this.data[index + 1], this.data[index + 2], this.data[index + 3])
+    }
+    Atomics.store(this.data, 1, read)
+  }
+}
+
+function modifiers (event) {
+  return (event.shiftKey ? 1 : 0) | (event.ctrlKey ? 2 : 0) | (event.altKey ? 4 : 0) | (event.metaKey ? 8 : 0)
+}
+
+// page side: the events raylib listens to, mouse positions in css pixels from the top left of the canvas
+export function forwardInput (canvas, ring) {
+  const position = event => {
+    const rect = canvas.getBoundingClientRect()
+    return [Math.round(event.clientX - rect.left), Math.round(event.clientY - rect.top)]
+  }
+  window.addEventListener('keydown', event => ring.push(KEY_DOWN, event.keyCode, modifiers(event)))
+  window.addEventListener('keyup', event => ring.push(KEY_UP, event.keyCode, modifiers(event)))
+  window.addEventListener('keypress', event => ring.push(KEY_PRESS, event.charCode, modifiers(event)))
+  canvas.addEventListener('mousemove', event => ring.push(MOUSE_MOVE, ...position(event), event.buttons))
+  canvas.addEventListener('mousedown', event => ring.push(MOUSE_DOWN, ...position(event), event.button))
+  window.addEventListener('mouseup', event => ring.push(MOUSE_UP, ...position(event), event.button))
+  canvas.addEventListener('wheel', event => {
+    event.preventDefault()
+    ring.push(WHEEL, Math.round(event.deltaX), Math.round(event.deltaY), event.deltaMode)
+  }, { passive: false })
+  const resize = () => ring.push(RESIZE, canvas.clientWidth, canvas.clientHeight, Math.round(devicePixelRatio * 1000))
+  new ResizeObserver(resize).observe(canvas)
+  resize()
+}
+
+class EventTargetStandIn {
+  constructor () {
+    this.listeners = {}
+  }
+
+  addEventListener (type, listener) {
+    (this.listeners[type] = this.listeners[type] || []).push(listener)
+  }
+
+  removeEventListener (type, listener) {
+    this.listeners[type] = (this.listeners[type] || []).filter(other => other !== listener)
+  }
+
+  dispatchEvent (event) {
+    for (const listener of this.listeners[event.type] || []) {
+      if (typeof listener === 'function') {
+        listener.call(this, event)
+      } else {
+        listener.handleEvent(event)
+      }
+    }
+  }
+}
+
+// worker side: emscripten's glfw and html5 code expect window and document and register their listeners on them
+// and on the canvas, set them up (after pyodide is loaded, it must still see a worker) before the raylib wasm starts
+export function standInDOM (canvas) {
+  const rect = { left: 0, top: 0, right: canvas.width, bottom: canvas.height, width: canvas.width, height: canvas.height }
+  const canvasTarget = new EventTargetStandIn()
+  canvas.addEventListener = canvasTarget.addEventListener.bind(canvasTarget)
+  canvas.removeEventListener = canvasTarget.removeEventListener.bind(canvasTarget)
+  canvas.getBoundingClientRect = () => rect
+  canvas.style = {}
+
+  const windowTarget = Object.assign(new EventTargetStandIn(), {
+    devicePixelRatio: 1, scrollX: 0, scrollY: 0, pageXOffset: 0, pageYOffset: 0, innerWidth: rect.width, innerHeight: rect.height
+  })
+  const documentTarget = Object.assign(new EventTargetStandIn(), {
+    fullscreenElement: null, pointerLockElement: null, querySelector: () => canvas, getElementById: () => canvas
+  })
+  documentTarget.documentElement = documentTarget.body = documentTarget
+  globalThis.window = windowTarget
+  globalThis.document = documentTarget
+
+  const targets = [windowTarget, documentTarget, canvasTarget]
+  return function dispatchInput (ring) {
+    ring.read((type, a, b, c) => {
+      if (type === RESIZE) {
+        Object.assign(rect, { right: a, bottom: b, width: a, height: b })
+        Object.assign(windowTarget, { innerWidth: a, innerHeight: b, devicePixelRatio: c / 1000 })
+      }
+      const isKey = type === KEY_DOWN || type === KEY_UP || type === KEY_PRESS
+      const isMouse = type === MOUSE_MOVE || type === MOUSE_DOWN || type === MOUSE_UP
+      const event = {
+        type: eventTypes[type],
+        target: canvas,
+        preventDefault () {},
+        stopPropagation () {},
+        keyCode: isKey ? a : 0,
+        which: isKey ? a : 0,
+        charCode: type === KEY_PRESS ? a : 0,
+        shiftKey: isKey && (b & 1) !== 0,
+        ctrlKey: isKey && (b & 2) !== 0,
+        altKey: isKey && (b & 4) !== 0,
+        metaKey: isKey && (b & 8) !== 0,
+        clientX: isMouse ? a : 0,
+        clientY: isMouse ? b : 0,
+        pageX: isMouse ? a : 0,
+        pageY: isMouse ? b : 0,
+        screenX: isMouse ? a : 0,
+        screenY: isMouse ? b : 0,
+        movementX: 0,
+        movementY: 0,
+        button: type === MOUSE_DOWN || type === MOUSE_UP ? c : 0,
+        buttons: type === MOUSE_MOVE ? c : 0,
+        deltaX: type === WHEEL ? a : 0,
+        deltaY: type === WHEEL ? b : 0,
+        deltaZ: 0,
+        deltaMode: type === WHEEL ? c : 0
+      }
+      for (const target of targets) {
+        target.dispatchEvent(event)
+      }
+    })
+  }
+}
@@ -1,19 +1,510 @@
 import Module from './raylib.js'
+import { InputRing, forwardInput } from './python-raylib-input.js'
 
 const loc = import.meta.url.replace(/python-raylib-web\.js$/, '')
 
-export default async function setup (canvas) {
-  const mod = await Module({ canvas })
-  mod.mem = new DataView(mod.HEAPU8.buffer)
+// emscripten replaces its HEAP* views when ALLOW_MEMORY_GROWTH grows the memory,
+// HEAPF64 is the last one it sets, so use it to rebuild mod.mem and tell python (mod.onMemoryGrowth)
+function trackMemoryGrowth (config) {
+  let heapF64
+  Object.defineProperty(config, 'HEAPF64', {
+    get () {
+      return heapF64
+    },
+    set (view) {
+      heapF64 = view
+      if (view) {
+        config.mem = new DataView(view.buffer)
+        if (config.onMemoryGrowth) {
+          config.onMemoryGrowth()
+        }
+      }
+    }
+  })
+  return config
+}
+
+// the wrapper compiled to .pyc files in a zip, kept in Cache Storage until bundle.json has a new hash
+async function fetchBundle ({ url, hash }) {
+  const request = `${loc}/${url}?hash=${hash}`
+  if (typeof caches === 'undefined') {
+    return fetch(request).then(r => r.arrayBuffer()) // Cache Storage is only there on https and localhost
+  }
+  const cache = await caches.open('raylib-python-web')
+  let response = await cache.match(request)
+  if (!response) {
+    response = await fetch(request)
+    for (const old of await cache.keys()) {
+      if (old.url.includes(url)) {
+        await cache.delete(old)
+      }
+    }
+    await cache.put(request, response.clone())
+  }
+  return response.arrayBuffer()
+}
+
+// the wrapper sources, compiled by pyodide when they are imported
+async function writeSources (pyodide) {
+  const files = await fetch(`${loc}/wasmraypy/files.json`).then(r => r.json())
+  pyodide.FS.mkdirTree('/home/pyodide/wasmraypy')
+  await Promise.all(files.map(async ({ url, path }) => {
+    const source = await fetch(`${loc}/${url}`).then(r => r.text())
+    pyodide.FS.writeFile(`/home/pyodide/${path}`, source)
+  }))
+}
+
+// pyodide with the wrapper loaded, shared by the games of the page (see getRuntime)
+async function loadRuntime ({ lazy, bundle }) {
   const pyodide = await loadPyodide()
-  window.mod = mod
-  pyodide.globals.set('_mod', mod)
 
-  console.log()
+  const started = performance.now()
+  const bundleInfo = bundle && await fetch(`${loc}/wasmraypy/bundle.json`, { cache: 'no-cache' }).then(r => r.json())
+  if (bundleInfo && bundleInfo.magic === pyodide.runPython('import importlib.util\nimportlib.util.MAGIC_NUMBER.hex()')) {
+    pyodide.FS.writeFile('/home/pyodide/wasmraypy.zip', new Uint8Array(await fetchBundle(bundleInfo)))
+    pyodide.runPython('import sys\nsys.path.insert(0, "/home/pyodide/wasmraypy.zip")')
+  } else {
+    await writeSources(pyodide)
+  }
+  pyodide.runPython('import importlib\nimportlib.invalidate_caches()')
+
+  return { pyodide, wasmraypy: pyodide.pyimport('wasmraypy'), lazy, loadTime: performance.now() - started }
+}
+
+const runtimes = new Map()
+
+// one runtime for each set of options, loaded the first time it is asked for
+export function getRuntime ({ lazy = true, bundle = true } = {}) {
+  const key = JSON.stringify({ lazy, bundle })
+  if (!runtimes.has(key)) {
+    runtimes.set(key, loadRuntime({ lazy, bundle }))
+  }
+  return runtimes.get(key)
+}
+
+// add up the time spent in the exported wasm functions of mod into clock.wasm, only done when timing is asked for
+function timeWasmCalls (mod, clock) {
+  for (const [name, exported] of Object.entries(mod)) {
+    if (name.startsWith('_') && typeof exported === 'function') {
+      mod[name] = function () {
+        const started = performance.now()
+        try {
+          return exported.apply(this, arguments)
+        } finally {
+          clock.wasm += performance.now() - started
+        }
+      }
+    }
+  }
+}
+
+// count the WebGL calls of a raylib wasm instance for the profiler: draw calls, texture binds and rlgl batches (each
+// batch rlgl draws starts with useProgram), start() wraps the context raylib draws with once InitWindow() created it
+function countGLCalls (mod) {
+  const counters = { drawCalls: 0, textureBinds: 0, batches: 0, counting: false }
+  counters.start = () => {
+    const gl = mod.ctx
+    if (counters.counting || !gl) {
+      return counters.counting
+    }
+    const count = (name, counter) => {
+      const call = gl[name]
+      if (call) {
+        gl[name] = function () {
+          counters[counter]++
+          return call.apply(gl, arguments)
+        }
+      }
+    }
+    for (const name of ['drawArrays', 'drawElements', 'drawArraysInstanced', 'drawElementsInstanced']) {
+      count(name, 'drawCalls')
+    }
+    count('bindTexture', 'textureBinds')
+    count('useProgram', 'batches')
+    counters.counting = true
+    return true
+  }
+  return counters
+}
+
+// where a fetched asset is written: wasm memory from _malloc, grown while the body streams in
+class MemorySink {
+  constructor (mod, length) {
+    this.mod = mod
+    this.capacity = Math.max(length, 64 * 1024)
+    this.address = mod._malloc(this.capacity)
+    this.size = 0
+  }
+
+  write (chunk) {
+    if (this.size + chunk.length > this.capacity) {
+      // no _realloc export, move the bytes so far to a bigger block
+      this.capacity = Math.max(2 * this.capacity, this.size + chunk.length)
+      const address = this.mod._malloc(this.capacity)
+      this.mod.HEAPU8.copyWithin(address, this.address, this.address + this.size)
+      this.mod._free(this.address)
+      this.address = address
+    }
+    this.mod.HEAPU8.set(chunk, this.address + this.size) // HEAPU8 again for every chunk, _malloc may grow the memory
+    this.size += chunk.length
+  }
+
+  bytes () {
+    return this.mod.HEAPU8.slice(this.address, this.address + this.size)
+  }
+
+  discard () {
+    this.mod._free(this.address)
+  }
+}
+
+// or a file of the emscripten FS (MEMFS), for the loaders that take a file name (fonts, models, music streams)
+class FileSink {
+  constructor (FS, path) {
+    this.FS = FS
+    this.path = path
+    FS.mkdirTree(path.slice(0, path.lastIndexOf('/')) || '/')
+    this.stream = FS.open(path, 'w')
+    this.address = 0
+    this.size = 0
+  }
+
+  write (chunk) {
+    this.FS.write(this.stream, chunk, 0, chunk.length)
+    this.size += chunk.length
+  }
+
+  bytes () {
+    return this.FS.readFile(this.path)
+  }
+
+  discard () {
+    this.FS.close(this.stream)
+    this.FS.unlink(this.path)
+  }
+
+  close () {
+    this.FS.close(this.stream)
+  }
+}
+
+async function hexDigest (bytes) {
+  const digest = await crypto.subtle.digest('SHA-256', bytes)
+  return Array.from(new Uint8Array(digest), byte => byte.toString(16).padStart(2, '0')).join('')
+}
+
+// the assets of the user code (wasmraypy.assets.AssetLoader) for a raylib wasm instance, fetched `parallel` at a time
+// and streamed into its memory or its FS while frames go on, python polls status() from update()
+// with a manifest (url -> SHA-256 of the content, see tools/assets_manifest.py) an asset is kept in Cache Storage by
+// its hash, so it is not fetched again on the next visit, nor after a deploy that didn't change it
+export class AssetLoader {
+  constructor (mod, { parallel = 6, cacheName = 'raylib-python-web-assets' } = {}) {
+    this.mod = mod
+    this.parallel = parallel
+    this.cacheName = cacheName
+    this.manifest = Promise.resolve({})
+    this.queue = [] // assets waiting for one of the parallel fetches
+    this.fetching = 0
+    this.assets = new Map() // id -> { status (0 loading, 1 loaded, -1 failed), address, size, error, sink }
+    this.nextId = 1
+    this.finished = 0 // count of the assets that finished, python only looks at status() when it changed
+  }
 
-  // just for dev, pull wrapper from seperate file
-  const wrapper = await fetch(`${loc}/wasmraypy.txt`).then(r => r.text())
-  pyodide.runPython(wrapper)
+  useManifest (url) {
+    this.manifest = fetch(new URL(url, globalThis.location), { cache: 'no-cache' })
+      .then(response => response.ok ? response.json() : {})
+      .catch(() => ({}))
+  }
+
+  // start loading url into wasm memory, or into the file path of the FS, return the id of the asset
+  load (url, path = null) {
+    const id = this.nextId++
+    this.assets.set(id, { status: 0, address: 0, size: 0, error: '', sink: null })
+    this.queue.push({ id, url, path })
+    this.next()
+    return id
+  }
+
+  next () {
+    while (this.fetching < this.parallel && this.queue.length > 0) {
+      const { id, url, path } = this.queue.shift()
+      const asset = this.assets.get(id)
+      this.fetching++
+      this.fetchAsset(asset, url, path)
+        .then(() => { asset.status = 1 }, error => {
+          asset.status = -1
+          asset.error = `${url}: ${error.message || error}`
+        })
+        .finally(() => {
+          this.fetching--
+          this.finished++
+          if (asset.released) {
+            this.release(id)
+          }
+          this.next()
+        })
+    }
+  }
+
+  async cached (url) {
+    const hash = (await this.manifest)[url]
+    if (!hash || typeof caches === 'undefined') { // Cache Storage is only there on https and localhost
+      return { hash: null }
+    }
+    const cache = await caches.open(this.cacheName)
+    const key = `${loc}assets/${hash}` // by content, the same bytes under another url are the same entry
+    return { hash, cache, key, response: await cache.match(key) }
+  }
+
+  async fetchAsset (asset, url, path) {
+    const { hash, cache, key, response: cachedResponse } = await this.cached(url)
+    const response = cachedResponse || await fetch(new URL(url, globalThis.location))
+    if (!response.ok) {
+      throw new Error(`${response.status} ${response.statusText}`)
+    }
+    const length = Number(response.headers.get('Content-Length')) || 0
+    const sink = asset.sink = path ? new FileSink(this.mod.FS, path) : new MemorySink(this.mod, length)
+    try {
+      const reader = response.body.getReader()
+      for (let chunk = await reader.read(); !chunk.done; chunk = await reader.read()) {
+        sink.write(chunk.value)
+      }
+      if (path) {
+        sink.close()
+      }
+    } catch (error) {
+      sink.discard()
+      asset.sink = null
+      throw error
+    }
+    asset.address = sink.address
+    asset.size = sink.size
+    if (hash && !cachedResponse) {
+      const bytes = sink.bytes()
+      if (await hexDigest(bytes) === hash) {
+        await cache.put(key, new Response(bytes))
+      } else {
+        console.warn(`${url} doesn't match its hash in the asset manifest, it is not cached`)
+      }
+    }
+  }
+
+  status (id) {
+    return this.assets.get(id).status
+  }
+
+  address (id) {
+    return this.assets.get(id).address
+  }
+
+  size (id) {
+    return this.assets.get(id).size
+  }
+
+  error (id) {
+    return this.assets.get(id).error
+  }
+
+  // free what load() wrote into wasm memory (files stay in the FS), once python has decoded it
+  release (id) {
+    const asset = this.assets.get(id)
+    if (asset.status === 0) {
+      asset.released = true // still streaming, released when it finishes
+      return
+    }
+    if (asset.sink instanceof MemorySink) {
+      asset.sink.discard()
+    }
+    this.assets.delete(id)
+  }
+}
+
+// a raylib wasm instance for canvas and the context of the wrapper that works on it
+export async function createContext (runtime, canvas, clock = null) {
+  const mod = await Module(trackMemoryGrowth({ canvas }))
+  mod.assets = new AssetLoader(mod)
+  mod.glCounters = countGLCalls(mod)
+  if (clock) {
+    timeWasmCalls(mod, clock)
+  }
+  globalThis.mod = mod
+  runtime.pyodide.globals.set('_mod', mod) // the wrapper takes the wasm instance of its first context from __main__
+  const started = performance.now()
+  const context = runtime.wasmraypy.create_context(mod)
+  if (!runtime.lazy) {
+    runtime.wasmraypy.load_all()
+  }
+  // loading the wrapper is only paid by the first context of a runtime
+  performance.measure('raylib-python-web wrapper', { start: started - runtime.loadTime, end: performance.now() })
+  runtime.loadTime = 0
+  return context
+}
+
+// a canvas running user code on a shared runtime, run() again replaces the code without reloading anything else
+export class RaylibGame {
+  constructor (runtime, context, clock = null) {
+    this.pyodide = runtime.pyodide
+    this.context = context
+    this.namespace = null
+    this.updateFunction = null // init() and update() of the user code are looked up once, not parsed every frame
+    this.frame = 0
+    this.previousTimestamp = 0
+    this.overran = false
+    this.skippedFrames = 0
+    this.clock = clock
+    // with timing, the ms of the last frame: in python (update() without its wasm calls), in wasm and idle
+    this.timing = clock && { python: 0, wasm: 0, idle: 0 }
+    this.onframe = null // called with timing after each frame
+  }
+
+  async run (code) {
+    this.stop()
+    await this.pyodide.loadPackagesFromImports(code) // for example numpy
+    this.release()
+    this.namespace = this.context.new_namespace()
+    this.pyodide.runPython(code, { globals: this.namespace })
+    const init = this.context.user_function(this.namespace, 'init')
+    this.updateFunction = this.context.user_function(this.namespace, 'update')
+    try {
+      init(performance.now())
+    } finally {
+      init.destroy()
+    }
+    this.start()
+  }
+
+  release () {
+    if (this.updateFunction) {
+      this.updateFunction.destroy()
+      this.updateFunction = null
+    }
+    if (this.namespace) {
+      this.namespace.destroy()
+      this.namespace = null
+    }
+  }
+
+  update (timestamp) {
+    this.context.activate()
+    this.updateFunction(timestamp)
+  }
+
+  start () {
+    const frame = timestamp => {
+      const interval = this.previousTimestamp ? timestamp - this.previousTimestamp : 0
+      this.previousTimestamp = timestamp
+      if (this.overran) {
+        // the last update() took longer than a frame, leave this one to the browser (input, layout)
+        this.overran = false
+        this.skippedFrames++
+      } else {
+        if (this.clock) {
+          this.clock.wasm = 0
+        }
+        const started = performance.now()
+        this.update(timestamp)
+        const duration = performance.now() - started
+        this.overran = interval > 0 && duration > interval
+        if (this.clock) {
+          this.timing.wasm = this.clock.wasm
+          this.timing.python = duration - this.clock.wasm
+          this.timing.idle = Math.max(0, interval - duration)
+          if (this.onframe) {
+            this.onframe(this.timing)
+          }
+        }
+      }
+      this.frame = requestAnimationFrame(frame)
+    }
+    this.stop()
+    this.frame = requestAnimationFrame(frame)
+  }
+
+  stop () {
+    cancelAnimationFrame(this.frame)
+    this.frame = 0
+    this.previousTimestamp = 0
+    this.overran = false
+  }
+}
+
+// the same game running in a worker (python-raylib-worker.js) on an OffscreenCanvas, the page only forwards input
+export class RaylibWorkerGame {
+  constructor (worker) {
+    this.worker = worker
+    this.replies = new Map()
+    this.nextId = 0
+    this.timing = null // sent by the worker after each frame, with timing
+    this.onframe = null
+    worker.onmessage = ({ data }) => {
+      if (data.timing) {
+        this.timing = data.timing
+        if (this.onframe) {
+          this.onframe(this.timing)
+        }
+        return
+      }
+      const { resolve, reject } = this.replies.get(data.id)
+      this.replies.delete(data.id)
+      if (data.error) {
+        reject(new Error(data.error))
+      } else {
+        resolve()
+      }
+    }
+  }
+
+  call (type, data = {}, transfer = []) {
+    const id = this.nextId++
+    this.worker.postMessage({ id, type, ...data }, transfer)
+    return new Promise((resolve, reject) => this.replies.set(id, { resolve, reject }))
+  }
+
+  run (code) {
+    return this.call('run', { code })
+  }
+
+  start () {
+    return this.call('start')
+  }
+
+  stop () {
+    return this.call('stop')
+  }
+}
+
+// the worker mode needs OffscreenCanvas, and SharedArrayBuffer for the input (a cross-origin isolated page)
+export function canRunInWorker (canvas) {
+  return typeof SharedArrayBuffer !== 'undefined' && globalThis.crossOriginIsolated === true &&
+    typeof canvas.transferControlToOffscreen === 'function'
+}
+
+// worker: run pyodide and raylib in a worker if the page allows it, else on the main thread
+// timing: measure the time of each frame in python, wasm and idle (game.timing), wasm calls are a bit slower with it
+// shared: reuse the pyodide of the other games with the same options, instead of loading a new one
+export async function createGame (canvas, { worker = false, timing = false, shared = true, ...options } = {}) {
+  if (worker && canRunInWorker(canvas)) {
+    const input = new InputRing()
+    const offscreen = canvas.transferControlToOffscreen()
+    const game = new RaylibWorkerGame(new Worker(new URL('./python-raylib-worker.js', import.meta.url), { type: 'module' }))
+    await game.call('create', { canvas: offscreen, input: input.buffer, options: { ...options, timing } }, [offscreen])
+    forwardInput(canvas, input)
+    return game
+  }
+  const runtime = await (shared ? getRuntime(options) : loadRuntime(options))
+  const clock = timing ? { wasm: 0 } : null
+  return new RaylibGame(runtime, await createContext(runtime, canvas, clock), clock)
+}
 
-  return pyodide
+// pyodide with the wrapper installed in its globals, for pages that run their user code themselves
+// lazy: import a module of the wrapper when user code first uses one of its names, instead of all at startup
+// bundle: import the wrapper from the precompiled bundle (release build), instead of its sources (debug build, with argument checks)
+// shared: reuse the pyodide of createGame() and earlier calls with the same options, instead of loading a new one.
+// Its globals are the user code's, so only one setup() canvas of a page can share it, the others need their own
+export default async function setup (canvas, { lazy = true, bundle = true, shared = false } = {}) {
+  const runtime = await (shared ? getRuntime({ lazy, bundle }) : loadRuntime({ lazy, bundle }))
+  const context = await createContext(runtime, canvas)
+  context.activate()
+  context.install(runtime.pyodide.globals)
+  return runtime.pyodide
 }
@@ -1,5 +1,5 @@
 import 'https://cdn.jsdelivr.net/pyodide/v0.23.4/full/pyodide.js'
-import setup from './python-raylib-web.js'
+import { createGame } from './python-raylib-web.js'
 
 class RaylibPythonComponent extends HTMLElement {
   constructor () {
@@ -53,20 +53,27 @@ canvas {
     }
   }
 
-  async start (src) {
+  // one start at a time, the game of the canvas is kept so new code only replaces the user code
+  start (src) {
+    this.starting = (this.starting || Promise.resolve()).catch(() => {}).then(() => this.load(src))
+    return this.starting
+  }
+
+  async load (src) {
     let userCode = this.textContent
     if (src) {
       userCode = await fetch(src).then(r => r.text())
     }
+    if (this.game && userCode === this.userCode) {
+      return
+    }
+    this.userCode = userCode
     this.style.display = 'block'
-    const python = await setup(this.canvas)
-    python.runPython(userCode)
-    python.runPython('init()')
-    const update = () => {
-      python.runPython('update()')
-      requestAnimationFrame(update)
+    if (!this.game) {
+      // worker attribute: run the game in a worker when the page allows it (see canRunInWorker)
+      this.game = await createGame(this.canvas, { worker: this.hasAttribute('worker') })
     }
-    update()
+    await this.game.run(userCode)
   }
 
   connectedCallback () {
@@ -74,6 +81,15 @@ canvas {
       this.start(this.src)
     })
     observer.observe(this, { childList: true })
+    if (this.game && this.userCode) {
+      this.game.start()
+    }
+  }
+
+  disconnectedCallback () {
+    if (this.game) {
+      this.game.stop()
+    }
   }
 }
 
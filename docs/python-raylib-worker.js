@@ -0,0 +1,44 @@
+// runs a game for RaylibWorkerGame (python-raylib-web.js): pyodide and the raylib wasm of one canvas in a worker
+import { loadPyodide } from 'https://cdn.jsdelivr.net/pyodide/v0.23.4/full/pyodide.mjs'
+import { getRuntime, createContext, RaylibGame } from './python-raylib-web.js'
+import { InputRing, standInDOM } from './python-raylib-input.js'
+
+globalThis.loadPyodide = loadPyodide
+
+class InputGame extends RaylibGame {
+  constructor (runtime, context, clock, input, dispatchInput) {
+    super(runtime, context, clock)
+    this.input = input
+    this.dispatchInput = dispatchInput
+  }
+
+  update (timestamp) {
+    this.dispatchInput(this.input)
+    super.update(timestamp)
+  }
+}
+
+let game
+
+const commands = {
+  async create ({ canvas, input, options: { timing, ...options } }) {
+    const runtime = await getRuntime(options)
+    const dispatchInput = standInDOM(canvas)
+    const clock = timing ? { wasm: 0 } : null
+    game = new InputGame(runtime, await createContext(runtime, canvas, clock), clock, new InputRing(input), dispatchInput)
+    game.onframe = timing => self.postMessage({ timing })
+  },
+  run: ({ code }) => game.run(code),
+  start: () => game.start(),
+  stop: () => game.stop()
+}
+
+self.onmessage = async ({ data }) => {
+  try {
+    await commands[data.type](data)
+    self.postMessage({ id: data.id })
+  } catch (error) {
+    console.error(error)
+    self.postMessage({ id: data.id, error: String(error) })
+  }
+}
@@ -0,0 +1,746 @@
+"""raylib for pyodide, each module of the wrapper is imported the first time one of its names is used"""
+import builtins
+import importlib
+import sys
+
+
+def __getattr__(name: str):
+    module_name = _names.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # not kept in the package globals, some names (colors) are switched with the active context
+    module = sys.modules.get(f"{__name__}.{module_name}") or importlib.import_module(f".{module_name}", __name__)
+    return getattr(module, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_names))
+
+
+class LazyBuiltins(dict):
+    """builtins of the user code, a name that is not a builtin is looked up in the wrapper the first time it is used"""
+
+    def __missing__(self, name: str):
+        if name in builtins.__dict__:
+            return builtins.__dict__[name]
+        try:
+            value = __getattr__(name)
+        except AttributeError:
+            raise KeyError(name) from None
+        self[name] = value
+        return value
+
+
+def create_context(mod):
+    """Use the wrapper with another raylib wasm instance (of another canvas), the first one comes from __main__._mod"""
+    core_imported = f"{__name__}.core" in sys.modules
+    core = importlib.import_module(".core", __name__)
+    return core.Context(mod) if core_imported else core._active_context
+
+
+def install(namespace: dict):
+    """Make the names of the wrapper usable in namespace (the globals of the user code) without importing them"""
+    importlib.import_module(".core", __name__)._active_context.install(namespace)
+
+
+def load_all():
+    """Import every module of the wrapper now instead of when its names are first used"""
+    for module_name in sorted(set(_names.values())):
+        importlib.import_module(f".{module_name}", __name__)
+
+# name -> module of the wrapper that defines it
+_names = {
+    "struct_clone": "core",
+    "HeapViews": "core",
+    "_heap": "core",
+    "ScratchArena": "core",
+    "_scratch_arena": "core",
+    "StructPool": "core",
+    "_struct_pool": "core",
+    "get_allocation_counters": "core",
+    "reset_allocation_counters": "core",
+    "_new_struct": "core",
+    "_import_numpy": "core",
+    "WasmArray": "core",
+    "StructArray": "core",
+    "PixelArray": "core",
+    "CharArray": "core",
+    "UCharArray": "core",
+    "Int16Array": "core",
+    "UInt16Array": "core",
+    "Int32Array": "core",
+    "UInt32Array": "core",
+    "FloatArray": "core",
+    "DoubleArray": "core",
+    "Vector2": "core",
+    "Vector2Shadow": "core",
+    "Vector3": "core",
+    "Vector3Shadow": "core",
+    "Vector4": "core",
+    "Vector4Shadow": "core",
+    "Quaternion": "core",
+    "Matrix": "core",
+    "Color": "core",
+    "ColorShadow": "core",
+    "Rectangle": "core",
+    "RectangleShadow": "core",
+    "Image": "core",
+    "Texture": "core",
+    "Texture2D": "core",
+    "TextureCubemap": "core",
+    "RenderTexture": "core",
+    "RenderTexture2D": "core",
+    "Font": "core",
+    "Camera3D": "core",
+    "Camera": "core",
+    "Camera2D": "core",
+    "Shader": "core",
+    "Ray": "core",
+    "VrDeviceInfo": "core",
+    "VrStereoConfig": "core",
+    "FilePathList": "core",
+    "check_struct_layouts": "core",
+    "ConfigFlags": "core",
+    "TraceLogLevel": "core",
+    "KeyboardKey": "core",
+    "MouseButton": "core",
+    "MouseCursor": "core",
+    "GamepadButton": "core",
+    "GamepadAxis": "core",
+    "MaterialMapIndex": "core",
+    "ShaderLocationIndex": "core",
+    "ShaderUniformDataType": "core",
+    "ShaderAttributeDataType": "core",
+    "PixelFormat": "core",
+    "TextureFilter": "core",
+    "TextureWrap": "core",
+    "CubemapLayout": "core",
+    "FontType": "core",
+    "BlendMode": "core",
+    "Gesture": "core",
+    "CameraMode": "core",
+    "CameraProjection": "core",
+    "NPatchLayout": "core",
+    "RAYLIB_VERSION_MAJOR": "core",
+    "RAYLIB_VERSION_MINOR": "core",
+    "RAYLIB_VERSION_PATCH": "core",
+    "RAYLIB_VERSION": "core",
+    "PI": "core",
+    "DEG2RAD": "core",
+    "RAD2DEG": "core",
+    "_colors": "core",
+    "LIGHTGRAY": "core",
+    "GRAY": "core",
+    "DARKGRAY": "core",
+    "YELLOW": "core",
+    "GOLD": "core",
+    "ORANGE": "core",
+    "PINK": "core",
+    "RED": "core",
+    "MAROON": "core",
+    "GREEN": "core",
+    "LIME": "core",
+    "DARKGREEN": "core",
+    "SKYBLUE": "core",
+    "BLUE": "core",
+    "DARKBLUE": "core",
+    "PURPLE": "core",
+    "VIOLET": "core",
+    "DARKPURPLE": "core",
+    "BEIGE": "core",
+    "BROWN": "core",
+    "DARKBROWN": "core",
+    "WHITE": "core",
+    "BLACK": "core",
+    "BLANK": "core",
+    "MAGENTA": "core",
+    "RAYWHITE": "core",
+    "CommandBuffer": "core",
+    "_command_buffer": "core",
+    "enable_command_buffer": "core",
+    "disable_command_buffer": "core",
+    "is_command_buffer_enabled": "core",
+    "flush_command_buffer": "core",
+    "_record_end_drawing": "core",
+    "TextLayout": "core",
+    "_text_layout_glyph": "core",
+    "_text_layout_rectangles": "core",
+    "_FontGlyphs": "core",
+    "TextLayoutCache": "core",
+    "_text_layouts": "core",
+    "layout_text": "core",
+    "draw_text_layout": "core",
+    "invalidate_text_layouts": "core",
+    "set_text_layouts_capacity": "core",
+    "get_text_layout_counters": "core",
+    "_argument_error": "core",
+    "_check_int": "core",
+    "_check_float": "core",
+    "_check_str": "core",
+    "_check_struct": "core",
+    "Context": "core",
+    "_cached_layers": "core",
+    "_active_context": "core",
+    "_missing_wasm_function": "core",
+    "_warned_missing_wasm_functions": "core",
+    "_is_wasm_function_exported": "core",
+    "_bind_wasm_functions": "core",
+    "_ProfiledCall": "core",
+    "_ProfiledModule": "core",
+    "_ProfiledView": "core",
+    "_ProfiledHeap": "core",
+    "_ProfiledAllocator": "core",
+    "Profiler": "core",
+    "enable_profiling": "core",
+    "disable_profiling": "core",
+    "is_profiling_enabled": "core",
+    "get_profile": "core",
+    "export_profile": "core",
+    "draw_profiler": "core",
+    "init_window": "core",
+    "window_should_close": "core",
+    "close_window": "core",
+    "is_window_ready": "core",
+    "is_window_fullscreen": "core",
+    "is_window_hidden": "core",
+    "is_window_minimized": "core",
+    "is_window_maximized": "core",
+    "is_window_focused": "core",
+    "is_window_resized": "core",
+    "is_window_state": "core",
+    "set_window_state": "core",
+    "clear_window_state": "core",
+    "toggle_fullscreen": "core",
+    "maximize_window": "core",
+    "minimize_window": "core",
+    "restore_window": "core",
+    "set_window_icon": "core",
+    "set_window_icons": "core",
+    "set_window_title": "core",
+    "set_window_position": "core",
+    "set_window_monitor": "core",
+    "set_window_min_size": "core",
+    "set_window_size": "core",
+    "set_window_opacity": "core",
+    "set_window_focused": "core",
+    "get_window_handle": "core",
+    "get_screen_width": "core",
+    "get_screen_height": "core",
+    "get_render_width": "core",
+    "get_render_height": "core",
+    "get_monitor_count": "core",
+    "get_current_monitor": "core",
+    "get_monitor_position": "core",
+    "get_monitor_width": "core",
+    "get_monitor_height": "core",
+    "get_monitor_physical_width": "core",
+    "get_monitor_physical_height": "core",
+    "get_monitor_refresh_rate": "core",
+    "get_window_position": "core",
+    "get_window_scale_dpi": "core",
+    "get_monitor_name": "core",
+    "set_clipboard_text": "core",
+    "get_clipboard_text": "core",
+    "enable_event_waiting": "core",
+    "disable_event_waiting": "core",
+    "swap_screen_buffer": "core",
+    "poll_input_events": "core",
+    "wait_time": "core",
+    "show_cursor": "core",
+    "hide_cursor": "core",
+    "is_cursor_hidden": "core",
+    "enable_cursor": "core",
+    "disable_cursor": "core",
+    "is_cursor_on_screen": "core",
+    "clear_background": "core",
+    "begin_drawing": "core",
+    "end_drawing": "core",
+    "begin_mode_2d": "core",
+    "end_mode_2d": "core",
+    "begin_mode_3d": "core",
+    "end_mode_3d": "core",
+    "begin_texture_mode": "core",
+    "end_texture_mode": "core",
+    "begin_shader_mode": "core",
+    "end_shader_mode": "core",
+    "begin_blend_mode": "core",
+    "end_blend_mode": "core",
+    "begin_scissor_mode": "core",
+    "end_scissor_mode": "core",
+    "begin_vr_stereo_mode": "core",
+    "end_vr_stereo_mode": "core",
+    "load_vr_stereo_config": "core",
+    "unload_vr_stereo_config": "core",
+    "load_shader": "core",
+    "load_shader_from_memory": "core",
+    "is_shader_ready": "core",
+    "get_shader_location": "core",
+    "get_shader_location_attrib": "core",
+    "set_shader_value": "core",
+    "set_shader_value_v": "core",
+    "set_shader_value_matrix": "core",
+    "set_shader_value_texture": "core",
+    "unload_shader": "core",
+    "get_mouse_ray": "core",
+    "get_camera_matrix": "core",
+    "get_camera_matrix_2d": "core",
+    "get_world_to_screen": "core",
+    "get_screen_to_world_2d": "core",
+    "get_world_to_screen_ex": "core",
+    "get_world_to_screen_2d": "core",
+    "set_target_fps": "core",
+    "get_fps": "core",
+    "get_frame_time": "core",
+    "get_time": "core",
+    "get_random_value": "core",
+    "set_random_seed": "core",
+    "take_screenshot": "core",
+    "set_config_flags": "core",
+    "set_trace_log_level": "core",
+    "mem_alloc": "core",
+    "mem_realloc": "core",
+    "mem_free": "core",
+    "open_url": "core",
+    "load_file_data": "core",
+    "unload_file_data": "core",
+    "save_file_data": "core",
+    "export_data_as_code": "core",
+    "load_file_text": "core",
+    "unload_file_text": "core",
+    "save_file_text": "core",
+    "file_exists": "core",
+    "directory_exists": "core",
+    "is_file_extension": "core",
+    "get_file_length": "core",
+    "get_file_extension": "core",
+    "get_file_name": "core",
+    "get_file_name_without_ext": "core",
+    "get_directory_path": "core",
+    "get_prev_directory_path": "core",
+    "get_working_directory": "core",
+    "get_application_directory": "core",
+    "change_directory": "core",
+    "is_path_file": "core",
+    "load_directory_files": "core",
+    "load_directory_files_ex": "core",
+    "unload_directory_files": "core",
+    "is_file_dropped": "core",
+    "load_dropped_files": "core",
+    "unload_dropped_files": "core",
+    "get_file_mod_time": "core",
+    "compress_data": "core",
+    "decompress_data": "core",
+    "encode_data_base64": "core",
+    "decode_data_base64": "core",
+    "is_key_pressed": "core",
+    "is_key_down": "core",
+    "is_key_released": "core",
+    "is_key_up": "core",
+    "set_exit_key": "core",
+    "get_key_pressed": "core",
+    "get_char_pressed": "core",
+    "is_gamepad_available": "core",
+    "get_gamepad_name": "core",
+    "is_gamepad_button_pressed": "core",
+    "is_gamepad_button_down": "core",
+    "is_gamepad_button_released": "core",
+    "is_gamepad_button_up": "core",
+    "get_gamepad_button_pressed": "core",
+    "get_gamepad_axis_count": "core",
+    "get_gamepad_axis_movement": "core",
+    "set_gamepad_mappings": "core",
+    "is_mouse_button_pressed": "core",
+    "is_mouse_button_down": "core",
+    "is_mouse_button_released": "core",
+    "is_mouse_button_up": "core",
+    "get_mouse_x": "core",
+    "get_mouse_y": "core",
+    "get_mouse_position": "core",
+    "get_mouse_delta": "core",
+    "set_mouse_position": "core",
+    "set_mouse_offset": "core",
+    "set_mouse_scale": "core",
+    "get_mouse_wheel_move": "core",
+    "get_mouse_wheel_move_v": "core",
+    "set_mouse_cursor": "core",
+    "get_touch_x": "core",
+    "get_touch_y": "core",
+    "get_touch_position": "core",
+    "get_touch_point_id": "core",
+    "get_touch_point_count": "core",
+    "set_gestures_enabled": "core",
+    "is_gesture_detected": "core",
+    "get_gesture_detected": "core",
+    "get_gesture_hold_duration": "core",
+    "get_gesture_drag_vector": "core",
+    "get_gesture_drag_angle": "core",
+    "get_gesture_pinch_vector": "core",
+    "get_gesture_pinch_angle": "core",
+    "update_camera": "core",
+    "update_camera_pro": "core",
+    "_wasm_functions_names": "core",
+    "_context_modules_names": "core",
+    "set_shapes_texture": "shapes",
+    "draw_pixel": "shapes",
+    "draw_pixel_v": "shapes",
+    "draw_line": "shapes",
+    "draw_line_v": "shapes",
+    "draw_line_ex": "shapes",
+    "draw_line_bezier": "shapes",
+    "draw_line_bezier_quad": "shapes",
+    "draw_line_bezier_cubic": "shapes",
+    "draw_line_strip": "shapes",
+    "draw_circle": "shapes",
+    "draw_circle_sector": "shapes",
+    "draw_circle_sector_lines": "shapes",
+    "draw_circle_gradient": "shapes",
+    "draw_circle_v": "shapes",
+    "draw_circle_lines": "shapes",
+    "draw_ellipse": "shapes",
+    "draw_ellipse_lines": "shapes",
+    "draw_ring": "shapes",
+    "draw_ring_lines": "shapes",
+    "draw_rectangle": "shapes",
+    "draw_rectangle_v": "shapes",
+    "draw_rectangle_rec": "shapes",
+    "draw_rectangle_pro": "shapes",
+    "draw_rectangle_gradient_v": "shapes",
+    "draw_rectangle_gradient_h": "shapes",
+    "draw_rectangle_gradient_ex": "shapes",
+    "draw_rectangle_lines": "shapes",
+    "draw_rectangle_lines_ex": "shapes",
+    "draw_rectangle_rounded": "shapes",
+    "draw_rectangle_rounded_lines": "shapes",
+    "draw_triangle": "shapes",
+    "draw_triangle_lines": "shapes",
+    "draw_triangle_fan": "shapes",
+    "draw_triangle_strip": "shapes",
+    "draw_poly": "shapes",
+    "draw_poly_lines": "shapes",
+    "draw_poly_lines_ex": "shapes",
+    "check_collision_recs": "shapes",
+    "check_collision_circles": "shapes",
+    "check_collision_circle_rec": "shapes",
+    "check_collision_point_rec": "shapes",
+    "check_collision_point_circle": "shapes",
+    "check_collision_point_triangle": "shapes",
+    "check_collision_point_poly": "shapes",
+    "check_collision_lines": "shapes",
+    "check_collision_point_line": "shapes",
+    "get_collision_rec": "shapes",
+    "NPatchInfo": "textures",
+    "load_image": "textures",
+    "load_image_raw": "textures",
+    "load_image_anim": "textures",
+    "load_image_from_memory": "textures",
+    "load_image_from_texture": "textures",
+    "load_image_from_screen": "textures",
+    "is_image_ready": "textures",
+    "unload_image": "textures",
+    "export_image": "textures",
+    "export_image_to_memory": "textures",
+    "export_image_as_code": "textures",
+    "gen_image_color": "textures",
+    "gen_image_gradient_linear": "textures",
+    "gen_image_gradient_radial": "textures",
+    "gen_image_gradient_square": "textures",
+    "gen_image_checked": "textures",
+    "gen_image_white_noise": "textures",
+    "gen_image_perlin_noise": "textures",
+    "gen_image_cellular": "textures",
+    "gen_image_text": "textures",
+    "image_copy": "textures",
+    "image_from_image": "textures",
+    "image_text": "textures",
+    "image_text_ex": "textures",
+    "image_format": "textures",
+    "image_to_pot": "textures",
+    "image_crop": "textures",
+    "image_alpha_crop": "textures",
+    "image_alpha_clear": "textures",
+    "image_alpha_mask": "textures",
+    "image_alpha_premultiply": "textures",
+    "image_blur_gaussian": "textures",
+    "image_resize": "textures",
+    "image_resize_nn": "textures",
+    "image_resize_canvas": "textures",
+    "image_mipmaps": "textures",
+    "image_dither": "textures",
+    "image_flip_vertical": "textures",
+    "image_flip_horizontal": "textures",
+    "image_rotate": "textures",
+    "image_rotate_cw": "textures",
+    "image_rotate_ccw": "textures",
+    "image_color_tint": "textures",
+    "image_color_invert": "textures",
+    "image_color_grayscale": "textures",
+    "image_color_contrast": "textures",
+    "image_color_brightness": "textures",
+    "image_color_replace": "textures",
+    "load_image_colors": "textures",
+    "load_image_palette": "textures",
+    "unload_image_colors": "textures",
+    "unload_image_palette": "textures",
+    "get_image_alpha_border": "textures",
+    "get_image_color": "textures",
+    "image_clear_background": "textures",
+    "image_draw_pixel": "textures",
+    "image_draw_pixel_v": "textures",
+    "image_draw_line": "textures",
+    "image_draw_line_v": "textures",
+    "image_draw_circle": "textures",
+    "image_draw_circle_v": "textures",
+    "image_draw_circle_lines": "textures",
+    "image_draw_circle_lines_v": "textures",
+    "image_draw_rectangle": "textures",
+    "image_draw_rectangle_v": "textures",
+    "image_draw_rectangle_rec": "textures",
+    "image_draw_rectangle_lines": "textures",
+    "image_draw": "textures",
+    "image_draw_text": "textures",
+    "image_draw_text_ex": "textures",
+    "load_texture": "textures",
+    "load_texture_from_image": "textures",
+    "load_texture_cubemap": "textures",
+    "load_render_texture": "textures",
+    "is_texture_ready": "textures",
+    "unload_texture": "textures",
+    "is_render_texture_ready": "textures",
+    "unload_render_texture": "textures",
+    "update_texture": "textures",
+    "update_texture_rec": "textures",
+    "gen_texture_mipmaps": "textures",
+    "set_texture_filter": "textures",
+    "set_texture_wrap": "textures",
+    "draw_texture": "textures",
+    "draw_texture_v": "textures",
+    "draw_texture_ex": "textures",
+    "draw_texture_rec": "textures",
+    "draw_texture_pro": "textures",
+    "draw_texture_n_patch": "textures",
+    "fade": "textures",
+    "color_to_int": "textures",
+    "color_normalize": "textures",
+    "color_from_normalized": "textures",
+    "color_to_hsv": "textures",
+    "color_from_hsv": "textures",
+    "color_tint": "textures",
+    "color_brightness": "textures",
+    "color_contrast": "textures",
+    "color_alpha": "textures",
+    "color_alpha_blend": "textures",
+    "get_color": "textures",
+    "get_pixel_color": "textures",
+    "set_pixel_color": "textures",
+    "get_pixel_data_size": "textures",
+    "_sprite_fields": "textures",
+    "SpriteBatch": "textures",
+    "update_texture_from_array": "textures",
+    "_SkylinePacker": "textures",
+    "AtlasRegion": "textures",
+    "TextureAtlas": "textures",
+    "CachedLayer": "textures",
+    "cached_layer": "textures",
+    "unload_cached_layers": "textures",
+    "GlyphInfo": "text",
+    "get_font_default": "text",
+    "load_font": "text",
+    "load_font_ex": "text",
+    "load_font_from_image": "text",
+    "load_font_from_memory": "text",
+    "is_font_ready": "text",
+    "load_font_data": "text",
+    "gen_image_font_atlas": "text",
+    "unload_font_data": "text",
+    "unload_font": "text",
+    "export_font_as_code": "text",
+    "draw_fps": "text",
+    "draw_text": "text",
+    "draw_text_ex": "text",
+    "draw_text_pro": "text",
+    "draw_text_codepoint": "text",
+    "draw_text_codepoints": "text",
+    "set_text_line_spacing": "text",
+    "measure_text": "text",
+    "measure_text_ex": "text",
+    "get_glyph_index": "text",
+    "get_glyph_info": "text",
+    "get_glyph_atlas_rec": "text",
+    "load_utf8": "text",
+    "unload_utf8": "text",
+    "load_codepoints": "text",
+    "unload_codepoints": "text",
+    "get_codepoint_count": "text",
+    "get_codepoint": "text",
+    "get_codepoint_next": "text",
+    "get_codepoint_previous": "text",
+    "codepoint_to_utf8": "text",
+    "text_copy": "text",
+    "text_is_equal": "text",
+    "text_length": "text",
+    "text_subtext": "text",
+    "text_replace": "text",
+    "text_insert": "text",
+    "text_join": "text",
+    "text_split": "text",
+    "text_append": "text",
+    "text_find_index": "text",
+    "text_to_upper": "text",
+    "text_to_lower": "text",
+    "text_to_pascal": "text",
+    "text_to_integer": "text",
+    "Mesh": "models",
+    "MaterialMap": "models",
+    "Material": "models",
+    "Transform": "models",
+    "BoneInfo": "models",
+    "Model": "models",
+    "ModelAnimation": "models",
+    "RayCollision": "models",
+    "BoundingBox": "models",
+    "draw_line_3d": "models",
+    "draw_point_3d": "models",
+    "draw_circle_3d": "models",
+    "draw_triangle_3d": "models",
+    "draw_triangle_strip_3d": "models",
+    "draw_cube": "models",
+    "draw_cube_v": "models",
+    "draw_cube_wires": "models",
+    "draw_cube_wires_v": "models",
+    "draw_sphere": "models",
+    "draw_sphere_ex": "models",
+    "draw_sphere_wires": "models",
+    "draw_cylinder": "models",
+    "draw_cylinder_ex": "models",
+    "draw_cylinder_wires": "models",
+    "draw_cylinder_wires_ex": "models",
+    "draw_capsule": "models",
+    "draw_capsule_wires": "models",
+    "draw_plane": "models",
+    "draw_ray": "models",
+    "draw_grid": "models",
+    "load_model": "models",
+    "load_model_from_mesh": "models",
+    "is_model_ready": "models",
+    "unload_model": "models",
+    "get_model_bounding_box": "models",
+    "draw_model": "models",
+    "draw_model_ex": "models",
+    "draw_model_wires": "models",
+    "draw_model_wires_ex": "models",
+    "draw_bounding_box": "models",
+    "draw_billboard": "models",
+    "draw_billboard_rec": "models",
+    "draw_billboard_pro": "models",
+    "upload_mesh": "models",
+    "update_mesh_buffer": "models",
+    "unload_mesh": "models",
+    "draw_mesh": "models",
+    "draw_mesh_instanced": "models",
+    "export_mesh": "models",
+    "get_mesh_bounding_box": "models",
+    "gen_mesh_tangents": "models",
+    "gen_mesh_poly": "models",
+    "gen_mesh_plane": "models",
+    "gen_mesh_cube": "models",
+    "gen_mesh_sphere": "models",
+    "gen_mesh_hemi_sphere": "models",
+    "gen_mesh_cylinder": "models",
+    "gen_mesh_cone": "models",
+    "gen_mesh_torus": "models",
+    "gen_mesh_knot": "models",
+    "gen_mesh_heightmap": "models",
+    "gen_mesh_cubicmap": "models",
+    "load_materials": "models",
+    "load_material_default": "models",
+    "is_material_ready": "models",
+    "unload_material": "models",
+    "set_material_texture": "models",
+    "set_model_mesh_material": "models",
+    "load_model_animations": "models",
+    "update_model_animation": "models",
+    "unload_model_animation": "models",
+    "unload_model_animations": "models",
+    "is_model_animation_valid": "models",
+    "check_collision_spheres": "models",
+    "check_collision_boxes": "models",
+    "check_collision_box_sphere": "models",
+    "get_ray_collision_sphere": "models",
+    "get_ray_collision_box": "models",
+    "get_ray_collision_mesh": "models",
+    "get_ray_collision_triangle": "models",
+    "get_ray_collision_quad": "models",
+    "Wave": "audio",
+    "AudioStream": "audio",
+    "Sound": "audio",
+    "Music": "audio",
+    "init_audio_device": "audio",
+    "close_audio_device": "audio",
+    "is_audio_device_ready": "audio",
+    "set_master_volume": "audio",
+    "load_wave": "audio",
+    "load_wave_from_memory": "audio",
+    "is_wave_ready": "audio",
+    "load_sound": "audio",
+    "load_sound_from_wave": "audio",
+    "is_sound_ready": "audio",
+    "update_sound": "audio",
+    "unload_wave": "audio",
+    "unload_sound": "audio",
+    "export_wave": "audio",
+    "export_wave_as_code": "audio",
+    "play_sound": "audio",
+    "stop_sound": "audio",
+    "pause_sound": "audio",
+    "resume_sound": "audio",
+    "is_sound_playing": "audio",
+    "set_sound_volume": "audio",
+    "set_sound_pitch": "audio",
+    "set_sound_pan": "audio",
+    "wave_copy": "audio",
+    "wave_crop": "audio",
+    "wave_format": "audio",
+    "load_wave_samples": "audio",
+    "unload_wave_samples": "audio",
+    "load_music_stream": "audio",
+    "load_music_stream_from_memory": "audio",
+    "is_music_ready": "audio",
+    "unload_music_stream": "audio",
+    "play_music_stream": "audio",
+    "is_music_stream_playing": "audio",
+    "update_music_stream": "audio",
+    "stop_music_stream": "audio",
+    "pause_music_stream": "audio",
+    "resume_music_stream": "audio",
+    "seek_music_stream": "audio",
+    "set_music_volume": "audio",
+    "set_music_pitch": "audio",
+    "set_music_pan": "audio",
+    "get_music_time_length": "audio",
+    "get_music_time_played": "audio",
+    "load_audio_stream": "audio",
+    "is_audio_stream_ready": "audio",
+    "unload_audio_stream": "audio",
+    "update_audio_stream": "audio",
+    "is_audio_stream_processed": "audio",
+    "play_audio_stream": "audio",
+    "pause_audio_stream": "audio",
+    "resume_audio_stream": "audio",
+    "is_audio_stream_playing": "audio",
+    "stop_audio_stream": "audio",
+    "set_audio_stream_volume": "audio",
+    "set_audio_stream_pitch": "audio",
+    "set_audio_stream_pan": "audio",
+    "set_audio_stream_buffer_size_default": "audio",
+    "Asset": "assets",
+    "_file_type": "assets",
+    "_decode_image": "assets",
+    "_decode_texture": "assets",
+    "_decode_wave": "assets",
+    "_decode_sound": "assets",
+    "_decode_font": "assets",
+    "_decode_model": "assets",
+    "_decode_music": "assets",
+    "_decode_file": "assets",
+    "AssetLoader": "assets",
+}
@@ -0,0 +1,231 @@
+# Generated by tools/code_generation/filesGeneration.py, do not edit by hand
+# the asset loader, python-raylib-web.js fetches and python decodes
+from .core import (
+    _mod,
+    Image,
+    Texture2D,
+    Font,
+)
+from .textures import (
+    load_image_from_memory,
+    is_image_ready,
+    unload_image,
+    load_texture_from_image,
+)
+from .text import (
+    load_font,
+    is_font_ready,
+)
+from .models import (
+    Model,
+    load_model,
+    is_model_ready,
+)
+from .audio import (
+    Wave,
+    Sound,
+    Music,
+    load_wave_from_memory,
+    is_wave_ready,
+    load_sound_from_wave,
+    unload_wave,
+    load_music_stream,
+    is_music_ready,
+)
+
+
+import time
+import urllib.parse
+
+
+class Asset:
+    """An asset of an AssetLoader, value is None until it is fetched and decoded, or error if it failed"""
+    __slots__ = ("url", "value", "error", "_id", "_decode")
+
+    def __init__(self, url: str, decode):
+        self.url = url
+        self.value = None
+        self.error = None
+        self._id = 0  # of the asset in the AssetLoader of python-raylib-web.js, while it is not decoded
+        self._decode = decode
+
+    @property
+    def ready(self) -> bool:
+        return self.value is not None
+
+    def __repr__(self):
+        return f"Asset({self.url!r}, {'ready' if self.ready else self.error or 'loading'})"
+
+
+def _file_type(url: str) -> str:
+    path = urllib.parse.urlsplit(url).path
+    return path[path.rfind('.'):].lower() if '.' in path else ""
+
+
+def _decode_image(loader, asset_id: int, url: str, path: str):
+    image = load_image_from_memory(_file_type(url), loader._js.address(asset_id), loader._js.size(asset_id))
+    if not is_image_ready(image):
+        raise ValueError("not an image raylib can decode")
+    return image
+
+
+def _decode_texture(loader, asset_id: int, url: str, path: str):
+    image = _decode_image(loader, asset_id, url, path)
+    texture = load_texture_from_image(image)
+    unload_image(image)
+    return texture
+
+
+def _decode_wave(loader, asset_id: int, url: str, path: str):
+    wave = load_wave_from_memory(_file_type(url), loader._js.address(asset_id), loader._js.size(asset_id))
+    if not is_wave_ready(wave):
+        raise ValueError("not a sound raylib can decode")
+    return wave
+
+
+def _decode_sound(loader, asset_id: int, url: str, path: str):
+    wave = _decode_wave(loader, asset_id, url, path)
+    sound = load_sound_from_wave(wave)
+    unload_wave(wave)
+    return sound
+
+
+def _decode_font(loader, asset_id: int, url: str, path: str):
+    font = load_font(path)
+    if not is_font_ready(font):
+        raise ValueError("not a font raylib can load")
+    return font
+
+
+def _decode_model(loader, asset_id: int, url: str, path: str):
+    model = load_model(path)
+    if not is_model_ready(model):
+        raise ValueError("not a model raylib can load")
+    return model
+
+
+def _decode_music(loader, asset_id: int, url: str, path: str):
+    music = load_music_stream(path)  # streamed from the file while it plays, the file stays in the FS
+    if not is_music_ready(music):
+        raise ValueError("not a music stream raylib can load")
+    return music
+
+
+def _decode_file(loader, asset_id: int, url: str, path: str):
+    return path
+
+
+class AssetLoader:
+    """Load assets without blocking the frames: python-raylib-web.js fetches them a few at a time in the
+    background, and poll() (called from update()) decodes the ones that arrived, within decode_budget seconds
+
+    manifest is the url of a json (see tools/assets_manifest.py) with the SHA-256 of the assets, the ones it lists are
+    kept in the browser by their content and load without the network the next time"""
+
+    def __init__(self, manifest: str = None, decode_budget: float = 0.004):
+        self._js = _mod.assets
+        if manifest is not None:
+            self._js.useManifest(manifest)
+        self.decode_budget = decode_budget
+        self._assets = {}  # (url, decode) -> Asset, the same asset asked twice is loaded once
+        self._loading = []  # assets python-raylib-web.js is fetching
+        self._fetched = []  # fetched, waiting for poll() to decode them
+        self._finished = 0  # self._js.finished when _loading was last checked
+        self._paths = {}  # asset id -> file the asset was written to in the FS, for the decoders that read files
+
+    def _load(self, url: str, decode, path: str = None) -> Asset:
+        asset = self._assets.get((url, decode))
+        if asset is not None:
+            return asset
+        asset = self._assets[(url, decode)] = Asset(url, decode)
+        asset._id = self._js.load(url, path)
+        self._paths[asset._id] = path
+        self._loading.append(asset)
+        return asset
+
+    @staticmethod
+    def _file_path(url: str) -> str:
+        return "/assets/" + urllib.parse.unquote(urllib.parse.urlsplit(url).path).lstrip('/')
+
+    def image(self, url: str) -> Asset:
+        """An Image, decoded with load_image_from_memory()"""
+        return self._load(url, _decode_image)
+
+    def texture(self, url: str) -> Asset:
+        """A Texture2D, decoded with load_image_from_memory()"""
+        return self._load(url, _decode_texture)
+
+    def wave(self, url: str) -> Asset:
+        """A Wave, decoded with load_wave_from_memory()"""
+        return self._load(url, _decode_wave)
+
+    def sound(self, url: str) -> Asset:
+        """A Sound, decoded with load_wave_from_memory()"""
+        return self._load(url, _decode_sound)
+
+    def font(self, url: str, path: str = None) -> Asset:
+        """A Font, written to path in the FS (/assets/ and the path of the url by default) and loaded from it"""
+        return self._load(url, _decode_font, path or self._file_path(url))
+
+    def model(self, url: str, path: str = None) -> Asset:
+        """A Model, written to path in the FS and loaded from it, the files it refers to (.mtl, textures) must be
+        loaded with file() first, into the same folder"""
+        return self._load(url, _decode_model, path or self._file_path(url))
+
+    def music(self, url: str, path: str = None) -> Asset:
+        """A Music stream, written to path in the FS and played from it"""
+        return self._load(url, _decode_music, path or self._file_path(url))
+
+    def file(self, url: str, path: str = None) -> Asset:
+        """Only write the url to path in the FS, value is the path"""
+        return self._load(url, _decode_file, path or self._file_path(url))
+
+    def poll(self):
+        """Decode the assets that arrived since the last poll(), call it once per frame"""
+        finished = self._js.finished
+        if finished != self._finished:
+            self._finished = finished
+            loading = []
+            for asset in self._loading:
+                status = self._js.status(asset._id)
+                if status == 0:
+                    loading.append(asset)
+                elif status > 0:
+                    self._fetched.append(asset)
+                else:
+                    asset.error = self._js.error(asset._id)
+                    self._forget(asset)
+            self._loading = loading
+
+        # at least one per frame, however long it takes
+        started = time.perf_counter()
+        decoded = 0
+        for asset in self._fetched:
+            if decoded > 0 and time.perf_counter() - started > self.decode_budget:
+                break
+            try:
+                asset.value = asset._decode(self, asset._id, asset.url, self._paths[asset._id])
+            except ValueError as error:
+                asset.error = f"{asset.url}: {error}"
+            except Exception as error:  # a failing decoder fails its asset, not every poll() after it
+                asset.error = f"{asset.url}: {type(error).__name__}: {error}"
+            self._forget(asset)
+            decoded += 1
+        del self._fetched[:decoded]
+
+    def _forget(self, asset: Asset):
+        self._js.release(asset._id)
+        del self._paths[asset._id]
+        asset._id = 0
+
+    @property
+    def progress(self) -> float:
+        """Part of the assets asked for that are done, loaded or failed, from 0.0 to 1.0"""
+        if not self._assets:
+            return 1.0
+        return 1.0 - (len(self._loading) + len(self._fetched)) / len(self._assets)
+
+    @property
+    def done(self) -> bool:
+        """True when every asset asked for is loaded or failed"""
+        return not self._loading and not self._fetched
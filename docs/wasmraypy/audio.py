@@ -0,0 +1,890 @@
+# Generated by tools/code_generation/filesGeneration.py, do not edit by hand
+# raylib.h, the functions of raudio
+from .core import (
+    struct_clone,
+    _heap,
+    _scratch_arena,
+    _struct_pool,
+    _new_struct,
+    check_struct_layouts,
+    _check_int,
+    _check_float,
+    _check_str,
+    _check_struct,
+    _bind_wasm_functions,
+)
+
+
+class Wave:
+    """Wave, audio wave data"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 20
+    _dtype_spec: dict = {"names": ["frameCount", "sampleRate", "sampleSize", "channels", "data"], "formats": ["<u4", "<u4", "<u4", "<u4", "<u4"], "offsets": [0, 4, 8, 12, 16], "itemsize": 20}
+
+    def __init__(self, frameCount: int = 0, sampleRate: int = 0, sampleSize: int = 0, channels: int = 0, data: int = 0, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(20)
+            self._to_free = _struct_pool
+            _heap.u32[self._address >> 2] = frameCount
+            _heap.u32[(self._address + 4) >> 2] = sampleRate
+            _heap.u32[(self._address + 8) >> 2] = sampleSize
+            _heap.u32[(self._address + 12) >> 2] = channels
+            _heap.u32[(self._address + 16) >> 2] = data
+
+    @property
+    def frameCount(self):
+        """Total number of frames (considering channels)"""
+        return _heap.u32[self._address >> 2]
+
+    @frameCount.setter
+    def frameCount(self, value):
+        if not self._frozen:
+            _heap.u32[self._address >> 2] = value
+
+    @property
+    def sampleRate(self):
+        """Frequency (samples per second)"""
+        return _heap.u32[(self._address + 4) >> 2]
+
+    @sampleRate.setter
+    def sampleRate(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 4) >> 2] = value
+
+    @property
+    def sampleSize(self):
+        """Bit depth (bits per sample): 8, 16, 32 (24 not supported)"""
+        return _heap.u32[(self._address + 8) >> 2]
+
+    @sampleSize.setter
+    def sampleSize(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 8) >> 2] = value
+
+    @property
+    def channels(self):
+        """Number of channels (1-mono, 2-stereo, ...)"""
+        return _heap.u32[(self._address + 12) >> 2]
+
+    @channels.setter
+    def channels(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 12) >> 2] = value
+
+    @property
+    def data(self):
+        """Buffer data pointer"""
+        return _heap.u32[(self._address + 16) >> 2]
+
+    @data.setter
+    def data(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 16) >> 2] = value
+
+    def __str__(self):
+        return f"Wave(address={self._address}, {self.frameCount}, {self.sampleRate}, {self.sampleSize}, {self.channels}, {self.data})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 20)
+
+class AudioStream:
+    """AudioStream, custom audio stream"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 20
+    _dtype_spec: dict = {"names": ["buffer", "processor", "sampleRate", "sampleSize", "channels"], "formats": ["<u4", "<u4", "<u4", "<u4", "<u4"], "offsets": [0, 4, 8, 12, 16], "itemsize": 20}
+
+    def __init__(self, buffer: int = 0, processor: int = 0, sampleRate: int = 0, sampleSize: int = 0, channels: int = 0, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(20)
+            self._to_free = _struct_pool
+            _heap.u32[self._address >> 2] = buffer
+            _heap.u32[(self._address + 4) >> 2] = processor
+            _heap.u32[(self._address + 8) >> 2] = sampleRate
+            _heap.u32[(self._address + 12) >> 2] = sampleSize
+            _heap.u32[(self._address + 16) >> 2] = channels
+
+    @property
+    def buffer(self):
+        """Pointer to internal data used by the audio system"""
+        return _heap.u32[self._address >> 2]
+
+    @buffer.setter
+    def buffer(self, value):
+        if not self._frozen:
+            _heap.u32[self._address >> 2] = value
+
+    @property
+    def processor(self):
+        """Pointer to internal data processor, useful for audio effects"""
+        return _heap.u32[(self._address + 4) >> 2]
+
+    @processor.setter
+    def processor(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 4) >> 2] = value
+
+    @property
+    def sampleRate(self):
+        """Frequency (samples per second)"""
+        return _heap.u32[(self._address + 8) >> 2]
+
+    @sampleRate.setter
+    def sampleRate(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 8) >> 2] = value
+
+    @property
+    def sampleSize(self):
+        """Bit depth (bits per sample): 8, 16, 32 (24 not supported)"""
+        return _heap.u32[(self._address + 12) >> 2]
+
+    @sampleSize.setter
+    def sampleSize(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 12) >> 2] = value
+
+    @property
+    def channels(self):
+        """Number of channels (1-mono, 2-stereo, ...)"""
+        return _heap.u32[(self._address + 16) >> 2]
+
+    @channels.setter
+    def channels(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 16) >> 2] = value
+
+    def __str__(self):
+        return f"AudioStream(address={self._address}, {self.buffer}, {self.processor}, {self.sampleRate}, {self.sampleSize}, {self.channels})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 20)
+
+class Sound:
+    """Sound"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 24
+    _dtype_spec: dict = {"names": ["stream", "frameCount"], "formats": [AudioStream._dtype_spec, "<u4"], "offsets": [0, 20], "itemsize": 24}
+
+    def __init__(self, stream: AudioStream = None, frameCount: int = 0, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(24)
+            self._to_free = _struct_pool
+            if stream is not None:
+                struct_clone(stream, self._address + 0)
+            else:
+                _heap.u8.fill(0, self._address + 0, self._address + 20)
+            _heap.u32[(self._address + 20) >> 2] = frameCount
+
+    @property
+    def stream(self):
+        """Audio stream"""
+        return AudioStream(0, address=self._address + 0)
+
+    @stream.setter
+    def stream(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 0)
+
+    @property
+    def frameCount(self):
+        """Total number of frames (considering channels)"""
+        return _heap.u32[(self._address + 20) >> 2]
+
+    @frameCount.setter
+    def frameCount(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 20) >> 2] = value
+
+    def __str__(self):
+        return f"Sound(address={self._address}, {self.stream}, {self.frameCount})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 24)
+
+class Music:
+    """Music, audio stream, anything longer than ~10 seconds should be streamed"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 36
+    _dtype_spec: dict = {"names": ["stream", "frameCount", "looping", "ctxType", "ctxData"], "formats": [AudioStream._dtype_spec, "<u4", "<i1", "<i4", "<u4"], "offsets": [0, 20, 24, 28, 32], "itemsize": 36}
+
+    def __init__(self, stream: AudioStream = None, frameCount: int = 0, looping: int = 0, ctxType: int = 0, ctxData: int = 0, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(36)
+            self._to_free = _struct_pool
+            if stream is not None:
+                struct_clone(stream, self._address + 0)
+            else:
+                _heap.u8.fill(0, self._address + 0, self._address + 20)
+            _heap.u32[(self._address + 20) >> 2] = frameCount
+            _heap.i8[self._address + 24] = looping
+            _heap.i32[(self._address + 28) >> 2] = ctxType
+            _heap.u32[(self._address + 32) >> 2] = ctxData
+
+    @property
+    def stream(self):
+        """Audio stream"""
+        return AudioStream(0, address=self._address + 0)
+
+    @stream.setter
+    def stream(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 0)
+
+    @property
+    def frameCount(self):
+        """Total number of frames (considering channels)"""
+        return _heap.u32[(self._address + 20) >> 2]
+
+    @frameCount.setter
+    def frameCount(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 20) >> 2] = value
+
+    @property
+    def looping(self):
+        """Music looping enable"""
+        return _heap.i8[self._address + 24]
+
+    @looping.setter
+    def looping(self, value):
+        if not self._frozen:
+            _heap.i8[self._address + 24] = value
+
+    @property
+    def ctxType(self):
+        """Type of music context (audio filetype)"""
+        return _heap.i32[(self._address + 28) >> 2]
+
+    @ctxType.setter
+    def ctxType(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 28) >> 2] = value
+
+    @property
+    def ctxData(self):
+        """Audio context data, depends on type"""
+        return _heap.u32[(self._address + 32) >> 2]
+
+    @ctxData.setter
+    def ctxData(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 32) >> 2] = value
+
+    def __str__(self):
+        return f"Music(address={self._address}, {self.stream}, {self.frameCount}, {self.looping}, {self.ctxType}, {self.ctxData})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 36)
+
+# index of the struct in StructLayouts of src/raylib_structs.h
+check_struct_layouts([
+    (Wave, 147),
+    (AudioStream, 153),
+    (Sound, 159),
+    (Music, 162),
+])
+
+
+def init_audio_device():
+    """Initialize audio device and context"""
+    _InitAudioDevice()
+
+
+def close_audio_device():
+    """Close the audio device and context"""
+    _CloseAudioDevice()
+
+
+def is_audio_device_ready() -> int:
+    """Check if audio device has been initialized successfully"""
+    return_interface = _IsAudioDeviceReady()
+    return return_interface
+
+
+def set_master_volume(volume: float):
+    """Set master volume (listener)"""
+    if __debug__:
+        _check_float("set_master_volume", "volume", volume)
+    _SetMasterVolume(volume)
+
+
+def load_wave(fileName: str, out: Wave = None) -> Wave:
+    """Load wave data from file"""
+    if __debug__:
+        _check_str("load_wave", "fileName", fileName)
+        if out is not None:
+            _check_struct("load_wave", "out", out, Wave)
+    Wave_ = _new_struct(Wave) if out is None or out.__class__ is not Wave else out
+    fileName_ = _scratch_arena.string(fileName)
+    _LoadWave(Wave_._address, fileName_)
+    if out is not None and out is not Wave_:
+        out._assign(Wave_)  # a shadow struct
+        return out
+    return Wave_
+
+
+def load_wave_from_memory(fileType: str, fileData: int, dataSize: int, out: Wave = None) -> Wave:
+    """Load wave from memory buffer, fileType refers to extension: i.e. '.wav'"""
+    if __debug__:
+        _check_str("load_wave_from_memory", "fileType", fileType)
+        _check_int("load_wave_from_memory", "fileData", fileData, 0, 4294967295)
+        _check_int("load_wave_from_memory", "dataSize", dataSize, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("load_wave_from_memory", "out", out, Wave)
+    Wave_ = _new_struct(Wave) if out is None or out.__class__ is not Wave else out
+    fileType_ = _scratch_arena.string(fileType)
+    _LoadWaveFromMemory(Wave_._address, fileType_, fileData, dataSize)
+    if out is not None and out is not Wave_:
+        out._assign(Wave_)  # a shadow struct
+        return out
+    return Wave_
+
+
+def is_wave_ready(wave: Wave) -> int:
+    """Checks if wave data is ready"""
+    if __debug__:
+        _check_struct("is_wave_ready", "wave", wave, Wave)
+    return_interface = _IsWaveReady(wave._address)
+    return return_interface
+
+
+def load_sound(fileName: str, out: Sound = None) -> Sound:
+    """Load sound from file"""
+    if __debug__:
+        _check_str("load_sound", "fileName", fileName)
+        if out is not None:
+            _check_struct("load_sound", "out", out, Sound)
+    Sound_ = _new_struct(Sound) if out is None or out.__class__ is not Sound else out
+    fileName_ = _scratch_arena.string(fileName)
+    _LoadSound(Sound_._address, fileName_)
+    if out is not None and out is not Sound_:
+        out._assign(Sound_)  # a shadow struct
+        return out
+    return Sound_
+
+
+def load_sound_from_wave(wave: Wave, out: Sound = None) -> Sound:
+    """Load sound from wave data"""
+    if __debug__:
+        _check_struct("load_sound_from_wave", "wave", wave, Wave)
+        if out is not None:
+            _check_struct("load_sound_from_wave", "out", out, Sound)
+    Sound_ = _new_struct(Sound) if out is None or out.__class__ is not Sound or out._address in (wave._address,) else out
+    _LoadSoundFromWave(Sound_._address, wave._address)
+    if out is not None and out is not Sound_:
+        if out.__class__ is Sound:
+            _memcpy(out._address, Sound_._address, Sound._size)
+        else:
+            out._assign(Sound_)  # a shadow struct
+        return out
+    return Sound_
+
+
+def is_sound_ready(sound: Sound) -> int:
+    """Checks if a sound is ready"""
+    if __debug__:
+        _check_struct("is_sound_ready", "sound", sound, Sound)
+    return_interface = _IsSoundReady(sound._address)
+    return return_interface
+
+
+def update_sound(sound: Sound, data: int, sampleCount: int):
+    """Update sound buffer with new data"""
+    if __debug__:
+        _check_struct("update_sound", "sound", sound, Sound)
+        _check_int("update_sound", "data", data, 0, 4294967295)
+        _check_int("update_sound", "sampleCount", sampleCount, -2147483648, 2147483647)
+    _UpdateSound(sound._address, data, sampleCount)
+
+
+def unload_wave(wave: Wave):
+    """Unload wave data"""
+    if __debug__:
+        _check_struct("unload_wave", "wave", wave, Wave)
+    _UnloadWave(wave._address)
+
+
+def unload_sound(sound: Sound):
+    """Unload sound"""
+    if __debug__:
+        _check_struct("unload_sound", "sound", sound, Sound)
+    _UnloadSound(sound._address)
+
+
+def export_wave(wave: Wave, fileName: str) -> int:
+    """Export wave data to file, returns true on success"""
+    if __debug__:
+        _check_struct("export_wave", "wave", wave, Wave)
+        _check_str("export_wave", "fileName", fileName)
+    fileName_ = _scratch_arena.string(fileName)
+    return_interface = _ExportWave(wave._address, fileName_)
+    return return_interface
+
+
+def export_wave_as_code(wave: Wave, fileName: str) -> int:
+    """Export wave sample data to code (.h), returns true on success"""
+    if __debug__:
+        _check_struct("export_wave_as_code", "wave", wave, Wave)
+        _check_str("export_wave_as_code", "fileName", fileName)
+    fileName_ = _scratch_arena.string(fileName)
+    return_interface = _ExportWaveAsCode(wave._address, fileName_)
+    return return_interface
+
+
+def play_sound(sound: Sound):
+    """Play a sound"""
+    if __debug__:
+        _check_struct("play_sound", "sound", sound, Sound)
+    _PlaySound(sound._address)
+
+
+def stop_sound(sound: Sound):
+    """Stop playing a sound"""
+    if __debug__:
+        _check_struct("stop_sound", "sound", sound, Sound)
+    _StopSound(sound._address)
+
+
+def pause_sound(sound: Sound):
+    """Pause a sound"""
+    if __debug__:
+        _check_struct("pause_sound", "sound", sound, Sound)
+    _PauseSound(sound._address)
+
+
+def resume_sound(sound: Sound):
+    """Resume a paused sound"""
+    if __debug__:
+        _check_struct("resume_sound", "sound", sound, Sound)
+    _ResumeSound(sound._address)
+
+
+def is_sound_playing(sound: Sound) -> int:
+    """Check if a sound is currently playing"""
+    if __debug__:
+        _check_struct("is_sound_playing", "sound", sound, Sound)
+    return_interface = _IsSoundPlaying(sound._address)
+    return return_interface
+
+
+def set_sound_volume(sound: Sound, volume: float):
+    """Set volume for a sound (1.0 is max level)"""
+    if __debug__:
+        _check_struct("set_sound_volume", "sound", sound, Sound)
+        _check_float("set_sound_volume", "volume", volume)
+    _SetSoundVolume(sound._address, volume)
+
+
+def set_sound_pitch(sound: Sound, pitch: float):
+    """Set pitch for a sound (1.0 is base level)"""
+    if __debug__:
+        _check_struct("set_sound_pitch", "sound", sound, Sound)
+        _check_float("set_sound_pitch", "pitch", pitch)
+    _SetSoundPitch(sound._address, pitch)
+
+
+def set_sound_pan(sound: Sound, pan: float):
+    """Set pan for a sound (0.5 is center)"""
+    if __debug__:
+        _check_struct("set_sound_pan", "sound", sound, Sound)
+        _check_float("set_sound_pan", "pan", pan)
+    _SetSoundPan(sound._address, pan)
+
+
+def wave_copy(wave: Wave, out: Wave = None) -> Wave:
+    """Copy a wave to a new wave"""
+    if __debug__:
+        _check_struct("wave_copy", "wave", wave, Wave)
+        if out is not None:
+            _check_struct("wave_copy", "out", out, Wave)
+    Wave_ = _new_struct(Wave) if out is None or out.__class__ is not Wave or out._address in (wave._address,) else out
+    _WaveCopy(Wave_._address, wave._address)
+    if out is not None and out is not Wave_:
+        if out.__class__ is Wave:
+            _memcpy(out._address, Wave_._address, Wave._size)
+        else:
+            out._assign(Wave_)  # a shadow struct
+        return out
+    return Wave_
+
+
+def wave_crop(wave: int, initSample: int, finalSample: int):
+    """Crop a wave to defined samples range"""
+    if __debug__:
+        _check_int("wave_crop", "wave", wave, 0, 4294967295)
+        _check_int("wave_crop", "initSample", initSample, -2147483648, 2147483647)
+        _check_int("wave_crop", "finalSample", finalSample, -2147483648, 2147483647)
+    _WaveCrop(wave, initSample, finalSample)
+
+
+def wave_format(wave: int, sampleRate: int, sampleSize: int, channels: int):
+    """Convert wave data to desired format"""
+    if __debug__:
+        _check_int("wave_format", "wave", wave, 0, 4294967295)
+        _check_int("wave_format", "sampleRate", sampleRate, -2147483648, 2147483647)
+        _check_int("wave_format", "sampleSize", sampleSize, -2147483648, 2147483647)
+        _check_int("wave_format", "channels", channels, -2147483648, 2147483647)
+    _WaveFormat(wave, sampleRate, sampleSize, channels)
+
+
+def load_wave_samples(wave: Wave) -> int:
+    """Load samples data from wave as a 32bit float data array"""
+    if __debug__:
+        _check_struct("load_wave_samples", "wave", wave, Wave)
+    return_interface = _LoadWaveSamples(wave._address)
+    return return_interface
+
+
+def unload_wave_samples(samples: int):
+    """Unload samples data loaded with LoadWaveSamples()"""
+    if __debug__:
+        _check_int("unload_wave_samples", "samples", samples, 0, 4294967295)
+    _UnloadWaveSamples(samples)
+
+
+def load_music_stream(fileName: str, out: Music = None) -> Music:
+    """Load music stream from file"""
+    if __debug__:
+        _check_str("load_music_stream", "fileName", fileName)
+        if out is not None:
+            _check_struct("load_music_stream", "out", out, Music)
+    Music_ = _new_struct(Music) if out is None or out.__class__ is not Music else out
+    fileName_ = _scratch_arena.string(fileName)
+    _LoadMusicStream(Music_._address, fileName_)
+    if out is not None and out is not Music_:
+        out._assign(Music_)  # a shadow struct
+        return out
+    return Music_
+
+
+def load_music_stream_from_memory(fileType: str, data: int, dataSize: int, out: Music = None) -> Music:
+    """Load music stream from data"""
+    if __debug__:
+        _check_str("load_music_stream_from_memory", "fileType", fileType)
+        _check_int("load_music_stream_from_memory", "data", data, 0, 4294967295)
+        _check_int("load_music_stream_from_memory", "dataSize", dataSize, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("load_music_stream_from_memory", "out", out, Music)
+    Music_ = _new_struct(Music) if out is None or out.__class__ is not Music else out
+    fileType_ = _scratch_arena.string(fileType)
+    _LoadMusicStreamFromMemory(Music_._address, fileType_, data, dataSize)
+    if out is not None and out is not Music_:
+        out._assign(Music_)  # a shadow struct
+        return out
+    return Music_
+
+
+def is_music_ready(music: Music) -> int:
+    """Checks if a music stream is ready"""
+    if __debug__:
+        _check_struct("is_music_ready", "music", music, Music)
+    return_interface = _IsMusicReady(music._address)
+    return return_interface
+
+
+def unload_music_stream(music: Music):
+    """Unload music stream"""
+    if __debug__:
+        _check_struct("unload_music_stream", "music", music, Music)
+    _UnloadMusicStream(music._address)
+
+
+def play_music_stream(music: Music):
+    """Start music playing"""
+    if __debug__:
+        _check_struct("play_music_stream", "music", music, Music)
+    _PlayMusicStream(music._address)
+
+
+def is_music_stream_playing(music: Music) -> int:
+    """Check if music is playing"""
+    if __debug__:
+        _check_struct("is_music_stream_playing", "music", music, Music)
+    return_interface = _IsMusicStreamPlaying(music._address)
+    return return_interface
+
+
+def update_music_stream(music: Music):
+    """Updates buffers for music streaming"""
+    if __debug__:
+        _check_struct("update_music_stream", "music", music, Music)
+    _UpdateMusicStream(music._address)
+
+
+def stop_music_stream(music: Music):
+    """Stop music playing"""
+    if __debug__:
+        _check_struct("stop_music_stream", "music", music, Music)
+    _StopMusicStream(music._address)
+
+
+def pause_music_stream(music: Music):
+    """Pause music playing"""
+    if __debug__:
+        _check_struct("pause_music_stream", "music", music, Music)
+    _PauseMusicStream(music._address)
+
+
+def resume_music_stream(music: Music):
+    """Resume playing paused music"""
+    if __debug__:
+        _check_struct("resume_music_stream", "music", music, Music)
+    _ResumeMusicStream(music._address)
+
+
+def seek_music_stream(music: Music, position: float):
+    """Seek music to a position (in seconds)"""
+    if __debug__:
+        _check_struct("seek_music_stream", "music", music, Music)
+        _check_float("seek_music_stream", "position", position)
+    _SeekMusicStream(music._address, position)
+
+
+def set_music_volume(music: Music, volume: float):
+    """Set volume for music (1.0 is max level)"""
+    if __debug__:
+        _check_struct("set_music_volume", "music", music, Music)
+        _check_float("set_music_volume", "volume", volume)
+    _SetMusicVolume(music._address, volume)
+
+
+def set_music_pitch(music: Music, pitch: float):
+    """Set pitch for a music (1.0 is base level)"""
+    if __debug__:
+        _check_struct("set_music_pitch", "music", music, Music)
+        _check_float("set_music_pitch", "pitch", pitch)
+    _SetMusicPitch(music._address, pitch)
+
+
+def set_music_pan(music: Music, pan: float):
+    """Set pan for a music (0.5 is center)"""
+    if __debug__:
+        _check_struct("set_music_pan", "music", music, Music)
+        _check_float("set_music_pan", "pan", pan)
+    _SetMusicPan(music._address, pan)
+
+
+def get_music_time_length(music: Music) -> float:
+    """Get music time length (in seconds)"""
+    if __debug__:
+        _check_struct("get_music_time_length", "music", music, Music)
+    return_interface = _GetMusicTimeLength(music._address)
+    return return_interface
+
+
+def get_music_time_played(music: Music) -> float:
+    """Get current music time played (in seconds)"""
+    if __debug__:
+        _check_struct("get_music_time_played", "music", music, Music)
+    return_interface = _GetMusicTimePlayed(music._address)
+    return return_interface
+
+
+def load_audio_stream(sampleRate: int, sampleSize: int, channels: int, out: AudioStream = None) -> AudioStream:
+    """Load audio stream (to stream raw audio pcm data)"""
+    if __debug__:
+        _check_int("load_audio_stream", "sampleRate", sampleRate, 0, 4294967295)
+        _check_int("load_audio_stream", "sampleSize", sampleSize, 0, 4294967295)
+        _check_int("load_audio_stream", "channels", channels, 0, 4294967295)
+        if out is not None:
+            _check_struct("load_audio_stream", "out", out, AudioStream)
+    AudioStream_ = _new_struct(AudioStream) if out is None or out.__class__ is not AudioStream else out
+    _LoadAudioStream(AudioStream_._address, sampleRate, sampleSize, channels)
+    if out is not None and out is not AudioStream_:
+        out._assign(AudioStream_)  # a shadow struct
+        return out
+    return AudioStream_
+
+
+def is_audio_stream_ready(stream: AudioStream) -> int:
+    """Checks if an audio stream is ready"""
+    if __debug__:
+        _check_struct("is_audio_stream_ready", "stream", stream, AudioStream)
+    return_interface = _IsAudioStreamReady(stream._address)
+    return return_interface
+
+
+def unload_audio_stream(stream: AudioStream):
+    """Unload audio stream and free memory"""
+    if __debug__:
+        _check_struct("unload_audio_stream", "stream", stream, AudioStream)
+    _UnloadAudioStream(stream._address)
+
+
+def update_audio_stream(stream: AudioStream, data: int, frameCount: int):
+    """Update audio stream buffers with data"""
+    if __debug__:
+        _check_struct("update_audio_stream", "stream", stream, AudioStream)
+        _check_int("update_audio_stream", "data", data, 0, 4294967295)
+        _check_int("update_audio_stream", "frameCount", frameCount, -2147483648, 2147483647)
+    _UpdateAudioStream(stream._address, data, frameCount)
+
+
+def is_audio_stream_processed(stream: AudioStream) -> int:
+    """Check if any audio stream buffers requires refill"""
+    if __debug__:
+        _check_struct("is_audio_stream_processed", "stream", stream, AudioStream)
+    return_interface = _IsAudioStreamProcessed(stream._address)
+    return return_interface
+
+
+def play_audio_stream(stream: AudioStream):
+    """Play audio stream"""
+    if __debug__:
+        _check_struct("play_audio_stream", "stream", stream, AudioStream)
+    _PlayAudioStream(stream._address)
+
+
+def pause_audio_stream(stream: AudioStream):
+    """Pause audio stream"""
+    if __debug__:
+        _check_struct("pause_audio_stream", "stream", stream, AudioStream)
+    _PauseAudioStream(stream._address)
+
+
+def resume_audio_stream(stream: AudioStream):
+    """Resume audio stream"""
+    if __debug__:
+        _check_struct("resume_audio_stream", "stream", stream, AudioStream)
+    _ResumeAudioStream(stream._address)
+
+
+def is_audio_stream_playing(stream: AudioStream) -> int:
+    """Check if audio stream is playing"""
+    if __debug__:
+        _check_struct("is_audio_stream_playing", "stream", stream, AudioStream)
+    return_interface = _IsAudioStreamPlaying(stream._address)
+    return return_interface
+
+
+def stop_audio_stream(stream: AudioStream):
+    """Stop audio stream"""
+    if __debug__:
+        _check_struct("stop_audio_stream", "stream", stream, AudioStream)
+    _StopAudioStream(stream._address)
+
+
+def set_audio_stream_volume(stream: AudioStream, volume: float):
+    """Set volume for audio stream (1.0 is max level)"""
+    if __debug__:
+        _check_struct("set_audio_stream_volume", "stream", stream, AudioStream)
+        _check_float("set_audio_stream_volume", "volume", volume)
+    _SetAudioStreamVolume(stream._address, volume)
+
+
+def set_audio_stream_pitch(stream: AudioStream, pitch: float):
+    """Set pitch for audio stream (1.0 is base level)"""
+    if __debug__:
+        _check_struct("set_audio_stream_pitch", "stream", stream, AudioStream)
+        _check_float("set_audio_stream_pitch", "pitch", pitch)
+    _SetAudioStreamPitch(stream._address, pitch)
+
+
+def set_audio_stream_pan(stream: AudioStream, pan: float):
+    """Set pan for audio stream (0.5 is centered)"""
+    if __debug__:
+        _check_struct("set_audio_stream_pan", "stream", stream, AudioStream)
+        _check_float("set_audio_stream_pan", "pan", pan)
+    _SetAudioStreamPan(stream._address, pan)
+
+
+def set_audio_stream_buffer_size_default(size: int):
+    """Default size for new audio streams"""
+    if __debug__:
+        _check_int("set_audio_stream_buffer_size_default", "size", size, -2147483648, 2147483647)
+    _SetAudioStreamBufferSizeDefault(size)
+
+
+# the wasm exports called above, fetched once instead of looked up at every call, they are bound
+# again when another context is activated or profiling starts
+_wasm_functions_names = [
+    "_InitAudioDevice",
+    "_CloseAudioDevice",
+    "_IsAudioDeviceReady",
+    "_SetMasterVolume",
+    "_LoadWave",
+    "_LoadWaveFromMemory",
+    "_IsWaveReady",
+    "_LoadSound",
+    "_LoadSoundFromWave",
+    "_memcpy",
+    "_IsSoundReady",
+    "_UpdateSound",
+    "_UnloadWave",
+    "_UnloadSound",
+    "_ExportWave",
+    "_ExportWaveAsCode",
+    "_PlaySound",
+    "_StopSound",
+    "_PauseSound",
+    "_ResumeSound",
+    "_IsSoundPlaying",
+    "_SetSoundVolume",
+    "_SetSoundPitch",
+    "_SetSoundPan",
+    "_WaveCopy",
+    "_WaveCrop",
+    "_WaveFormat",
+    "_LoadWaveSamples",
+    "_UnloadWaveSamples",
+    "_LoadMusicStream",
+    "_LoadMusicStreamFromMemory",
+    "_IsMusicReady",
+    "_UnloadMusicStream",
+    "_PlayMusicStream",
+    "_IsMusicStreamPlaying",
+    "_UpdateMusicStream",
+    "_StopMusicStream",
+    "_PauseMusicStream",
+    "_ResumeMusicStream",
+    "_SeekMusicStream",
+    "_SetMusicVolume",
+    "_SetMusicPitch",
+    "_SetMusicPan",
+    "_GetMusicTimeLength",
+    "_GetMusicTimePlayed",
+    "_LoadAudioStream",
+    "_IsAudioStreamReady",
+    "_UnloadAudioStream",
+    "_UpdateAudioStream",
+    "_IsAudioStreamProcessed",
+    "_PlayAudioStream",
+    "_PauseAudioStream",
+    "_ResumeAudioStream",
+    "_IsAudioStreamPlaying",
+    "_StopAudioStream",
+    "_SetAudioStreamVolume",
+    "_SetAudioStreamPitch",
+    "_SetAudioStreamPan",
+    "_SetAudioStreamBufferSizeDefault",
+]
+_bind_wasm_functions(globals())
+
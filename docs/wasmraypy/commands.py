@@ -0,0 +1,1138 @@
+# Generated by tools/code_generation/filesGeneration.py, do not edit by hand
+# raylib.h, the command buffer encoders of the draw calls
+import struct
+from .core import (
+    Vector2,
+    Vector3,
+    Matrix,
+    Color,
+    Rectangle,
+    Texture2D,
+    RenderTexture2D,
+    Font,
+    Camera3D,
+    Camera,
+    Camera2D,
+    Shader,
+    Ray,
+    VrStereoConfig,
+    _command_buffer,
+    _record_end_drawing,
+    clear_background,
+    end_drawing,
+    begin_mode_2d,
+    end_mode_2d,
+    begin_mode_3d,
+    end_mode_3d,
+    begin_texture_mode,
+    end_texture_mode,
+    begin_shader_mode,
+    end_shader_mode,
+    begin_blend_mode,
+    end_blend_mode,
+    begin_scissor_mode,
+    end_scissor_mode,
+    begin_vr_stereo_mode,
+    end_vr_stereo_mode,
+)
+from .textures import (
+    NPatchInfo,
+)
+from .models import (
+    Mesh,
+    Material,
+    Model,
+    BoundingBox,
+)
+
+
+_clear_background_command = struct.Struct("<iI")
+
+
+def _record_clear_background(color: Color):
+    """Set background color (framebuffer clear color)"""
+    _command_buffer.record(_clear_background_command, 0, Color._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_begin_mode_2d_command = struct.Struct("<iI")
+
+
+def _record_begin_mode_2d(camera: Camera2D):
+    """Begin 2D mode with custom camera (2D)"""
+    _command_buffer.record(_begin_mode_2d_command, 1, Camera2D._size)
+    _command_buffer.record_struct(camera, Camera2D._size)
+
+
+_end_mode_2d_command = struct.Struct("<i")
+
+
+def _record_end_mode_2d():
+    """Ends 2D mode with custom camera"""
+    _command_buffer.record(_end_mode_2d_command, 2)
+
+
+_begin_mode_3d_command = struct.Struct("<iI")
+
+
+def _record_begin_mode_3d(camera: Camera3D):
+    """Begin 3D mode with custom camera (3D)"""
+    _command_buffer.record(_begin_mode_3d_command, 3, Camera3D._size)
+    _command_buffer.record_struct(camera, Camera3D._size)
+
+
+_end_mode_3d_command = struct.Struct("<i")
+
+
+def _record_end_mode_3d():
+    """Ends 3D mode and returns to default 2D orthographic mode"""
+    _command_buffer.record(_end_mode_3d_command, 4)
+
+
+_begin_texture_mode_command = struct.Struct("<iI")
+
+
+def _record_begin_texture_mode(target: RenderTexture2D):
+    """Begin drawing to render texture"""
+    _command_buffer.record(_begin_texture_mode_command, 5, RenderTexture2D._size)
+    _command_buffer.record_struct(target, RenderTexture2D._size)
+
+
+_end_texture_mode_command = struct.Struct("<i")
+
+
+def _record_end_texture_mode():
+    """Ends drawing to render texture"""
+    _command_buffer.record(_end_texture_mode_command, 6)
+
+
+_begin_shader_mode_command = struct.Struct("<iI")
+
+
+def _record_begin_shader_mode(shader: Shader):
+    """Begin custom shader drawing"""
+    _command_buffer.record(_begin_shader_mode_command, 7, Shader._size)
+    _command_buffer.record_struct(shader, Shader._size)
+
+
+_end_shader_mode_command = struct.Struct("<i")
+
+
+def _record_end_shader_mode():
+    """End custom shader drawing (use default shader)"""
+    _command_buffer.record(_end_shader_mode_command, 8)
+
+
+_begin_blend_mode_command = struct.Struct("<ii")
+
+
+def _record_begin_blend_mode(mode: int):
+    """Begin blending mode (alpha, additive, multiplied, subtract, custom)"""
+    _command_buffer.record(_begin_blend_mode_command, 9, mode)
+
+
+_end_blend_mode_command = struct.Struct("<i")
+
+
+def _record_end_blend_mode():
+    """End blending mode (reset to default: alpha blending)"""
+    _command_buffer.record(_end_blend_mode_command, 10)
+
+
+_begin_scissor_mode_command = struct.Struct("<iiiii")
+
+
+def _record_begin_scissor_mode(x: int, y: int, width: int, height: int):
+    """Begin scissor mode (define screen area for following drawing)"""
+    _command_buffer.record(_begin_scissor_mode_command, 11, x, y, width, height)
+
+
+_end_scissor_mode_command = struct.Struct("<i")
+
+
+def _record_end_scissor_mode():
+    """End scissor mode"""
+    _command_buffer.record(_end_scissor_mode_command, 12)
+
+
+_begin_vr_stereo_mode_command = struct.Struct("<iI")
+
+
+def _record_begin_vr_stereo_mode(config: VrStereoConfig):
+    """Begin stereo rendering (requires VR simulator)"""
+    _command_buffer.record(_begin_vr_stereo_mode_command, 13, VrStereoConfig._size)
+    _command_buffer.record_struct(config, VrStereoConfig._size)
+
+
+_end_vr_stereo_mode_command = struct.Struct("<i")
+
+
+def _record_end_vr_stereo_mode():
+    """End stereo rendering (requires VR simulator)"""
+    _command_buffer.record(_end_vr_stereo_mode_command, 14)
+
+
+_draw_pixel_command = struct.Struct("<iiiI")
+
+
+def _record_draw_pixel(posX: int, posY: int, color: Color):
+    """Draw a pixel"""
+    _command_buffer.record(_draw_pixel_command, 15, posX, posY, Color._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_pixel_v_command = struct.Struct("<iII")
+
+
+def _record_draw_pixel_v(position: Vector2, color: Color):
+    """Draw a pixel (Vector version)"""
+    _command_buffer.record(_draw_pixel_v_command, 16, Vector2._size, Color._size)
+    _command_buffer.record_struct(position, Vector2._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_line_command = struct.Struct("<iiiiiI")
+
+
+def _record_draw_line(startPosX: int, startPosY: int, endPosX: int, endPosY: int, color: Color):
+    """Draw a line"""
+    _command_buffer.record(_draw_line_command, 17, startPosX, startPosY, endPosX, endPosY, Color._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_line_v_command = struct.Struct("<iIII")
+
+
+def _record_draw_line_v(startPos: Vector2, endPos: Vector2, color: Color):
+    """Draw a line (Vector version)"""
+    _command_buffer.record(_draw_line_v_command, 18, Vector2._size, Vector2._size, Color._size)
+    _command_buffer.record_struct(startPos, Vector2._size)
+    _command_buffer.record_struct(endPos, Vector2._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_line_ex_command = struct.Struct("<iIIfI")
+
+
+def _record_draw_line_ex(startPos: Vector2, endPos: Vector2, thick: float, color: Color):
+    """Draw a line defining thickness"""
+    _command_buffer.record(_draw_line_ex_command, 19, Vector2._size, Vector2._size, thick, Color._size)
+    _command_buffer.record_struct(startPos, Vector2._size)
+    _command_buffer.record_struct(endPos, Vector2._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_line_bezier_command = struct.Struct("<iIIfI")
+
+
+def _record_draw_line_bezier(startPos: Vector2, endPos: Vector2, thick: float, color: Color):
+    """Draw a line using cubic-bezier curves in-out"""
+    _command_buffer.record(_draw_line_bezier_command, 20, Vector2._size, Vector2._size, thick, Color._size)
+    _command_buffer.record_struct(startPos, Vector2._size)
+    _command_buffer.record_struct(endPos, Vector2._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_line_bezier_quad_command = struct.Struct("<iIIIfI")
+
+
+def _record_draw_line_bezier_quad(startPos: Vector2, endPos: Vector2, controlPos: Vector2, thick: float, color: Color):
+    """Draw line using quadratic bezier curves with a control point"""
+    _command_buffer.record(_draw_line_bezier_quad_command, 21, Vector2._size, Vector2._size, Vector2._size, thick, Color._size)
+    _command_buffer.record_struct(startPos, Vector2._size)
+    _command_buffer.record_struct(endPos, Vector2._size)
+    _command_buffer.record_struct(controlPos, Vector2._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_line_bezier_cubic_command = struct.Struct("<iIIIIfI")
+
+
+def _record_draw_line_bezier_cubic(startPos: Vector2, endPos: Vector2, startControlPos: Vector2, endControlPos: Vector2, thick: float, color: Color):
+    """Draw line using cubic bezier curves with 2 control points"""
+    _command_buffer.record(_draw_line_bezier_cubic_command, 22, Vector2._size, Vector2._size, Vector2._size, Vector2._size, thick, Color._size)
+    _command_buffer.record_struct(startPos, Vector2._size)
+    _command_buffer.record_struct(endPos, Vector2._size)
+    _command_buffer.record_struct(startControlPos, Vector2._size)
+    _command_buffer.record_struct(endControlPos, Vector2._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_line_strip_command = struct.Struct("<iIiI")
+
+
+def _record_draw_line_strip(points: int, pointCount: int, color: Color):
+    """Draw lines sequence"""
+    points_size = pointCount * Vector2._size
+    _command_buffer.record(_draw_line_strip_command, 23, points_size, pointCount, Color._size)
+    _command_buffer.record_memory(points, points_size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_circle_command = struct.Struct("<iiifI")
+
+
+def _record_draw_circle(centerX: int, centerY: int, radius: float, color: Color):
+    """Draw a color-filled circle"""
+    _command_buffer.record(_draw_circle_command, 24, centerX, centerY, radius, Color._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_circle_sector_command = struct.Struct("<iIfffiI")
+
+
+def _record_draw_circle_sector(center: Vector2, radius: float, startAngle: float, endAngle: float, segments: int, color: Color):
+    """Draw a piece of a circle"""
+    _command_buffer.record(_draw_circle_sector_command, 25, Vector2._size, radius, startAngle, endAngle, segments, Color._size)
+    _command_buffer.record_struct(center, Vector2._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_circle_sector_lines_command = struct.Struct("<iIfffiI")
+
+
+def _record_draw_circle_sector_lines(center: Vector2, radius: float, startAngle: float, endAngle: float, segments: int, color: Color):
+    """Draw circle sector outline"""
+    _command_buffer.record(_draw_circle_sector_lines_command, 26, Vector2._size, radius, startAngle, endAngle, segments, Color._size)
+    _command_buffer.record_struct(center, Vector2._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_circle_gradient_command = struct.Struct("<iiifII")
+
+
+def _record_draw_circle_gradient(centerX: int, centerY: int, radius: float, color1: Color, color2: Color):
+    """Draw a gradient-filled circle"""
+    _command_buffer.record(_draw_circle_gradient_command, 27, centerX, centerY, radius, Color._size, Color._size)
+    _command_buffer.record_struct(color1, Color._size)
+    _command_buffer.record_struct(color2, Color._size)
+
+
+_draw_circle_v_command = struct.Struct("<iIfI")
+
+
+def _record_draw_circle_v(center: Vector2, radius: float, color: Color):
+    """Draw a color-filled circle (Vector version)"""
+    _command_buffer.record(_draw_circle_v_command, 28, Vector2._size, radius, Color._size)
+    _command_buffer.record_struct(center, Vector2._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_circle_lines_command = struct.Struct("<iiifI")
+
+
+def _record_draw_circle_lines(centerX: int, centerY: int, radius: float, color: Color):
+    """Draw circle outline"""
+    _command_buffer.record(_draw_circle_lines_command, 29, centerX, centerY, radius, Color._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_ellipse_command = struct.Struct("<iiiffI")
+
+
+def _record_draw_ellipse(centerX: int, centerY: int, radiusH: float, radiusV: float, color: Color):
+    """Draw ellipse"""
+    _command_buffer.record(_draw_ellipse_command, 30, centerX, centerY, radiusH, radiusV, Color._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_ellipse_lines_command = struct.Struct("<iiiffI")
+
+
+def _record_draw_ellipse_lines(centerX: int, centerY: int, radiusH: float, radiusV: float, color: Color):
+    """Draw ellipse outline"""
+    _command_buffer.record(_draw_ellipse_lines_command, 31, centerX, centerY, radiusH, radiusV, Color._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_ring_command = struct.Struct("<iIffffiI")
+
+
+def _record_draw_ring(center: Vector2, innerRadius: float, outerRadius: float, startAngle: float, endAngle: float, segments: int, color: Color):
+    """Draw ring"""
+    _command_buffer.record(_draw_ring_command, 32, Vector2._size, innerRadius, outerRadius, startAngle, endAngle, segments, Color._size)
+    _command_buffer.record_struct(center, Vector2._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_ring_lines_command = struct.Struct("<iIffffiI")
+
+
+def _record_draw_ring_lines(center: Vector2, innerRadius: float, outerRadius: float, startAngle: float, endAngle: float, segments: int, color: Color):
+    """Draw ring outline"""
+    _command_buffer.record(_draw_ring_lines_command, 33, Vector2._size, innerRadius, outerRadius, startAngle, endAngle, segments, Color._size)
+    _command_buffer.record_struct(center, Vector2._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_rectangle_command = struct.Struct("<iiiiiI")
+
+
+def _record_draw_rectangle(posX: int, posY: int, width: int, height: int, color: Color):
+    """Draw a color-filled rectangle"""
+    _command_buffer.record(_draw_rectangle_command, 34, posX, posY, width, height, Color._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_rectangle_v_command = struct.Struct("<iIII")
+
+
+def _record_draw_rectangle_v(position: Vector2, size: Vector2, color: Color):
+    """Draw a color-filled rectangle (Vector version)"""
+    _command_buffer.record(_draw_rectangle_v_command, 35, Vector2._size, Vector2._size, Color._size)
+    _command_buffer.record_struct(position, Vector2._size)
+    _command_buffer.record_struct(size, Vector2._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_rectangle_rec_command = struct.Struct("<iII")
+
+
+def _record_draw_rectangle_rec(rec: Rectangle, color: Color):
+    """Draw a color-filled rectangle"""
+    _command_buffer.record(_draw_rectangle_rec_command, 36, Rectangle._size, Color._size)
+    _command_buffer.record_struct(rec, Rectangle._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_rectangle_pro_command = struct.Struct("<iIIfI")
+
+
+def _record_draw_rectangle_pro(rec: Rectangle, origin: Vector2, rotation: float, color: Color):
+    """Draw a color-filled rectangle with pro parameters"""
+    _command_buffer.record(_draw_rectangle_pro_command, 37, Rectangle._size, Vector2._size, rotation, Color._size)
+    _command_buffer.record_struct(rec, Rectangle._size)
+    _command_buffer.record_struct(origin, Vector2._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_rectangle_gradient_v_command = struct.Struct("<iiiiiII")
+
+
+def _record_draw_rectangle_gradient_v(posX: int, posY: int, width: int, height: int, color1: Color, color2: Color):
+    """Draw a vertical-gradient-filled rectangle"""
+    _command_buffer.record(_draw_rectangle_gradient_v_command, 38, posX, posY, width, height, Color._size, Color._size)
+    _command_buffer.record_struct(color1, Color._size)
+    _command_buffer.record_struct(color2, Color._size)
+
+
+_draw_rectangle_gradient_h_command = struct.Struct("<iiiiiII")
+
+
+def _record_draw_rectangle_gradient_h(posX: int, posY: int, width: int, height: int, color1: Color, color2: Color):
+    """Draw a horizontal-gradient-filled rectangle"""
+    _command_buffer.record(_draw_rectangle_gradient_h_command, 39, posX, posY, width, height, Color._size, Color._size)
+    _command_buffer.record_struct(color1, Color._size)
+    _command_buffer.record_struct(color2, Color._size)
+
+
+_draw_rectangle_gradient_ex_command = struct.Struct("<iIIIII")
+
+
+def _record_draw_rectangle_gradient_ex(rec: Rectangle, col1: Color, col2: Color, col3: Color, col4: Color):
+    """Draw a gradient-filled rectangle with custom vertex colors"""
+    _command_buffer.record(_draw_rectangle_gradient_ex_command, 40, Rectangle._size, Color._size, Color._size, Color._size, Color._size)
+    _command_buffer.record_struct(rec, Rectangle._size)
+    _command_buffer.record_struct(col1, Color._size)
+    _command_buffer.record_struct(col2, Color._size)
+    _command_buffer.record_struct(col3, Color._size)
+    _command_buffer.record_struct(col4, Color._size)
+
+
+_draw_rectangle_lines_command = struct.Struct("<iiiiiI")
+
+
+def _record_draw_rectangle_lines(posX: int, posY: int, width: int, height: int, color: Color):
+    """Draw rectangle outline"""
+    _command_buffer.record(_draw_rectangle_lines_command, 41, posX, posY, width, height, Color._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_rectangle_lines_ex_command = struct.Struct("<iIfI")
+
+
+def _record_draw_rectangle_lines_ex(rec: Rectangle, lineThick: float, color: Color):
+    """Draw rectangle outline with extended parameters"""
+    _command_buffer.record(_draw_rectangle_lines_ex_command, 42, Rectangle._size, lineThick, Color._size)
+    _command_buffer.record_struct(rec, Rectangle._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_rectangle_rounded_command = struct.Struct("<iIfiI")
+
+
+def _record_draw_rectangle_rounded(rec: Rectangle, roundness: float, segments: int, color: Color):
+    """Draw rectangle with rounded edges"""
+    _command_buffer.record(_draw_rectangle_rounded_command, 43, Rectangle._size, roundness, segments, Color._size)
+    _command_buffer.record_struct(rec, Rectangle._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_rectangle_rounded_lines_command = struct.Struct("<iIfifI")
+
+
+def _record_draw_rectangle_rounded_lines(rec: Rectangle, roundness: float, segments: int, lineThick: float, color: Color):
+    """Draw rectangle with rounded edges outline"""
+    _command_buffer.record(_draw_rectangle_rounded_lines_command, 44, Rectangle._size, roundness, segments, lineThick, Color._size)
+    _command_buffer.record_struct(rec, Rectangle._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_triangle_command = struct.Struct("<iIIII")
+
+
+def _record_draw_triangle(v1: Vector2, v2: Vector2, v3: Vector2, color: Color):
+    """Draw a color-filled triangle (vertex in counter-clockwise order!)"""
+    _command_buffer.record(_draw_triangle_command, 45, Vector2._size, Vector2._size, Vector2._size, Color._size)
+    _command_buffer.record_struct(v1, Vector2._size)
+    _command_buffer.record_struct(v2, Vector2._size)
+    _command_buffer.record_struct(v3, Vector2._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_triangle_lines_command = struct.Struct("<iIIII")
+
+
+def _record_draw_triangle_lines(v1: Vector2, v2: Vector2, v3: Vector2, color: Color):
+    """Draw triangle outline (vertex in counter-clockwise order!)"""
+    _command_buffer.record(_draw_triangle_lines_command, 46, Vector2._size, Vector2._size, Vector2._size, Color._size)
+    _command_buffer.record_struct(v1, Vector2._size)
+    _command_buffer.record_struct(v2, Vector2._size)
+    _command_buffer.record_struct(v3, Vector2._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_triangle_fan_command = struct.Struct("<iIiI")
+
+
+def _record_draw_triangle_fan(points: int, pointCount: int, color: Color):
+    """Draw a triangle fan defined by points (first vertex is the center)"""
+    points_size = pointCount * Vector2._size
+    _command_buffer.record(_draw_triangle_fan_command, 47, points_size, pointCount, Color._size)
+    _command_buffer.record_memory(points, points_size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_triangle_strip_command = struct.Struct("<iIiI")
+
+
+def _record_draw_triangle_strip(points: int, pointCount: int, color: Color):
+    """Draw a triangle strip defined by points"""
+    points_size = pointCount * Vector2._size
+    _command_buffer.record(_draw_triangle_strip_command, 48, points_size, pointCount, Color._size)
+    _command_buffer.record_memory(points, points_size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_poly_command = struct.Struct("<iIiffI")
+
+
+def _record_draw_poly(center: Vector2, sides: int, radius: float, rotation: float, color: Color):
+    """Draw a regular polygon (Vector version)"""
+    _command_buffer.record(_draw_poly_command, 49, Vector2._size, sides, radius, rotation, Color._size)
+    _command_buffer.record_struct(center, Vector2._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_poly_lines_command = struct.Struct("<iIiffI")
+
+
+def _record_draw_poly_lines(center: Vector2, sides: int, radius: float, rotation: float, color: Color):
+    """Draw a polygon outline of n sides"""
+    _command_buffer.record(_draw_poly_lines_command, 50, Vector2._size, sides, radius, rotation, Color._size)
+    _command_buffer.record_struct(center, Vector2._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_poly_lines_ex_command = struct.Struct("<iIifffI")
+
+
+def _record_draw_poly_lines_ex(center: Vector2, sides: int, radius: float, rotation: float, lineThick: float, color: Color):
+    """Draw a polygon outline of n sides with extended parameters"""
+    _command_buffer.record(_draw_poly_lines_ex_command, 51, Vector2._size, sides, radius, rotation, lineThick, Color._size)
+    _command_buffer.record_struct(center, Vector2._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_texture_command = struct.Struct("<iIiiI")
+
+
+def _record_draw_texture(texture: Texture2D, posX: int, posY: int, tint: Color):
+    """Draw a Texture2D"""
+    _command_buffer.record(_draw_texture_command, 52, Texture2D._size, posX, posY, Color._size)
+    _command_buffer.record_struct(texture, Texture2D._size)
+    _command_buffer.record_struct(tint, Color._size)
+
+
+_draw_texture_v_command = struct.Struct("<iIII")
+
+
+def _record_draw_texture_v(texture: Texture2D, position: Vector2, tint: Color):
+    """Draw a Texture2D with position defined as Vector2"""
+    _command_buffer.record(_draw_texture_v_command, 53, Texture2D._size, Vector2._size, Color._size)
+    _command_buffer.record_struct(texture, Texture2D._size)
+    _command_buffer.record_struct(position, Vector2._size)
+    _command_buffer.record_struct(tint, Color._size)
+
+
+_draw_texture_ex_command = struct.Struct("<iIIffI")
+
+
+def _record_draw_texture_ex(texture: Texture2D, position: Vector2, rotation: float, scale: float, tint: Color):
+    """Draw a Texture2D with extended parameters"""
+    _command_buffer.record(_draw_texture_ex_command, 54, Texture2D._size, Vector2._size, rotation, scale, Color._size)
+    _command_buffer.record_struct(texture, Texture2D._size)
+    _command_buffer.record_struct(position, Vector2._size)
+    _command_buffer.record_struct(tint, Color._size)
+
+
+_draw_texture_rec_command = struct.Struct("<iIIII")
+
+
+def _record_draw_texture_rec(texture: Texture2D, source: Rectangle, position: Vector2, tint: Color):
+    """Draw a part of a texture defined by a rectangle"""
+    _command_buffer.record(_draw_texture_rec_command, 55, Texture2D._size, Rectangle._size, Vector2._size, Color._size)
+    _command_buffer.record_struct(texture, Texture2D._size)
+    _command_buffer.record_struct(source, Rectangle._size)
+    _command_buffer.record_struct(position, Vector2._size)
+    _command_buffer.record_struct(tint, Color._size)
+
+
+_draw_texture_pro_command = struct.Struct("<iIIIIfI")
+
+
+def _record_draw_texture_pro(texture: Texture2D, source: Rectangle, dest: Rectangle, origin: Vector2, rotation: float, tint: Color):
+    """Draw a part of a texture defined by a rectangle with 'pro' parameters"""
+    _command_buffer.record(_draw_texture_pro_command, 56, Texture2D._size, Rectangle._size, Rectangle._size, Vector2._size, rotation, Color._size)
+    _command_buffer.record_struct(texture, Texture2D._size)
+    _command_buffer.record_struct(source, Rectangle._size)
+    _command_buffer.record_struct(dest, Rectangle._size)
+    _command_buffer.record_struct(origin, Vector2._size)
+    _command_buffer.record_struct(tint, Color._size)
+
+
+_draw_texture_n_patch_command = struct.Struct("<iIIIIfI")
+
+
+def _record_draw_texture_n_patch(texture: Texture2D, nPatchInfo: NPatchInfo, dest: Rectangle, origin: Vector2, rotation: float, tint: Color):
+    """Draws a texture (or part of it) that stretches or shrinks nicely"""
+    _command_buffer.record(_draw_texture_n_patch_command, 57, Texture2D._size, NPatchInfo._size, Rectangle._size, Vector2._size, rotation, Color._size)
+    _command_buffer.record_struct(texture, Texture2D._size)
+    _command_buffer.record_struct(nPatchInfo, NPatchInfo._size)
+    _command_buffer.record_struct(dest, Rectangle._size)
+    _command_buffer.record_struct(origin, Vector2._size)
+    _command_buffer.record_struct(tint, Color._size)
+
+
+_draw_fps_command = struct.Struct("<iii")
+
+
+def _record_draw_fps(posX: int, posY: int):
+    """Draw current FPS"""
+    _command_buffer.record(_draw_fps_command, 58, posX, posY)
+
+
+_draw_text_command = struct.Struct("<iIiiiI")
+
+
+def _record_draw_text(text: str, posX: int, posY: int, fontSize: int, color: Color):
+    """Draw text (using default font)"""
+    text_ = text.encode()
+    _command_buffer.record(_draw_text_command, 59, len(text_), posX, posY, fontSize, Color._size)
+    _command_buffer.record_string(text_)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_text_ex_command = struct.Struct("<iIIIffI")
+
+
+def _record_draw_text_ex(font: Font, text: str, position: Vector2, fontSize: float, spacing: float, tint: Color):
+    """Draw text using font and additional parameters"""
+    text_ = text.encode()
+    _command_buffer.record(_draw_text_ex_command, 60, Font._size, len(text_), Vector2._size, fontSize, spacing, Color._size)
+    _command_buffer.record_struct(font, Font._size)
+    _command_buffer.record_string(text_)
+    _command_buffer.record_struct(position, Vector2._size)
+    _command_buffer.record_struct(tint, Color._size)
+
+
+_draw_text_pro_command = struct.Struct("<iIIIIfffI")
+
+
+def _record_draw_text_pro(font: Font, text: str, position: Vector2, origin: Vector2, rotation: float, fontSize: float, spacing: float, tint: Color):
+    """Draw text using Font and pro parameters (rotation)"""
+    text_ = text.encode()
+    _command_buffer.record(_draw_text_pro_command, 61, Font._size, len(text_), Vector2._size, Vector2._size, rotation, fontSize, spacing, Color._size)
+    _command_buffer.record_struct(font, Font._size)
+    _command_buffer.record_string(text_)
+    _command_buffer.record_struct(position, Vector2._size)
+    _command_buffer.record_struct(origin, Vector2._size)
+    _command_buffer.record_struct(tint, Color._size)
+
+
+_draw_text_codepoint_command = struct.Struct("<iIiIfI")
+
+
+def _record_draw_text_codepoint(font: Font, codepoint: int, position: Vector2, fontSize: float, tint: Color):
+    """Draw one character (codepoint)"""
+    _command_buffer.record(_draw_text_codepoint_command, 62, Font._size, codepoint, Vector2._size, fontSize, Color._size)
+    _command_buffer.record_struct(font, Font._size)
+    _command_buffer.record_struct(position, Vector2._size)
+    _command_buffer.record_struct(tint, Color._size)
+
+
+_draw_text_codepoints_command = struct.Struct("<iIIiIffI")
+
+
+def _record_draw_text_codepoints(font: Font, codepoints: int, count: int, position: Vector2, fontSize: float, spacing: float, tint: Color):
+    """Draw multiple character (codepoint)"""
+    codepoints_size = count * 4
+    _command_buffer.record(_draw_text_codepoints_command, 63, Font._size, codepoints_size, count, Vector2._size, fontSize, spacing, Color._size)
+    _command_buffer.record_struct(font, Font._size)
+    _command_buffer.record_memory(codepoints, codepoints_size)
+    _command_buffer.record_struct(position, Vector2._size)
+    _command_buffer.record_struct(tint, Color._size)
+
+
+_draw_line_3d_command = struct.Struct("<iIII")
+
+
+def _record_draw_line_3d(startPos: Vector3, endPos: Vector3, color: Color):
+    """Draw a line in 3D world space"""
+    _command_buffer.record(_draw_line_3d_command, 64, Vector3._size, Vector3._size, Color._size)
+    _command_buffer.record_struct(startPos, Vector3._size)
+    _command_buffer.record_struct(endPos, Vector3._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_point_3d_command = struct.Struct("<iII")
+
+
+def _record_draw_point_3d(position: Vector3, color: Color):
+    """Draw a point in 3D space, actually a small line"""
+    _command_buffer.record(_draw_point_3d_command, 65, Vector3._size, Color._size)
+    _command_buffer.record_struct(position, Vector3._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_circle_3d_command = struct.Struct("<iIfIfI")
+
+
+def _record_draw_circle_3d(center: Vector3, radius: float, rotationAxis: Vector3, rotationAngle: float, color: Color):
+    """Draw a circle in 3D world space"""
+    _command_buffer.record(_draw_circle_3d_command, 66, Vector3._size, radius, Vector3._size, rotationAngle, Color._size)
+    _command_buffer.record_struct(center, Vector3._size)
+    _command_buffer.record_struct(rotationAxis, Vector3._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_triangle_3d_command = struct.Struct("<iIIII")
+
+
+def _record_draw_triangle_3d(v1: Vector3, v2: Vector3, v3: Vector3, color: Color):
+    """Draw a color-filled triangle (vertex in counter-clockwise order!)"""
+    _command_buffer.record(_draw_triangle_3d_command, 67, Vector3._size, Vector3._size, Vector3._size, Color._size)
+    _command_buffer.record_struct(v1, Vector3._size)
+    _command_buffer.record_struct(v2, Vector3._size)
+    _command_buffer.record_struct(v3, Vector3._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_triangle_strip_3d_command = struct.Struct("<iIiI")
+
+
+def _record_draw_triangle_strip_3d(points: int, pointCount: int, color: Color):
+    """Draw a triangle strip defined by points"""
+    points_size = pointCount * Vector3._size
+    _command_buffer.record(_draw_triangle_strip_3d_command, 68, points_size, pointCount, Color._size)
+    _command_buffer.record_memory(points, points_size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_cube_command = struct.Struct("<iIfffI")
+
+
+def _record_draw_cube(position: Vector3, width: float, height: float, length: float, color: Color):
+    """Draw cube"""
+    _command_buffer.record(_draw_cube_command, 69, Vector3._size, width, height, length, Color._size)
+    _command_buffer.record_struct(position, Vector3._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_cube_v_command = struct.Struct("<iIII")
+
+
+def _record_draw_cube_v(position: Vector3, size: Vector3, color: Color):
+    """Draw cube (Vector version)"""
+    _command_buffer.record(_draw_cube_v_command, 70, Vector3._size, Vector3._size, Color._size)
+    _command_buffer.record_struct(position, Vector3._size)
+    _command_buffer.record_struct(size, Vector3._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_cube_wires_command = struct.Struct("<iIfffI")
+
+
+def _record_draw_cube_wires(position: Vector3, width: float, height: float, length: float, color: Color):
+    """Draw cube wires"""
+    _command_buffer.record(_draw_cube_wires_command, 71, Vector3._size, width, height, length, Color._size)
+    _command_buffer.record_struct(position, Vector3._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_cube_wires_v_command = struct.Struct("<iIII")
+
+
+def _record_draw_cube_wires_v(position: Vector3, size: Vector3, color: Color):
+    """Draw cube wires (Vector version)"""
+    _command_buffer.record(_draw_cube_wires_v_command, 72, Vector3._size, Vector3._size, Color._size)
+    _command_buffer.record_struct(position, Vector3._size)
+    _command_buffer.record_struct(size, Vector3._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_sphere_command = struct.Struct("<iIfI")
+
+
+def _record_draw_sphere(centerPos: Vector3, radius: float, color: Color):
+    """Draw sphere"""
+    _command_buffer.record(_draw_sphere_command, 73, Vector3._size, radius, Color._size)
+    _command_buffer.record_struct(centerPos, Vector3._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_sphere_ex_command = struct.Struct("<iIfiiI")
+
+
+def _record_draw_sphere_ex(centerPos: Vector3, radius: float, rings: int, slices: int, color: Color):
+    """Draw sphere with extended parameters"""
+    _command_buffer.record(_draw_sphere_ex_command, 74, Vector3._size, radius, rings, slices, Color._size)
+    _command_buffer.record_struct(centerPos, Vector3._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_sphere_wires_command = struct.Struct("<iIfiiI")
+
+
+def _record_draw_sphere_wires(centerPos: Vector3, radius: float, rings: int, slices: int, color: Color):
+    """Draw sphere wires"""
+    _command_buffer.record(_draw_sphere_wires_command, 75, Vector3._size, radius, rings, slices, Color._size)
+    _command_buffer.record_struct(centerPos, Vector3._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_cylinder_command = struct.Struct("<iIfffiI")
+
+
+def _record_draw_cylinder(position: Vector3, radiusTop: float, radiusBottom: float, height: float, slices: int, color: Color):
+    """Draw a cylinder/cone"""
+    _command_buffer.record(_draw_cylinder_command, 76, Vector3._size, radiusTop, radiusBottom, height, slices, Color._size)
+    _command_buffer.record_struct(position, Vector3._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_cylinder_ex_command = struct.Struct("<iIIffiI")
+
+
+def _record_draw_cylinder_ex(startPos: Vector3, endPos: Vector3, startRadius: float, endRadius: float, sides: int, color: Color):
+    """Draw a cylinder with base at startPos and top at endPos"""
+    _command_buffer.record(_draw_cylinder_ex_command, 77, Vector3._size, Vector3._size, startRadius, endRadius, sides, Color._size)
+    _command_buffer.record_struct(startPos, Vector3._size)
+    _command_buffer.record_struct(endPos, Vector3._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_cylinder_wires_command = struct.Struct("<iIfffiI")
+
+
+def _record_draw_cylinder_wires(position: Vector3, radiusTop: float, radiusBottom: float, height: float, slices: int, color: Color):
+    """Draw a cylinder/cone wires"""
+    _command_buffer.record(_draw_cylinder_wires_command, 78, Vector3._size, radiusTop, radiusBottom, height, slices, Color._size)
+    _command_buffer.record_struct(position, Vector3._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_cylinder_wires_ex_command = struct.Struct("<iIIffiI")
+
+
+def _record_draw_cylinder_wires_ex(startPos: Vector3, endPos: Vector3, startRadius: float, endRadius: float, sides: int, color: Color):
+    """Draw a cylinder wires with base at startPos and top at endPos"""
+    _command_buffer.record(_draw_cylinder_wires_ex_command, 79, Vector3._size, Vector3._size, startRadius, endRadius, sides, Color._size)
+    _command_buffer.record_struct(startPos, Vector3._size)
+    _command_buffer.record_struct(endPos, Vector3._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_capsule_command = struct.Struct("<iIIfiiI")
+
+
+def _record_draw_capsule(startPos: Vector3, endPos: Vector3, radius: float, slices: int, rings: int, color: Color):
+    """Draw a capsule with the center of its sphere caps at startPos and endPos"""
+    _command_buffer.record(_draw_capsule_command, 80, Vector3._size, Vector3._size, radius, slices, rings, Color._size)
+    _command_buffer.record_struct(startPos, Vector3._size)
+    _command_buffer.record_struct(endPos, Vector3._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_capsule_wires_command = struct.Struct("<iIIfiiI")
+
+
+def _record_draw_capsule_wires(startPos: Vector3, endPos: Vector3, radius: float, slices: int, rings: int, color: Color):
+    """Draw capsule wireframe with the center of its sphere caps at startPos and endPos"""
+    _command_buffer.record(_draw_capsule_wires_command, 81, Vector3._size, Vector3._size, radius, slices, rings, Color._size)
+    _command_buffer.record_struct(startPos, Vector3._size)
+    _command_buffer.record_struct(endPos, Vector3._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_plane_command = struct.Struct("<iIII")
+
+
+def _record_draw_plane(centerPos: Vector3, size: Vector2, color: Color):
+    """Draw a plane XZ"""
+    _command_buffer.record(_draw_plane_command, 82, Vector3._size, Vector2._size, Color._size)
+    _command_buffer.record_struct(centerPos, Vector3._size)
+    _command_buffer.record_struct(size, Vector2._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_ray_command = struct.Struct("<iII")
+
+
+def _record_draw_ray(ray: Ray, color: Color):
+    """Draw a ray line"""
+    _command_buffer.record(_draw_ray_command, 83, Ray._size, Color._size)
+    _command_buffer.record_struct(ray, Ray._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_grid_command = struct.Struct("<iif")
+
+
+def _record_draw_grid(slices: int, spacing: float):
+    """Draw a grid (centered at (0, 0, 0))"""
+    _command_buffer.record(_draw_grid_command, 84, slices, spacing)
+
+
+_draw_model_command = struct.Struct("<iIIfI")
+
+
+def _record_draw_model(model: Model, position: Vector3, scale: float, tint: Color):
+    """Draw a model (with texture if set)"""
+    _command_buffer.record(_draw_model_command, 85, Model._size, Vector3._size, scale, Color._size)
+    _command_buffer.record_struct(model, Model._size)
+    _command_buffer.record_struct(position, Vector3._size)
+    _command_buffer.record_struct(tint, Color._size)
+
+
+_draw_model_ex_command = struct.Struct("<iIIIfII")
+
+
+def _record_draw_model_ex(model: Model, position: Vector3, rotationAxis: Vector3, rotationAngle: float, scale: Vector3, tint: Color):
+    """Draw a model with extended parameters"""
+    _command_buffer.record(_draw_model_ex_command, 86, Model._size, Vector3._size, Vector3._size, rotationAngle, Vector3._size, Color._size)
+    _command_buffer.record_struct(model, Model._size)
+    _command_buffer.record_struct(position, Vector3._size)
+    _command_buffer.record_struct(rotationAxis, Vector3._size)
+    _command_buffer.record_struct(scale, Vector3._size)
+    _command_buffer.record_struct(tint, Color._size)
+
+
+_draw_model_wires_command = struct.Struct("<iIIfI")
+
+
+def _record_draw_model_wires(model: Model, position: Vector3, scale: float, tint: Color):
+    """Draw a model wires (with texture if set)"""
+    _command_buffer.record(_draw_model_wires_command, 87, Model._size, Vector3._size, scale, Color._size)
+    _command_buffer.record_struct(model, Model._size)
+    _command_buffer.record_struct(position, Vector3._size)
+    _command_buffer.record_struct(tint, Color._size)
+
+
+_draw_model_wires_ex_command = struct.Struct("<iIIIfII")
+
+
+def _record_draw_model_wires_ex(model: Model, position: Vector3, rotationAxis: Vector3, rotationAngle: float, scale: Vector3, tint: Color):
+    """Draw a model wires (with texture if set) with extended parameters"""
+    _command_buffer.record(_draw_model_wires_ex_command, 88, Model._size, Vector3._size, Vector3._size, rotationAngle, Vector3._size, Color._size)
+    _command_buffer.record_struct(model, Model._size)
+    _command_buffer.record_struct(position, Vector3._size)
+    _command_buffer.record_struct(rotationAxis, Vector3._size)
+    _command_buffer.record_struct(scale, Vector3._size)
+    _command_buffer.record_struct(tint, Color._size)
+
+
+_draw_bounding_box_command = struct.Struct("<iII")
+
+
+def _record_draw_bounding_box(box: BoundingBox, color: Color):
+    """Draw bounding box (wires)"""
+    _command_buffer.record(_draw_bounding_box_command, 89, BoundingBox._size, Color._size)
+    _command_buffer.record_struct(box, BoundingBox._size)
+    _command_buffer.record_struct(color, Color._size)
+
+
+_draw_billboard_command = struct.Struct("<iIIIfI")
+
+
+def _record_draw_billboard(camera: Camera, texture: Texture2D, position: Vector3, size: float, tint: Color):
+    """Draw a billboard texture"""
+    _command_buffer.record(_draw_billboard_command, 90, Camera._size, Texture2D._size, Vector3._size, size, Color._size)
+    _command_buffer.record_struct(camera, Camera._size)
+    _command_buffer.record_struct(texture, Texture2D._size)
+    _command_buffer.record_struct(position, Vector3._size)
+    _command_buffer.record_struct(tint, Color._size)
+
+
+_draw_billboard_rec_command = struct.Struct("<iIIIIII")
+
+
+def _record_draw_billboard_rec(camera: Camera, texture: Texture2D, source: Rectangle, position: Vector3, size: Vector2, tint: Color):
+    """Draw a billboard texture defined by source"""
+    _command_buffer.record(_draw_billboard_rec_command, 91, Camera._size, Texture2D._size, Rectangle._size, Vector3._size, Vector2._size, Color._size)
+    _command_buffer.record_struct(camera, Camera._size)
+    _command_buffer.record_struct(texture, Texture2D._size)
+    _command_buffer.record_struct(source, Rectangle._size)
+    _command_buffer.record_struct(position, Vector3._size)
+    _command_buffer.record_struct(size, Vector2._size)
+    _command_buffer.record_struct(tint, Color._size)
+
+
+_draw_billboard_pro_command = struct.Struct("<iIIIIIIIfI")
+
+
+def _record_draw_billboard_pro(camera: Camera, texture: Texture2D, source: Rectangle, position: Vector3, up: Vector3, size: Vector2, origin: Vector2, rotation: float, tint: Color):
+    """Draw a billboard texture defined by source and rotation"""
+    _command_buffer.record(_draw_billboard_pro_command, 92, Camera._size, Texture2D._size, Rectangle._size, Vector3._size, Vector3._size, Vector2._size, Vector2._size, rotation, Color._size)
+    _command_buffer.record_struct(camera, Camera._size)
+    _command_buffer.record_struct(texture, Texture2D._size)
+    _command_buffer.record_struct(source, Rectangle._size)
+    _command_buffer.record_struct(position, Vector3._size)
+    _command_buffer.record_struct(up, Vector3._size)
+    _command_buffer.record_struct(size, Vector2._size)
+    _command_buffer.record_struct(origin, Vector2._size)
+    _command_buffer.record_struct(tint, Color._size)
+
+
+_draw_mesh_command = struct.Struct("<iIII")
+
+
+def _record_draw_mesh(mesh: Mesh, material: Material, transform: Matrix):
+    """Draw a 3d mesh with material and transform"""
+    _command_buffer.record(_draw_mesh_command, 93, Mesh._size, Material._size, Matrix._size)
+    _command_buffer.record_struct(mesh, Mesh._size)
+    _command_buffer.record_struct(material, Material._size)
+    _command_buffer.record_struct(transform, Matrix._size)
+
+
+_draw_mesh_instanced_command = struct.Struct("<iIIIi")
+
+
+def _record_draw_mesh_instanced(mesh: Mesh, material: Material, transforms: int, instances: int):
+    """Draw multiple mesh instances with material and different transforms"""
+    transforms_size = instances * Matrix._size
+    _command_buffer.record(_draw_mesh_instanced_command, 94, Mesh._size, Material._size, transforms_size, instances)
+    _command_buffer.record_struct(mesh, Mesh._size)
+    _command_buffer.record_struct(material, Material._size)
+    _command_buffer.record_memory(transforms, transforms_size)
+
+
+_command_buffer_functions = {
+    "clear_background": _record_clear_background,
+    "begin_mode_2d": _record_begin_mode_2d,
+    "end_mode_2d": _record_end_mode_2d,
+    "begin_mode_3d": _record_begin_mode_3d,
+    "end_mode_3d": _record_end_mode_3d,
+    "begin_texture_mode": _record_begin_texture_mode,
+    "end_texture_mode": _record_end_texture_mode,
+    "begin_shader_mode": _record_begin_shader_mode,
+    "end_shader_mode": _record_end_shader_mode,
+    "begin_blend_mode": _record_begin_blend_mode,
+    "end_blend_mode": _record_end_blend_mode,
+    "begin_scissor_mode": _record_begin_scissor_mode,
+    "end_scissor_mode": _record_end_scissor_mode,
+    "begin_vr_stereo_mode": _record_begin_vr_stereo_mode,
+    "end_vr_stereo_mode": _record_end_vr_stereo_mode,
+    "draw_pixel": _record_draw_pixel,
+    "draw_pixel_v": _record_draw_pixel_v,
+    "draw_line": _record_draw_line,
+    "draw_line_v": _record_draw_line_v,
+    "draw_line_ex": _record_draw_line_ex,
+    "draw_line_bezier": _record_draw_line_bezier,
+    "draw_line_bezier_quad": _record_draw_line_bezier_quad,
+    "draw_line_bezier_cubic": _record_draw_line_bezier_cubic,
+    "draw_line_strip": _record_draw_line_strip,
+    "draw_circle": _record_draw_circle,
+    "draw_circle_sector": _record_draw_circle_sector,
+    "draw_circle_sector_lines": _record_draw_circle_sector_lines,
+    "draw_circle_gradient": _record_draw_circle_gradient,
+    "draw_circle_v": _record_draw_circle_v,
+    "draw_circle_lines": _record_draw_circle_lines,
+    "draw_ellipse": _record_draw_ellipse,
+    "draw_ellipse_lines": _record_draw_ellipse_lines,
+    "draw_ring": _record_draw_ring,
+    "draw_ring_lines": _record_draw_ring_lines,
+    "draw_rectangle": _record_draw_rectangle,
+    "draw_rectangle_v": _record_draw_rectangle_v,
+    "draw_rectangle_rec": _record_draw_rectangle_rec,
+    "draw_rectangle_pro": _record_draw_rectangle_pro,
+    "draw_rectangle_gradient_v": _record_draw_rectangle_gradient_v,
+    "draw_rectangle_gradient_h": _record_draw_rectangle_gradient_h,
+    "draw_rectangle_gradient_ex": _record_draw_rectangle_gradient_ex,
+    "draw_rectangle_lines": _record_draw_rectangle_lines,
+    "draw_rectangle_lines_ex": _record_draw_rectangle_lines_ex,
+    "draw_rectangle_rounded": _record_draw_rectangle_rounded,
+    "draw_rectangle_rounded_lines": _record_draw_rectangle_rounded_lines,
+    "draw_triangle": _record_draw_triangle,
+    "draw_triangle_lines": _record_draw_triangle_lines,
+    "draw_triangle_fan": _record_draw_triangle_fan,
+    "draw_triangle_strip": _record_draw_triangle_strip,
+    "draw_poly": _record_draw_poly,
+    "draw_poly_lines": _record_draw_poly_lines,
+    "draw_poly_lines_ex": _record_draw_poly_lines_ex,
+    "draw_texture": _record_draw_texture,
+    "draw_texture_v": _record_draw_texture_v,
+    "draw_texture_ex": _record_draw_texture_ex,
+    "draw_texture_rec": _record_draw_texture_rec,
+    "draw_texture_pro": _record_draw_texture_pro,
+    "draw_texture_n_patch": _record_draw_texture_n_patch,
+    "draw_fps": _record_draw_fps,
+    "draw_text": _record_draw_text,
+    "draw_text_ex": _record_draw_text_ex,
+    "draw_text_pro": _record_draw_text_pro,
+    "draw_text_codepoint": _record_draw_text_codepoint,
+    "draw_text_codepoints": _record_draw_text_codepoints,
+    "draw_line_3d": _record_draw_line_3d,
+    "draw_point_3d": _record_draw_point_3d,
+    "draw_circle_3d": _record_draw_circle_3d,
+    "draw_triangle_3d": _record_draw_triangle_3d,
+    "draw_triangle_strip_3d": _record_draw_triangle_strip_3d,
+    "draw_cube": _record_draw_cube,
+    "draw_cube_v": _record_draw_cube_v,
+    "draw_cube_wires": _record_draw_cube_wires,
+    "draw_cube_wires_v": _record_draw_cube_wires_v,
+    "draw_sphere": _record_draw_sphere,
+    "draw_sphere_ex": _record_draw_sphere_ex,
+    "draw_sphere_wires": _record_draw_sphere_wires,
+    "draw_cylinder": _record_draw_cylinder,
+    "draw_cylinder_ex": _record_draw_cylinder_ex,
+    "draw_cylinder_wires": _record_draw_cylinder_wires,
+    "draw_cylinder_wires_ex": _record_draw_cylinder_wires_ex,
+    "draw_capsule": _record_draw_capsule,
+    "draw_capsule_wires": _record_draw_capsule_wires,
+    "draw_plane": _record_draw_plane,
+    "draw_ray": _record_draw_ray,
+    "draw_grid": _record_draw_grid,
+    "draw_model": _record_draw_model,
+    "draw_model_ex": _record_draw_model_ex,
+    "draw_model_wires": _record_draw_model_wires,
+    "draw_model_wires_ex": _record_draw_model_wires_ex,
+    "draw_bounding_box": _record_draw_bounding_box,
+    "draw_billboard": _record_draw_billboard,
+    "draw_billboard_rec": _record_draw_billboard_rec,
+    "draw_billboard_pro": _record_draw_billboard_pro,
+    "draw_mesh": _record_draw_mesh,
+    "draw_mesh_instanced": _record_draw_mesh_instanced,
+    "end_drawing": _record_end_drawing,
+}
+
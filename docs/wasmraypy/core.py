@@ -0,0 +1,5105 @@
+# Generated by tools/code_generation/filesGeneration.py, do not edit by hand
+# raylib.h, the functions of rcore and everything the other modules share
+from __main__ import (
+    _mod,
+)
+
+
+import enum
+
+# helper to copy a struct
+# newColor = struct_clone(RAYWHITE)
+# newColor._frozen = false
+# newColor.a = 127
+
+
+def struct_clone(source, a: int = 0):
+    owned = not a
+    if owned:
+        a = _struct_pool.alloc(source._size)
+    _mod._memcpy(a, source._address, source._size)
+    out = getattr(source, "_struct", source.__class__)(address=a)  # a shadow struct clones into its wasm struct
+    out._to_free = _struct_pool if owned else False
+    return out
+
+class HeapViews:
+    """Cached typed-array views of the wasm heap, rebuilt when the wasm memory grows"""
+
+    def __init__(self, mod):
+        self._mod = mod
+        self.refresh()
+
+    def refresh(self):
+        self.i8 = self._mod.HEAP8
+        self.u8 = self._mod.HEAPU8
+        self.i16 = self._mod.HEAP16
+        self.u16 = self._mod.HEAPU16
+        self.i32 = self._mod.HEAP32
+        self.u32 = self._mod.HEAPU32
+        self.f32 = self._mod.HEAPF32
+        self.f64 = self._mod.HEAPF64
+        self.mem = self._mod.mem  # DataView, only for values that are not aligned to their size
+
+
+_heap = HeapViews(_mod)
+_mod.onMemoryGrowth = _heap.refresh
+
+class ScratchArena:
+    """Bump allocator in wasm memory for the string arguments of a frame, reset at end_drawing()"""
+
+    def __init__(self, capacity: int = 16 * 1024, max_interned: int = 1024):
+        self._capacity = capacity
+        self.frame = 0  # counts the resets, memory from alloc() is valid while it doesn't change
+        self._address = 0
+        self._offset = 0
+        self._retired = []  # blocks that became too small during the frame, freed at reset()
+        # strings passed in two frames in a row are copied once into their own allocation and reused
+        # from then on, so text drawn every frame is not written into wasm memory again
+        self._interned = {}  # string -> address of its interned copy
+        self._max_interned = max_interned
+        self._previous_frame = set()  # strings of the previous frame, that were not interned
+        self._current_frame = set()
+
+    def alloc(self, size: int) -> int:
+        """Allocate size bytes that stay valid until the end of the frame"""
+        if self._address == 0 or self._offset + size > self._capacity:
+            if self._address != 0:
+                self._retired.append(self._address)
+                self._capacity *= 2
+            self._capacity = max(self._capacity, size)  # the first block too must hold size
+            self._address = _mod._malloc(self._capacity)
+            self._offset = 0
+        address = self._address + self._offset
+        self._offset += (size + 7) & ~7
+        return address
+
+    def string(self, text: str) -> int:
+        """Return the address of a NUL terminated UTF-8 copy of text, valid at least until the end of the frame"""
+        address = self._interned.get(text)
+        if address is not None:
+            return address
+
+        data = text.encode() + b"\0"
+        if text in self._previous_frame:
+            address = self._intern(text, len(data))
+        else:
+            self._current_frame.add(text)
+            address = self.alloc(len(data))
+        _heap.u8.subarray(address, address + len(data)).assign(data)
+        return address
+
+    def _intern(self, text: str, size: int) -> int:
+        if len(self._interned) >= self._max_interned:
+            self.clear_interned()
+        address = _mod._malloc(size)
+        self._interned[text] = address
+        return address
+
+    def clear_interned(self):
+        """Free the interned strings, they will be interned again if they keep coming back"""
+        for address in self._interned.values():
+            _mod._free(address)
+        self._interned.clear()
+
+    def reset(self):
+        """Release the strings of the frame"""
+        for address in self._retired:
+            _mod._free(address)
+        self._retired.clear()
+        self._offset = 0
+        self.frame += 1
+        self._previous_frame, self._current_frame = self._current_frame, self._previous_frame
+        self._current_frame.clear()
+
+
+_scratch_arena = ScratchArena()
+
+class StructPool:
+    """Free lists of wasm allocations by size class, so structs are not malloc-ed and freed every time"""
+
+    def __init__(self, mod, max_free_per_class: int = 4096):
+        self._mod = mod  # its own wasm module, structs can be collected while another context is active
+        self._free_lists = {}  # size class -> addresses ready to be reused
+        self._max_free_per_class = max_free_per_class
+        self.counters = {"malloc": 0, "free": 0, "reused": 0, "released": 0}
+
+    def alloc(self, size: int) -> int:
+        size_class = (size + 7) & ~7
+        free_list = self._free_lists.get(size_class)
+        if free_list:
+            self.counters["reused"] += 1
+            return free_list.pop()
+        self.counters["malloc"] += 1
+        return self._mod._malloc(size_class)
+
+    def release(self, address: int, size: int):
+        size_class = (size + 7) & ~7
+        free_list = self._free_lists.setdefault(size_class, [])
+        if len(free_list) < self._max_free_per_class:
+            self.counters["released"] += 1
+            free_list.append(address)
+        else:
+            self.counters["free"] += 1
+            self._mod._free(address)
+
+    def free(self, address: int):
+        """Free memory of the same wasm module that is not pooled (arrays)"""
+        self._mod._free(address)
+
+
+_struct_pool = StructPool(_mod)
+
+
+def get_allocation_counters() -> dict:
+    """Get how many struct allocations went to malloc/free and how many were served by the pool"""
+    return dict(_struct_pool.counters)
+
+
+def reset_allocation_counters():
+    """Set the struct allocation counters back to 0"""
+    for name in _struct_pool.counters:
+        _struct_pool.counters[name] = 0
+
+
+def _new_struct(stype):
+    """New stype instance in pooled memory that is left uninitialized, for values the wasm writes (return values)"""
+    out = stype.__new__(stype)
+    out._frozen = False
+    out._address = _struct_pool.alloc(stype._size)
+    out._to_free = _struct_pool
+    return out
+
+import array
+import contextlib
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("numpy views of wasm arrays need numpy, import it in your code "
+                          "or load it with pyodide.loadPackage('numpy')") from None
+    return numpy
+
+
+class WasmArray:
+    """Generic array-like collection that uses wasm as memory-back"""
+    _dtype = None  # numpy dtype of an item
+    _typecode = None  # array module typecode of an item, if an item is a primitive
+    _to_free = False  # nothing to free if __init__ raises before the memory is allocated
+    
+    def __init__(self, item_size: int, length: int, address: int = 0):
+        self._length = length
+        self._item_size = item_size
+        self._size = self._item_size * self._length
+        if address != 0:
+            self._address: int = address
+            self._to_free = False
+        else:
+            self._address: int = _mod._malloc(self._size)
+            self._to_free = _struct_pool  # the pool of the wasm module the memory is from frees it
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.free(self._address)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        # over the length, __getitem__ doesn't raise IndexError past the end
+        return (self[i] for i in range(self._length))
+
+    def __str__(self):
+        out = "WasmArray["
+        out += ', '.join([str(self[i]) for i in range(self._length)])
+        out += "] " + hex(self._address)
+        return out
+
+    def _byte_range(self, item: slice) -> tuple[int, int]:
+        start, stop, step = item.indices(self._length)
+        if step != 1:
+            raise ValueError("only contiguous slices can be copied in bulk")
+        return self._address + start * self._item_size, self._address + max(start, stop) * self._item_size
+
+    def _assign_slice(self, item: slice, values):
+        begin, end = self._byte_range(item)
+        if self._typecode is not None and not hasattr(values, "dtype"):
+            data = memoryview(array.array(self._typecode, values)).cast("B")
+        else:
+            numpy = _import_numpy()
+            data = numpy.ascontiguousarray(values, dtype=self._dtype).reshape(-1).view(numpy.uint8)
+        if len(data) != end - begin:
+            raise ValueError(f"can't copy {len(data) // self._item_size} items into a slice of "
+                             f"{(end - begin) // self._item_size} items")
+        _heap.u8.subarray(begin, end).assign(data)
+
+    def as_numpy(self):
+        """Copy the array into a new numpy array, with one bulk read of wasm memory"""
+        numpy = _import_numpy()
+        out = numpy.empty(self._length, dtype=self._dtype)
+        _heap.u8.subarray(self._address, self._address + self._size).assign_to(out.view(numpy.uint8))
+        return out
+
+    def from_numpy(self, values):
+        """Copy a numpy array (anything numpy can convert to the item dtype) into the array, with one bulk write"""
+        self._assign_slice(slice(None), values)
+
+    @contextlib.contextmanager
+    def numpy(self):
+        """Edit the array as a numpy array, it is written back to wasm memory when the with block ends"""
+        out = self.as_numpy()
+        yield out
+        self.from_numpy(out)
+
+
+class StructArray(WasmArray):
+    """an array of structs"""
+    def __init__(self, stype, length, address: int = 0):
+        super(StructArray, self).__init__(stype._size, length, address)
+        self._stype = stype
+        self._dtype = stype._dtype_spec
+
+    def __getitem__(self, item):
+        return self._stype(address=(self._address + (self._item_size * item)))
+
+    def __setitem__(self, item, value):
+        if isinstance(item, slice):
+            self._assign_slice(item, value)
+        else:
+            struct_clone(value, self._address + (self._item_size * item))
+
+    def _assign_slice(self, item: slice, values):
+        if hasattr(values, "dtype"):
+            numpy = _import_numpy()
+            values = numpy.asarray(values)
+            if values.dtype.names is None and values.ndim == 2:
+                values = self._rows_as_items(values)
+            super(StructArray, self)._assign_slice(item, values)
+            return
+        if not isinstance(values, (StructArray, list, tuple)):
+            values = list(values)
+        begin, end = self._byte_range(item)
+        if len(values) * self._item_size != end - begin:
+            raise ValueError(f"can't copy {len(values)} items into a slice of {(end - begin) // self._item_size} items")
+        if isinstance(values, StructArray):
+            if values._stype is not self._stype:
+                raise TypeError(f"can't copy {values._stype.__name__} items into a StructArray of {self._stype.__name__}")
+            _memcpy(begin, values._address, end - begin)
+        elif values and hasattr(values[0], "_address"):
+            # struct instances (or their shadows), copied one by one
+            for i, value in enumerate(values):
+                struct_clone(value, begin + i * self._item_size)
+        else:
+            super(StructArray, self)._assign_slice(item, values)
+
+    def _rows_as_items(self, rows):
+        """rows of numbers, one field per column like the raymath *_array functions take, as items of the array"""
+        numpy = _import_numpy()
+        dtype = numpy.dtype(self._dtype)
+        field_dtype = dtype.fields[dtype.names[0]][0]
+        # only structs of one kind of number without padding, like Vector2, Rectangle, Matrix or Color
+        if (any(dtype.fields[name][0] != field_dtype for name in dtype.names) or rows.shape[1] != len(dtype.names)
+                or dtype.itemsize != len(dtype.names) * field_dtype.itemsize):
+            raise ValueError(f"can't copy rows of {rows.shape[1]} numbers into {self._stype.__name__} items")
+        return numpy.ascontiguousarray(rows, dtype=field_dtype).view(dtype).reshape(-1)
+    
+class PixelArray(WasmArray):
+    """Pixels in wasm memory in a raylib pixel format, an item is the value of one channel, shape is
+    (height, width, channels): pixels[i] is an item, pixels[y, x] the channels of a pixel, pixels[y, x, c] one channel"""
+    # pixel format -> numpy dtype, array typecode and heap view of a channel, channels per pixel,
+    # the packed 16 bits formats (R5G6B5, R5G5B5A1, R4G4B4A4) have one uint16 channel
+    _formats = {
+        1: ("<u1", "B", "u8", 1),  # PIXELFORMAT_UNCOMPRESSED_GRAYSCALE
+        2: ("<u1", "B", "u8", 2),  # PIXELFORMAT_UNCOMPRESSED_GRAY_ALPHA
+        3: ("<u2", "H", "u16", 1),  # PIXELFORMAT_UNCOMPRESSED_R5G6B5
+        4: ("<u1", "B", "u8", 3),  # PIXELFORMAT_UNCOMPRESSED_R8G8B8
+        5: ("<u2", "H", "u16", 1),  # PIXELFORMAT_UNCOMPRESSED_R5G5B5A1
+        6: ("<u2", "H", "u16", 1),  # PIXELFORMAT_UNCOMPRESSED_R4G4B4A4
+        7: ("<u1", "B", "u8", 4),  # PIXELFORMAT_UNCOMPRESSED_R8G8B8A8
+        8: ("<f4", "f", "f32", 1),  # PIXELFORMAT_UNCOMPRESSED_R32
+        9: ("<f4", "f", "f32", 3),  # PIXELFORMAT_UNCOMPRESSED_R32G32B32
+        10: ("<f4", "f", "f32", 4),  # PIXELFORMAT_UNCOMPRESSED_R32G32B32A32
+    }
+
+    def __init__(self, width: int, height: int, format: int = 7, address: int = 0):
+        if format not in PixelArray._formats:
+            raise ValueError(f"pixel format {format} is compressed (or unknown), its pixels can't be accessed")
+        self._dtype, self._typecode, self._view, channels = PixelArray._formats[format]
+        self.format = format
+        self.shape = (height, width, channels)
+        item_size = int(self._dtype[2:])
+        self._shift = item_size.bit_length() - 1  # heap view index of an address
+        super(PixelArray, self).__init__(item_size, height * width * channels, address)
+
+    @classmethod
+    def pixel_size(cls, format: int) -> int:
+        """Bytes per pixel of an uncompressed pixel format"""
+        if format not in cls._formats:
+            raise ValueError(f"pixel format {format} is compressed (or unknown), its pixels can't be accessed")
+        dtype, _, _, channels = cls._formats[format]
+        return int(dtype[2:]) * channels
+
+    def _index(self, item) -> int:
+        y, x, channel = item
+        return (y * self.shape[1] + x) * self.shape[2] + channel
+
+    def __getitem__(self, item):
+        view = getattr(_heap, self._view)
+        if isinstance(item, tuple) and len(item) == 2:
+            first = (self._address >> self._shift) + self._index((*item, 0))
+            return tuple(view[first + channel] for channel in range(self.shape[2]))
+        if isinstance(item, tuple):
+            item = self._index(item)
+        return view[(self._address >> self._shift) + item]
+
+    def __setitem__(self, item, value):
+        if isinstance(item, slice):
+            self._assign_slice(item, value)
+            return
+        view = getattr(_heap, self._view)
+        if isinstance(item, tuple) and len(item) == 2:
+            first = (self._address >> self._shift) + self._index((*item, 0))
+            for channel in range(self.shape[2]):
+                view[first + channel] = value[channel]
+            return
+        if isinstance(item, tuple):
+            item = self._index(item)
+        view[(self._address >> self._shift) + item] = value
+
+    def as_numpy(self):
+        """Copy the pixels into a new numpy array shaped (height, width, channels), with one bulk read of wasm memory"""
+        return super(PixelArray, self).as_numpy().reshape(self.shape)
+
+class CharArray(WasmArray):
+    _dtype = "<i1"
+    _typecode = "b"
+
+    def __init__(self, length, address: int = 0):
+        super(CharArray, self).__init__(1, length, address)
+
+    def __getitem__(self, item):
+        return _heap.i8[self._address + item]
+
+    def __setitem__(self, item, value):
+        if isinstance(item, slice):
+            self._assign_slice(item, value)
+        else:
+            _heap.i8[self._address + item] = value
+
+
+class UCharArray(WasmArray):
+    _dtype = "<u1"
+    _typecode = "B"
+
+    def __init__(self, length, address: int = 0):
+        super(UCharArray, self).__init__(1, length, address)
+
+    def __getitem__(self, item):
+        return _heap.u8[self._address + item]
+
+    def __setitem__(self, item, value):
+        if isinstance(item, slice):
+            self._assign_slice(item, value)
+        else:
+            _heap.u8[self._address + item] = value
+
+
+class Int16Array(WasmArray):
+    _dtype = "<i2"
+    _typecode = "h"
+
+    def __init__(self, length, address: int = 0):
+        super(Int16Array, self).__init__(2, length, address)
+
+    def __getitem__(self, item):
+        return _heap.i16[(self._address >> 1) + item]
+
+    def __setitem__(self, item, value):
+        if isinstance(item, slice):
+            self._assign_slice(item, value)
+        else:
+            _heap.i16[(self._address >> 1) + item] = value
+
+
+class UInt16Array(WasmArray):
+    _dtype = "<u2"
+    _typecode = "H"
+
+    def __init__(self, length, address: int = 0):
+        super(UInt16Array, self).__init__(2, length, address)
+
+    def __getitem__(self, item):
+        return _heap.u16[(self._address >> 1) + item]
+
+    def __setitem__(self, item, value):
+        if isinstance(item, slice):
+            self._assign_slice(item, value)
+        else:
+            _heap.u16[(self._address >> 1) + item] = value
+
+
+class Int32Array(WasmArray):
+    _dtype = "<i4"
+    _typecode = "i"
+
+    def __init__(self, length, address: int = 0):
+        super(Int32Array, self).__init__(4, length, address)
+
+    def __getitem__(self, item):
+        return _heap.i32[(self._address >> 2) + item]
+
+    def __setitem__(self, item, value):
+        if isinstance(item, slice):
+            self._assign_slice(item, value)
+        else:
+            _heap.i32[(self._address >> 2) + item] = value
+
+
+class UInt32Array(WasmArray):
+    _dtype = "<u4"
+    _typecode = "I"
+
+    def __init__(self, length, address: int = 0):
+        super(UInt32Array, self).__init__(4, length, address)
+
+    def __getitem__(self, item):
+        return _heap.u32[(self._address >> 2) + item]
+
+    def __setitem__(self, item, value):
+        if isinstance(item, slice):
+            self._assign_slice(item, value)
+        else:
+            _heap.u32[(self._address >> 2) + item] = value
+
+
+class FloatArray(WasmArray):
+    _dtype = "<f4"
+    _typecode = "f"
+
+    def __init__(self, length, address: int = 0):
+        super(FloatArray, self).__init__(4, length, address)
+
+    def __getitem__(self, item):
+        return _heap.f32[(self._address >> 2) + item]
+
+    def __setitem__(self, item, value):
+        if isinstance(item, slice):
+            self._assign_slice(item, value)
+        else:
+            _heap.f32[(self._address >> 2) + item] = value
+
+
+class DoubleArray(WasmArray):
+    _dtype = "<f8"
+    _typecode = "d"
+
+    def __init__(self, length, address: int = 0):
+        super(DoubleArray, self).__init__(8, length, address)
+
+    def __getitem__(self, item):
+        return _heap.f64[(self._address >> 3) + item]
+
+    def __setitem__(self, item, value):
+        if isinstance(item, slice):
+            self._assign_slice(item, value)
+        else:
+            _heap.f64[(self._address >> 3) + item] = value
+
+
+class Vector2:
+    """Vector2, 2 components"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 8
+    _dtype_spec: dict = {"names": ["x", "y"], "formats": ["<f4", "<f4"], "offsets": [0, 4], "itemsize": 8}
+
+    def __init__(self, x: float = 0.0, y: float = 0.0, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(8)
+            self._to_free = _struct_pool
+            _heap.f32[self._address >> 2] = x
+            _heap.f32[(self._address + 4) >> 2] = y
+
+    @property
+    def x(self):
+        """Vector x component"""
+        return _heap.f32[self._address >> 2]
+
+    @x.setter
+    def x(self, value):
+        if not self._frozen:
+            _heap.f32[self._address >> 2] = value
+
+    @property
+    def y(self):
+        """Vector y component"""
+        return _heap.f32[(self._address + 4) >> 2]
+
+    @y.setter
+    def y(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 4) >> 2] = value
+
+    def __str__(self):
+        return f"Vector2(address={self._address}, {self.x}, {self.y})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 8)
+
+class Vector2Shadow:
+    """Vector2, 2 components, fields are python numbers copied into wasm memory only when passed to a function"""
+
+    __slots__ = ("x", "y", "_written", "_slot", "_frame")
+
+    _size: int = 8
+    _struct = Vector2
+
+    def __init__(self, x: float = 0.0, y: float = 0.0):
+        self.x = x
+        self.y = y
+        self._written = None  # the field values last copied into wasm memory
+        self._slot = 0
+        self._frame = -1
+
+    @property
+    def _address(self):
+        """Address of a copy of the fields in wasm memory, valid until the end of the frame"""
+        values = (self.x, self.y)
+        if values != self._written or self._frame != _scratch_arena.frame:
+            address = _scratch_arena.alloc(8)
+            _heap.f32[address >> 2] = values[0]
+            _heap.f32[(address + 4) >> 2] = values[1]
+            self._written = values
+            self._slot = address
+            self._frame = _scratch_arena.frame
+        return self._slot
+
+    @classmethod
+    def from_struct(cls, value: Vector2):
+        """Shadow copy of a Vector2"""
+        return cls(value.x, value.y)
+
+    def _assign(self, value: Vector2):
+        """Set the fields to the ones of a Vector2"""
+        self.x, self.y = value.x, value.y
+
+    def to_struct(self) -> Vector2:
+        """Vector2 in wasm memory with the same fields"""
+        return Vector2(self.x, self.y)
+
+    def __str__(self):
+        return f"Vector2Shadow({self.x}, {self.y})"
+
+class Vector3:
+    """Vector3, 3 components"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 12
+    _dtype_spec: dict = {"names": ["x", "y", "z"], "formats": ["<f4", "<f4", "<f4"], "offsets": [0, 4, 8], "itemsize": 12}
+
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(12)
+            self._to_free = _struct_pool
+            _heap.f32[self._address >> 2] = x
+            _heap.f32[(self._address + 4) >> 2] = y
+            _heap.f32[(self._address + 8) >> 2] = z
+
+    @property
+    def x(self):
+        """Vector x component"""
+        return _heap.f32[self._address >> 2]
+
+    @x.setter
+    def x(self, value):
+        if not self._frozen:
+            _heap.f32[self._address >> 2] = value
+
+    @property
+    def y(self):
+        """Vector y component"""
+        return _heap.f32[(self._address + 4) >> 2]
+
+    @y.setter
+    def y(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 4) >> 2] = value
+
+    @property
+    def z(self):
+        """Vector z component"""
+        return _heap.f32[(self._address + 8) >> 2]
+
+    @z.setter
+    def z(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 8) >> 2] = value
+
+    def __str__(self):
+        return f"Vector3(address={self._address}, {self.x}, {self.y}, {self.z})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 12)
+
+class Vector3Shadow:
+    """Vector3, 3 components, fields are python numbers copied into wasm memory only when passed to a function"""
+
+    __slots__ = ("x", "y", "z", "_written", "_slot", "_frame")
+
+    _size: int = 12
+    _struct = Vector3
+
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0):
+        self.x = x
+        self.y = y
+        self.z = z
+        self._written = None  # the field values last copied into wasm memory
+        self._slot = 0
+        self._frame = -1
+
+    @property
+    def _address(self):
+        """Address of a copy of the fields in wasm memory, valid until the end of the frame"""
+        values = (self.x, self.y, self.z)
+        if values != self._written or self._frame != _scratch_arena.frame:
+            address = _scratch_arena.alloc(12)
+            _heap.f32[address >> 2] = values[0]
+            _heap.f32[(address + 4) >> 2] = values[1]
+            _heap.f32[(address + 8) >> 2] = values[2]
+            self._written = values
+            self._slot = address
+            self._frame = _scratch_arena.frame
+        return self._slot
+
+    @classmethod
+    def from_struct(cls, value: Vector3):
+        """Shadow copy of a Vector3"""
+        return cls(value.x, value.y, value.z)
+
+    def _assign(self, value: Vector3):
+        """Set the fields to the ones of a Vector3"""
+        self.x, self.y, self.z = value.x, value.y, value.z
+
+    def to_struct(self) -> Vector3:
+        """Vector3 in wasm memory with the same fields"""
+        return Vector3(self.x, self.y, self.z)
+
+    def __str__(self):
+        return f"Vector3Shadow({self.x}, {self.y}, {self.z})"
+
+class Vector4:
+    """Vector4, 4 components"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 16
+    _dtype_spec: dict = {"names": ["x", "y", "z", "w"], "formats": ["<f4", "<f4", "<f4", "<f4"], "offsets": [0, 4, 8, 12], "itemsize": 16}
+
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0, w: float = 0.0, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(16)
+            self._to_free = _struct_pool
+            _heap.f32[self._address >> 2] = x
+            _heap.f32[(self._address + 4) >> 2] = y
+            _heap.f32[(self._address + 8) >> 2] = z
+            _heap.f32[(self._address + 12) >> 2] = w
+
+    @property
+    def x(self):
+        """Vector x component"""
+        return _heap.f32[self._address >> 2]
+
+    @x.setter
+    def x(self, value):
+        if not self._frozen:
+            _heap.f32[self._address >> 2] = value
+
+    @property
+    def y(self):
+        """Vector y component"""
+        return _heap.f32[(self._address + 4) >> 2]
+
+    @y.setter
+    def y(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 4) >> 2] = value
+
+    @property
+    def z(self):
+        """Vector z component"""
+        return _heap.f32[(self._address + 8) >> 2]
+
+    @z.setter
+    def z(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 8) >> 2] = value
+
+    @property
+    def w(self):
+        """Vector w component"""
+        return _heap.f32[(self._address + 12) >> 2]
+
+    @w.setter
+    def w(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 12) >> 2] = value
+
+    def __str__(self):
+        return f"Vector4(address={self._address}, {self.x}, {self.y}, {self.z}, {self.w})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 16)
+
+class Vector4Shadow:
+    """Vector4, 4 components, fields are python numbers copied into wasm memory only when passed to a function"""
+
+    __slots__ = ("x", "y", "z", "w", "_written", "_slot", "_frame")
+
+    _size: int = 16
+    _struct = Vector4
+
+    def __init__(self, x: float = 0.0, y: float = 0.0, z: float = 0.0, w: float = 0.0):
+        self.x = x
+        self.y = y
+        self.z = z
+        self.w = w
+        self._written = None  # the field values last copied into wasm memory
+        self._slot = 0
+        self._frame = -1
+
+    @property
+    def _address(self):
+        """Address of a copy of the fields in wasm memory, valid until the end of the frame"""
+        values = (self.x, self.y, self.z, self.w)
+        if values != self._written or self._frame != _scratch_arena.frame:
+            address = _scratch_arena.alloc(16)
+            _heap.f32[address >> 2] = values[0]
+            _heap.f32[(address + 4) >> 2] = values[1]
+            _heap.f32[(address + 8) >> 2] = values[2]
+            _heap.f32[(address + 12) >> 2] = values[3]
+            self._written = values
+            self._slot = address
+            self._frame = _scratch_arena.frame
+        return self._slot
+
+    @classmethod
+    def from_struct(cls, value: Vector4):
+        """Shadow copy of a Vector4"""
+        return cls(value.x, value.y, value.z, value.w)
+
+    def _assign(self, value: Vector4):
+        """Set the fields to the ones of a Vector4"""
+        self.x, self.y, self.z, self.w = value.x, value.y, value.z, value.w
+
+    def to_struct(self) -> Vector4:
+        """Vector4 in wasm memory with the same fields"""
+        return Vector4(self.x, self.y, self.z, self.w)
+
+    def __str__(self):
+        return f"Vector4Shadow({self.x}, {self.y}, {self.z}, {self.w})"
+
+Quaternion = Vector4
+
+class Matrix:
+    """Matrix, 4x4 components, column major, OpenGL style, right-handed"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 64
+    _dtype_spec: dict = {"names": ["m0", "m4", "m8", "m12", "m1", "m5", "m9", "m13", "m2", "m6", "m10", "m14", "m3", "m7", "m11", "m15"], "formats": ["<f4", "<f4", "<f4", "<f4", "<f4", "<f4", "<f4", "<f4", "<f4", "<f4", "<f4", "<f4", "<f4", "<f4", "<f4", "<f4"], "offsets": [0, 4, 8, 12, 16, 20, 24, 28, 32, 36, 40, 44, 48, 52, 56, 60], "itemsize": 64}
+
+    def __init__(self, m0: float = 0.0, m4: float = 0.0, m8: float = 0.0, m12: float = 0.0, m1: float = 0.0, m5: float = 0.0, m9: float = 0.0, m13: float = 0.0, m2: float = 0.0, m6: float = 0.0, m10: float = 0.0, m14: float = 0.0, m3: float = 0.0, m7: float = 0.0, m11: float = 0.0, m15: float = 0.0, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(64)
+            self._to_free = _struct_pool
+            _heap.f32[self._address >> 2] = m0
+            _heap.f32[(self._address + 4) >> 2] = m4
+            _heap.f32[(self._address + 8) >> 2] = m8
+            _heap.f32[(self._address + 12) >> 2] = m12
+            _heap.f32[(self._address + 16) >> 2] = m1
+            _heap.f32[(self._address + 20) >> 2] = m5
+            _heap.f32[(self._address + 24) >> 2] = m9
+            _heap.f32[(self._address + 28) >> 2] = m13
+            _heap.f32[(self._address + 32) >> 2] = m2
+            _heap.f32[(self._address + 36) >> 2] = m6
+            _heap.f32[(self._address + 40) >> 2] = m10
+            _heap.f32[(self._address + 44) >> 2] = m14
+            _heap.f32[(self._address + 48) >> 2] = m3
+            _heap.f32[(self._address + 52) >> 2] = m7
+            _heap.f32[(self._address + 56) >> 2] = m11
+            _heap.f32[(self._address + 60) >> 2] = m15
+
+    @property
+    def m0(self):
+        """Matrix first row (4 components)"""
+        return _heap.f32[self._address >> 2]
+
+    @m0.setter
+    def m0(self, value):
+        if not self._frozen:
+            _heap.f32[self._address >> 2] = value
+
+    @property
+    def m4(self):
+        """Matrix first row (4 components)"""
+        return _heap.f32[(self._address + 4) >> 2]
+
+    @m4.setter
+    def m4(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 4) >> 2] = value
+
+    @property
+    def m8(self):
+        """Matrix first row (4 components)"""
+        return _heap.f32[(self._address + 8) >> 2]
+
+    @m8.setter
+    def m8(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 8) >> 2] = value
+
+    @property
+    def m12(self):
+        """Matrix first row (4 components)"""
+        return _heap.f32[(self._address + 12) >> 2]
+
+    @m12.setter
+    def m12(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 12) >> 2] = value
+
+    @property
+    def m1(self):
+        """Matrix second row (4 components)"""
+        return _heap.f32[(self._address + 16) >> 2]
+
+    @m1.setter
+    def m1(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 16) >> 2] = value
+
+    @property
+    def m5(self):
+        """Matrix second row (4 components)"""
+        return _heap.f32[(self._address + 20) >> 2]
+
+    @m5.setter
+    def m5(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 20) >> 2] = value
+
+    @property
+    def m9(self):
+        """Matrix second row (4 components)"""
+        return _heap.f32[(self._address + 24) >> 2]
+
+    @m9.setter
+    def m9(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 24) >> 2] = value
+
+    @property
+    def m13(self):
+        """Matrix second row (4 components)"""
+        return _heap.f32[(self._address + 28) >> 2]
+
+    @m13.setter
+    def m13(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 28) >> 2] = value
+
+    @property
+    def m2(self):
+        """Matrix third row (4 components)"""
+        return _heap.f32[(self._address + 32) >> 2]
+
+    @m2.setter
+    def m2(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 32) >> 2] = value
+
+    @property
+    def m6(self):
+        """Matrix third row (4 components)"""
+        return _heap.f32[(self._address + 36) >> 2]
+
+    @m6.setter
+    def m6(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 36) >> 2] = value
+
+    @property
+    def m10(self):
+        """Matrix third row (4 components)"""
+        return _heap.f32[(self._address + 40) >> 2]
+
+    @m10.setter
+    def m10(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 40) >> 2] = value
+
+    @property
+    def m14(self):
+        """Matrix third row (4 components)"""
+        return _heap.f32[(self._address + 44) >> 2]
+
+    @m14.setter
+    def m14(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 44) >> 2] = value
+
+    @property
+    def m3(self):
+        """Matrix fourth row (4 components)"""
+        return _heap.f32[(self._address + 48) >> 2]
+
+    @m3.setter
+    def m3(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 48) >> 2] = value
+
+    @property
+    def m7(self):
+        """Matrix fourth row (4 components)"""
+        return _heap.f32[(self._address + 52) >> 2]
+
+    @m7.setter
+    def m7(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 52) >> 2] = value
+
+    @property
+    def m11(self):
+        """Matrix fourth row (4 components)"""
+        return _heap.f32[(self._address + 56) >> 2]
+
+    @m11.setter
+    def m11(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 56) >> 2] = value
+
+    @property
+    def m15(self):
+        """Matrix fourth row (4 components)"""
+        return _heap.f32[(self._address + 60) >> 2]
+
+    @m15.setter
+    def m15(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 60) >> 2] = value
+
+    def __str__(self):
+        return f"Matrix(address={self._address}, {self.m0}, {self.m4}, {self.m8}, {self.m12}, {self.m1}, {self.m5}, {self.m9}, {self.m13}, {self.m2}, {self.m6}, {self.m10}, {self.m14}, {self.m3}, {self.m7}, {self.m11}, {self.m15})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 64)
+
+class Color:
+    """Color, 4 components, R8G8B8A8 (32bit)"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 4
+    _dtype_spec: dict = {"names": ["r", "g", "b", "a"], "formats": ["<u1", "<u1", "<u1", "<u1"], "offsets": [0, 1, 2, 3], "itemsize": 4}
+
+    def __init__(self, r: int = 0, g: int = 0, b: int = 0, a: int = 0, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(4)
+            self._to_free = _struct_pool
+            _heap.u8[self._address] = r
+            _heap.u8[self._address + 1] = g
+            _heap.u8[self._address + 2] = b
+            _heap.u8[self._address + 3] = a
+
+    @property
+    def r(self):
+        """Color red value"""
+        return _heap.u8[self._address]
+
+    @r.setter
+    def r(self, value):
+        if not self._frozen:
+            _heap.u8[self._address] = value
+
+    @property
+    def g(self):
+        """Color green value"""
+        return _heap.u8[self._address + 1]
+
+    @g.setter
+    def g(self, value):
+        if not self._frozen:
+            _heap.u8[self._address + 1] = value
+
+    @property
+    def b(self):
+        """Color blue value"""
+        return _heap.u8[self._address + 2]
+
+    @b.setter
+    def b(self, value):
+        if not self._frozen:
+            _heap.u8[self._address + 2] = value
+
+    @property
+    def a(self):
+        """Color alpha value"""
+        return _heap.u8[self._address + 3]
+
+    @a.setter
+    def a(self, value):
+        if not self._frozen:
+            _heap.u8[self._address + 3] = value
+
+    def __str__(self):
+        return f"Color(address={self._address}, {self.r}, {self.g}, {self.b}, {self.a})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 4)
+
+class ColorShadow:
+    """Color, 4 components, R8G8B8A8 (32bit), fields are python numbers copied into wasm memory only when passed to a function"""
+
+    __slots__ = ("r", "g", "b", "a", "_written", "_slot", "_frame")
+
+    _size: int = 4
+    _struct = Color
+
+    def __init__(self, r: int = 0, g: int = 0, b: int = 0, a: int = 0):
+        self.r = r
+        self.g = g
+        self.b = b
+        self.a = a
+        self._written = None  # the field values last copied into wasm memory
+        self._slot = 0
+        self._frame = -1
+
+    @property
+    def _address(self):
+        """Address of a copy of the fields in wasm memory, valid until the end of the frame"""
+        values = (self.r, self.g, self.b, self.a)
+        if values != self._written or self._frame != _scratch_arena.frame:
+            address = _scratch_arena.alloc(4)
+            _heap.u8[address] = values[0]
+            _heap.u8[address + 1] = values[1]
+            _heap.u8[address + 2] = values[2]
+            _heap.u8[address + 3] = values[3]
+            self._written = values
+            self._slot = address
+            self._frame = _scratch_arena.frame
+        return self._slot
+
+    @classmethod
+    def from_struct(cls, value: Color):
+        """Shadow copy of a Color"""
+        return cls(value.r, value.g, value.b, value.a)
+
+    def _assign(self, value: Color):
+        """Set the fields to the ones of a Color"""
+        self.r, self.g, self.b, self.a = value.r, value.g, value.b, value.a
+
+    def to_struct(self) -> Color:
+        """Color in wasm memory with the same fields"""
+        return Color(self.r, self.g, self.b, self.a)
+
+    def __str__(self):
+        return f"ColorShadow({self.r}, {self.g}, {self.b}, {self.a})"
+
+class Rectangle:
+    """Rectangle, 4 components"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 16
+    _dtype_spec: dict = {"names": ["x", "y", "width", "height"], "formats": ["<f4", "<f4", "<f4", "<f4"], "offsets": [0, 4, 8, 12], "itemsize": 16}
+
+    def __init__(self, x: float = 0.0, y: float = 0.0, width: float = 0.0, height: float = 0.0, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(16)
+            self._to_free = _struct_pool
+            _heap.f32[self._address >> 2] = x
+            _heap.f32[(self._address + 4) >> 2] = y
+            _heap.f32[(self._address + 8) >> 2] = width
+            _heap.f32[(self._address + 12) >> 2] = height
+
+    @property
+    def x(self):
+        """Rectangle top-left corner position x"""
+        return _heap.f32[self._address >> 2]
+
+    @x.setter
+    def x(self, value):
+        if not self._frozen:
+            _heap.f32[self._address >> 2] = value
+
+    @property
+    def y(self):
+        """Rectangle top-left corner position y"""
+        return _heap.f32[(self._address + 4) >> 2]
+
+    @y.setter
+    def y(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 4) >> 2] = value
+
+    @property
+    def width(self):
+        """Rectangle width"""
+        return _heap.f32[(self._address + 8) >> 2]
+
+    @width.setter
+    def width(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 8) >> 2] = value
+
+    @property
+    def height(self):
+        """Rectangle height"""
+        return _heap.f32[(self._address + 12) >> 2]
+
+    @height.setter
+    def height(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 12) >> 2] = value
+
+    def __str__(self):
+        return f"Rectangle(address={self._address}, {self.x}, {self.y}, {self.width}, {self.height})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 16)
+
+class RectangleShadow:
+    """Rectangle, 4 components, fields are python numbers copied into wasm memory only when passed to a function"""
+
+    __slots__ = ("x", "y", "width", "height", "_written", "_slot", "_frame")
+
+    _size: int = 16
+    _struct = Rectangle
+
+    def __init__(self, x: float = 0.0, y: float = 0.0, width: float = 0.0, height: float = 0.0):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self._written = None  # the field values last copied into wasm memory
+        self._slot = 0
+        self._frame = -1
+
+    @property
+    def _address(self):
+        """Address of a copy of the fields in wasm memory, valid until the end of the frame"""
+        values = (self.x, self.y, self.width, self.height)
+        if values != self._written or self._frame != _scratch_arena.frame:
+            address = _scratch_arena.alloc(16)
+            _heap.f32[address >> 2] = values[0]
+            _heap.f32[(address + 4) >> 2] = values[1]
+            _heap.f32[(address + 8) >> 2] = values[2]
+            _heap.f32[(address + 12) >> 2] = values[3]
+            self._written = values
+            self._slot = address
+            self._frame = _scratch_arena.frame
+        return self._slot
+
+    @classmethod
+    def from_struct(cls, value: Rectangle):
+        """Shadow copy of a Rectangle"""
+        return cls(value.x, value.y, value.width, value.height)
+
+    def _assign(self, value: Rectangle):
+        """Set the fields to the ones of a Rectangle"""
+        self.x, self.y, self.width, self.height = value.x, value.y, value.width, value.height
+
+    def to_struct(self) -> Rectangle:
+        """Rectangle in wasm memory with the same fields"""
+        return Rectangle(self.x, self.y, self.width, self.height)
+
+    def __str__(self):
+        return f"RectangleShadow({self.x}, {self.y}, {self.width}, {self.height})"
+
+class Image:
+    """Image, pixel data stored in CPU memory (RAM)"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 20
+    _dtype_spec: dict = {"names": ["data", "width", "height", "mipmaps", "format"], "formats": ["<u4", "<i4", "<i4", "<i4", "<i4"], "offsets": [0, 4, 8, 12, 16], "itemsize": 20}
+
+    def __init__(self, data: int = 0, width: int = 0, height: int = 0, mipmaps: int = 0, format: int = 0, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(20)
+            self._to_free = _struct_pool
+            _heap.u32[self._address >> 2] = data
+            _heap.i32[(self._address + 4) >> 2] = width
+            _heap.i32[(self._address + 8) >> 2] = height
+            _heap.i32[(self._address + 12) >> 2] = mipmaps
+            _heap.i32[(self._address + 16) >> 2] = format
+
+    @property
+    def data(self):
+        """Image raw data"""
+        return _heap.u32[self._address >> 2]
+
+    @data.setter
+    def data(self, value):
+        if not self._frozen:
+            _heap.u32[self._address >> 2] = value
+
+    @property
+    def width(self):
+        """Image base width"""
+        return _heap.i32[(self._address + 4) >> 2]
+
+    @width.setter
+    def width(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 4) >> 2] = value
+
+    @property
+    def height(self):
+        """Image base height"""
+        return _heap.i32[(self._address + 8) >> 2]
+
+    @height.setter
+    def height(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 8) >> 2] = value
+
+    @property
+    def mipmaps(self):
+        """Mipmap levels, 1 by default"""
+        return _heap.i32[(self._address + 12) >> 2]
+
+    @mipmaps.setter
+    def mipmaps(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 12) >> 2] = value
+
+    @property
+    def format(self):
+        """Data format (PixelFormat type)"""
+        return _heap.i32[(self._address + 16) >> 2]
+
+    @format.setter
+    def format(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 16) >> 2] = value
+
+    def pixels(self) -> PixelArray:
+        """The pixels of the image (of its first mipmap) where they are in wasm memory, shaped (height, width,
+        channels) by its format, valid until the image is unloaded or its data reallocated"""
+        return PixelArray(self.width, self.height, self.format, address=self.data)
+
+    def __str__(self):
+        return f"Image(address={self._address}, {self.data}, {self.width}, {self.height}, {self.mipmaps}, {self.format})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 20)
+
+class Texture:
+    """Texture, tex data stored in GPU memory (VRAM)"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 20
+    _dtype_spec: dict = {"names": ["id", "width", "height", "mipmaps", "format"], "formats": ["<u4", "<i4", "<i4", "<i4", "<i4"], "offsets": [0, 4, 8, 12, 16], "itemsize": 20}
+
+    def __init__(self, id: int = 0, width: int = 0, height: int = 0, mipmaps: int = 0, format: int = 0, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(20)
+            self._to_free = _struct_pool
+            _heap.u32[self._address >> 2] = id
+            _heap.i32[(self._address + 4) >> 2] = width
+            _heap.i32[(self._address + 8) >> 2] = height
+            _heap.i32[(self._address + 12) >> 2] = mipmaps
+            _heap.i32[(self._address + 16) >> 2] = format
+
+    @property
+    def id(self):
+        """OpenGL texture id"""
+        return _heap.u32[self._address >> 2]
+
+    @id.setter
+    def id(self, value):
+        if not self._frozen:
+            _heap.u32[self._address >> 2] = value
+
+    @property
+    def width(self):
+        """Texture base width"""
+        return _heap.i32[(self._address + 4) >> 2]
+
+    @width.setter
+    def width(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 4) >> 2] = value
+
+    @property
+    def height(self):
+        """Texture base height"""
+        return _heap.i32[(self._address + 8) >> 2]
+
+    @height.setter
+    def height(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 8) >> 2] = value
+
+    @property
+    def mipmaps(self):
+        """Mipmap levels, 1 by default"""
+        return _heap.i32[(self._address + 12) >> 2]
+
+    @mipmaps.setter
+    def mipmaps(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 12) >> 2] = value
+
+    @property
+    def format(self):
+        """Data format (PixelFormat type)"""
+        return _heap.i32[(self._address + 16) >> 2]
+
+    @format.setter
+    def format(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 16) >> 2] = value
+
+    def __str__(self):
+        return f"Texture(address={self._address}, {self.id}, {self.width}, {self.height}, {self.mipmaps}, {self.format})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 20)
+
+Texture2D = Texture
+
+TextureCubemap = Texture
+
+class RenderTexture:
+    """RenderTexture, fbo for texture rendering"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 44
+    _dtype_spec: dict = {"names": ["id", "texture", "depth"], "formats": ["<u4", Texture._dtype_spec, Texture._dtype_spec], "offsets": [0, 4, 24], "itemsize": 44}
+
+    def __init__(self, id: int = 0, texture: Texture = None, depth: Texture = None, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(44)
+            self._to_free = _struct_pool
+            _heap.u32[self._address >> 2] = id
+            if texture is not None:
+                struct_clone(texture, self._address + 4)
+            else:
+                _heap.u8.fill(0, self._address + 4, self._address + 24)
+            if depth is not None:
+                struct_clone(depth, self._address + 24)
+            else:
+                _heap.u8.fill(0, self._address + 24, self._address + 44)
+
+    @property
+    def id(self):
+        """OpenGL framebuffer object id"""
+        return _heap.u32[self._address >> 2]
+
+    @id.setter
+    def id(self, value):
+        if not self._frozen:
+            _heap.u32[self._address >> 2] = value
+
+    @property
+    def texture(self):
+        """Color buffer attachment texture"""
+        return Texture(0, address=self._address + 4)
+
+    @texture.setter
+    def texture(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 4)
+
+    @property
+    def depth(self):
+        """Depth buffer attachment texture"""
+        return Texture(0, address=self._address + 24)
+
+    @depth.setter
+    def depth(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 24)
+
+    def __str__(self):
+        return f"RenderTexture(address={self._address}, {self.id}, {self.texture}, {self.depth})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 44)
+
+RenderTexture2D = RenderTexture
+
+class Font:
+    """Font, font texture and GlyphInfo array data"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 40
+    _dtype_spec: dict = {"names": ["baseSize", "glyphCount", "glyphPadding", "texture", "recs", "glyphs"], "formats": ["<i4", "<i4", "<i4", Texture2D._dtype_spec, "<u4", "<u4"], "offsets": [0, 4, 8, 12, 32, 36], "itemsize": 40}
+
+    def __init__(self, baseSize: int = 0, glyphCount: int = 0, glyphPadding: int = 0, texture: Texture2D = None, recs: int = 0, glyphs: int = 0, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(40)
+            self._to_free = _struct_pool
+            _heap.i32[self._address >> 2] = baseSize
+            _heap.i32[(self._address + 4) >> 2] = glyphCount
+            _heap.i32[(self._address + 8) >> 2] = glyphPadding
+            if texture is not None:
+                struct_clone(texture, self._address + 12)
+            else:
+                _heap.u8.fill(0, self._address + 12, self._address + 32)
+            _heap.u32[(self._address + 32) >> 2] = recs
+            _heap.u32[(self._address + 36) >> 2] = glyphs
+
+    @property
+    def baseSize(self):
+        """Base size (default chars height)"""
+        return _heap.i32[self._address >> 2]
+
+    @baseSize.setter
+    def baseSize(self, value):
+        if not self._frozen:
+            _heap.i32[self._address >> 2] = value
+
+    @property
+    def glyphCount(self):
+        """Number of glyph characters"""
+        return _heap.i32[(self._address + 4) >> 2]
+
+    @glyphCount.setter
+    def glyphCount(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 4) >> 2] = value
+
+    @property
+    def glyphPadding(self):
+        """Padding around the glyph characters"""
+        return _heap.i32[(self._address + 8) >> 2]
+
+    @glyphPadding.setter
+    def glyphPadding(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 8) >> 2] = value
+
+    @property
+    def texture(self):
+        """Texture atlas containing the glyphs"""
+        return Texture2D(0, address=self._address + 12)
+
+    @texture.setter
+    def texture(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 12)
+
+    @property
+    def recs(self):
+        """Rectangles in texture for the glyphs"""
+        return _heap.u32[(self._address + 32) >> 2]
+
+    @recs.setter
+    def recs(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 32) >> 2] = value
+
+    @property
+    def glyphs(self):
+        """Glyphs info data"""
+        return _heap.u32[(self._address + 36) >> 2]
+
+    @glyphs.setter
+    def glyphs(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 36) >> 2] = value
+
+    def __str__(self):
+        return f"Font(address={self._address}, {self.baseSize}, {self.glyphCount}, {self.glyphPadding}, {self.texture}, {self.recs}, {self.glyphs})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 40)
+
+class Camera3D:
+    """Camera, defines position/orientation in 3d space"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 44
+    _dtype_spec: dict = {"names": ["position", "target", "up", "fovy", "projection"], "formats": [Vector3._dtype_spec, Vector3._dtype_spec, Vector3._dtype_spec, "<f4", "<i4"], "offsets": [0, 12, 24, 36, 40], "itemsize": 44}
+
+    def __init__(self, position: Vector3 = None, target: Vector3 = None, up: Vector3 = None, fovy: float = 0.0, projection: int = 0, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(44)
+            self._to_free = _struct_pool
+            if position is not None:
+                struct_clone(position, self._address + 0)
+            else:
+                _heap.u8.fill(0, self._address + 0, self._address + 12)
+            if target is not None:
+                struct_clone(target, self._address + 12)
+            else:
+                _heap.u8.fill(0, self._address + 12, self._address + 24)
+            if up is not None:
+                struct_clone(up, self._address + 24)
+            else:
+                _heap.u8.fill(0, self._address + 24, self._address + 36)
+            _heap.f32[(self._address + 36) >> 2] = fovy
+            _heap.i32[(self._address + 40) >> 2] = projection
+
+    @property
+    def position(self):
+        """Camera position"""
+        return Vector3(0, address=self._address + 0)
+
+    @position.setter
+    def position(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 0)
+
+    @property
+    def target(self):
+        """Camera target it looks-at"""
+        return Vector3(0, address=self._address + 12)
+
+    @target.setter
+    def target(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 12)
+
+    @property
+    def up(self):
+        """Camera up vector (rotation over its axis)"""
+        return Vector3(0, address=self._address + 24)
+
+    @up.setter
+    def up(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 24)
+
+    @property
+    def fovy(self):
+        """Camera field-of-view aperture in Y (degrees) in perspective, used as near plane width in orthographic"""
+        return _heap.f32[(self._address + 36) >> 2]
+
+    @fovy.setter
+    def fovy(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 36) >> 2] = value
+
+    @property
+    def projection(self):
+        """Camera projection: CAMERA_PERSPECTIVE or CAMERA_ORTHOGRAPHIC"""
+        return _heap.i32[(self._address + 40) >> 2]
+
+    @projection.setter
+    def projection(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 40) >> 2] = value
+
+    def __str__(self):
+        return f"Camera3D(address={self._address}, {self.position}, {self.target}, {self.up}, {self.fovy}, {self.projection})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 44)
+
+Camera = Camera3D
+
+class Camera2D:
+    """Camera2D, defines position/orientation in 2d space"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 24
+    _dtype_spec: dict = {"names": ["offset", "target", "rotation", "zoom"], "formats": [Vector2._dtype_spec, Vector2._dtype_spec, "<f4", "<f4"], "offsets": [0, 8, 16, 20], "itemsize": 24}
+
+    def __init__(self, offset: Vector2 = None, target: Vector2 = None, rotation: float = 0.0, zoom: float = 0.0, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(24)
+            self._to_free = _struct_pool
+            if offset is not None:
+                struct_clone(offset, self._address + 0)
+            else:
+                _heap.u8.fill(0, self._address + 0, self._address + 8)
+            if target is not None:
+                struct_clone(target, self._address + 8)
+            else:
+                _heap.u8.fill(0, self._address + 8, self._address + 16)
+            _heap.f32[(self._address + 16) >> 2] = rotation
+            _heap.f32[(self._address + 20) >> 2] = zoom
+
+    @property
+    def offset(self):
+        """Camera offset (displacement from target)"""
+        return Vector2(0, address=self._address + 0)
+
+    @offset.setter
+    def offset(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 0)
+
+    @property
+    def target(self):
+        """Camera target (rotation and zoom origin)"""
+        return Vector2(0, address=self._address + 8)
+
+    @target.setter
+    def target(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 8)
+
+    @property
+    def rotation(self):
+        """Camera rotation in degrees"""
+        return _heap.f32[(self._address + 16) >> 2]
+
+    @rotation.setter
+    def rotation(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 16) >> 2] = value
+
+    @property
+    def zoom(self):
+        """Camera zoom (scaling), should be 1.0f by default"""
+        return _heap.f32[(self._address + 20) >> 2]
+
+    @zoom.setter
+    def zoom(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 20) >> 2] = value
+
+    def __str__(self):
+        return f"Camera2D(address={self._address}, {self.offset}, {self.target}, {self.rotation}, {self.zoom})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 24)
+
+class Shader:
+    """Shader"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 8
+    _dtype_spec: dict = {"names": ["id", "locs"], "formats": ["<u4", "<u4"], "offsets": [0, 4], "itemsize": 8}
+
+    def __init__(self, id: int = 0, locs: int = 0, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(8)
+            self._to_free = _struct_pool
+            _heap.u32[self._address >> 2] = id
+            _heap.u32[(self._address + 4) >> 2] = locs
+
+    @property
+    def id(self):
+        """Shader program id"""
+        return _heap.u32[self._address >> 2]
+
+    @id.setter
+    def id(self, value):
+        if not self._frozen:
+            _heap.u32[self._address >> 2] = value
+
+    @property
+    def locs(self):
+        """Shader locations array (RL_MAX_SHADER_LOCATIONS)"""
+        return _heap.u32[(self._address + 4) >> 2]
+
+    @locs.setter
+    def locs(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 4) >> 2] = value
+
+    def __str__(self):
+        return f"Shader(address={self._address}, {self.id}, {self.locs})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 8)
+
+class Ray:
+    """Ray, ray for raycasting"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 24
+    _dtype_spec: dict = {"names": ["position", "direction"], "formats": [Vector3._dtype_spec, Vector3._dtype_spec], "offsets": [0, 12], "itemsize": 24}
+
+    def __init__(self, position: Vector3 = None, direction: Vector3 = None, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(24)
+            self._to_free = _struct_pool
+            if position is not None:
+                struct_clone(position, self._address + 0)
+            else:
+                _heap.u8.fill(0, self._address + 0, self._address + 12)
+            if direction is not None:
+                struct_clone(direction, self._address + 12)
+            else:
+                _heap.u8.fill(0, self._address + 12, self._address + 24)
+
+    @property
+    def position(self):
+        """Ray position (origin)"""
+        return Vector3(0, address=self._address + 0)
+
+    @position.setter
+    def position(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 0)
+
+    @property
+    def direction(self):
+        """Ray direction"""
+        return Vector3(0, address=self._address + 12)
+
+    @direction.setter
+    def direction(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 12)
+
+    def __str__(self):
+        return f"Ray(address={self._address}, {self.position}, {self.direction})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 24)
+
+class VrDeviceInfo:
+    """VrDeviceInfo, Head-Mounted-Display device parameters"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 64
+    _dtype_spec: dict = {"names": ["hResolution", "vResolution", "hScreenSize", "vScreenSize", "vScreenCenter", "eyeToScreenDistance", "lensSeparationDistance", "interpupillaryDistance", "lensDistortionValues", "chromaAbCorrection"], "formats": ["<i4", "<i4", "<f4", "<f4", "<f4", "<f4", "<f4", "<f4", ("<f4", (4,)), ("<f4", (4,))], "offsets": [0, 4, 8, 12, 16, 20, 24, 28, 32, 48], "itemsize": 64}
+
+    def __init__(self, hResolution: int = 0, vResolution: int = 0, hScreenSize: float = 0.0, vScreenSize: float = 0.0, vScreenCenter: float = 0.0, eyeToScreenDistance: float = 0.0, lensSeparationDistance: float = 0.0, interpupillaryDistance: float = 0.0, lensDistortionValues: FloatArray = None, chromaAbCorrection: FloatArray = None, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(64)
+            self._to_free = _struct_pool
+            _heap.i32[self._address >> 2] = hResolution
+            _heap.i32[(self._address + 4) >> 2] = vResolution
+            _heap.f32[(self._address + 8) >> 2] = hScreenSize
+            _heap.f32[(self._address + 12) >> 2] = vScreenSize
+            _heap.f32[(self._address + 16) >> 2] = vScreenCenter
+            _heap.f32[(self._address + 20) >> 2] = eyeToScreenDistance
+            _heap.f32[(self._address + 24) >> 2] = lensSeparationDistance
+            _heap.f32[(self._address + 28) >> 2] = interpupillaryDistance
+            if lensDistortionValues is not None:
+                struct_clone(lensDistortionValues, self._address + 32)
+            else:
+                _heap.u8.fill(0, self._address + 32, self._address + 48)
+            if chromaAbCorrection is not None:
+                struct_clone(chromaAbCorrection, self._address + 48)
+            else:
+                _heap.u8.fill(0, self._address + 48, self._address + 64)
+
+    @property
+    def hResolution(self):
+        """Horizontal resolution in pixels"""
+        return _heap.i32[self._address >> 2]
+
+    @hResolution.setter
+    def hResolution(self, value):
+        if not self._frozen:
+            _heap.i32[self._address >> 2] = value
+
+    @property
+    def vResolution(self):
+        """Vertical resolution in pixels"""
+        return _heap.i32[(self._address + 4) >> 2]
+
+    @vResolution.setter
+    def vResolution(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 4) >> 2] = value
+
+    @property
+    def hScreenSize(self):
+        """Horizontal size in meters"""
+        return _heap.f32[(self._address + 8) >> 2]
+
+    @hScreenSize.setter
+    def hScreenSize(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 8) >> 2] = value
+
+    @property
+    def vScreenSize(self):
+        """Vertical size in meters"""
+        return _heap.f32[(self._address + 12) >> 2]
+
+    @vScreenSize.setter
+    def vScreenSize(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 12) >> 2] = value
+
+    @property
+    def vScreenCenter(self):
+        """Screen center in meters"""
+        return _heap.f32[(self._address + 16) >> 2]
+
+    @vScreenCenter.setter
+    def vScreenCenter(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 16) >> 2] = value
+
+    @property
+    def eyeToScreenDistance(self):
+        """Distance between eye and display in meters"""
+        return _heap.f32[(self._address + 20) >> 2]
+
+    @eyeToScreenDistance.setter
+    def eyeToScreenDistance(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 20) >> 2] = value
+
+    @property
+    def lensSeparationDistance(self):
+        """Lens separation distance in meters"""
+        return _heap.f32[(self._address + 24) >> 2]
+
+    @lensSeparationDistance.setter
+    def lensSeparationDistance(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 24) >> 2] = value
+
+    @property
+    def interpupillaryDistance(self):
+        """IPD (distance between pupils) in meters"""
+        return _heap.f32[(self._address + 28) >> 2]
+
+    @interpupillaryDistance.setter
+    def interpupillaryDistance(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 28) >> 2] = value
+
+    @property
+    def lensDistortionValues(self):
+        """Lens distortion constant parameters"""
+        return FloatArray(4, address=self._address + 32)
+
+    @lensDistortionValues.setter
+    def lensDistortionValues(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 32)
+
+    @property
+    def chromaAbCorrection(self):
+        """Chromatic aberration correction parameters"""
+        return FloatArray(4, address=self._address + 48)
+
+    @chromaAbCorrection.setter
+    def chromaAbCorrection(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 48)
+
+    def __str__(self):
+        return f"VrDeviceInfo(address={self._address}, {self.hResolution}, {self.vResolution}, {self.hScreenSize}, {self.vScreenSize}, {self.vScreenCenter}, {self.eyeToScreenDistance}, {self.lensSeparationDistance}, {self.interpupillaryDistance}, {self.lensDistortionValues}, {self.chromaAbCorrection})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 64)
+
+class VrStereoConfig:
+    """VrStereoConfig, VR stereo rendering configuration for simulator"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 304
+    _dtype_spec: dict = {"names": ["projection", "viewOffset", "leftLensCenter", "rightLensCenter", "leftScreenCenter", "rightScreenCenter", "scale", "scaleIn"], "formats": [(Matrix._dtype_spec, (2,)), (Matrix._dtype_spec, (2,)), ("<f4", (2,)), ("<f4", (2,)), ("<f4", (2,)), ("<f4", (2,)), ("<f4", (2,)), ("<f4", (2,))], "offsets": [0, 128, 256, 264, 272, 280, 288, 296], "itemsize": 304}
+
+    def __init__(self, projection: StructArray = None, viewOffset: StructArray = None, leftLensCenter: FloatArray = None, rightLensCenter: FloatArray = None, leftScreenCenter: FloatArray = None, rightScreenCenter: FloatArray = None, scale: FloatArray = None, scaleIn: FloatArray = None, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(304)
+            self._to_free = _struct_pool
+            if projection is not None:
+                struct_clone(projection, self._address + 0)
+            else:
+                _heap.u8.fill(0, self._address + 0, self._address + 128)
+            if viewOffset is not None:
+                struct_clone(viewOffset, self._address + 128)
+            else:
+                _heap.u8.fill(0, self._address + 128, self._address + 256)
+            if leftLensCenter is not None:
+                struct_clone(leftLensCenter, self._address + 256)
+            else:
+                _heap.u8.fill(0, self._address + 256, self._address + 264)
+            if rightLensCenter is not None:
+                struct_clone(rightLensCenter, self._address + 264)
+            else:
+                _heap.u8.fill(0, self._address + 264, self._address + 272)
+            if leftScreenCenter is not None:
+                struct_clone(leftScreenCenter, self._address + 272)
+            else:
+                _heap.u8.fill(0, self._address + 272, self._address + 280)
+            if rightScreenCenter is not None:
+                struct_clone(rightScreenCenter, self._address + 280)
+            else:
+                _heap.u8.fill(0, self._address + 280, self._address + 288)
+            if scale is not None:
+                struct_clone(scale, self._address + 288)
+            else:
+                _heap.u8.fill(0, self._address + 288, self._address + 296)
+            if scaleIn is not None:
+                struct_clone(scaleIn, self._address + 296)
+            else:
+                _heap.u8.fill(0, self._address + 296, self._address + 304)
+
+    @property
+    def projection(self):
+        """VR projection matrices (per eye)"""
+        return StructArray(Matrix, 2, address=self._address + 0)
+
+    @projection.setter
+    def projection(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 0)
+
+    @property
+    def viewOffset(self):
+        """VR view offset matrices (per eye)"""
+        return StructArray(Matrix, 2, address=self._address + 128)
+
+    @viewOffset.setter
+    def viewOffset(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 128)
+
+    @property
+    def leftLensCenter(self):
+        """VR left lens center"""
+        return FloatArray(2, address=self._address + 256)
+
+    @leftLensCenter.setter
+    def leftLensCenter(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 256)
+
+    @property
+    def rightLensCenter(self):
+        """VR right lens center"""
+        return FloatArray(2, address=self._address + 264)
+
+    @rightLensCenter.setter
+    def rightLensCenter(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 264)
+
+    @property
+    def leftScreenCenter(self):
+        """VR left screen center"""
+        return FloatArray(2, address=self._address + 272)
+
+    @leftScreenCenter.setter
+    def leftScreenCenter(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 272)
+
+    @property
+    def rightScreenCenter(self):
+        """VR right screen center"""
+        return FloatArray(2, address=self._address + 280)
+
+    @rightScreenCenter.setter
+    def rightScreenCenter(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 280)
+
+    @property
+    def scale(self):
+        """VR distortion scale"""
+        return FloatArray(2, address=self._address + 288)
+
+    @scale.setter
+    def scale(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 288)
+
+    @property
+    def scaleIn(self):
+        """VR distortion scale in"""
+        return FloatArray(2, address=self._address + 296)
+
+    @scaleIn.setter
+    def scaleIn(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 296)
+
+    def __str__(self):
+        return f"VrStereoConfig(address={self._address}, {self.projection}, {self.viewOffset}, {self.leftLensCenter}, {self.rightLensCenter}, {self.leftScreenCenter}, {self.rightScreenCenter}, {self.scale}, {self.scaleIn})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 304)
+
+class FilePathList:
+    """File path list"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 12
+    _dtype_spec: dict = {"names": ["capacity", "count", "paths"], "formats": ["<u4", "<u4", "<u4"], "offsets": [0, 4, 8], "itemsize": 12}
+
+    def __init__(self, capacity: int = 0, count: int = 0, paths: int = 0, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(12)
+            self._to_free = _struct_pool
+            _heap.u32[self._address >> 2] = capacity
+            _heap.u32[(self._address + 4) >> 2] = count
+            _heap.u32[(self._address + 8) >> 2] = paths
+
+    @property
+    def capacity(self):
+        """Filepaths max entries"""
+        return _heap.u32[self._address >> 2]
+
+    @capacity.setter
+    def capacity(self, value):
+        if not self._frozen:
+            _heap.u32[self._address >> 2] = value
+
+    @property
+    def count(self):
+        """Filepaths entries count"""
+        return _heap.u32[(self._address + 4) >> 2]
+
+    @count.setter
+    def count(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 4) >> 2] = value
+
+    @property
+    def paths(self):
+        """Filepaths entries"""
+        return _heap.u32[(self._address + 8) >> 2]
+
+    @paths.setter
+    def paths(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 8) >> 2] = value
+
+    def __str__(self):
+        return f"FilePathList(address={self._address}, {self.capacity}, {self.count}, {self.paths})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 12)
+
+
+import warnings
+
+
+def check_struct_layouts(structs: list) -> list[str]:
+    """Compare the size and member offsets of struct classes with sizeof/offsetof in the wasm, warns about and returns the mismatches
+
+    structs is a list of (struct class, index of its sizeof in the wasm table), every module checks its own structs"""
+    if not _is_wasm_function_exported(_GetStructLayouts):
+        return []  # the wasm was built without the layout table, warned about once
+
+    address = _GetStructLayouts()
+    count = _heap.i32[address >> 2]
+    layouts = array.array("i", bytes(4 * count))
+    _heap.u8.subarray(address + 4, address + 4 + 4 * count).assign_to(memoryview(layouts).cast("B"))
+
+    mismatches = []
+    for stype, index in structs:
+        expected = [stype._size] + stype._dtype_spec["offsets"]
+        actual = layouts[index:index + len(expected)].tolist()
+        if actual != expected:
+            mismatches.append(f"{stype.__name__}: [size, offsets...] is {actual} in wasm but {expected} in python")
+
+    for mismatch in mismatches:
+        warnings.warn(f"struct layout mismatch, {mismatch}")
+    return mismatches
+
+class ConfigFlags(enum.IntEnum):
+    """System/Window config flags"""
+    FLAG_VSYNC_HINT: int = 64  # Set to try enabling V-Sync on GPU
+    FLAG_FULLSCREEN_MODE: int = 2  # Set to run program in fullscreen
+    FLAG_WINDOW_RESIZABLE: int = 4  # Set to allow resizable window
+    FLAG_WINDOW_UNDECORATED: int = 8  # Set to disable window decoration (frame and buttons)
+    FLAG_WINDOW_HIDDEN: int = 128  # Set to hide window
+    FLAG_WINDOW_MINIMIZED: int = 512  # Set to minimize window (iconify)
+    FLAG_WINDOW_MAXIMIZED: int = 1024  # Set to maximize window (expanded to monitor)
+    FLAG_WINDOW_UNFOCUSED: int = 2048  # Set to window non focused
+    FLAG_WINDOW_TOPMOST: int = 4096  # Set to window always on top
+    FLAG_WINDOW_ALWAYS_RUN: int = 256  # Set to allow windows running while minimized
+    FLAG_WINDOW_TRANSPARENT: int = 16  # Set to allow transparent framebuffer
+    FLAG_WINDOW_HIGHDPI: int = 8192  # Set to support HighDPI
+    FLAG_WINDOW_MOUSE_PASSTHROUGH: int = 16384  # Set to support mouse passthrough, only supported when FLAG_WINDOW_UNDECORATED
+    FLAG_MSAA_4X_HINT: int = 32  # Set to try enabling MSAA 4X
+    FLAG_INTERLACED_HINT: int = 65536  # Set to try enabling interlaced video format (for V3D)
+
+
+class TraceLogLevel(enum.IntEnum):
+    """Trace log level"""
+    LOG_ALL: int = 0  # Display all logs
+    LOG_TRACE: int = 1  # Trace logging, intended for internal use only
+    LOG_DEBUG: int = 2  # Debug logging, used for internal debugging, it should be disabled on release builds
+    LOG_INFO: int = 3  # Info logging, used for program execution info
+    LOG_WARNING: int = 4  # Warning logging, used on recoverable failures
+    LOG_ERROR: int = 5  # Error logging, used on unrecoverable failures
+    LOG_FATAL: int = 6  # Fatal logging, used to abort program: exit(EXIT_FAILURE)
+    LOG_NONE: int = 7  # Disable logging
+
+
+class KeyboardKey(enum.IntEnum):
+    """Keyboard keys (US keyboard layout)"""
+    KEY_NULL: int = 0  # Key: NULL, used for no key pressed
+    KEY_APOSTROPHE: int = 39  # Key: '
+    KEY_COMMA: int = 44  # Key: ,
+    KEY_MINUS: int = 45  # Key: -
+    KEY_PERIOD: int = 46  # Key: .
+    KEY_SLASH: int = 47  # Key: /
+    KEY_ZERO: int = 48  # Key: 0
+    KEY_ONE: int = 49  # Key: 1
+    KEY_TWO: int = 50  # Key: 2
+    KEY_THREE: int = 51  # Key: 3
+    KEY_FOUR: int = 52  # Key: 4
+    KEY_FIVE: int = 53  # Key: 5
+    KEY_SIX: int = 54  # Key: 6
+    KEY_SEVEN: int = 55  # Key: 7
+    KEY_EIGHT: int = 56  # Key: 8
+    KEY_NINE: int = 57  # Key: 9
+    KEY_SEMICOLON: int = 59  # Key: ;
+    KEY_EQUAL: int = 61  # Key: =
+    KEY_A: int = 65  # Key: A | a
+    KEY_B: int = 66  # Key: B | b
+    KEY_C: int = 67  # Key: C | c
+    KEY_D: int = 68  # Key: D | d
+    KEY_E: int = 69  # Key: E | e
+    KEY_F: int = 70  # Key: F | f
+    KEY_G: int = 71  # Key: G | g
+    KEY_H: int = 72  # Key: H | h
+    KEY_I: int = 73  # Key: I | i
+    KEY_J: int = 74  # Key: J | j
+    KEY_K: int = 75  # Key: K | k
+    KEY_L: int = 76  # Key: L | l
+    KEY_M: int = 77  # Key: M | m
+    KEY_N: int = 78  # Key: N | n
+    KEY_O: int = 79  # Key: O | o
+    KEY_P: int = 80  # Key: P | p
+    KEY_Q: int = 81  # Key: Q | q
+    KEY_R: int = 82  # Key: R | r
+    KEY_S: int = 83  # Key: S | s
+    KEY_T: int = 84  # Key: T | t
+    KEY_U: int = 85  # Key: U | u
+    KEY_V: int = 86  # Key: V | v
+    KEY_W: int = 87  # Key: W | w
+    KEY_X: int = 88  # Key: X | x
+    KEY_Y: int = 89  # Key: Y | y
+    KEY_Z: int = 90  # Key: Z | z
+    KEY_LEFT_BRACKET: int = 91  # Key: [
+    KEY_BACKSLASH: int = 92  # Key: '\'
+    KEY_RIGHT_BRACKET: int = 93  # Key: ]
+    KEY_GRAVE: int = 96  # Key: `
+    KEY_SPACE: int = 32  # Key: Space
+    KEY_ESCAPE: int = 256  # Key: Esc
+    KEY_ENTER: int = 257  # Key: Enter
+    KEY_TAB: int = 258  # Key: Tab
+    KEY_BACKSPACE: int = 259  # Key: Backspace
+    KEY_INSERT: int = 260  # Key: Ins
+    KEY_DELETE: int = 261  # Key: Del
+    KEY_RIGHT: int = 262  # Key: Cursor right
+    KEY_LEFT: int = 263  # Key: Cursor left
+    KEY_DOWN: int = 264  # Key: Cursor down
+    KEY_UP: int = 265  # Key: Cursor up
+    KEY_PAGE_UP: int = 266  # Key: Page up
+    KEY_PAGE_DOWN: int = 267  # Key: Page down
+    KEY_HOME: int = 268  # Key: Home
+    KEY_END: int = 269  # Key: End
+    KEY_CAPS_LOCK: int = 280  # Key: Caps lock
+    KEY_SCROLL_LOCK: int = 281  # Key: Scroll down
+    KEY_NUM_LOCK: int = 282  # Key: Num lock
+    KEY_PRINT_SCREEN: int = 283  # Key: Print screen
+    KEY_PAUSE: int = 284  # Key: Pause
+    KEY_F1: int = 290  # Key: F1
+    KEY_F2: int = 291  # Key: F2
+    KEY_F3: int = 292  # Key: F3
+    KEY_F4: int = 293  # Key: F4
+    KEY_F5: int = 294  # Key: F5
+    KEY_F6: int = 295  # Key: F6
+    KEY_F7: int = 296  # Key: F7
+    KEY_F8: int = 297  # Key: F8
+    KEY_F9: int = 298  # Key: F9
+    KEY_F10: int = 299  # Key: F10
+    KEY_F11: int = 300  # Key: F11
+    KEY_F12: int = 301  # Key: F12
+    KEY_LEFT_SHIFT: int = 340  # Key: Shift left
+    KEY_LEFT_CONTROL: int = 341  # Key: Control left
+    KEY_LEFT_ALT: int = 342  # Key: Alt left
+    KEY_LEFT_SUPER: int = 343  # Key: Super left
+    KEY_RIGHT_SHIFT: int = 344  # Key: Shift right
+    KEY_RIGHT_CONTROL: int = 345  # Key: Control right
+    KEY_RIGHT_ALT: int = 346  # Key: Alt right
+    KEY_RIGHT_SUPER: int = 347  # Key: Super right
+    KEY_KB_MENU: int = 348  # Key: KB menu
+    KEY_KP_0: int = 320  # Key: Keypad 0
+    KEY_KP_1: int = 321  # Key: Keypad 1
+    KEY_KP_2: int = 322  # Key: Keypad 2
+    KEY_KP_3: int = 323  # Key: Keypad 3
+    KEY_KP_4: int = 324  # Key: Keypad 4
+    KEY_KP_5: int = 325  # Key: Keypad 5
+    KEY_KP_6: int = 326  # Key: Keypad 6
+    KEY_KP_7: int = 327  # Key: Keypad 7
+    KEY_KP_8: int = 328  # Key: Keypad 8
+    KEY_KP_9: int = 329  # Key: Keypad 9
+    KEY_KP_DECIMAL: int = 330  # Key: Keypad .
+    KEY_KP_DIVIDE: int = 331  # Key: Keypad /
+    KEY_KP_MULTIPLY: int = 332  # Key: Keypad *
+    KEY_KP_SUBTRACT: int = 333  # Key: Keypad -
+    KEY_KP_ADD: int = 334  # Key: Keypad +
+    KEY_KP_ENTER: int = 335  # Key: Keypad Enter
+    KEY_KP_EQUAL: int = 336  # Key: Keypad =
+    KEY_BACK: int = 4  # Key: Android back button
+    KEY_MENU: int = 82  # Key: Android menu button
+    KEY_VOLUME_UP: int = 24  # Key: Android volume up button
+    KEY_VOLUME_DOWN: int = 25  # Key: Android volume down button
+
+
+class MouseButton(enum.IntEnum):
+    """Mouse buttons"""
+    MOUSE_BUTTON_LEFT: int = 0  # Mouse button left
+    MOUSE_BUTTON_RIGHT: int = 1  # Mouse button right
+    MOUSE_BUTTON_MIDDLE: int = 2  # Mouse button middle (pressed wheel)
+    MOUSE_BUTTON_SIDE: int = 3  # Mouse button side (advanced mouse device)
+    MOUSE_BUTTON_EXTRA: int = 4  # Mouse button extra (advanced mouse device)
+    MOUSE_BUTTON_FORWARD: int = 5  # Mouse button forward (advanced mouse device)
+    MOUSE_BUTTON_BACK: int = 6  # Mouse button back (advanced mouse device)
+
+
+class MouseCursor(enum.IntEnum):
+    """Mouse cursor"""
+    MOUSE_CURSOR_DEFAULT: int = 0  # Default pointer shape
+    MOUSE_CURSOR_ARROW: int = 1  # Arrow shape
+    MOUSE_CURSOR_IBEAM: int = 2  # Text writing cursor shape
+    MOUSE_CURSOR_CROSSHAIR: int = 3  # Cross shape
+    MOUSE_CURSOR_POINTING_HAND: int = 4  # Pointing hand cursor
+    MOUSE_CURSOR_RESIZE_EW: int = 5  # Horizontal resize/move arrow shape
+    MOUSE_CURSOR_RESIZE_NS: int = 6  # Vertical resize/move arrow shape
+    MOUSE_CURSOR_RESIZE_NWSE: int = 7  # Top-left to bottom-right diagonal resize/move arrow shape
+    MOUSE_CURSOR_RESIZE_NESW: int = 8  # The top-right to bottom-left diagonal resize/move arrow shape
+    MOUSE_CURSOR_RESIZE_ALL: int = 9  # The omnidirectional resize/move cursor shape
+    MOUSE_CURSOR_NOT_ALLOWED: int = 10  # The operation-not-allowed shape
+
+
+class GamepadButton(enum.IntEnum):
+    """Gamepad buttons"""
+    GAMEPAD_BUTTON_UNKNOWN: int = 0  # Unknown button, just for error checking
+    GAMEPAD_BUTTON_LEFT_FACE_UP: int = 1  # Gamepad left DPAD up button
+    GAMEPAD_BUTTON_LEFT_FACE_RIGHT: int = 2  # Gamepad left DPAD right button
+    GAMEPAD_BUTTON_LEFT_FACE_DOWN: int = 3  # Gamepad left DPAD down button
+    GAMEPAD_BUTTON_LEFT_FACE_LEFT: int = 4  # Gamepad left DPAD left button
+    GAMEPAD_BUTTON_RIGHT_FACE_UP: int = 5  # Gamepad right button up (i.e. PS3: Triangle, Xbox: Y)
+    GAMEPAD_BUTTON_RIGHT_FACE_RIGHT: int = 6  # Gamepad right button right (i.e. PS3: Square, Xbox: X)
+    GAMEPAD_BUTTON_RIGHT_FACE_DOWN: int = 7  # Gamepad right button down (i.e. PS3: Cross, Xbox: A)
+    GAMEPAD_BUTTON_RIGHT_FACE_LEFT: int = 8  # Gamepad right button left (i.e. PS3: Circle, Xbox: B)
+    GAMEPAD_BUTTON_LEFT_TRIGGER_1: int = 9  # Gamepad top/back trigger left (first), it could be a trailing button
+    GAMEPAD_BUTTON_LEFT_TRIGGER_2: int = 10  # Gamepad top/back trigger left (second), it could be a trailing button
+    GAMEPAD_BUTTON_RIGHT_TRIGGER_1: int = 11  # Gamepad top/back trigger right (one), it could be a trailing button
+    GAMEPAD_BUTTON_RIGHT_TRIGGER_2: int = 12  # Gamepad top/back trigger right (second), it could be a trailing button
+    GAMEPAD_BUTTON_MIDDLE_LEFT: int = 13  # Gamepad center buttons, left one (i.e. PS3: Select)
+    GAMEPAD_BUTTON_MIDDLE: int = 14  # Gamepad center buttons, middle one (i.e. PS3: PS, Xbox: XBOX)
+    GAMEPAD_BUTTON_MIDDLE_RIGHT: int = 15  # Gamepad center buttons, right one (i.e. PS3: Start)
+    GAMEPAD_BUTTON_LEFT_THUMB: int = 16  # Gamepad joystick pressed button left
+    GAMEPAD_BUTTON_RIGHT_THUMB: int = 17  # Gamepad joystick pressed button right
+
+
+class GamepadAxis(enum.IntEnum):
+    """Gamepad axis"""
+    GAMEPAD_AXIS_LEFT_X: int = 0  # Gamepad left stick X axis
+    GAMEPAD_AXIS_LEFT_Y: int = 1  # Gamepad left stick Y axis
+    GAMEPAD_AXIS_RIGHT_X: int = 2  # Gamepad right stick X axis
+    GAMEPAD_AXIS_RIGHT_Y: int = 3  # Gamepad right stick Y axis
+    GAMEPAD_AXIS_LEFT_TRIGGER: int = 4  # Gamepad back trigger left, pressure level: [1..-1]
+    GAMEPAD_AXIS_RIGHT_TRIGGER: int = 5  # Gamepad back trigger right, pressure level: [1..-1]
+
+
+class MaterialMapIndex(enum.IntEnum):
+    """Material map index"""
+    MATERIAL_MAP_ALBEDO: int = 0  # Albedo material (same as: MATERIAL_MAP_DIFFUSE)
+    MATERIAL_MAP_METALNESS: int = 1  # Metalness material (same as: MATERIAL_MAP_SPECULAR)
+    MATERIAL_MAP_NORMAL: int = 2  # Normal material
+    MATERIAL_MAP_ROUGHNESS: int = 3  # Roughness material
+    MATERIAL_MAP_OCCLUSION: int = 4  # Ambient occlusion material
+    MATERIAL_MAP_EMISSION: int = 5  # Emission material
+    MATERIAL_MAP_HEIGHT: int = 6  # Heightmap material
+    MATERIAL_MAP_CUBEMAP: int = 7  # Cubemap material (NOTE: Uses GL_TEXTURE_CUBE_MAP)
+    MATERIAL_MAP_IRRADIANCE: int = 8  # Irradiance material (NOTE: Uses GL_TEXTURE_CUBE_MAP)
+    MATERIAL_MAP_PREFILTER: int = 9  # Prefilter material (NOTE: Uses GL_TEXTURE_CUBE_MAP)
+    MATERIAL_MAP_BRDF: int = 10  # Brdf material
+
+
+class ShaderLocationIndex(enum.IntEnum):
+    """Shader location index"""
+    SHADER_LOC_VERTEX_POSITION: int = 0  # Shader location: vertex attribute: position
+    SHADER_LOC_VERTEX_TEXCOORD01: int = 1  # Shader location: vertex attribute: texcoord01
+    SHADER_LOC_VERTEX_TEXCOORD02: int = 2  # Shader location: vertex attribute: texcoord02
+    SHADER_LOC_VERTEX_NORMAL: int = 3  # Shader location: vertex attribute: normal
+    SHADER_LOC_VERTEX_TANGENT: int = 4  # Shader location: vertex attribute: tangent
+    SHADER_LOC_VERTEX_COLOR: int = 5  # Shader location: vertex attribute: color
+    SHADER_LOC_MATRIX_MVP: int = 6  # Shader location: matrix uniform: model-view-projection
+    SHADER_LOC_MATRIX_VIEW: int = 7  # Shader location: matrix uniform: view (camera transform)
+    SHADER_LOC_MATRIX_PROJECTION: int = 8  # Shader location: matrix uniform: projection
+    SHADER_LOC_MATRIX_MODEL: int = 9  # Shader location: matrix uniform: model (transform)
+    SHADER_LOC_MATRIX_NORMAL: int = 10  # Shader location: matrix uniform: normal
+    SHADER_LOC_VECTOR_VIEW: int = 11  # Shader location: vector uniform: view
+    SHADER_LOC_COLOR_DIFFUSE: int = 12  # Shader location: vector uniform: diffuse color
+    SHADER_LOC_COLOR_SPECULAR: int = 13  # Shader location: vector uniform: specular color
+    SHADER_LOC_COLOR_AMBIENT: int = 14  # Shader location: vector uniform: ambient color
+    SHADER_LOC_MAP_ALBEDO: int = 15  # Shader location: sampler2d texture: albedo (same as: SHADER_LOC_MAP_DIFFUSE)
+    SHADER_LOC_MAP_METALNESS: int = 16  # Shader location: sampler2d texture: metalness (same as: SHADER_LOC_MAP_SPECULAR)
+    SHADER_LOC_MAP_NORMAL: int = 17  # Shader location: sampler2d texture: normal
+    SHADER_LOC_MAP_ROUGHNESS: int = 18  # Shader location: sampler2d texture: roughness
+    SHADER_LOC_MAP_OCCLUSION: int = 19  # Shader location: sampler2d texture: occlusion
+    SHADER_LOC_MAP_EMISSION: int = 20  # Shader location: sampler2d texture: emission
+    SHADER_LOC_MAP_HEIGHT: int = 21  # Shader location: sampler2d texture: height
+    SHADER_LOC_MAP_CUBEMAP: int = 22  # Shader location: samplerCube texture: cubemap
+    SHADER_LOC_MAP_IRRADIANCE: int = 23  # Shader location: samplerCube texture: irradiance
+    SHADER_LOC_MAP_PREFILTER: int = 24  # Shader location: samplerCube texture: prefilter
+    SHADER_LOC_MAP_BRDF: int = 25  # Shader location: sampler2d texture: brdf
+
+
+class ShaderUniformDataType(enum.IntEnum):
+    """Shader uniform data type"""
+    SHADER_UNIFORM_FLOAT: int = 0  # Shader uniform type: float
+    SHADER_UNIFORM_VEC2: int = 1  # Shader uniform type: vec2 (2 float)
+    SHADER_UNIFORM_VEC3: int = 2  # Shader uniform type: vec3 (3 float)
+    SHADER_UNIFORM_VEC4: int = 3  # Shader uniform type: vec4 (4 float)
+    SHADER_UNIFORM_INT: int = 4  # Shader uniform type: int
+    SHADER_UNIFORM_IVEC2: int = 5  # Shader uniform type: ivec2 (2 int)
+    SHADER_UNIFORM_IVEC3: int = 6  # Shader uniform type: ivec3 (3 int)
+    SHADER_UNIFORM_IVEC4: int = 7  # Shader uniform type: ivec4 (4 int)
+    SHADER_UNIFORM_SAMPLER2D: int = 8  # Shader uniform type: sampler2d
+
+
+class ShaderAttributeDataType(enum.IntEnum):
+    """Shader attribute data types"""
+    SHADER_ATTRIB_FLOAT: int = 0  # Shader attribute type: float
+    SHADER_ATTRIB_VEC2: int = 1  # Shader attribute type: vec2 (2 float)
+    SHADER_ATTRIB_VEC3: int = 2  # Shader attribute type: vec3 (3 float)
+    SHADER_ATTRIB_VEC4: int = 3  # Shader attribute type: vec4 (4 float)
+
+
+class PixelFormat(enum.IntEnum):
+    """Pixel formats"""
+    PIXELFORMAT_UNCOMPRESSED_GRAYSCALE: int = 1  # 8 bit per pixel (no alpha)
+    PIXELFORMAT_UNCOMPRESSED_GRAY_ALPHA: int = 2  # 8*2 bpp (2 channels)
+    PIXELFORMAT_UNCOMPRESSED_R5G6B5: int = 3  # 16 bpp
+    PIXELFORMAT_UNCOMPRESSED_R8G8B8: int = 4  # 24 bpp
+    PIXELFORMAT_UNCOMPRESSED_R5G5B5A1: int = 5  # 16 bpp (1 bit alpha)
+    PIXELFORMAT_UNCOMPRESSED_R4G4B4A4: int = 6  # 16 bpp (4 bit alpha)
+    PIXELFORMAT_UNCOMPRESSED_R8G8B8A8: int = 7  # 32 bpp
+    PIXELFORMAT_UNCOMPRESSED_R32: int = 8  # 32 bpp (1 channel - float)
+    PIXELFORMAT_UNCOMPRESSED_R32G32B32: int = 9  # 32*3 bpp (3 channels - float)
+    PIXELFORMAT_UNCOMPRESSED_R32G32B32A32: int = 10  # 32*4 bpp (4 channels - float)
+    PIXELFORMAT_COMPRESSED_DXT1_RGB: int = 11  # 4 bpp (no alpha)
+    PIXELFORMAT_COMPRESSED_DXT1_RGBA: int = 12  # 4 bpp (1 bit alpha)
+    PIXELFORMAT_COMPRESSED_DXT3_RGBA: int = 13  # 8 bpp
+    PIXELFORMAT_COMPRESSED_DXT5_RGBA: int = 14  # 8 bpp
+    PIXELFORMAT_COMPRESSED_ETC1_RGB: int = 15  # 4 bpp
+    PIXELFORMAT_COMPRESSED_ETC2_RGB: int = 16  # 4 bpp
+    PIXELFORMAT_COMPRESSED_ETC2_EAC_RGBA: int = 17  # 8 bpp
+    PIXELFORMAT_COMPRESSED_PVRT_RGB: int = 18  # 4 bpp
+    PIXELFORMAT_COMPRESSED_PVRT_RGBA: int = 19  # 4 bpp
+    PIXELFORMAT_COMPRESSED_ASTC_4x4_RGBA: int = 20  # 8 bpp
+    PIXELFORMAT_COMPRESSED_ASTC_8x8_RGBA: int = 21  # 2 bpp
+
+
+class TextureFilter(enum.IntEnum):
+    """Texture parameters: filter mode"""
+    TEXTURE_FILTER_POINT: int = 0  # No filter, just pixel approximation
+    TEXTURE_FILTER_BILINEAR: int = 1  # Linear filtering
+    TEXTURE_FILTER_TRILINEAR: int = 2  # Trilinear filtering (linear with mipmaps)
+    TEXTURE_FILTER_ANISOTROPIC_4X: int = 3  # Anisotropic filtering 4x
+    TEXTURE_FILTER_ANISOTROPIC_8X: int = 4  # Anisotropic filtering 8x
+    TEXTURE_FILTER_ANISOTROPIC_16X: int = 5  # Anisotropic filtering 16x
+
+
+class TextureWrap(enum.IntEnum):
+    """Texture parameters: wrap mode"""
+    TEXTURE_WRAP_REPEAT: int = 0  # Repeats texture in tiled mode
+    TEXTURE_WRAP_CLAMP: int = 1  # Clamps texture to edge pixel in tiled mode
+    TEXTURE_WRAP_MIRROR_REPEAT: int = 2  # Mirrors and repeats the texture in tiled mode
+    TEXTURE_WRAP_MIRROR_CLAMP: int = 3  # Mirrors and clamps to border the texture in tiled mode
+
+
+class CubemapLayout(enum.IntEnum):
+    """Cubemap layouts"""
+    CUBEMAP_LAYOUT_AUTO_DETECT: int = 0  # Automatically detect layout type
+    CUBEMAP_LAYOUT_LINE_VERTICAL: int = 1  # Layout is defined by a vertical line with faces
+    CUBEMAP_LAYOUT_LINE_HORIZONTAL: int = 2  # Layout is defined by a horizontal line with faces
+    CUBEMAP_LAYOUT_CROSS_THREE_BY_FOUR: int = 3  # Layout is defined by a 3x4 cross with cubemap faces
+    CUBEMAP_LAYOUT_CROSS_FOUR_BY_THREE: int = 4  # Layout is defined by a 4x3 cross with cubemap faces
+    CUBEMAP_LAYOUT_PANORAMA: int = 5  # Layout is defined by a panorama image (equirrectangular map)
+
+
+class FontType(enum.IntEnum):
+    """Font type, defines generation method"""
+    FONT_DEFAULT: int = 0  # Default font generation, anti-aliased
+    FONT_BITMAP: int = 1  # Bitmap font generation, no anti-aliasing
+    FONT_SDF: int = 2  # SDF font generation, requires external shader
+
+
+class BlendMode(enum.IntEnum):
+    """Color blending modes (pre-defined)"""
+    BLEND_ALPHA: int = 0  # Blend textures considering alpha (default)
+    BLEND_ADDITIVE: int = 1  # Blend textures adding colors
+    BLEND_MULTIPLIED: int = 2  # Blend textures multiplying colors
+    BLEND_ADD_COLORS: int = 3  # Blend textures adding colors (alternative)
+    BLEND_SUBTRACT_COLORS: int = 4  # Blend textures subtracting colors (alternative)
+    BLEND_ALPHA_PREMULTIPLY: int = 5  # Blend premultiplied textures considering alpha
+    BLEND_CUSTOM: int = 6  # Blend textures using custom src/dst factors (use rlSetBlendFactors())
+    BLEND_CUSTOM_SEPARATE: int = 7  # Blend textures using custom rgb/alpha separate src/dst factors (use rlSetBlendFactorsSeparate())
+
+
+class Gesture(enum.IntEnum):
+    """Gesture"""
+    GESTURE_NONE: int = 0  # No gesture
+    GESTURE_TAP: int = 1  # Tap gesture
+    GESTURE_DOUBLETAP: int = 2  # Double tap gesture
+    GESTURE_HOLD: int = 4  # Hold gesture
+    GESTURE_DRAG: int = 8  # Drag gesture
+    GESTURE_SWIPE_RIGHT: int = 16  # Swipe right gesture
+    GESTURE_SWIPE_LEFT: int = 32  # Swipe left gesture
+    GESTURE_SWIPE_UP: int = 64  # Swipe up gesture
+    GESTURE_SWIPE_DOWN: int = 128  # Swipe down gesture
+    GESTURE_PINCH_IN: int = 256  # Pinch in gesture
+    GESTURE_PINCH_OUT: int = 512  # Pinch out gesture
+
+
+class CameraMode(enum.IntEnum):
+    """Camera system modes"""
+    CAMERA_CUSTOM: int = 0  # Custom camera
+    CAMERA_FREE: int = 1  # Free camera
+    CAMERA_ORBITAL: int = 2  # Orbital camera
+    CAMERA_FIRST_PERSON: int = 3  # First person camera
+    CAMERA_THIRD_PERSON: int = 4  # Third person camera
+
+
+class CameraProjection(enum.IntEnum):
+    """Camera projection"""
+    CAMERA_PERSPECTIVE: int = 0  # Perspective projection
+    CAMERA_ORTHOGRAPHIC: int = 1  # Orthographic projection
+
+
+class NPatchLayout(enum.IntEnum):
+    """N-patch layout"""
+    NPATCH_NINE_PATCH: int = 0  # Npatch layout: 3x3 tiles
+    NPATCH_THREE_PATCH_VERTICAL: int = 1  # Npatch layout: 1x3 tiles
+    NPATCH_THREE_PATCH_HORIZONTAL: int = 2  # Npatch layout: 3x1 tiles
+
+
+RAYLIB_VERSION_MAJOR: int = 4
+RAYLIB_VERSION_MINOR: int = 6
+RAYLIB_VERSION_PATCH: int = 0
+RAYLIB_VERSION: str = "4.6-dev"
+PI: float = 3.141592653589793
+DEG2RAD: float = (PI/180.0)
+RAD2DEG: float = (180.0/PI)
+# color name -> (r, g, b, a)
+_colors = {
+    "LIGHTGRAY": (200, 200, 200, 255),
+    "GRAY": (130, 130, 130, 255),
+    "DARKGRAY": (80, 80, 80, 255),
+    "YELLOW": (253, 249, 0, 255),
+    "GOLD": (255, 203, 0, 255),
+    "ORANGE": (255, 161, 0, 255),
+    "PINK": (255, 109, 194, 255),
+    "RED": (230, 41, 55, 255),
+    "MAROON": (190, 33, 55, 255),
+    "GREEN": (0, 228, 48, 255),
+    "LIME": (0, 158, 47, 255),
+    "DARKGREEN": (0, 117, 44, 255),
+    "SKYBLUE": (102, 191, 255, 255),
+    "BLUE": (0, 121, 241, 255),
+    "DARKBLUE": (0, 82, 172, 255),
+    "PURPLE": (200, 122, 255, 255),
+    "VIOLET": (135, 60, 190, 255),
+    "DARKPURPLE": (112, 31, 126, 255),
+    "BEIGE": (211, 176, 131, 255),
+    "BROWN": (127, 106, 79, 255),
+    "DARKBROWN": (76, 63, 47, 255),
+    "WHITE": (255, 255, 255, 255),
+    "BLACK": (0, 0, 0, 255),
+    "BLANK": (0, 0, 0, 0),
+    "MAGENTA": (255, 0, 255, 255),
+    "RAYWHITE": (245, 245, 245, 255),
+}
+LIGHTGRAY: Color = Color(*_colors["LIGHTGRAY"], frozen=True)  # Light Gray
+GRAY: Color = Color(*_colors["GRAY"], frozen=True)  # Gray
+DARKGRAY: Color = Color(*_colors["DARKGRAY"], frozen=True)  # Dark Gray
+YELLOW: Color = Color(*_colors["YELLOW"], frozen=True)  # Yellow
+GOLD: Color = Color(*_colors["GOLD"], frozen=True)  # Gold
+ORANGE: Color = Color(*_colors["ORANGE"], frozen=True)  # Orange
+PINK: Color = Color(*_colors["PINK"], frozen=True)  # Pink
+RED: Color = Color(*_colors["RED"], frozen=True)  # Red
+MAROON: Color = Color(*_colors["MAROON"], frozen=True)  # Maroon
+GREEN: Color = Color(*_colors["GREEN"], frozen=True)  # Green
+LIME: Color = Color(*_colors["LIME"], frozen=True)  # Lime
+DARKGREEN: Color = Color(*_colors["DARKGREEN"], frozen=True)  # Dark Green
+SKYBLUE: Color = Color(*_colors["SKYBLUE"], frozen=True)  # Sky Blue
+BLUE: Color = Color(*_colors["BLUE"], frozen=True)  # Blue
+DARKBLUE: Color = Color(*_colors["DARKBLUE"], frozen=True)  # Dark Blue
+PURPLE: Color = Color(*_colors["PURPLE"], frozen=True)  # Purple
+VIOLET: Color = Color(*_colors["VIOLET"], frozen=True)  # Violet
+DARKPURPLE: Color = Color(*_colors["DARKPURPLE"], frozen=True)  # Dark Purple
+BEIGE: Color = Color(*_colors["BEIGE"], frozen=True)  # Beige
+BROWN: Color = Color(*_colors["BROWN"], frozen=True)  # Brown
+DARKBROWN: Color = Color(*_colors["DARKBROWN"], frozen=True)  # Dark Brown
+WHITE: Color = Color(*_colors["WHITE"], frozen=True)  # White
+BLACK: Color = Color(*_colors["BLACK"], frozen=True)  # Black
+BLANK: Color = Color(*_colors["BLANK"], frozen=True)  # Blank (Transparent)
+MAGENTA: Color = Color(*_colors["MAGENTA"], frozen=True)  # Magenta
+RAYWHITE: Color = Color(*_colors["RAYWHITE"], frozen=True)  # My own White (raylib logo)
+
+
+import struct
+
+
+class CommandBuffer:
+    """Records draw calls as packed opcodes, so a whole frame is replayed with one call into wasm"""
+
+    def __init__(self, capacity: int = 64 * 1024):
+        self._data = bytearray(capacity)
+        self._length = 0
+        self._frozen_copies = {}  # id -> (frozen struct, its bytes)
+        self._address = 0
+        self._wasm_capacity = 0
+
+    def __len__(self):
+        return self._length
+
+    def _reserve(self, size: int):
+        end = self._length + size
+        if end > len(self._data):
+            self._data.extend(bytes(max(end, 2 * len(self._data)) - len(self._data)))
+        return end
+
+    def record(self, command: struct.Struct, *args):
+        end = self._reserve(command.size)
+        try:
+            command.pack_into(self._data, self._length, *args)
+        except struct.error:
+            # a direct call lets wasm truncate floats passed as int parameters, do the same here
+            args = [int(arg) if code in "iI" else arg for code, arg in zip(command.format[1:], args)]
+            command.pack_into(self._data, self._length, *args)
+        self._length = end
+
+    def record_string(self, data: bytes):
+        # NUL terminated and padded to the 4 bytes slot size
+        end = self._reserve((len(data) + 4) & ~3)
+        self._data[self._length:self._length + len(data)] = data
+        self._data[self._length + len(data):end] = bytes(end - self._length - len(data))
+        self._length = end
+
+    def record_memory(self, address: int, size: int):
+        # a copy of the struct or array the call gets, so changing it after the call doesn't change the replay
+        end = self._reserve((size + 3) & ~3)
+        _heap.u8.subarray(address, address + size).assign_to(memoryview(self._data)[self._length:self._length + size])
+        self._length = end
+
+    def record_struct(self, value, size: int):
+        # frozen structs (the colors) never change, their bytes are read from wasm memory once
+        copy = self._frozen_copies.get(id(value))
+        if copy is None or copy[0] is not value:
+            if not getattr(value, "_frozen", False):
+                self.record_memory(value._address, size)
+                return
+            data = bytearray(size)
+            _heap.u8.subarray(value._address, value._address + size).assign_to(data)
+            copy = self._frozen_copies[id(value)] = (value, struct.Struct(f"<{(size + 3) & ~3}s"), bytes(data))
+        command = copy[1]
+        end = self._length + command.size
+        if end > len(self._data):
+            self._reserve(command.size)
+        command.pack_into(self._data, self._length, copy[2])
+        self._length = end
+
+    def flush(self):
+        """Copy the recorded commands into wasm memory and replay them"""
+        if self._length == 0:
+            return
+        if self._wasm_capacity < self._length:
+            if self._address != 0:
+                _mod._free(self._address)
+            self._wasm_capacity = len(self._data)
+            self._address = _mod._malloc(self._wasm_capacity)
+        _heap.u8.subarray(self._address, self._address + self._length).assign(memoryview(self._data)[:self._length])
+        _ReplayCommandBuffer(self._address, self._length)
+        self._length = 0
+
+    def clear(self):
+        """Drop the recorded commands without replaying them"""
+        self._length = 0
+
+
+_command_buffer = CommandBuffer()
+
+
+def enable_command_buffer():
+    """Record draw calls into the command buffer and replay them all at end_drawing(), the draw calls stay direct
+    if the raylib wasm can't replay them"""
+    if _active_context.overrides or not _is_wasm_function_exported(_ReplayCommandBuffer):
+        return
+    from .commands import _command_buffer_functions
+    _active_context.override(_command_buffer_functions)
+
+
+def disable_command_buffer():
+    """Replay anything still recorded and go back to calling wasm on every draw call"""
+    _command_buffer.flush()
+    _active_context.clear_overrides()
+
+
+def is_command_buffer_enabled() -> bool:
+    """Check if draw calls are recorded into the command buffer"""
+    return bool(_active_context.overrides)
+
+
+def flush_command_buffer():
+    """Replay the recorded draw calls now, needed before calls that are not recorded but depend on the drawing order"""
+    _command_buffer.flush()
+
+
+def _record_end_drawing():
+    """End canvas drawing and swap buffers (double buffering)"""
+    _command_buffer.flush()
+    _EndDrawing()
+    _scratch_arena.reset()
+
+
+import collections
+import struct
+
+
+class TextLayout(WasmArray):
+    """A text laid out once by LayoutText in raylib.c: its line breaks in width (not wrapped if width is 0) and the
+    glyph and position of each character, drawn with one call into wasm"""
+
+    def __init__(self, font: Font, text: str, font_size: float, spacing: float, width: float = 0.0):
+        # TextLayoutGlyph of raylib.c: the glyph index and its x, y, no more of them than characters
+        super(TextLayout, self).__init__(12, max(len(text), 1))
+        self.font = font  # kept alive with its address, the glyphs are drawn from it
+        self.font_size = font_size
+        if not _is_wasm_function_exported(_LayoutText):
+            self._count, self.width, self.height = self._lay_out(text, spacing, width)
+            return
+        size = _scratch_arena.alloc(8)
+        self._count = _LayoutText(font._address, _scratch_arena.string(text), font_size, spacing, width,
+                                  self._address, self._length, size)
+        self.width = _heap.f32[size >> 2]
+        self.height = _heap.f32[(size + 4) >> 2]
+
+    def _lay_out(self, text: str, spacing: float, width: float) -> tuple:
+        """LayoutText of raylib.c in python, for a raylib wasm without it: the glyph count, width and height"""
+        font_glyphs = _text_layouts.font_glyphs(self.font)
+        if not font_glyphs.advances:
+            return 0, 0.0, 0.0  # a font without glyphs, not loaded
+        scale = self.font_size / font_glyphs.base_size
+        line_height = font_glyphs.base_size * 1.5 * scale
+        glyphs = []
+        line_start = 0
+        word_start = -1
+        x = y = 0.0
+        for codepoint in map(ord, text):
+            if codepoint == 10:  # new line
+                x = 0.0
+                y += line_height
+                line_start = len(glyphs)
+                word_start = -1
+                continue
+            index = font_glyphs.index(codepoint)
+            advance = font_glyphs.advances[index] * scale
+            if codepoint in (32, 9):  # space or tab
+                if x > 0.0:
+                    x += advance + spacing  # no leading spaces
+                word_start = len(glyphs)
+                continue
+            if width > 0.0 and x + advance > width and len(glyphs) > line_start:
+                first = word_start if word_start > line_start else len(glyphs)
+                shift = glyphs[first][1] if first < len(glyphs) else x
+                glyphs[first:] = [(g, gx - shift, gy + line_height) for g, gx, gy in glyphs[first:]]
+                x -= shift
+                y += line_height
+                line_start = first
+                word_start = -1
+            glyphs.append((index, x, y))
+            x += advance + spacing
+        if glyphs:
+            data = b"".join(_text_layout_glyph.pack(*glyph) for glyph in glyphs)
+            _heap.u8.subarray(self._address, self._address + len(data)).assign(data)
+        text_width = max((gx + font_glyphs.advances[g] * scale for g, gx, gy in glyphs), default=0.0)
+        return len(glyphs), text_width, y + self.font_size if text else 0.0
+
+    def draw(self, x: float, y: float, tint: Color):
+        """Draw the text with its top left at (x, y)"""
+        _command_buffer.flush()  # the draw calls recorded before are drawn first
+        if not _is_wasm_function_exported(_DrawTextLayout):
+            self._draw_each(x, y, tint)
+            return
+        _DrawTextLayout(self.font._address, self._address, self._count, self.font_size, x, y, tint._address)
+
+    def _draw_each(self, x: float, y: float, tint: Color):
+        """DrawTexturePro for each glyph, for a raylib wasm without DrawTextLayout"""
+        if not self._count:
+            return
+        font_glyphs = _text_layouts.font_glyphs(self.font)
+        scale = self.font_size / font_glyphs.base_size
+        padding = font_glyphs.padding
+        data = bytearray(12 * self._count)
+        _heap.u8.subarray(self._address, self._address + len(data)).assign_to(data)
+        # the source and dest rectangles of each glyph in turn, then the origin (0, 0)
+        rectangles = _scratch_arena.alloc(40)
+        _heap.u8.subarray(rectangles + 32, rectangles + 40).assign(bytes(8))
+        texture = self.font._address + 12
+        for index, glyph_x, glyph_y in _text_layout_glyph.iter_unpack(data):
+            rec_x, rec_y, rec_width, rec_height = font_glyphs.recs[index]
+            offset_x, offset_y = font_glyphs.offsets[index]
+            source_width = rec_width + 2.0 * padding
+            source_height = rec_height + 2.0 * padding
+            _heap.u8.subarray(rectangles, rectangles + 32).assign(_text_layout_rectangles.pack(
+                rec_x - padding, rec_y - padding, source_width, source_height,
+                x + glyph_x + (offset_x - padding) * scale, y + glyph_y + (offset_y - padding) * scale,
+                source_width * scale, source_height * scale))
+            _DrawTexturePro(texture, rectangles, rectangles + 16, rectangles + 32, 0.0, tint._address)
+
+
+_text_layout_glyph = struct.Struct("<iff")  # TextLayoutGlyph of raylib.c
+_text_layout_rectangles = struct.Struct("<8f")
+
+
+class _FontGlyphs:
+    """The glyph metrics of a font read from wasm memory at once, for the text layouts of a raylib wasm without
+    LayoutText and DrawTextLayout"""
+
+    def __init__(self, font: Font):
+        self.base_size = font.baseSize
+        self.padding = float(font.glyphPadding)
+        count = font.glyphCount
+        glyphs = bytearray(36 * count)  # GlyphInfo: value, offsetX, offsetY, advanceX, then its image
+        _heap.u8.subarray(font.glyphs, font.glyphs + len(glyphs)).assign_to(glyphs)
+        recs = bytearray(16 * count)
+        _heap.u8.subarray(font.recs, font.recs + len(recs)).assign_to(recs)
+        self.recs = list(struct.iter_unpack("<4f", recs))
+        self.offsets = []
+        self.advances = []
+        self._indexes = {}
+        for index, (value, offset_x, offset_y, advance_x) in enumerate(struct.iter_unpack("<4i20x", glyphs)):
+            self._indexes.setdefault(value, index)
+            self.offsets.append((offset_x, offset_y))
+            self.advances.append(float(advance_x) if advance_x else self.recs[index][2])
+        self._fallback = self._indexes.get(63, 0)  # '?', like GetGlyphIndex
+
+    def index(self, codepoint: int) -> int:
+        """GetGlyphIndex of raylib"""
+        return self._indexes.get(codepoint, self._fallback)
+
+
+class TextLayoutCache:
+    """The layouts of the texts drawn lately, by font, text, size, spacing and width, the least recently used are
+    dropped past capacity"""
+
+    def __init__(self, capacity: int = 512):
+        self.capacity = capacity
+        self._layouts = collections.OrderedDict()
+        self.counters = {"hits": 0, "misses": 0}
+        self._fonts = {}  # the _FontGlyphs by the glyphs of their font, for a raylib wasm without LayoutText
+
+    def get(self, font: Font, text: str, font_size: float, spacing: float, width: float) -> TextLayout:
+        # the glyphs of a font identify it while it is loaded, unload_font() invalidates its layouts
+        key = (font.glyphs, text, font_size, spacing, width)
+        layout = self._layouts.get(key)
+        if layout is not None:
+            self._layouts.move_to_end(key)
+            self.counters["hits"] += 1
+            return layout
+        self.counters["misses"] += 1
+        layout = self._layouts[key] = TextLayout(font, text, font_size, spacing, width)
+        if len(self._layouts) > self.capacity:
+            self._layouts.popitem(last=False)
+        return layout
+
+    def font_glyphs(self, font: Font) -> _FontGlyphs:
+        """Get the glyph metrics of font, read once while it is loaded"""
+        font_glyphs = self._fonts.get(font.glyphs)
+        if font_glyphs is None:
+            font_glyphs = self._fonts[font.glyphs] = _FontGlyphs(font)
+        return font_glyphs
+
+    def invalidate(self, font: Font = None):
+        """Drop the layouts of font, or all of them"""
+        if font is None:
+            self._layouts.clear()
+            self._fonts.clear()
+            return
+        glyphs = font.glyphs
+        self._fonts.pop(glyphs, None)
+        for key in [key for key in self._layouts if key[0] == glyphs]:
+            del self._layouts[key]
+
+
+_text_layouts = TextLayoutCache()
+
+
+def layout_text(font: Font, text: str, font_size: float, spacing: float, width: float = 0.0) -> TextLayout:
+    """Get the layout of text, wrapped at the spaces in lines of at most width (0: only at \\n), from the cache
+    if it was laid out lately: its width and height, or draw() it"""
+    return _text_layouts.get(font, text, font_size, spacing, width)
+
+
+def draw_text_layout(font: Font, text: str, x: float, y: float, font_size: float, spacing: float, width: float,
+                     tint: Color):
+    """Draw text wrapped in lines of at most width (0: only at \\n), laid out once while it is drawn every frame"""
+    _text_layouts.get(font, text, font_size, spacing, width).draw(x, y, tint)
+
+
+def invalidate_text_layouts(font: Font = None):
+    """Drop the cached layouts of font, or all of them, unload_font() drops the ones of the font it unloads"""
+    _text_layouts.invalidate(font)
+
+
+def set_text_layouts_capacity(capacity: int):
+    """Set how many text layouts are cached"""
+    _text_layouts.capacity = capacity
+    while len(_text_layouts._layouts) > capacity:
+        _text_layouts._layouts.popitem(last=False)
+
+
+def get_text_layout_counters() -> dict:
+    """Get how many text layouts came from the cache (hits) and how many were laid out (misses)"""
+    return dict(_text_layouts.counters)
+
+
+def _argument_error(function_name: str, name: str, value, expected: str) -> TypeError:
+    return TypeError(f"{function_name}() argument {name} must be {expected}, not {type(value).__name__}")
+
+
+def _check_int(function_name: str, name: str, value, minimum: int = None, maximum: int = None):
+    if not isinstance(value, int):
+        raise _argument_error(function_name, name, value, "int")
+    if minimum is not None and not minimum <= value <= maximum:
+        raise ValueError(f"{function_name}() argument {name} must be in [{minimum}, {maximum}], not {value}")
+
+
+def _check_float(function_name: str, name: str, value):
+    if not isinstance(value, (int, float)):
+        raise _argument_error(function_name, name, value, "float")
+
+
+def _check_str(function_name: str, name: str, value):
+    if not isinstance(value, str):
+        raise _argument_error(function_name, name, value, "str")
+
+
+def _check_struct(function_name: str, name: str, value, stype):
+    # a shadow struct stands for its wasm struct
+    if not isinstance(value, stype) and getattr(value, "_struct", None) is not stype:
+        raise _argument_error(function_name, name, value, stype.__name__)
+
+
+import builtins
+import sys
+
+
+class Context:
+    """A raylib wasm instance (one per canvas) and the state the wrapper keeps for it, the modules of the
+    wrapper are shared and work on the active context"""
+
+    def __init__(self, mod, state: dict = None):
+        from . import LazyBuiltins
+        self.mod = mod
+        self.builtins = LazyBuiltins(builtins.__dict__)  # shared by the user code that runs on this context
+        self.overrides = {}  # names the user code sees replaced, by enable_command_buffer()
+        self.profiler = None  # see enable_profiling()
+        self.wasm_functions = {}  # name -> wasm export of the _mod in the state, see bind_wasm_functions()
+        if state is not None:
+            self.state = state
+            return
+
+        heap = HeapViews(mod)
+        mod.onMemoryGrowth = heap.refresh
+        self.state = {
+            "_mod": mod,
+            "_heap": heap,
+            "_scratch_arena": ScratchArena(),
+            "_struct_pool": StructPool(mod),
+            "_command_buffer": CommandBuffer(),
+            "_text_layouts": TextLayoutCache(),
+            "_cached_layers": {},  # name -> CachedLayer, see cached_layer()
+        }
+        # colors are structs in wasm memory too, so every wasm instance needs its own
+        previous = _active_context
+        self.activate()
+        self.state.update((name, Color(*rgba, frozen=True)) for name, rgba in _colors.items())
+        previous.activate()
+
+    def activate(self):
+        """Make the wrapper work on the wasm instance of this context, before running its user code"""
+        global _active_context
+        if _active_context is self:
+            return
+        self._bind_state()
+        _active_context = self
+
+    def _bind_state(self):
+        for module_name in _context_modules_names:
+            module = sys.modules.get(module_name)
+            if module is None:
+                continue
+            namespace = module.__dict__
+            for name, value in self.state.items():
+                if name in namespace:
+                    namespace[name] = value
+            if "_wasm_functions_names" in namespace:
+                self.bind_wasm_functions(namespace)
+
+    def bind_wasm_functions(self, namespace: dict):
+        """Bind the wasm exports a module of the wrapper calls (_DrawText for _mod._DrawText) to this context"""
+        wasm_functions = self.wasm_functions
+        mod = self.state["_mod"]
+        for name in namespace["_wasm_functions_names"]:
+            function = wasm_functions.get(name)
+            if function is None:
+                function = wasm_functions[name] = getattr(mod, name, None) or _missing_wasm_function(name)
+            namespace[name] = function
+
+    def set_profiler(self, profiler):
+        """Swap the state that talks to wasm for the stand-ins of profiler, or back when profiler is None"""
+        if self.profiler is not None:
+            self.state.update(self.profiler.profiled_state)
+        self.profiler = profiler
+        if profiler is not None:
+            self.state.update(profiler.stand_ins(self.state))
+        self.wasm_functions.clear()  # fetched again from the new _mod
+        if _active_context is self:
+            self._bind_state()
+
+    def install(self, namespace: dict):
+        """Make the names of the wrapper usable in namespace (the globals of the user code) without importing them"""
+        namespace["__builtins__"] = self.builtins
+        namespace["_mod"] = self.mod
+
+    def new_namespace(self) -> dict:
+        """Globals for new user code of this context, what the previous user code left (window, command buffer) is reset"""
+        self.activate()
+        if self.mod._IsWindowReady():
+            self.mod._CloseWindow()
+        self.clear_overrides()
+        self.set_profiler(None)
+        self.state["_command_buffer"].clear()
+        self.state["_cached_layers"].clear()  # their render textures went with the window
+        namespace = {"__name__": "__main__"}
+        self.install(namespace)
+        return namespace
+
+    @staticmethod
+    def user_function(namespace: dict, name: str):
+        """The function name of the user code, called by the frame loop with the frame timestamp even if it
+        takes no argument"""
+        function = namespace[name]
+        if getattr(getattr(function, "__code__", None), "co_argcount", 0) > 0:
+            return function
+        return lambda timestamp: function()
+
+    def override(self, values: dict):
+        """Replace names of the wrapper for the user code of this context"""
+        self.overrides.update(values)
+        self.builtins.update(values)
+
+    def clear_overrides(self):
+        """Go back to the names of the wrapper, they are looked up again the next time they are used"""
+        for name in self.overrides:
+            self.builtins.pop(name, None)
+        self.overrides.clear()
+
+
+_cached_layers = {}  # name -> CachedLayer of the active context, see cached_layer() in textures
+
+_active_context = Context(_mod, {name: globals()[name] for name in
+                                 ["_mod", "_heap", "_scratch_arena", "_struct_pool", "_command_buffer",
+                                  "_text_layouts", "_cached_layers", *_colors]})
+
+
+def _missing_wasm_function(name: str):
+    """Stands in for a function the raylib wasm doesn't export, it fails only if it is called"""
+    def missing(*args):
+        raise AttributeError(f"the raylib wasm doesn't export {name}, see EXPORTED_FUNCTIONS in tools/build.sh")
+    missing.missing_name = name
+    return missing
+
+
+_warned_missing_wasm_functions = set()
+
+
+def _is_wasm_function_exported(function) -> bool:
+    """Check if a bound wasm export is a function of the raylib wasm and not the stand-in of a missing one, the
+    wrapper falls back to python for the functions of raylib.c a wasm built before them lacks (warned about once)"""
+    name = getattr(function, "missing_name", None)
+    if name is None:
+        return True
+    if name not in _warned_missing_wasm_functions:
+        _warned_missing_wasm_functions.add(name)
+        warnings.warn(f"the raylib wasm doesn't export {name}, the wrapper does without it until the wasm is "
+                      f"rebuilt with tools/build.sh")
+    return False
+
+
+def _bind_wasm_functions(namespace: dict):
+    """Bind the wasm exports a module of the wrapper calls to the active context, when the module is imported"""
+    _active_context.bind_wasm_functions(namespace)
+
+
+import json
+import time
+
+
+class _ProfiledCall:
+    """Stands in for a function while profiling, adds its calls and time to entry"""
+    __slots__ = ("_function", "_entry", "_profiler")
+
+    def __init__(self, function, entry: list, profiler):
+        self._function = function
+        self._entry = entry
+        self._profiler = profiler
+
+    def __call__(self, *args):
+        if self._profiler.paused:
+            return self._function(*args)
+        started = time.perf_counter()
+        try:
+            return self._function(*args)
+        finally:
+            self._entry[0] += 1
+            self._entry[1] += time.perf_counter() - started
+
+
+class _ProfiledModule:
+    """Stands in for _mod while profiling, its exported functions (the bindings) are timed"""
+
+    def __init__(self, mod, profiler):
+        self._profiled = mod
+        self._profiler = profiler
+
+    def __getattr__(self, name: str):
+        value = getattr(self._profiled, name)
+        if name.startswith("_") and callable(value):
+            value = _ProfiledCall(value, self._profiler.entry("bindings", name), self._profiler)
+            if name == "_EndDrawing":
+                value = self._profiler.ending_frame(value)
+            setattr(self, name, value)  # found without __getattr__ from now on
+        return value
+
+
+class _ProfiledView:
+    """Stands in for a view of the wasm heap while profiling, every access to it crosses into javascript"""
+    __slots__ = ("_view", "_entry", "_profiler")
+
+    def __init__(self, view, entry: list, profiler):
+        self._view = view
+        self._entry = entry
+        self._profiler = profiler
+
+    def __getitem__(self, index):
+        if self._profiler.paused:
+            return self._view[index]
+        started = time.perf_counter()
+        try:
+            return self._view[index]
+        finally:
+            self._entry[0] += 1
+            self._entry[1] += time.perf_counter() - started
+
+    def __setitem__(self, index, value):
+        if self._profiler.paused:
+            self._view[index] = value
+            return
+        started = time.perf_counter()
+        try:
+            self._view[index] = value
+        finally:
+            self._entry[0] += 1
+            self._entry[1] += time.perf_counter() - started
+
+    def __getattr__(self, name: str):
+        return _ProfiledCall(getattr(self._view, name), self._entry, self._profiler)  # subarray(), getFloat32(), ...
+
+
+class _ProfiledHeap:
+    """Stands in for _heap while profiling"""
+
+    def __init__(self, heap, profiler):
+        self._heap = heap
+        self._profiler = profiler
+        self._entry = profiler.entry("marshalling", "heap")
+
+    def __getattr__(self, name: str):
+        # not kept, the views are replaced when the wasm memory grows
+        return _ProfiledView(getattr(self._heap, name), self._entry, self._profiler)
+
+
+class _ProfiledAllocator:
+    """Stands in for the scratch arena or the struct pool while profiling, timed_methods: method -> marshalling entry"""
+
+    def __init__(self, allocator, timed_methods: dict, profiler):
+        self._allocator = allocator
+        self._timed_methods = timed_methods
+        self._profiler = profiler
+
+    def __getattr__(self, name: str):
+        value = getattr(self._allocator, name)
+        if name in self._timed_methods:
+            value = _ProfiledCall(value, self._profiler.entry("marshalling", self._timed_methods[name]), self._profiler)
+            setattr(self, name, value)
+        return value
+
+
+class Profiler:
+    """Calls and time of the wasm bindings and of the marshalling around them, for the last frame and in total"""
+
+    def __init__(self):
+        self.paused = False  # set while the profiler draws itself
+        self.frames = 0
+        self._entries = {"bindings": {}, "marshalling": {}}  # kind -> name -> [calls, seconds] of the current frame
+        self.last_frame = {"bindings": {}, "marshalling": {}}
+        self.total = {"bindings": {}, "marshalling": {}}
+        # WebGL calls counted by python-raylib-web.js (mod.glCounters), once the window has a context
+        self.gpu_last_frame = {}
+        self.gpu_total = {"draw_calls": 0, "texture_binds": 0, "batches": 0}
+        self._gpu_counts = None  # the counters at the end of the previous frame
+        self.profiled_state = {}
+
+    def entry(self, kind: str, name: str) -> list:
+        return self._entries[kind].setdefault(name, [0, 0.0])
+
+    def stand_ins(self, state: dict) -> dict:
+        """The profiled stand-ins of the state of a context"""
+        self.profiled_state = {name: state[name] for name in ["_mod", "_heap", "_scratch_arena", "_struct_pool"]}
+        return {
+            "_mod": _ProfiledModule(state["_mod"], self),
+            "_heap": _ProfiledHeap(state["_heap"], self),
+            "_scratch_arena": _ProfiledAllocator(state["_scratch_arena"], {"string": "strings", "alloc": "scratch"}, self),
+            "_struct_pool": _ProfiledAllocator(state["_struct_pool"], {"alloc": "structs"}, self),
+        }
+
+    def ending_frame(self, end_drawing):
+        def profiled_end_drawing(*args):
+            end_drawing(*args)
+            self.end_frame()
+        return profiled_end_drawing
+
+    def _gpu_end_frame(self):
+        counters = getattr(self.profiled_state.get("_mod"), "glCounters", None)
+        if counters is None or not counters.start():
+            return
+        counts = (counters.drawCalls, counters.textureBinds, counters.batches)
+        if self._gpu_counts is not None:
+            self.gpu_last_frame = {name: count - previous for name, count, previous in
+                                   zip(self.gpu_total, counts, self._gpu_counts)}
+            for name, count in self.gpu_last_frame.items():
+                self.gpu_total[name] += count
+        self._gpu_counts = counts
+
+    def end_frame(self):
+        self.frames += 1
+        self._gpu_end_frame()
+        for kind, entries in self._entries.items():
+            last = self.last_frame[kind] = {}
+            total = self.total[kind]
+            for name, entry in entries.items():
+                if entry[0] == 0:
+                    continue
+                last[name] = (entry[0], entry[1])
+                total_entry = total.setdefault(name, [0, 0.0])
+                total_entry[0] += entry[0]
+                total_entry[1] += entry[1]
+                entry[0] = 0
+                entry[1] = 0.0
+
+    def report(self) -> dict:
+        def tables(entries: dict) -> dict:
+            report = {"crossings": sum(calls for calls, _ in entries["bindings"].values()) +
+                      entries["marshalling"].get("heap", (0, 0.0))[0]}
+            for kind, kind_entries in entries.items():
+                report[kind] = {name: {"calls": calls, "ms": seconds * 1000}
+                                for name, (calls, seconds) in sorted(kind_entries.items(), key=lambda item: -item[1][1])}
+            return report
+
+        return {"frames": self.frames, "last_frame": {**tables(self.last_frame), "gpu": dict(self.gpu_last_frame)},
+                "total": {**tables(self.total), "gpu": dict(self.gpu_total)}}
+
+
+def enable_profiling():
+    """Count and time every wasm binding and the marshalling around them (strings, structs, heap accesses), slows
+    the wasm calls down until disable_profiling()"""
+    if _active_context.profiler is None:
+        _active_context.set_profiler(Profiler())
+
+
+def disable_profiling():
+    """Go back to calling wasm without counting"""
+    _active_context.set_profiler(None)
+
+
+def is_profiling_enabled() -> bool:
+    """Check if the wasm bindings are profiled"""
+    return _active_context.profiler is not None
+
+
+def get_profile() -> dict:
+    """Get the calls and ms of each binding and of the marshalling, the crossings into javascript and the WebGL draw
+    calls, texture binds and rlgl batches (gpu), of the last frame and since enable_profiling()"""
+    profiler = _active_context.profiler
+    return profiler.report() if profiler is not None else {}
+
+
+def export_profile() -> str:
+    """Get the profile as JSON, to keep and compare later"""
+    return json.dumps(get_profile(), indent=2)
+
+
+def draw_profiler(x: int = 10, y: int = 10, lines: int = 8):
+    """Draw the bindings that took the most time in the last frame and the marshalling, over the frame"""
+    profiler = _active_context.profiler
+    if profiler is None:
+        return
+    last_frame = profiler.report()["last_frame"]
+    rows = [f"frame {profiler.frames}, {last_frame['crossings']} crossings"]
+    if last_frame["gpu"]:
+        gpu = last_frame["gpu"]
+        rows.append(f"{gpu['draw_calls']} draw calls, {gpu['texture_binds']} texture binds, {gpu['batches']} batches")
+    for kind in ["bindings", "marshalling"]:
+        for name, entry in list(last_frame[kind].items())[:lines]:
+            rows.append(f"{name.lstrip('_')} {entry['calls']}x {entry['ms']:.2f} ms")
+
+    # the functions the user code sees, so the overlay is recorded too when the command buffer is enabled
+    draw_rectangle = _active_context.builtins["draw_rectangle"]
+    draw_text = _active_context.builtins["draw_text"]
+    profiler.paused = True
+    try:
+        draw_rectangle(x, y, 240, 8 + 12 * len(rows), Color(0, 0, 0, 180))
+        for i, row in enumerate(rows):
+            draw_text(row, x + 4, y + 4 + 12 * i, 10, LIME)
+    finally:
+        profiler.paused = False
+
+
+def init_window(width: int, height: int, title: str):
+    """Initialize window and OpenGL context"""
+    if __debug__:
+        _check_int("init_window", "width", width, -2147483648, 2147483647)
+        _check_int("init_window", "height", height, -2147483648, 2147483647)
+        _check_str("init_window", "title", title)
+    title_ = _scratch_arena.string(title)
+    _InitWindow(width, height, title_)
+
+
+def window_should_close() -> int:
+    """Check if KEY_ESCAPE pressed or Close icon pressed"""
+    return_interface = _WindowShouldClose()
+    return return_interface
+
+
+def close_window():
+    """Close window and unload OpenGL context"""
+    _CloseWindow()
+
+
+def is_window_ready() -> int:
+    """Check if window has been initialized successfully"""
+    return_interface = _IsWindowReady()
+    return return_interface
+
+
+def is_window_fullscreen() -> int:
+    """Check if window is currently fullscreen"""
+    return_interface = _IsWindowFullscreen()
+    return return_interface
+
+
+def is_window_hidden() -> int:
+    """Check if window is currently hidden (only PLATFORM_DESKTOP)"""
+    return_interface = _IsWindowHidden()
+    return return_interface
+
+
+def is_window_minimized() -> int:
+    """Check if window is currently minimized (only PLATFORM_DESKTOP)"""
+    return_interface = _IsWindowMinimized()
+    return return_interface
+
+
+def is_window_maximized() -> int:
+    """Check if window is currently maximized (only PLATFORM_DESKTOP)"""
+    return_interface = _IsWindowMaximized()
+    return return_interface
+
+
+def is_window_focused() -> int:
+    """Check if window is currently focused (only PLATFORM_DESKTOP)"""
+    return_interface = _IsWindowFocused()
+    return return_interface
+
+
+def is_window_resized() -> int:
+    """Check if window has been resized last frame"""
+    return_interface = _IsWindowResized()
+    return return_interface
+
+
+def is_window_state(flag: int) -> int:
+    """Check if one specific window flag is enabled"""
+    if __debug__:
+        _check_int("is_window_state", "flag", flag, 0, 4294967295)
+    return_interface = _IsWindowState(flag)
+    return return_interface
+
+
+def set_window_state(flags: int):
+    """Set window configuration state using flags (only PLATFORM_DESKTOP)"""
+    if __debug__:
+        _check_int("set_window_state", "flags", flags, 0, 4294967295)
+    _SetWindowState(flags)
+
+
+def clear_window_state(flags: int):
+    """Clear window configuration state flags"""
+    if __debug__:
+        _check_int("clear_window_state", "flags", flags, 0, 4294967295)
+    _ClearWindowState(flags)
+
+
+def toggle_fullscreen():
+    """Toggle window state: fullscreen/windowed (only PLATFORM_DESKTOP)"""
+    _ToggleFullscreen()
+
+
+def maximize_window():
+    """Set window state: maximized, if resizable (only PLATFORM_DESKTOP)"""
+    _MaximizeWindow()
+
+
+def minimize_window():
+    """Set window state: minimized, if resizable (only PLATFORM_DESKTOP)"""
+    _MinimizeWindow()
+
+
+def restore_window():
+    """Set window state: not minimized/maximized (only PLATFORM_DESKTOP)"""
+    _RestoreWindow()
+
+
+def set_window_icon(image: Image):
+    """Set icon for window (single image, RGBA 32bit, only PLATFORM_DESKTOP)"""
+    if __debug__:
+        _check_struct("set_window_icon", "image", image, Image)
+    _SetWindowIcon(image._address)
+
+
+def set_window_icons(images: int, count: int):
+    """Set icon for window (multiple images, RGBA 32bit, only PLATFORM_DESKTOP)"""
+    if __debug__:
+        _check_int("set_window_icons", "images", images, 0, 4294967295)
+        _check_int("set_window_icons", "count", count, -2147483648, 2147483647)
+    _SetWindowIcons(images, count)
+
+
+def set_window_title(title: str):
+    """Set title for window (only PLATFORM_DESKTOP)"""
+    if __debug__:
+        _check_str("set_window_title", "title", title)
+    title_ = _scratch_arena.string(title)
+    _SetWindowTitle(title_)
+
+
+def set_window_position(x: int, y: int):
+    """Set window position on screen (only PLATFORM_DESKTOP)"""
+    if __debug__:
+        _check_int("set_window_position", "x", x, -2147483648, 2147483647)
+        _check_int("set_window_position", "y", y, -2147483648, 2147483647)
+    _SetWindowPosition(x, y)
+
+
+def set_window_monitor(monitor: int):
+    """Set monitor for the current window (fullscreen mode)"""
+    if __debug__:
+        _check_int("set_window_monitor", "monitor", monitor, -2147483648, 2147483647)
+    _SetWindowMonitor(monitor)
+
+
+def set_window_min_size(width: int, height: int):
+    """Set window minimum dimensions (for FLAG_WINDOW_RESIZABLE)"""
+    if __debug__:
+        _check_int("set_window_min_size", "width", width, -2147483648, 2147483647)
+        _check_int("set_window_min_size", "height", height, -2147483648, 2147483647)
+    _SetWindowMinSize(width, height)
+
+
+def set_window_size(width: int, height: int):
+    """Set window dimensions"""
+    if __debug__:
+        _check_int("set_window_size", "width", width, -2147483648, 2147483647)
+        _check_int("set_window_size", "height", height, -2147483648, 2147483647)
+    _SetWindowSize(width, height)
+
+
+def set_window_opacity(opacity: float):
+    """Set window opacity [0.0f..1.0f] (only PLATFORM_DESKTOP)"""
+    if __debug__:
+        _check_float("set_window_opacity", "opacity", opacity)
+    _SetWindowOpacity(opacity)
+
+
+def set_window_focused():
+    """Set window focused (only PLATFORM_DESKTOP)"""
+    _SetWindowFocused()
+
+
+def get_window_handle() -> int:
+    """Get native window handle"""
+    return_interface = _GetWindowHandle()
+    return return_interface
+
+
+def get_screen_width() -> int:
+    """Get current screen width"""
+    return_interface = _GetScreenWidth()
+    return return_interface
+
+
+def get_screen_height() -> int:
+    """Get current screen height"""
+    return_interface = _GetScreenHeight()
+    return return_interface
+
+
+def get_render_width() -> int:
+    """Get current render width (it considers HiDPI)"""
+    return_interface = _GetRenderWidth()
+    return return_interface
+
+
+def get_render_height() -> int:
+    """Get current render height (it considers HiDPI)"""
+    return_interface = _GetRenderHeight()
+    return return_interface
+
+
+def get_monitor_count() -> int:
+    """Get number of connected monitors"""
+    return_interface = _GetMonitorCount()
+    return return_interface
+
+
+def get_current_monitor() -> int:
+    """Get current connected monitor"""
+    return_interface = _GetCurrentMonitor()
+    return return_interface
+
+
+def get_monitor_position(monitor: int, out: Vector2 = None) -> Vector2:
+    """Get specified monitor position"""
+    if __debug__:
+        _check_int("get_monitor_position", "monitor", monitor, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("get_monitor_position", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 else out
+    _GetMonitorPosition(Vector2_._address, monitor)
+    if out is not None and out is not Vector2_:
+        out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def get_monitor_width(monitor: int) -> int:
+    """Get specified monitor width (current video mode used by monitor)"""
+    if __debug__:
+        _check_int("get_monitor_width", "monitor", monitor, -2147483648, 2147483647)
+    return_interface = _GetMonitorWidth(monitor)
+    return return_interface
+
+
+def get_monitor_height(monitor: int) -> int:
+    """Get specified monitor height (current video mode used by monitor)"""
+    if __debug__:
+        _check_int("get_monitor_height", "monitor", monitor, -2147483648, 2147483647)
+    return_interface = _GetMonitorHeight(monitor)
+    return return_interface
+
+
+def get_monitor_physical_width(monitor: int) -> int:
+    """Get specified monitor physical width in millimetres"""
+    if __debug__:
+        _check_int("get_monitor_physical_width", "monitor", monitor, -2147483648, 2147483647)
+    return_interface = _GetMonitorPhysicalWidth(monitor)
+    return return_interface
+
+
+def get_monitor_physical_height(monitor: int) -> int:
+    """Get specified monitor physical height in millimetres"""
+    if __debug__:
+        _check_int("get_monitor_physical_height", "monitor", monitor, -2147483648, 2147483647)
+    return_interface = _GetMonitorPhysicalHeight(monitor)
+    return return_interface
+
+
+def get_monitor_refresh_rate(monitor: int) -> int:
+    """Get specified monitor refresh rate"""
+    if __debug__:
+        _check_int("get_monitor_refresh_rate", "monitor", monitor, -2147483648, 2147483647)
+    return_interface = _GetMonitorRefreshRate(monitor)
+    return return_interface
+
+
+def get_window_position(out: Vector2 = None) -> Vector2:
+    """Get window position XY on monitor"""
+    if __debug__:
+        if out is not None:
+            _check_struct("get_window_position", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 else out
+    _GetWindowPosition(Vector2_._address)
+    if out is not None and out is not Vector2_:
+        out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def get_window_scale_dpi(out: Vector2 = None) -> Vector2:
+    """Get window scale DPI factor"""
+    if __debug__:
+        if out is not None:
+            _check_struct("get_window_scale_dpi", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 else out
+    _GetWindowScaleDPI(Vector2_._address)
+    if out is not None and out is not Vector2_:
+        out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def get_monitor_name(monitor: int) -> int:
+    """Get the human-readable, UTF-8 encoded name of the primary monitor"""
+    if __debug__:
+        _check_int("get_monitor_name", "monitor", monitor, -2147483648, 2147483647)
+    return_interface = _GetMonitorName(monitor)
+    return return_interface
+
+
+def set_clipboard_text(text: str):
+    """Set clipboard text content"""
+    if __debug__:
+        _check_str("set_clipboard_text", "text", text)
+    text_ = _scratch_arena.string(text)
+    _SetClipboardText(text_)
+
+
+def get_clipboard_text() -> int:
+    """Get clipboard text content"""
+    return_interface = _GetClipboardText()
+    return return_interface
+
+
+def enable_event_waiting():
+    """Enable waiting for events on EndDrawing(), no automatic event polling"""
+    _EnableEventWaiting()
+
+
+def disable_event_waiting():
+    """Disable waiting for events on EndDrawing(), automatic events polling"""
+    _DisableEventWaiting()
+
+
+def swap_screen_buffer():
+    """Swap back buffer with front buffer (screen drawing)"""
+    _SwapScreenBuffer()
+
+
+def poll_input_events():
+    """Register all input events"""
+    _PollInputEvents()
+
+
+def wait_time(seconds: float):
+    """Wait for some time (halt program execution)"""
+    if __debug__:
+        _check_float("wait_time", "seconds", seconds)
+    _WaitTime(seconds)
+
+
+def show_cursor():
+    """Shows cursor"""
+    _ShowCursor()
+
+
+def hide_cursor():
+    """Hides cursor"""
+    _HideCursor()
+
+
+def is_cursor_hidden() -> int:
+    """Check if cursor is not visible"""
+    return_interface = _IsCursorHidden()
+    return return_interface
+
+
+def enable_cursor():
+    """Enables cursor (unlock cursor)"""
+    _EnableCursor()
+
+
+def disable_cursor():
+    """Disables cursor (lock cursor)"""
+    _DisableCursor()
+
+
+def is_cursor_on_screen() -> int:
+    """Check if cursor is on the screen"""
+    return_interface = _IsCursorOnScreen()
+    return return_interface
+
+
+def clear_background(color: Color):
+    """Set background color (framebuffer clear color)"""
+    if __debug__:
+        _check_struct("clear_background", "color", color, Color)
+    _ClearBackground(color._address)
+
+
+def begin_drawing():
+    """Setup canvas (framebuffer) to start drawing"""
+    _BeginDrawing()
+
+
+def end_drawing():
+    """End canvas drawing and swap buffers (double buffering)"""
+    _EndDrawing()
+    _scratch_arena.reset()
+
+
+def begin_mode_2d(camera: Camera2D):
+    """Begin 2D mode with custom camera (2D)"""
+    if __debug__:
+        _check_struct("begin_mode_2d", "camera", camera, Camera2D)
+    _BeginMode2D(camera._address)
+
+
+def end_mode_2d():
+    """Ends 2D mode with custom camera"""
+    _EndMode2D()
+
+
+def begin_mode_3d(camera: Camera3D):
+    """Begin 3D mode with custom camera (3D)"""
+    if __debug__:
+        _check_struct("begin_mode_3d", "camera", camera, Camera3D)
+    _BeginMode3D(camera._address)
+
+
+def end_mode_3d():
+    """Ends 3D mode and returns to default 2D orthographic mode"""
+    _EndMode3D()
+
+
+def begin_texture_mode(target: RenderTexture2D):
+    """Begin drawing to render texture"""
+    if __debug__:
+        _check_struct("begin_texture_mode", "target", target, RenderTexture2D)
+    _BeginTextureMode(target._address)
+
+
+def end_texture_mode():
+    """Ends drawing to render texture"""
+    _EndTextureMode()
+
+
+def begin_shader_mode(shader: Shader):
+    """Begin custom shader drawing"""
+    if __debug__:
+        _check_struct("begin_shader_mode", "shader", shader, Shader)
+    _BeginShaderMode(shader._address)
+
+
+def end_shader_mode():
+    """End custom shader drawing (use default shader)"""
+    _EndShaderMode()
+
+
+def begin_blend_mode(mode: int):
+    """Begin blending mode (alpha, additive, multiplied, subtract, custom)"""
+    if __debug__:
+        _check_int("begin_blend_mode", "mode", mode, -2147483648, 2147483647)
+    _BeginBlendMode(mode)
+
+
+def end_blend_mode():
+    """End blending mode (reset to default: alpha blending)"""
+    _EndBlendMode()
+
+
+def begin_scissor_mode(x: int, y: int, width: int, height: int):
+    """Begin scissor mode (define screen area for following drawing)"""
+    if __debug__:
+        _check_int("begin_scissor_mode", "x", x, -2147483648, 2147483647)
+        _check_int("begin_scissor_mode", "y", y, -2147483648, 2147483647)
+        _check_int("begin_scissor_mode", "width", width, -2147483648, 2147483647)
+        _check_int("begin_scissor_mode", "height", height, -2147483648, 2147483647)
+    _BeginScissorMode(x, y, width, height)
+
+
+def end_scissor_mode():
+    """End scissor mode"""
+    _EndScissorMode()
+
+
+def begin_vr_stereo_mode(config: VrStereoConfig):
+    """Begin stereo rendering (requires VR simulator)"""
+    if __debug__:
+        _check_struct("begin_vr_stereo_mode", "config", config, VrStereoConfig)
+    _BeginVrStereoMode(config._address)
+
+
+def end_vr_stereo_mode():
+    """End stereo rendering (requires VR simulator)"""
+    _EndVrStereoMode()
+
+
+def load_vr_stereo_config(device: VrDeviceInfo, out: VrStereoConfig = None) -> VrStereoConfig:
+    """Load VR stereo config for VR simulator device parameters"""
+    if __debug__:
+        _check_struct("load_vr_stereo_config", "device", device, VrDeviceInfo)
+        if out is not None:
+            _check_struct("load_vr_stereo_config", "out", out, VrStereoConfig)
+    VrStereoConfig_ = _new_struct(VrStereoConfig) if out is None or out.__class__ is not VrStereoConfig or out._address in (device._address,) else out
+    _LoadVrStereoConfig(VrStereoConfig_._address, device._address)
+    if out is not None and out is not VrStereoConfig_:
+        if out.__class__ is VrStereoConfig:
+            _memcpy(out._address, VrStereoConfig_._address, VrStereoConfig._size)
+        else:
+            out._assign(VrStereoConfig_)  # a shadow struct
+        return out
+    return VrStereoConfig_
+
+
+def unload_vr_stereo_config(config: VrStereoConfig):
+    """Unload VR stereo config"""
+    if __debug__:
+        _check_struct("unload_vr_stereo_config", "config", config, VrStereoConfig)
+    _UnloadVrStereoConfig(config._address)
+
+
+def load_shader(vsFileName: str, fsFileName: str, out: Shader = None) -> Shader:
+    """Load shader from files and bind default locations"""
+    if __debug__:
+        _check_str("load_shader", "vsFileName", vsFileName)
+        _check_str("load_shader", "fsFileName", fsFileName)
+        if out is not None:
+            _check_struct("load_shader", "out", out, Shader)
+    Shader_ = _new_struct(Shader) if out is None or out.__class__ is not Shader else out
+    vsFileName_ = _scratch_arena.string(vsFileName)
+    fsFileName_ = _scratch_arena.string(fsFileName)
+    _LoadShader(Shader_._address, vsFileName_, fsFileName_)
+    if out is not None and out is not Shader_:
+        out._assign(Shader_)  # a shadow struct
+        return out
+    return Shader_
+
+
+def load_shader_from_memory(vsCode: str, fsCode: str, out: Shader = None) -> Shader:
+    """Load shader from code strings and bind default locations"""
+    if __debug__:
+        _check_str("load_shader_from_memory", "vsCode", vsCode)
+        _check_str("load_shader_from_memory", "fsCode", fsCode)
+        if out is not None:
+            _check_struct("load_shader_from_memory", "out", out, Shader)
+    Shader_ = _new_struct(Shader) if out is None or out.__class__ is not Shader else out
+    vsCode_ = _scratch_arena.string(vsCode)
+    fsCode_ = _scratch_arena.string(fsCode)
+    _LoadShaderFromMemory(Shader_._address, vsCode_, fsCode_)
+    if out is not None and out is not Shader_:
+        out._assign(Shader_)  # a shadow struct
+        return out
+    return Shader_
+
+
+def is_shader_ready(shader: Shader) -> int:
+    """Check if a shader is ready"""
+    if __debug__:
+        _check_struct("is_shader_ready", "shader", shader, Shader)
+    return_interface = _IsShaderReady(shader._address)
+    return return_interface
+
+
+def get_shader_location(shader: Shader, uniformName: str) -> int:
+    """Get shader uniform location"""
+    if __debug__:
+        _check_struct("get_shader_location", "shader", shader, Shader)
+        _check_str("get_shader_location", "uniformName", uniformName)
+    uniformName_ = _scratch_arena.string(uniformName)
+    return_interface = _GetShaderLocation(shader._address, uniformName_)
+    return return_interface
+
+
+def get_shader_location_attrib(shader: Shader, attribName: str) -> int:
+    """Get shader attribute location"""
+    if __debug__:
+        _check_struct("get_shader_location_attrib", "shader", shader, Shader)
+        _check_str("get_shader_location_attrib", "attribName", attribName)
+    attribName_ = _scratch_arena.string(attribName)
+    return_interface = _GetShaderLocationAttrib(shader._address, attribName_)
+    return return_interface
+
+
+def set_shader_value(shader: Shader, locIndex: int, value: int, uniformType: int):
+    """Set shader uniform value"""
+    if __debug__:
+        _check_struct("set_shader_value", "shader", shader, Shader)
+        _check_int("set_shader_value", "locIndex", locIndex, -2147483648, 2147483647)
+        _check_int("set_shader_value", "value", value, 0, 4294967295)
+        _check_int("set_shader_value", "uniformType", uniformType, -2147483648, 2147483647)
+    _SetShaderValue(shader._address, locIndex, value, uniformType)
+
+
+def set_shader_value_v(shader: Shader, locIndex: int, value: int, uniformType: int, count: int):
+    """Set shader uniform value vector"""
+    if __debug__:
+        _check_struct("set_shader_value_v", "shader", shader, Shader)
+        _check_int("set_shader_value_v", "locIndex", locIndex, -2147483648, 2147483647)
+        _check_int("set_shader_value_v", "value", value, 0, 4294967295)
+        _check_int("set_shader_value_v", "uniformType", uniformType, -2147483648, 2147483647)
+        _check_int("set_shader_value_v", "count", count, -2147483648, 2147483647)
+    _SetShaderValueV(shader._address, locIndex, value, uniformType, count)
+
+
+def set_shader_value_matrix(shader: Shader, locIndex: int, mat: Matrix):
+    """Set shader uniform value (matrix 4x4)"""
+    if __debug__:
+        _check_struct("set_shader_value_matrix", "shader", shader, Shader)
+        _check_int("set_shader_value_matrix", "locIndex", locIndex, -2147483648, 2147483647)
+        _check_struct("set_shader_value_matrix", "mat", mat, Matrix)
+    _SetShaderValueMatrix(shader._address, locIndex, mat._address)
+
+
+def set_shader_value_texture(shader: Shader, locIndex: int, texture: Texture2D):
+    """Set shader uniform value for texture (sampler2d)"""
+    if __debug__:
+        _check_struct("set_shader_value_texture", "shader", shader, Shader)
+        _check_int("set_shader_value_texture", "locIndex", locIndex, -2147483648, 2147483647)
+        _check_struct("set_shader_value_texture", "texture", texture, Texture2D)
+    _SetShaderValueTexture(shader._address, locIndex, texture._address)
+
+
+def unload_shader(shader: Shader):
+    """Unload shader from GPU memory (VRAM)"""
+    if __debug__:
+        _check_struct("unload_shader", "shader", shader, Shader)
+    _UnloadShader(shader._address)
+
+
+def get_mouse_ray(mousePosition: Vector2, camera: Camera, out: Ray = None) -> Ray:
+    """Get a ray trace from mouse position"""
+    if __debug__:
+        _check_struct("get_mouse_ray", "mousePosition", mousePosition, Vector2)
+        _check_struct("get_mouse_ray", "camera", camera, Camera)
+        if out is not None:
+            _check_struct("get_mouse_ray", "out", out, Ray)
+    Ray_ = _new_struct(Ray) if out is None or out.__class__ is not Ray or out._address in (mousePosition._address, camera._address,) else out
+    _GetMouseRay(Ray_._address, mousePosition._address, camera._address)
+    if out is not None and out is not Ray_:
+        if out.__class__ is Ray:
+            _memcpy(out._address, Ray_._address, Ray._size)
+        else:
+            out._assign(Ray_)  # a shadow struct
+        return out
+    return Ray_
+
+
+def get_camera_matrix(camera: Camera, out: Matrix = None) -> Matrix:
+    """Get camera transform matrix (view matrix)"""
+    if __debug__:
+        _check_struct("get_camera_matrix", "camera", camera, Camera)
+        if out is not None:
+            _check_struct("get_camera_matrix", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix or out._address in (camera._address,) else out
+    _GetCameraMatrix(Matrix_._address, camera._address)
+    if out is not None and out is not Matrix_:
+        if out.__class__ is Matrix:
+            _memcpy(out._address, Matrix_._address, Matrix._size)
+        else:
+            out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def get_camera_matrix_2d(camera: Camera2D, out: Matrix = None) -> Matrix:
+    """Get camera 2d transform matrix"""
+    if __debug__:
+        _check_struct("get_camera_matrix_2d", "camera", camera, Camera2D)
+        if out is not None:
+            _check_struct("get_camera_matrix_2d", "out", out, Matrix)
+    Matrix_ = _new_struct(Matrix) if out is None or out.__class__ is not Matrix or out._address in (camera._address,) else out
+    _GetCameraMatrix2D(Matrix_._address, camera._address)
+    if out is not None and out is not Matrix_:
+        if out.__class__ is Matrix:
+            _memcpy(out._address, Matrix_._address, Matrix._size)
+        else:
+            out._assign(Matrix_)  # a shadow struct
+        return out
+    return Matrix_
+
+
+def get_world_to_screen(position: Vector3, camera: Camera, out: Vector2 = None) -> Vector2:
+    """Get the screen space position for a 3d world space position"""
+    if __debug__:
+        _check_struct("get_world_to_screen", "position", position, Vector3)
+        _check_struct("get_world_to_screen", "camera", camera, Camera)
+        if out is not None:
+            _check_struct("get_world_to_screen", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 or out._address in (position._address, camera._address,) else out
+    _GetWorldToScreen(Vector2_._address, position._address, camera._address)
+    if out is not None and out is not Vector2_:
+        if out.__class__ is Vector2:
+            _memcpy(out._address, Vector2_._address, Vector2._size)
+        else:
+            out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def get_screen_to_world_2d(position: Vector2, camera: Camera2D, out: Vector2 = None) -> Vector2:
+    """Get the world space position for a 2d camera screen space position"""
+    if __debug__:
+        _check_struct("get_screen_to_world_2d", "position", position, Vector2)
+        _check_struct("get_screen_to_world_2d", "camera", camera, Camera2D)
+        if out is not None:
+            _check_struct("get_screen_to_world_2d", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 or out._address in (position._address, camera._address,) else out
+    _GetScreenToWorld2D(Vector2_._address, position._address, camera._address)
+    if out is not None and out is not Vector2_:
+        if out.__class__ is Vector2:
+            _memcpy(out._address, Vector2_._address, Vector2._size)
+        else:
+            out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def get_world_to_screen_ex(position: Vector3, camera: Camera, width: int, height: int, out: Vector2 = None) -> Vector2:
+    """Get size position for a 3d world space position"""
+    if __debug__:
+        _check_struct("get_world_to_screen_ex", "position", position, Vector3)
+        _check_struct("get_world_to_screen_ex", "camera", camera, Camera)
+        _check_int("get_world_to_screen_ex", "width", width, -2147483648, 2147483647)
+        _check_int("get_world_to_screen_ex", "height", height, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("get_world_to_screen_ex", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 or out._address in (position._address, camera._address,) else out
+    _GetWorldToScreenEx(Vector2_._address, position._address, camera._address, width, height)
+    if out is not None and out is not Vector2_:
+        if out.__class__ is Vector2:
+            _memcpy(out._address, Vector2_._address, Vector2._size)
+        else:
+            out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def get_world_to_screen_2d(position: Vector2, camera: Camera2D, out: Vector2 = None) -> Vector2:
+    """Get the screen space position for a 2d camera world space position"""
+    if __debug__:
+        _check_struct("get_world_to_screen_2d", "position", position, Vector2)
+        _check_struct("get_world_to_screen_2d", "camera", camera, Camera2D)
+        if out is not None:
+            _check_struct("get_world_to_screen_2d", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 or out._address in (position._address, camera._address,) else out
+    _GetWorldToScreen2D(Vector2_._address, position._address, camera._address)
+    if out is not None and out is not Vector2_:
+        if out.__class__ is Vector2:
+            _memcpy(out._address, Vector2_._address, Vector2._size)
+        else:
+            out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def set_target_fps(fps: int):
+    """Set target FPS (maximum)"""
+    if __debug__:
+        _check_int("set_target_fps", "fps", fps, -2147483648, 2147483647)
+    _SetTargetFPS(fps)
+
+
+def get_fps() -> int:
+    """Get current FPS"""
+    return_interface = _GetFPS()
+    return return_interface
+
+
+def get_frame_time() -> float:
+    """Get time in seconds for last frame drawn (delta time)"""
+    return_interface = _GetFrameTime()
+    return return_interface
+
+
+def get_time() -> float:
+    """Get elapsed time in seconds since InitWindow()"""
+    return_interface = _GetTime()
+    return return_interface
+
+
+def get_random_value(min: int, max: int) -> int:
+    """Get a random value between min and max (both included)"""
+    if __debug__:
+        _check_int("get_random_value", "min", min, -2147483648, 2147483647)
+        _check_int("get_random_value", "max", max, -2147483648, 2147483647)
+    return_interface = _GetRandomValue(min, max)
+    return return_interface
+
+
+def set_random_seed(seed: int):
+    """Set the seed for the random number generator"""
+    if __debug__:
+        _check_int("set_random_seed", "seed", seed, 0, 4294967295)
+    _SetRandomSeed(seed)
+
+
+def take_screenshot(fileName: str):
+    """Takes a screenshot of current screen (filename extension defines format)"""
+    if __debug__:
+        _check_str("take_screenshot", "fileName", fileName)
+    fileName_ = _scratch_arena.string(fileName)
+    _TakeScreenshot(fileName_)
+
+
+def set_config_flags(flags: int):
+    """Setup init configuration flags (view FLAGS)"""
+    if __debug__:
+        _check_int("set_config_flags", "flags", flags, 0, 4294967295)
+    _SetConfigFlags(flags)
+
+
+def set_trace_log_level(logLevel: int):
+    """Set the current threshold (minimum) log level"""
+    if __debug__:
+        _check_int("set_trace_log_level", "logLevel", logLevel, -2147483648, 2147483647)
+    _SetTraceLogLevel(logLevel)
+
+
+def mem_alloc(size: int) -> int:
+    """Internal memory allocator"""
+    if __debug__:
+        _check_int("mem_alloc", "size", size, 0, 4294967295)
+    return_interface = _MemAlloc(size)
+    return return_interface
+
+
+def mem_realloc(ptr: int, size: int) -> int:
+    """Internal memory reallocator"""
+    if __debug__:
+        _check_int("mem_realloc", "ptr", ptr, 0, 4294967295)
+        _check_int("mem_realloc", "size", size, 0, 4294967295)
+    return_interface = _MemRealloc(ptr, size)
+    return return_interface
+
+
+def mem_free(ptr: int):
+    """Internal memory free"""
+    if __debug__:
+        _check_int("mem_free", "ptr", ptr, 0, 4294967295)
+    _MemFree(ptr)
+
+
+def open_url(url: str):
+    """Open URL with default system browser (if available)"""
+    if __debug__:
+        _check_str("open_url", "url", url)
+    url_ = _scratch_arena.string(url)
+    _OpenURL(url_)
+
+
+def load_file_data(fileName: str, bytesRead: int) -> int:
+    """Load file data as byte array (read)"""
+    if __debug__:
+        _check_str("load_file_data", "fileName", fileName)
+        _check_int("load_file_data", "bytesRead", bytesRead, 0, 4294967295)
+    fileName_ = _scratch_arena.string(fileName)
+    return_interface = _LoadFileData(fileName_, bytesRead)
+    return return_interface
+
+
+def unload_file_data(data: int):
+    """Unload file data allocated by LoadFileData()"""
+    if __debug__:
+        _check_int("unload_file_data", "data", data, 0, 4294967295)
+    _UnloadFileData(data)
+
+
+def save_file_data(fileName: str, data: int, bytesToWrite: int) -> int:
+    """Save data to file from byte array (write), returns true on success"""
+    if __debug__:
+        _check_str("save_file_data", "fileName", fileName)
+        _check_int("save_file_data", "data", data, 0, 4294967295)
+        _check_int("save_file_data", "bytesToWrite", bytesToWrite, 0, 4294967295)
+    fileName_ = _scratch_arena.string(fileName)
+    return_interface = _SaveFileData(fileName_, data, bytesToWrite)
+    return return_interface
+
+
+def export_data_as_code(data: int, size: int, fileName: str) -> int:
+    """Export data to code (.h), returns true on success"""
+    if __debug__:
+        _check_int("export_data_as_code", "data", data, 0, 4294967295)
+        _check_int("export_data_as_code", "size", size, 0, 4294967295)
+        _check_str("export_data_as_code", "fileName", fileName)
+    fileName_ = _scratch_arena.string(fileName)
+    return_interface = _ExportDataAsCode(data, size, fileName_)
+    return return_interface
+
+
+def load_file_text(fileName: str) -> int:
+    """Load text data from file (read), returns a '\0' terminated string"""
+    if __debug__:
+        _check_str("load_file_text", "fileName", fileName)
+    fileName_ = _scratch_arena.string(fileName)
+    return_interface = _LoadFileText(fileName_)
+    return return_interface
+
+
+def unload_file_text(text: int):
+    """Unload file text data allocated by LoadFileText()"""
+    if __debug__:
+        _check_int("unload_file_text", "text", text, 0, 4294967295)
+    _UnloadFileText(text)
+
+
+def save_file_text(fileName: str, text: int) -> int:
+    """Save text data to file (write), string must be '\0' terminated, returns true on success"""
+    if __debug__:
+        _check_str("save_file_text", "fileName", fileName)
+        _check_int("save_file_text", "text", text, 0, 4294967295)
+    fileName_ = _scratch_arena.string(fileName)
+    return_interface = _SaveFileText(fileName_, text)
+    return return_interface
+
+
+def file_exists(fileName: str) -> int:
+    """Check if file exists"""
+    if __debug__:
+        _check_str("file_exists", "fileName", fileName)
+    fileName_ = _scratch_arena.string(fileName)
+    return_interface = _FileExists(fileName_)
+    return return_interface
+
+
+def directory_exists(dirPath: str) -> int:
+    """Check if a directory path exists"""
+    if __debug__:
+        _check_str("directory_exists", "dirPath", dirPath)
+    dirPath_ = _scratch_arena.string(dirPath)
+    return_interface = _DirectoryExists(dirPath_)
+    return return_interface
+
+
+def is_file_extension(fileName: str, ext: str) -> int:
+    """Check file extension (including point: .png, .wav)"""
+    if __debug__:
+        _check_str("is_file_extension", "fileName", fileName)
+        _check_str("is_file_extension", "ext", ext)
+    fileName_ = _scratch_arena.string(fileName)
+    ext_ = _scratch_arena.string(ext)
+    return_interface = _IsFileExtension(fileName_, ext_)
+    return return_interface
+
+
+def get_file_length(fileName: str) -> int:
+    """Get file length in bytes (NOTE: GetFileSize() conflicts with windows.h)"""
+    if __debug__:
+        _check_str("get_file_length", "fileName", fileName)
+    fileName_ = _scratch_arena.string(fileName)
+    return_interface = _GetFileLength(fileName_)
+    return return_interface
+
+
+def get_file_extension(fileName: str) -> int:
+    """Get pointer to extension for a filename string (includes dot: '.png')"""
+    if __debug__:
+        _check_str("get_file_extension", "fileName", fileName)
+    fileName_ = _scratch_arena.string(fileName)
+    return_interface = _GetFileExtension(fileName_)
+    return return_interface
+
+
+def get_file_name(filePath: str) -> int:
+    """Get pointer to filename for a path string"""
+    if __debug__:
+        _check_str("get_file_name", "filePath", filePath)
+    filePath_ = _scratch_arena.string(filePath)
+    return_interface = _GetFileName(filePath_)
+    return return_interface
+
+
+def get_file_name_without_ext(filePath: str) -> int:
+    """Get filename string without extension (uses static string)"""
+    if __debug__:
+        _check_str("get_file_name_without_ext", "filePath", filePath)
+    filePath_ = _scratch_arena.string(filePath)
+    return_interface = _GetFileNameWithoutExt(filePath_)
+    return return_interface
+
+
+def get_directory_path(filePath: str) -> int:
+    """Get full path for a given fileName with path (uses static string)"""
+    if __debug__:
+        _check_str("get_directory_path", "filePath", filePath)
+    filePath_ = _scratch_arena.string(filePath)
+    return_interface = _GetDirectoryPath(filePath_)
+    return return_interface
+
+
+def get_prev_directory_path(dirPath: str) -> int:
+    """Get previous directory path for a given path (uses static string)"""
+    if __debug__:
+        _check_str("get_prev_directory_path", "dirPath", dirPath)
+    dirPath_ = _scratch_arena.string(dirPath)
+    return_interface = _GetPrevDirectoryPath(dirPath_)
+    return return_interface
+
+
+def get_working_directory() -> int:
+    """Get current working directory (uses static string)"""
+    return_interface = _GetWorkingDirectory()
+    return return_interface
+
+
+def get_application_directory() -> int:
+    """Get the directory if the running application (uses static string)"""
+    return_interface = _GetApplicationDirectory()
+    return return_interface
+
+
+def change_directory(dir: str) -> int:
+    """Change working directory, return true on success"""
+    if __debug__:
+        _check_str("change_directory", "dir", dir)
+    dir_ = _scratch_arena.string(dir)
+    return_interface = _ChangeDirectory(dir_)
+    return return_interface
+
+
+def is_path_file(path: str) -> int:
+    """Check if a given path is a file or a directory"""
+    if __debug__:
+        _check_str("is_path_file", "path", path)
+    path_ = _scratch_arena.string(path)
+    return_interface = _IsPathFile(path_)
+    return return_interface
+
+
+def load_directory_files(dirPath: str, out: FilePathList = None) -> FilePathList:
+    """Load directory filepaths"""
+    if __debug__:
+        _check_str("load_directory_files", "dirPath", dirPath)
+        if out is not None:
+            _check_struct("load_directory_files", "out", out, FilePathList)
+    FilePathList_ = _new_struct(FilePathList) if out is None or out.__class__ is not FilePathList else out
+    dirPath_ = _scratch_arena.string(dirPath)
+    _LoadDirectoryFiles(FilePathList_._address, dirPath_)
+    if out is not None and out is not FilePathList_:
+        out._assign(FilePathList_)  # a shadow struct
+        return out
+    return FilePathList_
+
+
+def load_directory_files_ex(basePath: str, filter: str, scanSubdirs: int, out: FilePathList = None) -> FilePathList:
+    """Load directory filepaths with extension filtering and recursive directory scan"""
+    if __debug__:
+        _check_str("load_directory_files_ex", "basePath", basePath)
+        _check_str("load_directory_files_ex", "filter", filter)
+        _check_int("load_directory_files_ex", "scanSubdirs", scanSubdirs, -128, 127)
+        if out is not None:
+            _check_struct("load_directory_files_ex", "out", out, FilePathList)
+    FilePathList_ = _new_struct(FilePathList) if out is None or out.__class__ is not FilePathList else out
+    basePath_ = _scratch_arena.string(basePath)
+    filter_ = _scratch_arena.string(filter)
+    _LoadDirectoryFilesEx(FilePathList_._address, basePath_, filter_, scanSubdirs)
+    if out is not None and out is not FilePathList_:
+        out._assign(FilePathList_)  # a shadow struct
+        return out
+    return FilePathList_
+
+
+def unload_directory_files(files: FilePathList):
+    """Unload filepaths"""
+    if __debug__:
+        _check_struct("unload_directory_files", "files", files, FilePathList)
+    _UnloadDirectoryFiles(files._address)
+
+
+def is_file_dropped() -> int:
+    """Check if a file has been dropped into window"""
+    return_interface = _IsFileDropped()
+    return return_interface
+
+
+def load_dropped_files(out: FilePathList = None) -> FilePathList:
+    """Load dropped filepaths"""
+    if __debug__:
+        if out is not None:
+            _check_struct("load_dropped_files", "out", out, FilePathList)
+    FilePathList_ = _new_struct(FilePathList) if out is None or out.__class__ is not FilePathList else out
+    _LoadDroppedFiles(FilePathList_._address)
+    if out is not None and out is not FilePathList_:
+        out._assign(FilePathList_)  # a shadow struct
+        return out
+    return FilePathList_
+
+
+def unload_dropped_files(files: FilePathList):
+    """Unload dropped filepaths"""
+    if __debug__:
+        _check_struct("unload_dropped_files", "files", files, FilePathList)
+    _UnloadDroppedFiles(files._address)
+
+
+def get_file_mod_time(fileName: str) -> int:
+    """Get file modification time (last write time)"""
+    if __debug__:
+        _check_str("get_file_mod_time", "fileName", fileName)
+    fileName_ = _scratch_arena.string(fileName)
+    return_interface = _GetFileModTime(fileName_)
+    return return_interface
+
+
+def compress_data(data: int, dataSize: int, compDataSize: int) -> int:
+    """Compress data (DEFLATE algorithm), memory must be MemFree()"""
+    if __debug__:
+        _check_int("compress_data", "data", data, 0, 4294967295)
+        _check_int("compress_data", "dataSize", dataSize, -2147483648, 2147483647)
+        _check_int("compress_data", "compDataSize", compDataSize, 0, 4294967295)
+    return_interface = _CompressData(data, dataSize, compDataSize)
+    return return_interface
+
+
+def decompress_data(compData: int, compDataSize: int, dataSize: int) -> int:
+    """Decompress data (DEFLATE algorithm), memory must be MemFree()"""
+    if __debug__:
+        _check_int("decompress_data", "compData", compData, 0, 4294967295)
+        _check_int("decompress_data", "compDataSize", compDataSize, -2147483648, 2147483647)
+        _check_int("decompress_data", "dataSize", dataSize, 0, 4294967295)
+    return_interface = _DecompressData(compData, compDataSize, dataSize)
+    return return_interface
+
+
+def encode_data_base64(data: int, dataSize: int, outputSize: int) -> int:
+    """Encode data to Base64 string, memory must be MemFree()"""
+    if __debug__:
+        _check_int("encode_data_base64", "data", data, 0, 4294967295)
+        _check_int("encode_data_base64", "dataSize", dataSize, -2147483648, 2147483647)
+        _check_int("encode_data_base64", "outputSize", outputSize, 0, 4294967295)
+    return_interface = _EncodeDataBase64(data, dataSize, outputSize)
+    return return_interface
+
+
+def decode_data_base64(data: int, outputSize: int) -> int:
+    """Decode Base64 string data, memory must be MemFree()"""
+    if __debug__:
+        _check_int("decode_data_base64", "data", data, 0, 4294967295)
+        _check_int("decode_data_base64", "outputSize", outputSize, 0, 4294967295)
+    return_interface = _DecodeDataBase64(data, outputSize)
+    return return_interface
+
+
+def is_key_pressed(key: int) -> int:
+    """Check if a key has been pressed once"""
+    if __debug__:
+        _check_int("is_key_pressed", "key", key, -2147483648, 2147483647)
+    return_interface = _IsKeyPressed(key)
+    return return_interface
+
+
+def is_key_down(key: int) -> int:
+    """Check if a key is being pressed"""
+    if __debug__:
+        _check_int("is_key_down", "key", key, -2147483648, 2147483647)
+    return_interface = _IsKeyDown(key)
+    return return_interface
+
+
+def is_key_released(key: int) -> int:
+    """Check if a key has been released once"""
+    if __debug__:
+        _check_int("is_key_released", "key", key, -2147483648, 2147483647)
+    return_interface = _IsKeyReleased(key)
+    return return_interface
+
+
+def is_key_up(key: int) -> int:
+    """Check if a key is NOT being pressed"""
+    if __debug__:
+        _check_int("is_key_up", "key", key, -2147483648, 2147483647)
+    return_interface = _IsKeyUp(key)
+    return return_interface
+
+
+def set_exit_key(key: int):
+    """Set a custom key to exit program (default is ESC)"""
+    if __debug__:
+        _check_int("set_exit_key", "key", key, -2147483648, 2147483647)
+    _SetExitKey(key)
+
+
+def get_key_pressed() -> int:
+    """Get key pressed (keycode), call it multiple times for keys queued, returns 0 when the queue is empty"""
+    return_interface = _GetKeyPressed()
+    return return_interface
+
+
+def get_char_pressed() -> int:
+    """Get char pressed (unicode), call it multiple times for chars queued, returns 0 when the queue is empty"""
+    return_interface = _GetCharPressed()
+    return return_interface
+
+
+def is_gamepad_available(gamepad: int) -> int:
+    """Check if a gamepad is available"""
+    if __debug__:
+        _check_int("is_gamepad_available", "gamepad", gamepad, -2147483648, 2147483647)
+    return_interface = _IsGamepadAvailable(gamepad)
+    return return_interface
+
+
+def get_gamepad_name(gamepad: int) -> int:
+    """Get gamepad internal name id"""
+    if __debug__:
+        _check_int("get_gamepad_name", "gamepad", gamepad, -2147483648, 2147483647)
+    return_interface = _GetGamepadName(gamepad)
+    return return_interface
+
+
+def is_gamepad_button_pressed(gamepad: int, button: int) -> int:
+    """Check if a gamepad button has been pressed once"""
+    if __debug__:
+        _check_int("is_gamepad_button_pressed", "gamepad", gamepad, -2147483648, 2147483647)
+        _check_int("is_gamepad_button_pressed", "button", button, -2147483648, 2147483647)
+    return_interface = _IsGamepadButtonPressed(gamepad, button)
+    return return_interface
+
+
+def is_gamepad_button_down(gamepad: int, button: int) -> int:
+    """Check if a gamepad button is being pressed"""
+    if __debug__:
+        _check_int("is_gamepad_button_down", "gamepad", gamepad, -2147483648, 2147483647)
+        _check_int("is_gamepad_button_down", "button", button, -2147483648, 2147483647)
+    return_interface = _IsGamepadButtonDown(gamepad, button)
+    return return_interface
+
+
+def is_gamepad_button_released(gamepad: int, button: int) -> int:
+    """Check if a gamepad button has been released once"""
+    if __debug__:
+        _check_int("is_gamepad_button_released", "gamepad", gamepad, -2147483648, 2147483647)
+        _check_int("is_gamepad_button_released", "button", button, -2147483648, 2147483647)
+    return_interface = _IsGamepadButtonReleased(gamepad, button)
+    return return_interface
+
+
+def is_gamepad_button_up(gamepad: int, button: int) -> int:
+    """Check if a gamepad button is NOT being pressed"""
+    if __debug__:
+        _check_int("is_gamepad_button_up", "gamepad", gamepad, -2147483648, 2147483647)
+        _check_int("is_gamepad_button_up", "button", button, -2147483648, 2147483647)
+    return_interface = _IsGamepadButtonUp(gamepad, button)
+    return return_interface
+
+
+def get_gamepad_button_pressed() -> int:
+    """Get the last gamepad button pressed"""
+    return_interface = _GetGamepadButtonPressed()
+    return return_interface
+
+
+def get_gamepad_axis_count(gamepad: int) -> int:
+    """Get gamepad axis count for a gamepad"""
+    if __debug__:
+        _check_int("get_gamepad_axis_count", "gamepad", gamepad, -2147483648, 2147483647)
+    return_interface = _GetGamepadAxisCount(gamepad)
+    return return_interface
+
+
+def get_gamepad_axis_movement(gamepad: int, axis: int) -> float:
+    """Get axis movement value for a gamepad axis"""
+    if __debug__:
+        _check_int("get_gamepad_axis_movement", "gamepad", gamepad, -2147483648, 2147483647)
+        _check_int("get_gamepad_axis_movement", "axis", axis, -2147483648, 2147483647)
+    return_interface = _GetGamepadAxisMovement(gamepad, axis)
+    return return_interface
+
+
+def set_gamepad_mappings(mappings: str) -> int:
+    """Set internal gamepad mappings (SDL_GameControllerDB)"""
+    if __debug__:
+        _check_str("set_gamepad_mappings", "mappings", mappings)
+    mappings_ = _scratch_arena.string(mappings)
+    return_interface = _SetGamepadMappings(mappings_)
+    return return_interface
+
+
+def is_mouse_button_pressed(button: int) -> int:
+    """Check if a mouse button has been pressed once"""
+    if __debug__:
+        _check_int("is_mouse_button_pressed", "button", button, -2147483648, 2147483647)
+    return_interface = _IsMouseButtonPressed(button)
+    return return_interface
+
+
+def is_mouse_button_down(button: int) -> int:
+    """Check if a mouse button is being pressed"""
+    if __debug__:
+        _check_int("is_mouse_button_down", "button", button, -2147483648, 2147483647)
+    return_interface = _IsMouseButtonDown(button)
+    return return_interface
+
+
+def is_mouse_button_released(button: int) -> int:
+    """Check if a mouse button has been released once"""
+    if __debug__:
+        _check_int("is_mouse_button_released", "button", button, -2147483648, 2147483647)
+    return_interface = _IsMouseButtonReleased(button)
+    return return_interface
+
+
+def is_mouse_button_up(button: int) -> int:
+    """Check if a mouse button is NOT being pressed"""
+    if __debug__:
+        _check_int("is_mouse_button_up", "button", button, -2147483648, 2147483647)
+    return_interface = _IsMouseButtonUp(button)
+    return return_interface
+
+
+def get_mouse_x() -> int:
+    """Get mouse position X"""
+    return_interface = _GetMouseX()
+    return return_interface
+
+
+def get_mouse_y() -> int:
+    """Get mouse position Y"""
+    return_interface = _GetMouseY()
+    return return_interface
+
+
+def get_mouse_position(out: Vector2 = None) -> Vector2:
+    """Get mouse position XY"""
+    if __debug__:
+        if out is not None:
+            _check_struct("get_mouse_position", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 else out
+    _GetMousePosition(Vector2_._address)
+    if out is not None and out is not Vector2_:
+        out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def get_mouse_delta(out: Vector2 = None) -> Vector2:
+    """Get mouse delta between frames"""
+    if __debug__:
+        if out is not None:
+            _check_struct("get_mouse_delta", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 else out
+    _GetMouseDelta(Vector2_._address)
+    if out is not None and out is not Vector2_:
+        out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def set_mouse_position(x: int, y: int):
+    """Set mouse position XY"""
+    if __debug__:
+        _check_int("set_mouse_position", "x", x, -2147483648, 2147483647)
+        _check_int("set_mouse_position", "y", y, -2147483648, 2147483647)
+    _SetMousePosition(x, y)
+
+
+def set_mouse_offset(offsetX: int, offsetY: int):
+    """Set mouse offset"""
+    if __debug__:
+        _check_int("set_mouse_offset", "offsetX", offsetX, -2147483648, 2147483647)
+        _check_int("set_mouse_offset", "offsetY", offsetY, -2147483648, 2147483647)
+    _SetMouseOffset(offsetX, offsetY)
+
+
+def set_mouse_scale(scaleX: float, scaleY: float):
+    """Set mouse scaling"""
+    if __debug__:
+        _check_float("set_mouse_scale", "scaleX", scaleX)
+        _check_float("set_mouse_scale", "scaleY", scaleY)
+    _SetMouseScale(scaleX, scaleY)
+
+
+def get_mouse_wheel_move() -> float:
+    """Get mouse wheel movement for X or Y, whichever is larger"""
+    return_interface = _GetMouseWheelMove()
+    return return_interface
+
+
+def get_mouse_wheel_move_v(out: Vector2 = None) -> Vector2:
+    """Get mouse wheel movement for both X and Y"""
+    if __debug__:
+        if out is not None:
+            _check_struct("get_mouse_wheel_move_v", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 else out
+    _GetMouseWheelMoveV(Vector2_._address)
+    if out is not None and out is not Vector2_:
+        out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def set_mouse_cursor(cursor: int):
+    """Set mouse cursor"""
+    if __debug__:
+        _check_int("set_mouse_cursor", "cursor", cursor, -2147483648, 2147483647)
+    _SetMouseCursor(cursor)
+
+
+def get_touch_x() -> int:
+    """Get touch position X for touch point 0 (relative to screen size)"""
+    return_interface = _GetTouchX()
+    return return_interface
+
+
+def get_touch_y() -> int:
+    """Get touch position Y for touch point 0 (relative to screen size)"""
+    return_interface = _GetTouchY()
+    return return_interface
+
+
+def get_touch_position(index: int, out: Vector2 = None) -> Vector2:
+    """Get touch position XY for a touch point index (relative to screen size)"""
+    if __debug__:
+        _check_int("get_touch_position", "index", index, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("get_touch_position", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 else out
+    _GetTouchPosition(Vector2_._address, index)
+    if out is not None and out is not Vector2_:
+        out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def get_touch_point_id(index: int) -> int:
+    """Get touch point identifier for given index"""
+    if __debug__:
+        _check_int("get_touch_point_id", "index", index, -2147483648, 2147483647)
+    return_interface = _GetTouchPointId(index)
+    return return_interface
+
+
+def get_touch_point_count() -> int:
+    """Get number of touch points"""
+    return_interface = _GetTouchPointCount()
+    return return_interface
+
+
+def set_gestures_enabled(flags: int):
+    """Enable a set of gestures using flags"""
+    if __debug__:
+        _check_int("set_gestures_enabled", "flags", flags, 0, 4294967295)
+    _SetGesturesEnabled(flags)
+
+
+def is_gesture_detected(gesture: int) -> int:
+    """Check if a gesture have been detected"""
+    if __debug__:
+        _check_int("is_gesture_detected", "gesture", gesture, -2147483648, 2147483647)
+    return_interface = _IsGestureDetected(gesture)
+    return return_interface
+
+
+def get_gesture_detected() -> int:
+    """Get latest detected gesture"""
+    return_interface = _GetGestureDetected()
+    return return_interface
+
+
+def get_gesture_hold_duration() -> float:
+    """Get gesture hold time in milliseconds"""
+    return_interface = _GetGestureHoldDuration()
+    return return_interface
+
+
+def get_gesture_drag_vector(out: Vector2 = None) -> Vector2:
+    """Get gesture drag vector"""
+    if __debug__:
+        if out is not None:
+            _check_struct("get_gesture_drag_vector", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 else out
+    _GetGestureDragVector(Vector2_._address)
+    if out is not None and out is not Vector2_:
+        out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def get_gesture_drag_angle() -> float:
+    """Get gesture drag angle"""
+    return_interface = _GetGestureDragAngle()
+    return return_interface
+
+
+def get_gesture_pinch_vector(out: Vector2 = None) -> Vector2:
+    """Get gesture pinch delta"""
+    if __debug__:
+        if out is not None:
+            _check_struct("get_gesture_pinch_vector", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 else out
+    _GetGesturePinchVector(Vector2_._address)
+    if out is not None and out is not Vector2_:
+        out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def get_gesture_pinch_angle() -> float:
+    """Get gesture pinch angle"""
+    return_interface = _GetGesturePinchAngle()
+    return return_interface
+
+
+def update_camera(camera: int, mode: int):
+    """Update camera position for selected mode"""
+    if __debug__:
+        _check_int("update_camera", "camera", camera, 0, 4294967295)
+        _check_int("update_camera", "mode", mode, -2147483648, 2147483647)
+    _UpdateCamera(camera, mode)
+
+
+def update_camera_pro(camera: int, movement: Vector3, rotation: Vector3, zoom: float):
+    """Update camera movement/rotation"""
+    if __debug__:
+        _check_int("update_camera_pro", "camera", camera, 0, 4294967295)
+        _check_struct("update_camera_pro", "movement", movement, Vector3)
+        _check_struct("update_camera_pro", "rotation", rotation, Vector3)
+        _check_float("update_camera_pro", "zoom", zoom)
+    _UpdateCameraPro(camera, movement._address, rotation._address, zoom)
+
+
+# the wasm exports called above, fetched once instead of looked up at every call, they are bound
+# again when another context is activated or profiling starts
+_wasm_functions_names = [
+    "_InitWindow",
+    "_WindowShouldClose",
+    "_CloseWindow",
+    "_IsWindowReady",
+    "_IsWindowFullscreen",
+    "_IsWindowHidden",
+    "_IsWindowMinimized",
+    "_IsWindowMaximized",
+    "_IsWindowFocused",
+    "_IsWindowResized",
+    "_IsWindowState",
+    "_SetWindowState",
+    "_ClearWindowState",
+    "_ToggleFullscreen",
+    "_MaximizeWindow",
+    "_MinimizeWindow",
+    "_RestoreWindow",
+    "_SetWindowIcon",
+    "_SetWindowIcons",
+    "_SetWindowTitle",
+    "_SetWindowPosition",
+    "_SetWindowMonitor",
+    "_SetWindowMinSize",
+    "_SetWindowSize",
+    "_SetWindowOpacity",
+    "_SetWindowFocused",
+    "_GetWindowHandle",
+    "_GetScreenWidth",
+    "_GetScreenHeight",
+    "_GetRenderWidth",
+    "_GetRenderHeight",
+    "_GetMonitorCount",
+    "_GetCurrentMonitor",
+    "_GetMonitorPosition",
+    "_GetMonitorWidth",
+    "_GetMonitorHeight",
+    "_GetMonitorPhysicalWidth",
+    "_GetMonitorPhysicalHeight",
+    "_GetMonitorRefreshRate",
+    "_GetWindowPosition",
+    "_GetWindowScaleDPI",
+    "_GetMonitorName",
+    "_SetClipboardText",
+    "_GetClipboardText",
+    "_EnableEventWaiting",
+    "_DisableEventWaiting",
+    "_SwapScreenBuffer",
+    "_PollInputEvents",
+    "_WaitTime",
+    "_ShowCursor",
+    "_HideCursor",
+    "_IsCursorHidden",
+    "_EnableCursor",
+    "_DisableCursor",
+    "_IsCursorOnScreen",
+    "_ClearBackground",
+    "_BeginDrawing",
+    "_EndDrawing",
+    "_BeginMode2D",
+    "_EndMode2D",
+    "_BeginMode3D",
+    "_EndMode3D",
+    "_BeginTextureMode",
+    "_EndTextureMode",
+    "_BeginShaderMode",
+    "_EndShaderMode",
+    "_BeginBlendMode",
+    "_EndBlendMode",
+    "_BeginScissorMode",
+    "_EndScissorMode",
+    "_BeginVrStereoMode",
+    "_EndVrStereoMode",
+    "_LoadVrStereoConfig",
+    "_memcpy",
+    "_UnloadVrStereoConfig",
+    "_LoadShader",
+    "_LoadShaderFromMemory",
+    "_IsShaderReady",
+    "_GetShaderLocation",
+    "_GetShaderLocationAttrib",
+    "_SetShaderValue",
+    "_SetShaderValueV",
+    "_SetShaderValueMatrix",
+    "_SetShaderValueTexture",
+    "_UnloadShader",
+    "_GetMouseRay",
+    "_GetCameraMatrix",
+    "_GetCameraMatrix2D",
+    "_GetWorldToScreen",
+    "_GetScreenToWorld2D",
+    "_GetWorldToScreenEx",
+    "_GetWorldToScreen2D",
+    "_SetTargetFPS",
+    "_GetFPS",
+    "_GetFrameTime",
+    "_GetTime",
+    "_GetRandomValue",
+    "_SetRandomSeed",
+    "_TakeScreenshot",
+    "_SetConfigFlags",
+    "_SetTraceLogLevel",
+    "_MemAlloc",
+    "_MemRealloc",
+    "_MemFree",
+    "_OpenURL",
+    "_LoadFileData",
+    "_UnloadFileData",
+    "_SaveFileData",
+    "_ExportDataAsCode",
+    "_LoadFileText",
+    "_UnloadFileText",
+    "_SaveFileText",
+    "_FileExists",
+    "_DirectoryExists",
+    "_IsFileExtension",
+    "_GetFileLength",
+    "_GetFileExtension",
+    "_GetFileName",
+    "_GetFileNameWithoutExt",
+    "_GetDirectoryPath",
+    "_GetPrevDirectoryPath",
+    "_GetWorkingDirectory",
+    "_GetApplicationDirectory",
+    "_ChangeDirectory",
+    "_IsPathFile",
+    "_LoadDirectoryFiles",
+    "_LoadDirectoryFilesEx",
+    "_UnloadDirectoryFiles",
+    "_IsFileDropped",
+    "_LoadDroppedFiles",
+    "_UnloadDroppedFiles",
+    "_GetFileModTime",
+    "_CompressData",
+    "_DecompressData",
+    "_EncodeDataBase64",
+    "_DecodeDataBase64",
+    "_IsKeyPressed",
+    "_IsKeyDown",
+    "_IsKeyReleased",
+    "_IsKeyUp",
+    "_SetExitKey",
+    "_GetKeyPressed",
+    "_GetCharPressed",
+    "_IsGamepadAvailable",
+    "_GetGamepadName",
+    "_IsGamepadButtonPressed",
+    "_IsGamepadButtonDown",
+    "_IsGamepadButtonReleased",
+    "_IsGamepadButtonUp",
+    "_GetGamepadButtonPressed",
+    "_GetGamepadAxisCount",
+    "_GetGamepadAxisMovement",
+    "_SetGamepadMappings",
+    "_IsMouseButtonPressed",
+    "_IsMouseButtonDown",
+    "_IsMouseButtonReleased",
+    "_IsMouseButtonUp",
+    "_GetMouseX",
+    "_GetMouseY",
+    "_GetMousePosition",
+    "_GetMouseDelta",
+    "_SetMousePosition",
+    "_SetMouseOffset",
+    "_SetMouseScale",
+    "_GetMouseWheelMove",
+    "_GetMouseWheelMoveV",
+    "_SetMouseCursor",
+    "_GetTouchX",
+    "_GetTouchY",
+    "_GetTouchPosition",
+    "_GetTouchPointId",
+    "_GetTouchPointCount",
+    "_SetGesturesEnabled",
+    "_IsGestureDetected",
+    "_GetGestureDetected",
+    "_GetGestureHoldDuration",
+    "_GetGestureDragVector",
+    "_GetGestureDragAngle",
+    "_GetGesturePinchVector",
+    "_GetGesturePinchAngle",
+    "_UpdateCamera",
+    "_UpdateCameraPro",
+    "_ReplayCommandBuffer",
+    "_LayoutText",
+    "_DrawTextLayout",
+    "_DrawTexturePro",
+    "_GetStructLayouts",
+]
+_bind_wasm_functions(globals())
+
+
+# index of the struct in StructLayouts of src/raylib_structs.h
+check_struct_layouts([
+    (Vector2, 0),
+    (Vector3, 3),
+    (Vector4, 7),
+    (Matrix, 12),
+    (Color, 29),
+    (Rectangle, 34),
+    (Image, 39),
+    (Texture, 45),
+    (RenderTexture, 51),
+    (Font, 68),
+    (Camera3D, 75),
+    (Camera2D, 81),
+    (Shader, 102),
+    (Ray, 136),
+    (VrDeviceInfo, 168),
+    (VrStereoConfig, 179),
+    (FilePathList, 188),
+])
+
+
+# the modules that use the state of a context, Context.activate() switches it in them
+_context_modules_names = [
+    f"{__package__}.core",
+    f"{__package__}.shapes",
+    f"{__package__}.textures",
+    f"{__package__}.text",
+    f"{__package__}.models",
+    f"{__package__}.audio",
+    f"{__package__}.assets",
+    f"{__package__}.commands",
+    "raymath",
+    "rlgl",
+    "raygui",
+    "rcamera",
+    "reasings",
+]
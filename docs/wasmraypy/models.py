@@ -0,0 +1,1743 @@
+# Generated by tools/code_generation/filesGeneration.py, do not edit by hand
+# raylib.h, the functions of rmodels
+from .core import (
+    struct_clone,
+    _heap,
+    _scratch_arena,
+    _struct_pool,
+    _new_struct,
+    CharArray,
+    FloatArray,
+    Vector2,
+    Vector3,
+    Quaternion,
+    Matrix,
+    Color,
+    Rectangle,
+    Image,
+    Texture2D,
+    Camera,
+    Shader,
+    Ray,
+    check_struct_layouts,
+    _check_int,
+    _check_float,
+    _check_str,
+    _check_struct,
+    _bind_wasm_functions,
+)
+
+
+class Mesh:
+    """Mesh, vertex data and vao/vbo"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 60
+    _dtype_spec: dict = {"names": ["vertexCount", "triangleCount", "vertices", "texcoords", "texcoords2", "normals", "tangents", "colors", "indices", "animVertices", "animNormals", "boneIds", "boneWeights", "vaoId", "vboId"], "formats": ["<i4", "<i4", "<u4", "<u4", "<u4", "<u4", "<u4", "<u4", "<u4", "<u4", "<u4", "<u4", "<u4", "<u4", "<u4"], "offsets": [0, 4, 8, 12, 16, 20, 24, 28, 32, 36, 40, 44, 48, 52, 56], "itemsize": 60}
+
+    def __init__(self, vertexCount: int = 0, triangleCount: int = 0, vertices: int = 0, texcoords: int = 0, texcoords2: int = 0, normals: int = 0, tangents: int = 0, colors: int = 0, indices: int = 0, animVertices: int = 0, animNormals: int = 0, boneIds: int = 0, boneWeights: int = 0, vaoId: int = 0, vboId: int = 0, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(60)
+            self._to_free = _struct_pool
+            _heap.i32[self._address >> 2] = vertexCount
+            _heap.i32[(self._address + 4) >> 2] = triangleCount
+            _heap.u32[(self._address + 8) >> 2] = vertices
+            _heap.u32[(self._address + 12) >> 2] = texcoords
+            _heap.u32[(self._address + 16) >> 2] = texcoords2
+            _heap.u32[(self._address + 20) >> 2] = normals
+            _heap.u32[(self._address + 24) >> 2] = tangents
+            _heap.u32[(self._address + 28) >> 2] = colors
+            _heap.u32[(self._address + 32) >> 2] = indices
+            _heap.u32[(self._address + 36) >> 2] = animVertices
+            _heap.u32[(self._address + 40) >> 2] = animNormals
+            _heap.u32[(self._address + 44) >> 2] = boneIds
+            _heap.u32[(self._address + 48) >> 2] = boneWeights
+            _heap.u32[(self._address + 52) >> 2] = vaoId
+            _heap.u32[(self._address + 56) >> 2] = vboId
+
+    @property
+    def vertexCount(self):
+        """Number of vertices stored in arrays"""
+        return _heap.i32[self._address >> 2]
+
+    @vertexCount.setter
+    def vertexCount(self, value):
+        if not self._frozen:
+            _heap.i32[self._address >> 2] = value
+
+    @property
+    def triangleCount(self):
+        """Number of triangles stored (indexed or not)"""
+        return _heap.i32[(self._address + 4) >> 2]
+
+    @triangleCount.setter
+    def triangleCount(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 4) >> 2] = value
+
+    @property
+    def vertices(self):
+        """Vertex position (XYZ - 3 components per vertex) (shader-location = 0)"""
+        return _heap.u32[(self._address + 8) >> 2]
+
+    @vertices.setter
+    def vertices(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 8) >> 2] = value
+
+    @property
+    def texcoords(self):
+        """Vertex texture coordinates (UV - 2 components per vertex) (shader-location = 1)"""
+        return _heap.u32[(self._address + 12) >> 2]
+
+    @texcoords.setter
+    def texcoords(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 12) >> 2] = value
+
+    @property
+    def texcoords2(self):
+        """Vertex texture second coordinates (UV - 2 components per vertex) (shader-location = 5)"""
+        return _heap.u32[(self._address + 16) >> 2]
+
+    @texcoords2.setter
+    def texcoords2(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 16) >> 2] = value
+
+    @property
+    def normals(self):
+        """Vertex normals (XYZ - 3 components per vertex) (shader-location = 2)"""
+        return _heap.u32[(self._address + 20) >> 2]
+
+    @normals.setter
+    def normals(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 20) >> 2] = value
+
+    @property
+    def tangents(self):
+        """Vertex tangents (XYZW - 4 components per vertex) (shader-location = 4)"""
+        return _heap.u32[(self._address + 24) >> 2]
+
+    @tangents.setter
+    def tangents(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 24) >> 2] = value
+
+    @property
+    def colors(self):
+        """Vertex colors (RGBA - 4 components per vertex) (shader-location = 3)"""
+        return _heap.u32[(self._address + 28) >> 2]
+
+    @colors.setter
+    def colors(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 28) >> 2] = value
+
+    @property
+    def indices(self):
+        """Vertex indices (in case vertex data comes indexed)"""
+        return _heap.u32[(self._address + 32) >> 2]
+
+    @indices.setter
+    def indices(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 32) >> 2] = value
+
+    @property
+    def animVertices(self):
+        """Animated vertex positions (after bones transformations)"""
+        return _heap.u32[(self._address + 36) >> 2]
+
+    @animVertices.setter
+    def animVertices(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 36) >> 2] = value
+
+    @property
+    def animNormals(self):
+        """Animated normals (after bones transformations)"""
+        return _heap.u32[(self._address + 40) >> 2]
+
+    @animNormals.setter
+    def animNormals(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 40) >> 2] = value
+
+    @property
+    def boneIds(self):
+        """Vertex bone ids, max 255 bone ids, up to 4 bones influence by vertex (skinning)"""
+        return _heap.u32[(self._address + 44) >> 2]
+
+    @boneIds.setter
+    def boneIds(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 44) >> 2] = value
+
+    @property
+    def boneWeights(self):
+        """Vertex bone weight, up to 4 bones influence by vertex (skinning)"""
+        return _heap.u32[(self._address + 48) >> 2]
+
+    @boneWeights.setter
+    def boneWeights(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 48) >> 2] = value
+
+    @property
+    def vaoId(self):
+        """OpenGL Vertex Array Object id"""
+        return _heap.u32[(self._address + 52) >> 2]
+
+    @vaoId.setter
+    def vaoId(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 52) >> 2] = value
+
+    @property
+    def vboId(self):
+        """OpenGL Vertex Buffer Objects id (default vertex data)"""
+        return _heap.u32[(self._address + 56) >> 2]
+
+    @vboId.setter
+    def vboId(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 56) >> 2] = value
+
+    def __str__(self):
+        return f"Mesh(address={self._address}, {self.vertexCount}, {self.triangleCount}, {self.vertices}, {self.texcoords}, {self.texcoords2}, {self.normals}, {self.tangents}, {self.colors}, {self.indices}, {self.animVertices}, {self.animNormals}, {self.boneIds}, {self.boneWeights}, {self.vaoId}, {self.vboId})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 60)
+
+class MaterialMap:
+    """MaterialMap"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 28
+    _dtype_spec: dict = {"names": ["texture", "color", "value"], "formats": [Texture2D._dtype_spec, Color._dtype_spec, "<f4"], "offsets": [0, 20, 24], "itemsize": 28}
+
+    def __init__(self, texture: Texture2D = None, color: Color = None, value: float = 0.0, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(28)
+            self._to_free = _struct_pool
+            if texture is not None:
+                struct_clone(texture, self._address + 0)
+            else:
+                _heap.u8.fill(0, self._address + 0, self._address + 20)
+            if color is not None:
+                struct_clone(color, self._address + 20)
+            else:
+                _heap.u8.fill(0, self._address + 20, self._address + 24)
+            _heap.f32[(self._address + 24) >> 2] = value
+
+    @property
+    def texture(self):
+        """Material map texture"""
+        return Texture2D(0, address=self._address + 0)
+
+    @texture.setter
+    def texture(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 0)
+
+    @property
+    def color(self):
+        """Material map color"""
+        return Color(0, address=self._address + 20)
+
+    @color.setter
+    def color(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 20)
+
+    @property
+    def value(self):
+        """Material map value"""
+        return _heap.f32[(self._address + 24) >> 2]
+
+    @value.setter
+    def value(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 24) >> 2] = value
+
+    def __str__(self):
+        return f"MaterialMap(address={self._address}, {self.texture}, {self.color}, {self.value})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 28)
+
+class Material:
+    """Material, includes shader and maps"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 28
+    _dtype_spec: dict = {"names": ["shader", "maps", "params"], "formats": [Shader._dtype_spec, "<u4", ("<f4", (4,))], "offsets": [0, 8, 12], "itemsize": 28}
+
+    def __init__(self, shader: Shader = None, maps: int = 0, params: FloatArray = None, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(28)
+            self._to_free = _struct_pool
+            if shader is not None:
+                struct_clone(shader, self._address + 0)
+            else:
+                _heap.u8.fill(0, self._address + 0, self._address + 8)
+            _heap.u32[(self._address + 8) >> 2] = maps
+            if params is not None:
+                struct_clone(params, self._address + 12)
+            else:
+                _heap.u8.fill(0, self._address + 12, self._address + 28)
+
+    @property
+    def shader(self):
+        """Material shader"""
+        return Shader(0, address=self._address + 0)
+
+    @shader.setter
+    def shader(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 0)
+
+    @property
+    def maps(self):
+        """Material maps array (MAX_MATERIAL_MAPS)"""
+        return _heap.u32[(self._address + 8) >> 2]
+
+    @maps.setter
+    def maps(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 8) >> 2] = value
+
+    @property
+    def params(self):
+        """Material generic parameters (if required)"""
+        return FloatArray(4, address=self._address + 12)
+
+    @params.setter
+    def params(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 12)
+
+    def __str__(self):
+        return f"Material(address={self._address}, {self.shader}, {self.maps}, {self.params})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 28)
+
+class Transform:
+    """Transform, vertex transformation data"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 40
+    _dtype_spec: dict = {"names": ["translation", "rotation", "scale"], "formats": [Vector3._dtype_spec, Quaternion._dtype_spec, Vector3._dtype_spec], "offsets": [0, 12, 28], "itemsize": 40}
+
+    def __init__(self, translation: Vector3 = None, rotation: Quaternion = None, scale: Vector3 = None, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(40)
+            self._to_free = _struct_pool
+            if translation is not None:
+                struct_clone(translation, self._address + 0)
+            else:
+                _heap.u8.fill(0, self._address + 0, self._address + 12)
+            if rotation is not None:
+                struct_clone(rotation, self._address + 12)
+            else:
+                _heap.u8.fill(0, self._address + 12, self._address + 28)
+            if scale is not None:
+                struct_clone(scale, self._address + 28)
+            else:
+                _heap.u8.fill(0, self._address + 28, self._address + 40)
+
+    @property
+    def translation(self):
+        """Translation"""
+        return Vector3(0, address=self._address + 0)
+
+    @translation.setter
+    def translation(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 0)
+
+    @property
+    def rotation(self):
+        """Rotation"""
+        return Quaternion(0, address=self._address + 12)
+
+    @rotation.setter
+    def rotation(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 12)
+
+    @property
+    def scale(self):
+        """Scale"""
+        return Vector3(0, address=self._address + 28)
+
+    @scale.setter
+    def scale(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 28)
+
+    def __str__(self):
+        return f"Transform(address={self._address}, {self.translation}, {self.rotation}, {self.scale})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 40)
+
+class BoneInfo:
+    """Bone, skeletal animation bone"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 36
+    _dtype_spec: dict = {"names": ["name", "parent"], "formats": [("<i1", (32,)), "<i4"], "offsets": [0, 32], "itemsize": 36}
+
+    def __init__(self, name: CharArray = None, parent: int = 0, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(36)
+            self._to_free = _struct_pool
+            if name is not None:
+                struct_clone(name, self._address + 0)
+            else:
+                _heap.u8.fill(0, self._address + 0, self._address + 32)
+            _heap.i32[(self._address + 32) >> 2] = parent
+
+    @property
+    def name(self):
+        """Bone name"""
+        return CharArray(32, address=self._address + 0)
+
+    @name.setter
+    def name(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 0)
+
+    @property
+    def parent(self):
+        """Bone parent"""
+        return _heap.i32[(self._address + 32) >> 2]
+
+    @parent.setter
+    def parent(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 32) >> 2] = value
+
+    def __str__(self):
+        return f"BoneInfo(address={self._address}, {self.name}, {self.parent})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 36)
+
+class Model:
+    """Model, meshes, materials and animation data"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 96
+    _dtype_spec: dict = {"names": ["transform", "meshCount", "materialCount", "meshes", "materials", "meshMaterial", "boneCount", "bones", "bindPose"], "formats": [Matrix._dtype_spec, "<i4", "<i4", "<u4", "<u4", "<u4", "<i4", "<u4", "<u4"], "offsets": [0, 64, 68, 72, 76, 80, 84, 88, 92], "itemsize": 96}
+
+    def __init__(self, transform: Matrix = None, meshCount: int = 0, materialCount: int = 0, meshes: int = 0, materials: int = 0, meshMaterial: int = 0, boneCount: int = 0, bones: int = 0, bindPose: int = 0, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(96)
+            self._to_free = _struct_pool
+            if transform is not None:
+                struct_clone(transform, self._address + 0)
+            else:
+                _heap.u8.fill(0, self._address + 0, self._address + 64)
+            _heap.i32[(self._address + 64) >> 2] = meshCount
+            _heap.i32[(self._address + 68) >> 2] = materialCount
+            _heap.u32[(self._address + 72) >> 2] = meshes
+            _heap.u32[(self._address + 76) >> 2] = materials
+            _heap.u32[(self._address + 80) >> 2] = meshMaterial
+            _heap.i32[(self._address + 84) >> 2] = boneCount
+            _heap.u32[(self._address + 88) >> 2] = bones
+            _heap.u32[(self._address + 92) >> 2] = bindPose
+
+    @property
+    def transform(self):
+        """Local transform matrix"""
+        return Matrix(0, address=self._address + 0)
+
+    @transform.setter
+    def transform(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 0)
+
+    @property
+    def meshCount(self):
+        """Number of meshes"""
+        return _heap.i32[(self._address + 64) >> 2]
+
+    @meshCount.setter
+    def meshCount(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 64) >> 2] = value
+
+    @property
+    def materialCount(self):
+        """Number of materials"""
+        return _heap.i32[(self._address + 68) >> 2]
+
+    @materialCount.setter
+    def materialCount(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 68) >> 2] = value
+
+    @property
+    def meshes(self):
+        """Meshes array"""
+        return _heap.u32[(self._address + 72) >> 2]
+
+    @meshes.setter
+    def meshes(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 72) >> 2] = value
+
+    @property
+    def materials(self):
+        """Materials array"""
+        return _heap.u32[(self._address + 76) >> 2]
+
+    @materials.setter
+    def materials(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 76) >> 2] = value
+
+    @property
+    def meshMaterial(self):
+        """Mesh material number"""
+        return _heap.u32[(self._address + 80) >> 2]
+
+    @meshMaterial.setter
+    def meshMaterial(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 80) >> 2] = value
+
+    @property
+    def boneCount(self):
+        """Number of bones"""
+        return _heap.i32[(self._address + 84) >> 2]
+
+    @boneCount.setter
+    def boneCount(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 84) >> 2] = value
+
+    @property
+    def bones(self):
+        """Bones information (skeleton)"""
+        return _heap.u32[(self._address + 88) >> 2]
+
+    @bones.setter
+    def bones(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 88) >> 2] = value
+
+    @property
+    def bindPose(self):
+        """Bones base transformation (pose)"""
+        return _heap.u32[(self._address + 92) >> 2]
+
+    @bindPose.setter
+    def bindPose(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 92) >> 2] = value
+
+    def __str__(self):
+        return f"Model(address={self._address}, {self.transform}, {self.meshCount}, {self.materialCount}, {self.meshes}, {self.materials}, {self.meshMaterial}, {self.boneCount}, {self.bones}, {self.bindPose})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 96)
+
+class ModelAnimation:
+    """ModelAnimation"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 48
+    _dtype_spec: dict = {"names": ["boneCount", "frameCount", "bones", "framePoses", "name"], "formats": ["<i4", "<i4", "<u4", "<u4", ("<i1", (32,))], "offsets": [0, 4, 8, 12, 16], "itemsize": 48}
+
+    def __init__(self, boneCount: int = 0, frameCount: int = 0, bones: int = 0, framePoses: int = 0, name: CharArray = None, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(48)
+            self._to_free = _struct_pool
+            _heap.i32[self._address >> 2] = boneCount
+            _heap.i32[(self._address + 4) >> 2] = frameCount
+            _heap.u32[(self._address + 8) >> 2] = bones
+            _heap.u32[(self._address + 12) >> 2] = framePoses
+            if name is not None:
+                struct_clone(name, self._address + 16)
+            else:
+                _heap.u8.fill(0, self._address + 16, self._address + 48)
+
+    @property
+    def boneCount(self):
+        """Number of bones"""
+        return _heap.i32[self._address >> 2]
+
+    @boneCount.setter
+    def boneCount(self, value):
+        if not self._frozen:
+            _heap.i32[self._address >> 2] = value
+
+    @property
+    def frameCount(self):
+        """Number of animation frames"""
+        return _heap.i32[(self._address + 4) >> 2]
+
+    @frameCount.setter
+    def frameCount(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 4) >> 2] = value
+
+    @property
+    def bones(self):
+        """Bones information (skeleton)"""
+        return _heap.u32[(self._address + 8) >> 2]
+
+    @bones.setter
+    def bones(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 8) >> 2] = value
+
+    @property
+    def framePoses(self):
+        """Poses array by frame"""
+        return _heap.u32[(self._address + 12) >> 2]
+
+    @framePoses.setter
+    def framePoses(self, value):
+        if not self._frozen:
+            _heap.u32[(self._address + 12) >> 2] = value
+
+    @property
+    def name(self):
+        """Animation name"""
+        return CharArray(32, address=self._address + 16)
+
+    @name.setter
+    def name(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 16)
+
+    def __str__(self):
+        return f"ModelAnimation(address={self._address}, {self.boneCount}, {self.frameCount}, {self.bones}, {self.framePoses}, {self.name})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 48)
+
+class RayCollision:
+    """RayCollision, ray hit information"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 32
+    _dtype_spec: dict = {"names": ["hit", "distance", "point", "normal"], "formats": ["<i1", "<f4", Vector3._dtype_spec, Vector3._dtype_spec], "offsets": [0, 4, 8, 20], "itemsize": 32}
+
+    def __init__(self, hit: int = 0, distance: float = 0.0, point: Vector3 = None, normal: Vector3 = None, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(32)
+            self._to_free = _struct_pool
+            _heap.i8[self._address] = hit
+            _heap.f32[(self._address + 4) >> 2] = distance
+            if point is not None:
+                struct_clone(point, self._address + 8)
+            else:
+                _heap.u8.fill(0, self._address + 8, self._address + 20)
+            if normal is not None:
+                struct_clone(normal, self._address + 20)
+            else:
+                _heap.u8.fill(0, self._address + 20, self._address + 32)
+
+    @property
+    def hit(self):
+        """Did the ray hit something?"""
+        return _heap.i8[self._address]
+
+    @hit.setter
+    def hit(self, value):
+        if not self._frozen:
+            _heap.i8[self._address] = value
+
+    @property
+    def distance(self):
+        """Distance to the nearest hit"""
+        return _heap.f32[(self._address + 4) >> 2]
+
+    @distance.setter
+    def distance(self, value):
+        if not self._frozen:
+            _heap.f32[(self._address + 4) >> 2] = value
+
+    @property
+    def point(self):
+        """Point of the nearest hit"""
+        return Vector3(0, address=self._address + 8)
+
+    @point.setter
+    def point(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 8)
+
+    @property
+    def normal(self):
+        """Surface normal of hit"""
+        return Vector3(0, address=self._address + 20)
+
+    @normal.setter
+    def normal(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 20)
+
+    def __str__(self):
+        return f"RayCollision(address={self._address}, {self.hit}, {self.distance}, {self.point}, {self.normal})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 32)
+
+class BoundingBox:
+    """BoundingBox"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 24
+    _dtype_spec: dict = {"names": ["min", "max"], "formats": [Vector3._dtype_spec, Vector3._dtype_spec], "offsets": [0, 12], "itemsize": 24}
+
+    def __init__(self, min: Vector3 = None, max: Vector3 = None, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(24)
+            self._to_free = _struct_pool
+            if min is not None:
+                struct_clone(min, self._address + 0)
+            else:
+                _heap.u8.fill(0, self._address + 0, self._address + 12)
+            if max is not None:
+                struct_clone(max, self._address + 12)
+            else:
+                _heap.u8.fill(0, self._address + 12, self._address + 24)
+
+    @property
+    def min(self):
+        """Minimum vertex box-corner"""
+        return Vector3(0, address=self._address + 0)
+
+    @min.setter
+    def min(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 0)
+
+    @property
+    def max(self):
+        """Maximum vertex box-corner"""
+        return Vector3(0, address=self._address + 12)
+
+    @max.setter
+    def max(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 12)
+
+    def __str__(self):
+        return f"BoundingBox(address={self._address}, {self.min}, {self.max})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 24)
+
+# index of the struct in StructLayouts of src/raylib_structs.h
+check_struct_layouts([
+    (Mesh, 86),
+    (MaterialMap, 105),
+    (Material, 109),
+    (Transform, 113),
+    (BoneInfo, 117),
+    (Model, 120),
+    (ModelAnimation, 130),
+    (RayCollision, 139),
+    (BoundingBox, 144),
+])
+
+
+def draw_line_3d(startPos: Vector3, endPos: Vector3, color: Color):
+    """Draw a line in 3D world space"""
+    if __debug__:
+        _check_struct("draw_line_3d", "startPos", startPos, Vector3)
+        _check_struct("draw_line_3d", "endPos", endPos, Vector3)
+        _check_struct("draw_line_3d", "color", color, Color)
+    _DrawLine3D(startPos._address, endPos._address, color._address)
+
+
+def draw_point_3d(position: Vector3, color: Color):
+    """Draw a point in 3D space, actually a small line"""
+    if __debug__:
+        _check_struct("draw_point_3d", "position", position, Vector3)
+        _check_struct("draw_point_3d", "color", color, Color)
+    _DrawPoint3D(position._address, color._address)
+
+
+def draw_circle_3d(center: Vector3, radius: float, rotationAxis: Vector3, rotationAngle: float, color: Color):
+    """Draw a circle in 3D world space"""
+    if __debug__:
+        _check_struct("draw_circle_3d", "center", center, Vector3)
+        _check_float("draw_circle_3d", "radius", radius)
+        _check_struct("draw_circle_3d", "rotationAxis", rotationAxis, Vector3)
+        _check_float("draw_circle_3d", "rotationAngle", rotationAngle)
+        _check_struct("draw_circle_3d", "color", color, Color)
+    _DrawCircle3D(center._address, radius, rotationAxis._address, rotationAngle, color._address)
+
+
+def draw_triangle_3d(v1: Vector3, v2: Vector3, v3: Vector3, color: Color):
+    """Draw a color-filled triangle (vertex in counter-clockwise order!)"""
+    if __debug__:
+        _check_struct("draw_triangle_3d", "v1", v1, Vector3)
+        _check_struct("draw_triangle_3d", "v2", v2, Vector3)
+        _check_struct("draw_triangle_3d", "v3", v3, Vector3)
+        _check_struct("draw_triangle_3d", "color", color, Color)
+    _DrawTriangle3D(v1._address, v2._address, v3._address, color._address)
+
+
+def draw_triangle_strip_3d(points: int, pointCount: int, color: Color):
+    """Draw a triangle strip defined by points"""
+    if __debug__:
+        _check_int("draw_triangle_strip_3d", "points", points, 0, 4294967295)
+        _check_int("draw_triangle_strip_3d", "pointCount", pointCount, -2147483648, 2147483647)
+        _check_struct("draw_triangle_strip_3d", "color", color, Color)
+    _DrawTriangleStrip3D(points, pointCount, color._address)
+
+
+def draw_cube(position: Vector3, width: float, height: float, length: float, color: Color):
+    """Draw cube"""
+    if __debug__:
+        _check_struct("draw_cube", "position", position, Vector3)
+        _check_float("draw_cube", "width", width)
+        _check_float("draw_cube", "height", height)
+        _check_float("draw_cube", "length", length)
+        _check_struct("draw_cube", "color", color, Color)
+    _DrawCube(position._address, width, height, length, color._address)
+
+
+def draw_cube_v(position: Vector3, size: Vector3, color: Color):
+    """Draw cube (Vector version)"""
+    if __debug__:
+        _check_struct("draw_cube_v", "position", position, Vector3)
+        _check_struct("draw_cube_v", "size", size, Vector3)
+        _check_struct("draw_cube_v", "color", color, Color)
+    _DrawCubeV(position._address, size._address, color._address)
+
+
+def draw_cube_wires(position: Vector3, width: float, height: float, length: float, color: Color):
+    """Draw cube wires"""
+    if __debug__:
+        _check_struct("draw_cube_wires", "position", position, Vector3)
+        _check_float("draw_cube_wires", "width", width)
+        _check_float("draw_cube_wires", "height", height)
+        _check_float("draw_cube_wires", "length", length)
+        _check_struct("draw_cube_wires", "color", color, Color)
+    _DrawCubeWires(position._address, width, height, length, color._address)
+
+
+def draw_cube_wires_v(position: Vector3, size: Vector3, color: Color):
+    """Draw cube wires (Vector version)"""
+    if __debug__:
+        _check_struct("draw_cube_wires_v", "position", position, Vector3)
+        _check_struct("draw_cube_wires_v", "size", size, Vector3)
+        _check_struct("draw_cube_wires_v", "color", color, Color)
+    _DrawCubeWiresV(position._address, size._address, color._address)
+
+
+def draw_sphere(centerPos: Vector3, radius: float, color: Color):
+    """Draw sphere"""
+    if __debug__:
+        _check_struct("draw_sphere", "centerPos", centerPos, Vector3)
+        _check_float("draw_sphere", "radius", radius)
+        _check_struct("draw_sphere", "color", color, Color)
+    _DrawSphere(centerPos._address, radius, color._address)
+
+
+def draw_sphere_ex(centerPos: Vector3, radius: float, rings: int, slices: int, color: Color):
+    """Draw sphere with extended parameters"""
+    if __debug__:
+        _check_struct("draw_sphere_ex", "centerPos", centerPos, Vector3)
+        _check_float("draw_sphere_ex", "radius", radius)
+        _check_int("draw_sphere_ex", "rings", rings, -2147483648, 2147483647)
+        _check_int("draw_sphere_ex", "slices", slices, -2147483648, 2147483647)
+        _check_struct("draw_sphere_ex", "color", color, Color)
+    _DrawSphereEx(centerPos._address, radius, rings, slices, color._address)
+
+
+def draw_sphere_wires(centerPos: Vector3, radius: float, rings: int, slices: int, color: Color):
+    """Draw sphere wires"""
+    if __debug__:
+        _check_struct("draw_sphere_wires", "centerPos", centerPos, Vector3)
+        _check_float("draw_sphere_wires", "radius", radius)
+        _check_int("draw_sphere_wires", "rings", rings, -2147483648, 2147483647)
+        _check_int("draw_sphere_wires", "slices", slices, -2147483648, 2147483647)
+        _check_struct("draw_sphere_wires", "color", color, Color)
+    _DrawSphereWires(centerPos._address, radius, rings, slices, color._address)
+
+
+def draw_cylinder(position: Vector3, radiusTop: float, radiusBottom: float, height: float, slices: int, color: Color):
+    """Draw a cylinder/cone"""
+    if __debug__:
+        _check_struct("draw_cylinder", "position", position, Vector3)
+        _check_float("draw_cylinder", "radiusTop", radiusTop)
+        _check_float("draw_cylinder", "radiusBottom", radiusBottom)
+        _check_float("draw_cylinder", "height", height)
+        _check_int("draw_cylinder", "slices", slices, -2147483648, 2147483647)
+        _check_struct("draw_cylinder", "color", color, Color)
+    _DrawCylinder(position._address, radiusTop, radiusBottom, height, slices, color._address)
+
+
+def draw_cylinder_ex(startPos: Vector3, endPos: Vector3, startRadius: float, endRadius: float, sides: int, color: Color):
+    """Draw a cylinder with base at startPos and top at endPos"""
+    if __debug__:
+        _check_struct("draw_cylinder_ex", "startPos", startPos, Vector3)
+        _check_struct("draw_cylinder_ex", "endPos", endPos, Vector3)
+        _check_float("draw_cylinder_ex", "startRadius", startRadius)
+        _check_float("draw_cylinder_ex", "endRadius", endRadius)
+        _check_int("draw_cylinder_ex", "sides", sides, -2147483648, 2147483647)
+        _check_struct("draw_cylinder_ex", "color", color, Color)
+    _DrawCylinderEx(startPos._address, endPos._address, startRadius, endRadius, sides, color._address)
+
+
+def draw_cylinder_wires(position: Vector3, radiusTop: float, radiusBottom: float, height: float, slices: int, color: Color):
+    """Draw a cylinder/cone wires"""
+    if __debug__:
+        _check_struct("draw_cylinder_wires", "position", position, Vector3)
+        _check_float("draw_cylinder_wires", "radiusTop", radiusTop)
+        _check_float("draw_cylinder_wires", "radiusBottom", radiusBottom)
+        _check_float("draw_cylinder_wires", "height", height)
+        _check_int("draw_cylinder_wires", "slices", slices, -2147483648, 2147483647)
+        _check_struct("draw_cylinder_wires", "color", color, Color)
+    _DrawCylinderWires(position._address, radiusTop, radiusBottom, height, slices, color._address)
+
+
+def draw_cylinder_wires_ex(startPos: Vector3, endPos: Vector3, startRadius: float, endRadius: float, sides: int, color: Color):
+    """Draw a cylinder wires with base at startPos and top at endPos"""
+    if __debug__:
+        _check_struct("draw_cylinder_wires_ex", "startPos", startPos, Vector3)
+        _check_struct("draw_cylinder_wires_ex", "endPos", endPos, Vector3)
+        _check_float("draw_cylinder_wires_ex", "startRadius", startRadius)
+        _check_float("draw_cylinder_wires_ex", "endRadius", endRadius)
+        _check_int("draw_cylinder_wires_ex", "sides", sides, -2147483648, 2147483647)
+        _check_struct("draw_cylinder_wires_ex", "color", color, Color)
+    _DrawCylinderWiresEx(startPos._address, endPos._address, startRadius, endRadius, sides, color._address)
+
+
+def draw_capsule(startPos: Vector3, endPos: Vector3, radius: float, slices: int, rings: int, color: Color):
+    """Draw a capsule with the center of its sphere caps at startPos and endPos"""
+    if __debug__:
+        _check_struct("draw_capsule", "startPos", startPos, Vector3)
+        _check_struct("draw_capsule", "endPos", endPos, Vector3)
+        _check_float("draw_capsule", "radius", radius)
+        _check_int("draw_capsule", "slices", slices, -2147483648, 2147483647)
+        _check_int("draw_capsule", "rings", rings, -2147483648, 2147483647)
+        _check_struct("draw_capsule", "color", color, Color)
+    _DrawCapsule(startPos._address, endPos._address, radius, slices, rings, color._address)
+
+
+def draw_capsule_wires(startPos: Vector3, endPos: Vector3, radius: float, slices: int, rings: int, color: Color):
+    """Draw capsule wireframe with the center of its sphere caps at startPos and endPos"""
+    if __debug__:
+        _check_struct("draw_capsule_wires", "startPos", startPos, Vector3)
+        _check_struct("draw_capsule_wires", "endPos", endPos, Vector3)
+        _check_float("draw_capsule_wires", "radius", radius)
+        _check_int("draw_capsule_wires", "slices", slices, -2147483648, 2147483647)
+        _check_int("draw_capsule_wires", "rings", rings, -2147483648, 2147483647)
+        _check_struct("draw_capsule_wires", "color", color, Color)
+    _DrawCapsuleWires(startPos._address, endPos._address, radius, slices, rings, color._address)
+
+
+def draw_plane(centerPos: Vector3, size: Vector2, color: Color):
+    """Draw a plane XZ"""
+    if __debug__:
+        _check_struct("draw_plane", "centerPos", centerPos, Vector3)
+        _check_struct("draw_plane", "size", size, Vector2)
+        _check_struct("draw_plane", "color", color, Color)
+    _DrawPlane(centerPos._address, size._address, color._address)
+
+
+def draw_ray(ray: Ray, color: Color):
+    """Draw a ray line"""
+    if __debug__:
+        _check_struct("draw_ray", "ray", ray, Ray)
+        _check_struct("draw_ray", "color", color, Color)
+    _DrawRay(ray._address, color._address)
+
+
+def draw_grid(slices: int, spacing: float):
+    """Draw a grid (centered at (0, 0, 0))"""
+    if __debug__:
+        _check_int("draw_grid", "slices", slices, -2147483648, 2147483647)
+        _check_float("draw_grid", "spacing", spacing)
+    _DrawGrid(slices, spacing)
+
+
+def load_model(fileName: str, out: Model = None) -> Model:
+    """Load model from files (meshes and materials)"""
+    if __debug__:
+        _check_str("load_model", "fileName", fileName)
+        if out is not None:
+            _check_struct("load_model", "out", out, Model)
+    Model_ = _new_struct(Model) if out is None or out.__class__ is not Model else out
+    fileName_ = _scratch_arena.string(fileName)
+    _LoadModel(Model_._address, fileName_)
+    if out is not None and out is not Model_:
+        out._assign(Model_)  # a shadow struct
+        return out
+    return Model_
+
+
+def load_model_from_mesh(mesh: Mesh, out: Model = None) -> Model:
+    """Load model from generated mesh (default material)"""
+    if __debug__:
+        _check_struct("load_model_from_mesh", "mesh", mesh, Mesh)
+        if out is not None:
+            _check_struct("load_model_from_mesh", "out", out, Model)
+    Model_ = _new_struct(Model) if out is None or out.__class__ is not Model or out._address in (mesh._address,) else out
+    _LoadModelFromMesh(Model_._address, mesh._address)
+    if out is not None and out is not Model_:
+        if out.__class__ is Model:
+            _memcpy(out._address, Model_._address, Model._size)
+        else:
+            out._assign(Model_)  # a shadow struct
+        return out
+    return Model_
+
+
+def is_model_ready(model: Model) -> int:
+    """Check if a model is ready"""
+    if __debug__:
+        _check_struct("is_model_ready", "model", model, Model)
+    return_interface = _IsModelReady(model._address)
+    return return_interface
+
+
+def unload_model(model: Model):
+    """Unload model (including meshes) from memory (RAM and/or VRAM)"""
+    if __debug__:
+        _check_struct("unload_model", "model", model, Model)
+    _UnloadModel(model._address)
+
+
+def get_model_bounding_box(model: Model, out: BoundingBox = None) -> BoundingBox:
+    """Compute model bounding box limits (considers all meshes)"""
+    if __debug__:
+        _check_struct("get_model_bounding_box", "model", model, Model)
+        if out is not None:
+            _check_struct("get_model_bounding_box", "out", out, BoundingBox)
+    BoundingBox_ = _new_struct(BoundingBox) if out is None or out.__class__ is not BoundingBox or out._address in (model._address,) else out
+    _GetModelBoundingBox(BoundingBox_._address, model._address)
+    if out is not None and out is not BoundingBox_:
+        if out.__class__ is BoundingBox:
+            _memcpy(out._address, BoundingBox_._address, BoundingBox._size)
+        else:
+            out._assign(BoundingBox_)  # a shadow struct
+        return out
+    return BoundingBox_
+
+
+def draw_model(model: Model, position: Vector3, scale: float, tint: Color):
+    """Draw a model (with texture if set)"""
+    if __debug__:
+        _check_struct("draw_model", "model", model, Model)
+        _check_struct("draw_model", "position", position, Vector3)
+        _check_float("draw_model", "scale", scale)
+        _check_struct("draw_model", "tint", tint, Color)
+    _DrawModel(model._address, position._address, scale, tint._address)
+
+
+def draw_model_ex(model: Model, position: Vector3, rotationAxis: Vector3, rotationAngle: float, scale: Vector3, tint: Color):
+    """Draw a model with extended parameters"""
+    if __debug__:
+        _check_struct("draw_model_ex", "model", model, Model)
+        _check_struct("draw_model_ex", "position", position, Vector3)
+        _check_struct("draw_model_ex", "rotationAxis", rotationAxis, Vector3)
+        _check_float("draw_model_ex", "rotationAngle", rotationAngle)
+        _check_struct("draw_model_ex", "scale", scale, Vector3)
+        _check_struct("draw_model_ex", "tint", tint, Color)
+    _DrawModelEx(model._address, position._address, rotationAxis._address, rotationAngle, scale._address, tint._address)
+
+
+def draw_model_wires(model: Model, position: Vector3, scale: float, tint: Color):
+    """Draw a model wires (with texture if set)"""
+    if __debug__:
+        _check_struct("draw_model_wires", "model", model, Model)
+        _check_struct("draw_model_wires", "position", position, Vector3)
+        _check_float("draw_model_wires", "scale", scale)
+        _check_struct("draw_model_wires", "tint", tint, Color)
+    _DrawModelWires(model._address, position._address, scale, tint._address)
+
+
+def draw_model_wires_ex(model: Model, position: Vector3, rotationAxis: Vector3, rotationAngle: float, scale: Vector3, tint: Color):
+    """Draw a model wires (with texture if set) with extended parameters"""
+    if __debug__:
+        _check_struct("draw_model_wires_ex", "model", model, Model)
+        _check_struct("draw_model_wires_ex", "position", position, Vector3)
+        _check_struct("draw_model_wires_ex", "rotationAxis", rotationAxis, Vector3)
+        _check_float("draw_model_wires_ex", "rotationAngle", rotationAngle)
+        _check_struct("draw_model_wires_ex", "scale", scale, Vector3)
+        _check_struct("draw_model_wires_ex", "tint", tint, Color)
+    _DrawModelWiresEx(model._address, position._address, rotationAxis._address, rotationAngle, scale._address, tint._address)
+
+
+def draw_bounding_box(box: BoundingBox, color: Color):
+    """Draw bounding box (wires)"""
+    if __debug__:
+        _check_struct("draw_bounding_box", "box", box, BoundingBox)
+        _check_struct("draw_bounding_box", "color", color, Color)
+    _DrawBoundingBox(box._address, color._address)
+
+
+def draw_billboard(camera: Camera, texture: Texture2D, position: Vector3, size: float, tint: Color):
+    """Draw a billboard texture"""
+    if __debug__:
+        _check_struct("draw_billboard", "camera", camera, Camera)
+        _check_struct("draw_billboard", "texture", texture, Texture2D)
+        _check_struct("draw_billboard", "position", position, Vector3)
+        _check_float("draw_billboard", "size", size)
+        _check_struct("draw_billboard", "tint", tint, Color)
+    _DrawBillboard(camera._address, texture._address, position._address, size, tint._address)
+
+
+def draw_billboard_rec(camera: Camera, texture: Texture2D, source: Rectangle, position: Vector3, size: Vector2, tint: Color):
+    """Draw a billboard texture defined by source"""
+    if __debug__:
+        _check_struct("draw_billboard_rec", "camera", camera, Camera)
+        _check_struct("draw_billboard_rec", "texture", texture, Texture2D)
+        _check_struct("draw_billboard_rec", "source", source, Rectangle)
+        _check_struct("draw_billboard_rec", "position", position, Vector3)
+        _check_struct("draw_billboard_rec", "size", size, Vector2)
+        _check_struct("draw_billboard_rec", "tint", tint, Color)
+    _DrawBillboardRec(camera._address, texture._address, source._address, position._address, size._address, tint._address)
+
+
+def draw_billboard_pro(camera: Camera, texture: Texture2D, source: Rectangle, position: Vector3, up: Vector3, size: Vector2, origin: Vector2, rotation: float, tint: Color):
+    """Draw a billboard texture defined by source and rotation"""
+    if __debug__:
+        _check_struct("draw_billboard_pro", "camera", camera, Camera)
+        _check_struct("draw_billboard_pro", "texture", texture, Texture2D)
+        _check_struct("draw_billboard_pro", "source", source, Rectangle)
+        _check_struct("draw_billboard_pro", "position", position, Vector3)
+        _check_struct("draw_billboard_pro", "up", up, Vector3)
+        _check_struct("draw_billboard_pro", "size", size, Vector2)
+        _check_struct("draw_billboard_pro", "origin", origin, Vector2)
+        _check_float("draw_billboard_pro", "rotation", rotation)
+        _check_struct("draw_billboard_pro", "tint", tint, Color)
+    _DrawBillboardPro(camera._address, texture._address, source._address, position._address, up._address, size._address, origin._address, rotation, tint._address)
+
+
+def upload_mesh(mesh: int, dynamic: int):
+    """Upload mesh vertex data in GPU and provide VAO/VBO ids"""
+    if __debug__:
+        _check_int("upload_mesh", "mesh", mesh, 0, 4294967295)
+        _check_int("upload_mesh", "dynamic", dynamic, -128, 127)
+    _UploadMesh(mesh, dynamic)
+
+
+def update_mesh_buffer(mesh: Mesh, index: int, data: int, dataSize: int, offset: int):
+    """Update mesh vertex data in GPU for a specific buffer index"""
+    if __debug__:
+        _check_struct("update_mesh_buffer", "mesh", mesh, Mesh)
+        _check_int("update_mesh_buffer", "index", index, -2147483648, 2147483647)
+        _check_int("update_mesh_buffer", "data", data, 0, 4294967295)
+        _check_int("update_mesh_buffer", "dataSize", dataSize, -2147483648, 2147483647)
+        _check_int("update_mesh_buffer", "offset", offset, -2147483648, 2147483647)
+    _UpdateMeshBuffer(mesh._address, index, data, dataSize, offset)
+
+
+def unload_mesh(mesh: Mesh):
+    """Unload mesh data from CPU and GPU"""
+    if __debug__:
+        _check_struct("unload_mesh", "mesh", mesh, Mesh)
+    _UnloadMesh(mesh._address)
+
+
+def draw_mesh(mesh: Mesh, material: Material, transform: Matrix):
+    """Draw a 3d mesh with material and transform"""
+    if __debug__:
+        _check_struct("draw_mesh", "mesh", mesh, Mesh)
+        _check_struct("draw_mesh", "material", material, Material)
+        _check_struct("draw_mesh", "transform", transform, Matrix)
+    _DrawMesh(mesh._address, material._address, transform._address)
+
+
+def draw_mesh_instanced(mesh: Mesh, material: Material, transforms: int, instances: int):
+    """Draw multiple mesh instances with material and different transforms"""
+    if __debug__:
+        _check_struct("draw_mesh_instanced", "mesh", mesh, Mesh)
+        _check_struct("draw_mesh_instanced", "material", material, Material)
+        _check_int("draw_mesh_instanced", "transforms", transforms, 0, 4294967295)
+        _check_int("draw_mesh_instanced", "instances", instances, -2147483648, 2147483647)
+    _DrawMeshInstanced(mesh._address, material._address, transforms, instances)
+
+
+def export_mesh(mesh: Mesh, fileName: str) -> int:
+    """Export mesh data to file, returns true on success"""
+    if __debug__:
+        _check_struct("export_mesh", "mesh", mesh, Mesh)
+        _check_str("export_mesh", "fileName", fileName)
+    fileName_ = _scratch_arena.string(fileName)
+    return_interface = _ExportMesh(mesh._address, fileName_)
+    return return_interface
+
+
+def get_mesh_bounding_box(mesh: Mesh, out: BoundingBox = None) -> BoundingBox:
+    """Compute mesh bounding box limits"""
+    if __debug__:
+        _check_struct("get_mesh_bounding_box", "mesh", mesh, Mesh)
+        if out is not None:
+            _check_struct("get_mesh_bounding_box", "out", out, BoundingBox)
+    BoundingBox_ = _new_struct(BoundingBox) if out is None or out.__class__ is not BoundingBox or out._address in (mesh._address,) else out
+    _GetMeshBoundingBox(BoundingBox_._address, mesh._address)
+    if out is not None and out is not BoundingBox_:
+        if out.__class__ is BoundingBox:
+            _memcpy(out._address, BoundingBox_._address, BoundingBox._size)
+        else:
+            out._assign(BoundingBox_)  # a shadow struct
+        return out
+    return BoundingBox_
+
+
+def gen_mesh_tangents(mesh: int):
+    """Compute mesh tangents"""
+    if __debug__:
+        _check_int("gen_mesh_tangents", "mesh", mesh, 0, 4294967295)
+    _GenMeshTangents(mesh)
+
+
+def gen_mesh_poly(sides: int, radius: float, out: Mesh = None) -> Mesh:
+    """Generate polygonal mesh"""
+    if __debug__:
+        _check_int("gen_mesh_poly", "sides", sides, -2147483648, 2147483647)
+        _check_float("gen_mesh_poly", "radius", radius)
+        if out is not None:
+            _check_struct("gen_mesh_poly", "out", out, Mesh)
+    Mesh_ = _new_struct(Mesh) if out is None or out.__class__ is not Mesh else out
+    _GenMeshPoly(Mesh_._address, sides, radius)
+    if out is not None and out is not Mesh_:
+        out._assign(Mesh_)  # a shadow struct
+        return out
+    return Mesh_
+
+
+def gen_mesh_plane(width: float, length: float, resX: int, resZ: int, out: Mesh = None) -> Mesh:
+    """Generate plane mesh (with subdivisions)"""
+    if __debug__:
+        _check_float("gen_mesh_plane", "width", width)
+        _check_float("gen_mesh_plane", "length", length)
+        _check_int("gen_mesh_plane", "resX", resX, -2147483648, 2147483647)
+        _check_int("gen_mesh_plane", "resZ", resZ, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("gen_mesh_plane", "out", out, Mesh)
+    Mesh_ = _new_struct(Mesh) if out is None or out.__class__ is not Mesh else out
+    _GenMeshPlane(Mesh_._address, width, length, resX, resZ)
+    if out is not None and out is not Mesh_:
+        out._assign(Mesh_)  # a shadow struct
+        return out
+    return Mesh_
+
+
+def gen_mesh_cube(width: float, height: float, length: float, out: Mesh = None) -> Mesh:
+    """Generate cuboid mesh"""
+    if __debug__:
+        _check_float("gen_mesh_cube", "width", width)
+        _check_float("gen_mesh_cube", "height", height)
+        _check_float("gen_mesh_cube", "length", length)
+        if out is not None:
+            _check_struct("gen_mesh_cube", "out", out, Mesh)
+    Mesh_ = _new_struct(Mesh) if out is None or out.__class__ is not Mesh else out
+    _GenMeshCube(Mesh_._address, width, height, length)
+    if out is not None and out is not Mesh_:
+        out._assign(Mesh_)  # a shadow struct
+        return out
+    return Mesh_
+
+
+def gen_mesh_sphere(radius: float, rings: int, slices: int, out: Mesh = None) -> Mesh:
+    """Generate sphere mesh (standard sphere)"""
+    if __debug__:
+        _check_float("gen_mesh_sphere", "radius", radius)
+        _check_int("gen_mesh_sphere", "rings", rings, -2147483648, 2147483647)
+        _check_int("gen_mesh_sphere", "slices", slices, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("gen_mesh_sphere", "out", out, Mesh)
+    Mesh_ = _new_struct(Mesh) if out is None or out.__class__ is not Mesh else out
+    _GenMeshSphere(Mesh_._address, radius, rings, slices)
+    if out is not None and out is not Mesh_:
+        out._assign(Mesh_)  # a shadow struct
+        return out
+    return Mesh_
+
+
+def gen_mesh_hemi_sphere(radius: float, rings: int, slices: int, out: Mesh = None) -> Mesh:
+    """Generate half-sphere mesh (no bottom cap)"""
+    if __debug__:
+        _check_float("gen_mesh_hemi_sphere", "radius", radius)
+        _check_int("gen_mesh_hemi_sphere", "rings", rings, -2147483648, 2147483647)
+        _check_int("gen_mesh_hemi_sphere", "slices", slices, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("gen_mesh_hemi_sphere", "out", out, Mesh)
+    Mesh_ = _new_struct(Mesh) if out is None or out.__class__ is not Mesh else out
+    _GenMeshHemiSphere(Mesh_._address, radius, rings, slices)
+    if out is not None and out is not Mesh_:
+        out._assign(Mesh_)  # a shadow struct
+        return out
+    return Mesh_
+
+
+def gen_mesh_cylinder(radius: float, height: float, slices: int, out: Mesh = None) -> Mesh:
+    """Generate cylinder mesh"""
+    if __debug__:
+        _check_float("gen_mesh_cylinder", "radius", radius)
+        _check_float("gen_mesh_cylinder", "height", height)
+        _check_int("gen_mesh_cylinder", "slices", slices, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("gen_mesh_cylinder", "out", out, Mesh)
+    Mesh_ = _new_struct(Mesh) if out is None or out.__class__ is not Mesh else out
+    _GenMeshCylinder(Mesh_._address, radius, height, slices)
+    if out is not None and out is not Mesh_:
+        out._assign(Mesh_)  # a shadow struct
+        return out
+    return Mesh_
+
+
+def gen_mesh_cone(radius: float, height: float, slices: int, out: Mesh = None) -> Mesh:
+    """Generate cone/pyramid mesh"""
+    if __debug__:
+        _check_float("gen_mesh_cone", "radius", radius)
+        _check_float("gen_mesh_cone", "height", height)
+        _check_int("gen_mesh_cone", "slices", slices, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("gen_mesh_cone", "out", out, Mesh)
+    Mesh_ = _new_struct(Mesh) if out is None or out.__class__ is not Mesh else out
+    _GenMeshCone(Mesh_._address, radius, height, slices)
+    if out is not None and out is not Mesh_:
+        out._assign(Mesh_)  # a shadow struct
+        return out
+    return Mesh_
+
+
+def gen_mesh_torus(radius: float, size: float, radSeg: int, sides: int, out: Mesh = None) -> Mesh:
+    """Generate torus mesh"""
+    if __debug__:
+        _check_float("gen_mesh_torus", "radius", radius)
+        _check_float("gen_mesh_torus", "size", size)
+        _check_int("gen_mesh_torus", "radSeg", radSeg, -2147483648, 2147483647)
+        _check_int("gen_mesh_torus", "sides", sides, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("gen_mesh_torus", "out", out, Mesh)
+    Mesh_ = _new_struct(Mesh) if out is None or out.__class__ is not Mesh else out
+    _GenMeshTorus(Mesh_._address, radius, size, radSeg, sides)
+    if out is not None and out is not Mesh_:
+        out._assign(Mesh_)  # a shadow struct
+        return out
+    return Mesh_
+
+
+def gen_mesh_knot(radius: float, size: float, radSeg: int, sides: int, out: Mesh = None) -> Mesh:
+    """Generate trefoil knot mesh"""
+    if __debug__:
+        _check_float("gen_mesh_knot", "radius", radius)
+        _check_float("gen_mesh_knot", "size", size)
+        _check_int("gen_mesh_knot", "radSeg", radSeg, -2147483648, 2147483647)
+        _check_int("gen_mesh_knot", "sides", sides, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("gen_mesh_knot", "out", out, Mesh)
+    Mesh_ = _new_struct(Mesh) if out is None or out.__class__ is not Mesh else out
+    _GenMeshKnot(Mesh_._address, radius, size, radSeg, sides)
+    if out is not None and out is not Mesh_:
+        out._assign(Mesh_)  # a shadow struct
+        return out
+    return Mesh_
+
+
+def gen_mesh_heightmap(heightmap: Image, size: Vector3, out: Mesh = None) -> Mesh:
+    """Generate heightmap mesh from image data"""
+    if __debug__:
+        _check_struct("gen_mesh_heightmap", "heightmap", heightmap, Image)
+        _check_struct("gen_mesh_heightmap", "size", size, Vector3)
+        if out is not None:
+            _check_struct("gen_mesh_heightmap", "out", out, Mesh)
+    Mesh_ = _new_struct(Mesh) if out is None or out.__class__ is not Mesh or out._address in (heightmap._address, size._address,) else out
+    _GenMeshHeightmap(Mesh_._address, heightmap._address, size._address)
+    if out is not None and out is not Mesh_:
+        if out.__class__ is Mesh:
+            _memcpy(out._address, Mesh_._address, Mesh._size)
+        else:
+            out._assign(Mesh_)  # a shadow struct
+        return out
+    return Mesh_
+
+
+def gen_mesh_cubicmap(cubicmap: Image, cubeSize: Vector3, out: Mesh = None) -> Mesh:
+    """Generate cubes-based map mesh from image data"""
+    if __debug__:
+        _check_struct("gen_mesh_cubicmap", "cubicmap", cubicmap, Image)
+        _check_struct("gen_mesh_cubicmap", "cubeSize", cubeSize, Vector3)
+        if out is not None:
+            _check_struct("gen_mesh_cubicmap", "out", out, Mesh)
+    Mesh_ = _new_struct(Mesh) if out is None or out.__class__ is not Mesh or out._address in (cubicmap._address, cubeSize._address,) else out
+    _GenMeshCubicmap(Mesh_._address, cubicmap._address, cubeSize._address)
+    if out is not None and out is not Mesh_:
+        if out.__class__ is Mesh:
+            _memcpy(out._address, Mesh_._address, Mesh._size)
+        else:
+            out._assign(Mesh_)  # a shadow struct
+        return out
+    return Mesh_
+
+
+def load_materials(fileName: str, materialCount: int) -> int:
+    """Load materials from model file"""
+    if __debug__:
+        _check_str("load_materials", "fileName", fileName)
+        _check_int("load_materials", "materialCount", materialCount, 0, 4294967295)
+    fileName_ = _scratch_arena.string(fileName)
+    return_interface = _LoadMaterials(fileName_, materialCount)
+    return return_interface
+
+
+def load_material_default(out: Material = None) -> Material:
+    """Load default material (Supports: DIFFUSE, SPECULAR, NORMAL maps)"""
+    if __debug__:
+        if out is not None:
+            _check_struct("load_material_default", "out", out, Material)
+    Material_ = _new_struct(Material) if out is None or out.__class__ is not Material else out
+    _LoadMaterialDefault(Material_._address)
+    if out is not None and out is not Material_:
+        out._assign(Material_)  # a shadow struct
+        return out
+    return Material_
+
+
+def is_material_ready(material: Material) -> int:
+    """Check if a material is ready"""
+    if __debug__:
+        _check_struct("is_material_ready", "material", material, Material)
+    return_interface = _IsMaterialReady(material._address)
+    return return_interface
+
+
+def unload_material(material: Material):
+    """Unload material from GPU memory (VRAM)"""
+    if __debug__:
+        _check_struct("unload_material", "material", material, Material)
+    _UnloadMaterial(material._address)
+
+
+def set_material_texture(material: int, mapType: int, texture: Texture2D):
+    """Set texture for a material map type (MATERIAL_MAP_DIFFUSE, MATERIAL_MAP_SPECULAR...)"""
+    if __debug__:
+        _check_int("set_material_texture", "material", material, 0, 4294967295)
+        _check_int("set_material_texture", "mapType", mapType, -2147483648, 2147483647)
+        _check_struct("set_material_texture", "texture", texture, Texture2D)
+    _SetMaterialTexture(material, mapType, texture._address)
+
+
+def set_model_mesh_material(model: int, meshId: int, materialId: int):
+    """Set material for a mesh"""
+    if __debug__:
+        _check_int("set_model_mesh_material", "model", model, 0, 4294967295)
+        _check_int("set_model_mesh_material", "meshId", meshId, -2147483648, 2147483647)
+        _check_int("set_model_mesh_material", "materialId", materialId, -2147483648, 2147483647)
+    _SetModelMeshMaterial(model, meshId, materialId)
+
+
+def load_model_animations(fileName: str, animCount: int) -> int:
+    """Load model animations from file"""
+    if __debug__:
+        _check_str("load_model_animations", "fileName", fileName)
+        _check_int("load_model_animations", "animCount", animCount, 0, 4294967295)
+    fileName_ = _scratch_arena.string(fileName)
+    return_interface = _LoadModelAnimations(fileName_, animCount)
+    return return_interface
+
+
+def update_model_animation(model: Model, anim: ModelAnimation, frame: int):
+    """Update model animation pose"""
+    if __debug__:
+        _check_struct("update_model_animation", "model", model, Model)
+        _check_struct("update_model_animation", "anim", anim, ModelAnimation)
+        _check_int("update_model_animation", "frame", frame, -2147483648, 2147483647)
+    _UpdateModelAnimation(model._address, anim._address, frame)
+
+
+def unload_model_animation(anim: ModelAnimation):
+    """Unload animation data"""
+    if __debug__:
+        _check_struct("unload_model_animation", "anim", anim, ModelAnimation)
+    _UnloadModelAnimation(anim._address)
+
+
+def unload_model_animations(animations: int, count: int):
+    """Unload animation array data"""
+    if __debug__:
+        _check_int("unload_model_animations", "animations", animations, 0, 4294967295)
+        _check_int("unload_model_animations", "count", count, 0, 4294967295)
+    _UnloadModelAnimations(animations, count)
+
+
+def is_model_animation_valid(model: Model, anim: ModelAnimation) -> int:
+    """Check model animation skeleton match"""
+    if __debug__:
+        _check_struct("is_model_animation_valid", "model", model, Model)
+        _check_struct("is_model_animation_valid", "anim", anim, ModelAnimation)
+    return_interface = _IsModelAnimationValid(model._address, anim._address)
+    return return_interface
+
+
+def check_collision_spheres(center1: Vector3, radius1: float, center2: Vector3, radius2: float) -> int:
+    """Check collision between two spheres"""
+    if __debug__:
+        _check_struct("check_collision_spheres", "center1", center1, Vector3)
+        _check_float("check_collision_spheres", "radius1", radius1)
+        _check_struct("check_collision_spheres", "center2", center2, Vector3)
+        _check_float("check_collision_spheres", "radius2", radius2)
+    return_interface = _CheckCollisionSpheres(center1._address, radius1, center2._address, radius2)
+    return return_interface
+
+
+def check_collision_boxes(box1: BoundingBox, box2: BoundingBox) -> int:
+    """Check collision between two bounding boxes"""
+    if __debug__:
+        _check_struct("check_collision_boxes", "box1", box1, BoundingBox)
+        _check_struct("check_collision_boxes", "box2", box2, BoundingBox)
+    return_interface = _CheckCollisionBoxes(box1._address, box2._address)
+    return return_interface
+
+
+def check_collision_box_sphere(box: BoundingBox, center: Vector3, radius: float) -> int:
+    """Check collision between box and sphere"""
+    if __debug__:
+        _check_struct("check_collision_box_sphere", "box", box, BoundingBox)
+        _check_struct("check_collision_box_sphere", "center", center, Vector3)
+        _check_float("check_collision_box_sphere", "radius", radius)
+    return_interface = _CheckCollisionBoxSphere(box._address, center._address, radius)
+    return return_interface
+
+
+def get_ray_collision_sphere(ray: Ray, center: Vector3, radius: float, out: RayCollision = None) -> RayCollision:
+    """Get collision info between ray and sphere"""
+    if __debug__:
+        _check_struct("get_ray_collision_sphere", "ray", ray, Ray)
+        _check_struct("get_ray_collision_sphere", "center", center, Vector3)
+        _check_float("get_ray_collision_sphere", "radius", radius)
+        if out is not None:
+            _check_struct("get_ray_collision_sphere", "out", out, RayCollision)
+    RayCollision_ = _new_struct(RayCollision) if out is None or out.__class__ is not RayCollision or out._address in (ray._address, center._address,) else out
+    _GetRayCollisionSphere(RayCollision_._address, ray._address, center._address, radius)
+    if out is not None and out is not RayCollision_:
+        if out.__class__ is RayCollision:
+            _memcpy(out._address, RayCollision_._address, RayCollision._size)
+        else:
+            out._assign(RayCollision_)  # a shadow struct
+        return out
+    return RayCollision_
+
+
+def get_ray_collision_box(ray: Ray, box: BoundingBox, out: RayCollision = None) -> RayCollision:
+    """Get collision info between ray and box"""
+    if __debug__:
+        _check_struct("get_ray_collision_box", "ray", ray, Ray)
+        _check_struct("get_ray_collision_box", "box", box, BoundingBox)
+        if out is not None:
+            _check_struct("get_ray_collision_box", "out", out, RayCollision)
+    RayCollision_ = _new_struct(RayCollision) if out is None or out.__class__ is not RayCollision or out._address in (ray._address, box._address,) else out
+    _GetRayCollisionBox(RayCollision_._address, ray._address, box._address)
+    if out is not None and out is not RayCollision_:
+        if out.__class__ is RayCollision:
+            _memcpy(out._address, RayCollision_._address, RayCollision._size)
+        else:
+            out._assign(RayCollision_)  # a shadow struct
+        return out
+    return RayCollision_
+
+
+def get_ray_collision_mesh(ray: Ray, mesh: Mesh, transform: Matrix, out: RayCollision = None) -> RayCollision:
+    """Get collision info between ray and mesh"""
+    if __debug__:
+        _check_struct("get_ray_collision_mesh", "ray", ray, Ray)
+        _check_struct("get_ray_collision_mesh", "mesh", mesh, Mesh)
+        _check_struct("get_ray_collision_mesh", "transform", transform, Matrix)
+        if out is not None:
+            _check_struct("get_ray_collision_mesh", "out", out, RayCollision)
+    RayCollision_ = _new_struct(RayCollision) if out is None or out.__class__ is not RayCollision or out._address in (ray._address, mesh._address, transform._address,) else out
+    _GetRayCollisionMesh(RayCollision_._address, ray._address, mesh._address, transform._address)
+    if out is not None and out is not RayCollision_:
+        if out.__class__ is RayCollision:
+            _memcpy(out._address, RayCollision_._address, RayCollision._size)
+        else:
+            out._assign(RayCollision_)  # a shadow struct
+        return out
+    return RayCollision_
+
+
+def get_ray_collision_triangle(ray: Ray, p1: Vector3, p2: Vector3, p3: Vector3, out: RayCollision = None) -> RayCollision:
+    """Get collision info between ray and triangle"""
+    if __debug__:
+        _check_struct("get_ray_collision_triangle", "ray", ray, Ray)
+        _check_struct("get_ray_collision_triangle", "p1", p1, Vector3)
+        _check_struct("get_ray_collision_triangle", "p2", p2, Vector3)
+        _check_struct("get_ray_collision_triangle", "p3", p3, Vector3)
+        if out is not None:
+            _check_struct("get_ray_collision_triangle", "out", out, RayCollision)
+    RayCollision_ = _new_struct(RayCollision) if out is None or out.__class__ is not RayCollision or out._address in (ray._address, p1._address, p2._address, p3._address,) else out
+    _GetRayCollisionTriangle(RayCollision_._address, ray._address, p1._address, p2._address, p3._address)
+    if out is not None and out is not RayCollision_:
+        if out.__class__ is RayCollision:
+            _memcpy(out._address, RayCollision_._address, RayCollision._size)
+        else:
+            out._assign(RayCollision_)  # a shadow struct
+        return out
+    return RayCollision_
+
+
+def get_ray_collision_quad(ray: Ray, p1: Vector3, p2: Vector3, p3: Vector3, p4: Vector3, out: RayCollision = None) -> RayCollision:
+    """Get collision info between ray and quad"""
+    if __debug__:
+        _check_struct("get_ray_collision_quad", "ray", ray, Ray)
+        _check_struct("get_ray_collision_quad", "p1", p1, Vector3)
+        _check_struct("get_ray_collision_quad", "p2", p2, Vector3)
+        _check_struct("get_ray_collision_quad", "p3", p3, Vector3)
+        _check_struct("get_ray_collision_quad", "p4", p4, Vector3)
+        if out is not None:
+            _check_struct("get_ray_collision_quad", "out", out, RayCollision)
+    RayCollision_ = _new_struct(RayCollision) if out is None or out.__class__ is not RayCollision or out._address in (ray._address, p1._address, p2._address, p3._address, p4._address,) else out
+    _GetRayCollisionQuad(RayCollision_._address, ray._address, p1._address, p2._address, p3._address, p4._address)
+    if out is not None and out is not RayCollision_:
+        if out.__class__ is RayCollision:
+            _memcpy(out._address, RayCollision_._address, RayCollision._size)
+        else:
+            out._assign(RayCollision_)  # a shadow struct
+        return out
+    return RayCollision_
+
+
+# the wasm exports called above, fetched once instead of looked up at every call, they are bound
+# again when another context is activated or profiling starts
+_wasm_functions_names = [
+    "_DrawLine3D",
+    "_DrawPoint3D",
+    "_DrawCircle3D",
+    "_DrawTriangle3D",
+    "_DrawTriangleStrip3D",
+    "_DrawCube",
+    "_DrawCubeV",
+    "_DrawCubeWires",
+    "_DrawCubeWiresV",
+    "_DrawSphere",
+    "_DrawSphereEx",
+    "_DrawSphereWires",
+    "_DrawCylinder",
+    "_DrawCylinderEx",
+    "_DrawCylinderWires",
+    "_DrawCylinderWiresEx",
+    "_DrawCapsule",
+    "_DrawCapsuleWires",
+    "_DrawPlane",
+    "_DrawRay",
+    "_DrawGrid",
+    "_LoadModel",
+    "_LoadModelFromMesh",
+    "_memcpy",
+    "_IsModelReady",
+    "_UnloadModel",
+    "_GetModelBoundingBox",
+    "_DrawModel",
+    "_DrawModelEx",
+    "_DrawModelWires",
+    "_DrawModelWiresEx",
+    "_DrawBoundingBox",
+    "_DrawBillboard",
+    "_DrawBillboardRec",
+    "_DrawBillboardPro",
+    "_UploadMesh",
+    "_UpdateMeshBuffer",
+    "_UnloadMesh",
+    "_DrawMesh",
+    "_DrawMeshInstanced",
+    "_ExportMesh",
+    "_GetMeshBoundingBox",
+    "_GenMeshTangents",
+    "_GenMeshPoly",
+    "_GenMeshPlane",
+    "_GenMeshCube",
+    "_GenMeshSphere",
+    "_GenMeshHemiSphere",
+    "_GenMeshCylinder",
+    "_GenMeshCone",
+    "_GenMeshTorus",
+    "_GenMeshKnot",
+    "_GenMeshHeightmap",
+    "_GenMeshCubicmap",
+    "_LoadMaterials",
+    "_LoadMaterialDefault",
+    "_IsMaterialReady",
+    "_UnloadMaterial",
+    "_SetMaterialTexture",
+    "_SetModelMeshMaterial",
+    "_LoadModelAnimations",
+    "_UpdateModelAnimation",
+    "_UnloadModelAnimation",
+    "_UnloadModelAnimations",
+    "_IsModelAnimationValid",
+    "_CheckCollisionSpheres",
+    "_CheckCollisionBoxes",
+    "_CheckCollisionBoxSphere",
+    "_GetRayCollisionSphere",
+    "_GetRayCollisionBox",
+    "_GetRayCollisionMesh",
+    "_GetRayCollisionTriangle",
+    "_GetRayCollisionQuad",
+]
+_bind_wasm_functions(globals())
+
@@ -0,0 +1,576 @@
+# Generated by tools/code_generation/filesGeneration.py, do not edit by hand
+# raylib.h, the functions of rshapes
+from .core import (
+    _new_struct,
+    Vector2,
+    Color,
+    Rectangle,
+    Texture2D,
+    _check_int,
+    _check_float,
+    _check_struct,
+    _bind_wasm_functions,
+)
+
+
+def set_shapes_texture(texture: Texture2D, source: Rectangle):
+    """Set texture and rectangle to be used on shapes drawing"""
+    if __debug__:
+        _check_struct("set_shapes_texture", "texture", texture, Texture2D)
+        _check_struct("set_shapes_texture", "source", source, Rectangle)
+    _SetShapesTexture(texture._address, source._address)
+
+
+def draw_pixel(posX: int, posY: int, color: Color):
+    """Draw a pixel"""
+    if __debug__:
+        _check_int("draw_pixel", "posX", posX, -2147483648, 2147483647)
+        _check_int("draw_pixel", "posY", posY, -2147483648, 2147483647)
+        _check_struct("draw_pixel", "color", color, Color)
+    _DrawPixel(posX, posY, color._address)
+
+
+def draw_pixel_v(position: Vector2, color: Color):
+    """Draw a pixel (Vector version)"""
+    if __debug__:
+        _check_struct("draw_pixel_v", "position", position, Vector2)
+        _check_struct("draw_pixel_v", "color", color, Color)
+    _DrawPixelV(position._address, color._address)
+
+
+def draw_line(startPosX: int, startPosY: int, endPosX: int, endPosY: int, color: Color):
+    """Draw a line"""
+    if __debug__:
+        _check_int("draw_line", "startPosX", startPosX, -2147483648, 2147483647)
+        _check_int("draw_line", "startPosY", startPosY, -2147483648, 2147483647)
+        _check_int("draw_line", "endPosX", endPosX, -2147483648, 2147483647)
+        _check_int("draw_line", "endPosY", endPosY, -2147483648, 2147483647)
+        _check_struct("draw_line", "color", color, Color)
+    _DrawLine(startPosX, startPosY, endPosX, endPosY, color._address)
+
+
+def draw_line_v(startPos: Vector2, endPos: Vector2, color: Color):
+    """Draw a line (Vector version)"""
+    if __debug__:
+        _check_struct("draw_line_v", "startPos", startPos, Vector2)
+        _check_struct("draw_line_v", "endPos", endPos, Vector2)
+        _check_struct("draw_line_v", "color", color, Color)
+    _DrawLineV(startPos._address, endPos._address, color._address)
+
+
+def draw_line_ex(startPos: Vector2, endPos: Vector2, thick: float, color: Color):
+    """Draw a line defining thickness"""
+    if __debug__:
+        _check_struct("draw_line_ex", "startPos", startPos, Vector2)
+        _check_struct("draw_line_ex", "endPos", endPos, Vector2)
+        _check_float("draw_line_ex", "thick", thick)
+        _check_struct("draw_line_ex", "color", color, Color)
+    _DrawLineEx(startPos._address, endPos._address, thick, color._address)
+
+
+def draw_line_bezier(startPos: Vector2, endPos: Vector2, thick: float, color: Color):
+    """Draw a line using cubic-bezier curves in-out"""
+    if __debug__:
+        _check_struct("draw_line_bezier", "startPos", startPos, Vector2)
+        _check_struct("draw_line_bezier", "endPos", endPos, Vector2)
+        _check_float("draw_line_bezier", "thick", thick)
+        _check_struct("draw_line_bezier", "color", color, Color)
+    _DrawLineBezier(startPos._address, endPos._address, thick, color._address)
+
+
+def draw_line_bezier_quad(startPos: Vector2, endPos: Vector2, controlPos: Vector2, thick: float, color: Color):
+    """Draw line using quadratic bezier curves with a control point"""
+    if __debug__:
+        _check_struct("draw_line_bezier_quad", "startPos", startPos, Vector2)
+        _check_struct("draw_line_bezier_quad", "endPos", endPos, Vector2)
+        _check_struct("draw_line_bezier_quad", "controlPos", controlPos, Vector2)
+        _check_float("draw_line_bezier_quad", "thick", thick)
+        _check_struct("draw_line_bezier_quad", "color", color, Color)
+    _DrawLineBezierQuad(startPos._address, endPos._address, controlPos._address, thick, color._address)
+
+
+def draw_line_bezier_cubic(startPos: Vector2, endPos: Vector2, startControlPos: Vector2, endControlPos: Vector2, thick: float, color: Color):
+    """Draw line using cubic bezier curves with 2 control points"""
+    if __debug__:
+        _check_struct("draw_line_bezier_cubic", "startPos", startPos, Vector2)
+        _check_struct("draw_line_bezier_cubic", "endPos", endPos, Vector2)
+        _check_struct("draw_line_bezier_cubic", "startControlPos", startControlPos, Vector2)
+        _check_struct("draw_line_bezier_cubic", "endControlPos", endControlPos, Vector2)
+        _check_float("draw_line_bezier_cubic", "thick", thick)
+        _check_struct("draw_line_bezier_cubic", "color", color, Color)
+    _DrawLineBezierCubic(startPos._address, endPos._address, startControlPos._address, endControlPos._address, thick, color._address)
+
+
+def draw_line_strip(points: int, pointCount: int, color: Color):
+    """Draw lines sequence"""
+    if __debug__:
+        _check_int("draw_line_strip", "points", points, 0, 4294967295)
+        _check_int("draw_line_strip", "pointCount", pointCount, -2147483648, 2147483647)
+        _check_struct("draw_line_strip", "color", color, Color)
+    _DrawLineStrip(points, pointCount, color._address)
+
+
+def draw_circle(centerX: int, centerY: int, radius: float, color: Color):
+    """Draw a color-filled circle"""
+    if __debug__:
+        _check_int("draw_circle", "centerX", centerX, -2147483648, 2147483647)
+        _check_int("draw_circle", "centerY", centerY, -2147483648, 2147483647)
+        _check_float("draw_circle", "radius", radius)
+        _check_struct("draw_circle", "color", color, Color)
+    _DrawCircle(centerX, centerY, radius, color._address)
+
+
+def draw_circle_sector(center: Vector2, radius: float, startAngle: float, endAngle: float, segments: int, color: Color):
+    """Draw a piece of a circle"""
+    if __debug__:
+        _check_struct("draw_circle_sector", "center", center, Vector2)
+        _check_float("draw_circle_sector", "radius", radius)
+        _check_float("draw_circle_sector", "startAngle", startAngle)
+        _check_float("draw_circle_sector", "endAngle", endAngle)
+        _check_int("draw_circle_sector", "segments", segments, -2147483648, 2147483647)
+        _check_struct("draw_circle_sector", "color", color, Color)
+    _DrawCircleSector(center._address, radius, startAngle, endAngle, segments, color._address)
+
+
+def draw_circle_sector_lines(center: Vector2, radius: float, startAngle: float, endAngle: float, segments: int, color: Color):
+    """Draw circle sector outline"""
+    if __debug__:
+        _check_struct("draw_circle_sector_lines", "center", center, Vector2)
+        _check_float("draw_circle_sector_lines", "radius", radius)
+        _check_float("draw_circle_sector_lines", "startAngle", startAngle)
+        _check_float("draw_circle_sector_lines", "endAngle", endAngle)
+        _check_int("draw_circle_sector_lines", "segments", segments, -2147483648, 2147483647)
+        _check_struct("draw_circle_sector_lines", "color", color, Color)
+    _DrawCircleSectorLines(center._address, radius, startAngle, endAngle, segments, color._address)
+
+
+def draw_circle_gradient(centerX: int, centerY: int, radius: float, color1: Color, color2: Color):
+    """Draw a gradient-filled circle"""
+    if __debug__:
+        _check_int("draw_circle_gradient", "centerX", centerX, -2147483648, 2147483647)
+        _check_int("draw_circle_gradient", "centerY", centerY, -2147483648, 2147483647)
+        _check_float("draw_circle_gradient", "radius", radius)
+        _check_struct("draw_circle_gradient", "color1", color1, Color)
+        _check_struct("draw_circle_gradient", "color2", color2, Color)
+    _DrawCircleGradient(centerX, centerY, radius, color1._address, color2._address)
+
+
+def draw_circle_v(center: Vector2, radius: float, color: Color):
+    """Draw a color-filled circle (Vector version)"""
+    if __debug__:
+        _check_struct("draw_circle_v", "center", center, Vector2)
+        _check_float("draw_circle_v", "radius", radius)
+        _check_struct("draw_circle_v", "color", color, Color)
+    _DrawCircleV(center._address, radius, color._address)
+
+
+def draw_circle_lines(centerX: int, centerY: int, radius: float, color: Color):
+    """Draw circle outline"""
+    if __debug__:
+        _check_int("draw_circle_lines", "centerX", centerX, -2147483648, 2147483647)
+        _check_int("draw_circle_lines", "centerY", centerY, -2147483648, 2147483647)
+        _check_float("draw_circle_lines", "radius", radius)
+        _check_struct("draw_circle_lines", "color", color, Color)
+    _DrawCircleLines(centerX, centerY, radius, color._address)
+
+
+def draw_ellipse(centerX: int, centerY: int, radiusH: float, radiusV: float, color: Color):
+    """Draw ellipse"""
+    if __debug__:
+        _check_int("draw_ellipse", "centerX", centerX, -2147483648, 2147483647)
+        _check_int("draw_ellipse", "centerY", centerY, -2147483648, 2147483647)
+        _check_float("draw_ellipse", "radiusH", radiusH)
+        _check_float("draw_ellipse", "radiusV", radiusV)
+        _check_struct("draw_ellipse", "color", color, Color)
+    _DrawEllipse(centerX, centerY, radiusH, radiusV, color._address)
+
+
+def draw_ellipse_lines(centerX: int, centerY: int, radiusH: float, radiusV: float, color: Color):
+    """Draw ellipse outline"""
+    if __debug__:
+        _check_int("draw_ellipse_lines", "centerX", centerX, -2147483648, 2147483647)
+        _check_int("draw_ellipse_lines", "centerY", centerY, -2147483648, 2147483647)
+        _check_float("draw_ellipse_lines", "radiusH", radiusH)
+        _check_float("draw_ellipse_lines", "radiusV", radiusV)
+        _check_struct("draw_ellipse_lines", "color", color, Color)
+    _DrawEllipseLines(centerX, centerY, radiusH, radiusV, color._address)
+
+
+def draw_ring(center: Vector2, innerRadius: float, outerRadius: float, startAngle: float, endAngle: float, segments: int, color: Color):
+    """Draw ring"""
+    if __debug__:
+        _check_struct("draw_ring", "center", center, Vector2)
+        _check_float("draw_ring", "innerRadius", innerRadius)
+        _check_float("draw_ring", "outerRadius", outerRadius)
+        _check_float("draw_ring", "startAngle", startAngle)
+        _check_float("draw_ring", "endAngle", endAngle)
+        _check_int("draw_ring", "segments", segments, -2147483648, 2147483647)
+        _check_struct("draw_ring", "color", color, Color)
+    _DrawRing(center._address, innerRadius, outerRadius, startAngle, endAngle, segments, color._address)
+
+
+def draw_ring_lines(center: Vector2, innerRadius: float, outerRadius: float, startAngle: float, endAngle: float, segments: int, color: Color):
+    """Draw ring outline"""
+    if __debug__:
+        _check_struct("draw_ring_lines", "center", center, Vector2)
+        _check_float("draw_ring_lines", "innerRadius", innerRadius)
+        _check_float("draw_ring_lines", "outerRadius", outerRadius)
+        _check_float("draw_ring_lines", "startAngle", startAngle)
+        _check_float("draw_ring_lines", "endAngle", endAngle)
+        _check_int("draw_ring_lines", "segments", segments, -2147483648, 2147483647)
+        _check_struct("draw_ring_lines", "color", color, Color)
+    _DrawRingLines(center._address, innerRadius, outerRadius, startAngle, endAngle, segments, color._address)
+
+
+def draw_rectangle(posX: int, posY: int, width: int, height: int, color: Color):
+    """Draw a color-filled rectangle"""
+    if __debug__:
+        _check_int("draw_rectangle", "posX", posX, -2147483648, 2147483647)
+        _check_int("draw_rectangle", "posY", posY, -2147483648, 2147483647)
+        _check_int("draw_rectangle", "width", width, -2147483648, 2147483647)
+        _check_int("draw_rectangle", "height", height, -2147483648, 2147483647)
+        _check_struct("draw_rectangle", "color", color, Color)
+    _DrawRectangle(posX, posY, width, height, color._address)
+
+
+def draw_rectangle_v(position: Vector2, size: Vector2, color: Color):
+    """Draw a color-filled rectangle (Vector version)"""
+    if __debug__:
+        _check_struct("draw_rectangle_v", "position", position, Vector2)
+        _check_struct("draw_rectangle_v", "size", size, Vector2)
+        _check_struct("draw_rectangle_v", "color", color, Color)
+    _DrawRectangleV(position._address, size._address, color._address)
+
+
+def draw_rectangle_rec(rec: Rectangle, color: Color):
+    """Draw a color-filled rectangle"""
+    if __debug__:
+        _check_struct("draw_rectangle_rec", "rec", rec, Rectangle)
+        _check_struct("draw_rectangle_rec", "color", color, Color)
+    _DrawRectangleRec(rec._address, color._address)
+
+
+def draw_rectangle_pro(rec: Rectangle, origin: Vector2, rotation: float, color: Color):
+    """Draw a color-filled rectangle with pro parameters"""
+    if __debug__:
+        _check_struct("draw_rectangle_pro", "rec", rec, Rectangle)
+        _check_struct("draw_rectangle_pro", "origin", origin, Vector2)
+        _check_float("draw_rectangle_pro", "rotation", rotation)
+        _check_struct("draw_rectangle_pro", "color", color, Color)
+    _DrawRectanglePro(rec._address, origin._address, rotation, color._address)
+
+
+def draw_rectangle_gradient_v(posX: int, posY: int, width: int, height: int, color1: Color, color2: Color):
+    """Draw a vertical-gradient-filled rectangle"""
+    if __debug__:
+        _check_int("draw_rectangle_gradient_v", "posX", posX, -2147483648, 2147483647)
+        _check_int("draw_rectangle_gradient_v", "posY", posY, -2147483648, 2147483647)
+        _check_int("draw_rectangle_gradient_v", "width", width, -2147483648, 2147483647)
+        _check_int("draw_rectangle_gradient_v", "height", height, -2147483648, 2147483647)
+        _check_struct("draw_rectangle_gradient_v", "color1", color1, Color)
+        _check_struct("draw_rectangle_gradient_v", "color2", color2, Color)
+    _DrawRectangleGradientV(posX, posY, width, height, color1._address, color2._address)
+
+
+def draw_rectangle_gradient_h(posX: int, posY: int, width: int, height: int, color1: Color, color2: Color):
+    """Draw a horizontal-gradient-filled rectangle"""
+    if __debug__:
+        _check_int("draw_rectangle_gradient_h", "posX", posX, -2147483648, 2147483647)
+        _check_int("draw_rectangle_gradient_h", "posY", posY, -2147483648, 2147483647)
+        _check_int("draw_rectangle_gradient_h", "width", width, -2147483648, 2147483647)
+        _check_int("draw_rectangle_gradient_h", "height", height, -2147483648, 2147483647)
+        _check_struct("draw_rectangle_gradient_h", "color1", color1, Color)
+        _check_struct("draw_rectangle_gradient_h", "color2", color2, Color)
+    _DrawRectangleGradientH(posX, posY, width, height, color1._address, color2._address)
+
+
+def draw_rectangle_gradient_ex(rec: Rectangle, col1: Color, col2: Color, col3: Color, col4: Color):
+    """Draw a gradient-filled rectangle with custom vertex colors"""
+    if __debug__:
+        _check_struct("draw_rectangle_gradient_ex", "rec", rec, Rectangle)
+        _check_struct("draw_rectangle_gradient_ex", "col1", col1, Color)
+        _check_struct("draw_rectangle_gradient_ex", "col2", col2, Color)
+        _check_struct("draw_rectangle_gradient_ex", "col3", col3, Color)
+        _check_struct("draw_rectangle_gradient_ex", "col4", col4, Color)
+    _DrawRectangleGradientEx(rec._address, col1._address, col2._address, col3._address, col4._address)
+
+
+def draw_rectangle_lines(posX: int, posY: int, width: int, height: int, color: Color):
+    """Draw rectangle outline"""
+    if __debug__:
+        _check_int("draw_rectangle_lines", "posX", posX, -2147483648, 2147483647)
+        _check_int("draw_rectangle_lines", "posY", posY, -2147483648, 2147483647)
+        _check_int("draw_rectangle_lines", "width", width, -2147483648, 2147483647)
+        _check_int("draw_rectangle_lines", "height", height, -2147483648, 2147483647)
+        _check_struct("draw_rectangle_lines", "color", color, Color)
+    _DrawRectangleLines(posX, posY, width, height, color._address)
+
+
+def draw_rectangle_lines_ex(rec: Rectangle, lineThick: float, color: Color):
+    """Draw rectangle outline with extended parameters"""
+    if __debug__:
+        _check_struct("draw_rectangle_lines_ex", "rec", rec, Rectangle)
+        _check_float("draw_rectangle_lines_ex", "lineThick", lineThick)
+        _check_struct("draw_rectangle_lines_ex", "color", color, Color)
+    _DrawRectangleLinesEx(rec._address, lineThick, color._address)
+
+
+def draw_rectangle_rounded(rec: Rectangle, roundness: float, segments: int, color: Color):
+    """Draw rectangle with rounded edges"""
+    if __debug__:
+        _check_struct("draw_rectangle_rounded", "rec", rec, Rectangle)
+        _check_float("draw_rectangle_rounded", "roundness", roundness)
+        _check_int("draw_rectangle_rounded", "segments", segments, -2147483648, 2147483647)
+        _check_struct("draw_rectangle_rounded", "color", color, Color)
+    _DrawRectangleRounded(rec._address, roundness, segments, color._address)
+
+
+def draw_rectangle_rounded_lines(rec: Rectangle, roundness: float, segments: int, lineThick: float, color: Color):
+    """Draw rectangle with rounded edges outline"""
+    if __debug__:
+        _check_struct("draw_rectangle_rounded_lines", "rec", rec, Rectangle)
+        _check_float("draw_rectangle_rounded_lines", "roundness", roundness)
+        _check_int("draw_rectangle_rounded_lines", "segments", segments, -2147483648, 2147483647)
+        _check_float("draw_rectangle_rounded_lines", "lineThick", lineThick)
+        _check_struct("draw_rectangle_rounded_lines", "color", color, Color)
+    _DrawRectangleRoundedLines(rec._address, roundness, segments, lineThick, color._address)
+
+
+def draw_triangle(v1: Vector2, v2: Vector2, v3: Vector2, color: Color):
+    """Draw a color-filled triangle (vertex in counter-clockwise order!)"""
+    if __debug__:
+        _check_struct("draw_triangle", "v1", v1, Vector2)
+        _check_struct("draw_triangle", "v2", v2, Vector2)
+        _check_struct("draw_triangle", "v3", v3, Vector2)
+        _check_struct("draw_triangle", "color", color, Color)
+    _DrawTriangle(v1._address, v2._address, v3._address, color._address)
+
+
+def draw_triangle_lines(v1: Vector2, v2: Vector2, v3: Vector2, color: Color):
+    """Draw triangle outline (vertex in counter-clockwise order!)"""
+    if __debug__:
+        _check_struct("draw_triangle_lines", "v1", v1, Vector2)
+        _check_struct("draw_triangle_lines", "v2", v2, Vector2)
+        _check_struct("draw_triangle_lines", "v3", v3, Vector2)
+        _check_struct("draw_triangle_lines", "color", color, Color)
+    _DrawTriangleLines(v1._address, v2._address, v3._address, color._address)
+
+
+def draw_triangle_fan(points: int, pointCount: int, color: Color):
+    """Draw a triangle fan defined by points (first vertex is the center)"""
+    if __debug__:
+        _check_int("draw_triangle_fan", "points", points, 0, 4294967295)
+        _check_int("draw_triangle_fan", "pointCount", pointCount, -2147483648, 2147483647)
+        _check_struct("draw_triangle_fan", "color", color, Color)
+    _DrawTriangleFan(points, pointCount, color._address)
+
+
+def draw_triangle_strip(points: int, pointCount: int, color: Color):
+    """Draw a triangle strip defined by points"""
+    if __debug__:
+        _check_int("draw_triangle_strip", "points", points, 0, 4294967295)
+        _check_int("draw_triangle_strip", "pointCount", pointCount, -2147483648, 2147483647)
+        _check_struct("draw_triangle_strip", "color", color, Color)
+    _DrawTriangleStrip(points, pointCount, color._address)
+
+
+def draw_poly(center: Vector2, sides: int, radius: float, rotation: float, color: Color):
+    """Draw a regular polygon (Vector version)"""
+    if __debug__:
+        _check_struct("draw_poly", "center", center, Vector2)
+        _check_int("draw_poly", "sides", sides, -2147483648, 2147483647)
+        _check_float("draw_poly", "radius", radius)
+        _check_float("draw_poly", "rotation", rotation)
+        _check_struct("draw_poly", "color", color, Color)
+    _DrawPoly(center._address, sides, radius, rotation, color._address)
+
+
+def draw_poly_lines(center: Vector2, sides: int, radius: float, rotation: float, color: Color):
+    """Draw a polygon outline of n sides"""
+    if __debug__:
+        _check_struct("draw_poly_lines", "center", center, Vector2)
+        _check_int("draw_poly_lines", "sides", sides, -2147483648, 2147483647)
+        _check_float("draw_poly_lines", "radius", radius)
+        _check_float("draw_poly_lines", "rotation", rotation)
+        _check_struct("draw_poly_lines", "color", color, Color)
+    _DrawPolyLines(center._address, sides, radius, rotation, color._address)
+
+
+def draw_poly_lines_ex(center: Vector2, sides: int, radius: float, rotation: float, lineThick: float, color: Color):
+    """Draw a polygon outline of n sides with extended parameters"""
+    if __debug__:
+        _check_struct("draw_poly_lines_ex", "center", center, Vector2)
+        _check_int("draw_poly_lines_ex", "sides", sides, -2147483648, 2147483647)
+        _check_float("draw_poly_lines_ex", "radius", radius)
+        _check_float("draw_poly_lines_ex", "rotation", rotation)
+        _check_float("draw_poly_lines_ex", "lineThick", lineThick)
+        _check_struct("draw_poly_lines_ex", "color", color, Color)
+    _DrawPolyLinesEx(center._address, sides, radius, rotation, lineThick, color._address)
+
+
+def check_collision_recs(rec1: Rectangle, rec2: Rectangle) -> int:
+    """Check collision between two rectangles"""
+    if __debug__:
+        _check_struct("check_collision_recs", "rec1", rec1, Rectangle)
+        _check_struct("check_collision_recs", "rec2", rec2, Rectangle)
+    return_interface = _CheckCollisionRecs(rec1._address, rec2._address)
+    return return_interface
+
+
+def check_collision_circles(center1: Vector2, radius1: float, center2: Vector2, radius2: float) -> int:
+    """Check collision between two circles"""
+    if __debug__:
+        _check_struct("check_collision_circles", "center1", center1, Vector2)
+        _check_float("check_collision_circles", "radius1", radius1)
+        _check_struct("check_collision_circles", "center2", center2, Vector2)
+        _check_float("check_collision_circles", "radius2", radius2)
+    return_interface = _CheckCollisionCircles(center1._address, radius1, center2._address, radius2)
+    return return_interface
+
+
+def check_collision_circle_rec(center: Vector2, radius: float, rec: Rectangle) -> int:
+    """Check collision between circle and rectangle"""
+    if __debug__:
+        _check_struct("check_collision_circle_rec", "center", center, Vector2)
+        _check_float("check_collision_circle_rec", "radius", radius)
+        _check_struct("check_collision_circle_rec", "rec", rec, Rectangle)
+    return_interface = _CheckCollisionCircleRec(center._address, radius, rec._address)
+    return return_interface
+
+
+def check_collision_point_rec(point: Vector2, rec: Rectangle) -> int:
+    """Check if point is inside rectangle"""
+    if __debug__:
+        _check_struct("check_collision_point_rec", "point", point, Vector2)
+        _check_struct("check_collision_point_rec", "rec", rec, Rectangle)
+    return_interface = _CheckCollisionPointRec(point._address, rec._address)
+    return return_interface
+
+
+def check_collision_point_circle(point: Vector2, center: Vector2, radius: float) -> int:
+    """Check if point is inside circle"""
+    if __debug__:
+        _check_struct("check_collision_point_circle", "point", point, Vector2)
+        _check_struct("check_collision_point_circle", "center", center, Vector2)
+        _check_float("check_collision_point_circle", "radius", radius)
+    return_interface = _CheckCollisionPointCircle(point._address, center._address, radius)
+    return return_interface
+
+
+def check_collision_point_triangle(point: Vector2, p1: Vector2, p2: Vector2, p3: Vector2) -> int:
+    """Check if point is inside a triangle"""
+    if __debug__:
+        _check_struct("check_collision_point_triangle", "point", point, Vector2)
+        _check_struct("check_collision_point_triangle", "p1", p1, Vector2)
+        _check_struct("check_collision_point_triangle", "p2", p2, Vector2)
+        _check_struct("check_collision_point_triangle", "p3", p3, Vector2)
+    return_interface = _CheckCollisionPointTriangle(point._address, p1._address, p2._address, p3._address)
+    return return_interface
+
+
+def check_collision_point_poly(point: Vector2, points: int, pointCount: int) -> int:
+    """Check if point is within a polygon described by array of vertices"""
+    if __debug__:
+        _check_struct("check_collision_point_poly", "point", point, Vector2)
+        _check_int("check_collision_point_poly", "points", points, 0, 4294967295)
+        _check_int("check_collision_point_poly", "pointCount", pointCount, -2147483648, 2147483647)
+    return_interface = _CheckCollisionPointPoly(point._address, points, pointCount)
+    return return_interface
+
+
+def check_collision_lines(startPos1: Vector2, endPos1: Vector2, startPos2: Vector2, endPos2: Vector2, collisionPoint: int) -> int:
+    """Check the collision between two lines defined by two points each, returns collision point by reference"""
+    if __debug__:
+        _check_struct("check_collision_lines", "startPos1", startPos1, Vector2)
+        _check_struct("check_collision_lines", "endPos1", endPos1, Vector2)
+        _check_struct("check_collision_lines", "startPos2", startPos2, Vector2)
+        _check_struct("check_collision_lines", "endPos2", endPos2, Vector2)
+        _check_int("check_collision_lines", "collisionPoint", collisionPoint, 0, 4294967295)
+    return_interface = _CheckCollisionLines(startPos1._address, endPos1._address, startPos2._address, endPos2._address, collisionPoint)
+    return return_interface
+
+
+def check_collision_point_line(point: Vector2, p1: Vector2, p2: Vector2, threshold: int) -> int:
+    """Check if point belongs to line created between two points [p1] and [p2] with defined margin in pixels [threshold]"""
+    if __debug__:
+        _check_struct("check_collision_point_line", "point", point, Vector2)
+        _check_struct("check_collision_point_line", "p1", p1, Vector2)
+        _check_struct("check_collision_point_line", "p2", p2, Vector2)
+        _check_int("check_collision_point_line", "threshold", threshold, -2147483648, 2147483647)
+    return_interface = _CheckCollisionPointLine(point._address, p1._address, p2._address, threshold)
+    return return_interface
+
+
+def get_collision_rec(rec1: Rectangle, rec2: Rectangle, out: Rectangle = None) -> Rectangle:
+    """Get collision rectangle for two rectangles collision"""
+    if __debug__:
+        _check_struct("get_collision_rec", "rec1", rec1, Rectangle)
+        _check_struct("get_collision_rec", "rec2", rec2, Rectangle)
+        if out is not None:
+            _check_struct("get_collision_rec", "out", out, Rectangle)
+    Rectangle_ = _new_struct(Rectangle) if out is None or out.__class__ is not Rectangle or out._address in (rec1._address, rec2._address,) else out
+    _GetCollisionRec(Rectangle_._address, rec1._address, rec2._address)
+    if out is not None and out is not Rectangle_:
+        if out.__class__ is Rectangle:
+            _memcpy(out._address, Rectangle_._address, Rectangle._size)
+        else:
+            out._assign(Rectangle_)  # a shadow struct
+        return out
+    return Rectangle_
+
+
+# the wasm exports called above, fetched once instead of looked up at every call, they are bound
+# again when another context is activated or profiling starts
+_wasm_functions_names = [
+    "_SetShapesTexture",
+    "_DrawPixel",
+    "_DrawPixelV",
+    "_DrawLine",
+    "_DrawLineV",
+    "_DrawLineEx",
+    "_DrawLineBezier",
+    "_DrawLineBezierQuad",
+    "_DrawLineBezierCubic",
+    "_DrawLineStrip",
+    "_DrawCircle",
+    "_DrawCircleSector",
+    "_DrawCircleSectorLines",
+    "_DrawCircleGradient",
+    "_DrawCircleV",
+    "_DrawCircleLines",
+    "_DrawEllipse",
+    "_DrawEllipseLines",
+    "_DrawRing",
+    "_DrawRingLines",
+    "_DrawRectangle",
+    "_DrawRectangleV",
+    "_DrawRectangleRec",
+    "_DrawRectanglePro",
+    "_DrawRectangleGradientV",
+    "_DrawRectangleGradientH",
+    "_DrawRectangleGradientEx",
+    "_DrawRectangleLines",
+    "_DrawRectangleLinesEx",
+    "_DrawRectangleRounded",
+    "_DrawRectangleRoundedLines",
+    "_DrawTriangle",
+    "_DrawTriangleLines",
+    "_DrawTriangleFan",
+    "_DrawTriangleStrip",
+    "_DrawPoly",
+    "_DrawPolyLines",
+    "_DrawPolyLinesEx",
+    "_CheckCollisionRecs",
+    "_CheckCollisionCircles",
+    "_CheckCollisionCircleRec",
+    "_CheckCollisionPointRec",
+    "_CheckCollisionPointCircle",
+    "_CheckCollisionPointTriangle",
+    "_CheckCollisionPointPoly",
+    "_CheckCollisionLines",
+    "_CheckCollisionPointLine",
+    "_GetCollisionRec",
+    "_memcpy",
+]
+_bind_wasm_functions(globals())
+
@@ -0,0 +1,695 @@
+# Generated by tools/code_generation/filesGeneration.py, do not edit by hand
+# raylib.h, the functions of rtext
+from .core import (
+    struct_clone,
+    _heap,
+    _scratch_arena,
+    _struct_pool,
+    _new_struct,
+    Vector2,
+    Color,
+    Rectangle,
+    Image,
+    Font,
+    check_struct_layouts,
+    _text_layouts,
+    _check_int,
+    _check_float,
+    _check_str,
+    _check_struct,
+    _bind_wasm_functions,
+)
+
+
+class GlyphInfo:
+    """GlyphInfo, font characters glyphs info"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 36
+    _dtype_spec: dict = {"names": ["value", "offsetX", "offsetY", "advanceX", "image"], "formats": ["<i4", "<i4", "<i4", "<i4", Image._dtype_spec], "offsets": [0, 4, 8, 12, 16], "itemsize": 36}
+
+    def __init__(self, value: int = 0, offsetX: int = 0, offsetY: int = 0, advanceX: int = 0, image: Image = None, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(36)
+            self._to_free = _struct_pool
+            _heap.i32[self._address >> 2] = value
+            _heap.i32[(self._address + 4) >> 2] = offsetX
+            _heap.i32[(self._address + 8) >> 2] = offsetY
+            _heap.i32[(self._address + 12) >> 2] = advanceX
+            if image is not None:
+                struct_clone(image, self._address + 16)
+            else:
+                _heap.u8.fill(0, self._address + 16, self._address + 36)
+
+    @property
+    def value(self):
+        """Character value (Unicode)"""
+        return _heap.i32[self._address >> 2]
+
+    @value.setter
+    def value(self, value):
+        if not self._frozen:
+            _heap.i32[self._address >> 2] = value
+
+    @property
+    def offsetX(self):
+        """Character offset X when drawing"""
+        return _heap.i32[(self._address + 4) >> 2]
+
+    @offsetX.setter
+    def offsetX(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 4) >> 2] = value
+
+    @property
+    def offsetY(self):
+        """Character offset Y when drawing"""
+        return _heap.i32[(self._address + 8) >> 2]
+
+    @offsetY.setter
+    def offsetY(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 8) >> 2] = value
+
+    @property
+    def advanceX(self):
+        """Character advance position X"""
+        return _heap.i32[(self._address + 12) >> 2]
+
+    @advanceX.setter
+    def advanceX(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 12) >> 2] = value
+
+    @property
+    def image(self):
+        """Character image data"""
+        return Image(0, address=self._address + 16)
+
+    @image.setter
+    def image(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 16)
+
+    def __str__(self):
+        return f"GlyphInfo(address={self._address}, {self.value}, {self.offsetX}, {self.offsetY}, {self.advanceX}, {self.image})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 36)
+
+# index of the struct in StructLayouts of src/raylib_structs.h
+check_struct_layouts([
+    (GlyphInfo, 62),
+])
+
+
+def get_font_default(out: Font = None) -> Font:
+    """Get the default Font"""
+    if __debug__:
+        if out is not None:
+            _check_struct("get_font_default", "out", out, Font)
+    Font_ = _new_struct(Font) if out is None or out.__class__ is not Font else out
+    _GetFontDefault(Font_._address)
+    if out is not None and out is not Font_:
+        out._assign(Font_)  # a shadow struct
+        return out
+    return Font_
+
+
+def load_font(fileName: str, out: Font = None) -> Font:
+    """Load font from file into GPU memory (VRAM)"""
+    if __debug__:
+        _check_str("load_font", "fileName", fileName)
+        if out is not None:
+            _check_struct("load_font", "out", out, Font)
+    Font_ = _new_struct(Font) if out is None or out.__class__ is not Font else out
+    fileName_ = _scratch_arena.string(fileName)
+    _LoadFont(Font_._address, fileName_)
+    if out is not None and out is not Font_:
+        out._assign(Font_)  # a shadow struct
+        return out
+    return Font_
+
+
+def load_font_ex(fileName: str, fontSize: int, fontChars: int, glyphCount: int, out: Font = None) -> Font:
+    """Load font from file with extended parameters, use NULL for fontChars and 0 for glyphCount to load the default character set"""
+    if __debug__:
+        _check_str("load_font_ex", "fileName", fileName)
+        _check_int("load_font_ex", "fontSize", fontSize, -2147483648, 2147483647)
+        _check_int("load_font_ex", "fontChars", fontChars, 0, 4294967295)
+        _check_int("load_font_ex", "glyphCount", glyphCount, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("load_font_ex", "out", out, Font)
+    Font_ = _new_struct(Font) if out is None or out.__class__ is not Font else out
+    fileName_ = _scratch_arena.string(fileName)
+    _LoadFontEx(Font_._address, fileName_, fontSize, fontChars, glyphCount)
+    if out is not None and out is not Font_:
+        out._assign(Font_)  # a shadow struct
+        return out
+    return Font_
+
+
+def load_font_from_image(image: Image, key: Color, firstChar: int, out: Font = None) -> Font:
+    """Load font from Image (XNA style)"""
+    if __debug__:
+        _check_struct("load_font_from_image", "image", image, Image)
+        _check_struct("load_font_from_image", "key", key, Color)
+        _check_int("load_font_from_image", "firstChar", firstChar, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("load_font_from_image", "out", out, Font)
+    Font_ = _new_struct(Font) if out is None or out.__class__ is not Font or out._address in (image._address, key._address,) else out
+    _LoadFontFromImage(Font_._address, image._address, key._address, firstChar)
+    if out is not None and out is not Font_:
+        if out.__class__ is Font:
+            _memcpy(out._address, Font_._address, Font._size)
+        else:
+            out._assign(Font_)  # a shadow struct
+        return out
+    return Font_
+
+
+def load_font_from_memory(fileType: str, fileData: int, dataSize: int, fontSize: int, fontChars: int, glyphCount: int, out: Font = None) -> Font:
+    """Load font from memory buffer, fileType refers to extension: i.e. '.ttf'"""
+    if __debug__:
+        _check_str("load_font_from_memory", "fileType", fileType)
+        _check_int("load_font_from_memory", "fileData", fileData, 0, 4294967295)
+        _check_int("load_font_from_memory", "dataSize", dataSize, -2147483648, 2147483647)
+        _check_int("load_font_from_memory", "fontSize", fontSize, -2147483648, 2147483647)
+        _check_int("load_font_from_memory", "fontChars", fontChars, 0, 4294967295)
+        _check_int("load_font_from_memory", "glyphCount", glyphCount, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("load_font_from_memory", "out", out, Font)
+    Font_ = _new_struct(Font) if out is None or out.__class__ is not Font else out
+    fileType_ = _scratch_arena.string(fileType)
+    _LoadFontFromMemory(Font_._address, fileType_, fileData, dataSize, fontSize, fontChars, glyphCount)
+    if out is not None and out is not Font_:
+        out._assign(Font_)  # a shadow struct
+        return out
+    return Font_
+
+
+def is_font_ready(font: Font) -> int:
+    """Check if a font is ready"""
+    if __debug__:
+        _check_struct("is_font_ready", "font", font, Font)
+    return_interface = _IsFontReady(font._address)
+    return return_interface
+
+
+def load_font_data(fileData: int, dataSize: int, fontSize: int, fontChars: int, glyphCount: int, type: int) -> int:
+    """Load font data for further use"""
+    if __debug__:
+        _check_int("load_font_data", "fileData", fileData, 0, 4294967295)
+        _check_int("load_font_data", "dataSize", dataSize, -2147483648, 2147483647)
+        _check_int("load_font_data", "fontSize", fontSize, -2147483648, 2147483647)
+        _check_int("load_font_data", "fontChars", fontChars, 0, 4294967295)
+        _check_int("load_font_data", "glyphCount", glyphCount, -2147483648, 2147483647)
+        _check_int("load_font_data", "type", type, -2147483648, 2147483647)
+    return_interface = _LoadFontData(fileData, dataSize, fontSize, fontChars, glyphCount, type)
+    return return_interface
+
+
+def gen_image_font_atlas(chars: int, recs: int, glyphCount: int, fontSize: int, padding: int, packMethod: int, out: Image = None) -> Image:
+    """Generate image font atlas using chars info"""
+    if __debug__:
+        _check_int("gen_image_font_atlas", "chars", chars, 0, 4294967295)
+        _check_int("gen_image_font_atlas", "recs", recs, 0, 4294967295)
+        _check_int("gen_image_font_atlas", "glyphCount", glyphCount, -2147483648, 2147483647)
+        _check_int("gen_image_font_atlas", "fontSize", fontSize, -2147483648, 2147483647)
+        _check_int("gen_image_font_atlas", "padding", padding, -2147483648, 2147483647)
+        _check_int("gen_image_font_atlas", "packMethod", packMethod, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("gen_image_font_atlas", "out", out, Image)
+    Image_ = _new_struct(Image) if out is None or out.__class__ is not Image else out
+    _GenImageFontAtlas(Image_._address, chars, recs, glyphCount, fontSize, padding, packMethod)
+    if out is not None and out is not Image_:
+        out._assign(Image_)  # a shadow struct
+        return out
+    return Image_
+
+
+def unload_font_data(chars: int, glyphCount: int):
+    """Unload font chars info data (RAM)"""
+    if __debug__:
+        _check_int("unload_font_data", "chars", chars, 0, 4294967295)
+        _check_int("unload_font_data", "glyphCount", glyphCount, -2147483648, 2147483647)
+    _UnloadFontData(chars, glyphCount)
+
+
+def unload_font(font: Font):
+    """Unload font from GPU memory (VRAM)"""
+    if __debug__:
+        _check_struct("unload_font", "font", font, Font)
+    _UnloadFont(font._address)
+    _text_layouts.invalidate(font)
+
+
+def export_font_as_code(font: Font, fileName: str) -> int:
+    """Export font as code file, returns true on success"""
+    if __debug__:
+        _check_struct("export_font_as_code", "font", font, Font)
+        _check_str("export_font_as_code", "fileName", fileName)
+    fileName_ = _scratch_arena.string(fileName)
+    return_interface = _ExportFontAsCode(font._address, fileName_)
+    return return_interface
+
+
+def draw_fps(posX: int, posY: int):
+    """Draw current FPS"""
+    if __debug__:
+        _check_int("draw_fps", "posX", posX, -2147483648, 2147483647)
+        _check_int("draw_fps", "posY", posY, -2147483648, 2147483647)
+    _DrawFPS(posX, posY)
+
+
+def draw_text(text: str, posX: int, posY: int, fontSize: int, color: Color):
+    """Draw text (using default font)"""
+    if __debug__:
+        _check_str("draw_text", "text", text)
+        _check_int("draw_text", "posX", posX, -2147483648, 2147483647)
+        _check_int("draw_text", "posY", posY, -2147483648, 2147483647)
+        _check_int("draw_text", "fontSize", fontSize, -2147483648, 2147483647)
+        _check_struct("draw_text", "color", color, Color)
+    text_ = _scratch_arena.string(text)
+    _DrawText(text_, posX, posY, fontSize, color._address)
+
+
+def draw_text_ex(font: Font, text: str, position: Vector2, fontSize: float, spacing: float, tint: Color):
+    """Draw text using font and additional parameters"""
+    if __debug__:
+        _check_struct("draw_text_ex", "font", font, Font)
+        _check_str("draw_text_ex", "text", text)
+        _check_struct("draw_text_ex", "position", position, Vector2)
+        _check_float("draw_text_ex", "fontSize", fontSize)
+        _check_float("draw_text_ex", "spacing", spacing)
+        _check_struct("draw_text_ex", "tint", tint, Color)
+    text_ = _scratch_arena.string(text)
+    _DrawTextEx(font._address, text_, position._address, fontSize, spacing, tint._address)
+
+
+def draw_text_pro(font: Font, text: str, position: Vector2, origin: Vector2, rotation: float, fontSize: float, spacing: float, tint: Color):
+    """Draw text using Font and pro parameters (rotation)"""
+    if __debug__:
+        _check_struct("draw_text_pro", "font", font, Font)
+        _check_str("draw_text_pro", "text", text)
+        _check_struct("draw_text_pro", "position", position, Vector2)
+        _check_struct("draw_text_pro", "origin", origin, Vector2)
+        _check_float("draw_text_pro", "rotation", rotation)
+        _check_float("draw_text_pro", "fontSize", fontSize)
+        _check_float("draw_text_pro", "spacing", spacing)
+        _check_struct("draw_text_pro", "tint", tint, Color)
+    text_ = _scratch_arena.string(text)
+    _DrawTextPro(font._address, text_, position._address, origin._address, rotation, fontSize, spacing, tint._address)
+
+
+def draw_text_codepoint(font: Font, codepoint: int, position: Vector2, fontSize: float, tint: Color):
+    """Draw one character (codepoint)"""
+    if __debug__:
+        _check_struct("draw_text_codepoint", "font", font, Font)
+        _check_int("draw_text_codepoint", "codepoint", codepoint, -2147483648, 2147483647)
+        _check_struct("draw_text_codepoint", "position", position, Vector2)
+        _check_float("draw_text_codepoint", "fontSize", fontSize)
+        _check_struct("draw_text_codepoint", "tint", tint, Color)
+    _DrawTextCodepoint(font._address, codepoint, position._address, fontSize, tint._address)
+
+
+def draw_text_codepoints(font: Font, codepoints: int, count: int, position: Vector2, fontSize: float, spacing: float, tint: Color):
+    """Draw multiple character (codepoint)"""
+    if __debug__:
+        _check_struct("draw_text_codepoints", "font", font, Font)
+        _check_int("draw_text_codepoints", "codepoints", codepoints, 0, 4294967295)
+        _check_int("draw_text_codepoints", "count", count, -2147483648, 2147483647)
+        _check_struct("draw_text_codepoints", "position", position, Vector2)
+        _check_float("draw_text_codepoints", "fontSize", fontSize)
+        _check_float("draw_text_codepoints", "spacing", spacing)
+        _check_struct("draw_text_codepoints", "tint", tint, Color)
+    _DrawTextCodepoints(font._address, codepoints, count, position._address, fontSize, spacing, tint._address)
+
+
+def set_text_line_spacing(spacing: int):
+    """Set vertical line spacing when drawing with line-breaks"""
+    if __debug__:
+        _check_int("set_text_line_spacing", "spacing", spacing, -2147483648, 2147483647)
+    _SetTextLineSpacing(spacing)
+
+
+def measure_text(text: str, fontSize: int) -> int:
+    """Measure string width for default font"""
+    if __debug__:
+        _check_str("measure_text", "text", text)
+        _check_int("measure_text", "fontSize", fontSize, -2147483648, 2147483647)
+    text_ = _scratch_arena.string(text)
+    return_interface = _MeasureText(text_, fontSize)
+    return return_interface
+
+
+def measure_text_ex(font: Font, text: str, fontSize: float, spacing: float, out: Vector2 = None) -> Vector2:
+    """Measure string size for Font"""
+    if __debug__:
+        _check_struct("measure_text_ex", "font", font, Font)
+        _check_str("measure_text_ex", "text", text)
+        _check_float("measure_text_ex", "fontSize", fontSize)
+        _check_float("measure_text_ex", "spacing", spacing)
+        if out is not None:
+            _check_struct("measure_text_ex", "out", out, Vector2)
+    Vector2_ = _new_struct(Vector2) if out is None or out.__class__ is not Vector2 or out._address in (font._address,) else out
+    text_ = _scratch_arena.string(text)
+    _MeasureTextEx(Vector2_._address, font._address, text_, fontSize, spacing)
+    if out is not None and out is not Vector2_:
+        if out.__class__ is Vector2:
+            _memcpy(out._address, Vector2_._address, Vector2._size)
+        else:
+            out._assign(Vector2_)  # a shadow struct
+        return out
+    return Vector2_
+
+
+def get_glyph_index(font: Font, codepoint: int) -> int:
+    """Get glyph index position in font for a codepoint (unicode character), fallback to '?' if not found"""
+    if __debug__:
+        _check_struct("get_glyph_index", "font", font, Font)
+        _check_int("get_glyph_index", "codepoint", codepoint, -2147483648, 2147483647)
+    return_interface = _GetGlyphIndex(font._address, codepoint)
+    return return_interface
+
+
+def get_glyph_info(font: Font, codepoint: int, out: GlyphInfo = None) -> GlyphInfo:
+    """Get glyph font info data for a codepoint (unicode character), fallback to '?' if not found"""
+    if __debug__:
+        _check_struct("get_glyph_info", "font", font, Font)
+        _check_int("get_glyph_info", "codepoint", codepoint, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("get_glyph_info", "out", out, GlyphInfo)
+    GlyphInfo_ = _new_struct(GlyphInfo) if out is None or out.__class__ is not GlyphInfo or out._address in (font._address,) else out
+    _GetGlyphInfo(GlyphInfo_._address, font._address, codepoint)
+    if out is not None and out is not GlyphInfo_:
+        if out.__class__ is GlyphInfo:
+            _memcpy(out._address, GlyphInfo_._address, GlyphInfo._size)
+        else:
+            out._assign(GlyphInfo_)  # a shadow struct
+        return out
+    return GlyphInfo_
+
+
+def get_glyph_atlas_rec(font: Font, codepoint: int, out: Rectangle = None) -> Rectangle:
+    """Get glyph rectangle in font atlas for a codepoint (unicode character), fallback to '?' if not found"""
+    if __debug__:
+        _check_struct("get_glyph_atlas_rec", "font", font, Font)
+        _check_int("get_glyph_atlas_rec", "codepoint", codepoint, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("get_glyph_atlas_rec", "out", out, Rectangle)
+    Rectangle_ = _new_struct(Rectangle) if out is None or out.__class__ is not Rectangle or out._address in (font._address,) else out
+    _GetGlyphAtlasRec(Rectangle_._address, font._address, codepoint)
+    if out is not None and out is not Rectangle_:
+        if out.__class__ is Rectangle:
+            _memcpy(out._address, Rectangle_._address, Rectangle._size)
+        else:
+            out._assign(Rectangle_)  # a shadow struct
+        return out
+    return Rectangle_
+
+
+def load_utf8(codepoints: int, length: int) -> int:
+    """Load UTF-8 text encoded from codepoints array"""
+    if __debug__:
+        _check_int("load_utf8", "codepoints", codepoints, 0, 4294967295)
+        _check_int("load_utf8", "length", length, -2147483648, 2147483647)
+    return_interface = _LoadUTF8(codepoints, length)
+    return return_interface
+
+
+def unload_utf8(text: int):
+    """Unload UTF-8 text encoded from codepoints array"""
+    if __debug__:
+        _check_int("unload_utf8", "text", text, 0, 4294967295)
+    _UnloadUTF8(text)
+
+
+def load_codepoints(text: str, count: int) -> int:
+    """Load all codepoints from a UTF-8 text string, codepoints count returned by parameter"""
+    if __debug__:
+        _check_str("load_codepoints", "text", text)
+        _check_int("load_codepoints", "count", count, 0, 4294967295)
+    text_ = _scratch_arena.string(text)
+    return_interface = _LoadCodepoints(text_, count)
+    return return_interface
+
+
+def unload_codepoints(codepoints: int):
+    """Unload codepoints data from memory"""
+    if __debug__:
+        _check_int("unload_codepoints", "codepoints", codepoints, 0, 4294967295)
+    _UnloadCodepoints(codepoints)
+
+
+def get_codepoint_count(text: str) -> int:
+    """Get total number of codepoints in a UTF-8 encoded string"""
+    if __debug__:
+        _check_str("get_codepoint_count", "text", text)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GetCodepointCount(text_)
+    return return_interface
+
+
+def get_codepoint(text: str, codepointSize: int) -> int:
+    """Get next codepoint in a UTF-8 encoded string, 0x3f('?') is returned on failure"""
+    if __debug__:
+        _check_str("get_codepoint", "text", text)
+        _check_int("get_codepoint", "codepointSize", codepointSize, 0, 4294967295)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GetCodepoint(text_, codepointSize)
+    return return_interface
+
+
+def get_codepoint_next(text: str, codepointSize: int) -> int:
+    """Get next codepoint in a UTF-8 encoded string, 0x3f('?') is returned on failure"""
+    if __debug__:
+        _check_str("get_codepoint_next", "text", text)
+        _check_int("get_codepoint_next", "codepointSize", codepointSize, 0, 4294967295)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GetCodepointNext(text_, codepointSize)
+    return return_interface
+
+
+def get_codepoint_previous(text: str, codepointSize: int) -> int:
+    """Get previous codepoint in a UTF-8 encoded string, 0x3f('?') is returned on failure"""
+    if __debug__:
+        _check_str("get_codepoint_previous", "text", text)
+        _check_int("get_codepoint_previous", "codepointSize", codepointSize, 0, 4294967295)
+    text_ = _scratch_arena.string(text)
+    return_interface = _GetCodepointPrevious(text_, codepointSize)
+    return return_interface
+
+
+def codepoint_to_utf8(codepoint: int, utf8Size: int) -> int:
+    """Encode one codepoint into UTF-8 byte array (array length returned as parameter)"""
+    if __debug__:
+        _check_int("codepoint_to_utf8", "codepoint", codepoint, -2147483648, 2147483647)
+        _check_int("codepoint_to_utf8", "utf8Size", utf8Size, 0, 4294967295)
+    return_interface = _CodepointToUTF8(codepoint, utf8Size)
+    return return_interface
+
+
+def text_copy(dst: int, src: str) -> int:
+    """Copy one string to another, returns bytes copied"""
+    if __debug__:
+        _check_int("text_copy", "dst", dst, 0, 4294967295)
+        _check_str("text_copy", "src", src)
+    src_ = _scratch_arena.string(src)
+    return_interface = _TextCopy(dst, src_)
+    return return_interface
+
+
+def text_is_equal(text1: str, text2: str) -> int:
+    """Check if two text string are equal"""
+    if __debug__:
+        _check_str("text_is_equal", "text1", text1)
+        _check_str("text_is_equal", "text2", text2)
+    text1_ = _scratch_arena.string(text1)
+    text2_ = _scratch_arena.string(text2)
+    return_interface = _TextIsEqual(text1_, text2_)
+    return return_interface
+
+
+def text_length(text: str) -> int:
+    """Get text length, checks for '\0' ending"""
+    if __debug__:
+        _check_str("text_length", "text", text)
+    text_ = _scratch_arena.string(text)
+    return_interface = _TextLength(text_)
+    return return_interface
+
+
+def text_subtext(text: str, position: int, length: int) -> int:
+    """Get a piece of a text string"""
+    if __debug__:
+        _check_str("text_subtext", "text", text)
+        _check_int("text_subtext", "position", position, -2147483648, 2147483647)
+        _check_int("text_subtext", "length", length, -2147483648, 2147483647)
+    text_ = _scratch_arena.string(text)
+    return_interface = _TextSubtext(text_, position, length)
+    return return_interface
+
+
+def text_replace(text: int, replace: str, by: str) -> int:
+    """Replace text string (WARNING: memory must be freed!)"""
+    if __debug__:
+        _check_int("text_replace", "text", text, 0, 4294967295)
+        _check_str("text_replace", "replace", replace)
+        _check_str("text_replace", "by", by)
+    replace_ = _scratch_arena.string(replace)
+    by_ = _scratch_arena.string(by)
+    return_interface = _TextReplace(text, replace_, by_)
+    return return_interface
+
+
+def text_insert(text: str, insert: str, position: int) -> int:
+    """Insert text in a position (WARNING: memory must be freed!)"""
+    if __debug__:
+        _check_str("text_insert", "text", text)
+        _check_str("text_insert", "insert", insert)
+        _check_int("text_insert", "position", position, -2147483648, 2147483647)
+    text_ = _scratch_arena.string(text)
+    insert_ = _scratch_arena.string(insert)
+    return_interface = _TextInsert(text_, insert_, position)
+    return return_interface
+
+
+def text_join(textList: int, count: int, delimiter: str) -> int:
+    """Join text strings with delimiter"""
+    if __debug__:
+        _check_int("text_join", "textList", textList, 0, 4294967295)
+        _check_int("text_join", "count", count, -2147483648, 2147483647)
+        _check_str("text_join", "delimiter", delimiter)
+    delimiter_ = _scratch_arena.string(delimiter)
+    return_interface = _TextJoin(textList, count, delimiter_)
+    return return_interface
+
+
+def text_split(text: str, delimiter: int, count: int) -> int:
+    """Split text into multiple strings"""
+    if __debug__:
+        _check_str("text_split", "text", text)
+        _check_int("text_split", "delimiter", delimiter, -128, 127)
+        _check_int("text_split", "count", count, 0, 4294967295)
+    text_ = _scratch_arena.string(text)
+    return_interface = _TextSplit(text_, delimiter, count)
+    return return_interface
+
+
+def text_append(text: int, append: str, position: int):
+    """Append text at specific position and move cursor!"""
+    if __debug__:
+        _check_int("text_append", "text", text, 0, 4294967295)
+        _check_str("text_append", "append", append)
+        _check_int("text_append", "position", position, 0, 4294967295)
+    append_ = _scratch_arena.string(append)
+    _TextAppend(text, append_, position)
+
+
+def text_find_index(text: str, find: str) -> int:
+    """Find first text occurrence within a string"""
+    if __debug__:
+        _check_str("text_find_index", "text", text)
+        _check_str("text_find_index", "find", find)
+    text_ = _scratch_arena.string(text)
+    find_ = _scratch_arena.string(find)
+    return_interface = _TextFindIndex(text_, find_)
+    return return_interface
+
+
+def text_to_upper(text: str) -> int:
+    """Get upper case version of provided string"""
+    if __debug__:
+        _check_str("text_to_upper", "text", text)
+    text_ = _scratch_arena.string(text)
+    return_interface = _TextToUpper(text_)
+    return return_interface
+
+
+def text_to_lower(text: str) -> int:
+    """Get lower case version of provided string"""
+    if __debug__:
+        _check_str("text_to_lower", "text", text)
+    text_ = _scratch_arena.string(text)
+    return_interface = _TextToLower(text_)
+    return return_interface
+
+
+def text_to_pascal(text: str) -> int:
+    """Get Pascal case notation version of provided string"""
+    if __debug__:
+        _check_str("text_to_pascal", "text", text)
+    text_ = _scratch_arena.string(text)
+    return_interface = _TextToPascal(text_)
+    return return_interface
+
+
+def text_to_integer(text: str) -> int:
+    """Get integer value from text (negative values not supported)"""
+    if __debug__:
+        _check_str("text_to_integer", "text", text)
+    text_ = _scratch_arena.string(text)
+    return_interface = _TextToInteger(text_)
+    return return_interface
+
+
+# the wasm exports called above, fetched once instead of looked up at every call, they are bound
+# again when another context is activated or profiling starts
+_wasm_functions_names = [
+    "_GetFontDefault",
+    "_LoadFont",
+    "_LoadFontEx",
+    "_LoadFontFromImage",
+    "_memcpy",
+    "_LoadFontFromMemory",
+    "_IsFontReady",
+    "_LoadFontData",
+    "_GenImageFontAtlas",
+    "_UnloadFontData",
+    "_UnloadFont",
+    "_ExportFontAsCode",
+    "_DrawFPS",
+    "_DrawText",
+    "_DrawTextEx",
+    "_DrawTextPro",
+    "_DrawTextCodepoint",
+    "_DrawTextCodepoints",
+    "_SetTextLineSpacing",
+    "_MeasureText",
+    "_MeasureTextEx",
+    "_GetGlyphIndex",
+    "_GetGlyphInfo",
+    "_GetGlyphAtlasRec",
+    "_LoadUTF8",
+    "_UnloadUTF8",
+    "_LoadCodepoints",
+    "_UnloadCodepoints",
+    "_GetCodepointCount",
+    "_GetCodepoint",
+    "_GetCodepointNext",
+    "_GetCodepointPrevious",
+    "_CodepointToUTF8",
+    "_TextCopy",
+    "_TextIsEqual",
+    "_TextLength",
+    "_TextSubtext",
+    "_TextReplace",
+    "_TextInsert",
+    "_TextJoin",
+    "_TextSplit",
+    "_TextAppend",
+    "_TextFindIndex",
+    "_TextToUpper",
+    "_TextToLower",
+    "_TextToPascal",
+    "_TextToInteger",
+]
+_bind_wasm_functions(globals())
+
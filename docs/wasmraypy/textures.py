@@ -0,0 +1,1946 @@
+# Generated by tools/code_generation/filesGeneration.py, do not edit by hand
+# raylib.h, the functions of rtextures
+import struct
+from .core import (
+    _mod,
+    struct_clone,
+    _heap,
+    _scratch_arena,
+    _struct_pool,
+    _new_struct,
+    _import_numpy,
+    WasmArray,
+    PixelArray,
+    Vector2,
+    Vector2Shadow,
+    Vector3,
+    Vector4,
+    Color,
+    Rectangle,
+    RectangleShadow,
+    Image,
+    Texture,
+    Texture2D,
+    TextureCubemap,
+    RenderTexture2D,
+    Font,
+    Camera2D,
+    check_struct_layouts,
+    WHITE,
+    BLANK,
+    _command_buffer,
+    _check_int,
+    _check_float,
+    _check_str,
+    _check_struct,
+    _cached_layers,
+    _active_context,
+    _is_wasm_function_exported,
+    _bind_wasm_functions,
+    get_screen_width,
+    get_screen_height,
+    clear_background,
+    begin_mode_2d,
+    end_mode_2d,
+    begin_texture_mode,
+    end_texture_mode,
+)
+
+
+class NPatchInfo:
+    """NPatchInfo, n-patch layout info"""
+
+    __slots__ = ("_frozen", "_address", "_to_free")
+
+    _size: int = 36
+    _dtype_spec: dict = {"names": ["source", "left", "top", "right", "bottom", "layout"], "formats": [Rectangle._dtype_spec, "<i4", "<i4", "<i4", "<i4", "<i4"], "offsets": [0, 16, 20, 24, 28, 32], "itemsize": 36}
+
+    def __init__(self, source: Rectangle = None, left: int = 0, top: int = 0, right: int = 0, bottom: int = 0, layout: int = 0, address: int = 0, frozen: bool = False):
+        self._frozen = frozen
+        if address != 0:
+            self._address = address
+            self._to_free = False
+        else:
+            self._address = _struct_pool.alloc(36)
+            self._to_free = _struct_pool
+            if source is not None:
+                struct_clone(source, self._address + 0)
+            else:
+                _heap.u8.fill(0, self._address + 0, self._address + 16)
+            _heap.i32[(self._address + 16) >> 2] = left
+            _heap.i32[(self._address + 20) >> 2] = top
+            _heap.i32[(self._address + 24) >> 2] = right
+            _heap.i32[(self._address + 28) >> 2] = bottom
+            _heap.i32[(self._address + 32) >> 2] = layout
+
+    @property
+    def source(self):
+        """Texture source rectangle"""
+        return Rectangle(0, address=self._address + 0)
+
+    @source.setter
+    def source(self, value):
+        if not self._frozen:
+            struct_clone(value, self._address + 0)
+
+    @property
+    def left(self):
+        """Left border offset"""
+        return _heap.i32[(self._address + 16) >> 2]
+
+    @left.setter
+    def left(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 16) >> 2] = value
+
+    @property
+    def top(self):
+        """Top border offset"""
+        return _heap.i32[(self._address + 20) >> 2]
+
+    @top.setter
+    def top(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 20) >> 2] = value
+
+    @property
+    def right(self):
+        """Right border offset"""
+        return _heap.i32[(self._address + 24) >> 2]
+
+    @right.setter
+    def right(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 24) >> 2] = value
+
+    @property
+    def bottom(self):
+        """Bottom border offset"""
+        return _heap.i32[(self._address + 28) >> 2]
+
+    @bottom.setter
+    def bottom(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 28) >> 2] = value
+
+    @property
+    def layout(self):
+        """Layout of the n-patch: 3x3, 1x3 or 3x1"""
+        return _heap.i32[(self._address + 32) >> 2]
+
+    @layout.setter
+    def layout(self, value):
+        if not self._frozen:
+            _heap.i32[(self._address + 32) >> 2] = value
+
+    def __str__(self):
+        return f"NPatchInfo(address={self._address}, {self.source}, {self.left}, {self.top}, {self.right}, {self.bottom}, {self.layout})"
+
+    def __del__(self):
+        if self._to_free:
+            self._to_free.release(self._address, 36)
+
+# index of the struct in StructLayouts of src/raylib_structs.h
+check_struct_layouts([
+    (NPatchInfo, 55),
+])
+
+
+def load_image(fileName: str, out: Image = None) -> Image:
+    """Load image from file into CPU memory (RAM)"""
+    if __debug__:
+        _check_str("load_image", "fileName", fileName)
+        if out is not None:
+            _check_struct("load_image", "out", out, Image)
+    Image_ = _new_struct(Image) if out is None or out.__class__ is not Image else out
+    fileName_ = _scratch_arena.string(fileName)
+    _LoadImage(Image_._address, fileName_)
+    if out is not None and out is not Image_:
+        out._assign(Image_)  # a shadow struct
+        return out
+    return Image_
+
+
+def load_image_raw(fileName: str, width: int, height: int, format: int, headerSize: int, out: Image = None) -> Image:
+    """Load image from RAW file data"""
+    if __debug__:
+        _check_str("load_image_raw", "fileName", fileName)
+        _check_int("load_image_raw", "width", width, -2147483648, 2147483647)
+        _check_int("load_image_raw", "height", height, -2147483648, 2147483647)
+        _check_int("load_image_raw", "format", format, -2147483648, 2147483647)
+        _check_int("load_image_raw", "headerSize", headerSize, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("load_image_raw", "out", out, Image)
+    Image_ = _new_struct(Image) if out is None or out.__class__ is not Image else out
+    fileName_ = _scratch_arena.string(fileName)
+    _LoadImageRaw(Image_._address, fileName_, width, height, format, headerSize)
+    if out is not None and out is not Image_:
+        out._assign(Image_)  # a shadow struct
+        return out
+    return Image_
+
+
+def load_image_anim(fileName: str, frames: int, out: Image = None) -> Image:
+    """Load image sequence from file (frames appended to image.data)"""
+    if __debug__:
+        _check_str("load_image_anim", "fileName", fileName)
+        _check_int("load_image_anim", "frames", frames, 0, 4294967295)
+        if out is not None:
+            _check_struct("load_image_anim", "out", out, Image)
+    Image_ = _new_struct(Image) if out is None or out.__class__ is not Image else out
+    fileName_ = _scratch_arena.string(fileName)
+    _LoadImageAnim(Image_._address, fileName_, frames)
+    if out is not None and out is not Image_:
+        out._assign(Image_)  # a shadow struct
+        return out
+    return Image_
+
+
+def load_image_from_memory(fileType: str, fileData: int, dataSize: int, out: Image = None) -> Image:
+    """Load image from memory buffer, fileType refers to extension: i.e. '.png'"""
+    if __debug__:
+        _check_str("load_image_from_memory", "fileType", fileType)
+        _check_int("load_image_from_memory", "fileData", fileData, 0, 4294967295)
+        _check_int("load_image_from_memory", "dataSize", dataSize, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("load_image_from_memory", "out", out, Image)
+    Image_ = _new_struct(Image) if out is None or out.__class__ is not Image else out
+    fileType_ = _scratch_arena.string(fileType)
+    _LoadImageFromMemory(Image_._address, fileType_, fileData, dataSize)
+    if out is not None and out is not Image_:
+        out._assign(Image_)  # a shadow struct
+        return out
+    return Image_
+
+
+def load_image_from_texture(texture: Texture2D, out: Image = None) -> Image:
+    """Load image from GPU texture data"""
+    if __debug__:
+        _check_struct("load_image_from_texture", "texture", texture, Texture2D)
+        if out is not None:
+            _check_struct("load_image_from_texture", "out", out, Image)
+    Image_ = _new_struct(Image) if out is None or out.__class__ is not Image or out._address in (texture._address,) else out
+    _LoadImageFromTexture(Image_._address, texture._address)
+    if out is not None and out is not Image_:
+        if out.__class__ is Image:
+            _memcpy(out._address, Image_._address, Image._size)
+        else:
+            out._assign(Image_)  # a shadow struct
+        return out
+    return Image_
+
+
+def load_image_from_screen(out: Image = None) -> Image:
+    """Load image from screen buffer and (screenshot)"""
+    if __debug__:
+        if out is not None:
+            _check_struct("load_image_from_screen", "out", out, Image)
+    Image_ = _new_struct(Image) if out is None or out.__class__ is not Image else out
+    _LoadImageFromScreen(Image_._address)
+    if out is not None and out is not Image_:
+        out._assign(Image_)  # a shadow struct
+        return out
+    return Image_
+
+
+def is_image_ready(image: Image) -> int:
+    """Check if an image is ready"""
+    if __debug__:
+        _check_struct("is_image_ready", "image", image, Image)
+    return_interface = _IsImageReady(image._address)
+    return return_interface
+
+
+def unload_image(image: Image):
+    """Unload image from CPU memory (RAM)"""
+    if __debug__:
+        _check_struct("unload_image", "image", image, Image)
+    _UnloadImage(image._address)
+
+
+def export_image(image: Image, fileName: str) -> int:
+    """Export image data to file, returns true on success"""
+    if __debug__:
+        _check_struct("export_image", "image", image, Image)
+        _check_str("export_image", "fileName", fileName)
+    fileName_ = _scratch_arena.string(fileName)
+    return_interface = _ExportImage(image._address, fileName_)
+    return return_interface
+
+
+def export_image_to_memory(image: Image, fileType: str, fileSize: int) -> int:
+    """Export image to memory buffer"""
+    if __debug__:
+        _check_struct("export_image_to_memory", "image", image, Image)
+        _check_str("export_image_to_memory", "fileType", fileType)
+        _check_int("export_image_to_memory", "fileSize", fileSize, 0, 4294967295)
+    fileType_ = _scratch_arena.string(fileType)
+    return_interface = _ExportImageToMemory(image._address, fileType_, fileSize)
+    return return_interface
+
+
+def export_image_as_code(image: Image, fileName: str) -> int:
+    """Export image as code file defining an array of bytes, returns true on success"""
+    if __debug__:
+        _check_struct("export_image_as_code", "image", image, Image)
+        _check_str("export_image_as_code", "fileName", fileName)
+    fileName_ = _scratch_arena.string(fileName)
+    return_interface = _ExportImageAsCode(image._address, fileName_)
+    return return_interface
+
+
+def gen_image_color(width: int, height: int, color: Color, out: Image = None) -> Image:
+    """Generate image: plain color"""
+    if __debug__:
+        _check_int("gen_image_color", "width", width, -2147483648, 2147483647)
+        _check_int("gen_image_color", "height", height, -2147483648, 2147483647)
+        _check_struct("gen_image_color", "color", color, Color)
+        if out is not None:
+            _check_struct("gen_image_color", "out", out, Image)
+    Image_ = _new_struct(Image) if out is None or out.__class__ is not Image or out._address in (color._address,) else out
+    _GenImageColor(Image_._address, width, height, color._address)
+    if out is not None and out is not Image_:
+        if out.__class__ is Image:
+            _memcpy(out._address, Image_._address, Image._size)
+        else:
+            out._assign(Image_)  # a shadow struct
+        return out
+    return Image_
+
+
+def gen_image_gradient_linear(width: int, height: int, direction: int, start: Color, end: Color, out: Image = None) -> Image:
+    """Generate image: linear gradient, direction in degrees [0..360], 0=Vertical gradient"""
+    if __debug__:
+        _check_int("gen_image_gradient_linear", "width", width, -2147483648, 2147483647)
+        _check_int("gen_image_gradient_linear", "height", height, -2147483648, 2147483647)
+        _check_int("gen_image_gradient_linear", "direction", direction, -2147483648, 2147483647)
+        _check_struct("gen_image_gradient_linear", "start", start, Color)
+        _check_struct("gen_image_gradient_linear", "end", end, Color)
+        if out is not None:
+            _check_struct("gen_image_gradient_linear", "out", out, Image)
+    Image_ = _new_struct(Image) if out is None or out.__class__ is not Image or out._address in (start._address, end._address,) else out
+    _GenImageGradientLinear(Image_._address, width, height, direction, start._address, end._address)
+    if out is not None and out is not Image_:
+        if out.__class__ is Image:
+            _memcpy(out._address, Image_._address, Image._size)
+        else:
+            out._assign(Image_)  # a shadow struct
+        return out
+    return Image_
+
+
+def gen_image_gradient_radial(width: int, height: int, density: float, inner: Color, outer: Color, out: Image = None) -> Image:
+    """Generate image: radial gradient"""
+    if __debug__:
+        _check_int("gen_image_gradient_radial", "width", width, -2147483648, 2147483647)
+        _check_int("gen_image_gradient_radial", "height", height, -2147483648, 2147483647)
+        _check_float("gen_image_gradient_radial", "density", density)
+        _check_struct("gen_image_gradient_radial", "inner", inner, Color)
+        _check_struct("gen_image_gradient_radial", "outer", outer, Color)
+        if out is not None:
+            _check_struct("gen_image_gradient_radial", "out", out, Image)
+    Image_ = _new_struct(Image) if out is None or out.__class__ is not Image or out._address in (inner._address, outer._address,) else out
+    _GenImageGradientRadial(Image_._address, width, height, density, inner._address, outer._address)
+    if out is not None and out is not Image_:
+        if out.__class__ is Image:
+            _memcpy(out._address, Image_._address, Image._size)
+        else:
+            out._assign(Image_)  # a shadow struct
+        return out
+    return Image_
+
+
+def gen_image_gradient_square(width: int, height: int, density: float, inner: Color, outer: Color, out: Image = None) -> Image:
+    """Generate image: square gradient"""
+    if __debug__:
+        _check_int("gen_image_gradient_square", "width", width, -2147483648, 2147483647)
+        _check_int("gen_image_gradient_square", "height", height, -2147483648, 2147483647)
+        _check_float("gen_image_gradient_square", "density", density)
+        _check_struct("gen_image_gradient_square", "inner", inner, Color)
+        _check_struct("gen_image_gradient_square", "outer", outer, Color)
+        if out is not None:
+            _check_struct("gen_image_gradient_square", "out", out, Image)
+    Image_ = _new_struct(Image) if out is None or out.__class__ is not Image or out._address in (inner._address, outer._address,) else out
+    _GenImageGradientSquare(Image_._address, width, height, density, inner._address, outer._address)
+    if out is not None and out is not Image_:
+        if out.__class__ is Image:
+            _memcpy(out._address, Image_._address, Image._size)
+        else:
+            out._assign(Image_)  # a shadow struct
+        return out
+    return Image_
+
+
+def gen_image_checked(width: int, height: int, checksX: int, checksY: int, col1: Color, col2: Color, out: Image = None) -> Image:
+    """Generate image: checked"""
+    if __debug__:
+        _check_int("gen_image_checked", "width", width, -2147483648, 2147483647)
+        _check_int("gen_image_checked", "height", height, -2147483648, 2147483647)
+        _check_int("gen_image_checked", "checksX", checksX, -2147483648, 2147483647)
+        _check_int("gen_image_checked", "checksY", checksY, -2147483648, 2147483647)
+        _check_struct("gen_image_checked", "col1", col1, Color)
+        _check_struct("gen_image_checked", "col2", col2, Color)
+        if out is not None:
+            _check_struct("gen_image_checked", "out", out, Image)
+    Image_ = _new_struct(Image) if out is None or out.__class__ is not Image or out._address in (col1._address, col2._address,) else out
+    _GenImageChecked(Image_._address, width, height, checksX, checksY, col1._address, col2._address)
+    if out is not None and out is not Image_:
+        if out.__class__ is Image:
+            _memcpy(out._address, Image_._address, Image._size)
+        else:
+            out._assign(Image_)  # a shadow struct
+        return out
+    return Image_
+
+
+def gen_image_white_noise(width: int, height: int, factor: float, out: Image = None) -> Image:
+    """Generate image: white noise"""
+    if __debug__:
+        _check_int("gen_image_white_noise", "width", width, -2147483648, 2147483647)
+        _check_int("gen_image_white_noise", "height", height, -2147483648, 2147483647)
+        _check_float("gen_image_white_noise", "factor", factor)
+        if out is not None:
+            _check_struct("gen_image_white_noise", "out", out, Image)
+    Image_ = _new_struct(Image) if out is None or out.__class__ is not Image else out
+    _GenImageWhiteNoise(Image_._address, width, height, factor)
+    if out is not None and out is not Image_:
+        out._assign(Image_)  # a shadow struct
+        return out
+    return Image_
+
+
+def gen_image_perlin_noise(width: int, height: int, offsetX: int, offsetY: int, scale: float, out: Image = None) -> Image:
+    """Generate image: perlin noise"""
+    if __debug__:
+        _check_int("gen_image_perlin_noise", "width", width, -2147483648, 2147483647)
+        _check_int("gen_image_perlin_noise", "height", height, -2147483648, 2147483647)
+        _check_int("gen_image_perlin_noise", "offsetX", offsetX, -2147483648, 2147483647)
+        _check_int("gen_image_perlin_noise", "offsetY", offsetY, -2147483648, 2147483647)
+        _check_float("gen_image_perlin_noise", "scale", scale)
+        if out is not None:
+            _check_struct("gen_image_perlin_noise", "out", out, Image)
+    Image_ = _new_struct(Image) if out is None or out.__class__ is not Image else out
+    _GenImagePerlinNoise(Image_._address, width, height, offsetX, offsetY, scale)
+    if out is not None and out is not Image_:
+        out._assign(Image_)  # a shadow struct
+        return out
+    return Image_
+
+
+def gen_image_cellular(width: int, height: int, tileSize: int, out: Image = None) -> Image:
+    """Generate image: cellular algorithm, bigger tileSize means bigger cells"""
+    if __debug__:
+        _check_int("gen_image_cellular", "width", width, -2147483648, 2147483647)
+        _check_int("gen_image_cellular", "height", height, -2147483648, 2147483647)
+        _check_int("gen_image_cellular", "tileSize", tileSize, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("gen_image_cellular", "out", out, Image)
+    Image_ = _new_struct(Image) if out is None or out.__class__ is not Image else out
+    _GenImageCellular(Image_._address, width, height, tileSize)
+    if out is not None and out is not Image_:
+        out._assign(Image_)  # a shadow struct
+        return out
+    return Image_
+
+
+def gen_image_text(width: int, height: int, text: str, out: Image = None) -> Image:
+    """Generate image: grayscale image from text data"""
+    if __debug__:
+        _check_int("gen_image_text", "width", width, -2147483648, 2147483647)
+        _check_int("gen_image_text", "height", height, -2147483648, 2147483647)
+        _check_str("gen_image_text", "text", text)
+        if out is not None:
+            _check_struct("gen_image_text", "out", out, Image)
+    Image_ = _new_struct(Image) if out is None or out.__class__ is not Image else out
+    text_ = _scratch_arena.string(text)
+    _GenImageText(Image_._address, width, height, text_)
+    if out is not None and out is not Image_:
+        out._assign(Image_)  # a shadow struct
+        return out
+    return Image_
+
+
+def image_copy(image: Image, out: Image = None) -> Image:
+    """Create an image duplicate (useful for transformations)"""
+    if __debug__:
+        _check_struct("image_copy", "image", image, Image)
+        if out is not None:
+            _check_struct("image_copy", "out", out, Image)
+    Image_ = _new_struct(Image) if out is None or out.__class__ is not Image or out._address in (image._address,) else out
+    _ImageCopy(Image_._address, image._address)
+    if out is not None and out is not Image_:
+        if out.__class__ is Image:
+            _memcpy(out._address, Image_._address, Image._size)
+        else:
+            out._assign(Image_)  # a shadow struct
+        return out
+    return Image_
+
+
+def image_from_image(image: Image, rec: Rectangle, out: Image = None) -> Image:
+    """Create an image from another image piece"""
+    if __debug__:
+        _check_struct("image_from_image", "image", image, Image)
+        _check_struct("image_from_image", "rec", rec, Rectangle)
+        if out is not None:
+            _check_struct("image_from_image", "out", out, Image)
+    Image_ = _new_struct(Image) if out is None or out.__class__ is not Image or out._address in (image._address, rec._address,) else out
+    _ImageFromImage(Image_._address, image._address, rec._address)
+    if out is not None and out is not Image_:
+        if out.__class__ is Image:
+            _memcpy(out._address, Image_._address, Image._size)
+        else:
+            out._assign(Image_)  # a shadow struct
+        return out
+    return Image_
+
+
+def image_text(text: str, fontSize: int, color: Color, out: Image = None) -> Image:
+    """Create an image from text (default font)"""
+    if __debug__:
+        _check_str("image_text", "text", text)
+        _check_int("image_text", "fontSize", fontSize, -2147483648, 2147483647)
+        _check_struct("image_text", "color", color, Color)
+        if out is not None:
+            _check_struct("image_text", "out", out, Image)
+    Image_ = _new_struct(Image) if out is None or out.__class__ is not Image or out._address in (color._address,) else out
+    text_ = _scratch_arena.string(text)
+    _ImageText(Image_._address, text_, fontSize, color._address)
+    if out is not None and out is not Image_:
+        if out.__class__ is Image:
+            _memcpy(out._address, Image_._address, Image._size)
+        else:
+            out._assign(Image_)  # a shadow struct
+        return out
+    return Image_
+
+
+def image_text_ex(font: Font, text: str, fontSize: float, spacing: float, tint: Color, out: Image = None) -> Image:
+    """Create an image from text (custom sprite font)"""
+    if __debug__:
+        _check_struct("image_text_ex", "font", font, Font)
+        _check_str("image_text_ex", "text", text)
+        _check_float("image_text_ex", "fontSize", fontSize)
+        _check_float("image_text_ex", "spacing", spacing)
+        _check_struct("image_text_ex", "tint", tint, Color)
+        if out is not None:
+            _check_struct("image_text_ex", "out", out, Image)
+    Image_ = _new_struct(Image) if out is None or out.__class__ is not Image or out._address in (font._address, tint._address,) else out
+    text_ = _scratch_arena.string(text)
+    _ImageTextEx(Image_._address, font._address, text_, fontSize, spacing, tint._address)
+    if out is not None and out is not Image_:
+        if out.__class__ is Image:
+            _memcpy(out._address, Image_._address, Image._size)
+        else:
+            out._assign(Image_)  # a shadow struct
+        return out
+    return Image_
+
+
+def image_format(image: int, newFormat: int):
+    """Convert image data to desired format"""
+    if __debug__:
+        _check_int("image_format", "image", image, 0, 4294967295)
+        _check_int("image_format", "newFormat", newFormat, -2147483648, 2147483647)
+    _ImageFormat(image, newFormat)
+
+
+def image_to_pot(image: int, fill: Color):
+    """Convert image to POT (power-of-two)"""
+    if __debug__:
+        _check_int("image_to_pot", "image", image, 0, 4294967295)
+        _check_struct("image_to_pot", "fill", fill, Color)
+    _ImageToPOT(image, fill._address)
+
+
+def image_crop(image: int, crop: Rectangle):
+    """Crop an image to a defined rectangle"""
+    if __debug__:
+        _check_int("image_crop", "image", image, 0, 4294967295)
+        _check_struct("image_crop", "crop", crop, Rectangle)
+    _ImageCrop(image, crop._address)
+
+
+def image_alpha_crop(image: int, threshold: float):
+    """Crop image depending on alpha value"""
+    if __debug__:
+        _check_int("image_alpha_crop", "image", image, 0, 4294967295)
+        _check_float("image_alpha_crop", "threshold", threshold)
+    _ImageAlphaCrop(image, threshold)
+
+
+def image_alpha_clear(image: int, color: Color, threshold: float):
+    """Clear alpha channel to desired color"""
+    if __debug__:
+        _check_int("image_alpha_clear", "image", image, 0, 4294967295)
+        _check_struct("image_alpha_clear", "color", color, Color)
+        _check_float("image_alpha_clear", "threshold", threshold)
+    _ImageAlphaClear(image, color._address, threshold)
+
+
+def image_alpha_mask(image: int, alphaMask: Image):
+    """Apply alpha mask to image"""
+    if __debug__:
+        _check_int("image_alpha_mask", "image", image, 0, 4294967295)
+        _check_struct("image_alpha_mask", "alphaMask", alphaMask, Image)
+    _ImageAlphaMask(image, alphaMask._address)
+
+
+def image_alpha_premultiply(image: int):
+    """Premultiply alpha channel"""
+    if __debug__:
+        _check_int("image_alpha_premultiply", "image", image, 0, 4294967295)
+    _ImageAlphaPremultiply(image)
+
+
+def image_blur_gaussian(image: int, blurSize: int):
+    """Apply Gaussian blur using a box blur approximation"""
+    if __debug__:
+        _check_int("image_blur_gaussian", "image", image, 0, 4294967295)
+        _check_int("image_blur_gaussian", "blurSize", blurSize, -2147483648, 2147483647)
+    _ImageBlurGaussian(image, blurSize)
+
+
+def image_resize(image: int, newWidth: int, newHeight: int):
+    """Resize image (Bicubic scaling algorithm)"""
+    if __debug__:
+        _check_int("image_resize", "image", image, 0, 4294967295)
+        _check_int("image_resize", "newWidth", newWidth, -2147483648, 2147483647)
+        _check_int("image_resize", "newHeight", newHeight, -2147483648, 2147483647)
+    _ImageResize(image, newWidth, newHeight)
+
+
+def image_resize_nn(image: int, newWidth: int, newHeight: int):
+    """Resize image (Nearest-Neighbor scaling algorithm)"""
+    if __debug__:
+        _check_int("image_resize_nn", "image", image, 0, 4294967295)
+        _check_int("image_resize_nn", "newWidth", newWidth, -2147483648, 2147483647)
+        _check_int("image_resize_nn", "newHeight", newHeight, -2147483648, 2147483647)
+    _ImageResizeNN(image, newWidth, newHeight)
+
+
+def image_resize_canvas(image: int, newWidth: int, newHeight: int, offsetX: int, offsetY: int, fill: Color):
+    """Resize canvas and fill with color"""
+    if __debug__:
+        _check_int("image_resize_canvas", "image", image, 0, 4294967295)
+        _check_int("image_resize_canvas", "newWidth", newWidth, -2147483648, 2147483647)
+        _check_int("image_resize_canvas", "newHeight", newHeight, -2147483648, 2147483647)
+        _check_int("image_resize_canvas", "offsetX", offsetX, -2147483648, 2147483647)
+        _check_int("image_resize_canvas", "offsetY", offsetY, -2147483648, 2147483647)
+        _check_struct("image_resize_canvas", "fill", fill, Color)
+    _ImageResizeCanvas(image, newWidth, newHeight, offsetX, offsetY, fill._address)
+
+
+def image_mipmaps(image: int):
+    """Compute all mipmap levels for a provided image"""
+    if __debug__:
+        _check_int("image_mipmaps", "image", image, 0, 4294967295)
+    _ImageMipmaps(image)
+
+
+def image_dither(image: int, rBpp: int, gBpp: int, bBpp: int, aBpp: int):
+    """Dither image data to 16bpp or lower (Floyd-Steinberg dithering)"""
+    if __debug__:
+        _check_int("image_dither", "image", image, 0, 4294967295)
+        _check_int("image_dither", "rBpp", rBpp, -2147483648, 2147483647)
+        _check_int("image_dither", "gBpp", gBpp, -2147483648, 2147483647)
+        _check_int("image_dither", "bBpp", bBpp, -2147483648, 2147483647)
+        _check_int("image_dither", "aBpp", aBpp, -2147483648, 2147483647)
+    _ImageDither(image, rBpp, gBpp, bBpp, aBpp)
+
+
+def image_flip_vertical(image: int):
+    """Flip image vertically"""
+    if __debug__:
+        _check_int("image_flip_vertical", "image", image, 0, 4294967295)
+    _ImageFlipVertical(image)
+
+
+def image_flip_horizontal(image: int):
+    """Flip image horizontally"""
+    if __debug__:
+        _check_int("image_flip_horizontal", "image", image, 0, 4294967295)
+    _ImageFlipHorizontal(image)
+
+
+def image_rotate(image: int, degrees: int):
+    """Rotate image by input angle in degrees (-359 to 359)"""
+    if __debug__:
+        _check_int("image_rotate", "image", image, 0, 4294967295)
+        _check_int("image_rotate", "degrees", degrees, -2147483648, 2147483647)
+    _ImageRotate(image, degrees)
+
+
+def image_rotate_cw(image: int):
+    """Rotate image clockwise 90deg"""
+    if __debug__:
+        _check_int("image_rotate_cw", "image", image, 0, 4294967295)
+    _ImageRotateCW(image)
+
+
+def image_rotate_ccw(image: int):
+    """Rotate image counter-clockwise 90deg"""
+    if __debug__:
+        _check_int("image_rotate_ccw", "image", image, 0, 4294967295)
+    _ImageRotateCCW(image)
+
+
+def image_color_tint(image: int, color: Color):
+    """Modify image color: tint"""
+    if __debug__:
+        _check_int("image_color_tint", "image", image, 0, 4294967295)
+        _check_struct("image_color_tint", "color", color, Color)
+    _ImageColorTint(image, color._address)
+
+
+def image_color_invert(image: int):
+    """Modify image color: invert"""
+    if __debug__:
+        _check_int("image_color_invert", "image", image, 0, 4294967295)
+    _ImageColorInvert(image)
+
+
+def image_color_grayscale(image: int):
+    """Modify image color: grayscale"""
+    if __debug__:
+        _check_int("image_color_grayscale", "image", image, 0, 4294967295)
+    _ImageColorGrayscale(image)
+
+
+def image_color_contrast(image: int, contrast: float):
+    """Modify image color: contrast (-100 to 100)"""
+    if __debug__:
+        _check_int("image_color_contrast", "image", image, 0, 4294967295)
+        _check_float("image_color_contrast", "contrast", contrast)
+    _ImageColorContrast(image, contrast)
+
+
+def image_color_brightness(image: int, brightness: int):
+    """Modify image color: brightness (-255 to 255)"""
+    if __debug__:
+        _check_int("image_color_brightness", "image", image, 0, 4294967295)
+        _check_int("image_color_brightness", "brightness", brightness, -2147483648, 2147483647)
+    _ImageColorBrightness(image, brightness)
+
+
+def image_color_replace(image: int, color: Color, replace: Color):
+    """Modify image color: replace color"""
+    if __debug__:
+        _check_int("image_color_replace", "image", image, 0, 4294967295)
+        _check_struct("image_color_replace", "color", color, Color)
+        _check_struct("image_color_replace", "replace", replace, Color)
+    _ImageColorReplace(image, color._address, replace._address)
+
+
+def load_image_colors(image: Image) -> int:
+    """Load color data from image as a Color array (RGBA - 32bit)"""
+    if __debug__:
+        _check_struct("load_image_colors", "image", image, Image)
+    return_interface = _LoadImageColors(image._address)
+    return return_interface
+
+
+def load_image_palette(image: Image, maxPaletteSize: int, colorCount: int) -> int:
+    """Load colors palette from image as a Color array (RGBA - 32bit)"""
+    if __debug__:
+        _check_struct("load_image_palette", "image", image, Image)
+        _check_int("load_image_palette", "maxPaletteSize", maxPaletteSize, -2147483648, 2147483647)
+        _check_int("load_image_palette", "colorCount", colorCount, 0, 4294967295)
+    return_interface = _LoadImagePalette(image._address, maxPaletteSize, colorCount)
+    return return_interface
+
+
+def unload_image_colors(colors: int):
+    """Unload color data loaded with LoadImageColors()"""
+    if __debug__:
+        _check_int("unload_image_colors", "colors", colors, 0, 4294967295)
+    _UnloadImageColors(colors)
+
+
+def unload_image_palette(colors: int):
+    """Unload colors palette loaded with LoadImagePalette()"""
+    if __debug__:
+        _check_int("unload_image_palette", "colors", colors, 0, 4294967295)
+    _UnloadImagePalette(colors)
+
+
+def get_image_alpha_border(image: Image, threshold: float, out: Rectangle = None) -> Rectangle:
+    """Get image alpha border rectangle"""
+    if __debug__:
+        _check_struct("get_image_alpha_border", "image", image, Image)
+        _check_float("get_image_alpha_border", "threshold", threshold)
+        if out is not None:
+            _check_struct("get_image_alpha_border", "out", out, Rectangle)
+    Rectangle_ = _new_struct(Rectangle) if out is None or out.__class__ is not Rectangle or out._address in (image._address,) else out
+    _GetImageAlphaBorder(Rectangle_._address, image._address, threshold)
+    if out is not None and out is not Rectangle_:
+        if out.__class__ is Rectangle:
+            _memcpy(out._address, Rectangle_._address, Rectangle._size)
+        else:
+            out._assign(Rectangle_)  # a shadow struct
+        return out
+    return Rectangle_
+
+
+def get_image_color(image: Image, x: int, y: int, out: Color = None) -> Color:
+    """Get image pixel color at (x, y) position"""
+    if __debug__:
+        _check_struct("get_image_color", "image", image, Image)
+        _check_int("get_image_color", "x", x, -2147483648, 2147483647)
+        _check_int("get_image_color", "y", y, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("get_image_color", "out", out, Color)
+    Color_ = _new_struct(Color) if out is None or out.__class__ is not Color or out._address in (image._address,) else out
+    _GetImageColor(Color_._address, image._address, x, y)
+    if out is not None and out is not Color_:
+        if out.__class__ is Color:
+            _memcpy(out._address, Color_._address, Color._size)
+        else:
+            out._assign(Color_)  # a shadow struct
+        return out
+    return Color_
+
+
+def image_clear_background(dst: int, color: Color):
+    """Clear image background with given color"""
+    if __debug__:
+        _check_int("image_clear_background", "dst", dst, 0, 4294967295)
+        _check_struct("image_clear_background", "color", color, Color)
+    _ImageClearBackground(dst, color._address)
+
+
+def image_draw_pixel(dst: int, posX: int, posY: int, color: Color):
+    """Draw pixel within an image"""
+    if __debug__:
+        _check_int("image_draw_pixel", "dst", dst, 0, 4294967295)
+        _check_int("image_draw_pixel", "posX", posX, -2147483648, 2147483647)
+        _check_int("image_draw_pixel", "posY", posY, -2147483648, 2147483647)
+        _check_struct("image_draw_pixel", "color", color, Color)
+    _ImageDrawPixel(dst, posX, posY, color._address)
+
+
+def image_draw_pixel_v(dst: int, position: Vector2, color: Color):
+    """Draw pixel within an image (Vector version)"""
+    if __debug__:
+        _check_int("image_draw_pixel_v", "dst", dst, 0, 4294967295)
+        _check_struct("image_draw_pixel_v", "position", position, Vector2)
+        _check_struct("image_draw_pixel_v", "color", color, Color)
+    _ImageDrawPixelV(dst, position._address, color._address)
+
+
+def image_draw_line(dst: int, startPosX: int, startPosY: int, endPosX: int, endPosY: int, color: Color):
+    """Draw line within an image"""
+    if __debug__:
+        _check_int("image_draw_line", "dst", dst, 0, 4294967295)
+        _check_int("image_draw_line", "startPosX", startPosX, -2147483648, 2147483647)
+        _check_int("image_draw_line", "startPosY", startPosY, -2147483648, 2147483647)
+        _check_int("image_draw_line", "endPosX", endPosX, -2147483648, 2147483647)
+        _check_int("image_draw_line", "endPosY", endPosY, -2147483648, 2147483647)
+        _check_struct("image_draw_line", "color", color, Color)
+    _ImageDrawLine(dst, startPosX, startPosY, endPosX, endPosY, color._address)
+
+
+def image_draw_line_v(dst: int, start: Vector2, end: Vector2, color: Color):
+    """Draw line within an image (Vector version)"""
+    if __debug__:
+        _check_int("image_draw_line_v", "dst", dst, 0, 4294967295)
+        _check_struct("image_draw_line_v", "start", start, Vector2)
+        _check_struct("image_draw_line_v", "end", end, Vector2)
+        _check_struct("image_draw_line_v", "color", color, Color)
+    _ImageDrawLineV(dst, start._address, end._address, color._address)
+
+
+def image_draw_circle(dst: int, centerX: int, centerY: int, radius: int, color: Color):
+    """Draw a filled circle within an image"""
+    if __debug__:
+        _check_int("image_draw_circle", "dst", dst, 0, 4294967295)
+        _check_int("image_draw_circle", "centerX", centerX, -2147483648, 2147483647)
+        _check_int("image_draw_circle", "centerY", centerY, -2147483648, 2147483647)
+        _check_int("image_draw_circle", "radius", radius, -2147483648, 2147483647)
+        _check_struct("image_draw_circle", "color", color, Color)
+    _ImageDrawCircle(dst, centerX, centerY, radius, color._address)
+
+
+def image_draw_circle_v(dst: int, center: Vector2, radius: int, color: Color):
+    """Draw a filled circle within an image (Vector version)"""
+    if __debug__:
+        _check_int("image_draw_circle_v", "dst", dst, 0, 4294967295)
+        _check_struct("image_draw_circle_v", "center", center, Vector2)
+        _check_int("image_draw_circle_v", "radius", radius, -2147483648, 2147483647)
+        _check_struct("image_draw_circle_v", "color", color, Color)
+    _ImageDrawCircleV(dst, center._address, radius, color._address)
+
+
+def image_draw_circle_lines(dst: int, centerX: int, centerY: int, radius: int, color: Color):
+    """Draw circle outline within an image"""
+    if __debug__:
+        _check_int("image_draw_circle_lines", "dst", dst, 0, 4294967295)
+        _check_int("image_draw_circle_lines", "centerX", centerX, -2147483648, 2147483647)
+        _check_int("image_draw_circle_lines", "centerY", centerY, -2147483648, 2147483647)
+        _check_int("image_draw_circle_lines", "radius", radius, -2147483648, 2147483647)
+        _check_struct("image_draw_circle_lines", "color", color, Color)
+    _ImageDrawCircleLines(dst, centerX, centerY, radius, color._address)
+
+
+def image_draw_circle_lines_v(dst: int, center: Vector2, radius: int, color: Color):
+    """Draw circle outline within an image (Vector version)"""
+    if __debug__:
+        _check_int("image_draw_circle_lines_v", "dst", dst, 0, 4294967295)
+        _check_struct("image_draw_circle_lines_v", "center", center, Vector2)
+        _check_int("image_draw_circle_lines_v", "radius", radius, -2147483648, 2147483647)
+        _check_struct("image_draw_circle_lines_v", "color", color, Color)
+    _ImageDrawCircleLinesV(dst, center._address, radius, color._address)
+
+
+def image_draw_rectangle(dst: int, posX: int, posY: int, width: int, height: int, color: Color):
+    """Draw rectangle within an image"""
+    if __debug__:
+        _check_int("image_draw_rectangle", "dst", dst, 0, 4294967295)
+        _check_int("image_draw_rectangle", "posX", posX, -2147483648, 2147483647)
+        _check_int("image_draw_rectangle", "posY", posY, -2147483648, 2147483647)
+        _check_int("image_draw_rectangle", "width", width, -2147483648, 2147483647)
+        _check_int("image_draw_rectangle", "height", height, -2147483648, 2147483647)
+        _check_struct("image_draw_rectangle", "color", color, Color)
+    _ImageDrawRectangle(dst, posX, posY, width, height, color._address)
+
+
+def image_draw_rectangle_v(dst: int, position: Vector2, size: Vector2, color: Color):
+    """Draw rectangle within an image (Vector version)"""
+    if __debug__:
+        _check_int("image_draw_rectangle_v", "dst", dst, 0, 4294967295)
+        _check_struct("image_draw_rectangle_v", "position", position, Vector2)
+        _check_struct("image_draw_rectangle_v", "size", size, Vector2)
+        _check_struct("image_draw_rectangle_v", "color", color, Color)
+    _ImageDrawRectangleV(dst, position._address, size._address, color._address)
+
+
+def image_draw_rectangle_rec(dst: int, rec: Rectangle, color: Color):
+    """Draw rectangle within an image"""
+    if __debug__:
+        _check_int("image_draw_rectangle_rec", "dst", dst, 0, 4294967295)
+        _check_struct("image_draw_rectangle_rec", "rec", rec, Rectangle)
+        _check_struct("image_draw_rectangle_rec", "color", color, Color)
+    _ImageDrawRectangleRec(dst, rec._address, color._address)
+
+
+def image_draw_rectangle_lines(dst: int, rec: Rectangle, thick: int, color: Color):
+    """Draw rectangle lines within an image"""
+    if __debug__:
+        _check_int("image_draw_rectangle_lines", "dst", dst, 0, 4294967295)
+        _check_struct("image_draw_rectangle_lines", "rec", rec, Rectangle)
+        _check_int("image_draw_rectangle_lines", "thick", thick, -2147483648, 2147483647)
+        _check_struct("image_draw_rectangle_lines", "color", color, Color)
+    _ImageDrawRectangleLines(dst, rec._address, thick, color._address)
+
+
+def image_draw(dst: int, src: Image, srcRec: Rectangle, dstRec: Rectangle, tint: Color):
+    """Draw a source image within a destination image (tint applied to source)"""
+    if __debug__:
+        _check_int("image_draw", "dst", dst, 0, 4294967295)
+        _check_struct("image_draw", "src", src, Image)
+        _check_struct("image_draw", "srcRec", srcRec, Rectangle)
+        _check_struct("image_draw", "dstRec", dstRec, Rectangle)
+        _check_struct("image_draw", "tint", tint, Color)
+    _ImageDraw(dst, src._address, srcRec._address, dstRec._address, tint._address)
+
+
+def image_draw_text(dst: int, text: str, posX: int, posY: int, fontSize: int, color: Color):
+    """Draw text (using default font) within an image (destination)"""
+    if __debug__:
+        _check_int("image_draw_text", "dst", dst, 0, 4294967295)
+        _check_str("image_draw_text", "text", text)
+        _check_int("image_draw_text", "posX", posX, -2147483648, 2147483647)
+        _check_int("image_draw_text", "posY", posY, -2147483648, 2147483647)
+        _check_int("image_draw_text", "fontSize", fontSize, -2147483648, 2147483647)
+        _check_struct("image_draw_text", "color", color, Color)
+    text_ = _scratch_arena.string(text)
+    _ImageDrawText(dst, text_, posX, posY, fontSize, color._address)
+
+
+def image_draw_text_ex(dst: int, font: Font, text: str, position: Vector2, fontSize: float, spacing: float, tint: Color):
+    """Draw text (custom sprite font) within an image (destination)"""
+    if __debug__:
+        _check_int("image_draw_text_ex", "dst", dst, 0, 4294967295)
+        _check_struct("image_draw_text_ex", "font", font, Font)
+        _check_str("image_draw_text_ex", "text", text)
+        _check_struct("image_draw_text_ex", "position", position, Vector2)
+        _check_float("image_draw_text_ex", "fontSize", fontSize)
+        _check_float("image_draw_text_ex", "spacing", spacing)
+        _check_struct("image_draw_text_ex", "tint", tint, Color)
+    text_ = _scratch_arena.string(text)
+    _ImageDrawTextEx(dst, font._address, text_, position._address, fontSize, spacing, tint._address)
+
+
+def load_texture(fileName: str, out: Texture2D = None) -> Texture2D:
+    """Load texture from file into GPU memory (VRAM)"""
+    if __debug__:
+        _check_str("load_texture", "fileName", fileName)
+        if out is not None:
+            _check_struct("load_texture", "out", out, Texture2D)
+    Texture2D_ = _new_struct(Texture2D) if out is None or out.__class__ is not Texture2D else out
+    fileName_ = _scratch_arena.string(fileName)
+    _LoadTexture(Texture2D_._address, fileName_)
+    if out is not None and out is not Texture2D_:
+        out._assign(Texture2D_)  # a shadow struct
+        return out
+    return Texture2D_
+
+
+def load_texture_from_image(image: Image, out: Texture2D = None) -> Texture2D:
+    """Load texture from image data"""
+    if __debug__:
+        _check_struct("load_texture_from_image", "image", image, Image)
+        if out is not None:
+            _check_struct("load_texture_from_image", "out", out, Texture2D)
+    Texture2D_ = _new_struct(Texture2D) if out is None or out.__class__ is not Texture2D or out._address in (image._address,) else out
+    _LoadTextureFromImage(Texture2D_._address, image._address)
+    if out is not None and out is not Texture2D_:
+        if out.__class__ is Texture2D:
+            _memcpy(out._address, Texture2D_._address, Texture2D._size)
+        else:
+            out._assign(Texture2D_)  # a shadow struct
+        return out
+    return Texture2D_
+
+
+def load_texture_cubemap(image: Image, layout: int, out: TextureCubemap = None) -> TextureCubemap:
+    """Load cubemap from image, multiple image cubemap layouts supported"""
+    if __debug__:
+        _check_struct("load_texture_cubemap", "image", image, Image)
+        _check_int("load_texture_cubemap", "layout", layout, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("load_texture_cubemap", "out", out, TextureCubemap)
+    TextureCubemap_ = _new_struct(TextureCubemap) if out is None or out.__class__ is not TextureCubemap or out._address in (image._address,) else out
+    _LoadTextureCubemap(TextureCubemap_._address, image._address, layout)
+    if out is not None and out is not TextureCubemap_:
+        if out.__class__ is TextureCubemap:
+            _memcpy(out._address, TextureCubemap_._address, TextureCubemap._size)
+        else:
+            out._assign(TextureCubemap_)  # a shadow struct
+        return out
+    return TextureCubemap_
+
+
+def load_render_texture(width: int, height: int, out: RenderTexture2D = None) -> RenderTexture2D:
+    """Load texture for rendering (framebuffer)"""
+    if __debug__:
+        _check_int("load_render_texture", "width", width, -2147483648, 2147483647)
+        _check_int("load_render_texture", "height", height, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("load_render_texture", "out", out, RenderTexture2D)
+    RenderTexture2D_ = _new_struct(RenderTexture2D) if out is None or out.__class__ is not RenderTexture2D else out
+    _LoadRenderTexture(RenderTexture2D_._address, width, height)
+    if out is not None and out is not RenderTexture2D_:
+        out._assign(RenderTexture2D_)  # a shadow struct
+        return out
+    return RenderTexture2D_
+
+
+def is_texture_ready(texture: Texture2D) -> int:
+    """Check if a texture is ready"""
+    if __debug__:
+        _check_struct("is_texture_ready", "texture", texture, Texture2D)
+    return_interface = _IsTextureReady(texture._address)
+    return return_interface
+
+
+def unload_texture(texture: Texture2D):
+    """Unload texture from GPU memory (VRAM)"""
+    if __debug__:
+        _check_struct("unload_texture", "texture", texture, Texture2D)
+    _UnloadTexture(texture._address)
+
+
+def is_render_texture_ready(target: RenderTexture2D) -> int:
+    """Check if a render texture is ready"""
+    if __debug__:
+        _check_struct("is_render_texture_ready", "target", target, RenderTexture2D)
+    return_interface = _IsRenderTextureReady(target._address)
+    return return_interface
+
+
+def unload_render_texture(target: RenderTexture2D):
+    """Unload render texture from GPU memory (VRAM)"""
+    if __debug__:
+        _check_struct("unload_render_texture", "target", target, RenderTexture2D)
+    _UnloadRenderTexture(target._address)
+
+
+def update_texture(texture: Texture2D, pixels: int):
+    """Update GPU texture with new data"""
+    if __debug__:
+        _check_struct("update_texture", "texture", texture, Texture2D)
+        _check_int("update_texture", "pixels", pixels, 0, 4294967295)
+    _UpdateTexture(texture._address, pixels)
+
+
+def update_texture_rec(texture: Texture2D, rec: Rectangle, pixels: int):
+    """Update GPU texture rectangle with new data"""
+    if __debug__:
+        _check_struct("update_texture_rec", "texture", texture, Texture2D)
+        _check_struct("update_texture_rec", "rec", rec, Rectangle)
+        _check_int("update_texture_rec", "pixels", pixels, 0, 4294967295)
+    _UpdateTextureRec(texture._address, rec._address, pixels)
+
+
+def gen_texture_mipmaps(texture: int):
+    """Generate GPU mipmaps for a texture"""
+    if __debug__:
+        _check_int("gen_texture_mipmaps", "texture", texture, 0, 4294967295)
+    _GenTextureMipmaps(texture)
+
+
+def set_texture_filter(texture: Texture2D, filter: int):
+    """Set texture scaling filter mode"""
+    if __debug__:
+        _check_struct("set_texture_filter", "texture", texture, Texture2D)
+        _check_int("set_texture_filter", "filter", filter, -2147483648, 2147483647)
+    _SetTextureFilter(texture._address, filter)
+
+
+def set_texture_wrap(texture: Texture2D, wrap: int):
+    """Set texture wrapping mode"""
+    if __debug__:
+        _check_struct("set_texture_wrap", "texture", texture, Texture2D)
+        _check_int("set_texture_wrap", "wrap", wrap, -2147483648, 2147483647)
+    _SetTextureWrap(texture._address, wrap)
+
+
+def draw_texture(texture: Texture2D, posX: int, posY: int, tint: Color):
+    """Draw a Texture2D"""
+    if __debug__:
+        _check_struct("draw_texture", "texture", texture, Texture2D)
+        _check_int("draw_texture", "posX", posX, -2147483648, 2147483647)
+        _check_int("draw_texture", "posY", posY, -2147483648, 2147483647)
+        _check_struct("draw_texture", "tint", tint, Color)
+    _DrawTexture(texture._address, posX, posY, tint._address)
+
+
+def draw_texture_v(texture: Texture2D, position: Vector2, tint: Color):
+    """Draw a Texture2D with position defined as Vector2"""
+    if __debug__:
+        _check_struct("draw_texture_v", "texture", texture, Texture2D)
+        _check_struct("draw_texture_v", "position", position, Vector2)
+        _check_struct("draw_texture_v", "tint", tint, Color)
+    _DrawTextureV(texture._address, position._address, tint._address)
+
+
+def draw_texture_ex(texture: Texture2D, position: Vector2, rotation: float, scale: float, tint: Color):
+    """Draw a Texture2D with extended parameters"""
+    if __debug__:
+        _check_struct("draw_texture_ex", "texture", texture, Texture2D)
+        _check_struct("draw_texture_ex", "position", position, Vector2)
+        _check_float("draw_texture_ex", "rotation", rotation)
+        _check_float("draw_texture_ex", "scale", scale)
+        _check_struct("draw_texture_ex", "tint", tint, Color)
+    _DrawTextureEx(texture._address, position._address, rotation, scale, tint._address)
+
+
+def draw_texture_rec(texture: Texture2D, source: Rectangle, position: Vector2, tint: Color):
+    """Draw a part of a texture defined by a rectangle"""
+    if __debug__:
+        _check_struct("draw_texture_rec", "texture", texture, Texture2D)
+        _check_struct("draw_texture_rec", "source", source, Rectangle)
+        _check_struct("draw_texture_rec", "position", position, Vector2)
+        _check_struct("draw_texture_rec", "tint", tint, Color)
+    _DrawTextureRec(texture._address, source._address, position._address, tint._address)
+
+
+def draw_texture_pro(texture: Texture2D, source: Rectangle, dest: Rectangle, origin: Vector2, rotation: float, tint: Color):
+    """Draw a part of a texture defined by a rectangle with 'pro' parameters"""
+    if __debug__:
+        _check_struct("draw_texture_pro", "texture", texture, Texture2D)
+        _check_struct("draw_texture_pro", "source", source, Rectangle)
+        _check_struct("draw_texture_pro", "dest", dest, Rectangle)
+        _check_struct("draw_texture_pro", "origin", origin, Vector2)
+        _check_float("draw_texture_pro", "rotation", rotation)
+        _check_struct("draw_texture_pro", "tint", tint, Color)
+    _DrawTexturePro(texture._address, source._address, dest._address, origin._address, rotation, tint._address)
+
+
+def draw_texture_n_patch(texture: Texture2D, nPatchInfo: NPatchInfo, dest: Rectangle, origin: Vector2, rotation: float, tint: Color):
+    """Draws a texture (or part of it) that stretches or shrinks nicely"""
+    if __debug__:
+        _check_struct("draw_texture_n_patch", "texture", texture, Texture2D)
+        _check_struct("draw_texture_n_patch", "nPatchInfo", nPatchInfo, NPatchInfo)
+        _check_struct("draw_texture_n_patch", "dest", dest, Rectangle)
+        _check_struct("draw_texture_n_patch", "origin", origin, Vector2)
+        _check_float("draw_texture_n_patch", "rotation", rotation)
+        _check_struct("draw_texture_n_patch", "tint", tint, Color)
+    _DrawTextureNPatch(texture._address, nPatchInfo._address, dest._address, origin._address, rotation, tint._address)
+
+
+def fade(color: Color, alpha: float, out: Color = None) -> Color:
+    """Get color with alpha applied, alpha goes from 0.0f to 1.0f"""
+    if __debug__:
+        _check_struct("fade", "color", color, Color)
+        _check_float("fade", "alpha", alpha)
+        if out is not None:
+            _check_struct("fade", "out", out, Color)
+    Color_ = _new_struct(Color) if out is None or out.__class__ is not Color or out._address in (color._address,) else out
+    _Fade(Color_._address, color._address, alpha)
+    if out is not None and out is not Color_:
+        if out.__class__ is Color:
+            _memcpy(out._address, Color_._address, Color._size)
+        else:
+            out._assign(Color_)  # a shadow struct
+        return out
+    return Color_
+
+
+def color_to_int(color: Color) -> int:
+    """Get hexadecimal value for a Color"""
+    if __debug__:
+        _check_struct("color_to_int", "color", color, Color)
+    return_interface = _ColorToInt(color._address)
+    return return_interface
+
+
+def color_normalize(color: Color, out: Vector4 = None) -> Vector4:
+    """Get Color normalized as float [0..1]"""
+    if __debug__:
+        _check_struct("color_normalize", "color", color, Color)
+        if out is not None:
+            _check_struct("color_normalize", "out", out, Vector4)
+    Vector4_ = _new_struct(Vector4) if out is None or out.__class__ is not Vector4 or out._address in (color._address,) else out
+    _ColorNormalize(Vector4_._address, color._address)
+    if out is not None and out is not Vector4_:
+        if out.__class__ is Vector4:
+            _memcpy(out._address, Vector4_._address, Vector4._size)
+        else:
+            out._assign(Vector4_)  # a shadow struct
+        return out
+    return Vector4_
+
+
+def color_from_normalized(normalized: Vector4, out: Color = None) -> Color:
+    """Get Color from normalized values [0..1]"""
+    if __debug__:
+        _check_struct("color_from_normalized", "normalized", normalized, Vector4)
+        if out is not None:
+            _check_struct("color_from_normalized", "out", out, Color)
+    Color_ = _new_struct(Color) if out is None or out.__class__ is not Color or out._address in (normalized._address,) else out
+    _ColorFromNormalized(Color_._address, normalized._address)
+    if out is not None and out is not Color_:
+        if out.__class__ is Color:
+            _memcpy(out._address, Color_._address, Color._size)
+        else:
+            out._assign(Color_)  # a shadow struct
+        return out
+    return Color_
+
+
+def color_to_hsv(color: Color, out: Vector3 = None) -> Vector3:
+    """Get HSV values for a Color, hue [0..360], saturation/value [0..1]"""
+    if __debug__:
+        _check_struct("color_to_hsv", "color", color, Color)
+        if out is not None:
+            _check_struct("color_to_hsv", "out", out, Vector3)
+    Vector3_ = _new_struct(Vector3) if out is None or out.__class__ is not Vector3 or out._address in (color._address,) else out
+    _ColorToHSV(Vector3_._address, color._address)
+    if out is not None and out is not Vector3_:
+        if out.__class__ is Vector3:
+            _memcpy(out._address, Vector3_._address, Vector3._size)
+        else:
+            out._assign(Vector3_)  # a shadow struct
+        return out
+    return Vector3_
+
+
+def color_from_hsv(hue: float, saturation: float, value: float, out: Color = None) -> Color:
+    """Get a Color from HSV values, hue [0..360], saturation/value [0..1]"""
+    if __debug__:
+        _check_float("color_from_hsv", "hue", hue)
+        _check_float("color_from_hsv", "saturation", saturation)
+        _check_float("color_from_hsv", "value", value)
+        if out is not None:
+            _check_struct("color_from_hsv", "out", out, Color)
+    Color_ = _new_struct(Color) if out is None or out.__class__ is not Color else out
+    _ColorFromHSV(Color_._address, hue, saturation, value)
+    if out is not None and out is not Color_:
+        out._assign(Color_)  # a shadow struct
+        return out
+    return Color_
+
+
+def color_tint(color: Color, tint: Color, out: Color = None) -> Color:
+    """Get color multiplied with another color"""
+    if __debug__:
+        _check_struct("color_tint", "color", color, Color)
+        _check_struct("color_tint", "tint", tint, Color)
+        if out is not None:
+            _check_struct("color_tint", "out", out, Color)
+    Color_ = _new_struct(Color) if out is None or out.__class__ is not Color or out._address in (color._address, tint._address,) else out
+    _ColorTint(Color_._address, color._address, tint._address)
+    if out is not None and out is not Color_:
+        if out.__class__ is Color:
+            _memcpy(out._address, Color_._address, Color._size)
+        else:
+            out._assign(Color_)  # a shadow struct
+        return out
+    return Color_
+
+
+def color_brightness(color: Color, factor: float, out: Color = None) -> Color:
+    """Get color with brightness correction, brightness factor goes from -1.0f to 1.0f"""
+    if __debug__:
+        _check_struct("color_brightness", "color", color, Color)
+        _check_float("color_brightness", "factor", factor)
+        if out is not None:
+            _check_struct("color_brightness", "out", out, Color)
+    Color_ = _new_struct(Color) if out is None or out.__class__ is not Color or out._address in (color._address,) else out
+    _ColorBrightness(Color_._address, color._address, factor)
+    if out is not None and out is not Color_:
+        if out.__class__ is Color:
+            _memcpy(out._address, Color_._address, Color._size)
+        else:
+            out._assign(Color_)  # a shadow struct
+        return out
+    return Color_
+
+
+def color_contrast(color: Color, contrast: float, out: Color = None) -> Color:
+    """Get color with contrast correction, contrast values between -1.0f and 1.0f"""
+    if __debug__:
+        _check_struct("color_contrast", "color", color, Color)
+        _check_float("color_contrast", "contrast", contrast)
+        if out is not None:
+            _check_struct("color_contrast", "out", out, Color)
+    Color_ = _new_struct(Color) if out is None or out.__class__ is not Color or out._address in (color._address,) else out
+    _ColorContrast(Color_._address, color._address, contrast)
+    if out is not None and out is not Color_:
+        if out.__class__ is Color:
+            _memcpy(out._address, Color_._address, Color._size)
+        else:
+            out._assign(Color_)  # a shadow struct
+        return out
+    return Color_
+
+
+def color_alpha(color: Color, alpha: float, out: Color = None) -> Color:
+    """Get color with alpha applied, alpha goes from 0.0f to 1.0f"""
+    if __debug__:
+        _check_struct("color_alpha", "color", color, Color)
+        _check_float("color_alpha", "alpha", alpha)
+        if out is not None:
+            _check_struct("color_alpha", "out", out, Color)
+    Color_ = _new_struct(Color) if out is None or out.__class__ is not Color or out._address in (color._address,) else out
+    _ColorAlpha(Color_._address, color._address, alpha)
+    if out is not None and out is not Color_:
+        if out.__class__ is Color:
+            _memcpy(out._address, Color_._address, Color._size)
+        else:
+            out._assign(Color_)  # a shadow struct
+        return out
+    return Color_
+
+
+def color_alpha_blend(dst: Color, src: Color, tint: Color, out: Color = None) -> Color:
+    """Get src alpha-blended into dst color with tint"""
+    if __debug__:
+        _check_struct("color_alpha_blend", "dst", dst, Color)
+        _check_struct("color_alpha_blend", "src", src, Color)
+        _check_struct("color_alpha_blend", "tint", tint, Color)
+        if out is not None:
+            _check_struct("color_alpha_blend", "out", out, Color)
+    Color_ = _new_struct(Color) if out is None or out.__class__ is not Color or out._address in (dst._address, src._address, tint._address,) else out
+    _ColorAlphaBlend(Color_._address, dst._address, src._address, tint._address)
+    if out is not None and out is not Color_:
+        if out.__class__ is Color:
+            _memcpy(out._address, Color_._address, Color._size)
+        else:
+            out._assign(Color_)  # a shadow struct
+        return out
+    return Color_
+
+
+def get_color(hexValue: int, out: Color = None) -> Color:
+    """Get Color structure from hexadecimal value"""
+    if __debug__:
+        _check_int("get_color", "hexValue", hexValue, 0, 4294967295)
+        if out is not None:
+            _check_struct("get_color", "out", out, Color)
+    Color_ = _new_struct(Color) if out is None or out.__class__ is not Color else out
+    _GetColor(Color_._address, hexValue)
+    if out is not None and out is not Color_:
+        out._assign(Color_)  # a shadow struct
+        return out
+    return Color_
+
+
+def get_pixel_color(srcPtr: int, format: int, out: Color = None) -> Color:
+    """Get Color from a source pixel pointer of certain format"""
+    if __debug__:
+        _check_int("get_pixel_color", "srcPtr", srcPtr, 0, 4294967295)
+        _check_int("get_pixel_color", "format", format, -2147483648, 2147483647)
+        if out is not None:
+            _check_struct("get_pixel_color", "out", out, Color)
+    Color_ = _new_struct(Color) if out is None or out.__class__ is not Color else out
+    _GetPixelColor(Color_._address, srcPtr, format)
+    if out is not None and out is not Color_:
+        out._assign(Color_)  # a shadow struct
+        return out
+    return Color_
+
+
+def set_pixel_color(dstPtr: int, color: Color, format: int):
+    """Set color formatted into destination pixel pointer"""
+    if __debug__:
+        _check_int("set_pixel_color", "dstPtr", dstPtr, 0, 4294967295)
+        _check_struct("set_pixel_color", "color", color, Color)
+        _check_int("set_pixel_color", "format", format, -2147483648, 2147483647)
+    _SetPixelColor(dstPtr, color._address, format)
+
+
+def get_pixel_data_size(width: int, height: int, format: int) -> int:
+    """Get pixel data size in bytes for certain format"""
+    if __debug__:
+        _check_int("get_pixel_data_size", "width", width, -2147483648, 2147483647)
+        _check_int("get_pixel_data_size", "height", height, -2147483648, 2147483647)
+        _check_int("get_pixel_data_size", "format", format, -2147483648, 2147483647)
+    return_interface = _GetPixelDataSize(width, height, format)
+    return return_interface
+
+
+# the wasm exports called above, fetched once instead of looked up at every call, they are bound
+# again when another context is activated or profiling starts
+_wasm_functions_names = [
+    "_LoadImage",
+    "_LoadImageRaw",
+    "_LoadImageAnim",
+    "_LoadImageFromMemory",
+    "_LoadImageFromTexture",
+    "_memcpy",
+    "_LoadImageFromScreen",
+    "_IsImageReady",
+    "_UnloadImage",
+    "_ExportImage",
+    "_ExportImageToMemory",
+    "_ExportImageAsCode",
+    "_GenImageColor",
+    "_GenImageGradientLinear",
+    "_GenImageGradientRadial",
+    "_GenImageGradientSquare",
+    "_GenImageChecked",
+    "_GenImageWhiteNoise",
+    "_GenImagePerlinNoise",
+    "_GenImageCellular",
+    "_GenImageText",
+    "_ImageCopy",
+    "_ImageFromImage",
+    "_ImageText",
+    "_ImageTextEx",
+    "_ImageFormat",
+    "_ImageToPOT",
+    "_ImageCrop",
+    "_ImageAlphaCrop",
+    "_ImageAlphaClear",
+    "_ImageAlphaMask",
+    "_ImageAlphaPremultiply",
+    "_ImageBlurGaussian",
+    "_ImageResize",
+    "_ImageResizeNN",
+    "_ImageResizeCanvas",
+    "_ImageMipmaps",
+    "_ImageDither",
+    "_ImageFlipVertical",
+    "_ImageFlipHorizontal",
+    "_ImageRotate",
+    "_ImageRotateCW",
+    "_ImageRotateCCW",
+    "_ImageColorTint",
+    "_ImageColorInvert",
+    "_ImageColorGrayscale",
+    "_ImageColorContrast",
+    "_ImageColorBrightness",
+    "_ImageColorReplace",
+    "_LoadImageColors",
+    "_LoadImagePalette",
+    "_UnloadImageColors",
+    "_UnloadImagePalette",
+    "_GetImageAlphaBorder",
+    "_GetImageColor",
+    "_ImageClearBackground",
+    "_ImageDrawPixel",
+    "_ImageDrawPixelV",
+    "_ImageDrawLine",
+    "_ImageDrawLineV",
+    "_ImageDrawCircle",
+    "_ImageDrawCircleV",
+    "_ImageDrawCircleLines",
+    "_ImageDrawCircleLinesV",
+    "_ImageDrawRectangle",
+    "_ImageDrawRectangleV",
+    "_ImageDrawRectangleRec",
+    "_ImageDrawRectangleLines",
+    "_ImageDraw",
+    "_ImageDrawText",
+    "_ImageDrawTextEx",
+    "_LoadTexture",
+    "_LoadTextureFromImage",
+    "_LoadTextureCubemap",
+    "_LoadRenderTexture",
+    "_IsTextureReady",
+    "_UnloadTexture",
+    "_IsRenderTextureReady",
+    "_UnloadRenderTexture",
+    "_UpdateTexture",
+    "_UpdateTextureRec",
+    "_GenTextureMipmaps",
+    "_SetTextureFilter",
+    "_SetTextureWrap",
+    "_DrawTexture",
+    "_DrawTextureV",
+    "_DrawTextureEx",
+    "_DrawTextureRec",
+    "_DrawTexturePro",
+    "_DrawTextureNPatch",
+    "_Fade",
+    "_ColorToInt",
+    "_ColorNormalize",
+    "_ColorFromNormalized",
+    "_ColorToHSV",
+    "_ColorFromHSV",
+    "_ColorTint",
+    "_ColorBrightness",
+    "_ColorContrast",
+    "_ColorAlpha",
+    "_ColorAlphaBlend",
+    "_GetColor",
+    "_GetPixelColor",
+    "_SetPixelColor",
+    "_GetPixelDataSize",
+    "_DrawSpriteBatch",
+    "_rlDrawRenderBatchActive",
+]
+_bind_wasm_functions(globals())
+
+
+def _sprite_fields(value, names: tuple) -> tuple:
+    # a struct (or its shadow) or already a tuple of its fields
+    return tuple(value) if isinstance(value, (tuple, list)) else tuple(getattr(value, name) for name in names)
+
+
+class SpriteBatch(WasmArray):
+    """Sprites of one texture in wasm memory, all drawn with one call into wasm (DrawSpriteBatch in raylib.c): the
+    source and dest rectangles, origin, rotation and tint of each, like the arguments of draw_texture_pro()"""
+    # the layout of SpriteBatchItem in raylib.c
+    _sprite = struct.Struct("<11f4B")
+    _dtype = {"names": ["source_x", "source_y", "source_width", "source_height", "x", "y", "width", "height",
+                        "origin_x", "origin_y", "rotation", "tint"],
+              "formats": ["<f4"] * 11 + [("<u1", (4,))],
+              "offsets": [0, 4, 8, 12, 16, 20, 24, 28, 32, 36, 40, 44],
+              "itemsize": 48}
+
+    def __init__(self, texture: Texture2D, capacity: int):
+        super(SpriteBatch, self).__init__(SpriteBatch._sprite.size, capacity)
+        self.texture = texture
+        _heap.u8.fill(0, self._address, self._address + self._size)  # transparent until they are set
+
+    @classmethod
+    def new_sprites(cls, count: int):
+        """A numpy array of count sprites (white, not rotated) to fill and pass to draw(), its fields are source_x,
+        source_y, source_width, source_height, x, y, width, height, origin_x, origin_y, rotation and tint (r, g, b, a)"""
+        numpy = _import_numpy()
+        sprites = numpy.zeros(count, dtype=cls._dtype)
+        sprites["tint"] = 255
+        return sprites
+
+    def __getitem__(self, item: int) -> tuple:
+        if not 0 <= item < self._length:
+            raise IndexError("sprite index out of range")
+        address = self._address + self._item_size * item
+        data = bytearray(self._item_size)
+        _heap.u8.subarray(address, address + self._item_size).assign_to(data)
+        values = self._sprite.unpack(data)
+        return values[0:4], values[4:8], values[8:10], values[10], values[11:15]
+
+    def __setitem__(self, item, value):
+        """batch[i] = (source, dest, origin, rotation, tint), the rectangles, vector and color as structs or tuples"""
+        if isinstance(item, slice):
+            self._assign_slice(item, value)
+            return
+        if not 0 <= item < self._length:
+            raise IndexError("sprite index out of range")
+        source, dest, origin, rotation, tint = value
+        address = self._address + self._item_size * item
+        _heap.u8.subarray(address, address + self._item_size).assign(self._sprite.pack(
+            *_sprite_fields(source, ("x", "y", "width", "height")), *_sprite_fields(dest, ("x", "y", "width", "height")),
+            *_sprite_fields(origin, ("x", "y")), rotation, *_sprite_fields(tint, ("r", "g", "b", "a"))))
+
+    def draw(self, sprites=None, count: int = None):
+        """Draw the first count sprites of the batch (all of them by default), sprites (from new_sprites()) are
+        copied into the start of the batch first, with one bulk write"""
+        if sprites is not None:
+            self._assign_slice(slice(0, len(sprites)), sprites)
+            count = len(sprites) if count is None else count
+        count = self._length if count is None else min(count, self._length)
+        _command_buffer.flush()  # the draw calls recorded before are drawn first
+        if not _is_wasm_function_exported(_DrawSpriteBatch):
+            self._draw_each(count)
+            return
+        _DrawSpriteBatch(self.texture._address, self._address, count)
+
+    def _draw_each(self, count: int):
+        """DrawTexturePro for each sprite, for a raylib wasm without DrawSpriteBatch"""
+        size = self._item_size
+        data = bytearray(size * count)
+        _heap.u8.subarray(self._address, self._address + size * count).assign_to(data)
+        rotations = memoryview(data).cast("f")[10::12]
+        texture = self.texture._address
+        for address, rotation in zip(range(self._address, self._address + size * count, size), rotations):
+            # the source, dest, origin and tint of the sprite are structs in wasm memory already
+            _DrawTexturePro(texture, address, address + 16, address + 32, rotation, address + 44)
+
+def update_texture_from_array(texture: Texture2D, pixels):
+    """Update the whole GPU texture from pixels in its format: a PixelArray (or any WasmArray) is uploaded from where
+    it is in wasm memory, a numpy array (or a buffer) is copied into wasm memory with one bulk write first"""
+    size = texture.width * texture.height * PixelArray.pixel_size(texture.format)
+    if isinstance(pixels, WasmArray):
+        data = None
+        given = pixels._size
+    else:
+        data = memoryview(_import_numpy().ascontiguousarray(pixels) if hasattr(pixels, "dtype") else pixels).cast("B")
+        given = len(data)
+    if given != size:
+        raise ValueError(f"the texture takes {size} bytes of pixels ({texture.width}x{texture.height}, "
+                         f"format {texture.format}), not {given}")
+    _command_buffer.flush()  # the draw calls recorded before draw the texture as it was
+    if data is None:
+        _UpdateTexture(texture._address, pixels._address)
+        return
+    # UpdateTexture copies the pixels to the GPU before it returns, the copy in wasm memory is only needed until then
+    address = _mod._malloc(size)
+    _heap.u8.subarray(address, address + size).assign(data)
+    _UpdateTexture(texture._address, address)
+    _mod._free(address)
+
+class _SkylinePacker:
+    """Places rectangles bottom-left first on a skyline, the top edge of what is placed so far, as segments
+    [x, y, width] from left to right"""
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self._skyline = [[0, 0, width]]
+
+    def _fit(self, index: int, width: int, height: int):
+        """y where a rectangle whose left edge is on the segment index fits, or None"""
+        x = self._skyline[index][0]
+        if x + width > self.width:
+            return None
+        y = 0
+        remaining = width
+        while remaining > 0:
+            _, segment_y, segment_width = self._skyline[index]
+            y = max(y, segment_y)
+            if y + height > self.height:
+                return None
+            remaining -= segment_width
+            index += 1
+        return y
+
+    def insert(self, width: int, height: int):
+        """(x, y) of a new width x height rectangle, the lowest place (then the narrowest segment), or None if
+        it doesn't fit"""
+        best = None
+        for index, (x, _, segment_width) in enumerate(self._skyline):
+            y = self._fit(index, width, height)
+            if y is not None and (best is None or (y + height, segment_width) < best[0]):
+                best = ((y + height, segment_width), index, x, y)
+        if best is None:
+            return None
+        _, index, x, y = best
+        self._skyline.insert(index, [x, y + height, width])
+        # the segments under the new one are shortened or removed
+        right = x + width
+        while index + 1 < len(self._skyline) and self._skyline[index + 1][0] < right:
+            segment = self._skyline[index + 1]
+            segment_right = segment[0] + segment[2]
+            if segment_right <= right:
+                del self._skyline[index + 1]
+            else:
+                segment[2] = segment_right - right
+                segment[0] = right
+        # and neighbours at the same height merged
+        merged = [self._skyline[0]]
+        for segment in self._skyline[1:]:
+            if segment[1] == merged[-1][1]:
+                merged[-1][2] += segment[2]
+            else:
+                merged.append(segment)
+        self._skyline = merged
+        return x, y
+
+
+class AtlasRegion:
+    """An image packed into a TextureAtlas, drawn from the texture of the atlas"""
+    __slots__ = ("atlas", "name", "source")
+
+    def __init__(self, atlas, name, source):
+        self.atlas = atlas
+        self.name = name
+        self.source = source  # RectangleShadow of the image in the atlas, moved when the atlas grows
+
+    @property
+    def width(self) -> float:
+        return self.source.width
+
+    @property
+    def height(self) -> float:
+        return self.source.height
+
+    def draw(self, x: float, y: float, tint: Color = None):
+        """Draw the image at (x, y), like draw_texture_rec()"""
+        atlas = self.atlas
+        if atlas._dirty:
+            atlas.build()
+        # the function the user code sees, recorded like its other draw calls when the command buffer is enabled
+        _active_context.builtins["draw_texture_rec"](atlas.texture, self.source, Vector2Shadow(x, y),
+                                                     WHITE if tint is None else tint)
+
+    def draw_pro(self, dest: Rectangle, origin: Vector2, rotation: float, tint: Color = None):
+        """Draw the image into dest, scaled and rotated around origin, like draw_texture_pro()"""
+        atlas = self.atlas
+        if atlas._dirty:
+            atlas.build()
+        _active_context.builtins["draw_texture_pro"](atlas.texture, self.source, dest, origin, rotation,
+                                                     WHITE if tint is None else tint)
+
+
+class TextureAtlas:
+    """Images packed into one texture: sprites drawn from it don't switch textures, each switch makes rlgl end a
+    draw call. Images added later go into the free space, only when it is full the atlas doubles its size (up to
+    max_size) and packs everything again"""
+
+    def __init__(self, width: int = 1024, height: int = 1024, padding: int = 1, max_size: int = 4096):
+        self.padding = padding  # pixels around each image, so filtering doesn't bleed the neighbours in
+        self.max_size = max_size
+        self.regions = {}  # name -> AtlasRegion
+        self.image = gen_image_color(width, height, Color(0, 0, 0, 0))  # what the texture gets, kept to add images to
+        self.texture = None
+        self._packer = _SkylinePacker(width, height)
+        self._changed = []  # rectangles of the image to upload at the next build(), None for the whole image
+        self._dirty = False
+
+    def __len__(self):
+        return len(self.regions)
+
+    def __contains__(self, name) -> bool:
+        return name in self.regions
+
+    def __getitem__(self, name) -> AtlasRegion:
+        return self.regions[name]
+
+    def add(self, name, image: Image) -> AtlasRegion:
+        """Copy image into the atlas (it can be unloaded after), the atlas texture is updated before the next draw
+        or by build()"""
+        if name in self.regions:
+            raise KeyError(f"the atlas already has an image named {name!r}")
+        width, height = image.width, image.height
+        place = self._packer.insert(width + self.padding, height + self.padding)
+        while place is None:
+            self._grow(width, height)
+            place = self._packer.insert(width + self.padding, height + self.padding)
+        source = RectangleShadow(place[0], place[1], width, height)
+        image_draw(self.image._address, image, Rectangle(0, 0, width, height), source.to_struct(), WHITE)
+        region = self.regions[name] = AtlasRegion(self, name, source)
+        if self._changed is not None:
+            self._changed.append(source)
+        self._dirty = True
+        return region
+
+    def _grow(self, width: int, height: int):
+        """Double the smaller side of the atlas until every image packs into it again, in decreasing height"""
+        regions = sorted(self.regions.values(), key=lambda region: -region.source.height)
+        atlas_width, atlas_height = self._packer.width, self._packer.height
+        while True:
+            if atlas_width >= self.max_size and atlas_height >= self.max_size:
+                raise ValueError(f"a {width}x{height} image doesn't fit in the atlas, even at its max_size")
+            if atlas_width <= atlas_height and atlas_width < self.max_size:
+                atlas_width = min(2 * atlas_width, self.max_size)
+            else:
+                atlas_height = min(2 * atlas_height, self.max_size)
+            packer = _SkylinePacker(atlas_width, atlas_height)
+            places = [packer.insert(int(region.source.width) + self.padding, int(region.source.height) + self.padding)
+                      for region in regions]
+            if None not in places:
+                break
+
+        image = gen_image_color(atlas_width, atlas_height, Color(0, 0, 0, 0))
+        for region, (x, y) in zip(regions, places):
+            source = region.source
+            moved = RectangleShadow(x, y, source.width, source.height)
+            image_draw(image._address, self.image, source.to_struct(), moved.to_struct(), WHITE)
+            region.source = moved
+        unload_image(self.image)
+        self.image = image
+        self._packer = packer
+        self._changed = None  # a new texture
+
+    def build(self):
+        """Upload what changed since the last build to the texture: the rectangles of the images added, or a new
+        texture if the atlas grew"""
+        _command_buffer.flush()  # the draw calls recorded before use the texture as it was
+        if self.texture is None or self._changed is None:
+            if self.texture is not None:
+                _rlDrawRenderBatchActive()  # the draws rlgl batched so far still use the old texture
+                unload_texture(self.texture)
+            self.texture = load_texture_from_image(self.image)
+        else:
+            for rectangle in self._changed:
+                pixels = image_from_image(self.image, rectangle.to_struct())
+                update_texture_rec(self.texture, rectangle.to_struct(), pixels.data)
+                unload_image(pixels)
+        self._changed = []
+        self._dirty = False
+
+    def unload(self):
+        """Unload the image and the texture of the atlas"""
+        unload_image(self.image)
+        if self.texture is not None:
+            unload_texture(self.texture)
+            self.texture = None
+
+import math
+
+
+class CachedLayer:
+    """Draw calls recorded once into a RenderTexture2D and drawn from it in the next frames with one draw call,
+    until the layer is marked dirty or the camera moves too far. The draw calls go in its with block, drawn only
+    while it records:
+
+    with cached_layer("buildings", camera, margin=200) as layer:
+        if layer.recording:
+            for building, color in zip(buildings, colors): draw_rectangle_rec(building, color)
+    """
+
+    def __init__(self, name, camera: Camera2D = None, margin: int = 0, width: int = 0, height: int = 0,
+                 clear_color: Color = None):
+        self.name = name
+        self.camera = camera  # the draw calls are recorded in its world space, the texture stays on the screen
+        self.margin = margin  # pixels recorded past each side, how far the camera pans before the layer records again
+        self.width = width  # 0: the screen size
+        self.height = height
+        self.clear_color = clear_color  # None: transparent, an opaque color blends translucent draw calls only once
+        self.target = None
+        self.recording = False
+        self.renders = 0  # how many times the layer recorded
+        self._dirty = True
+        self._recorded_camera = None  # offset x, y, target x, y, rotation and zoom of the camera it recorded with
+        self._size = None
+        self._source = None
+        self._shift_x = self._shift_y = 0.0
+
+    def mark_dirty(self):
+        """Record the draw calls again the next time the layer is drawn"""
+        self._dirty = True
+
+    def _camera_values(self):
+        address = self.camera._address >> 2
+        f32 = _heap.f32
+        return (f32[address], f32[address + 1], f32[address + 2], f32[address + 3], f32[address + 4],
+                f32[address + 5])
+
+    def _shift(self):
+        """Where the recorded texture moved on the screen since the layer recorded, or None if the camera turned
+        or zoomed or the texture would no longer cover the screen"""
+        if self.camera is None or self._recorded_camera is None:
+            return (0.0, 0.0) if self.camera is None and self._recorded_camera is None else None
+        offset_x, offset_y, target_x, target_y, rotation, zoom = self._camera_values()
+        recorded = self._recorded_camera
+        if rotation != recorded[4] or zoom != recorded[5]:
+            return None
+        # the screen position of the recorded target, the same transform as GetWorldToScreen2D()
+        x = (recorded[2] - target_x) * zoom
+        y = (recorded[3] - target_y) * zoom
+        if rotation != 0.0:
+            cos, sin = math.cos(math.radians(rotation)), math.sin(math.radians(rotation))
+            x, y = x * cos - y * sin, x * sin + y * cos
+        shift_x = offset_x + x - recorded[0]
+        shift_y = offset_y + y - recorded[1]
+        if abs(shift_x) > self.margin or abs(shift_y) > self.margin:
+            return None
+        return shift_x, shift_y
+
+    def __enter__(self):
+        width = self.width or get_screen_width()
+        height = self.height or get_screen_height()
+        margin = self.margin
+        size = (width + 2 * margin, height + 2 * margin)
+        if self.target is None or size != self._size:
+            self.unload()
+            self.target = load_render_texture(*size)
+            self._size = size
+            self._source = RectangleShadow(0, 0, size[0], -size[1])  # render textures are upside down
+            self._dirty = True
+        shift = None if self._dirty else self._shift()
+        if shift is not None:
+            self._shift_x, self._shift_y = shift
+            return self
+
+        # the functions the user code sees, so they are recorded in order when the command buffer is enabled
+        builtins = _active_context.builtins
+        builtins["begin_texture_mode"](self.target)
+        builtins["clear_background"](BLANK if self.clear_color is None else self.clear_color)
+        self._shift_x = self._shift_y = 0.0
+        self._recorded_camera = None
+        if self.camera is not None:
+            self._recorded_camera = self._camera_values()
+            offset_x, offset_y, target_x, target_y, rotation, zoom = self._recorded_camera
+            builtins["begin_mode_2d"](Camera2D(Vector2(offset_x + margin, offset_y + margin),
+                                               Vector2(target_x, target_y), rotation, zoom))
+        self.recording = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        builtins = _active_context.builtins
+        if self.recording:
+            if self.camera is not None:
+                builtins["end_mode_2d"]()
+            builtins["end_texture_mode"]()
+            self.recording = False
+            if exc_type is not None:
+                return False  # still dirty, recorded again the next time
+            self._dirty = False
+            self.renders += 1
+        elif exc_type is not None:
+            return False
+
+        builtins["draw_texture_rec"](self.target.texture, self._source,
+                                     Vector2Shadow(self._shift_x - self.margin, self._shift_y - self.margin), WHITE)
+        return False
+
+    def unload(self):
+        """Unload the render texture of the layer, it records again the next time it is drawn"""
+        if self.target is None:
+            return
+        _command_buffer.flush()
+        _rlDrawRenderBatchActive()  # the draws rlgl batched so far may still use the texture
+        unload_render_texture(self.target)
+        self.target = None
+        self._dirty = True
+
+
+def cached_layer(name, camera: Camera2D = None, margin: int = 0, width: int = 0, height: int = 0,
+                 clear_color: Color = None) -> CachedLayer:
+    """Get the layer name, drawn with a with block outside begin_mode_2d(): it records its draw calls into a render
+    texture when it is new, marked dirty or camera turned, zoomed or panned more than margin pixels, and otherwise
+    draws the texture"""
+    layer = _cached_layers.get(name)
+    if layer is None:
+        layer = _cached_layers[name] = CachedLayer(name, camera, margin, width, height, clear_color)
+        return layer
+    layer.camera = camera
+    layer.margin = margin
+    layer.width = width
+    layer.height = height
+    layer.clear_color = clear_color
+    return layer
+
+
+def unload_cached_layers():
+    """Unload the render textures of all the cached layers and forget them"""
+    for layer in _cached_layers.values():
+        layer.unload()
+    _cached_layers.clear()
@@ -13,6 +13,9 @@
 #include "reasings.h"
 #include "rlgl.h"
 
+#include "raylib_commands.h"
+#include "raylib_structs.h"
+
 // These are really handy for wordwrap, and are available in raylib/examples/text/text_rectangle_bounds.c
 
 // Draw text using font inside rectangle limits with support for text selection
@@ -139,3 +142,297 @@ EMSCRIPTEN_KEEPALIVE void DrawTextBoxedSelectable(Font font, const char* text, R
 EMSCRIPTEN_KEEPALIVE void DrawTextBoxed(Font font, const char* text, Rectangle rec, float fontSize, float spacing, bool wordWrap, Color tint) {
   DrawTextBoxedSelectable(font, text, rec, fontSize, spacing, wordWrap, tint, 0, 0, WHITE, WHITE);
 }
+
+// Replay the draw calls recorded by the python CommandBuffer, a whole frame in one call
+EMSCRIPTEN_KEEPALIVE void ReplayCommandBuffer(const void* buffer, int size) {
+  const CommandSlot* slot = (const CommandSlot*)buffer;
+  const CommandSlot* end = (const CommandSlot*)((const unsigned char*)buffer + size);
+
+  while (slot < end) {
+    int opcode = slot->i;
+    slot = ReplayCommand(opcode, slot + 1);
+
+    if (slot == NULL) {
+      TraceLog(LOG_WARNING, "COMMANDS: Unknown opcode %i, dropping the rest of the buffer", opcode);
+      break;
+    }
+  }
+}
+
+// Sizes and member offsets of the raylib structs, the python wrapper checks its struct classes against them at startup
+EMSCRIPTEN_KEEPALIVE const int* GetStructLayouts(void) {
+  return StructLayouts;
+}
+
+// One sprite of the python SpriteBatch, the arguments of DrawTexturePro, in the layout of SpriteBatch._dtype
+typedef struct SpriteBatchItem {
+  Rectangle source;
+  Rectangle dest;
+  Vector2 origin;
+  float rotation;
+  Color tint;
+} SpriteBatchItem;
+
+_Static_assert(sizeof(SpriteBatchItem) == 48, "SpriteBatchItem must match SpriteBatch._dtype of the python wrapper");
+
+// Quads per rlBegin()/rlEnd(), a chunk always fits in an empty render batch (2048 quads on web)
+#define SPRITE_BATCH_CHUNK 1024
+
+// Draw sprites of a texture like DrawTexturePro does, as quads of the rlgl render batch without a call per sprite
+EMSCRIPTEN_KEEPALIVE void DrawSpriteBatch(const Texture2D* texture, const SpriteBatchItem* sprites, int count) {
+  if ((texture->id == 0) || (count <= 0))
+    return;
+
+  float width = (float)texture->width;
+  float height = (float)texture->height;
+
+  rlSetTexture(texture->id);
+  for (int start = 0; start < count; start += SPRITE_BATCH_CHUNK) {
+    int end = ((start + SPRITE_BATCH_CHUNK) < count) ? (start + SPRITE_BATCH_CHUNK) : count;
+    rlCheckRenderBatchLimit(4 * (end - start));  // draws the batch so far if the chunk doesn't fit
+
+    rlBegin(RL_QUADS);
+    rlNormal3f(0.0f, 0.0f, 1.0f);
+    for (int i = start; i < end; i++) {
+      const SpriteBatchItem* sprite = &sprites[i];
+      Rectangle source = sprite->source;
+      Rectangle dest = sprite->dest;
+
+      bool flipX = false;
+      if (source.width < 0) {
+        flipX = true;
+        source.width *= -1;
+      }
+      if (source.height < 0)
+        source.y -= source.height;
+
+      Vector2 topLeft, topRight, bottomLeft, bottomRight;
+      if (sprite->rotation == 0.0f) {
+        float x = dest.x - sprite->origin.x;
+        float y = dest.y - sprite->origin.y;
+        topLeft = (Vector2){x, y};
+        topRight = (Vector2){x + dest.width, y};
+        bottomLeft = (Vector2){x, y + dest.height};
+        bottomRight = (Vector2){x + dest.width, y + dest.height};
+      } else {
+        float sinRotation = sinf(sprite->rotation * DEG2RAD);
+        float cosRotation = cosf(sprite->rotation * DEG2RAD);
+        float dx = -sprite->origin.x;
+        float dy = -sprite->origin.y;
+        topLeft = (Vector2){dest.x + dx * cosRotation - dy * sinRotation, dest.y + dx * sinRotation + dy * cosRotation};
+        topRight = (Vector2){dest.x + (dx + dest.width) * cosRotation - dy * sinRotation,
+                             dest.y + (dx + dest.width) * sinRotation + dy * cosRotation};
+        bottomLeft = (Vector2){dest.x + dx * cosRotation - (dy + dest.height) * sinRotation,
+                               dest.y + dx * sinRotation + (dy + dest.height) * cosRotation};
+        bottomRight = (Vector2){dest.x + (dx + dest.width) * cosRotation - (dy + dest.height) * sinRotation,
+                                dest.y + (dx + dest.width) * sinRotation + (dy + dest.height) * cosRotation};
+      }
+
+      float left = (flipX ? source.x + source.width : source.x) / width;
+      float right = (flipX ? source.x : source.x + source.width) / width;
+      float top = source.y / height;
+      float bottom = (source.y + source.height) / height;
+
+      rlColor4ub(sprite->tint.r, sprite->tint.g, sprite->tint.b, sprite->tint.a);
+      rlTexCoord2f(left, top);
+      rlVertex2f(topLeft.x, topLeft.y);
+      rlTexCoord2f(left, bottom);
+      rlVertex2f(bottomLeft.x, bottomLeft.y);
+      rlTexCoord2f(right, bottom);
+      rlVertex2f(bottomRight.x, bottomRight.y);
+      rlTexCoord2f(right, top);
+      rlVertex2f(topRight.x, topRight.y);
+    }
+    rlEnd();
+  }
+  rlSetTexture(0);
+}
+
+// raymath over arrays, for the batched python functions (vector2_transform_array, ...): one call for count values
+// instead of one per value. out can be the input array, each value is read before its result is written
+
+EMSCRIPTEN_KEEPALIVE void Vector2AddArray(const Vector2* v1, const Vector2* v2, int count, Vector2* out) {
+  for (int i = 0; i < count; i++)
+    out[i] = (Vector2){v1[i].x + v2[i].x, v1[i].y + v2[i].y};
+}
+
+EMSCRIPTEN_KEEPALIVE void Vector3AddArray(const Vector3* v1, const Vector3* v2, int count, Vector3* out) {
+  for (int i = 0; i < count; i++)
+    out[i] = (Vector3){v1[i].x + v2[i].x, v1[i].y + v2[i].y, v1[i].z + v2[i].z};
+}
+
+EMSCRIPTEN_KEEPALIVE void Vector2ScaleArray(const Vector2* v, int count, float scale, Vector2* out) {
+  for (int i = 0; i < count; i++)
+    out[i] = (Vector2){v[i].x * scale, v[i].y * scale};
+}
+
+EMSCRIPTEN_KEEPALIVE void Vector3ScaleArray(const Vector3* v, int count, float scale, Vector3* out) {
+  for (int i = 0; i < count; i++)
+    out[i] = (Vector3){v[i].x * scale, v[i].y * scale, v[i].z * scale};
+}
+
+// like Vector2Normalize, a zero vector stays zero
+EMSCRIPTEN_KEEPALIVE void Vector2NormalizeArray(const Vector2* v, int count, Vector2* out) {
+  for (int i = 0; i < count; i++) {
+    Vector2 value = v[i];
+    float length = sqrtf(value.x * value.x + value.y * value.y);
+    out[i] = (length > 0) ? (Vector2){value.x / length, value.y / length} : value;
+  }
+}
+
+EMSCRIPTEN_KEEPALIVE void Vector3NormalizeArray(const Vector3* v, int count, Vector3* out) {
+  for (int i = 0; i < count; i++) {
+    Vector3 value = v[i];
+    float length = sqrtf(value.x * value.x + value.y * value.y + value.z * value.z);
+    out[i] = (length > 0) ? (Vector3){value.x / length, value.y / length, value.z / length} : value;
+  }
+}
+
+EMSCRIPTEN_KEEPALIVE void Vector2LerpArray(const Vector2* v1, const Vector2* v2, int count, float amount, Vector2* out) {
+  for (int i = 0; i < count; i++)
+    out[i] = (Vector2){v1[i].x + amount * (v2[i].x - v1[i].x), v1[i].y + amount * (v2[i].y - v1[i].y)};
+}
+
+EMSCRIPTEN_KEEPALIVE void Vector3LerpArray(const Vector3* v1, const Vector3* v2, int count, float amount, Vector3* out) {
+  for (int i = 0; i < count; i++)
+    out[i] = (Vector3){v1[i].x + amount * (v2[i].x - v1[i].x), v1[i].y + amount * (v2[i].y - v1[i].y),
+                       v1[i].z + amount * (v2[i].z - v1[i].z)};
+}
+
+// like Vector2Transform, z = 0 and w = 1
+EMSCRIPTEN_KEEPALIVE void Vector2TransformArray(const Vector2* v, int count, const Matrix* mat, Vector2* out) {
+  Matrix m = *mat;
+  for (int i = 0; i < count; i++) {
+    Vector2 value = v[i];
+    out[i] = (Vector2){m.m0 * value.x + m.m4 * value.y + m.m12, m.m1 * value.x + m.m5 * value.y + m.m13};
+  }
+}
+
+// like Vector3Transform, w = 1
+EMSCRIPTEN_KEEPALIVE void Vector3TransformArray(const Vector3* v, int count, const Matrix* mat, Vector3* out) {
+  Matrix m = *mat;
+  for (int i = 0; i < count; i++) {
+    Vector3 value = v[i];
+    out[i] = (Vector3){m.m0 * value.x + m.m4 * value.y + m.m8 * value.z + m.m12,
+                       m.m1 * value.x + m.m5 * value.y + m.m9 * value.z + m.m13,
+                       m.m2 * value.x + m.m6 * value.y + m.m10 * value.z + m.m14};
+  }
+}
+
+// MatrixMultiply(left[i], right) for each matrix of left
+EMSCRIPTEN_KEEPALIVE void MatrixMultiplyArray(const Matrix* left, int count, const Matrix* right, Matrix* out) {
+  Matrix r = *right;
+  for (int i = 0; i < count; i++) {
+    Matrix l = left[i];
+    out[i] = (Matrix){
+        .m0 = l.m0 * r.m0 + l.m1 * r.m4 + l.m2 * r.m8 + l.m3 * r.m12,
+        .m4 = l.m4 * r.m0 + l.m5 * r.m4 + l.m6 * r.m8 + l.m7 * r.m12,
+        .m8 = l.m8 * r.m0 + l.m9 * r.m4 + l.m10 * r.m8 + l.m11 * r.m12,
+        .m12 = l.m12 * r.m0 + l.m13 * r.m4 + l.m14 * r.m8 + l.m15 * r.m12,
+        .m1 = l.m0 * r.m1 + l.m1 * r.m5 + l.m2 * r.m9 + l.m3 * r.m13,
+        .m5 = l.m4 * r.m1 + l.m5 * r.m5 + l.m6 * r.m9 + l.m7 * r.m13,
+        .m9 = l.m8 * r.m1 + l.m9 * r.m5 + l.m10 * r.m9 + l.m11 * r.m13,
+        .m13 = l.m12 * r.m1 + l.m13 * r.m5 + l.m14 * r.m9 + l.m15 * r.m13,
+        .m2 = l.m0 * r.m2 + l.m1 * r.m6 + l.m2 * r.m10 + l.m3 * r.m14,
+        .m6 = l.m4 * r.m2 + l.m5 * r.m6 + l.m6 * r.m10 + l.m7 * r.m14,
+        .m10 = l.m8 * r.m2 + l.m9 * r.m6 + l.m10 * r.m10 + l.m11 * r.m14,
+        .m14 = l.m12 * r.m2 + l.m13 * r.m6 + l.m14 * r.m10 + l.m15 * r.m14,
+        .m3 = l.m0 * r.m3 + l.m1 * r.m7 + l.m2 * r.m11 + l.m3 * r.m15,
+        .m7 = l.m4 * r.m3 + l.m5 * r.m7 + l.m6 * r.m11 + l.m7 * r.m15,
+        .m11 = l.m8 * r.m3 + l.m9 * r.m7 + l.m10 * r.m11 + l.m11 * r.m15,
+        .m15 = l.m12 * r.m3 + l.m13 * r.m7 + l.m14 * r.m11 + l.m15 * r.m15};
+  }
+}
+
+// One glyph of a text laid out for the python TextLayout: the glyph in the font and where it is drawn from the top
+// left of the text, at the fontSize of the layout
+typedef struct TextLayoutGlyph {
+  int index;
+  float x;
+  float y;
+} TextLayoutGlyph;
+
+_Static_assert(sizeof(TextLayoutGlyph) == 12, "TextLayoutGlyph must match TextLayout of the python wrapper");
+
+// Lay out text in lines of at most width (no wrapping when width <= 0), wrapped at the spaces like DrawTextBoxed or
+// inside a word longer than a line. The glyphs to draw go into glyphs (spaces take room but are not drawn) and size
+// gets the width and height of the text. Returns the count of glyphs, or -1 when there are more than capacity
+EMSCRIPTEN_KEEPALIVE int LayoutText(const Font* font, const char* text, float fontSize, float spacing, float width, TextLayoutGlyph* glyphs, int capacity, Vector2* size) {
+  float scaleFactor = fontSize / (float)font->baseSize;
+  float lineHeight = (font->baseSize + font->baseSize / 2.0f) * scaleFactor;
+  int length = TextLength(text);
+
+  int count = 0;
+  int lineStart = 0;    // first glyph of the current line
+  int wordStart = -1;   // first glyph after the last space of the current line, where the line can wrap
+  float x = 0.0f;
+  float y = 0.0f;
+
+  for (int i = 0; i < length;) {
+    int codepointByteCount = 0;
+    int codepoint = GetCodepointNext(&text[i], &codepointByteCount);
+    i += codepointByteCount;
+
+    if (codepoint == '\n') {
+      x = 0.0f;
+      y += lineHeight;
+      lineStart = count;
+      wordStart = -1;
+      continue;
+    }
+
+    int index = GetGlyphIndex(*font, codepoint);
+    float advance = ((font->glyphs[index].advanceX == 0) ? font->recs[index].width : (float)font->glyphs[index].advanceX) * scaleFactor;
+
+    if ((codepoint == ' ') || (codepoint == '\t')) {
+      if (x > 0.0f)
+        x += advance + spacing;  // no leading spaces
+      wordStart = count;
+      continue;
+    }
+
+    if ((width > 0.0f) && ((x + advance) > width) && (count > lineStart)) {
+      // wrap at the last space of the line, or here when the word doesn't fit in a line at all
+      int first = (wordStart > lineStart) ? wordStart : count;
+      float shift = (first < count) ? glyphs[first].x : x;
+      for (int g = first; g < count; g++) {
+        glyphs[g].x -= shift;
+        glyphs[g].y += lineHeight;
+      }
+      x -= shift;
+      y += lineHeight;
+      lineStart = first;
+      wordStart = -1;
+    }
+
+    if (count == capacity)
+      return -1;
+    glyphs[count++] = (TextLayoutGlyph){index, x, y};
+    x += advance + spacing;
+  }
+
+  float textWidth = 0.0f;
+  for (int g = 0; g < count; g++) {
+    int index = glyphs[g].index;
+    float advance = ((font->glyphs[index].advanceX == 0) ? font->recs[index].width : (float)font->glyphs[index].advanceX) * scaleFactor;
+    textWidth = fmaxf(textWidth, glyphs[g].x + advance);
+  }
+  *size = (Vector2){textWidth, (length > 0) ? y + fontSize : 0.0f};
+  return count;
+}
+
+// Draw the glyphs from LayoutText at (x, y), like DrawTextCodepoint does for each without looking its glyph up again
+EMSCRIPTEN_KEEPALIVE void DrawTextLayout(const Font* font, const TextLayoutGlyph* glyphs, int count, float fontSize, float x, float y, const Color* tint) {
+  float scaleFactor = fontSize / (float)font->baseSize;
+  float padding = (float)font->glyphPadding;
+
+  for (int i = 0; i < count; i++) {
+    int index = glyphs[i].index;
+    Rectangle rec = font->recs[index];
+    Rectangle source = {rec.x - padding, rec.y - padding, rec.width + 2.0f * padding, rec.height + 2.0f * padding};
+    Rectangle dest = {x + glyphs[i].x + (font->glyphs[index].offsetX - padding) * scaleFactor,
+                      y + glyphs[i].y + (font->glyphs[index].offsetY - padding) * scaleFactor,
+                      source.width * scaleFactor, source.height * scaleFactor};
+    DrawTexturePro(font->texture, source, dest, (Vector2){0.0f, 0.0f}, 0.0f, *tint);
+  }
+}
@@ -0,0 +1,945 @@
+// Generated by tools/code_generation/filesGeneration.py, do not edit by hand
+// Replays the draw calls recorded by the python CommandBuffer (see ReplayCommandBuffer in raylib.c)
+
+#pragma once
+
+#include <stddef.h>
+
+// every recorded argument takes one 4 bytes slot, structs and arrays hold their byte size and are copied
+// after the slots, so the replay sees them as they were when the call was recorded
+typedef union CommandSlot {
+  int i;
+  unsigned int u;
+  float f;
+} CommandSlot;
+
+// strings are stored NUL terminated right after the slots of their command
+#define COMMAND_STRING_SLOTS(length) (((length) + 4) / 4)
+#define COMMAND_DATA_SLOTS(size) (((size) + 3) / 4)
+
+// replay a single command, returns the slot of the next command or NULL for an unknown opcode
+static const CommandSlot* ReplayCommand(int opcode, const CommandSlot* slot) {
+  switch (opcode) {
+    case 0: {  // ClearBackground
+      const CommandSlot* next = slot + 1;
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      ClearBackground(*color);
+      return next;
+    }
+    case 1: {  // BeginMode2D
+      const CommandSlot* next = slot + 1;
+      const Camera2D* camera = (const Camera2D*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      BeginMode2D(*camera);
+      return next;
+    }
+    case 2: {  // EndMode2D
+      const CommandSlot* next = slot + 0;
+      EndMode2D();
+      return next;
+    }
+    case 3: {  // BeginMode3D
+      const CommandSlot* next = slot + 1;
+      const Camera3D* camera = (const Camera3D*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      BeginMode3D(*camera);
+      return next;
+    }
+    case 4: {  // EndMode3D
+      const CommandSlot* next = slot + 0;
+      EndMode3D();
+      return next;
+    }
+    case 5: {  // BeginTextureMode
+      const CommandSlot* next = slot + 1;
+      const RenderTexture2D* target = (const RenderTexture2D*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      BeginTextureMode(*target);
+      return next;
+    }
+    case 6: {  // EndTextureMode
+      const CommandSlot* next = slot + 0;
+      EndTextureMode();
+      return next;
+    }
+    case 7: {  // BeginShaderMode
+      const CommandSlot* next = slot + 1;
+      const Shader* shader = (const Shader*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      BeginShaderMode(*shader);
+      return next;
+    }
+    case 8: {  // EndShaderMode
+      const CommandSlot* next = slot + 0;
+      EndShaderMode();
+      return next;
+    }
+    case 9: {  // BeginBlendMode
+      const CommandSlot* next = slot + 1;
+      BeginBlendMode(slot[0].i);
+      return next;
+    }
+    case 10: {  // EndBlendMode
+      const CommandSlot* next = slot + 0;
+      EndBlendMode();
+      return next;
+    }
+    case 11: {  // BeginScissorMode
+      const CommandSlot* next = slot + 4;
+      BeginScissorMode(slot[0].i, slot[1].i, slot[2].i, slot[3].i);
+      return next;
+    }
+    case 12: {  // EndScissorMode
+      const CommandSlot* next = slot + 0;
+      EndScissorMode();
+      return next;
+    }
+    case 13: {  // BeginVrStereoMode
+      const CommandSlot* next = slot + 1;
+      const VrStereoConfig* config = (const VrStereoConfig*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      BeginVrStereoMode(*config);
+      return next;
+    }
+    case 14: {  // EndVrStereoMode
+      const CommandSlot* next = slot + 0;
+      EndVrStereoMode();
+      return next;
+    }
+    case 15: {  // DrawPixel
+      const CommandSlot* next = slot + 3;
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      DrawPixel(slot[0].i, slot[1].i, *color);
+      return next;
+    }
+    case 16: {  // DrawPixelV
+      const CommandSlot* next = slot + 2;
+      const Vector2* position = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      DrawPixelV(*position, *color);
+      return next;
+    }
+    case 17: {  // DrawLine
+      const CommandSlot* next = slot + 5;
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      DrawLine(slot[0].i, slot[1].i, slot[2].i, slot[3].i, *color);
+      return next;
+    }
+    case 18: {  // DrawLineV
+      const CommandSlot* next = slot + 3;
+      const Vector2* startPos = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector2* endPos = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      DrawLineV(*startPos, *endPos, *color);
+      return next;
+    }
+    case 19: {  // DrawLineEx
+      const CommandSlot* next = slot + 4;
+      const Vector2* startPos = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector2* endPos = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[3].u);
+      DrawLineEx(*startPos, *endPos, slot[2].f, *color);
+      return next;
+    }
+    case 20: {  // DrawLineBezier
+      const CommandSlot* next = slot + 4;
+      const Vector2* startPos = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector2* endPos = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[3].u);
+      DrawLineBezier(*startPos, *endPos, slot[2].f, *color);
+      return next;
+    }
+    case 21: {  // DrawLineBezierQuad
+      const CommandSlot* next = slot + 5;
+      const Vector2* startPos = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector2* endPos = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Vector2* controlPos = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      DrawLineBezierQuad(*startPos, *endPos, *controlPos, slot[3].f, *color);
+      return next;
+    }
+    case 22: {  // DrawLineBezierCubic
+      const CommandSlot* next = slot + 6;
+      const Vector2* startPos = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector2* endPos = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Vector2* startControlPos = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      const Vector2* endControlPos = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[3].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[5].u);
+      DrawLineBezierCubic(*startPos, *endPos, *startControlPos, *endControlPos, slot[4].f, *color);
+      return next;
+    }
+    case 23: {  // DrawLineStrip
+      const CommandSlot* next = slot + 3;
+      Vector2 * points = (Vector2 *)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      DrawLineStrip(points, slot[1].i, *color);
+      return next;
+    }
+    case 24: {  // DrawCircle
+      const CommandSlot* next = slot + 4;
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[3].u);
+      DrawCircle(slot[0].i, slot[1].i, slot[2].f, *color);
+      return next;
+    }
+    case 25: {  // DrawCircleSector
+      const CommandSlot* next = slot + 6;
+      const Vector2* center = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[5].u);
+      DrawCircleSector(*center, slot[1].f, slot[2].f, slot[3].f, slot[4].i, *color);
+      return next;
+    }
+    case 26: {  // DrawCircleSectorLines
+      const CommandSlot* next = slot + 6;
+      const Vector2* center = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[5].u);
+      DrawCircleSectorLines(*center, slot[1].f, slot[2].f, slot[3].f, slot[4].i, *color);
+      return next;
+    }
+    case 27: {  // DrawCircleGradient
+      const CommandSlot* next = slot + 5;
+      const Color* color1 = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[3].u);
+      const Color* color2 = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      DrawCircleGradient(slot[0].i, slot[1].i, slot[2].f, *color1, *color2);
+      return next;
+    }
+    case 28: {  // DrawCircleV
+      const CommandSlot* next = slot + 3;
+      const Vector2* center = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      DrawCircleV(*center, slot[1].f, *color);
+      return next;
+    }
+    case 29: {  // DrawCircleLines
+      const CommandSlot* next = slot + 4;
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[3].u);
+      DrawCircleLines(slot[0].i, slot[1].i, slot[2].f, *color);
+      return next;
+    }
+    case 30: {  // DrawEllipse
+      const CommandSlot* next = slot + 5;
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      DrawEllipse(slot[0].i, slot[1].i, slot[2].f, slot[3].f, *color);
+      return next;
+    }
+    case 31: {  // DrawEllipseLines
+      const CommandSlot* next = slot + 5;
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      DrawEllipseLines(slot[0].i, slot[1].i, slot[2].f, slot[3].f, *color);
+      return next;
+    }
+    case 32: {  // DrawRing
+      const CommandSlot* next = slot + 7;
+      const Vector2* center = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[6].u);
+      DrawRing(*center, slot[1].f, slot[2].f, slot[3].f, slot[4].f, slot[5].i, *color);
+      return next;
+    }
+    case 33: {  // DrawRingLines
+      const CommandSlot* next = slot + 7;
+      const Vector2* center = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[6].u);
+      DrawRingLines(*center, slot[1].f, slot[2].f, slot[3].f, slot[4].f, slot[5].i, *color);
+      return next;
+    }
+    case 34: {  // DrawRectangle
+      const CommandSlot* next = slot + 5;
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      DrawRectangle(slot[0].i, slot[1].i, slot[2].i, slot[3].i, *color);
+      return next;
+    }
+    case 35: {  // DrawRectangleV
+      const CommandSlot* next = slot + 3;
+      const Vector2* position = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector2* size = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      DrawRectangleV(*position, *size, *color);
+      return next;
+    }
+    case 36: {  // DrawRectangleRec
+      const CommandSlot* next = slot + 2;
+      const Rectangle* rec = (const Rectangle*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      DrawRectangleRec(*rec, *color);
+      return next;
+    }
+    case 37: {  // DrawRectanglePro
+      const CommandSlot* next = slot + 4;
+      const Rectangle* rec = (const Rectangle*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector2* origin = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[3].u);
+      DrawRectanglePro(*rec, *origin, slot[2].f, *color);
+      return next;
+    }
+    case 38: {  // DrawRectangleGradientV
+      const CommandSlot* next = slot + 6;
+      const Color* color1 = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      const Color* color2 = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[5].u);
+      DrawRectangleGradientV(slot[0].i, slot[1].i, slot[2].i, slot[3].i, *color1, *color2);
+      return next;
+    }
+    case 39: {  // DrawRectangleGradientH
+      const CommandSlot* next = slot + 6;
+      const Color* color1 = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      const Color* color2 = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[5].u);
+      DrawRectangleGradientH(slot[0].i, slot[1].i, slot[2].i, slot[3].i, *color1, *color2);
+      return next;
+    }
+    case 40: {  // DrawRectangleGradientEx
+      const CommandSlot* next = slot + 5;
+      const Rectangle* rec = (const Rectangle*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* col1 = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Color* col2 = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      const Color* col3 = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[3].u);
+      const Color* col4 = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      DrawRectangleGradientEx(*rec, *col1, *col2, *col3, *col4);
+      return next;
+    }
+    case 41: {  // DrawRectangleLines
+      const CommandSlot* next = slot + 5;
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      DrawRectangleLines(slot[0].i, slot[1].i, slot[2].i, slot[3].i, *color);
+      return next;
+    }
+    case 42: {  // DrawRectangleLinesEx
+      const CommandSlot* next = slot + 3;
+      const Rectangle* rec = (const Rectangle*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      DrawRectangleLinesEx(*rec, slot[1].f, *color);
+      return next;
+    }
+    case 43: {  // DrawRectangleRounded
+      const CommandSlot* next = slot + 4;
+      const Rectangle* rec = (const Rectangle*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[3].u);
+      DrawRectangleRounded(*rec, slot[1].f, slot[2].i, *color);
+      return next;
+    }
+    case 44: {  // DrawRectangleRoundedLines
+      const CommandSlot* next = slot + 5;
+      const Rectangle* rec = (const Rectangle*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      DrawRectangleRoundedLines(*rec, slot[1].f, slot[2].i, slot[3].f, *color);
+      return next;
+    }
+    case 45: {  // DrawTriangle
+      const CommandSlot* next = slot + 4;
+      const Vector2* v1 = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector2* v2 = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Vector2* v3 = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[3].u);
+      DrawTriangle(*v1, *v2, *v3, *color);
+      return next;
+    }
+    case 46: {  // DrawTriangleLines
+      const CommandSlot* next = slot + 4;
+      const Vector2* v1 = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector2* v2 = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Vector2* v3 = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[3].u);
+      DrawTriangleLines(*v1, *v2, *v3, *color);
+      return next;
+    }
+    case 47: {  // DrawTriangleFan
+      const CommandSlot* next = slot + 3;
+      Vector2 * points = (Vector2 *)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      DrawTriangleFan(points, slot[1].i, *color);
+      return next;
+    }
+    case 48: {  // DrawTriangleStrip
+      const CommandSlot* next = slot + 3;
+      Vector2 * points = (Vector2 *)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      DrawTriangleStrip(points, slot[1].i, *color);
+      return next;
+    }
+    case 49: {  // DrawPoly
+      const CommandSlot* next = slot + 5;
+      const Vector2* center = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      DrawPoly(*center, slot[1].i, slot[2].f, slot[3].f, *color);
+      return next;
+    }
+    case 50: {  // DrawPolyLines
+      const CommandSlot* next = slot + 5;
+      const Vector2* center = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      DrawPolyLines(*center, slot[1].i, slot[2].f, slot[3].f, *color);
+      return next;
+    }
+    case 51: {  // DrawPolyLinesEx
+      const CommandSlot* next = slot + 6;
+      const Vector2* center = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[5].u);
+      DrawPolyLinesEx(*center, slot[1].i, slot[2].f, slot[3].f, slot[4].f, *color);
+      return next;
+    }
+    case 52: {  // DrawTexture
+      const CommandSlot* next = slot + 4;
+      const Texture2D* texture = (const Texture2D*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* tint = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[3].u);
+      DrawTexture(*texture, slot[1].i, slot[2].i, *tint);
+      return next;
+    }
+    case 53: {  // DrawTextureV
+      const CommandSlot* next = slot + 3;
+      const Texture2D* texture = (const Texture2D*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector2* position = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Color* tint = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      DrawTextureV(*texture, *position, *tint);
+      return next;
+    }
+    case 54: {  // DrawTextureEx
+      const CommandSlot* next = slot + 5;
+      const Texture2D* texture = (const Texture2D*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector2* position = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Color* tint = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      DrawTextureEx(*texture, *position, slot[2].f, slot[3].f, *tint);
+      return next;
+    }
+    case 55: {  // DrawTextureRec
+      const CommandSlot* next = slot + 4;
+      const Texture2D* texture = (const Texture2D*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Rectangle* source = (const Rectangle*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Vector2* position = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      const Color* tint = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[3].u);
+      DrawTextureRec(*texture, *source, *position, *tint);
+      return next;
+    }
+    case 56: {  // DrawTexturePro
+      const CommandSlot* next = slot + 6;
+      const Texture2D* texture = (const Texture2D*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Rectangle* source = (const Rectangle*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Rectangle* dest = (const Rectangle*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      const Vector2* origin = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[3].u);
+      const Color* tint = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[5].u);
+      DrawTexturePro(*texture, *source, *dest, *origin, slot[4].f, *tint);
+      return next;
+    }
+    case 57: {  // DrawTextureNPatch
+      const CommandSlot* next = slot + 6;
+      const Texture2D* texture = (const Texture2D*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const NPatchInfo* nPatchInfo = (const NPatchInfo*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Rectangle* dest = (const Rectangle*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      const Vector2* origin = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[3].u);
+      const Color* tint = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[5].u);
+      DrawTextureNPatch(*texture, *nPatchInfo, *dest, *origin, slot[4].f, *tint);
+      return next;
+    }
+    case 58: {  // DrawFPS
+      const CommandSlot* next = slot + 2;
+      DrawFPS(slot[0].i, slot[1].i);
+      return next;
+    }
+    case 59: {  // DrawText
+      const CommandSlot* next = slot + 5;
+      const char* text = (const char*)next;
+      next += COMMAND_STRING_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      DrawText(text, slot[1].i, slot[2].i, slot[3].i, *color);
+      return next;
+    }
+    case 60: {  // DrawTextEx
+      const CommandSlot* next = slot + 6;
+      const Font* font = (const Font*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const char* text = (const char*)next;
+      next += COMMAND_STRING_SLOTS(slot[1].u);
+      const Vector2* position = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      const Color* tint = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[5].u);
+      DrawTextEx(*font, text, *position, slot[3].f, slot[4].f, *tint);
+      return next;
+    }
+    case 61: {  // DrawTextPro
+      const CommandSlot* next = slot + 8;
+      const Font* font = (const Font*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const char* text = (const char*)next;
+      next += COMMAND_STRING_SLOTS(slot[1].u);
+      const Vector2* position = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      const Vector2* origin = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[3].u);
+      const Color* tint = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[7].u);
+      DrawTextPro(*font, text, *position, *origin, slot[4].f, slot[5].f, slot[6].f, *tint);
+      return next;
+    }
+    case 62: {  // DrawTextCodepoint
+      const CommandSlot* next = slot + 5;
+      const Font* font = (const Font*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector2* position = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      const Color* tint = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      DrawTextCodepoint(*font, slot[1].i, *position, slot[3].f, *tint);
+      return next;
+    }
+    case 63: {  // DrawTextCodepoints
+      const CommandSlot* next = slot + 7;
+      const Font* font = (const Font*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const int * codepoints = (const int *)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Vector2* position = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[3].u);
+      const Color* tint = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[6].u);
+      DrawTextCodepoints(*font, codepoints, slot[2].i, *position, slot[4].f, slot[5].f, *tint);
+      return next;
+    }
+    case 64: {  // DrawLine3D
+      const CommandSlot* next = slot + 3;
+      const Vector3* startPos = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector3* endPos = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      DrawLine3D(*startPos, *endPos, *color);
+      return next;
+    }
+    case 65: {  // DrawPoint3D
+      const CommandSlot* next = slot + 2;
+      const Vector3* position = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      DrawPoint3D(*position, *color);
+      return next;
+    }
+    case 66: {  // DrawCircle3D
+      const CommandSlot* next = slot + 5;
+      const Vector3* center = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector3* rotationAxis = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      DrawCircle3D(*center, slot[1].f, *rotationAxis, slot[3].f, *color);
+      return next;
+    }
+    case 67: {  // DrawTriangle3D
+      const CommandSlot* next = slot + 4;
+      const Vector3* v1 = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector3* v2 = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Vector3* v3 = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[3].u);
+      DrawTriangle3D(*v1, *v2, *v3, *color);
+      return next;
+    }
+    case 68: {  // DrawTriangleStrip3D
+      const CommandSlot* next = slot + 3;
+      Vector3 * points = (Vector3 *)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      DrawTriangleStrip3D(points, slot[1].i, *color);
+      return next;
+    }
+    case 69: {  // DrawCube
+      const CommandSlot* next = slot + 5;
+      const Vector3* position = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      DrawCube(*position, slot[1].f, slot[2].f, slot[3].f, *color);
+      return next;
+    }
+    case 70: {  // DrawCubeV
+      const CommandSlot* next = slot + 3;
+      const Vector3* position = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector3* size = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      DrawCubeV(*position, *size, *color);
+      return next;
+    }
+    case 71: {  // DrawCubeWires
+      const CommandSlot* next = slot + 5;
+      const Vector3* position = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      DrawCubeWires(*position, slot[1].f, slot[2].f, slot[3].f, *color);
+      return next;
+    }
+    case 72: {  // DrawCubeWiresV
+      const CommandSlot* next = slot + 3;
+      const Vector3* position = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector3* size = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      DrawCubeWiresV(*position, *size, *color);
+      return next;
+    }
+    case 73: {  // DrawSphere
+      const CommandSlot* next = slot + 3;
+      const Vector3* centerPos = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      DrawSphere(*centerPos, slot[1].f, *color);
+      return next;
+    }
+    case 74: {  // DrawSphereEx
+      const CommandSlot* next = slot + 5;
+      const Vector3* centerPos = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      DrawSphereEx(*centerPos, slot[1].f, slot[2].i, slot[3].i, *color);
+      return next;
+    }
+    case 75: {  // DrawSphereWires
+      const CommandSlot* next = slot + 5;
+      const Vector3* centerPos = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      DrawSphereWires(*centerPos, slot[1].f, slot[2].i, slot[3].i, *color);
+      return next;
+    }
+    case 76: {  // DrawCylinder
+      const CommandSlot* next = slot + 6;
+      const Vector3* position = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[5].u);
+      DrawCylinder(*position, slot[1].f, slot[2].f, slot[3].f, slot[4].i, *color);
+      return next;
+    }
+    case 77: {  // DrawCylinderEx
+      const CommandSlot* next = slot + 6;
+      const Vector3* startPos = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector3* endPos = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[5].u);
+      DrawCylinderEx(*startPos, *endPos, slot[2].f, slot[3].f, slot[4].i, *color);
+      return next;
+    }
+    case 78: {  // DrawCylinderWires
+      const CommandSlot* next = slot + 6;
+      const Vector3* position = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[5].u);
+      DrawCylinderWires(*position, slot[1].f, slot[2].f, slot[3].f, slot[4].i, *color);
+      return next;
+    }
+    case 79: {  // DrawCylinderWiresEx
+      const CommandSlot* next = slot + 6;
+      const Vector3* startPos = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector3* endPos = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[5].u);
+      DrawCylinderWiresEx(*startPos, *endPos, slot[2].f, slot[3].f, slot[4].i, *color);
+      return next;
+    }
+    case 80: {  // DrawCapsule
+      const CommandSlot* next = slot + 6;
+      const Vector3* startPos = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector3* endPos = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[5].u);
+      DrawCapsule(*startPos, *endPos, slot[2].f, slot[3].i, slot[4].i, *color);
+      return next;
+    }
+    case 81: {  // DrawCapsuleWires
+      const CommandSlot* next = slot + 6;
+      const Vector3* startPos = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector3* endPos = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[5].u);
+      DrawCapsuleWires(*startPos, *endPos, slot[2].f, slot[3].i, slot[4].i, *color);
+      return next;
+    }
+    case 82: {  // DrawPlane
+      const CommandSlot* next = slot + 3;
+      const Vector3* centerPos = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector2* size = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      DrawPlane(*centerPos, *size, *color);
+      return next;
+    }
+    case 83: {  // DrawRay
+      const CommandSlot* next = slot + 2;
+      const Ray* ray = (const Ray*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      DrawRay(*ray, *color);
+      return next;
+    }
+    case 84: {  // DrawGrid
+      const CommandSlot* next = slot + 2;
+      DrawGrid(slot[0].i, slot[1].f);
+      return next;
+    }
+    case 85: {  // DrawModel
+      const CommandSlot* next = slot + 4;
+      const Model* model = (const Model*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector3* position = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Color* tint = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[3].u);
+      DrawModel(*model, *position, slot[2].f, *tint);
+      return next;
+    }
+    case 86: {  // DrawModelEx
+      const CommandSlot* next = slot + 6;
+      const Model* model = (const Model*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector3* position = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Vector3* rotationAxis = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      const Vector3* scale = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      const Color* tint = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[5].u);
+      DrawModelEx(*model, *position, *rotationAxis, slot[3].f, *scale, *tint);
+      return next;
+    }
+    case 87: {  // DrawModelWires
+      const CommandSlot* next = slot + 4;
+      const Model* model = (const Model*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector3* position = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Color* tint = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[3].u);
+      DrawModelWires(*model, *position, slot[2].f, *tint);
+      return next;
+    }
+    case 88: {  // DrawModelWiresEx
+      const CommandSlot* next = slot + 6;
+      const Model* model = (const Model*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Vector3* position = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Vector3* rotationAxis = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      const Vector3* scale = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      const Color* tint = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[5].u);
+      DrawModelWiresEx(*model, *position, *rotationAxis, slot[3].f, *scale, *tint);
+      return next;
+    }
+    case 89: {  // DrawBoundingBox
+      const CommandSlot* next = slot + 2;
+      const BoundingBox* box = (const BoundingBox*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Color* color = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      DrawBoundingBox(*box, *color);
+      return next;
+    }
+    case 90: {  // DrawBillboard
+      const CommandSlot* next = slot + 5;
+      const Camera* camera = (const Camera*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Texture2D* texture = (const Texture2D*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Vector3* position = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      const Color* tint = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      DrawBillboard(*camera, *texture, *position, slot[3].f, *tint);
+      return next;
+    }
+    case 91: {  // DrawBillboardRec
+      const CommandSlot* next = slot + 6;
+      const Camera* camera = (const Camera*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Texture2D* texture = (const Texture2D*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Rectangle* source = (const Rectangle*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      const Vector3* position = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[3].u);
+      const Vector2* size = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      const Color* tint = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[5].u);
+      DrawBillboardRec(*camera, *texture, *source, *position, *size, *tint);
+      return next;
+    }
+    case 92: {  // DrawBillboardPro
+      const CommandSlot* next = slot + 9;
+      const Camera* camera = (const Camera*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Texture2D* texture = (const Texture2D*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Rectangle* source = (const Rectangle*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      const Vector3* position = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[3].u);
+      const Vector3* up = (const Vector3*)next;
+      next += COMMAND_DATA_SLOTS(slot[4].u);
+      const Vector2* size = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[5].u);
+      const Vector2* origin = (const Vector2*)next;
+      next += COMMAND_DATA_SLOTS(slot[6].u);
+      const Color* tint = (const Color*)next;
+      next += COMMAND_DATA_SLOTS(slot[8].u);
+      DrawBillboardPro(*camera, *texture, *source, *position, *up, *size, *origin, slot[7].f, *tint);
+      return next;
+    }
+    case 93: {  // DrawMesh
+      const CommandSlot* next = slot + 3;
+      const Mesh* mesh = (const Mesh*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Material* material = (const Material*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Matrix* transform = (const Matrix*)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      DrawMesh(*mesh, *material, *transform);
+      return next;
+    }
+    case 94: {  // DrawMeshInstanced
+      const CommandSlot* next = slot + 4;
+      const Mesh* mesh = (const Mesh*)next;
+      next += COMMAND_DATA_SLOTS(slot[0].u);
+      const Material* material = (const Material*)next;
+      next += COMMAND_DATA_SLOTS(slot[1].u);
+      const Matrix * transforms = (const Matrix *)next;
+      next += COMMAND_DATA_SLOTS(slot[2].u);
+      DrawMeshInstanced(*mesh, *material, transforms, slot[3].i);
+      return next;
+    }
+    default:
+      return NULL;
+  }
+}
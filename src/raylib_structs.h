@@ -0,0 +1,43 @@
+// Generated by tools/code_generation/filesGeneration.py, do not edit by hand
+// Layout of the raylib structs as the C compiler sees it, the python wrapper checks its own layout against it
+
+#pragma once
+
+#include <stddef.h>
+
+// the number of values that follow, then for every struct: sizeof, then offsetof of each member
+static const int StructLayouts[] = {
+  192,
+  sizeof(Vector2), offsetof(Vector2, x), offsetof(Vector2, y),
+  sizeof(Vector3), offsetof(Vector3, x), offsetof(Vector3, y), offsetof(Vector3, z),
+  sizeof(Vector4), offsetof(Vector4, x), offsetof(Vector4, y), offsetof(Vector4, z), offsetof(Vector4, w),
+  sizeof(Matrix), offsetof(Matrix, m0), offsetof(Matrix, m4), offsetof(Matrix, m8), offsetof(Matrix, m12), offsetof(Matrix, m1), offsetof(Matrix, m5), offsetof(Matrix, m9), offsetof(Matrix, m13), offsetof(Matrix, m2), offsetof(Matrix, m6), offsetof(Matrix, m10), offsetof(Matrix, m14), offsetof(Matrix, m3), offsetof(Matrix, m7), offsetof(Matrix, m11), offsetof(Matrix, m15),
+  sizeof(Color), offsetof(Color, r), offsetof(Color, g), offsetof(Color, b), offsetof(Color, a),
+  sizeof(Rectangle), offsetof(Rectangle, x), offsetof(Rectangle, y), offsetof(Rectangle, width), offsetof(Rectangle, height),
+  sizeof(Image), offsetof(Image, data), offsetof(Image, width), offsetof(Image, height), offsetof(Image, mipmaps), offsetof(Image, format),
+  sizeof(Texture), offsetof(Texture, id), offsetof(Texture, width), offsetof(Texture, height), offsetof(Texture, mipmaps), offsetof(Texture, format),
+  sizeof(RenderTexture), offsetof(RenderTexture, id), offsetof(RenderTexture, texture), offsetof(RenderTexture, depth),
+  sizeof(NPatchInfo), offsetof(NPatchInfo, source), offsetof(NPatchInfo, left), offsetof(NPatchInfo, top), offsetof(NPatchInfo, right), offsetof(NPatchInfo, bottom), offsetof(NPatchInfo, layout),
+  sizeof(GlyphInfo), offsetof(GlyphInfo, value), offsetof(GlyphInfo, offsetX), offsetof(GlyphInfo, offsetY), offsetof(GlyphInfo, advanceX), offsetof(GlyphInfo, image),
+  sizeof(Font), offsetof(Font, baseSize), offsetof(Font, glyphCount), offsetof(Font, glyphPadding), offsetof(Font, texture), offsetof(Font, recs), offsetof(Font, glyphs),
+  sizeof(Camera3D), offsetof(Camera3D, position), offsetof(Camera3D, target), offsetof(Camera3D, up), offsetof(Camera3D, fovy), offsetof(Camera3D, projection),
+  sizeof(Camera2D), offsetof(Camera2D, offset), offsetof(Camera2D, target), offsetof(Camera2D, rotation), offsetof(Camera2D, zoom),
+  sizeof(Mesh), offsetof(Mesh, vertexCount), offsetof(Mesh, triangleCount), offsetof(Mesh, vertices), offsetof(Mesh, texcoords), offsetof(Mesh, texcoords2), offsetof(Mesh, normals), offsetof(Mesh, tangents), offsetof(Mesh, colors), offsetof(Mesh, indices), offsetof(Mesh, animVertices), offsetof(Mesh, animNormals), offsetof(Mesh, boneIds), offsetof(Mesh, boneWeights), offsetof(Mesh, vaoId), offsetof(Mesh, vboId),
+  sizeof(Shader), offsetof(Shader, id), offsetof(Shader, locs),
+  sizeof(MaterialMap), offsetof(MaterialMap, texture), offsetof(MaterialMap, color), offsetof(MaterialMap, value),
+  sizeof(Material), offsetof(Material, shader), offsetof(Material, maps), offsetof(Material, params),
+  sizeof(Transform), offsetof(Transform, translation), offsetof(Transform, rotation), offsetof(Transform, scale),
+  sizeof(BoneInfo), offsetof(BoneInfo, name), offsetof(BoneInfo, parent),
+  sizeof(Model), offsetof(Model, transform), offsetof(Model, meshCount), offsetof(Model, materialCount), offsetof(Model, meshes), offsetof(Model, materials), offsetof(Model, meshMaterial), offsetof(Model, boneCount), offsetof(Model, bones), offsetof(Model, bindPose),
+  sizeof(ModelAnimation), offsetof(ModelAnimation, boneCount), offsetof(ModelAnimation, frameCount), offsetof(ModelAnimation, bones), offsetof(ModelAnimation, framePoses), offsetof(ModelAnimation, name),
+  sizeof(Ray), offsetof(Ray, position), offsetof(Ray, direction),
+  sizeof(RayCollision), offsetof(RayCollision, hit), offsetof(RayCollision, distance), offsetof(RayCollision, point), offsetof(RayCollision, normal),
+  sizeof(BoundingBox), offsetof(BoundingBox, min), offsetof(BoundingBox, max),
+  sizeof(Wave), offsetof(Wave, frameCount), offsetof(Wave, sampleRate), offsetof(Wave, sampleSize), offsetof(Wave, channels), offsetof(Wave, data),
+  sizeof(AudioStream), offsetof(AudioStream, buffer), offsetof(AudioStream, processor), offsetof(AudioStream, sampleRate), offsetof(AudioStream, sampleSize), offsetof(AudioStream, channels),
+  sizeof(Sound), offsetof(Sound, stream), offsetof(Sound, frameCount),
+  sizeof(Music), offsetof(Music, stream), offsetof(Music, frameCount), offsetof(Music, looping), offsetof(Music, ctxType), offsetof(Music, ctxData),
+  sizeof(VrDeviceInfo), offsetof(VrDeviceInfo, hResolution), offsetof(VrDeviceInfo, vResolution), offsetof(VrDeviceInfo, hScreenSize), offsetof(VrDeviceInfo, vScreenSize), offsetof(VrDeviceInfo, vScreenCenter), offsetof(VrDeviceInfo, eyeToScreenDistance), offsetof(VrDeviceInfo, lensSeparationDistance), offsetof(VrDeviceInfo, interpupillaryDistance), offsetof(VrDeviceInfo, lensDistortionValues), offsetof(VrDeviceInfo, chromaAbCorrection),
+  sizeof(VrStereoConfig), offsetof(VrStereoConfig, projection), offsetof(VrStereoConfig, viewOffset), offsetof(VrStereoConfig, leftLensCenter), offsetof(VrStereoConfig, rightLensCenter), offsetof(VrStereoConfig, leftScreenCenter), offsetof(VrStereoConfig, rightScreenCenter), offsetof(VrStereoConfig, scale), offsetof(VrStereoConfig, scaleIn),
+  sizeof(FilePathList), offsetof(FilePathList, capacity), offsetof(FilePathList, count), offsetof(FilePathList, paths),
+};
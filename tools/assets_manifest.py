@@ -0,0 +1,42 @@
+"""Write the asset manifest of a game: the SHA-256 of each file of its assets folder, by url
+
+python3 assets_manifest.py docs/examples/my_game/resources --prefix resources/ -o docs/examples/my_game/assets.json
+
+AssetLoader(manifest="assets.json") keeps the assets it lists in Cache Storage by their hash, the urls in the manifest
+are the ones the game asks for (relative to its page), so --prefix is the path of the folder from the page.
+"""
+import argparse
+import hashlib
+import json
+from pathlib import Path
+
+
+def file_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open('rb') as file:
+        for chunk in iter(lambda: file.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def assets_manifest(folder: Path, prefix: str) -> dict[str, str]:
+    return {prefix + path.relative_to(folder).as_posix(): file_hash(path)
+            for path in sorted(folder.rglob('*')) if path.is_file()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("folder", type=Path, help="the assets folder")
+    parser.add_argument("--prefix", default="", help="url of the folder relative to the page, like resources/")
+    parser.add_argument("-o", "--output", type=Path, help="the manifest file, printed when not given")
+    arguments = parser.parse_args()
+
+    manifest = json.dumps(assets_manifest(arguments.folder, arguments.prefix), indent=2) + '\n'
+    if arguments.output is None:
+        print(manifest, end='')
+    else:
+        arguments.output.write_text(manifest)
+
+
+if __name__ == '__main__':
+    main()
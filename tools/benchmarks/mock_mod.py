@@ -0,0 +1,121 @@
+import re
+import struct
+from pathlib import Path
+
+BUILD_SCRIPT_PATH = Path(__file__).parent.parent / 'build.sh'
+DOCS_RAYLIB_JS_PATH = Path(__file__).parent.parent.parent / 'docs' / 'raylib.js'
+
+# the struct layout table is not mocked, the wrapper skips its check when the wasm doesn't export it
+NOT_MOCKED_FUNCTIONS_NAMES = ["_GetStructLayouts"]
+
+
+def exported_functions_names() -> list[str]:
+    """the functions tools/build.sh exports from the raylib wasm"""
+    match = re.search(r"EXPORTED_FUNCTIONS=(\S+)", BUILD_SCRIPT_PATH.read_text())
+    return [name.strip("'\"") for name in match.group(1).split(',')]
+
+
+def shipped_functions_names() -> list[str]:
+    """the functions of tools/build.sh the wasm in docs exports, the pages can't call the ones it was built without"""
+    exports = set(re.findall(r'Module\["(_\w+)"\]', DOCS_RAYLIB_JS_PATH.read_text()))
+    return [name for name in exported_functions_names() if name in exports]
+
+
+class MockSubarray:
+    """pyodide's TypedArray.subarray() of HEAPU8, only what the wrapper uses"""
+
+    def __init__(self, memory: bytearray, begin: int, end: int):
+        self._memory = memory
+        self._begin = begin
+        self._end = end
+
+    def assign(self, data):
+        self._memory[self._begin:self._end] = memoryview(data).cast('B')
+
+    def assign_to(self, data):
+        memoryview(data).cast('B')[:] = self._memory[self._begin:self._end]
+
+
+class MockHeapU8:
+    def __init__(self, memory: bytearray):
+        self._memory = memory
+        self._view = memoryview(memory)
+
+    def __getitem__(self, index: int):
+        return self._view[index]
+
+    def __setitem__(self, index: int, value: int):
+        self._view[index] = value
+
+    def subarray(self, begin: int, end: int) -> MockSubarray:
+        return MockSubarray(self._memory, begin, end)
+
+    def fill(self, value: int, begin: int, end: int):
+        self._memory[begin:end] = bytes([value]) * (end - begin)
+
+
+class MockDataView:
+    """the DataView python-raylib-web.js keeps as mod.mem, for values that are not aligned to their size"""
+
+    def __init__(self, memory: bytearray):
+        self._memory = memory
+        for name, format_character in [("Int8", "b"), ("Uint8", "B"), ("Int16", "h"), ("Uint16", "H"), ("Int32", "i"),
+                                       ("Uint32", "I"), ("Float32", "f"), ("Float64", "d")]:
+            item = struct.Struct("<" + format_character)
+            setattr(self, f"get{name}", lambda address, little_endian=True, item=item: item.unpack_from(memory, address)[0])
+            setattr(self, f"set{name}", lambda address, value, little_endian=True, item=item: item.pack_into(memory, address, value))
+
+
+class MockModule:
+    """Stands in for the emscripten module of the raylib wasm (_mod): a bytearray heap, malloc/free with free lists
+    and the exported raylib functions as no-ops that return 0, so the wrapper runs in CPython without a browser
+
+    functions_names are the exported functions, by default the ones of docs/raylib.wasm: the wrapper falls back like
+    it does on the pages for the ones it lacks"""
+
+    def __init__(self, memory_size: int = 64 * 1024 * 1024, functions_names: list[str] = None):
+        self.memory = bytearray(memory_size)
+        self._top = 8
+        self._free_lists = {}  # size -> freed addresses
+        self._sizes = {}  # address -> size
+        self.calls = 0  # calls of the no-op raylib functions
+
+        view = memoryview(self.memory)
+        self.HEAP8 = view.cast('b')
+        self.HEAPU8 = MockHeapU8(self.memory)
+        self.HEAP16 = view.cast('h')
+        self.HEAPU16 = view.cast('H')
+        self.HEAP32 = view.cast('i')
+        self.HEAPU32 = view.cast('I')
+        self.HEAPF32 = view.cast('f')
+        self.HEAPF64 = view.cast('d')
+        self.mem = MockDataView(self.memory)
+        self.onMemoryGrowth = None
+
+        for name in shipped_functions_names() if functions_names is None else functions_names:
+            if name not in NOT_MOCKED_FUNCTIONS_NAMES and not hasattr(self, name):
+                setattr(self, name, self._no_op)
+
+    def _no_op(self, *args):
+        self.calls += 1
+        return 0
+
+    def _malloc(self, size: int) -> int:
+        size = (size + 7) & ~7
+        free_list = self._free_lists.get(size)
+        if free_list:
+            return free_list.pop()
+        address = self._top
+        self._top += size
+        if self._top > len(self.memory):
+            raise MemoryError("the mock wasm heap is full")
+        self._sizes[address] = size
+        return address
+
+    def _free(self, address: int):
+        if address != 0:
+            self._free_lists.setdefault(self._sizes[address], []).append(address)
+
+    def _memcpy(self, destination: int, source: int, size: int) -> int:
+        self.memory[destination:destination + size] = self.memory[source:source + size]
+        return destination
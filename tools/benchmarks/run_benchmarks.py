@@ -0,0 +1,155 @@
+"""Headless benchmarks of the generated wrapper, docs/wasmraypy loaded into CPython with mock_mod.MockModule as _mod
+
+python3 -O run_benchmarks.py          run and compare with baseline.json
+python3 -O run_benchmarks.py --save   run and keep the results as the new baseline.json
+
+The numbers are the wrapper's own python overhead, the wasm calls are no-ops. Compare runs on the same machine.
+-O leaves the argument checks out like the .pyc bundle does, without it the debug build is measured.
+"""
+import argparse
+import json
+import platform
+import sys
+import timeit
+from pathlib import Path
+
+from mock_mod import MockModule
+
+BENCHMARKS_FOLDER_PATH = Path(__file__).parent
+DOCS_FOLDER_PATH = BENCHMARKS_FOLDER_PATH.parent.parent / 'docs'
+EXAMPLES_FOLDER_PATH = DOCS_FOLDER_PATH / 'examples'
+BASELINE_PATH = BENCHMARKS_FOLDER_PATH / 'baseline.json'
+
+# name -> (setup, statement, statements per run), run in the globals of user code
+MICRO_BENCHMARKS: dict[str, tuple[str, str, int]] = {
+    "struct construction Vector2": ("", "Vector2(1.0, 2.0)", 10000),
+    "struct construction Camera2D": ("", "Camera2D(Vector2(1.0, 2.0), Vector2(3.0, 4.0), 0.0, 1.0)", 2000),
+    "field read": ("v = Vector2(1.0, 2.0)", "v.x", 20000),
+    "field write": ("v = Vector2(1.0, 2.0)", "v.x = 3.0", 20000),
+    "nested field read": ("camera = Camera2D(Vector2(), Vector2(), 0.0, 1.0)", "camera.target.x", 10000),
+    "shadow field write": ("v = Vector2Shadow(1.0, 2.0)", "v.x = 3.0", 20000),
+    "StructArray iteration (64 items)": ("vectors = StructArray(Vector2, 64)",
+                                         "for i in range(len(vectors)): vectors[i].x", 200),
+    "string marshalling, new text": ("import itertools\ncounter = itertools.count()",
+                                     "draw_text(str(next(counter)), 0, 0, 10, RED)", 5000),
+    "string marshalling, same text": ("", "draw_text('score', 0, 0, 10, RED)", 10000),
+    "draw call, direct": ("", "draw_rectangle(1, 2, 3, 4, RED)", 10000),
+    "draw call, recorded": ("enable_command_buffer()", "draw_rectangle(1, 2, 3, 4, RED)", 10000),
+    "draw call, struct arguments": ("position = Vector2(1.0, 2.0)\nsize = Vector2(3.0, 4.0)",
+                                    "draw_rectangle_v(position, size, RED)", 10000),
+    "struct return": ("", "get_mouse_position()", 10000),
+    "sprite, draw_texture_pro": ("texture = load_texture_from_image(gen_image_color(4, 4, RED))\n"
+                                 "source = Rectangle(0, 0, 4, 4)\ndest = Rectangle(1, 2, 8, 8)\norigin = Vector2()",
+                                 "draw_texture_pro(texture, source, dest, origin, 0.0, WHITE)", 10000),
+    "sprite batch, 50000 sprites": ("texture = load_texture_from_image(gen_image_color(4, 4, RED))\n"
+                                    "batch = SpriteBatch(texture, 50000)\nsprites = SpriteBatch.new_sprites(50000)",
+                                    "batch.draw(sprites)", 100),
+    "vector3_transform, one point": ("import raymath\nmat = Matrix(m0=1, m5=1, m10=1, m15=1)\nv = Vector3(1, 2, 3)\n"
+                                     "out = Vector3()",
+                                     "raymath.vector3_transform(v, mat, out=out)", 10000),
+    "vector3_transform_array, 10000 points (numpy)": ("import raymath, numpy\nmat = Matrix(m0=1, m5=1, m10=1, m15=1)\n"
+                                                      "points = numpy.ones((10000, 3), numpy.float32)",
+                                                      "raymath.vector3_transform_array(points, mat)", 100),
+    "pixel write, PixelArray": ("pixels = PixelArray(256, 256)", "pixels[1, 2] = (1, 2, 3, 4)", 10000),
+    "update_texture_from_array, 256x256 (numpy)": ("import numpy\n"
+                                                   "texture = Texture2D(id=1, width=256, height=256, mipmaps=1, format=7)\n"
+                                                   "pixels = numpy.zeros((256, 256, 4), numpy.uint8)",
+                                                   "update_texture_from_array(texture, pixels)", 1000),
+    "sprite, atlas region": ("atlas = TextureAtlas(64, 64)\n"
+                             "region = atlas.add(0, Image(data=0, width=8, height=8, mipmaps=1, format=7))\n"
+                             "atlas.build()",
+                             "region.draw(1, 2)", 10000),
+    "text, cached layout": ("font = get_font_default()",
+                            "draw_text_layout(font, 'score: 100', 10, 10, 20, 1, 0, RED)", 10000),
+    "cached layer, drawn": ("camera = Camera2D(Vector2(400.0, 225.0), Vector2(), 0.0, 1.0)\n"
+                            "def draw_layer():\n"
+                            "    with cached_layer('layer', camera, margin=100) as layer:\n"
+                            "        if layer.recording: draw_rectangle(1, 2, 3, 4, RED)",
+                            "draw_layer()", 10000),
+}
+
+# the modules of docs/modules, imported on the wrapper like its own
+API_MODULES_NAMES = ["raymath", "rlgl", "raygui", "rcamera", "reasings"]
+
+# replays of the examples: one update() (a frame) per statement
+EXAMPLES_NAMES = ["core/core_basic_window", "core/core_2d_camera"]
+
+
+def load_wrapper():
+    """import the wrapper on a new mock wasm, return the wasmraypy package"""
+    for module_name in list(sys.modules):
+        if module_name.startswith('wasmraypy') or module_name in API_MODULES_NAMES:
+            del sys.modules[module_name]
+    for path in [str(DOCS_FOLDER_PATH), str(DOCS_FOLDER_PATH / 'modules')]:
+        if path not in sys.path:
+            sys.path.insert(0, path)
+    sys.modules['__main__']._mod = MockModule()  # where python-raylib-web.js puts the wasm module
+    import wasmraypy
+    return wasmraypy
+
+
+def user_globals(wasmraypy) -> dict:
+    namespace = {"__name__": "__main__"}
+    wasmraypy.install(namespace)
+    return namespace
+
+
+def time_statement(namespace: dict, setup: str, statement: str, number: int, repeat: int) -> float:
+    """best time of one statement in µs, frames are ended every 100 statements so per-frame memory is released"""
+    exec(setup, namespace)
+    timer = timeit.Timer(f"for _ in range(100):\n    {statement}\nend_drawing()", globals=namespace)
+    runs = max(1, number // 100)
+    return min(timer.repeat(repeat=repeat, number=runs)) / (runs * 100) * 1e6
+
+
+def run_benchmarks(repeat: int) -> dict[str, float]:
+    wasmraypy = load_wrapper()
+    wasmraypy.load_all()
+    results: dict[str, float] = {}
+
+    for name, (setup, statement, number) in MICRO_BENCHMARKS.items():
+        namespace = user_globals(wasmraypy)
+        results[name] = time_statement(namespace, setup, statement, number, repeat)
+        exec("disable_command_buffer()", namespace)
+
+    for example_name in EXAMPLES_NAMES:
+        source_path = EXAMPLES_FOLDER_PATH / example_name / f"{example_name.split('/')[1]}.py"
+        namespace = user_globals(wasmraypy)
+        exec(compile(source_path.read_text(), str(source_path), 'exec'), namespace)
+        namespace["init"]()
+        timer = timeit.Timer("update()", globals=namespace)
+        results[f"example {example_name}, frame"] = min(timer.repeat(repeat=repeat, number=200)) / 200 * 1e6
+
+    return results
+
+
+def print_results(results: dict[str, float], baseline: dict[str, float]):
+    print(f"{'benchmark':<45}{'µs':>10}{'baseline':>10}{'ratio':>8}")
+    for name, time in results.items():
+        line = f"{name:<45}{time:>10.2f}"
+        if name in baseline:
+            line += f"{baseline[name]:>10.2f}{time / baseline[name]:>8.2f}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", action="store_true", help="keep the results as the new baseline")
+    parser.add_argument("--repeat", type=int, default=5, help="runs of each benchmark, the best one counts")
+    arguments = parser.parse_args()
+
+    if __debug__:
+        print("measuring the debug build with its argument checks, run python3 -O for the release build")
+    results = run_benchmarks(arguments.repeat)
+    baseline = json.loads(BASELINE_PATH.read_text())["results"] if BASELINE_PATH.exists() else {}
+    print_results(results, baseline)
+
+    if arguments.save:
+        BASELINE_PATH.write_text(json.dumps({"python": platform.python_version(),
+                                             "results": {name: round(time, 3) for name, time in results.items()}},
+                                            indent=2) + '\n')
+        print(f"saved {BASELINE_PATH}")
+
+
+if __name__ == '__main__':
+    main()
@@ -52,5 +52,5 @@ emcc src/raylib.c src/raylib/build/raylib/libraylib.a -o demo/raylib.js -I src/r
 	-sUSE_GLFW=3 \
 	-sEXPORTED_RUNTIME_METHODS=ccall,cwrap,allocateUTF8,stringToUTF8,UTF8ToString,FS,setValue,getValue \
 	-sENVIRONMENT=web \
-	-sEXPORTED_FUNCTIONS=_malloc,_memcpy,_free,_InitWindow,_WindowShouldClose,_CloseWindow,_IsWindowReady,_IsWindowFullscreen,_IsWindowResized,_IsWindowState,_ClearWindowState,_SetWindowMonitor,_SetWindowMinSize,_SetWindowSize,_GetWindowHandle,_GetScreenWidth,_GetScreenHeight,_GetRenderWidth,_GetRenderHeight,_GetMonitorCount,_GetCurrentMonitor,_GetMonitorPosition,_GetMonitorWidth,_GetMonitorHeight,_GetMonitorPhysicalWidth,_GetMonitorPhysicalHeight,_GetMonitorRefreshRate,_GetWindowPosition,_GetWindowScaleDPI,_GetMonitorName,_SetClipboardText,_GetClipboardText,_EnableEventWaiting,_DisableEventWaiting,_SwapScreenBuffer,_PollInputEvents,_WaitTime,_ShowCursor,_HideCursor,_IsCursorHidden,_EnableCursor,_DisableCursor,_IsCursorOnScreen,_ClearBackground,_BeginDrawing,_EndDrawing,_BeginMode2D,_EndMode2D,_BeginMode3D,_EndMode3D,_BeginTextureMode,_EndTextureMode,_BeginShaderMode,_EndShaderMode,_BeginBlendMode,_EndBlendMode,_BeginScissorMode,_EndScissorMode,_BeginVrStereoMode,_EndVrStereoMode,_LoadVrStereoConfig,_UnloadVrStereoConfig,_LoadShader,_LoadShaderFromMemory,_IsShaderReady,_GetShaderLocation,_GetShaderLocationAttrib,_SetShaderValue,_SetShaderValueV,_SetShaderValueMatrix,_SetShaderValueTexture,_UnloadShader,_GetMouseRay,_GetCameraMatrix,_GetCameraMatrix2D,_GetWorldToScreen,_GetScreenToWorld2D,_GetWorldToScreenEx,_GetWorldToScreen2D,_SetTargetFPS,_GetFPS,_GetFrameTime,_GetTime,_GetRandomValue,_SetRandomSeed,_TakeScreenshot,_SetConfigFlags,_TraceLog,_SetTraceLogLevel,_MemAlloc,_MemRealloc,_MemFree,_OpenURL,_SetTraceLogCallback,_SetLoadFileDataCallback,_SetSaveFileDataCallback,_SetLoadFileTextCallback,_SetSaveFileTextCallback,_LoadFileData,_UnloadFileData,_SaveFileData,_ExportDataAsCode,_LoadFileText,_UnloadFileText,_SaveFileText,_FileExists,_DirectoryExists,_IsFileExtension,_GetFileLength,_GetFileExtension,_GetFileName,_GetFileNameWithoutExt,_GetDirectoryPath,_GetPrevDirectoryPath,_GetWorkingDirectory,_GetApplicationDirectory,_ChangeDirectory,_IsPathFile,_LoadDirectoryFiles,_LoadDirectoryFilesEx,_UnloadDirectoryFiles,_IsFileDropped,_LoadDroppedFiles,_UnloadDroppedFiles,_GetFileModTime,_CompressData,_DecompressData,_EncodeDataBase64,_DecodeDataBase64,_IsKeyPressed,_IsKeyDown,_IsKeyReleased,_IsKeyUp,_SetExitKey,_GetKeyPressed,_GetCharPressed,_IsGamepadAvailable,_GetGamepadName,_IsGamepadButtonPressed,_IsGamepadButtonDown,_IsGamepadButtonReleased,_IsGamepadButtonUp,_GetGamepadButtonPressed,_GetGamepadAxisCount,_GetGamepadAxisMovement,_SetGamepadMappings,_IsMouseButtonPressed,_IsMouseButtonDown,_IsMouseButtonReleased,_IsMouseButtonUp,_GetMouseX,_GetMouseY,_GetMousePosition,_GetMouseDelta,_SetMousePosition,_SetMouseOffset,_SetMouseScale,_GetMouseWheelMove,_GetMouseWheelMoveV,_SetMouseCursor,_GetTouchX,_GetTouchY,_GetTouchPosition,_GetTouchPointId,_GetTouchPointCount,_SetGesturesEnabled,_IsGestureDetected,_GetGestureDetected,_GetGestureHoldDuration,_GetGestureDragVector,_GetGestureDragAngle,_GetGesturePinchVector,_GetGesturePinchAngle,_UpdateCamera,_UpdateCameraPro,_SetShapesTexture,_DrawPixel,_DrawPixelV,_DrawLine,_DrawLineV,_DrawLineEx,_DrawLineBezier,_DrawLineBezierQuad,_DrawLineBezierCubic,_DrawLineStrip,_DrawCircle,_DrawCircleSector,_DrawCircleSectorLines,_DrawCircleGradient,_DrawCircleV,_DrawCircleLines,_DrawEllipse,_DrawEllipseLines,_DrawRing,_DrawRingLines,_DrawRectangle,_DrawRectangleV,_DrawRectangleRec,_DrawRectanglePro,_DrawRectangleGradientV,_DrawRectangleGradientH,_DrawRectangleGradientEx,_DrawRectangleLines,_DrawRectangleLinesEx,_DrawRectangleRounded,_DrawRectangleRoundedLines,_DrawTriangle,_DrawTriangleLines,_DrawTriangleFan,_DrawTriangleStrip,_DrawPoly,_DrawPolyLines,_DrawPolyLinesEx,_CheckCollisionRecs,_CheckCollisionCircles,_CheckCollisionCircleRec,_CheckCollisionPointRec,_CheckCollisionPointCircle,_CheckCollisionPointTriangle,_CheckCollisionPointPoly,_CheckCollisionLines,_CheckCollisionPointLine,_GetCollisionRec,_LoadImage,_LoadImageRaw,_LoadImageAnim,_LoadImageFromMemory,_LoadImageFromTexture,_LoadImageFromScreen,_IsImageReady,_UnloadImage,_ExportImage,_ExportImageToMemory,_ExportImageAsCode,_GenImageColor,_GenImageGradientLinear,_GenImageGradientRadial,_GenImageGradientSquare,_GenImageChecked,_GenImageWhiteNoise,_GenImagePerlinNoise,_GenImageCellular,_GenImageText,_ImageCopy,_ImageFromImage,_ImageText,_ImageTextEx,_ImageFormat,_ImageToPOT,_ImageCrop,_ImageAlphaCrop,_ImageAlphaClear,_ImageAlphaMask,_ImageAlphaPremultiply,_ImageBlurGaussian,_ImageResize,_ImageResizeNN,_ImageResizeCanvas,_ImageMipmaps,_ImageDither,_ImageFlipVertical,_ImageFlipHorizontal,_ImageRotate,_ImageRotateCW,_ImageRotateCCW,_ImageColorTint,_ImageColorInvert,_ImageColorGrayscale,_ImageColorContrast,_ImageColorBrightness,_ImageColorReplace,_LoadImageColors,_LoadImagePalette,_UnloadImageColors,_UnloadImagePalette,_GetImageAlphaBorder,_GetImageColor,_ImageClearBackground,_ImageDrawPixel,_ImageDrawPixelV,_ImageDrawLine,_ImageDrawLineV,_ImageDrawCircle,_ImageDrawCircleV,_ImageDrawCircleLines,_ImageDrawCircleLinesV,_ImageDrawRectangle,_ImageDrawRectangleV,_ImageDrawRectangleRec,_ImageDrawRectangleLines,_ImageDraw,_ImageDrawText,_ImageDrawTextEx,_LoadTexture,_LoadTextureFromImage,_LoadTextureCubemap,_LoadRenderTexture,_IsTextureReady,_UnloadTexture,_IsRenderTextureReady,_UnloadRenderTexture,_UpdateTexture,_UpdateTextureRec,_GenTextureMipmaps,_SetTextureFilter,_SetTextureWrap,_DrawTexture,_DrawTextureV,_DrawTextureEx,_DrawTextureRec,_DrawTexturePro,_DrawTextureNPatch,_Fade,_ColorToInt,_ColorNormalize,_ColorFromNormalized,_ColorToHSV,_ColorFromHSV,_ColorTint,_ColorBrightness,_ColorContrast,_ColorAlpha,_ColorAlphaBlend,_GetColor,_GetPixelColor,_SetPixelColor,_GetPixelDataSize,_GetFontDefault,_LoadFont,_LoadFontEx,_LoadFontFromImage,_LoadFontFromMemory,_IsFontReady,_LoadFontData,_GenImageFontAtlas,_UnloadFontData,_UnloadFont,_ExportFontAsCode,_DrawFPS,_DrawText,_DrawTextEx,_DrawTextPro,_DrawTextCodepoint,_DrawTextCodepoints,_SetTextLineSpacing,_MeasureText,_MeasureTextEx,_GetGlyphIndex,_GetGlyphInfo,_GetGlyphAtlasRec,_LoadUTF8,_UnloadUTF8,_LoadCodepoints,_UnloadCodepoints,_GetCodepointCount,_GetCodepoint,_GetCodepointNext,_GetCodepointPrevious,_CodepointToUTF8,_TextCopy,_TextIsEqual,_TextLength,_TextFormat,_TextSubtext,_TextReplace,_TextInsert,_TextJoin,_TextSplit,_TextAppend,_TextFindIndex,_TextToUpper,_TextToLower,_TextToPascal,_TextToInteger,_DrawLine3D,_DrawPoint3D,_DrawCircle3D,_DrawTriangle3D,_DrawTriangleStrip3D,_DrawCube,_DrawCubeV,_DrawCubeWires,_DrawCubeWiresV,_DrawSphere,_DrawSphereEx,_DrawSphereWires,_DrawCylinder,_DrawCylinderEx,_DrawCylinderWires,_DrawCylinderWiresEx,_DrawCapsule,_DrawCapsuleWires,_DrawPlane,_DrawRay,_DrawGrid,_LoadModel,_LoadModelFromMesh,_IsModelReady,_UnloadModel,_GetModelBoundingBox,_DrawModel,_DrawModelEx,_DrawModelWires,_DrawModelWiresEx,_DrawBoundingBox,_DrawBillboard,_DrawBillboardRec,_DrawBillboardPro,_UploadMesh,_UpdateMeshBuffer,_UnloadMesh,_DrawMesh,_DrawMeshInstanced,_ExportMesh,_GetMeshBoundingBox,_GenMeshTangents,_GenMeshPoly,_GenMeshPlane,_GenMeshCube,_GenMeshSphere,_GenMeshHemiSphere,_GenMeshCylinder,_GenMeshCone,_GenMeshTorus,_GenMeshKnot,_GenMeshHeightmap,_GenMeshCubicmap,_LoadMaterials,_LoadMaterialDefault,_IsMaterialReady,_UnloadMaterial,_SetMaterialTexture,_SetModelMeshMaterial,_LoadModelAnimations,_UpdateModelAnimation,_UnloadModelAnimation,_UnloadModelAnimations,_IsModelAnimationValid,_CheckCollisionSpheres,_CheckCollisionBoxes,_CheckCollisionBoxSphere,_GetRayCollisionSphere,_GetRayCollisionBox,_GetRayCollisionMesh,_GetRayCollisionTriangle,_GetRayCollisionQuad,_InitAudioDevice,_CloseAudioDevice,_IsAudioDeviceReady,_SetMasterVolume,_LoadWave,_LoadWaveFromMemory,_IsWaveReady,_LoadSound,_LoadSoundFromWave,_IsSoundReady,_UpdateSound,_UnloadWave,_UnloadSound,_ExportWave,_ExportWaveAsCode,_PlaySound,_StopSound,_PauseSound,_ResumeSound,_IsSoundPlaying,_SetSoundVolume,_SetSoundPitch,_SetSoundPan,_WaveCopy,_WaveCrop,_WaveFormat,_LoadWaveSamples,_UnloadWaveSamples,_LoadMusicStream,_LoadMusicStreamFromMemory,_IsMusicReady,_UnloadMusicStream,_PlayMusicStream,_IsMusicStreamPlaying,_UpdateMusicStream,_StopMusicStream,_PauseMusicStream,_ResumeMusicStream,_SeekMusicStream,_SetMusicVolume,_SetMusicPitch,_SetMusicPan,_GetMusicTimeLength,_GetMusicTimePlayed,_LoadAudioStream,_IsAudioStreamReady,_UnloadAudioStream,_UpdateAudioStream,_IsAudioStreamProcessed,_PlayAudioStream,_PauseAudioStream,_ResumeAudioStream,_IsAudioStreamPlaying,_StopAudioStream,_SetAudioStreamVolume,_SetAudioStreamPitch,_SetAudioStreamPan,_SetAudioStreamBufferSizeDefault,_SetAudioStreamCallback,_AttachAudioStreamProcessor,_DetachAudioStreamProcessor,_AttachAudioMixedProcessor,_DetachAudioMixedProcessor,_GuiEnable,_GuiDisable,_GuiLock,_GuiUnlock,_GuiIsLocked,_GuiFade,_GuiSetState,_GuiGetState,_GuiSetFont,_GuiGetFont,_GuiSetStyle,_GuiGetStyle,_GuiLoadStyle,_GuiLoadStyleDefault,_GuiEnableTooltip,_GuiDisableTooltip,_GuiSetTooltip,_GuiIconText,_GuiSetIconScale,_GuiGetIcons,_GuiLoadIcons,_GuiDrawIcon,_GuiWindowBox,_GuiGroupBox,_GuiLine,_GuiPanel,_GuiTabBar,_GuiScrollPanel,_GuiLabel,_GuiButton,_GuiLabelButton,_GuiToggle,_GuiToggleGroup,_GuiCheckBox,_GuiComboBox,_GuiDropdownBox,_GuiSpinner,_GuiValueBox,_GuiTextBox,_GuiSlider,_GuiSliderBar,_GuiProgressBar,_GuiStatusBar,_GuiDummyRec,_GuiGrid,_GuiListView,_GuiListViewEx,_GuiMessageBox,_GuiTextInputBox,_GuiColorPicker,_GuiColorPanel,_GuiColorBarAlpha,_GuiColorBarHue,_GuiColorPickerHSV,_GuiColorPanelHSV,_Clamp,_Lerp,_Normalize,_Remap,_Wrap,_FloatEquals,_Vector2Zero,_Vector2One,_Vector2Add,_Vector2AddValue,_Vector2Subtract,_Vector2SubtractValue,_Vector2Length,_Vector2LengthSqr,_Vector2DotProduct,_Vector2Distance,_Vector2DistanceSqr,_Vector2Angle,_Vector2LineAngle,_Vector2Scale,_Vector2Multiply,_Vector2Negate,_Vector2Divide,_Vector2Normalize,_Vector2Transform,_Vector2Lerp,_Vector2Reflect,_Vector2Rotate,_Vector2MoveTowards,_Vector2Invert,_Vector2Clamp,_Vector2ClampValue,_Vector2Equals,_Vector3Zero,_Vector3One,_Vector3Add,_Vector3AddValue,_Vector3Subtract,_Vector3SubtractValue,_Vector3Scale,_Vector3Multiply,_Vector3CrossProduct,_Vector3Perpendicular,_Vector3Length,_Vector3LengthSqr,_Vector3DotProduct,_Vector3Distance,_Vector3DistanceSqr,_Vector3Angle,_Vector3Negate,_Vector3Divide,_Vector3Normalize,_Vector3OrthoNormalize,_Vector3Transform,_Vector3RotateByQuaternion,_Vector3RotateByAxisAngle,_Vector3Lerp,_Vector3Reflect,_Vector3Min,_Vector3Max,_Vector3Barycenter,_Vector3Unproject,_Vector3ToFloatV,_Vector3Invert,_Vector3Clamp,_Vector3ClampValue,_Vector3Equals,_Vector3Refract,_MatrixDeterminant,_MatrixTrace,_MatrixTranspose,_MatrixInvert,_MatrixIdentity,_MatrixAdd,_MatrixSubtract,_MatrixMultiply,_MatrixTranslate,_MatrixRotate,_MatrixRotateX,_MatrixRotateY,_MatrixRotateZ,_MatrixRotateXYZ,_MatrixRotateZYX,_MatrixScale,_MatrixFrustum,_MatrixPerspective,_MatrixOrtho,_MatrixLookAt,_MatrixToFloatV,_QuaternionAdd,_QuaternionAddValue,_QuaternionSubtract,_QuaternionSubtractValue,_QuaternionIdentity,_QuaternionLength,_QuaternionNormalize,_QuaternionInvert,_QuaternionMultiply,_QuaternionScale,_QuaternionDivide,_QuaternionLerp,_QuaternionNlerp,_QuaternionSlerp,_QuaternionFromVector3ToVector3,_QuaternionFromMatrix,_QuaternionToMatrix,_QuaternionFromAxisAngle,_QuaternionToAxisAngle,_QuaternionFromEuler,_QuaternionToEuler,_QuaternionTransform,_QuaternionEquals,_EaseLinearNone,_EaseLinearIn,_EaseLinearOut,_EaseLinearInOut,_EaseSineIn,_EaseSineOut,_EaseSineInOut,_EaseCircIn,_EaseCircOut,_EaseCircInOut,_EaseCubicIn,_EaseCubicOut,_EaseCubicInOut,_EaseQuadIn,_EaseQuadOut,_EaseQuadInOut,_EaseExpoIn,_EaseExpoOut,_EaseExpoInOut,_EaseBackIn,_EaseBackOut,_EaseBackInOut,_EaseBounceOut,_EaseBounceIn,_EaseBounceInOut,_EaseElasticIn,_EaseElasticOut,_EaseElasticInOut,_rlMatrixMode,_rlPushMatrix,_rlPopMatrix,_rlLoadIdentity,_rlTranslatef,_rlRotatef,_rlScalef,_rlMultMatrixf,_rlFrustum,_rlOrtho,_rlViewport,_rlBegin,_rlEnd,_rlVertex2i,_rlVertex2f,_rlVertex3f,_rlTexCoord2f,_rlNormal3f,_rlColor4ub,_rlColor3f,_rlColor4f,_rlEnableVertexArray,_rlDisableVertexArray,_rlEnableVertexBuffer,_rlDisableVertexBuffer,_rlEnableVertexBufferElement,_rlDisableVertexBufferElement,_rlEnableVertexAttribute,_rlDisableVertexAttribute,_rlActiveTextureSlot,_rlEnableTexture,_rlDisableTexture,_rlEnableTextureCubemap,_rlDisableTextureCubemap,_rlTextureParameters,_rlCubemapParameters,_rlEnableShader,_rlDisableShader,_rlEnableFramebuffer,_rlDisableFramebuffer,_rlActiveDrawBuffers,_rlEnableColorBlend,_rlDisableColorBlend,_rlEnableDepthTest,_rlDisableDepthTest,_rlEnableDepthMask,_rlDisableDepthMask,_rlEnableBackfaceCulling,_rlDisableBackfaceCulling,_rlSetCullFace,_rlEnableScissorTest,_rlDisableScissorTest,_rlScissor,_rlEnableWireMode,_rlDisableWireMode,_rlSetLineWidth,_rlGetLineWidth,_rlEnableSmoothLines,_rlDisableSmoothLines,_rlEnableStereoRender,_rlDisableStereoRender,_rlIsStereoRenderEnabled,_rlClearColor,_rlClearScreenBuffers,_rlCheckErrors,_rlSetBlendMode,_rlSetBlendFactors,_rlSetBlendFactorsSeparate,_rlglInit,_rlglClose,_rlLoadExtensions,_rlGetVersion,_rlSetFramebufferWidth,_rlGetFramebufferWidth,_rlSetFramebufferHeight,_rlGetFramebufferHeight,_rlGetTextureIdDefault,_rlGetShaderIdDefault,_rlGetShaderLocsDefault,_rlLoadRenderBatch,_rlUnloadRenderBatch,_rlDrawRenderBatch,_rlSetRenderBatchActive,_rlDrawRenderBatchActive,_rlCheckRenderBatchLimit,_rlSetTexture,_rlLoadVertexArray,_rlLoadVertexBuffer,_rlLoadVertexBufferElement,_rlUpdateVertexBuffer,_rlUpdateVertexBufferElements,_rlUnloadVertexArray,_rlUnloadVertexBuffer,_rlSetVertexAttribute,_rlSetVertexAttributeDivisor,_rlSetVertexAttributeDefault,_rlDrawVertexArray,_rlDrawVertexArrayElements,_rlDrawVertexArrayInstanced,_rlDrawVertexArrayElementsInstanced,_rlLoadTexture,_rlLoadTextureDepth,_rlLoadTextureCubemap,_rlUpdateTexture,_rlGetGlTextureFormats,_rlGetPixelFormatName,_rlUnloadTexture,_rlGenTextureMipmaps,_rlReadTexturePixels,_rlReadScreenPixels,_rlLoadFramebuffer,_rlFramebufferAttach,_rlFramebufferComplete,_rlUnloadFramebuffer,_rlLoadShaderCode,_rlCompileShader,_rlLoadShaderProgram,_rlUnloadShaderProgram,_rlGetLocationUniform,_rlGetLocationAttrib,_rlSetUniform,_rlSetUniformMatrix,_rlSetUniformSampler,_rlSetShader,_rlLoadComputeShaderProgram,_rlComputeShaderDispatch,_rlLoadShaderBuffer,_rlUnloadShaderBuffer,_rlUpdateShaderBuffer,_rlBindShaderBuffer,_rlReadShaderBuffer,_rlCopyShaderBuffer,_rlGetShaderBufferSize,_rlBindImageTexture,_rlGetMatrixModelview,_rlGetMatrixProjection,_rlGetMatrixTransform,_rlGetMatrixProjectionStereo,_rlGetMatrixViewOffsetStereo,_rlSetMatrixProjection,_rlSetMatrixModelview,_rlSetMatrixProjectionStereo,_rlSetMatrixViewOffsetStereo,_rlLoadDrawCube,_rlLoadDrawQuad,_GetCameraForward,_GetCameraUp,_GetCameraRight,_CameraMoveForward,_CameraMoveUp,_CameraMoveRight,_CameraMoveToTarget,_CameraYaw,_CameraPitch,_CameraRoll,_GetCameraViewMatrix,_GetCameraProjectionMatrix,_DrawTextBoxed,_DrawTextBoxedSelectable
+	-sEXPORTED_FUNCTIONS=_malloc,_memcpy,_free,_InitWindow,_WindowShouldClose,_CloseWindow,_IsWindowReady,_IsWindowFullscreen,_IsWindowResized,_IsWindowState,_ClearWindowState,_SetWindowMonitor,_SetWindowMinSize,_SetWindowSize,_GetWindowHandle,_GetScreenWidth,_GetScreenHeight,_GetRenderWidth,_GetRenderHeight,_GetMonitorCount,_GetCurrentMonitor,_GetMonitorPosition,_GetMonitorWidth,_GetMonitorHeight,_GetMonitorPhysicalWidth,_GetMonitorPhysicalHeight,_GetMonitorRefreshRate,_GetWindowPosition,_GetWindowScaleDPI,_GetMonitorName,_SetClipboardText,_GetClipboardText,_EnableEventWaiting,_DisableEventWaiting,_SwapScreenBuffer,_PollInputEvents,_WaitTime,_ShowCursor,_HideCursor,_IsCursorHidden,_EnableCursor,_DisableCursor,_IsCursorOnScreen,_ClearBackground,_BeginDrawing,_EndDrawing,_BeginMode2D,_EndMode2D,_BeginMode3D,_EndMode3D,_BeginTextureMode,_EndTextureMode,_BeginShaderMode,_EndShaderMode,_BeginBlendMode,_EndBlendMode,_BeginScissorMode,_EndScissorMode,_BeginVrStereoMode,_EndVrStereoMode,_LoadVrStereoConfig,_UnloadVrStereoConfig,_LoadShader,_LoadShaderFromMemory,_IsShaderReady,_GetShaderLocation,_GetShaderLocationAttrib,_SetShaderValue,_SetShaderValueV,_SetShaderValueMatrix,_SetShaderValueTexture,_UnloadShader,_GetMouseRay,_GetCameraMatrix,_GetCameraMatrix2D,_GetWorldToScreen,_GetScreenToWorld2D,_GetWorldToScreenEx,_GetWorldToScreen2D,_SetTargetFPS,_GetFPS,_GetFrameTime,_GetTime,_GetRandomValue,_SetRandomSeed,_TakeScreenshot,_SetConfigFlags,_TraceLog,_SetTraceLogLevel,_MemAlloc,_MemRealloc,_MemFree,_OpenURL,_SetTraceLogCallback,_SetLoadFileDataCallback,_SetSaveFileDataCallback,_SetLoadFileTextCallback,_SetSaveFileTextCallback,_LoadFileData,_UnloadFileData,_SaveFileData,_ExportDataAsCode,_LoadFileText,_UnloadFileText,_SaveFileText,_FileExists,_DirectoryExists,_IsFileExtension,_GetFileLength,_GetFileExtension,_GetFileName,_GetFileNameWithoutExt,_GetDirectoryPath,_GetPrevDirectoryPath,_GetWorkingDirectory,_GetApplicationDirectory,_ChangeDirectory,_IsPathFile,_LoadDirectoryFiles,_LoadDirectoryFilesEx,_UnloadDirectoryFiles,_IsFileDropped,_LoadDroppedFiles,_UnloadDroppedFiles,_GetFileModTime,_CompressData,_DecompressData,_EncodeDataBase64,_DecodeDataBase64,_IsKeyPressed,_IsKeyDown,_IsKeyReleased,_IsKeyUp,_SetExitKey,_GetKeyPressed,_GetCharPressed,_IsGamepadAvailable,_GetGamepadName,_IsGamepadButtonPressed,_IsGamepadButtonDown,_IsGamepadButtonReleased,_IsGamepadButtonUp,_GetGamepadButtonPressed,_GetGamepadAxisCount,_GetGamepadAxisMovement,_SetGamepadMappings,_IsMouseButtonPressed,_IsMouseButtonDown,_IsMouseButtonReleased,_IsMouseButtonUp,_GetMouseX,_GetMouseY,_GetMousePosition,_GetMouseDelta,_SetMousePosition,_SetMouseOffset,_SetMouseScale,_GetMouseWheelMove,_GetMouseWheelMoveV,_SetMouseCursor,_GetTouchX,_GetTouchY,_GetTouchPosition,_GetTouchPointId,_GetTouchPointCount,_SetGesturesEnabled,_IsGestureDetected,_GetGestureDetected,_GetGestureHoldDuration,_GetGestureDragVector,_GetGestureDragAngle,_GetGesturePinchVector,_GetGesturePinchAngle,_UpdateCamera,_UpdateCameraPro,_SetShapesTexture,_DrawPixel,_DrawPixelV,_DrawLine,_DrawLineV,_DrawLineEx,_DrawLineBezier,_DrawLineBezierQuad,_DrawLineBezierCubic,_DrawLineStrip,_DrawCircle,_DrawCircleSector,_DrawCircleSectorLines,_DrawCircleGradient,_DrawCircleV,_DrawCircleLines,_DrawEllipse,_DrawEllipseLines,_DrawRing,_DrawRingLines,_DrawRectangle,_DrawRectangleV,_DrawRectangleRec,_DrawRectanglePro,_DrawRectangleGradientV,_DrawRectangleGradientH,_DrawRectangleGradientEx,_DrawRectangleLines,_DrawRectangleLinesEx,_DrawRectangleRounded,_DrawRectangleRoundedLines,_DrawTriangle,_DrawTriangleLines,_DrawTriangleFan,_DrawTriangleStrip,_DrawPoly,_DrawPolyLines,_DrawPolyLinesEx,_CheckCollisionRecs,_CheckCollisionCircles,_CheckCollisionCircleRec,_CheckCollisionPointRec,_CheckCollisionPointCircle,_CheckCollisionPointTriangle,_CheckCollisionPointPoly,_CheckCollisionLines,_CheckCollisionPointLine,_GetCollisionRec,_LoadImage,_LoadImageRaw,_LoadImageAnim,_LoadImageFromMemory,_LoadImageFromTexture,_LoadImageFromScreen,_IsImageReady,_UnloadImage,_ExportImage,_ExportImageToMemory,_ExportImageAsCode,_GenImageColor,_GenImageGradientLinear,_GenImageGradientRadial,_GenImageGradientSquare,_GenImageChecked,_GenImageWhiteNoise,_GenImagePerlinNoise,_GenImageCellular,_GenImageText,_ImageCopy,_ImageFromImage,_ImageText,_ImageTextEx,_ImageFormat,_ImageToPOT,_ImageCrop,_ImageAlphaCrop,_ImageAlphaClear,_ImageAlphaMask,_ImageAlphaPremultiply,_ImageBlurGaussian,_ImageResize,_ImageResizeNN,_ImageResizeCanvas,_ImageMipmaps,_ImageDither,_ImageFlipVertical,_ImageFlipHorizontal,_ImageRotate,_ImageRotateCW,_ImageRotateCCW,_ImageColorTint,_ImageColorInvert,_ImageColorGrayscale,_ImageColorContrast,_ImageColorBrightness,_ImageColorReplace,_LoadImageColors,_LoadImagePalette,_UnloadImageColors,_UnloadImagePalette,_GetImageAlphaBorder,_GetImageColor,_ImageClearBackground,_ImageDrawPixel,_ImageDrawPixelV,_ImageDrawLine,_ImageDrawLineV,_ImageDrawCircle,_ImageDrawCircleV,_ImageDrawCircleLines,_ImageDrawCircleLinesV,_ImageDrawRectangle,_ImageDrawRectangleV,_ImageDrawRectangleRec,_ImageDrawRectangleLines,_ImageDraw,_ImageDrawText,_ImageDrawTextEx,_LoadTexture,_LoadTextureFromImage,_LoadTextureCubemap,_LoadRenderTexture,_IsTextureReady,_UnloadTexture,_IsRenderTextureReady,_UnloadRenderTexture,_UpdateTexture,_UpdateTextureRec,_GenTextureMipmaps,_SetTextureFilter,_SetTextureWrap,_DrawTexture,_DrawTextureV,_DrawTextureEx,_DrawTextureRec,_DrawTexturePro,_DrawTextureNPatch,_Fade,_ColorToInt,_ColorNormalize,_ColorFromNormalized,_ColorToHSV,_ColorFromHSV,_ColorTint,_ColorBrightness,_ColorContrast,_ColorAlpha,_ColorAlphaBlend,_GetColor,_GetPixelColor,_SetPixelColor,_GetPixelDataSize,_GetFontDefault,_LoadFont,_LoadFontEx,_LoadFontFromImage,_LoadFontFromMemory,_IsFontReady,_LoadFontData,_GenImageFontAtlas,_UnloadFontData,_UnloadFont,_ExportFontAsCode,_DrawFPS,_DrawText,_DrawTextEx,_DrawTextPro,_DrawTextCodepoint,_DrawTextCodepoints,_SetTextLineSpacing,_MeasureText,_MeasureTextEx,_GetGlyphIndex,_GetGlyphInfo,_GetGlyphAtlasRec,_LoadUTF8,_UnloadUTF8,_LoadCodepoints,_UnloadCodepoints,_GetCodepointCount,_GetCodepoint,_GetCodepointNext,_GetCodepointPrevious,_CodepointToUTF8,_TextCopy,_TextIsEqual,_TextLength,_TextFormat,_TextSubtext,_TextReplace,_TextInsert,_TextJoin,_TextSplit,_TextAppend,_TextFindIndex,_TextToUpper,_TextToLower,_TextToPascal,_TextToInteger,_DrawLine3D,_DrawPoint3D,_DrawCircle3D,_DrawTriangle3D,_DrawTriangleStrip3D,_DrawCube,_DrawCubeV,_DrawCubeWires,_DrawCubeWiresV,_DrawSphere,_DrawSphereEx,_DrawSphereWires,_DrawCylinder,_DrawCylinderEx,_DrawCylinderWires,_DrawCylinderWiresEx,_DrawCapsule,_DrawCapsuleWires,_DrawPlane,_DrawRay,_DrawGrid,_LoadModel,_LoadModelFromMesh,_IsModelReady,_UnloadModel,_GetModelBoundingBox,_DrawModel,_DrawModelEx,_DrawModelWires,_DrawModelWiresEx,_DrawBoundingBox,_DrawBillboard,_DrawBillboardRec,_DrawBillboardPro,_UploadMesh,_UpdateMeshBuffer,_UnloadMesh,_DrawMesh,_DrawMeshInstanced,_ExportMesh,_GetMeshBoundingBox,_GenMeshTangents,_GenMeshPoly,_GenMeshPlane,_GenMeshCube,_GenMeshSphere,_GenMeshHemiSphere,_GenMeshCylinder,_GenMeshCone,_GenMeshTorus,_GenMeshKnot,_GenMeshHeightmap,_GenMeshCubicmap,_LoadMaterials,_LoadMaterialDefault,_IsMaterialReady,_UnloadMaterial,_SetMaterialTexture,_SetModelMeshMaterial,_LoadModelAnimations,_UpdateModelAnimation,_UnloadModelAnimation,_UnloadModelAnimations,_IsModelAnimationValid,_CheckCollisionSpheres,_CheckCollisionBoxes,_CheckCollisionBoxSphere,_GetRayCollisionSphere,_GetRayCollisionBox,_GetRayCollisionMesh,_GetRayCollisionTriangle,_GetRayCollisionQuad,_InitAudioDevice,_CloseAudioDevice,_IsAudioDeviceReady,_SetMasterVolume,_LoadWave,_LoadWaveFromMemory,_IsWaveReady,_LoadSound,_LoadSoundFromWave,_IsSoundReady,_UpdateSound,_UnloadWave,_UnloadSound,_ExportWave,_ExportWaveAsCode,_PlaySound,_StopSound,_PauseSound,_ResumeSound,_IsSoundPlaying,_SetSoundVolume,_SetSoundPitch,_SetSoundPan,_WaveCopy,_WaveCrop,_WaveFormat,_LoadWaveSamples,_UnloadWaveSamples,_LoadMusicStream,_LoadMusicStreamFromMemory,_IsMusicReady,_UnloadMusicStream,_PlayMusicStream,_IsMusicStreamPlaying,_UpdateMusicStream,_StopMusicStream,_PauseMusicStream,_ResumeMusicStream,_SeekMusicStream,_SetMusicVolume,_SetMusicPitch,_SetMusicPan,_GetMusicTimeLength,_GetMusicTimePlayed,_LoadAudioStream,_IsAudioStreamReady,_UnloadAudioStream,_UpdateAudioStream,_IsAudioStreamProcessed,_PlayAudioStream,_PauseAudioStream,_ResumeAudioStream,_IsAudioStreamPlaying,_StopAudioStream,_SetAudioStreamVolume,_SetAudioStreamPitch,_SetAudioStreamPan,_SetAudioStreamBufferSizeDefault,_SetAudioStreamCallback,_AttachAudioStreamProcessor,_DetachAudioStreamProcessor,_AttachAudioMixedProcessor,_DetachAudioMixedProcessor,_GuiEnable,_GuiDisable,_GuiLock,_GuiUnlock,_GuiIsLocked,_GuiFade,_GuiSetState,_GuiGetState,_GuiSetFont,_GuiGetFont,_GuiSetStyle,_GuiGetStyle,_GuiLoadStyle,_GuiLoadStyleDefault,_GuiEnableTooltip,_GuiDisableTooltip,_GuiSetTooltip,_GuiIconText,_GuiSetIconScale,_GuiGetIcons,_GuiLoadIcons,_GuiDrawIcon,_GuiWindowBox,_GuiGroupBox,_GuiLine,_GuiPanel,_GuiTabBar,_GuiScrollPanel,_GuiLabel,_GuiButton,_GuiLabelButton,_GuiToggle,_GuiToggleGroup,_GuiCheckBox,_GuiComboBox,_GuiDropdownBox,_GuiSpinner,_GuiValueBox,_GuiTextBox,_GuiSlider,_GuiSliderBar,_GuiProgressBar,_GuiStatusBar,_GuiDummyRec,_GuiGrid,_GuiListView,_GuiListViewEx,_GuiMessageBox,_GuiTextInputBox,_GuiColorPicker,_GuiColorPanel,_GuiColorBarAlpha,_GuiColorBarHue,_GuiColorPickerHSV,_GuiColorPanelHSV,_Clamp,_Lerp,_Normalize,_Remap,_Wrap,_FloatEquals,_Vector2Zero,_Vector2One,_Vector2Add,_Vector2AddValue,_Vector2Subtract,_Vector2SubtractValue,_Vector2Length,_Vector2LengthSqr,_Vector2DotProduct,_Vector2Distance,_Vector2DistanceSqr,_Vector2Angle,_Vector2LineAngle,_Vector2Scale,_Vector2Multiply,_Vector2Negate,_Vector2Divide,_Vector2Normalize,_Vector2Transform,_Vector2Lerp,_Vector2Reflect,_Vector2Rotate,_Vector2MoveTowards,_Vector2Invert,_Vector2Clamp,_Vector2ClampValue,_Vector2Equals,_Vector3Zero,_Vector3One,_Vector3Add,_Vector3AddValue,_Vector3Subtract,_Vector3SubtractValue,_Vector3Scale,_Vector3Multiply,_Vector3CrossProduct,_Vector3Perpendicular,_Vector3Length,_Vector3LengthSqr,_Vector3DotProduct,_Vector3Distance,_Vector3DistanceSqr,_Vector3Angle,_Vector3Negate,_Vector3Divide,_Vector3Normalize,_Vector3OrthoNormalize,_Vector3Transform,_Vector3RotateByQuaternion,_Vector3RotateByAxisAngle,_Vector3Lerp,_Vector3Reflect,_Vector3Min,_Vector3Max,_Vector3Barycenter,_Vector3Unproject,_Vector3ToFloatV,_Vector3Invert,_Vector3Clamp,_Vector3ClampValue,_Vector3Equals,_Vector3Refract,_MatrixDeterminant,_MatrixTrace,_MatrixTranspose,_MatrixInvert,_MatrixIdentity,_MatrixAdd,_MatrixSubtract,_MatrixMultiply,_MatrixTranslate,_MatrixRotate,_MatrixRotateX,_MatrixRotateY,_MatrixRotateZ,_MatrixRotateXYZ,_MatrixRotateZYX,_MatrixScale,_MatrixFrustum,_MatrixPerspective,_MatrixOrtho,_MatrixLookAt,_MatrixToFloatV,_QuaternionAdd,_QuaternionAddValue,_QuaternionSubtract,_QuaternionSubtractValue,_QuaternionIdentity,_QuaternionLength,_QuaternionNormalize,_QuaternionInvert,_QuaternionMultiply,_QuaternionScale,_QuaternionDivide,_QuaternionLerp,_QuaternionNlerp,_QuaternionSlerp,_QuaternionFromVector3ToVector3,_QuaternionFromMatrix,_QuaternionToMatrix,_QuaternionFromAxisAngle,_QuaternionToAxisAngle,_QuaternionFromEuler,_QuaternionToEuler,_QuaternionTransform,_QuaternionEquals,_EaseLinearNone,_EaseLinearIn,_EaseLinearOut,_EaseLinearInOut,_EaseSineIn,_EaseSineOut,_EaseSineInOut,_EaseCircIn,_EaseCircOut,_EaseCircInOut,_EaseCubicIn,_EaseCubicOut,_EaseCubicInOut,_EaseQuadIn,_EaseQuadOut,_EaseQuadInOut,_EaseExpoIn,_EaseExpoOut,_EaseExpoInOut,_EaseBackIn,_EaseBackOut,_EaseBackInOut,_EaseBounceOut,_EaseBounceIn,_EaseBounceInOut,_EaseElasticIn,_EaseElasticOut,_EaseElasticInOut,_rlMatrixMode,_rlPushMatrix,_rlPopMatrix,_rlLoadIdentity,_rlTranslatef,_rlRotatef,_rlScalef,_rlMultMatrixf,_rlFrustum,_rlOrtho,_rlViewport,_rlBegin,_rlEnd,_rlVertex2i,_rlVertex2f,_rlVertex3f,_rlTexCoord2f,_rlNormal3f,_rlColor4ub,_rlColor3f,_rlColor4f,_rlEnableVertexArray,_rlDisableVertexArray,_rlEnableVertexBuffer,_rlDisableVertexBuffer,_rlEnableVertexBufferElement,_rlDisableVertexBufferElement,_rlEnableVertexAttribute,_rlDisableVertexAttribute,_rlActiveTextureSlot,_rlEnableTexture,_rlDisableTexture,_rlEnableTextureCubemap,_rlDisableTextureCubemap,_rlTextureParameters,_rlCubemapParameters,_rlEnableShader,_rlDisableShader,_rlEnableFramebuffer,_rlDisableFramebuffer,_rlActiveDrawBuffers,_rlEnableColorBlend,_rlDisableColorBlend,_rlEnableDepthTest,_rlDisableDepthTest,_rlEnableDepthMask,_rlDisableDepthMask,_rlEnableBackfaceCulling,_rlDisableBackfaceCulling,_rlSetCullFace,_rlEnableScissorTest,_rlDisableScissorTest,_rlScissor,_rlEnableWireMode,_rlDisableWireMode,_rlSetLineWidth,_rlGetLineWidth,_rlEnableSmoothLines,_rlDisableSmoothLines,_rlEnableStereoRender,_rlDisableStereoRender,_rlIsStereoRenderEnabled,_rlClearColor,_rlClearScreenBuffers,_rlCheckErrors,_rlSetBlendMode,_rlSetBlendFactors,_rlSetBlendFactorsSeparate,_rlglInit,_rlglClose,_rlLoadExtensions,_rlGetVersion,_rlSetFramebufferWidth,_rlGetFramebufferWidth,_rlSetFramebufferHeight,_rlGetFramebufferHeight,_rlGetTextureIdDefault,_rlGetShaderIdDefault,_rlGetShaderLocsDefault,_rlLoadRenderBatch,_rlUnloadRenderBatch,_rlDrawRenderBatch,_rlSetRenderBatchActive,_rlDrawRenderBatchActive,_rlCheckRenderBatchLimit,_rlSetTexture,_rlLoadVertexArray,_rlLoadVertexBuffer,_rlLoadVertexBufferElement,_rlUpdateVertexBuffer,_rlUpdateVertexBufferElements,_rlUnloadVertexArray,_rlUnloadVertexBuffer,_rlSetVertexAttribute,_rlSetVertexAttributeDivisor,_rlSetVertexAttributeDefault,_rlDrawVertexArray,_rlDrawVertexArrayElements,_rlDrawVertexArrayInstanced,_rlDrawVertexArrayElementsInstanced,_rlLoadTexture,_rlLoadTextureDepth,_rlLoadTextureCubemap,_rlUpdateTexture,_rlGetGlTextureFormats,_rlGetPixelFormatName,_rlUnloadTexture,_rlGenTextureMipmaps,_rlReadTexturePixels,_rlReadScreenPixels,_rlLoadFramebuffer,_rlFramebufferAttach,_rlFramebufferComplete,_rlUnloadFramebuffer,_rlLoadShaderCode,_rlCompileShader,_rlLoadShaderProgram,_rlUnloadShaderProgram,_rlGetLocationUniform,_rlGetLocationAttrib,_rlSetUniform,_rlSetUniformMatrix,_rlSetUniformSampler,_rlSetShader,_rlLoadComputeShaderProgram,_rlComputeShaderDispatch,_rlLoadShaderBuffer,_rlUnloadShaderBuffer,_rlUpdateShaderBuffer,_rlBindShaderBuffer,_rlReadShaderBuffer,_rlCopyShaderBuffer,_rlGetShaderBufferSize,_rlBindImageTexture,_rlGetMatrixModelview,_rlGetMatrixProjection,_rlGetMatrixTransform,_rlGetMatrixProjectionStereo,_rlGetMatrixViewOffsetStereo,_rlSetMatrixProjection,_rlSetMatrixModelview,_rlSetMatrixProjectionStereo,_rlSetMatrixViewOffsetStereo,_rlLoadDrawCube,_rlLoadDrawQuad,_GetCameraForward,_GetCameraUp,_GetCameraRight,_CameraMoveForward,_CameraMoveUp,_CameraMoveRight,_CameraMoveToTarget,_CameraYaw,_CameraPitch,_CameraRoll,_GetCameraViewMatrix,_GetCameraProjectionMatrix,_DrawTextBoxed,_DrawTextBoxedSelectable,_ReplayCommandBuffer,_DrawSpriteBatch,_Vector2AddArray,_Vector3AddArray,_Vector2ScaleArray,_Vector3ScaleArray,_Vector2NormalizeArray,_Vector3NormalizeArray,_Vector2LerpArray,_Vector3LerpArray,_Vector2TransformArray,_Vector3TransformArray,_MatrixMultiplyArray,_LayoutText,_DrawTextLayout,_GetStructLayouts
 
@@ -0,0 +1,46 @@
+"""Check that a raylib build exports every function tools/build.sh lists in EXPORTED_FUNCTIONS
+
+python3 tools/check_wasm_exports.py                 checks docs/raylib.js, the build the pages load
+python3 tools/check_wasm_exports.py demo/raylib.js  checks a new build before it is copied into docs
+
+The functions of raylib.c (ReplayCommandBuffer, DrawSpriteBatch, LayoutText...) only reach the pages once the wasm is
+rebuilt with tools/build.sh and copied into docs, until then the wrapper raises when they are called.
+"""
+import argparse
+import re
+import sys
+from pathlib import Path
+
+TOOLS_FOLDER_PATH = Path(__file__).parent
+BUILD_SCRIPT_PATH = TOOLS_FOLDER_PATH / 'build.sh'
+DOCS_RAYLIB_JS_PATH = TOOLS_FOLDER_PATH.parent / 'docs' / 'raylib.js'
+
+
+def build_exported_functions(build_script: Path) -> list[str]:
+    match = re.search(r'-sEXPORTED_FUNCTIONS=(\S+)', build_script.read_text())
+    return match.group(1).split(',')
+
+
+def raylib_js_exports(raylib_js: Path) -> set[str]:
+    # emscripten glue: _DrawText=Module["_DrawText"]=...
+    return set(re.findall(r'Module\["(_\w+)"\]', raylib_js.read_text()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("raylib_js", type=Path, nargs='?', default=DOCS_RAYLIB_JS_PATH,
+                        help="the emscripten glue of the build, docs/raylib.js when not given")
+    arguments = parser.parse_args()
+
+    exports = raylib_js_exports(arguments.raylib_js)
+    missing = [name for name in build_exported_functions(BUILD_SCRIPT_PATH) if name not in exports]
+    if missing:
+        print(f"{arguments.raylib_js} doesn't export {len(missing)} functions of tools/build.sh, rebuild it:")
+        for name in missing:
+            print(f"  {name}")
+        sys.exit(1)
+    print(f"{arguments.raylib_js} exports every function of tools/build.sh")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,25 @@
+from heap_generation import *
+
 wasm_array_string: str = \
     """
+import array
+import contextlib
+
+
+def _import_numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("numpy views of wasm arrays need numpy, import it in your code "
+                          "or load it with pyodide.loadPackage('numpy')") from None
+    return numpy
+
+
 class WasmArray:
     \"\"\"Generic array-like collection that uses wasm as memory-back\"\"\"
+    _dtype = None  # numpy dtype of an item
+    _typecode = None  # array module typecode of an item, if an item is a primitive
+    _to_free = False  # nothing to free if __init__ raises before the memory is allocated
     
     def __init__(self, item_size: int, length: int, address: int = 0):
         self._length = length
@@ -9,23 +27,63 @@ class WasmArray:
         self._size = self._item_size * self._length
         if address != 0:
             self._address: int = address
-            self._to_free: bool = False
+            self._to_free = False
         else:
             self._address: int = _mod._malloc(self._size)
-            self._to_free: bool = True
+            self._to_free = _struct_pool  # the pool of the wasm module the memory is from frees it
 
     def __del__(self):
         if self._to_free:
-            _mod._free(self._address)
+            self._to_free.free(self._address)
 
     def __len__(self):
         return self._length
 
+    def __iter__(self):
+        # over the length, __getitem__ doesn't raise IndexError past the end
+        return (self[i] for i in range(self._length))
+
     def __str__(self):
         out = "WasmArray["
         out += ', '.join([str(self[i]) for i in range(self._length)])
         out += "] " + hex(self._address)
         return out
+
+    def _byte_range(self, item: slice) -> tuple[int, int]:
+        start, stop, step = item.indices(self._length)
+        if step != 1:
+            raise ValueError("only contiguous slices can be copied in bulk")
+        return self._address + start * self._item_size, self._address + max(start, stop) * self._item_size
+
+    def _assign_slice(self, item: slice, values):
+        begin, end = self._byte_range(item)
+        if self._typecode is not None and not hasattr(values, "dtype"):
+            data = memoryview(array.array(self._typecode, values)).cast("B")
+        else:
+            numpy = _import_numpy()
+            data = numpy.ascontiguousarray(values, dtype=self._dtype).reshape(-1).view(numpy.uint8)
+        if len(data) != end - begin:
+            raise ValueError(f"can't copy {len(data) // self._item_size} items into a slice of "
+                             f"{(end - begin) // self._item_size} items")
+        _heap.u8.subarray(begin, end).assign(data)
+
+    def as_numpy(self):
+        \"\"\"Copy the array into a new numpy array, with one bulk read of wasm memory\"\"\"
+        numpy = _import_numpy()
+        out = numpy.empty(self._length, dtype=self._dtype)
+        _heap.u8.subarray(self._address, self._address + self._size).assign_to(out.view(numpy.uint8))
+        return out
+
+    def from_numpy(self, values):
+        \"\"\"Copy a numpy array (anything numpy can convert to the item dtype) into the array, with one bulk write\"\"\"
+        self._assign_slice(slice(None), values)
+
+    @contextlib.contextmanager
+    def numpy(self):
+        \"\"\"Edit the array as a numpy array, it is written back to wasm memory when the with block ends\"\"\"
+        out = self.as_numpy()
+        yield out
+        self.from_numpy(out)
 """
 
 struct_array_string: str = \
@@ -35,18 +93,59 @@ class StructArray(WasmArray):
     def __init__(self, stype, length, address: int = 0):
         super(StructArray, self).__init__(stype._size, length, address)
         self._stype = stype
+        self._dtype = stype._dtype_spec
 
     def __getitem__(self, item):
         return self._stype(address=(self._address + (self._item_size * item)))
 
     def __setitem__(self, item, value):
-        struct_clone(value, self._address + (self._item_size * item))
+        if isinstance(item, slice):
+            self._assign_slice(item, value)
+        else:
+            struct_clone(value, self._address + (self._item_size * item))
+
+    def _assign_slice(self, item: slice, values):
+        if hasattr(values, "dtype"):
+            numpy = _import_numpy()
+            values = numpy.asarray(values)
+            if values.dtype.names is None and values.ndim == 2:
+                values = self._rows_as_items(values)
+            super(StructArray, self)._assign_slice(item, values)
+            return
+        if not isinstance(values, (StructArray, list, tuple)):
+            values = list(values)
+        begin, end = self._byte_range(item)
+        if len(values) * self._item_size != end - begin:
+            raise ValueError(f"can't copy {len(values)} items into a slice of {(end - begin) // self._item_size} items")
+        if isinstance(values, StructArray):
+            if values._stype is not self._stype:
+                raise TypeError(f"can't copy {values._stype.__name__} items into a StructArray of {self._stype.__name__}")
+            _memcpy(begin, values._address, end - begin)
+        elif values and hasattr(values[0], "_address"):
+            # struct instances (or their shadows), copied one by one
+            for i, value in enumerate(values):
+                struct_clone(value, begin + i * self._item_size)
+        else:
+            super(StructArray, self)._assign_slice(item, values)
+
+    def _rows_as_items(self, rows):
+        \"\"\"rows of numbers, one field per column like the raymath *_array functions take, as items of the array\"\"\"
+        numpy = _import_numpy()
+        dtype = numpy.dtype(self._dtype)
+        field_dtype = dtype.fields[dtype.names[0]][0]
+        # only structs of one kind of number without padding, like Vector2, Rectangle, Matrix or Color
+        if (any(dtype.fields[name][0] != field_dtype for name in dtype.names) or rows.shape[1] != len(dtype.names)
+                or dtype.itemsize != len(dtype.names) * field_dtype.itemsize):
+            raise ValueError(f"can't copy rows of {rows.shape[1]} numbers into {self._stype.__name__} items")
+        return numpy.ascontiguousarray(rows, dtype=field_dtype).view(dtype).reshape(-1)
     """
 
 
-def generate_primitive_array_class(metadata: tuple[str, str, int]) -> str:
+def generate_primitive_array_class(metadata: tuple[str, CTypeKind, int]) -> str:
     string = ""
     string += f"class {metadata[0]}(WasmArray):\n"
+    string += f"    _dtype = \"{numpy_format_for_ctype_kind[metadata[1]][0]}\"\n"
+    string += f"    _typecode = \"{numpy_format_for_ctype_kind[metadata[1]][1]}\"\n\n"
 
     # add __init__ method
     string += f"    def __init__(self, length, address: int = 0):\n"
@@ -54,28 +153,31 @@ def generate_primitive_array_class(metadata: tuple[str, str, int]) -> str:
 
     # add __getitem__
     string += f"    def __getitem__(self, item):\n"
-    string += f"        return _mod.mem.get{metadata[1]}(self._address + (item * self._item_size), True)\n\n"
+    string += f"        return {heap_array_item_string(metadata[1], 'self._address', 'item')}\n\n"
 
     # add __setitem__
     string += f"    def __setitem__(self, item, value):\n"
-    string += f"        _mod.mem.set{metadata[1]}(self._address + (item * self._item_size), value, True)\n\n"
+    string += f"        if isinstance(item, slice):\n"
+    string += f"            self._assign_slice(item, value)\n"
+    string += f"        else:\n"
+    string += f"            {heap_array_item_string(metadata[1], 'self._address', 'item')} = value\n\n"
 
     return string
 
 
 # first str in tuple(str, str, int) is for the name of the array class.
-# second str in tuple(str, str, int) is for the string that will use to get/set the memory from wasm,
-# for example Int16 or Float32...
-# first int in tuple(str, str, int) is for the size in bytes of an item.
-primitive_array_classes_metadata: list[tuple[str, str, int]] = [
-    ("CharArray", "Int8", 1),
-    ("UCharArray", "Uint8", 1),
-    ("Int16Array", "Int16", 2),
-    ("UInt16Array", "Uint16", 2),
-    ("Int32Array", "Int32", 4),
-    ("UInt32Array", "Uint32", 4),
-    # ("Int64Array", "Int16"), not implemented
-    # ("UInt64Array", "Uint16"), not implemented
-    ("FloatArray", "Float32", 4),
-    ("DoubleArray", "Float64", 8),
+# CTypeKind in tuple(str, CTypeKind, int) is for the kind of an item, it selects the heap view used to get/set the memory
+# from wasm, for example _heap.i16 or _heap.f32...
+# first int in tuple(str, CTypeKind, int) is for the size in bytes of an item.
+primitive_array_classes_metadata: list[tuple[str, CTypeKind, int]] = [
+    ("CharArray", CTypeKind.I8, 1),
+    ("UCharArray", CTypeKind.UI8, 1),
+    ("Int16Array", CTypeKind.I16, 2),
+    ("UInt16Array", CTypeKind.UI16, 2),
+    ("Int32Array", CTypeKind.I32, 4),
+    ("UInt32Array", CTypeKind.UI32, 4),
+    # ("Int64Array", CTypeKind.I64, 8), not implemented
+    # ("UInt64Array", CTypeKind.UI64, 8), not implemented
+    ("FloatArray", CTypeKind.Float, 4),
+    ("DoubleArray", CTypeKind.Double, 8),
 ]
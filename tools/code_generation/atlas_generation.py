@@ -0,0 +1,192 @@
+texture_atlas_string: str = \
+    """
+class _SkylinePacker:
+    \"\"\"Places rectangles bottom-left first on a skyline, the top edge of what is placed so far, as segments
+    [x, y, width] from left to right\"\"\"
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self._skyline = [[0, 0, width]]
+
+    def _fit(self, index: int, width: int, height: int):
+        \"\"\"y where a rectangle whose left edge is on the segment index fits, or None\"\"\"
+        x = self._skyline[index][0]
+        if x + width > self.width:
+            return None
+        y = 0
+        remaining = width
+        while remaining > 0:
+            _, segment_y, segment_width = self._skyline[index]
+            y = max(y, segment_y)
+            if y + height > self.height:
+                return None
+            remaining -= segment_width
+            index += 1
+        return y
+
+    def insert(self, width: int, height: int):
+        \"\"\"(x, y) of a new width x height rectangle, the lowest place (then the narrowest segment), or None if
+        it doesn't fit\"\"\"
+        best = None
+        for index, (x, _, segment_width) in enumerate(self._skyline):
+            y = self._fit(index, width, height)
+            if y is not None and (best is None or (y + height, segment_width) < best[0]):
+                best = ((y + height, segment_width), index, x, y)
+        if best is None:
+            return None
+        _, index, x, y = best
+        self._skyline.insert(index, [x, y + height, width])
+        # the segments under the new one are shortened or removed
+        right = x + width
+        while index + 1 < len(self._skyline) and self._skyline[index + 1][0] < right:
+            segment = self._skyline[index + 1]
+            segment_right = segment[0] + segment[2]
+            if segment_right <= right:
+                del self._skyline[index + 1]
+            else:
+                segment[2] = segment_right - right
+                segment[0] = right
+        # and neighbours at the same height merged
+        merged = [self._skyline[0]]
+        for segment in self._skyline[1:]:
+            if segment[1] == merged[-1][1]:
+                merged[-1][2] += segment[2]
+            else:
+                merged.append(segment)
+        self._skyline = merged
+        return x, y
+
+
+class AtlasRegion:
+    \"\"\"An image packed into a TextureAtlas, drawn from the texture of the atlas\"\"\"
+    __slots__ = ("atlas", "name", "source")
+
+    def __init__(self, atlas, name, source):
+        self.atlas = atlas
+        self.name = name
+        self.source = source  # RectangleShadow of the image in the atlas, moved when the atlas grows
+
+    @property
+    def width(self) -> float:
+        return self.source.width
+
+    @property
+    def height(self) -> float:
+        return self.source.height
+
+    def draw(self, x: float, y: float, tint: Color = None):
+        \"\"\"Draw the image at (x, y), like draw_texture_rec()\"\"\"
+        atlas = self.atlas
+        if atlas._dirty:
+            atlas.build()
+        # the function the user code sees, recorded like its other draw calls when the command buffer is enabled
+        _active_context.builtins["draw_texture_rec"](atlas.texture, self.source, Vector2Shadow(x, y),
+                                                     WHITE if tint is None else tint)
+
+    def draw_pro(self, dest: Rectangle, origin: Vector2, rotation: float, tint: Color = None):
+        \"\"\"Draw the image into dest, scaled and rotated around origin, like draw_texture_pro()\"\"\"
+        atlas = self.atlas
+        if atlas._dirty:
+            atlas.build()
+        _active_context.builtins["draw_texture_pro"](atlas.texture, self.source, dest, origin, rotation,
+                                                     WHITE if tint is None else tint)
+
+
+class TextureAtlas:
+    \"\"\"Images packed into one texture: sprites drawn from it don't switch textures, each switch makes rlgl end a
+    draw call. Images added later go into the free space, only when it is full the atlas doubles its size (up to
+    max_size) and packs everything again\"\"\"
+
+    def __init__(self, width: int = 1024, height: int = 1024, padding: int = 1, max_size: int = 4096):
+        self.padding = padding  # pixels around each image, so filtering doesn't bleed the neighbours in
+        self.max_size = max_size
+        self.regions = {}  # name -> AtlasRegion
+        self.image = gen_image_color(width, height, Color(0, 0, 0, 0))  # what the texture gets, kept to add images to
+        self.texture = None
+        self._packer = _SkylinePacker(width, height)
+        self._changed = []  # rectangles of the image to upload at the next build(), None for the whole image
+        self._dirty = False
+
+    def __len__(self):
+        return len(self.regions)
+
+    def __contains__(self, name) -> bool:
+        return name in self.regions
+
+    def __getitem__(self, name) -> AtlasRegion:
+        return self.regions[name]
+
+    def add(self, name, image: Image) -> AtlasRegion:
+        \"\"\"Copy image into the atlas (it can be unloaded after), the atlas texture is updated before the next draw
+        or by build()\"\"\"
+        if name in self.regions:
+            raise KeyError(f"the atlas already has an image named {name!r}")
+        width, height = image.width, image.height
+        place = self._packer.insert(width + self.padding, height + self.padding)
+        while place is None:
+            self._grow(width, height)
+            place = self._packer.insert(width + self.padding, height + self.padding)
+        source = RectangleShadow(place[0], place[1], width, height)
+        image_draw(self.image._address, image, Rectangle(0, 0, width, height), source.to_struct(), WHITE)
+        region = self.regions[name] = AtlasRegion(self, name, source)
+        if self._changed is not None:
+            self._changed.append(source)
+        self._dirty = True
+        return region
+
+    def _grow(self, width: int, height: int):
+        \"\"\"Double the smaller side of the atlas until every image packs into it again, in decreasing height\"\"\"
+        regions = sorted(self.regions.values(), key=lambda region: -region.source.height)
+        atlas_width, atlas_height = self._packer.width, self._packer.height
+        while True:
+            if atlas_width >= self.max_size and atlas_height >= self.max_size:
+                raise ValueError(f"a {width}x{height} image doesn't fit in the atlas, even at its max_size")
+            if atlas_width <= atlas_height and atlas_width < self.max_size:
+                atlas_width = min(2 * atlas_width, self.max_size)
+            else:
+                atlas_height = min(2 * atlas_height, self.max_size)
+            packer = _SkylinePacker(atlas_width, atlas_height)
+            places = [packer.insert(int(region.source.width) + self.padding, int(region.source.height) + self.padding)
+                      for region in regions]
+            if None not in places:
+                break
+
+        image = gen_image_color(atlas_width, atlas_height, Color(0, 0, 0, 0))
+        for region, (x, y) in zip(regions, places):
+            source = region.source
+            moved = RectangleShadow(x, y, source.width, source.height)
+            image_draw(image._address, self.image, source.to_struct(), moved.to_struct(), WHITE)
+            region.source = moved
+        unload_image(self.image)
+        self.image = image
+        self._packer = packer
+        self._changed = None  # a new texture
+
+    def build(self):
+        \"\"\"Upload what changed since the last build to the texture: the rectangles of the images added, or a new
+        texture if the atlas grew\"\"\"
+        _command_buffer.flush()  # the draw calls recorded before use the texture as it was
+        if self.texture is None or self._changed is None:
+            if self.texture is not None:
+                _rlDrawRenderBatchActive()  # the draws rlgl batched so far still use the old texture
+                unload_texture(self.texture)
+            self.texture = load_texture_from_image(self.image)
+        else:
+            for rectangle in self._changed:
+                pixels = image_from_image(self.image, rectangle.to_struct())
+                update_texture_rec(self.texture, rectangle.to_struct(), pixels.data)
+                unload_image(pixels)
+        self._changed = []
+        self._dirty = False
+
+    def unload(self):
+        \"\"\"Unload the image and the texture of the atlas\"\"\"
+        unload_image(self.image)
+        if self.texture is not None:
+            unload_texture(self.texture)
+            self.texture = None
+"""
+
+# the export of rlgl the atlas calls, bound in textures with the exports of its functions
+texture_atlas_wasm_functions_names: list[str] = ["_rlDrawRenderBatchActive"]
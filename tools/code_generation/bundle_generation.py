@@ -0,0 +1,48 @@
+import hashlib
+import importlib.util
+import json
+import py_compile
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+# the python of the pyodide version the pages load (v0.23.4), .pyc files only import in the same minor version
+PYODIDE_PYTHON_VERSION: tuple[int, int] = (3, 11)
+
+BUNDLE_NAME: str = "wasmraypy.zip"
+
+
+def compile_to_pyc(source_path: Path) -> bytes:
+    """return the .pyc of a source file, unchecked hash based so the same source always gives the same bytes, and
+    optimized (optimize=1) so the "if __debug__:" argument checks are left out: the bundle is the release build"""
+    with tempfile.TemporaryDirectory() as directory:
+        pyc_path = Path(directory) / "module.pyc"
+        py_compile.compile(str(source_path), cfile=str(pyc_path), dfile=source_path.name, doraise=True, optimize=1,
+                           invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+        return pyc_path.read_bytes()
+
+
+def generate_bundle(docs_path: Path) -> None:
+    """zip the .pyc of every file in wasmraypy/files.json, for zipimport, and write its hash into wasmraypy/bundle.json"""
+    if sys.version_info[:2] != PYODIDE_PYTHON_VERSION:
+        print(f"{BUNDLE_NAME} needs python {'.'.join(map(str, PYODIDE_PYTHON_VERSION))} to match pyodide, "
+              f"not {sys.version_info.major}.{sys.version_info.minor}, it was not regenerated")
+        return
+
+    files = json.loads((docs_path / "wasmraypy" / "files.json").read_text())
+    with zipfile.ZipFile(docs_path / BUNDLE_NAME, "w", zipfile.ZIP_DEFLATED) as bundle:
+        for file in sorted(files, key=lambda file: file["path"]):
+            # a fixed date keeps the zip the same when the sources didn't change
+            info = zipfile.ZipInfo(file["path"][:-len(".py")] + ".pyc", date_time=(1980, 1, 1, 0, 0, 0))
+            info.compress_type = zipfile.ZIP_DEFLATED
+            bundle.writestr(info, compile_to_pyc(docs_path / file["url"]))
+
+    bundle_hash: str = hashlib.sha256((docs_path / BUNDLE_NAME).read_bytes()).hexdigest()[:16]
+    with open(docs_path / "wasmraypy" / "bundle.json", "w") as writer:
+        json.dump({"url": BUNDLE_NAME, "hash": bundle_hash, "magic": importlib.util.MAGIC_NUMBER.hex()}, writer, indent=2)
+        writer.write("\n")
+
+
+if __name__ == "__main__":
+    generate_bundle(Path(__file__).parent.parent.parent / "docs")
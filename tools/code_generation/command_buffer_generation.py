@@ -0,0 +1,275 @@
+from ctype_lexer import *
+from ctype_parser import *
+from function_generation import python_function_name, function_member_to_python_type_hint
+from heap_generation import heap_view_for_ctype_kind
+
+command_buffer_string: str = \
+    """
+import struct
+
+
+class CommandBuffer:
+    \"\"\"Records draw calls as packed opcodes, so a whole frame is replayed with one call into wasm\"\"\"
+
+    def __init__(self, capacity: int = 64 * 1024):
+        self._data = bytearray(capacity)
+        self._length = 0
+        self._frozen_copies = {}  # id -> (frozen struct, its bytes)
+        self._address = 0
+        self._wasm_capacity = 0
+
+    def __len__(self):
+        return self._length
+
+    def _reserve(self, size: int):
+        end = self._length + size
+        if end > len(self._data):
+            self._data.extend(bytes(max(end, 2 * len(self._data)) - len(self._data)))
+        return end
+
+    def record(self, command: struct.Struct, *args):
+        end = self._reserve(command.size)
+        try:
+            command.pack_into(self._data, self._length, *args)
+        except struct.error:
+            # a direct call lets wasm truncate floats passed as int parameters, do the same here
+            args = [int(arg) if code in "iI" else arg for code, arg in zip(command.format[1:], args)]
+            command.pack_into(self._data, self._length, *args)
+        self._length = end
+
+    def record_string(self, data: bytes):
+        # NUL terminated and padded to the 4 bytes slot size
+        end = self._reserve((len(data) + 4) & ~3)
+        self._data[self._length:self._length + len(data)] = data
+        self._data[self._length + len(data):end] = bytes(end - self._length - len(data))
+        self._length = end
+
+    def record_memory(self, address: int, size: int):
+        # a copy of the struct or array the call gets, so changing it after the call doesn't change the replay
+        end = self._reserve((size + 3) & ~3)
+        _heap.u8.subarray(address, address + size).assign_to(memoryview(self._data)[self._length:self._length + size])
+        self._length = end
+
+    def record_struct(self, value, size: int):
+        # frozen structs (the colors) never change, their bytes are read from wasm memory once
+        copy = self._frozen_copies.get(id(value))
+        if copy is None or copy[0] is not value:
+            if not getattr(value, "_frozen", False):
+                self.record_memory(value._address, size)
+                return
+            data = bytearray(size)
+            _heap.u8.subarray(value._address, value._address + size).assign_to(data)
+            copy = self._frozen_copies[id(value)] = (value, struct.Struct(f"<{(size + 3) & ~3}s"), bytes(data))
+        command = copy[1]
+        end = self._length + command.size
+        if end > len(self._data):
+            self._reserve(command.size)
+        command.pack_into(self._data, self._length, copy[2])
+        self._length = end
+
+    def flush(self):
+        \"\"\"Copy the recorded commands into wasm memory and replay them\"\"\"
+        if self._length == 0:
+            return
+        if self._wasm_capacity < self._length:
+            if self._address != 0:
+                _mod._free(self._address)
+            self._wasm_capacity = len(self._data)
+            self._address = _mod._malloc(self._wasm_capacity)
+        _heap.u8.subarray(self._address, self._address + self._length).assign(memoryview(self._data)[:self._length])
+        _ReplayCommandBuffer(self._address, self._length)
+        self._length = 0
+
+    def clear(self):
+        \"\"\"Drop the recorded commands without replaying them\"\"\"
+        self._length = 0
+
+
+_command_buffer = CommandBuffer()
+
+
+def enable_command_buffer():
+    \"\"\"Record draw calls into the command buffer and replay them all at end_drawing(), the draw calls stay direct
+    if the raylib wasm can't replay them\"\"\"
+    if _active_context.overrides or not _is_wasm_function_exported(_ReplayCommandBuffer):
+        return
+    from .commands import _command_buffer_functions
+    _active_context.override(_command_buffer_functions)
+
+
+def disable_command_buffer():
+    \"\"\"Replay anything still recorded and go back to calling wasm on every draw call\"\"\"
+    _command_buffer.flush()
+    _active_context.clear_overrides()
+
+
+def is_command_buffer_enabled() -> bool:
+    \"\"\"Check if draw calls are recorded into the command buffer\"\"\"
+    return bool(_active_context.overrides)
+
+
+def flush_command_buffer():
+    \"\"\"Replay the recorded draw calls now, needed before calls that are not recorded but depend on the drawing order\"\"\"
+    _command_buffer.flush()
+
+
+def _record_end_drawing():
+    \"\"\"End canvas drawing and swap buffers (double buffering)\"\"\"
+    _command_buffer.flush()
+    _EndDrawing()
+    _scratch_arena.reset()
+"""
+
+# the exports of raylib.c the command buffer calls, bound in core with the exports of its functions
+command_buffer_wasm_functions_names: list[str] = ["_ReplayCommandBuffer"]
+
+# BeginDrawing() and EndDrawing() frame the buffer, they are never recorded
+not_recorded_functions_names: list[str] = ["BeginDrawing", "EndDrawing"]
+
+
+def is_function_recordable(function_data) -> bool:
+    """a function can be recorded if it draws (or changes the drawing state) and has nothing to return"""
+    name: str = function_data['name']
+    if name in not_recorded_functions_names or function_data['returnType'] != "void":
+        return False
+    if not (name.startswith("Draw") or name.startswith("Begin") or name.startswith("End") or name == "ClearBackground"):
+        return False
+    return all(param['type'] != "..." for param in function_data.get('params', []))
+
+
+def parse_function_params(function_data) -> list[tuple[dict, CType]]:
+    return [(param, parse_ctype(param["type"])) for param in function_data.get('params', [])]
+
+
+def command_slot_format_for_ctype(param: dict, ctype: CType) -> str:
+    """return the struct module format char of the 4 bytes slot that holds a parameter"""
+    if param['type'] == "const char *":
+        return "I"  # the byte length, the string itself is appended after the slots
+    match ctype.kind:
+        case CTypeKind.I8 | CTypeKind.I16 | CTypeKind.I32:
+            return "i"
+        case CTypeKind.UI8 | CTypeKind.UI16 | CTypeKind.UI32 | CTypeKind.Pointer | CTypeKind.Struct:
+            return "I"
+        case CTypeKind.Float:
+            return "f"
+        case _:
+            assert False, f"{param['type']} can't be stored in a command slot"
+
+
+def command_pointer_size_string(params: list[tuple[dict, CType]], index: int) -> str:
+    """the byte size of the array a pointer parameter points to, its length is the parameter that follows it"""
+    ctype = params[index][1]
+    count = params[index + 1]
+    assert count[1].kind == CTypeKind.I32, f"{params[index][0]['name']} has no length parameter after it"
+    pointee = ctype.of
+    size = f"{pointee.struct_token.string}._size" if pointee.kind == CTypeKind.Struct else \
+        str(1 << heap_view_for_ctype_kind[pointee.kind][1])
+    return f"{count[0]['name']} * {size}"
+
+
+def generate_command_encoder_code(function_data, opcode: int) -> str:
+    params = parse_function_params(function_data)
+    name_of_function: str = python_function_name(function_data['name'])
+
+    string: str = ""
+    string += f"_{name_of_function}_command = struct.Struct(\"<i"
+    string += "".join(command_slot_format_for_ctype(param, ctype) for param, ctype in params)
+    string += "\")\n\n\n"
+
+    string += f"def _record_{name_of_function}("
+    string += ", ".join(f"{param['name']}: {'str' if param['type'] == 'const char *' else function_member_to_python_type_hint(ctype)}"
+                        for param, ctype in params)
+    string += "):\n"
+    string += f"    \"\"\"{function_data['description']}\"\"\"\n" if function_data['description'] != "" else ""
+
+    args: list[str] = [str(opcode)]
+    appended: list[str] = []  # what follows the slots, in the order of the parameters
+    for index, (param, ctype) in enumerate(params):
+        if param['type'] == "const char *":
+            string += f"    {param['name']}_ = {param['name']}.encode()\n"
+            args.append(f"len({param['name']}_)")
+            appended.append(f"_command_buffer.record_string({param['name']}_)")
+        elif ctype.kind == CTypeKind.Struct:
+            args.append(f"{ctype.struct_token.string}._size")
+            appended.append(f"_command_buffer.record_struct({param['name']}, {ctype.struct_token.string}._size)")
+        elif ctype.kind == CTypeKind.Pointer:
+            string += f"    {param['name']}_size = {command_pointer_size_string(params, index)}\n"
+            args.append(f"{param['name']}_size")
+            appended.append(f"_command_buffer.record_memory({param['name']}, {param['name']}_size)")
+        else:
+            args.append(param['name'])
+
+    string += f"    _command_buffer.record(_{name_of_function}_command, {', '.join(args)})\n"
+    for line in appended:
+        string += f"    {line}\n"
+
+    return string
+
+
+def c_command_slot_value(param: dict, ctype: CType, index: int) -> str:
+    match ctype.kind:
+        case CTypeKind.Float:
+            return f"slot[{index}].f"
+        case CTypeKind.UI8 | CTypeKind.UI16 | CTypeKind.UI32:
+            return f"slot[{index}].u"
+        case _:
+            return f"slot[{index}].i"
+
+
+def generate_command_dispatch_case_code(function_data, opcode: int) -> str:
+    params = parse_function_params(function_data)
+
+    string: str = ""
+    string += f"    case {opcode}: {{  // {function_data['name']}\n"
+    string += f"      const CommandSlot* next = slot + {len(params)};\n"
+
+    args: list[str] = []
+    for index, (param, ctype) in enumerate(params):
+        if param['type'] == "const char *":
+            string += f"      const char* {param['name']} = (const char*)next;\n"
+            string += f"      next += COMMAND_STRING_SLOTS(slot[{index}].u);\n"
+            args.append(param['name'])
+        elif ctype.kind == CTypeKind.Struct or ctype.kind == CTypeKind.Pointer:
+            # the copy recorded after the slots, the slot holds its byte size
+            string += f"      {param['type']} {param['name']} = ({param['type']})next;\n" \
+                if ctype.kind == CTypeKind.Pointer else \
+                f"      const {param['type']}* {param['name']} = (const {param['type']}*)next;\n"
+            string += f"      next += COMMAND_DATA_SLOTS(slot[{index}].u);\n"
+            args.append(param['name'] if ctype.kind == CTypeKind.Pointer else f"*{param['name']}")
+        else:
+            args.append(c_command_slot_value(param, ctype, index))
+
+    string += f"      {function_data['name']}({', '.join(args)});\n"
+    string += f"      return next;\n"
+    string += f"    }}\n"
+
+    return string
+
+
+def generate_command_dispatch_header(functions_data) -> str:
+    string: str = ""
+    string += "// Generated by tools/code_generation/filesGeneration.py, do not edit by hand\n"
+    string += "// Replays the draw calls recorded by the python CommandBuffer (see ReplayCommandBuffer in raylib.c)\n\n"
+    string += "#pragma once\n\n"
+    string += "#include <stddef.h>\n\n"
+    string += "// every recorded argument takes one 4 bytes slot, structs and arrays hold their byte size and are copied\n"
+    string += "// after the slots, so the replay sees them as they were when the call was recorded\n"
+    string += "typedef union CommandSlot {\n"
+    string += "  int i;\n"
+    string += "  unsigned int u;\n"
+    string += "  float f;\n"
+    string += "} CommandSlot;\n\n"
+    string += "// strings are stored NUL terminated right after the slots of their command\n"
+    string += "#define COMMAND_STRING_SLOTS(length) (((length) + 4) / 4)\n"
+    string += "#define COMMAND_DATA_SLOTS(size) (((size) + 3) / 4)\n\n"
+    string += "// replay a single command, returns the slot of the next command or NULL for an unknown opcode\n"
+    string += "static const CommandSlot* ReplayCommand(int opcode, const CommandSlot* slot) {\n"
+    string += "  switch (opcode) {\n"
+    for opcode, function_data in enumerate(functions_data):
+        string += generate_command_dispatch_case_code(function_data, opcode)
+    string += "    default:\n"
+    string += "      return NULL;\n"
+    string += "  }\n"
+    string += "}\n"
+
+    return string
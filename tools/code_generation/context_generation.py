@@ -0,0 +1,166 @@
+context_string: str = \
+    """
+import builtins
+import sys
+
+
+class Context:
+    \"\"\"A raylib wasm instance (one per canvas) and the state the wrapper keeps for it, the modules of the
+    wrapper are shared and work on the active context\"\"\"
+
+    def __init__(self, mod, state: dict = None):
+        from . import LazyBuiltins
+        self.mod = mod
+        self.builtins = LazyBuiltins(builtins.__dict__)  # shared by the user code that runs on this context
+        self.overrides = {}  # names the user code sees replaced, by enable_command_buffer()
+        self.profiler = None  # see enable_profiling()
+        self.wasm_functions = {}  # name -> wasm export of the _mod in the state, see bind_wasm_functions()
+        if state is not None:
+            self.state = state
+            return
+
+        heap = HeapViews(mod)
+        mod.onMemoryGrowth = heap.refresh
+        self.state = {
+            "_mod": mod,
+            "_heap": heap,
+            "_scratch_arena": ScratchArena(),
+            "_struct_pool": StructPool(mod),
+            "_command_buffer": CommandBuffer(),
+            "_text_layouts": TextLayoutCache(),
+            "_cached_layers": {},  # name -> CachedLayer, see cached_layer()
+        }
+        # colors are structs in wasm memory too, so every wasm instance needs its own
+        previous = _active_context
+        self.activate()
+        self.state.update((name, Color(*rgba, frozen=True)) for name, rgba in _colors.items())
+        previous.activate()
+
+    def activate(self):
+        \"\"\"Make the wrapper work on the wasm instance of this context, before running its user code\"\"\"
+        global _active_context
+        if _active_context is self:
+            return
+        self._bind_state()
+        _active_context = self
+
+    def _bind_state(self):
+        for module_name in _context_modules_names:
+            module = sys.modules.get(module_name)
+            if module is None:
+                continue
+            namespace = module.__dict__
+            for name, value in self.state.items():
+                if name in namespace:
+                    namespace[name] = value
+            if "_wasm_functions_names" in namespace:
+                self.bind_wasm_functions(namespace)
+
+    def bind_wasm_functions(self, namespace: dict):
+        \"\"\"Bind the wasm exports a module of the wrapper calls (_DrawText for _mod._DrawText) to this context\"\"\"
+        wasm_functions = self.wasm_functions
+        mod = self.state["_mod"]
+        for name in namespace["_wasm_functions_names"]:
+            function = wasm_functions.get(name)
+            if function is None:
+                function = wasm_functions[name] = getattr(mod, name, None) or _missing_wasm_function(name)
+            namespace[name] = function
+
+    def set_profiler(self, profiler):
+        \"\"\"Swap the state that talks to wasm for the stand-ins of profiler, or back when profiler is None\"\"\"
+        if self.profiler is not None:
+            self.state.update(self.profiler.profiled_state)
+        self.profiler = profiler
+        if profiler is not None:
+            self.state.update(profiler.stand_ins(self.state))
+        self.wasm_functions.clear()  # fetched again from the new _mod
+        if _active_context is self:
+            self._bind_state()
+
+    def install(self, namespace: dict):
+        \"\"\"Make the names of the wrapper usable in namespace (the globals of the user code) without importing them\"\"\"
+        namespace["__builtins__"] = self.builtins
+        namespace["_mod"] = self.mod
+
+    def new_namespace(self) -> dict:
+        \"\"\"Globals for new user code of this context, what the previous user code left (window, command buffer) is reset\"\"\"
+        self.activate()
+        if self.mod._IsWindowReady():
+            self.mod._CloseWindow()
+        self.clear_overrides()
+        self.set_profiler(None)
+        self.state["_command_buffer"].clear()
+        self.state["_cached_layers"].clear()  # their render textures went with the window
+        namespace = {"__name__": "__main__"}
+        self.install(namespace)
+        return namespace
+
+    @staticmethod
+    def user_function(namespace: dict, name: str):
+        \"\"\"The function name of the user code, called by the frame loop with the frame timestamp even if it
+        takes no argument\"\"\"
+        function = namespace[name]
+        if getattr(getattr(function, "__code__", None), "co_argcount", 0) > 0:
+            return function
+        return lambda timestamp: function()
+
+    def override(self, values: dict):
+        \"\"\"Replace names of the wrapper for the user code of this context\"\"\"
+        self.overrides.update(values)
+        self.builtins.update(values)
+
+    def clear_overrides(self):
+        \"\"\"Go back to the names of the wrapper, they are looked up again the next time they are used\"\"\"
+        for name in self.overrides:
+            self.builtins.pop(name, None)
+        self.overrides.clear()
+
+
+_cached_layers = {}  # name -> CachedLayer of the active context, see cached_layer() in textures
+
+_active_context = Context(_mod, {name: globals()[name] for name in
+                                 ["_mod", "_heap", "_scratch_arena", "_struct_pool", "_command_buffer",
+                                  "_text_layouts", "_cached_layers", *_colors]})
+
+
+def _missing_wasm_function(name: str):
+    \"\"\"Stands in for a function the raylib wasm doesn't export, it fails only if it is called\"\"\"
+    def missing(*args):
+        raise AttributeError(f"the raylib wasm doesn't export {name}, see EXPORTED_FUNCTIONS in tools/build.sh")
+    missing.missing_name = name
+    return missing
+
+
+_warned_missing_wasm_functions = set()
+
+
+def _is_wasm_function_exported(function) -> bool:
+    \"\"\"Check if a bound wasm export is a function of the raylib wasm and not the stand-in of a missing one, the
+    wrapper falls back to python for the functions of raylib.c a wasm built before them lacks (warned about once)\"\"\"
+    name = getattr(function, "missing_name", None)
+    if name is None:
+        return True
+    if name not in _warned_missing_wasm_functions:
+        _warned_missing_wasm_functions.add(name)
+        warnings.warn(f"the raylib wasm doesn't export {name}, the wrapper does without it until the wasm is "
+                      f"rebuilt with tools/build.sh")
+    return False
+
+
+def _bind_wasm_functions(namespace: dict):
+    \"\"\"Bind the wasm exports a module of the wrapper calls to the active context, when the module is imported\"\"\"
+    _active_context.bind_wasm_functions(namespace)
+"""
+
+
+def generate_context_modules_code(package_modules_names: list[str], api_modules_names: list[str]) -> str:
+    string: str = ""
+    string += "# the modules that use the state of a context, Context.activate() switches it in them\n"
+    string += "_context_modules_names = [\n"
+    for module_name in package_modules_names:
+        string += f"    f\"{{__package__}}.{module_name}\",\n"
+    for module_name in api_modules_names:
+        string += f"    \"{module_name}\",\n"
+    string += "]\n"
+
+    return string
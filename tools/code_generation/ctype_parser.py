@@ -1,5 +1,7 @@
 from __future__ import annotations
+import functools
 from ctype_token import *
+from ctype_lexer import Lexer
 
 END_OF_FILE = '\0'
 
@@ -193,3 +195,15 @@ class Parser:
             ctype_pointer_or_array.of = ctype
             ctype = ctype_pointer_or_array
         return ctype
+
+
+_lexer = Lexer()
+_parser = Parser()
+
+
+@functools.lru_cache(maxsize=None)
+def parse_ctype(string: str) -> CType:
+    """return the CType of a C type string, memoized: the API repeats the same few types thousands of times and the
+    CType objects are never changed after parsing"""
+    _lexer.lex_string_to_token_stream(string)
+    return _parser.parse_token_stream_to_ctype(_lexer.token_stream)
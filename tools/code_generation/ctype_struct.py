@@ -8,15 +8,16 @@ END_OF_FILE = '\0'
 
 # first step, build all the structs as objects and link then together (if needed)
 
-# struct_name-size par
-struct_name_size_pars: list[tuple[str, int]] = []
+# struct name -> struct_name-size-alignment par
+struct_name_size_pars: dict[str, tuple[str, int, int]] = {}
 
 
-def get_struct_name_size_par_by_name(name: str) -> tuple[str, int]:
-    for par in struct_name_size_pars:
-        if name == par[0]:
-            return par
-    return None
+def add_struct_name_size_par(name: str, size: int, alignment: int) -> None:
+    struct_name_size_pars[name] = (name, size, alignment)
+
+
+def get_struct_name_size_par_by_name(name: str) -> tuple[str, int, int]:
+    return struct_name_size_pars.get(name)
 
 
 def get_ctype_size(ctype: CType) -> int:
@@ -42,26 +43,51 @@ def get_ctype_size(ctype: CType) -> int:
     return size
 
 
+def get_ctype_alignment(ctype: CType) -> int:
+    """return CType object alignment in bytes, following the wasm32 C ABI (every scalar is aligned to its size)"""
+    match ctype.kind:
+        case CTypeKind.Void:
+            raise SyntaxError("void type shouldn't be checked for alignment")
+        case CTypeKind.Array:
+            return get_ctype_alignment(ctype.of)
+        case CTypeKind.Struct:
+            return get_struct_name_size_par_by_name(ctype.struct_token.string)[2]
+        case _:
+            return get_ctype_size(ctype)
+
+
+def align_up(value: int, alignment: int) -> int:
+    return (value + alignment - 1) // alignment * alignment
+
+
 class CTypeStruct:
     def __init__(self, name: str, members: list[CType]):
         self.name = name
         self.members = members
-        self.size = 0  # the size of the struct in bytes
-
-    def calculate_size(self):
+        self.size = 0  # the size of the struct in bytes, including the tail padding
+        self.alignment = 1  # the alignment of the struct in bytes, the biggest alignment of its members
+        self.offsets: list[int] = []  # the offset of each member in bytes
+        self.paddings: list[int] = []  # the padding bytes inserted before each member
+        self.tail_padding = 0  # the padding bytes after the last member, so arrays of the struct stay aligned
+
+    def calculate_layout(self):
+        offset: int = 0
         for member in self.members:
-            self.size += get_ctype_size(member)
+            alignment: int = get_ctype_alignment(member)
+            aligned_offset: int = align_up(offset, alignment)
+            self.paddings.append(aligned_offset - offset)
+            self.offsets.append(aligned_offset)
+            self.alignment = max(self.alignment, alignment)
+            offset = aligned_offset + get_ctype_size(member)
+
+        self.size = align_up(offset, self.alignment)
+        self.tail_padding = self.size - offset
 
 
 def parse_struct_json_to_CTypeStruct(struct_json) -> CTypeStruct:
     members: list[CType] = []
-    lexer = Lexer()
-    parser = Parser()
 
     for field in struct_json["fields"]:
-        lexer.lex_string_to_token_stream(field["type"])
-        ctype = parser.parse_token_stream_to_ctype(lexer.token_stream)
-
-        members.append(ctype)
+        members.append(parse_ctype(field["type"]))
 
     return CTypeStruct(struct_json["name"], members)
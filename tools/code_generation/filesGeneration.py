@@ -1,49 +1,93 @@
 from __future__ import annotations
 import array_generation
+import assets_generation
+import atlas_generation
 import ctype_struct
 import struct_generation
 import enum_generation
 import define_generation
 import function_generation
 import color_generation
+import command_buffer_generation
+import heap_generation
+import layer_generation
+import struct_layout_generation
+import scratch_arena_generation
+import struct_pool_generation
+import text_layout_generation
+import package_generation
+import context_generation
+import profiler_generation
+import pixels_generation
+import raymath_arrays_generation
+import sprite_batch_generation
+import bundle_generation
+import hashlib
 import json
+import re
+import sys
 from pathlib import Path
 
 RAYLIB_PYTHON_WEB_FOLDER_PATH = Path(__file__).parent.parent.parent
 print(RAYLIB_PYTHON_WEB_FOLDER_PATH)
 JSON_API_FOLDER_PATH = RAYLIB_PYTHON_WEB_FOLDER_PATH / "tools/api"
 WASMRAYPY_FOLDER_PATH = RAYLIB_PYTHON_WEB_FOLDER_PATH / "docs"
+RAYLIB_C_FOLDER_PATH = RAYLIB_PYTHON_WEB_FOLDER_PATH / "src"
+API_MODULES_FOLDER_PATH = WASMRAYPY_FOLDER_PATH / "modules"
+PACKAGE_FOLDER_PATH = WASMRAYPY_FOLDER_PATH / "wasmraypy"
+# the hashes of the inputs of the last generation, python3 filesGeneration.py --force regenerates anyway
+INPUTS_HASHES_PATH = Path(__file__).parent / "inputs_hashes.json"
 
-wrapped_defines_names = []
+# raylib.h is split into modules like raylib's own source files, the C name is the first function of each module
+RAYLIB_MODULES_FIRST_FUNCTIONS = [("InitWindow", "core"), ("SetShapesTexture", "shapes"), ("LoadImage", "textures"),
+                                  ("GetFontDefault", "text"), ("DrawLine3D", "models"), ("InitAudioDevice", "audio")]
+# structs only the functions of one module use, the others are in core
+RAYLIB_MODULES_STRUCTS = {"textures": ["NPatchInfo"], "text": ["GlyphInfo"],
+                          "models": ["Mesh", "MaterialMap", "Material", "Transform", "BoneInfo", "Model", "ModelAnimation",
+                                     "RayCollision", "BoundingBox"],
+                          "audio": ["Wave", "AudioStream", "Sound", "Music"]}
 
-wrapped_colors_names = []
+# the headers next to raylib.h, each is wrapped into its own module: import raymath, rlgl, ...
+API_MODULES_NAMES = ["raymath", "rlgl", "raygui", "rcamera", "reasings"]
 
-wrapped_enums_names = []
+wrapped_defines_names = set()
 
-wrapped_structures_names = []
-wrapped_structures_names_stub = []
+wrapped_colors_names = set()
 
-wrapped_aliases_names = []
+wrapped_enums_names = set()
 
-wrapped_functions_names = []
+wrapped_structures_names = set()
+wrapped_structures_names_stub = set()
+
+wrapped_aliases_names = set()
+
+wrapped_functions_names = set()
+wrapped_functions_python_names = {}  # python name -> C name, to catch two C names that end up as one python name
 
 
 # -----------------------------------------
 
 
-def generate_file(file_path: Path) -> None:
-    if Path(file_path).exists():
-        with open(Path(file_path), "w"):  # if the file exists we clean it
-            pass
-    else:
-        print(f"the {file_path} doesn't exist, regenerating a new one")
-        with open(file_path, "x"):
-            pass
+def inputs_hashes() -> dict[str, str]:
+    """the content hash of every file the generation reads: the api json files and the generator itself"""
+    paths = sorted(JSON_API_FOLDER_PATH.glob("*.json")) + sorted(Path(__file__).parent.glob("*.py"))
+    return {path.relative_to(RAYLIB_PYTHON_WEB_FOLDER_PATH).as_posix(): hashlib.sha256(path.read_bytes()).hexdigest()
+            for path in paths}
+
 
+written_files: list[Path] = []
 
-def add_text_to_file(file_path: Path, _string: str) -> None:
-    with open(Path(file_path), "a") as file:
+
+def write_file(file_path: Path, _string: str) -> None:
+    """write the file in one go, only if its content changed so unchanged outputs keep their time stamps"""
+    file_path = Path(file_path)
+    if not file_path.exists():
+        print(f"the {file_path} doesn't exist, regenerating a new one")
+    elif file_path.read_text() == _string:
+        return
+    with open(file_path, "w") as file:
         file.write(_string)
+    written_files.append(file_path)
 
 
 # -----------------------------------------
@@ -52,6 +96,7 @@ def generate_wasm_array_classes_code() -> str:
     _string = ""
     _string += array_generation.wasm_array_string + '\n'
     _string += array_generation.struct_array_string + '\n'
+    _string += pixels_generation.pixel_array_string.lstrip('\n') + '\n'
 
     for primitive_array_metadata in array_generation.primitive_array_classes_metadata:
         _string += array_generation.generate_primitive_array_class(primitive_array_metadata) + '\n'
@@ -64,18 +109,23 @@ def generate_structs_aliases_code(structs_api, aliases_api) -> str:
     for struct_api in structs_api:
         if struct_api['name'] in wrapped_structures_names:
             continue
-        wrapped_enums_names.append(struct_api['name'])
+        if struct_api['name'] in wrapped_aliases_names:
+            continue  # for example Texture2D, that raygui.h redefines as a struct
+        if any(field['type'].startswith('#') for field in struct_api['fields']):
+            continue  # the raylib parser keeps the #if lines inside rlVertexBuffer as fields
+        wrapped_structures_names.add(struct_api['name'])
         _string += struct_generation.generate_struct_code(struct_api)
+        if struct_api['name'] in struct_generation.shadow_structs_names:
+            _string += struct_generation.generate_shadow_struct_code(struct_api)
 
         struct_aliases = struct_generation.does_struct_name_has_alias(struct_api['name'], aliases_api)
         for alias_api in struct_aliases:
             if alias_api['name'] in wrapped_aliases_names:
                 continue
-            wrapped_aliases_names.append(alias_api['name'])
+            wrapped_aliases_names.add(alias_api['name'])
             _string += struct_generation.generate_struct_alias_code(alias_api) + '\n'
-            struct_ = ctype_struct.parse_struct_json_to_CTypeStruct(struct_api)
-            struct_.calculate_size()
-            struct_generation.struct_name_size_pars.append((alias_api['name'], struct_.size))
+            _, size, alignment = ctype_struct.get_struct_name_size_par_by_name(struct_api['name'])
+            ctype_struct.add_struct_name_size_par(alias_api['name'], size, alignment)
 
     return _string
 
@@ -85,7 +135,7 @@ def generate_enums_code(enums_api) -> str:
     for enum_api in enums_api:
         if enum_api['name'] in wrapped_enums_names:
             continue
-        wrapped_enums_names.append(enum_api['name'])
+        wrapped_enums_names.add(enum_api['name'])
         _string += enum_generation.generate_enum_code(enum_api) + '\n'
 
     return _string
@@ -96,37 +146,147 @@ def generate_defines_code(defines_api) -> str:
     for define_api in defines_api:
         if define_api['name'] in wrapped_defines_names:
             continue
-        wrapped_enums_names.append(define_api['name'])
+        wrapped_defines_names.add(define_api['name'])
         _string += define_generation.generate_define_code(define_api)
 
     return _string
 
 
-def generate_functions_code(functions_api) -> str:
+def generate_functions_code(functions_api, module_name: str = "raylib", runtime_wasm_functions_names=()) -> str:
+    """runtime_wasm_functions_names: the exports the runtime code of the module calls, bound with the ones of its
+    functions"""
     _string = ""
+    wasm_functions_names: list[str] = []
     for function_api in functions_api:
         if function_api['name'] in wrapped_functions_names:
             continue
-        wrapped_functions_names.append(function_api['name'])
-        function_string = function_generation.generate_function_code(function_api)
-        _string += function_string + '\n\n' if function_string != "" else ""
+        wrapped_functions_names.add(function_api['name'])
+        python_name = function_generation.python_function_name(function_api['name'])
+        if python_name in wrapped_functions_python_names:
+            print(f"{function_api['name']} and {wrapped_functions_python_names[python_name]} have the same python name, "
+                  f"{function_api['name']} is wrapped as {module_name}_{python_name}")
+            python_name = f"{module_name}_{python_name}"
+        wrapped_functions_python_names[python_name] = function_api['name']
+        function_string = function_generation.generate_function_code(function_api, python_name)
+        if function_string == "":
+            continue
+        _string += function_string + '\n\n'
+        wasm_functions_names.append(function_generation.wasm_function_name(function_api['name']))
+        if "_memcpy(" in function_string and "_memcpy" not in wasm_functions_names:
+            wasm_functions_names.append("_memcpy")
+    wasm_functions_names += [name for name in dict.fromkeys(runtime_wasm_functions_names)
+                             if name not in wasm_functions_names]
+
+    if len(wasm_functions_names) != 0:
+        _string += function_generation.generate_wasm_functions_binding_code(wasm_functions_names) + '\n'
 
     return _string
 
 
 def generate_colors_code(defines_api) -> str:
-    _string = ""
-    for defines_api in defines_api:
-        if defines_api['name'] in wrapped_colors_names:
-            continue
-        color_string = color_generation.generate_color_code(defines_api)
-        if color_string != "":
-            wrapped_functions_names.append(defines_api['name'])
-            _string += color_string + '\n'
+    colors_api = [define_api for define_api in defines_api
+                  if define_api['type'] == "COLOR" and define_api['name'] not in wrapped_colors_names]
+
+    # the values are kept, each context creates the colors again in its own wasm memory
+    _string = "# color name -> (r, g, b, a)\n"
+    _string += "_colors = {\n"
+    for color_api in colors_api:
+        _string += color_generation.generate_color_values_code(color_api) + '\n'
+    _string += "}\n"
+    for color_api in colors_api:
+        wrapped_functions_names.add(color_api['name'])
+        _string += color_generation.generate_color_code(color_api) + '\n'
 
     return _string + '\n'
 
 
+def generate_module_header(description: str, source: str, imported_modules_names: list[tuple[str, list[str]]]) -> str:
+    _string = ""
+    _string += f"# Generated by tools/code_generation/filesGeneration.py, do not edit by hand\n"
+    _string += f"# {description}\n"
+    if "enum.IntEnum" in source and "import enum\n" not in source:
+        _string += "import enum\n"
+    if "struct.Struct" in source and "import struct\n" not in source:
+        _string += "import struct\n"
+    # the modules share the wasm module, helpers and struct classes of wasmraypy.core, but not what they define
+    defined_names = set(package_generation.top_level_names(source))
+    # one import group per module, a module can be listed more than once (its structs, then its functions)
+    modules_names: dict[str, dict[str, None]] = {}
+    for from_module, names in imported_modules_names:
+        modules_names.setdefault(from_module, {}).update(dict.fromkeys(names))
+    for from_module, names in modules_names.items():
+        _string += package_generation.generate_module_imports_code(source, from_module,
+                                                                   [name for name in names if name not in defined_names])
+
+    return _string + "\n\n"
+
+
+def generate_api_module_code(module_name: str, api) -> str:
+    _string = ""
+    _string += generate_structs_aliases_code(api['structs'], api['aliases'])
+    _string += generate_enums_code(api['enums'])
+    _string += generate_defines_code(api['defines']) + '\n'
+    _string += generate_functions_code(api['functions'], module_name,
+                                       runtime_wasm_functions_names.get(module_name, []))
+
+    return _string
+
+
+def split_raylib_structs(structs_api) -> dict[str, list]:
+    modules_structs = {"core": []}
+    for struct_api in structs_api:
+        module_name = next((module_name for module_name, names in RAYLIB_MODULES_STRUCTS.items()
+                            if struct_api['name'] in names), "core")
+        modules_structs.setdefault(module_name, []).append(struct_api)
+
+    return modules_structs
+
+
+def split_raylib_functions(functions_api) -> dict[str, list]:
+    modules_functions = {}
+    module_name = RAYLIB_MODULES_FIRST_FUNCTIONS[0][1]
+    first_functions = dict(RAYLIB_MODULES_FIRST_FUNCTIONS)
+    for function_api in functions_api:
+        module_name = first_functions.get(function_api['name'], module_name)
+        modules_functions.setdefault(module_name, []).append(function_api)
+
+    return modules_functions
+
+
+def recordable_functions(functions_api) -> list:
+    return [function_api for function_api in functions_api
+            if command_buffer_generation.is_function_recordable(function_api)]
+
+
+def generate_command_buffer_code(functions_api) -> str:
+    _string = ""
+
+    functions = recordable_functions(functions_api)
+    for opcode, function_api in enumerate(functions):
+        _string += command_buffer_generation.generate_command_encoder_code(function_api, opcode) + '\n\n'
+
+    _string += "_command_buffer_functions = {\n"
+    for function_api in functions:
+        name_of_function = function_generation.python_function_name(function_api['name'])
+        _string += f"    \"{name_of_function}\": _record_{name_of_function},\n"
+    _string += "    \"end_drawing\": _record_end_drawing,\n"
+    _string += "}\n\n"
+
+    return _string
+
+
+# -----------------------------------------
+# skip the generation when its inputs didn't change since the last one
+current_inputs_hashes = inputs_hashes()
+previous_inputs_hashes = json.loads(INPUTS_HASHES_PATH.read_text()) if INPUTS_HASHES_PATH.exists() else {}
+changed_inputs = [name for name in sorted(current_inputs_hashes.keys() | previous_inputs_hashes.keys())
+                  if current_inputs_hashes.get(name) != previous_inputs_hashes.get(name)]
+if not changed_inputs and "--force" not in sys.argv[1:]:
+    print("the inputs didn't change since the last generation, nothing to do (--force regenerates anyway)")
+    sys.exit(0)
+for name in changed_inputs:
+    print(f"changed: {name}")
+
 # -----------------------------------------
 """# load config data
 with open(Path(JSON_API_FOLDER_PATH / 'config.json')) as reader:
@@ -178,9 +338,16 @@ raygui_api_aliases = raygui_api['aliases']
 raygui_api_enums = raygui_api['enums']
 raygui_api_functions = raygui_api['functions']
 
+# load rcamera data
+with open(Path(JSON_API_FOLDER_PATH / 'rcamera.json')) as reader:
+    rcamera_api = json.load(reader)
+
+# load reasings data
+with open(Path(JSON_API_FOLDER_PATH / 'reasings.json')) as reader:
+    reasings_api = json.load(reader)
+
 # -----------------------------------------
-# generate all the files for wasmraypy
-generate_file(WASMRAYPY_FOLDER_PATH / 'wasmraypy.txt')
+# generate the wasmraypy package
 other_text = """
 import enum
 
@@ -190,22 +357,137 @@ import enum
 # newColor.a = 127
 
 
-def struct_clone(source, a):
-    if not a:
-        a = _mod._malloc(source._size)
+def struct_clone(source, a: int = 0):
+    owned = not a
+    if owned:
+        a = _struct_pool.alloc(source._size)
     _mod._memcpy(a, source._address, source._size)
-    out = source.__class__(address=a)
+    out = getattr(source, "_struct", source.__class__)(address=a)  # a shadow struct clones into its wasm struct
+    out._to_free = _struct_pool if owned else False
     return out
 """
-add_text_to_file(WASMRAYPY_FOLDER_PATH / 'wasmraypy.txt', other_text)
-add_text_to_file(WASMRAYPY_FOLDER_PATH / 'wasmraypy.txt', generate_wasm_array_classes_code())
-add_text_to_file(WASMRAYPY_FOLDER_PATH / 'wasmraypy.txt',
-                 generate_structs_aliases_code(raylib_api_structs, raylib_api_aliases))
-add_text_to_file(WASMRAYPY_FOLDER_PATH / 'wasmraypy.txt',
-                 generate_enums_code(raylib_api_enums))
-add_text_to_file(WASMRAYPY_FOLDER_PATH / 'wasmraypy.txt',
-                 generate_defines_code(raylib_api_defines))
-add_text_to_file(WASMRAYPY_FOLDER_PATH / 'wasmraypy.txt',
-                 generate_functions_code(raylib_api_functions))
-add_text_to_file(WASMRAYPY_FOLDER_PATH / 'wasmraypy.txt',
-                 generate_colors_code(raylib_api_defines))
+
+# the wasm module, runtime helpers, structs, enums, defines, colors and the core functions
+core_source = ""
+core_source += other_text
+core_source += heap_generation.heap_views_string
+core_source += scratch_arena_generation.scratch_arena_string
+core_source += struct_pool_generation.struct_pool_string
+core_source += generate_wasm_array_classes_code()
+raylib_modules_structs = split_raylib_structs(raylib_api_structs)
+core_source += generate_structs_aliases_code(raylib_modules_structs["core"], raylib_api_aliases)
+core_source += struct_layout_generation.struct_layout_check_string + '\n'
+core_source += generate_enums_code(raylib_api_enums)
+core_source += generate_defines_code(raylib_api_defines)
+core_source += generate_colors_code(raylib_api_defines)
+core_source += command_buffer_generation.command_buffer_string + '\n'
+core_source += text_layout_generation.text_layout_string + '\n'
+core_source += function_generation.argument_checks_string + '\n'
+core_source += context_generation.context_string + '\n'
+core_source += profiler_generation.profiler_string + '\n'
+
+raylib_modules_functions = split_raylib_functions(raylib_api_functions)
+# the exports of raylib.c the runtime code appended to a module calls
+runtime_wasm_functions_names: dict[str, list[str]] = {
+    "core": command_buffer_generation.command_buffer_wasm_functions_names +
+            text_layout_generation.text_layout_wasm_functions_names +
+            struct_layout_generation.struct_layout_wasm_functions_names,
+    "textures": sprite_batch_generation.sprite_batch_wasm_functions_names +
+                atlas_generation.texture_atlas_wasm_functions_names +
+                layer_generation.cached_layer_wasm_functions_names,
+    "raymath": raymath_arrays_generation.raymath_arrays_wasm_functions_names,
+}
+modules_sources = {}
+for raylib_module_name, module_functions in raylib_modules_functions.items():
+    modules_sources[raylib_module_name] = ""
+    if raylib_module_name in RAYLIB_MODULES_STRUCTS:
+        module_structs = raylib_modules_structs[raylib_module_name]
+        modules_sources[raylib_module_name] += generate_structs_aliases_code(module_structs, raylib_api_aliases)
+        modules_sources[raylib_module_name] += \
+            struct_layout_generation.generate_struct_layout_check_code(module_structs, raylib_api_structs) + '\n'
+    modules_sources[raylib_module_name] += \
+        generate_functions_code(module_functions,
+                                runtime_wasm_functions_names=runtime_wasm_functions_names.get(raylib_module_name, []))
+# the sprites drawn with one call into wasm, next to the texture functions
+modules_sources["textures"] += '\n' + sprite_batch_generation.sprite_batch_string.lstrip('\n')
+modules_sources["textures"] += '\n' + pixels_generation.update_texture_from_array_string.lstrip('\n')
+modules_sources["textures"] += '\n' + atlas_generation.texture_atlas_string.lstrip('\n')
+modules_sources["textures"] += '\n' + layer_generation.cached_layer_string.lstrip('\n')
+# the asset loader, over the load functions of the other modules
+modules_sources["assets"] = assets_generation.asset_loader_string.lstrip('\n')
+modules_sources["core"] = core_source + '\n' + modules_sources["core"]
+# checked once the exports of core are bound, the other modules check theirs when they are imported
+modules_sources["core"] += '\n' + struct_layout_generation.generate_struct_layout_check_code(
+    raylib_modules_structs["core"], raylib_api_structs)
+modules_sources["core"] += '\n' + context_generation.generate_context_modules_code(list(modules_sources) + ["commands"],
+                                                                                   API_MODULES_NAMES)
+
+# names the other modules can import from core, _mod comes from __main__ where python-raylib-web.js puts it
+core_names: list[str] = ["_mod"] + package_generation.top_level_names(modules_sources["core"])
+# and the structs of the other modules, that the command buffer encoders also use
+modules_imported_names: list[tuple[str, list[str]]] = [(".core", core_names)]
+for raylib_module_name, module_structs in raylib_modules_structs.items():
+    if raylib_module_name != "core":
+        modules_imported_names.append((f".{raylib_module_name}",
+                                       [struct_api['name'] for struct_api in module_structs]))
+
+# the draw calls recorded by the command buffer, only imported by enable_command_buffer()
+commands_source = generate_command_buffer_code(raylib_api_functions)
+
+PACKAGE_FOLDER_PATH.mkdir(exist_ok=True)
+write_file(PACKAGE_FOLDER_PATH / '__init__.py', package_generation.generate_package_init_code(modules_sources))
+
+for raylib_module_name, module_source in modules_sources.items():
+    if raylib_module_name == "core":
+        header = generate_module_header("raylib.h, the functions of rcore and everything the other modules share",
+                                        module_source, [("__main__", ["_mod"])])
+    elif raylib_module_name == "assets":
+        header = generate_module_header("the asset loader, python-raylib-web.js fetches and python decodes",
+                                        module_source,
+                                        modules_imported_names +
+                                        [(f".{name}", package_generation.top_level_names(modules_sources[name]))
+                                         for name in raylib_modules_functions if name != "core"])
+    else:
+        header = generate_module_header(f"raylib.h, the functions of r{raylib_module_name}", module_source,
+                                        [imported for imported in modules_imported_names
+                                         if imported[0] != f".{raylib_module_name}"])
+    write_file(PACKAGE_FOLDER_PATH / f'{raylib_module_name}.py', header + module_source.lstrip('\n'))
+
+write_file(PACKAGE_FOLDER_PATH / 'commands.py',
+           generate_module_header("raylib.h, the command buffer encoders of the draw calls",
+                                  commands_source, modules_imported_names) + commands_source)
+
+# generate the C side of the command buffer
+write_file(RAYLIB_C_FOLDER_PATH / 'raylib_commands.h',
+           command_buffer_generation.generate_command_dispatch_header(recordable_functions(raylib_api_functions)))
+
+# generate the C side of the struct layout check
+write_file(RAYLIB_C_FOLDER_PATH / 'raylib_structs.h',
+           struct_layout_generation.generate_struct_layout_header(raylib_api_structs))
+
+# generate a module for each of the other headers, after raylib so they reuse its structs and skip what it has
+API_MODULES_FOLDER_PATH.mkdir(exist_ok=True)
+for api_module_name, api_module in zip(API_MODULES_NAMES, [raymath_api, rlgl_api, raygui_api, rcamera_api, reasings_api]):
+    api_module_source = generate_api_module_code(api_module_name, api_module)
+    if api_module_name == "raymath":
+        # next to the functions of single values, the same ones over arrays
+        api_module_source += raymath_arrays_generation.raymath_arrays_string
+    write_file(API_MODULES_FOLDER_PATH / f"{api_module_name}.py",
+               generate_module_header(f"{api_module_name}.h, from tools/api/{api_module_name}.json",
+                                      api_module_source,
+                                      [(f"wasmraypy{from_module}", names)
+                                       for from_module, names in modules_imported_names]) + api_module_source)
+
+# the files python-raylib-web.js writes into the pyodide file system, url relative to docs -> path in /home/pyodide
+files = [{"url": f"wasmraypy/{name}.py", "path": f"wasmraypy/{name}.py"}
+         for name in ["__init__"] + list(modules_sources) + ["commands"]]
+files += [{"url": f"modules/{name}.py", "path": f"{name}.py"} for name in API_MODULES_NAMES]
+write_file(PACKAGE_FOLDER_PATH / 'files.json', json.dumps(files, indent=2) + '\n')
+
+# compile everything above into the .pyc bundle python-raylib-web.js loads by default, again only if a source changed
+bundled_paths = {WASMRAYPY_FOLDER_PATH / file["url"] for file in files}
+if not (WASMRAYPY_FOLDER_PATH / bundle_generation.BUNDLE_NAME).exists() or bundled_paths.intersection(written_files):
+    bundle_generation.generate_bundle(WASMRAYPY_FOLDER_PATH)
+
+write_file(INPUTS_HASHES_PATH, json.dumps(current_inputs_hashes, indent=2) + '\n')
+print(f"{len(written_files)} files written")
@@ -1,5 +1,6 @@
 from ctype_lexer import *
 from ctype_parser import *
+import keyword
 import re
 
 
@@ -10,6 +11,94 @@ def underscore(_string: str) -> str:
     return _string.lower()
 
 
+# functions that end a frame, after them the string arguments of the frame are no longer needed
+scratch_arena_reset_functions_names: list[str] = ["EndDrawing"]
+
+# functions that unload a font, the text layouts cached for it are dropped too
+text_layouts_invalidate_functions_names: list[str] = ["UnloadFont"]
+
+
+def python_function_name(c_name: str) -> str:
+    """return the snake_case python name of a raylib function, for example DrawRectangleRec -> draw_rectangle_rec"""
+    return underscore(c_name).replace('3_d', '_3d').replace('2_d', '_2d').replace('vector_2', 'vector2_').replace('vector_3', 'vector3_')
+
+
+# the runtime of the argument checks, the functions run them under "if __debug__:" so they are compiled out of
+# the .pyc bundle (compiled with optimize=1) and only run when the sources are loaded
+argument_checks_string: str = \
+    """
+def _argument_error(function_name: str, name: str, value, expected: str) -> TypeError:
+    return TypeError(f"{function_name}() argument {name} must be {expected}, not {type(value).__name__}")
+
+
+def _check_int(function_name: str, name: str, value, minimum: int = None, maximum: int = None):
+    if not isinstance(value, int):
+        raise _argument_error(function_name, name, value, "int")
+    if minimum is not None and not minimum <= value <= maximum:
+        raise ValueError(f"{function_name}() argument {name} must be in [{minimum}, {maximum}], not {value}")
+
+
+def _check_float(function_name: str, name: str, value):
+    if not isinstance(value, (int, float)):
+        raise _argument_error(function_name, name, value, "float")
+
+
+def _check_str(function_name: str, name: str, value):
+    if not isinstance(value, str):
+        raise _argument_error(function_name, name, value, "str")
+
+
+def _check_struct(function_name: str, name: str, value, stype):
+    # a shadow struct stands for its wasm struct
+    if not isinstance(value, stype) and getattr(value, "_struct", None) is not stype:
+        raise _argument_error(function_name, name, value, stype.__name__)
+"""
+
+# the values a C integer type can hold, the wasm call would wrap the others around
+integer_ranges: dict[CTypeKind, tuple[int, int]] = {
+    CTypeKind.I8: (-2 ** 7, 2 ** 7 - 1), CTypeKind.UI8: (0, 2 ** 8 - 1),
+    CTypeKind.I16: (-2 ** 15, 2 ** 15 - 1), CTypeKind.UI16: (0, 2 ** 16 - 1),
+    CTypeKind.I32: (-2 ** 31, 2 ** 31 - 1), CTypeKind.UI32: (0, 2 ** 32 - 1),
+    CTypeKind.Pointer: (0, 2 ** 32 - 1),  # wasm32 addresses
+}
+
+
+def generate_argument_check_code(function_name: str, name: str, c_type: str, ctype: CType) -> str:
+    """return the debug check of an argument, specialized for its C type, or "" if it is not checked"""
+    if c_type == "const char *":
+        return f"        _check_str(\"{function_name}\", \"{name}\", {name})\n"
+    match ctype.kind:
+        case CTypeKind.Float | CTypeKind.Double:
+            return f"        _check_float(\"{function_name}\", \"{name}\", {name})\n"
+        case CTypeKind.Struct:
+            return f"        _check_struct(\"{function_name}\", \"{name}\", {name}, {ctype.struct_token.string})\n"
+        case kind if kind in integer_ranges:
+            minimum, maximum = integer_ranges[kind]
+            return f"        _check_int(\"{function_name}\", \"{name}\", {name}, {minimum}, {maximum})\n"
+        case CTypeKind.I64 | CTypeKind.UI64:
+            return f"        _check_int(\"{function_name}\", \"{name}\", {name})\n"
+    return ""
+
+
+def wasm_function_name(c_name: str) -> str:
+    """return the name a module binds the wasm export of a C function to, _mod._DrawText -> _DrawText"""
+    return f"_{c_name}"
+
+
+def generate_wasm_functions_binding_code(names: list[str]) -> str:
+    """return the binding of the wasm exports the functions of a module call, done once when it is imported"""
+    string: str = ""
+    string += "# the wasm exports called above, fetched once instead of looked up at every call, they are bound\n"
+    string += "# again when another context is activated or profiling starts\n"
+    string += "_wasm_functions_names = [\n"
+    for name in names:
+        string += f"    \"{name}\",\n"
+    string += "]\n"
+    string += "_bind_wasm_functions(globals())\n"
+
+    return string
+
+
 def function_member_to_python_type_hint(member: CType):
     match member.kind:
         case CTypeKind.Void:
@@ -49,25 +138,24 @@ def function_member_to_python_type_hint(member: CType):
             return member.struct_token.string
 
 
-def generate_function_code(function_data):
+def generate_function_code(function_data, python_name: str = ""):
     start_function = ""
     end_function = ""
     function_header = ""
     function_body = ""
 
-    lexer = Lexer()
-    parser = Parser()
-
     parameters_ctype_index_list = []
 
     # function name fixing
-    name_of_function = underscore(function_data['name']).replace('3_d', '_3d').replace('2_d', '_2d').replace('vector_2', 'vector_2').replace('vector_3', 'vector3_')
+    name_of_function = python_name if python_name != "" else python_function_name(function_data['name'])
 
     # function header
     # ----------------------------------------------------------------------------
     function_header += f"def {name_of_function}("
 
-    params = function_data.get('params', [])
+    # C parameter names that are python keywords, like from in QuaternionFromVector3ToVector3, get a trailing _
+    params = [dict(param, name=param['name'] + "_") if keyword.iskeyword(param['name']) else param
+              for param in function_data.get('params', [])]
     for param in params:
         if param["type"] == "void":
             continue
@@ -76,8 +164,7 @@ def generate_function_code(function_data):
         elif param["type"] in ["AudioCallback", "TraceLogCallback", "LoadFileDataCallback", "SaveFileDataCallback", "LoadFileTextCallback", "SaveFileTextCallback"]:  # no support for those structs yet
             return ""
 
-        lexer.lex_string_to_token_stream(param["type"])
-        ctype = parser.parse_token_stream_to_ctype(lexer.token_stream)
+        ctype = parse_ctype(param["type"])
         parameters_ctype_index_list.append(ctype)
 
         function_header += param['name']
@@ -86,18 +173,22 @@ def generate_function_code(function_data):
         else:
             function_header += f": {function_member_to_python_type_hint(ctype)}, "
 
-    if len(params) != 0:
-        function_header = function_header[0:-2]
-
-    function_header += ")"
-
     is_return_type_struct = False
     return_ctype = CType(CTypeKind.Void)
 
     if function_data["returnType"] != "void":
-        lexer.lex_string_to_token_stream(function_data["returnType"])
-        return_ctype = parser.parse_token_stream_to_ctype(lexer.token_stream)
+        return_ctype = parse_ctype(function_data["returnType"])
+
+    # struct return values can be written into a struct the caller reuses
+    if return_ctype.kind == CTypeKind.Struct:
+        function_header += f"out: {function_data['returnType']} = None, "
 
+    if len(params) != 0 or return_ctype.kind == CTypeKind.Struct:
+        function_header = function_header[0:-2]
+
+    function_header += ")"
+
+    if function_data["returnType"] != "void":
         function_header += f" -> {function_member_to_python_type_hint(return_ctype)}:\n"
     else:
         function_header += ":\n"
@@ -105,29 +196,48 @@ def generate_function_code(function_data):
 
     # function start
     # ----------------------------------------------------------------------------
-    # create return struct instance
+    # create return struct instance, out can't be used directly if it is also an argument, since wasm
+    # assumes the struct arguments and the return value don't overlap, or if it is a shadow struct, since wasm
+    # would write the result into its copy of the fields
+    struct_params_names = [param['name'] for i, param in enumerate(params)
+                           if parameters_ctype_index_list[i].kind == CTypeKind.Struct]
     if function_data["returnType"] != "void" and return_ctype.kind == CTypeKind.Struct:
         is_return_type_struct = True
-        start_function += f"    {function_data['returnType']}_ = {function_data['returnType']}()\n"
+        if len(struct_params_names) != 0:
+            struct_params_addresses = ", ".join(f"{name}._address" for name in struct_params_names)
+            start_function += f"    {function_data['returnType']}_ = _new_struct({function_data['returnType']}) " \
+                              f"if out is None or out.__class__ is not {function_data['returnType']} " \
+                              f"or out._address in ({struct_params_addresses},) else out\n"
+        else:
+            start_function += f"    {function_data['returnType']}_ = _new_struct({function_data['returnType']}) " \
+                              f"if out is None or out.__class__ is not {function_data['returnType']} else out\n"
+
+    # check the arguments in debug, before anything is written into wasm memory
+    checks = ""
+    for i, param in enumerate(params):
+        checks += generate_argument_check_code(name_of_function, param['name'], param['type'],
+                                               parameters_ctype_index_list[i])
+    if return_ctype.kind == CTypeKind.Struct:
+        checks += f"        if out is not None:\n"
+        checks += "    " + generate_argument_check_code(name_of_function, "out", function_data['returnType'],
+                                                        return_ctype)
+    if checks != "":
+        start_function = "    if __debug__:\n" + checks + start_function
 
     # add string-pointer interface
     for i, param in enumerate(params):
         if param['type'] == "const char *":
-            start_function += f"    {param['name']}_ = _mod._malloc(len({param['name']}) + 1)\n"
-            start_function += f"    _mod.stringToUTF8({param['name']}, {param['name']}_, len({param['name']}) + 1)\n"
+            start_function += f"    {param['name']}_ = _scratch_arena.string({param['name']})\n"
     # ----------------------------------------------------------------------------
 
     # function body
     # ----------------------------------------------------------------------------
-    # add function description
-    function_body += f"    \"\"\"{function_data['description']}\"\"\"\n" if function_data['description'] != "" else ""
-
-    # add start _mod._function
+    # add start of the call to the bound wasm function
     # if function return type that is not a struct (and not void) we need to create a return instance
     if function_data["returnType"] != "void" and return_ctype.kind != CTypeKind.Struct:
-        function_body += f"    return_interface = _mod._{function_data['name']}("
+        function_body += f"    return_interface = {wasm_function_name(function_data['name'])}("
     else:
-        function_body += f"    _mod._{function_data['name']}("
+        function_body += f"    {wasm_function_name(function_data['name'])}("
 
     # add return struct interface as first parameter (if needed)
     if function_data["returnType"] != "void" and return_ctype.kind == CTypeKind.Struct:
@@ -149,17 +259,31 @@ def generate_function_code(function_data):
 
     # function end
     # ----------------------------------------------------------------------------
-    # deallocate string-pointer interface
-    for i, param in enumerate(params):
-        if param['type'] == "const char *":
-            end_function += f"    _mod._free({param['name']}_)\n"
+    # the strings of the frame are released when the frame ends
+    if function_data['name'] in scratch_arena_reset_functions_names:
+        end_function += f"    _scratch_arena.reset()\n"
+    if function_data['name'] in text_layouts_invalidate_functions_names:
+        end_function += f"    _text_layouts.invalidate({function_data['params'][0]['name']})\n"
 
     # if function return type that is not a struct (and not void) we need to return return_instance
     if function_data["returnType"] != "void" and return_ctype.kind != CTypeKind.Struct:
         end_function += f"    return return_interface\n"
     elif function_data["returnType"] != "void" and return_ctype.kind == CTypeKind.Struct:
+        end_function += f"    if out is not None and out is not {function_data['returnType']}_:\n"
+        if len(struct_params_names) != 0:
+            end_function += f"        if out.__class__ is {function_data['returnType']}:\n"
+            end_function += f"            _memcpy(out._address, {function_data['returnType']}_._address, " \
+                            f"{function_data['returnType']}._size)\n"
+            end_function += f"        else:\n"
+            end_function += f"            out._assign({function_data['returnType']}_)  # a shadow struct\n"
+        else:
+            end_function += f"        out._assign({function_data['returnType']}_)  # a shadow struct\n"
+        end_function += f"        return out\n"
         end_function += f"    return {function_data['returnType']}_\n"
     else:
         pass  # there should be no return statement
 
-    return function_header + start_function + function_body + end_function
+    # the description first, so it is the docstring
+    description = f"    \"\"\"{function_data['description']}\"\"\"\n" if function_data['description'] != "" else ""
+
+    return function_header + description + start_function + function_body + end_function
@@ -0,0 +1,78 @@
+from ctype_token import *
+
+heap_views_string: str = \
+    """
+class HeapViews:
+    \"\"\"Cached typed-array views of the wasm heap, rebuilt when the wasm memory grows\"\"\"
+
+    def __init__(self, mod):
+        self._mod = mod
+        self.refresh()
+
+    def refresh(self):
+        self.i8 = self._mod.HEAP8
+        self.u8 = self._mod.HEAPU8
+        self.i16 = self._mod.HEAP16
+        self.u16 = self._mod.HEAPU16
+        self.i32 = self._mod.HEAP32
+        self.u32 = self._mod.HEAPU32
+        self.f32 = self._mod.HEAPF32
+        self.f64 = self._mod.HEAPF64
+        self.mem = self._mod.mem  # DataView, only for values that are not aligned to their size
+
+
+_heap = HeapViews(_mod)
+_mod.onMemoryGrowth = _heap.refresh
+"""
+
+
+# the view of each kind and log2 of its item size (the shift that turns an address into an index)
+heap_view_for_ctype_kind: dict[CTypeKind, tuple[str, int]] = {
+    CTypeKind.I8: ("i8", 0),
+    CTypeKind.UI8: ("u8", 0),
+    CTypeKind.I16: ("i16", 1),
+    CTypeKind.UI16: ("u16", 1),
+    CTypeKind.I32: ("i32", 2),
+    CTypeKind.UI32: ("u32", 2),
+    CTypeKind.Pointer: ("u32", 2),
+    CTypeKind.Float: ("f32", 2),
+    CTypeKind.Double: ("f64", 3),
+}
+
+
+def is_heap_offset_aligned(kind: CTypeKind, offset: int) -> bool:
+    """typed-array views can only reach values whose offset is a multiple of their size"""
+    return offset % (1 << heap_view_for_ctype_kind[kind][1]) == 0
+
+
+def heap_item_string(kind: CTypeKind, address: str, offset: int = 0) -> str:
+    """return the python expression of the heap view item at address + offset, for example _heap.f32[(a + 4) >> 2]"""
+    view, shift = heap_view_for_ctype_kind[kind]
+    address_string: str = f"{address} + {offset}" if offset != 0 else address
+    if shift == 0:
+        return f"_heap.{view}[{address_string}]"
+    if offset != 0:
+        address_string = f"({address_string})"
+    return f"_heap.{view}[{address_string} >> {shift}]"
+
+
+def heap_array_item_string(kind: CTypeKind, address: str, index: str) -> str:
+    """return the python expression of the index-th item of an array at address, for example _heap.f32[(a >> 2) + i]"""
+    view, shift = heap_view_for_ctype_kind[kind]
+    if shift == 0:
+        return f"_heap.{view}[{address} + {index}]"
+    return f"_heap.{view}[({address} >> {shift}) + {index}]"
+
+
+# numpy dtype and array module typecode of the items of each kind, both little endian like wasm
+numpy_format_for_ctype_kind: dict[CTypeKind, tuple[str, str]] = {
+    CTypeKind.I8: ("<i1", "b"),
+    CTypeKind.UI8: ("<u1", "B"),
+    CTypeKind.I16: ("<i2", "h"),
+    CTypeKind.UI16: ("<u2", "H"),
+    CTypeKind.I32: ("<i4", "i"),
+    CTypeKind.UI32: ("<u4", "I"),
+    CTypeKind.Pointer: ("<u4", "I"),
+    CTypeKind.Float: ("<f4", "f"),
+    CTypeKind.Double: ("<f8", "d"),
+}
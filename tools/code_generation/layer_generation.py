@@ -0,0 +1,148 @@
+cached_layer_string: str = \
+    """
+import math
+
+
+class CachedLayer:
+    \"\"\"Draw calls recorded once into a RenderTexture2D and drawn from it in the next frames with one draw call,
+    until the layer is marked dirty or the camera moves too far. The draw calls go in its with block, drawn only
+    while it records:
+
+    with cached_layer("buildings", camera, margin=200) as layer:
+        if layer.recording:
+            for building, color in zip(buildings, colors): draw_rectangle_rec(building, color)
+    \"\"\"
+
+    def __init__(self, name, camera: Camera2D = None, margin: int = 0, width: int = 0, height: int = 0,
+                 clear_color: Color = None):
+        self.name = name
+        self.camera = camera  # the draw calls are recorded in its world space, the texture stays on the screen
+        self.margin = margin  # pixels recorded past each side, how far the camera pans before the layer records again
+        self.width = width  # 0: the screen size
+        self.height = height
+        self.clear_color = clear_color  # None: transparent, an opaque color blends translucent draw calls only once
+        self.target = None
+        self.recording = False
+        self.renders = 0  # how many times the layer recorded
+        self._dirty = True
+        self._recorded_camera = None  # offset x, y, target x, y, rotation and zoom of the camera it recorded with
+        self._size = None
+        self._source = None
+        self._shift_x = self._shift_y = 0.0
+
+    def mark_dirty(self):
+        \"\"\"Record the draw calls again the next time the layer is drawn\"\"\"
+        self._dirty = True
+
+    def _camera_values(self):
+        address = self.camera._address >> 2
+        f32 = _heap.f32
+        return (f32[address], f32[address + 1], f32[address + 2], f32[address + 3], f32[address + 4],
+                f32[address + 5])
+
+    def _shift(self):
+        \"\"\"Where the recorded texture moved on the screen since the layer recorded, or None if the camera turned
+        or zoomed or the texture would no longer cover the screen\"\"\"
+        if self.camera is None or self._recorded_camera is None:
+            return (0.0, 0.0) if self.camera is None and self._recorded_camera is None else None
+        offset_x, offset_y, target_x, target_y, rotation, zoom = self._camera_values()
+        recorded = self._recorded_camera
+        if rotation != recorded[4] or zoom != recorded[5]:
+            return None
+        # the screen position of the recorded target, the same transform as GetWorldToScreen2D()
+        x = (recorded[2] - target_x) * zoom
+        y = (recorded[3] - target_y) * zoom
+        if rotation != 0.0:
+            cos, sin = math.cos(math.radians(rotation)), math.sin(math.radians(rotation))
+            x, y = x * cos - y * sin, x * sin + y * cos
+        shift_x = offset_x + x - recorded[0]
+        shift_y = offset_y + y - recorded[1]
+        if abs(shift_x) > self.margin or abs(shift_y) > self.margin:
+            return None
+        return shift_x, shift_y
+
+    def __enter__(self):
+        width = self.width or get_screen_width()
+        height = self.height or get_screen_height()
+        margin = self.margin
+        size = (width + 2 * margin, height + 2 * margin)
+        if self.target is None or size != self._size:
+            self.unload()
+            self.target = load_render_texture(*size)
+            self._size = size
+            self._source = RectangleShadow(0, 0, size[0], -size[1])  # render textures are upside down
+            self._dirty = True
+        shift = None if self._dirty else self._shift()
+        if shift is not None:
+            self._shift_x, self._shift_y = shift
+            return self
+
+        # the functions the user code sees, so they are recorded in order when the command buffer is enabled
+        builtins = _active_context.builtins
+        builtins["begin_texture_mode"](self.target)
+        builtins["clear_background"](BLANK if self.clear_color is None else self.clear_color)
+        self._shift_x = self._shift_y = 0.0
+        self._recorded_camera = None
+        if self.camera is not None:
+            self._recorded_camera = self._camera_values()
+            offset_x, offset_y, target_x, target_y, rotation, zoom = self._recorded_camera
+            builtins["begin_mode_2d"](Camera2D(Vector2(offset_x + margin, offset_y + margin),
+                                               Vector2(target_x, target_y), rotation, zoom))
+        self.recording = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        builtins = _active_context.builtins
+        if self.recording:
+            if self.camera is not None:
+                builtins["end_mode_2d"]()
+            builtins["end_texture_mode"]()
+            self.recording = False
+            if exc_type is not None:
+                return False  # still dirty, recorded again the next time
+            self._dirty = False
+            self.renders += 1
+        elif exc_type is not None:
+            return False
+
+        builtins["draw_texture_rec"](self.target.texture, self._source,
+                                     Vector2Shadow(self._shift_x - self.margin, self._shift_y - self.margin), WHITE)
+        return False
+
+    def unload(self):
+        \"\"\"Unload the render texture of the layer, it records again the next time it is drawn\"\"\"
+        if self.target is None:
+            return
+        _command_buffer.flush()
+        _rlDrawRenderBatchActive()  # the draws rlgl batched so far may still use the texture
+        unload_render_texture(self.target)
+        self.target = None
+        self._dirty = True
+
+
+def cached_layer(name, camera: Camera2D = None, margin: int = 0, width: int = 0, height: int = 0,
+                 clear_color: Color = None) -> CachedLayer:
+    \"\"\"Get the layer name, drawn with a with block outside begin_mode_2d(): it records its draw calls into a render
+    texture when it is new, marked dirty or camera turned, zoomed or panned more than margin pixels, and otherwise
+    draws the texture\"\"\"
+    layer = _cached_layers.get(name)
+    if layer is None:
+        layer = _cached_layers[name] = CachedLayer(name, camera, margin, width, height, clear_color)
+        return layer
+    layer.camera = camera
+    layer.margin = margin
+    layer.width = width
+    layer.height = height
+    layer.clear_color = clear_color
+    return layer
+
+
+def unload_cached_layers():
+    \"\"\"Unload the render textures of all the cached layers and forget them\"\"\"
+    for layer in _cached_layers.values():
+        layer.unload()
+    _cached_layers.clear()
+"""
+
+# the export of rlgl the layers call, bound in textures with the exports of its functions
+cached_layer_wasm_functions_names: list[str] = ["_rlDrawRenderBatchActive"]
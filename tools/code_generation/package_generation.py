@@ -0,0 +1,102 @@
+import ast
+import json
+import re
+
+package_init_string: str = \
+    """
+\"\"\"raylib for pyodide, each module of the wrapper is imported the first time one of its names is used\"\"\"
+import builtins
+import importlib
+import sys
+
+
+def __getattr__(name: str):
+    module_name = _names.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # not kept in the package globals, some names (colors) are switched with the active context
+    module = sys.modules.get(f"{__name__}.{module_name}") or importlib.import_module(f".{module_name}", __name__)
+    return getattr(module, name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_names))
+
+
+class LazyBuiltins(dict):
+    \"\"\"builtins of the user code, a name that is not a builtin is looked up in the wrapper the first time it is used\"\"\"
+
+    def __missing__(self, name: str):
+        if name in builtins.__dict__:
+            return builtins.__dict__[name]
+        try:
+            value = __getattr__(name)
+        except AttributeError:
+            raise KeyError(name) from None
+        self[name] = value
+        return value
+
+
+def create_context(mod):
+    \"\"\"Use the wrapper with another raylib wasm instance (of another canvas), the first one comes from __main__._mod\"\"\"
+    core_imported = f"{__name__}.core" in sys.modules
+    core = importlib.import_module(".core", __name__)
+    return core.Context(mod) if core_imported else core._active_context
+
+
+def install(namespace: dict):
+    \"\"\"Make the names of the wrapper usable in namespace (the globals of the user code) without importing them\"\"\"
+    importlib.import_module(".core", __name__)._active_context.install(namespace)
+
+
+def load_all():
+    \"\"\"Import every module of the wrapper now instead of when its names are first used\"\"\"
+    for module_name in sorted(set(_names.values())):
+        importlib.import_module(f".{module_name}", __name__)
+"""
+
+
+def top_level_names(source: str) -> list[str]:
+    """return the names a module source defines at top level (classes, functions and assigned names), in order"""
+    names: list[str] = []
+    for node in ast.parse(source).body:
+        if isinstance(node, (ast.ClassDef, ast.FunctionDef)):
+            names.append(node.name)
+        elif isinstance(node, ast.Assign):
+            names += [target.id for target in node.targets if isinstance(target, ast.Name)]
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name):
+            names.append(node.target.id)
+    return [name for name in names if not name.startswith("__")]
+
+
+def generate_module_imports_code(source: str, from_module: str, names: list[str]) -> str:
+    """return the import of the names that source uses from from_module"""
+    source_words: set[str] = set(re.findall(r"\w+", source))
+    used_names: list[str] = [name for name in names if name in source_words]
+    if len(used_names) == 0:
+        return ""
+
+    string: str = ""
+    string += f"from {from_module} import (\n"
+    for name in used_names:
+        string += f"    {name},\n"
+    string += ")\n"
+
+    return string
+
+
+def generate_package_init_code(modules_sources: dict[str, str]) -> str:
+    string: str = ""
+    string += package_init_string.lstrip('\n') + '\n'
+    string += "# name -> module of the wrapper that defines it\n"
+    string += "_names = {\n"
+    mapped_names: set[str] = set()
+    for module_name, source in modules_sources.items():
+        for name in top_level_names(source):
+            if name in mapped_names:  # each module has its own _wasm_functions_names, the first one is kept
+                continue
+            mapped_names.add(name)
+            string += f"    {json.dumps(name)}: \"{module_name}\",\n"
+    string += "}\n"
+
+    return string
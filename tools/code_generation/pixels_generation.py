@@ -0,0 +1,104 @@
+pixel_array_string: str = \
+    """
+class PixelArray(WasmArray):
+    \"\"\"Pixels in wasm memory in a raylib pixel format, an item is the value of one channel, shape is
+    (height, width, channels): pixels[i] is an item, pixels[y, x] the channels of a pixel, pixels[y, x, c] one channel\"\"\"
+    # pixel format -> numpy dtype, array typecode and heap view of a channel, channels per pixel,
+    # the packed 16 bits formats (R5G6B5, R5G5B5A1, R4G4B4A4) have one uint16 channel
+    _formats = {
+        1: ("<u1", "B", "u8", 1),  # PIXELFORMAT_UNCOMPRESSED_GRAYSCALE
+        2: ("<u1", "B", "u8", 2),  # PIXELFORMAT_UNCOMPRESSED_GRAY_ALPHA
+        3: ("<u2", "H", "u16", 1),  # PIXELFORMAT_UNCOMPRESSED_R5G6B5
+        4: ("<u1", "B", "u8", 3),  # PIXELFORMAT_UNCOMPRESSED_R8G8B8
+        5: ("<u2", "H", "u16", 1),  # PIXELFORMAT_UNCOMPRESSED_R5G5B5A1
+        6: ("<u2", "H", "u16", 1),  # PIXELFORMAT_UNCOMPRESSED_R4G4B4A4
+        7: ("<u1", "B", "u8", 4),  # PIXELFORMAT_UNCOMPRESSED_R8G8B8A8
+        8: ("<f4", "f", "f32", 1),  # PIXELFORMAT_UNCOMPRESSED_R32
+        9: ("<f4", "f", "f32", 3),  # PIXELFORMAT_UNCOMPRESSED_R32G32B32
+        10: ("<f4", "f", "f32", 4),  # PIXELFORMAT_UNCOMPRESSED_R32G32B32A32
+    }
+
+    def __init__(self, width: int, height: int, format: int = 7, address: int = 0):
+        if format not in PixelArray._formats:
+            raise ValueError(f"pixel format {format} is compressed (or unknown), its pixels can't be accessed")
+        self._dtype, self._typecode, self._view, channels = PixelArray._formats[format]
+        self.format = format
+        self.shape = (height, width, channels)
+        item_size = int(self._dtype[2:])
+        self._shift = item_size.bit_length() - 1  # heap view index of an address
+        super(PixelArray, self).__init__(item_size, height * width * channels, address)
+
+    @classmethod
+    def pixel_size(cls, format: int) -> int:
+        \"\"\"Bytes per pixel of an uncompressed pixel format\"\"\"
+        if format not in cls._formats:
+            raise ValueError(f"pixel format {format} is compressed (or unknown), its pixels can't be accessed")
+        dtype, _, _, channels = cls._formats[format]
+        return int(dtype[2:]) * channels
+
+    def _index(self, item) -> int:
+        y, x, channel = item
+        return (y * self.shape[1] + x) * self.shape[2] + channel
+
+    def __getitem__(self, item):
+        view = getattr(_heap, self._view)
+        if isinstance(item, tuple) and len(item) == 2:
+            first = (self._address >> self._shift) + self._index((*item, 0))
+            return tuple(view[first + channel] for channel in range(self.shape[2]))
+        if isinstance(item, tuple):
+            item = self._index(item)
+        return view[(self._address >> self._shift) + item]
+
+    def __setitem__(self, item, value):
+        if isinstance(item, slice):
+            self._assign_slice(item, value)
+            return
+        view = getattr(_heap, self._view)
+        if isinstance(item, tuple) and len(item) == 2:
+            first = (self._address >> self._shift) + self._index((*item, 0))
+            for channel in range(self.shape[2]):
+                view[first + channel] = value[channel]
+            return
+        if isinstance(item, tuple):
+            item = self._index(item)
+        view[(self._address >> self._shift) + item] = value
+
+    def as_numpy(self):
+        \"\"\"Copy the pixels into a new numpy array shaped (height, width, channels), with one bulk read of wasm memory\"\"\"
+        return super(PixelArray, self).as_numpy().reshape(self.shape)
+"""
+
+image_methods_string: str = \
+    """
+    def pixels(self) -> PixelArray:
+        \"\"\"The pixels of the image (of its first mipmap) where they are in wasm memory, shaped (height, width,
+        channels) by its format, valid until the image is unloaded or its data reallocated\"\"\"
+        return PixelArray(self.width, self.height, self.format, address=self.data)
+
+"""
+
+update_texture_from_array_string: str = \
+    """
+def update_texture_from_array(texture: Texture2D, pixels):
+    \"\"\"Update the whole GPU texture from pixels in its format: a PixelArray (or any WasmArray) is uploaded from where
+    it is in wasm memory, a numpy array (or a buffer) is copied into wasm memory with one bulk write first\"\"\"
+    size = texture.width * texture.height * PixelArray.pixel_size(texture.format)
+    if isinstance(pixels, WasmArray):
+        data = None
+        given = pixels._size
+    else:
+        data = memoryview(_import_numpy().ascontiguousarray(pixels) if hasattr(pixels, "dtype") else pixels).cast("B")
+        given = len(data)
+    if given != size:
+        raise ValueError(f"the texture takes {size} bytes of pixels ({texture.width}x{texture.height}, "
+                         f"format {texture.format}), not {given}")
+    _command_buffer.flush()  # the draw calls recorded before draw the texture as it was
+    if data is None:
+        _UpdateTexture(texture._address, pixels._address)
+        return
+    # UpdateTexture copies the pixels to the GPU before it returns, the copy in wasm memory is only needed until then
+    address = _mod._malloc(size)
+    _heap.u8.subarray(address, address + size).assign(data)
+    _UpdateTexture(texture._address, address)
+    _mod._free(address)
+"""
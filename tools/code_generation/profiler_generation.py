@@ -0,0 +1,235 @@
+profiler_string: str = \
+    """
+import json
+import time
+
+
+class _ProfiledCall:
+    \"\"\"Stands in for a function while profiling, adds its calls and time to entry\"\"\"
+    __slots__ = ("_function", "_entry", "_profiler")
+
+    def __init__(self, function, entry: list, profiler):
+        self._function = function
+        self._entry = entry
+        self._profiler = profiler
+
+    def __call__(self, *args):
+        if self._profiler.paused:
+            return self._function(*args)
+        started = time.perf_counter()
+        try:
+            return self._function(*args)
+        finally:
+            self._entry[0] += 1
+            self._entry[1] += time.perf_counter() - started
+
+
+class _ProfiledModule:
+    \"\"\"Stands in for _mod while profiling, its exported functions (the bindings) are timed\"\"\"
+
+    def __init__(self, mod, profiler):
+        self._profiled = mod
+        self._profiler = profiler
+
+    def __getattr__(self, name: str):
+        value = getattr(self._profiled, name)
+        if name.startswith("_") and callable(value):
+            value = _ProfiledCall(value, self._profiler.entry("bindings", name), self._profiler)
+            if name == "_EndDrawing":
+                value = self._profiler.ending_frame(value)
+            setattr(self, name, value)  # found without __getattr__ from now on
+        return value
+
+
+class _ProfiledView:
+    \"\"\"Stands in for a view of the wasm heap while profiling, every access to it crosses into javascript\"\"\"
+    __slots__ = ("_view", "_entry", "_profiler")
+
+    def __init__(self, view, entry: list, profiler):
+        self._view = view
+        self._entry = entry
+        self._profiler = profiler
+
+    def __getitem__(self, index):
+        if self._profiler.paused:
+            return self._view[index]
+        started = time.perf_counter()
+        try:
+            return self._view[index]
+        finally:
+            self._entry[0] += 1
+            self._entry[1] += time.perf_counter() - started
+
+    def __setitem__(self, index, value):
+        if self._profiler.paused:
+            self._view[index] = value
+            return
+        started = time.perf_counter()
+        try:
+            self._view[index] = value
+        finally:
+            self._entry[0] += 1
+            self._entry[1] += time.perf_counter() - started
+
+    def __getattr__(self, name: str):
+        return _ProfiledCall(getattr(self._view, name), self._entry, self._profiler)  # subarray(), getFloat32(), ...
+
+
+class _ProfiledHeap:
+    \"\"\"Stands in for _heap while profiling\"\"\"
+
+    def __init__(self, heap, profiler):
+        self._heap = heap
+        self._profiler = profiler
+        self._entry = profiler.entry("marshalling", "heap")
+
+    def __getattr__(self, name: str):
+        # not kept, the views are replaced when the wasm memory grows
+        return _ProfiledView(getattr(self._heap, name), self._entry, self._profiler)
+
+
+class _ProfiledAllocator:
+    \"\"\"Stands in for the scratch arena or the struct pool while profiling, timed_methods: method -> marshalling entry\"\"\"
+
+    def __init__(self, allocator, timed_methods: dict, profiler):
+        self._allocator = allocator
+        self._timed_methods = timed_methods
+        self._profiler = profiler
+
+    def __getattr__(self, name: str):
+        value = getattr(self._allocator, name)
+        if name in self._timed_methods:
+            value = _ProfiledCall(value, self._profiler.entry("marshalling", self._timed_methods[name]), self._profiler)
+            setattr(self, name, value)
+        return value
+
+
+class Profiler:
+    \"\"\"Calls and time of the wasm bindings and of the marshalling around them, for the last frame and in total\"\"\"
+
+    def __init__(self):
+        self.paused = False  # set while the profiler draws itself
+        self.frames = 0
+        self._entries = {"bindings": {}, "marshalling": {}}  # kind -> name -> [calls, seconds] of the current frame
+        self.last_frame = {"bindings": {}, "marshalling": {}}
+        self.total = {"bindings": {}, "marshalling": {}}
+        # WebGL calls counted by python-raylib-web.js (mod.glCounters), once the window has a context
+        self.gpu_last_frame = {}
+        self.gpu_total = {"draw_calls": 0, "texture_binds": 0, "batches": 0}
+        self._gpu_counts = None  # the counters at the end of the previous frame
+        self.profiled_state = {}
+
+    def entry(self, kind: str, name: str) -> list:
+        return self._entries[kind].setdefault(name, [0, 0.0])
+
+    def stand_ins(self, state: dict) -> dict:
+        \"\"\"The profiled stand-ins of the state of a context\"\"\"
+        self.profiled_state = {name: state[name] for name in ["_mod", "_heap", "_scratch_arena", "_struct_pool"]}
+        return {
+            "_mod": _ProfiledModule(state["_mod"], self),
+            "_heap": _ProfiledHeap(state["_heap"], self),
+            "_scratch_arena": _ProfiledAllocator(state["_scratch_arena"], {"string": "strings", "alloc": "scratch"}, self),
+            "_struct_pool": _ProfiledAllocator(state["_struct_pool"], {"alloc": "structs"}, self),
+        }
+
+    def ending_frame(self, end_drawing):
+        def profiled_end_drawing(*args):
+            end_drawing(*args)
+            self.end_frame()
+        return profiled_end_drawing
+
+    def _gpu_end_frame(self):
+        counters = getattr(self.profiled_state.get("_mod"), "glCounters", None)
+        if counters is None or not counters.start():
+            return
+        counts = (counters.drawCalls, counters.textureBinds, counters.batches)
+        if self._gpu_counts is not None:
+            self.gpu_last_frame = {name: count - previous for name, count, previous in
+                                   zip(self.gpu_total, counts, self._gpu_counts)}
+            for name, count in self.gpu_last_frame.items():
+                self.gpu_total[name] += count
+        self._gpu_counts = counts
+
+    def end_frame(self):
+        self.frames += 1
+        self._gpu_end_frame()
+        for kind, entries in self._entries.items():
+            last = self.last_frame[kind] = {}
+            total = self.total[kind]
+            for name, entry in entries.items():
+                if entry[0] == 0:
+                    continue
+                last[name] = (entry[0], entry[1])
+                total_entry = total.setdefault(name, [0, 0.0])
+                total_entry[0] += entry[0]
+                total_entry[1] += entry[1]
+                entry[0] = 0
+                entry[1] = 0.0
+
+    def report(self) -> dict:
+        def tables(entries: dict) -> dict:
+            report = {"crossings": sum(calls for calls, _ in entries["bindings"].values()) +
+                      entries["marshalling"].get("heap", (0, 0.0))[0]}
+            for kind, kind_entries in entries.items():
+                report[kind] = {name: {"calls": calls, "ms": seconds * 1000}
+                                for name, (calls, seconds) in sorted(kind_entries.items(), key=lambda item: -item[1][1])}
+            return report
+
+        return {"frames": self.frames, "last_frame": {**tables(self.last_frame), "gpu": dict(self.gpu_last_frame)},
+                "total": {**tables(self.total), "gpu": dict(self.gpu_total)}}
+
+
+def enable_profiling():
+    \"\"\"Count and time every wasm binding and the marshalling around them (strings, structs, heap accesses), slows
+    the wasm calls down until disable_profiling()\"\"\"
+    if _active_context.profiler is None:
+        _active_context.set_profiler(Profiler())
+
+
+def disable_profiling():
+    \"\"\"Go back to calling wasm without counting\"\"\"
+    _active_context.set_profiler(None)
+
+
+def is_profiling_enabled() -> bool:
+    \"\"\"Check if the wasm bindings are profiled\"\"\"
+    return _active_context.profiler is not None
+
+
+def get_profile() -> dict:
+    \"\"\"Get the calls and ms of each binding and of the marshalling, the crossings into javascript and the WebGL draw
+    calls, texture binds and rlgl batches (gpu), of the last frame and since enable_profiling()\"\"\"
+    profiler = _active_context.profiler
+    return profiler.report() if profiler is not None else {}
+
+
+def export_profile() -> str:
+    \"\"\"Get the profile as JSON, to keep and compare later\"\"\"
+    return json.dumps(get_profile(), indent=2)
+
+
+def draw_profiler(x: int = 10, y: int = 10, lines: int = 8):
+    \"\"\"Draw the bindings that took the most time in the last frame and the marshalling, over the frame\"\"\"
+    profiler = _active_context.profiler
+    if profiler is None:
+        return
+    last_frame = profiler.report()["last_frame"]
+    rows = [f"frame {profiler.frames}, {last_frame['crossings']} crossings"]
+    if last_frame["gpu"]:
+        gpu = last_frame["gpu"]
+        rows.append(f"{gpu['draw_calls']} draw calls, {gpu['texture_binds']} texture binds, {gpu['batches']} batches")
+    for kind in ["bindings", "marshalling"]:
+        for name, entry in list(last_frame[kind].items())[:lines]:
+            rows.append(f"{name.lstrip('_')} {entry['calls']}x {entry['ms']:.2f} ms")
+
+    # the functions the user code sees, so the overlay is recorded too when the command buffer is enabled
+    draw_rectangle = _active_context.builtins["draw_rectangle"]
+    draw_text = _active_context.builtins["draw_text"]
+    profiler.paused = True
+    try:
+        draw_rectangle(x, y, 240, 8 + 12 * len(rows), Color(0, 0, 0, 180))
+        for i, row in enumerate(rows):
+            draw_text(row, x + 4, y + 4 + 12 * i, 10, LIME)
+    finally:
+        profiler.paused = False
+"""
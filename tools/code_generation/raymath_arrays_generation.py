@@ -0,0 +1,206 @@
+raymath_arrays_string: str = \
+    """
+# raymath over whole arrays: a StructArray is computed in wasm memory with one call into wasm (the *Array
+# functions of raylib.c), a numpy array (like StructArray.as_numpy() or shaped (count, 2 or 3)) with numpy
+
+
+def _check_struct_array(values: StructArray, stype):
+    if values._stype is not stype:
+        raise TypeError(f"expected a StructArray of {stype.__name__}, not of {values._stype.__name__}")
+
+
+def _struct_array_out(values: StructArray, stype, out: StructArray) -> StructArray:
+    _check_struct_array(values, stype)
+    if out is None:
+        return StructArray(stype, len(values))
+    if out._stype is not stype or len(out) < len(values):
+        raise ValueError(f"out must be a StructArray of at least {len(values)} {stype.__name__}")
+    return out
+
+
+def _in_wasm(kernel, stype, *arrays) -> bool:
+    \"\"\"Check if arrays are all StructArrays of stype for the wasm kernel, otherwise they are computed with numpy
+    (a StructArray among them copied out of wasm memory), like when the raylib wasm doesn't export the kernel\"\"\"
+    struct_arrays = [values for values in arrays if isinstance(values, StructArray)]
+    for values in struct_arrays:
+        _check_struct_array(values, stype)
+    return len(struct_arrays) == len(arrays) and _is_wasm_function_exported(kernel)
+
+
+def _numpy_rows(values, size: int):
+    \"\"\"values as a (count, size) numpy array, and a function that gives a result the dtype and shape of values\"\"\"
+    numpy = _import_numpy()
+    if isinstance(values, StructArray):
+        values = values.as_numpy()
+    values = numpy.asarray(values)
+    if values.dtype.names is not None:  # structured, the fields of the struct are columns
+        dtype = values.dtype
+        rows = numpy.ascontiguousarray(values).view(numpy.float32).reshape(-1, size)
+        return rows, lambda result: numpy.ascontiguousarray(result, dtype=numpy.float32).view(dtype).reshape(-1)
+    return values.reshape(-1, size), lambda result: result.reshape(values.shape)
+
+
+def _numpy_result(result, out, values):
+    \"\"\"result into out, or a new StructArray if values is one\"\"\"
+    if isinstance(out, StructArray):
+        out[:len(result)] = result
+        return out
+    if out is None:
+        if not isinstance(values, StructArray):
+            return result
+        out = StructArray(values._stype, len(result))
+        out.from_numpy(result)
+        return out
+    out[...] = result
+    return out
+
+
+def _matrix_rows(mat):
+    \"\"\"mat (a Matrix or 16 floats in its field order) as a 4x4 numpy array, row i is the row i of the math\"\"\"
+    numpy = _import_numpy()
+    if isinstance(mat, Matrix):
+        rows = numpy.empty(16, dtype=numpy.float32)
+        _heap.u8.subarray(mat._address, mat._address + Matrix._size).assign_to(rows.view(numpy.uint8))
+        return rows.reshape(4, 4)
+    return numpy.asarray(mat, dtype=numpy.float32).reshape(4, 4)
+
+
+def vector2_add_array(v1, v2, out=None):
+    \"\"\"Add two arrays of Vector2, item by item\"\"\"
+    if _in_wasm(_Vector2AddArray, Vector2, v1, v2):
+        out = _struct_array_out(v1, Vector2, out)
+        _Vector2AddArray(v1._address, v2._address, min(len(v1), len(v2)), out._address)
+        return out
+    rows1, shaped = _numpy_rows(v1, 2)
+    rows2, _ = _numpy_rows(v2, 2)
+    return _numpy_result(shaped(rows1 + rows2), out, v1)
+
+
+def vector3_add_array(v1, v2, out=None):
+    \"\"\"Add two arrays of Vector3, item by item\"\"\"
+    if _in_wasm(_Vector3AddArray, Vector3, v1, v2):
+        out = _struct_array_out(v1, Vector3, out)
+        _Vector3AddArray(v1._address, v2._address, min(len(v1), len(v2)), out._address)
+        return out
+    rows1, shaped = _numpy_rows(v1, 3)
+    rows2, _ = _numpy_rows(v2, 3)
+    return _numpy_result(shaped(rows1 + rows2), out, v1)
+
+
+def vector2_scale_array(v, scale: float, out=None):
+    \"\"\"Multiply every Vector2 of an array by scale\"\"\"
+    if _in_wasm(_Vector2ScaleArray, Vector2, v):
+        out = _struct_array_out(v, Vector2, out)
+        _Vector2ScaleArray(v._address, len(v), scale, out._address)
+        return out
+    rows, shaped = _numpy_rows(v, 2)
+    return _numpy_result(shaped(rows * scale), out, v)
+
+
+def vector3_scale_array(v, scale: float, out=None):
+    \"\"\"Multiply every Vector3 of an array by scale\"\"\"
+    if _in_wasm(_Vector3ScaleArray, Vector3, v):
+        out = _struct_array_out(v, Vector3, out)
+        _Vector3ScaleArray(v._address, len(v), scale, out._address)
+        return out
+    rows, shaped = _numpy_rows(v, 3)
+    return _numpy_result(shaped(rows * scale), out, v)
+
+
+def _normalized_rows(rows):
+    numpy = _import_numpy()
+    lengths = numpy.sqrt((rows * rows).sum(axis=1, keepdims=True))
+    return numpy.divide(rows, lengths, out=rows.astype(numpy.result_type(rows, lengths)), where=lengths > 0)
+
+
+def vector2_normalize_array(v, out=None):
+    \"\"\"Normalize every Vector2 of an array, a zero vector stays zero\"\"\"
+    if _in_wasm(_Vector2NormalizeArray, Vector2, v):
+        out = _struct_array_out(v, Vector2, out)
+        _Vector2NormalizeArray(v._address, len(v), out._address)
+        return out
+    rows, shaped = _numpy_rows(v, 2)
+    return _numpy_result(shaped(_normalized_rows(rows)), out, v)
+
+
+def vector3_normalize_array(v, out=None):
+    \"\"\"Normalize every Vector3 of an array, a zero vector stays zero\"\"\"
+    if _in_wasm(_Vector3NormalizeArray, Vector3, v):
+        out = _struct_array_out(v, Vector3, out)
+        _Vector3NormalizeArray(v._address, len(v), out._address)
+        return out
+    rows, shaped = _numpy_rows(v, 3)
+    return _numpy_result(shaped(_normalized_rows(rows)), out, v)
+
+
+def vector2_lerp_array(v1, v2, amount, out=None):
+    \"\"\"Interpolate between two arrays of Vector2, item by item, amount can be one per item with numpy arrays\"\"\"
+    if _in_wasm(_Vector2LerpArray, Vector2, v1, v2):
+        out = _struct_array_out(v1, Vector2, out)
+        _Vector2LerpArray(v1._address, v2._address, min(len(v1), len(v2)), amount, out._address)
+        return out
+    rows1, shaped = _numpy_rows(v1, 2)
+    rows2, _ = _numpy_rows(v2, 2)
+    amount = _import_numpy().asarray(amount).reshape(-1, 1)
+    return _numpy_result(shaped(rows1 + amount * (rows2 - rows1)), out, v1)
+
+
+def vector3_lerp_array(v1, v2, amount, out=None):
+    \"\"\"Interpolate between two arrays of Vector3, item by item, amount can be one per item with numpy arrays\"\"\"
+    if _in_wasm(_Vector3LerpArray, Vector3, v1, v2):
+        out = _struct_array_out(v1, Vector3, out)
+        _Vector3LerpArray(v1._address, v2._address, min(len(v1), len(v2)), amount, out._address)
+        return out
+    rows1, shaped = _numpy_rows(v1, 3)
+    rows2, _ = _numpy_rows(v2, 3)
+    amount = _import_numpy().asarray(amount).reshape(-1, 1)
+    return _numpy_result(shaped(rows1 + amount * (rows2 - rows1)), out, v1)
+
+
+def vector2_transform_array(v, mat, out=None):
+    \"\"\"Transform every Vector2 of an array by mat, like vector2_transform()\"\"\"
+    if _in_wasm(_Vector2TransformArray, Vector2, v) and isinstance(mat, Matrix):
+        out = _struct_array_out(v, Vector2, out)
+        _Vector2TransformArray(v._address, len(v), mat._address, out._address)
+        return out
+    rows, shaped = _numpy_rows(v, 2)
+    matrix = _matrix_rows(mat)
+    return _numpy_result(shaped(rows @ matrix[:2, :2].T + matrix[:2, 3]), out, v)
+
+
+def vector3_transform_array(v, mat, out=None):
+    \"\"\"Transform every Vector3 of an array by mat, like vector3_transform()\"\"\"
+    if _in_wasm(_Vector3TransformArray, Vector3, v) and isinstance(mat, Matrix):
+        out = _struct_array_out(v, Vector3, out)
+        _Vector3TransformArray(v._address, len(v), mat._address, out._address)
+        return out
+    rows, shaped = _numpy_rows(v, 3)
+    matrix = _matrix_rows(mat)
+    return _numpy_result(shaped(rows @ matrix[:3, :3].T + matrix[:3, 3]), out, v)
+
+
+def matrix_multiply_array(left, right, out=None):
+    \"\"\"matrix_multiply(left[i], right) for every Matrix of left\"\"\"
+    if _in_wasm(_MatrixMultiplyArray, Matrix, left) and isinstance(right, Matrix):
+        out = _struct_array_out(left, Matrix, out)
+        _MatrixMultiplyArray(left._address, len(left), right._address, out._address)
+        return out
+    rows, shaped = _numpy_rows(left, 16)
+    # matrix_multiply(left, right) is right @ left in math order
+    return _numpy_result(shaped((_matrix_rows(right) @ rows.reshape(-1, 4, 4)).reshape(-1, 16)), out, left)
+"""
+
+# the exports of raylib.c the functions over arrays call, bound in raymath with the exports of its functions
+raymath_arrays_wasm_functions_names: list[str] = [
+    "_Vector2AddArray",
+    "_Vector3AddArray",
+    "_Vector2ScaleArray",
+    "_Vector3ScaleArray",
+    "_Vector2NormalizeArray",
+    "_Vector3NormalizeArray",
+    "_Vector2LerpArray",
+    "_Vector3LerpArray",
+    "_Vector2TransformArray",
+    "_Vector3TransformArray",
+    "_MatrixMultiplyArray",
+]
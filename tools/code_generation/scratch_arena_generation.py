@@ -0,0 +1,72 @@
+scratch_arena_string: str = \
+    """
+class ScratchArena:
+    \"\"\"Bump allocator in wasm memory for the string arguments of a frame, reset at end_drawing()\"\"\"
+
+    def __init__(self, capacity: int = 16 * 1024, max_interned: int = 1024):
+        self._capacity = capacity
+        self.frame = 0  # counts the resets, memory from alloc() is valid while it doesn't change
+        self._address = 0
+        self._offset = 0
+        self._retired = []  # blocks that became too small during the frame, freed at reset()
+        # strings passed in two frames in a row are copied once into their own allocation and reused
+        # from then on, so text drawn every frame is not written into wasm memory again
+        self._interned = {}  # string -> address of its interned copy
+        self._max_interned = max_interned
+        self._previous_frame = set()  # strings of the previous frame, that were not interned
+        self._current_frame = set()
+
+    def alloc(self, size: int) -> int:
+        \"\"\"Allocate size bytes that stay valid until the end of the frame\"\"\"
+        if self._address == 0 or self._offset + size > self._capacity:
+            if self._address != 0:
+                self._retired.append(self._address)
+                self._capacity *= 2
+            self._capacity = max(self._capacity, size)  # the first block too must hold size
+            self._address = _mod._malloc(self._capacity)
+            self._offset = 0
+        address = self._address + self._offset
+        self._offset += (size + 7) & ~7
+        return address
+
+    def string(self, text: str) -> int:
+        \"\"\"Return the address of a NUL terminated UTF-8 copy of text, valid at least until the end of the frame\"\"\"
+        address = self._interned.get(text)
+        if address is not None:
+            return address
+
+        data = text.encode() + b"\\0"
+        if text in self._previous_frame:
+            address = self._intern(text, len(data))
+        else:
+            self._current_frame.add(text)
+            address = self.alloc(len(data))
+        _heap.u8.subarray(address, address + len(data)).assign(data)
+        return address
+
+    def _intern(self, text: str, size: int) -> int:
+        if len(self._interned) >= self._max_interned:
+            self.clear_interned()
+        address = _mod._malloc(size)
+        self._interned[text] = address
+        return address
+
+    def clear_interned(self):
+        \"\"\"Free the interned strings, they will be interned again if they keep coming back\"\"\"
+        for address in self._interned.values():
+            _mod._free(address)
+        self._interned.clear()
+
+    def reset(self):
+        \"\"\"Release the strings of the frame\"\"\"
+        for address in self._retired:
+            _mod._free(address)
+        self._retired.clear()
+        self._offset = 0
+        self.frame += 1
+        self._previous_frame, self._current_frame = self._current_frame, self._previous_frame
+        self._current_frame.clear()
+
+
+_scratch_arena = ScratchArena()
+"""
@@ -0,0 +1,81 @@
+sprite_batch_string: str = \
+    """
+def _sprite_fields(value, names: tuple) -> tuple:
+    # a struct (or its shadow) or already a tuple of its fields
+    return tuple(value) if isinstance(value, (tuple, list)) else tuple(getattr(value, name) for name in names)
+
+
+class SpriteBatch(WasmArray):
+    \"\"\"Sprites of one texture in wasm memory, all drawn with one call into wasm (DrawSpriteBatch in raylib.c): the
+    source and dest rectangles, origin, rotation and tint of each, like the arguments of draw_texture_pro()\"\"\"
+    # the layout of SpriteBatchItem in raylib.c
+    _sprite = struct.Struct("<11f4B")
+    _dtype = {"names": ["source_x", "source_y", "source_width", "source_height", "x", "y", "width", "height",
+                        "origin_x", "origin_y", "rotation", "tint"],
+              "formats": ["<f4"] * 11 + [("<u1", (4,))],
+              "offsets": [0, 4, 8, 12, 16, 20, 24, 28, 32, 36, 40, 44],
+              "itemsize": 48}
+
+    def __init__(self, texture: Texture2D, capacity: int):
+        super(SpriteBatch, self).__init__(SpriteBatch._sprite.size, capacity)
+        self.texture = texture
+        _heap.u8.fill(0, self._address, self._address + self._size)  # transparent until they are set
+
+    @classmethod
+    def new_sprites(cls, count: int):
+        \"\"\"A numpy array of count sprites (white, not rotated) to fill and pass to draw(), its fields are source_x,
+        source_y, source_width, source_height, x, y, width, height, origin_x, origin_y, rotation and tint (r, g, b, a)\"\"\"
+        numpy = _import_numpy()
+        sprites = numpy.zeros(count, dtype=cls._dtype)
+        sprites["tint"] = 255
+        return sprites
+
+    def __getitem__(self, item: int) -> tuple:
+        if not 0 <= item < self._length:
+            raise IndexError("sprite index out of range")
+        address = self._address + self._item_size * item
+        data = bytearray(self._item_size)
+        _heap.u8.subarray(address, address + self._item_size).assign_to(data)
+        values = self._sprite.unpack(data)
+        return values[0:4], values[4:8], values[8:10], values[10], values[11:15]
+
+    def __setitem__(self, item, value):
+        \"\"\"batch[i] = (source, dest, origin, rotation, tint), the rectangles, vector and color as structs or tuples\"\"\"
+        if isinstance(item, slice):
+            self._assign_slice(item, value)
+            return
+        if not 0 <= item < self._length:
+            raise IndexError("sprite index out of range")
+        source, dest, origin, rotation, tint = value
+        address = self._address + self._item_size * item
+        _heap.u8.subarray(address, address + self._item_size).assign(self._sprite.pack(
+            *_sprite_fields(source, ("x", "y", "width", "height")), *_sprite_fields(dest, ("x", "y", "width", "height")),
+            *_sprite_fields(origin, ("x", "y")), rotation, *_sprite_fields(tint, ("r", "g", "b", "a"))))
+
+    def draw(self, sprites=None, count: int = None):
+        \"\"\"Draw the first count sprites of the batch (all of them by default), sprites (from new_sprites()) are
+        copied into the start of the batch first, with one bulk write\"\"\"
+        if sprites is not None:
+            self._assign_slice(slice(0, len(sprites)), sprites)
+            count = len(sprites) if count is None else count
+        count = self._length if count is None else min(count, self._length)
+        _command_buffer.flush()  # the draw calls recorded before are drawn first
+        if not _is_wasm_function_exported(_DrawSpriteBatch):
+            self._draw_each(count)
+            return
+        _DrawSpriteBatch(self.texture._address, self._address, count)
+
+    def _draw_each(self, count: int):
+        \"\"\"DrawTexturePro for each sprite, for a raylib wasm without DrawSpriteBatch\"\"\"
+        size = self._item_size
+        data = bytearray(size * count)
+        _heap.u8.subarray(self._address, self._address + size * count).assign_to(data)
+        rotations = memoryview(data).cast("f")[10::12]
+        texture = self.texture._address
+        for address, rotation in zip(range(self._address, self._address + size * count, size), rotations):
+            # the source, dest, origin and tint of the sprite are structs in wasm memory already
+            _DrawTexturePro(texture, address, address + 16, address + 32, rotation, address + 44)
+"""
+
+# the exports of raylib.c the sprite batch calls, bound in textures with the exports of its functions
+sprite_batch_wasm_functions_names: list[str] = ["_DrawSpriteBatch"]
@@ -1,8 +1,19 @@
 from enum import *
 from ctype_struct import *
+from heap_generation import *
+from pixels_generation import image_methods_string
 import json
 
 
+# small value types that also get a shadow struct class, with the fields kept as python numbers
+shadow_structs_names = ["Vector2", "Vector3", "Vector4", "Color", "Rectangle"]
+
+# methods added to the class of a struct, before __str__
+structs_methods: dict[str, str] = {
+    "Image": image_methods_string,
+}
+
+
 class HeapKind(Enum):
     Int8 = auto()
     Int16 = auto()
@@ -90,6 +101,29 @@ def emscripten_XXXType_string_for_ctype_kind(kind: CTypeKind, get: bool = True)
     return string_
 
 
+def heap_member_get_string(kind: CTypeKind, offset: int) -> str:
+    if is_heap_offset_aligned(kind, offset):
+        return heap_item_string(kind, "self._address", offset)
+    return f"_heap.mem.{emscripten_XXXType_string_for_ctype_kind(kind, True)}(self._address + {offset}, True)"
+
+
+def heap_member_set_string(kind: CTypeKind, offset: int, value: str) -> str:
+    if is_heap_offset_aligned(kind, offset):
+        return f"{heap_item_string(kind, 'self._address', offset)} = {value}"
+    return f"_heap.mem.{emscripten_XXXType_string_for_ctype_kind(kind, False)}(self._address + {offset}, {value}, True)"
+
+
+def numpy_format_string_for_ctype(ctype: CType) -> str:
+    """return the python expression of the numpy dtype of a struct member"""
+    match ctype.kind:
+        case CTypeKind.Struct:
+            return f"{ctype.struct_token.string}._dtype_spec"
+        case CTypeKind.Array:
+            return f"({numpy_format_string_for_ctype(ctype.of)}, ({ctype.array_size},))"
+        case _:
+            return f"\"{numpy_format_for_ctype_kind[ctype.kind][0]}\""
+
+
 def default_attribute_string_from_ctype_kind(kind: CTypeKind) -> str:
     match kind:
         case CTypeKind.Void:
@@ -111,13 +145,23 @@ def default_attribute_string_from_ctype_kind(kind: CTypeKind) -> str:
 def generate_struct_code(struct_api) -> str:
     string: str = ""
     struct_: CTypeStruct = parse_struct_json_to_CTypeStruct(struct_api)
-    struct_.calculate_size()
-    struct_name_size_pars.append((struct_.name, struct_.size))
+    struct_.calculate_layout()
+    add_struct_name_size_par(struct_.name, struct_.size, struct_.alignment)
 
     string += f"class {struct_api['name']}:\n"
     string += f"    \"\"\"{struct_api['description']}\"\"\"\n\n"
+    # instances only hold the wasm address and two flags, slots keep them small and out of a __dict__
+    string += f"    __slots__ = (\"_frozen\", \"_address\", \"_to_free\")\n\n"
     # add size member variable
-    string += f"    _size: int = {struct_.size}\n\n"
+    string += f"    _size: int = {struct_.size}\n"
+
+    # add numpy dtype description, used by StructArray numpy views
+    quoted_names: list[str] = [f"\"{member_json['name']}\"" for member_json in struct_api['fields']]
+    string += f"    _dtype_spec: dict = {{"
+    string += f"\"names\": [{', '.join(quoted_names)}], "
+    string += f"\"formats\": [{', '.join(numpy_format_string_for_ctype(member_ctype) for member_ctype in struct_.members)}], "
+    string += f"\"offsets\": {struct_.offsets}, "
+    string += f"\"itemsize\": {struct_.size}}}\n\n"
 
     # add init method
     string += f"    def __init__(self, "
@@ -142,20 +186,19 @@ def generate_struct_code(struct_api) -> str:
     string += f"            self._address = address\n"
     string += f"            self._to_free = False\n"
     string += f"        else:\n"
-    string += f"            self._address = _mod._malloc({struct_.size})\n"
-    string += f"            self._to_free = True\n"
+    string += f"            self._address = _struct_pool.alloc({struct_.size})\n"
+    string += f"            self._to_free = _struct_pool\n"
 
     # set self values
-    offset: int = 0
-    for member_ctype, member_json in zip(struct_.members, struct_api['fields']):
+    for member_ctype, member_json, offset in zip(struct_.members, struct_api['fields'], struct_.offsets):
         if member_ctype.kind != CTypeKind.Struct and member_ctype.kind != CTypeKind.Array:
-            string += f"            _mod.mem.{emscripten_XXXType_string_for_ctype_kind(member_ctype.kind, False)}" \
-                      f"(self._address + {offset}, {member_json['name']}, True)\n"
+            string += f"            {heap_member_set_string(member_ctype.kind, offset, member_json['name'])}\n"
         else:
             string += f"            if {member_json['name']} is not None:\n"
             string += f"                struct_clone({member_json['name']}, self._address + {offset})\n"
-
-        offset += get_ctype_size(member_ctype)
+            # pooled memory is reused, so members that are not given can't rely on fresh memory
+            string += f"            else:\n"
+            string += f"                _heap.u8.fill(0, self._address + {offset}, self._address + {offset + get_ctype_size(member_ctype)})\n"
 
     string += '\n'
 
@@ -173,22 +216,19 @@ def generate_struct_code(struct_api) -> str:
             return ""  # TODO: implement struct code_generation for structs that has members of array type"""
 
     # add setters and getters
-    offset = 0
-    for member_ctype, member_json in zip(struct_.members, struct_api['fields']):
+    for member_ctype, member_json, offset in zip(struct_.members, struct_api['fields'], struct_.offsets):
         if member_ctype.kind != CTypeKind.Struct and member_ctype.kind != CTypeKind.Array:
             # getter
             string += f"    @property\n"
             string += f"    def {member_json['name']}(self):\n"
             string += f"        \"\"\"{member_json['description']}\"\"\"\n"
-            string += f"        return _mod.mem.{emscripten_XXXType_string_for_ctype_kind(member_ctype.kind, True)}" \
-                      f"(self._address + {offset}, True)\n\n"
+            string += f"        return {heap_member_get_string(member_ctype.kind, offset)}\n\n"
 
             # setter
             string += f"    @{member_json['name']}.setter\n"
             string += f"    def {member_json['name']}(self, value):\n"
             string += f"        if not self._frozen:\n"
-            string += f"            _mod.mem.{emscripten_XXXType_string_for_ctype_kind(member_ctype.kind, False)}" \
-                      f"(self._address + {offset}, value, True)\n\n"
+            string += f"            {heap_member_set_string(member_ctype.kind, offset, 'value')}\n\n"
         else:
             type_hint: str = struct_member_to_python_type_hint(member_ctype)
             # getter
@@ -207,7 +247,7 @@ def generate_struct_code(struct_api) -> str:
             string += f"        if not self._frozen:\n"
             string += f"            struct_clone(value, self._address + {offset})\n\n"
 
-        offset += get_ctype_size(member_ctype)
+    string += structs_methods.get(struct_api['name'], "").lstrip('\n')
 
     # add __str__ method
     string += f"    def __str__(self):\n"
@@ -221,7 +261,74 @@ def generate_struct_code(struct_api) -> str:
     # add __del__ method
     string += "    def __del__(self):\n"
     string += "        if self._to_free:\n"
-    string += "            _mod._free(self._address)\n\n"
+    string += f"            self._to_free.release(self._address, {struct_.size})\n\n"
+
+    return string
+
+
+def generate_shadow_struct_code(struct_api) -> str:
+    struct_: CTypeStruct = parse_struct_json_to_CTypeStruct(struct_api)
+    struct_.calculate_layout()
+    names: list[str] = [member_json['name'] for member_json in struct_api['fields']]
+
+    string: str = ""
+    string += f"class {struct_api['name']}Shadow:\n"
+    string += f"    \"\"\"{struct_api['description']}, fields are python numbers copied into wasm memory " \
+              f"only when passed to a function\"\"\"\n\n"
+    string += f"    __slots__ = ({', '.join(f'{chr(34)}{name}{chr(34)}' for name in names)}, " \
+              f"\"_written\", \"_slot\", \"_frame\")\n\n"
+    string += f"    _size: int = {struct_.size}\n"
+    string += f"    _struct = {struct_api['name']}\n\n"
+
+    # add init method
+    string += f"    def __init__(self, "
+    for member_ctype, name in zip(struct_.members, names):
+        string += f"{name}: {struct_member_to_python_type_hint(member_ctype)} = " \
+                  f"{default_attribute_string_from_ctype_kind(member_ctype.kind)}, "
+    string = string[:-2] + "):\n"
+    for name in names:
+        string += f"        self.{name} = {name}\n"
+    string += f"        self._written = None  # the field values last copied into wasm memory\n"
+    string += f"        self._slot = 0\n"
+    string += f"        self._frame = -1\n\n"
+
+    # wrappers pass struct arguments by their address, so the copy happens here
+    string += f"    @property\n"
+    string += f"    def _address(self):\n"
+    string += f"        \"\"\"Address of a copy of the fields in wasm memory, valid until the end of the frame\"\"\"\n"
+    string += f"        values = ({', '.join(f'self.{name}' for name in names)})\n"
+    string += f"        if values != self._written or self._frame != _scratch_arena.frame:\n"
+    # a new slot on every change, the command buffer may still have to read the previous one
+    string += f"            address = _scratch_arena.alloc({struct_.size})\n"
+    for i, (member_ctype, offset) in enumerate(zip(struct_.members, struct_.offsets)):
+        assert is_heap_offset_aligned(member_ctype.kind, offset), "shadow structs are for structs of aligned numbers"
+        string += f"            {heap_item_string(member_ctype.kind, 'address', offset)} = values[{i}]\n"
+    string += f"            self._written = values\n"
+    string += f"            self._slot = address\n"
+    string += f"            self._frame = _scratch_arena.frame\n"
+    string += f"        return self._slot\n\n"
+
+    # add conversions
+    string += f"    @classmethod\n"
+    string += f"    def from_struct(cls, value: {struct_api['name']}):\n"
+    string += f"        \"\"\"Shadow copy of a {struct_api['name']}\"\"\"\n"
+    string += f"        return cls({', '.join(f'value.{name}' for name in names)})\n\n"
+
+    # out= of the functions that return the struct
+    string += f"    def _assign(self, value: {struct_api['name']}):\n"
+    string += f"        \"\"\"Set the fields to the ones of a {struct_api['name']}\"\"\"\n"
+    string += f"        {', '.join(f'self.{name}' for name in names)} = " \
+              f"{', '.join(f'value.{name}' for name in names)}\n\n"
+
+    string += f"    def to_struct(self) -> {struct_api['name']}:\n"
+    string += f"        \"\"\"{struct_api['name']} in wasm memory with the same fields\"\"\"\n"
+    string += f"        return {struct_api['name']}({', '.join(f'self.{name}' for name in names)})\n\n"
+
+    # add __str__ method
+    string += f"    def __str__(self):\n"
+    string += f"        return f\"{struct_api['name']}Shadow("
+    string += ", ".join("{self." + name + "}" for name in names)
+    string += ")\"\n\n"
 
     return string
 
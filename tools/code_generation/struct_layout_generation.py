@@ -0,0 +1,74 @@
+struct_layout_check_string: str = \
+    """
+import warnings
+
+
+def check_struct_layouts(structs: list) -> list[str]:
+    \"\"\"Compare the size and member offsets of struct classes with sizeof/offsetof in the wasm, warns about and returns the mismatches
+
+    structs is a list of (struct class, index of its sizeof in the wasm table), every module checks its own structs\"\"\"
+    if not _is_wasm_function_exported(_GetStructLayouts):
+        return []  # the wasm was built without the layout table, warned about once
+
+    address = _GetStructLayouts()
+    count = _heap.i32[address >> 2]
+    layouts = array.array("i", bytes(4 * count))
+    _heap.u8.subarray(address + 4, address + 4 + 4 * count).assign_to(memoryview(layouts).cast("B"))
+
+    mismatches = []
+    for stype, index in structs:
+        expected = [stype._size] + stype._dtype_spec["offsets"]
+        actual = layouts[index:index + len(expected)].tolist()
+        if actual != expected:
+            mismatches.append(f"{stype.__name__}: [size, offsets...] is {actual} in wasm but {expected} in python")
+
+    for mismatch in mismatches:
+        warnings.warn(f"struct layout mismatch, {mismatch}")
+    return mismatches
+"""
+
+
+# the export of raylib.c the check calls, bound in core with the exports of its functions
+struct_layout_wasm_functions_names: list[str] = ["_GetStructLayouts"]
+
+
+def struct_layout_indexes(structs_api) -> dict[str, int]:
+    """return the index of the sizeof of each struct in StructLayouts, after the count"""
+    indexes: dict[str, int] = {}
+    index: int = 0
+    for struct_api in structs_api:
+        indexes[struct_api['name']] = index
+        index += 1 + len(struct_api['fields'])
+    return indexes
+
+
+def generate_struct_layout_check_code(structs_api, all_structs_api) -> str:
+    string: str = ""
+    indexes: dict[str, int] = struct_layout_indexes(all_structs_api)
+    string += "# index of the struct in StructLayouts of src/raylib_structs.h\n"
+    string += "check_struct_layouts([\n"
+    for struct_api in structs_api:
+        string += f"    ({struct_api['name']}, {indexes[struct_api['name']]}),\n"
+    string += "])\n\n"
+
+    return string
+
+
+def generate_struct_layout_header(structs_api) -> str:
+    string: str = ""
+    string += "// Generated by tools/code_generation/filesGeneration.py, do not edit by hand\n"
+    string += "// Layout of the raylib structs as the C compiler sees it, the python wrapper checks its own layout against it\n\n"
+    string += "#pragma once\n\n"
+    string += "#include <stddef.h>\n\n"
+    string += "// the number of values that follow, then for every struct: sizeof, then offsetof of each member\n"
+    string += "static const int StructLayouts[] = {\n"
+    count: int = sum(1 + len(struct_api['fields']) for struct_api in structs_api)
+    string += f"  {count},\n"
+    for struct_api in structs_api:
+        string += f"  sizeof({struct_api['name']}),"
+        for field in struct_api['fields']:
+            string += f" offsetof({struct_api['name']}, {field['name']}),"
+        string += "\n"
+    string += "};\n"
+
+    return string
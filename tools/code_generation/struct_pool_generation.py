@@ -0,0 +1,57 @@
+struct_pool_string: str = \
+    """
+class StructPool:
+    \"\"\"Free lists of wasm allocations by size class, so structs are not malloc-ed and freed every time\"\"\"
+
+    def __init__(self, mod, max_free_per_class: int = 4096):
+        self._mod = mod  # its own wasm module, structs can be collected while another context is active
+        self._free_lists = {}  # size class -> addresses ready to be reused
+        self._max_free_per_class = max_free_per_class
+        self.counters = {"malloc": 0, "free": 0, "reused": 0, "released": 0}
+
+    def alloc(self, size: int) -> int:
+        size_class = (size + 7) & ~7
+        free_list = self._free_lists.get(size_class)
+        if free_list:
+            self.counters["reused"] += 1
+            return free_list.pop()
+        self.counters["malloc"] += 1
+        return self._mod._malloc(size_class)
+
+    def release(self, address: int, size: int):
+        size_class = (size + 7) & ~7
+        free_list = self._free_lists.setdefault(size_class, [])
+        if len(free_list) < self._max_free_per_class:
+            self.counters["released"] += 1
+            free_list.append(address)
+        else:
+            self.counters["free"] += 1
+            self._mod._free(address)
+
+    def free(self, address: int):
+        \"\"\"Free memory of the same wasm module that is not pooled (arrays)\"\"\"
+        self._mod._free(address)
+
+
+_struct_pool = StructPool(_mod)
+
+
+def get_allocation_counters() -> dict:
+    \"\"\"Get how many struct allocations went to malloc/free and how many were served by the pool\"\"\"
+    return dict(_struct_pool.counters)
+
+
+def reset_allocation_counters():
+    \"\"\"Set the struct allocation counters back to 0\"\"\"
+    for name in _struct_pool.counters:
+        _struct_pool.counters[name] = 0
+
+
+def _new_struct(stype):
+    \"\"\"New stype instance in pooled memory that is left uninitialized, for values the wasm writes (return values)\"\"\"
+    out = stype.__new__(stype)
+    out._frozen = False
+    out._address = _struct_pool.alloc(stype._size)
+    out._to_free = _struct_pool
+    return out
+"""
@@ -0,0 +1,206 @@
+text_layout_string: str = \
+    """
+import collections
+import struct
+
+
+class TextLayout(WasmArray):
+    \"\"\"A text laid out once by LayoutText in raylib.c: its line breaks in width (not wrapped if width is 0) and the
+    glyph and position of each character, drawn with one call into wasm\"\"\"
+
+    def __init__(self, font: Font, text: str, font_size: float, spacing: float, width: float = 0.0):
+        # TextLayoutGlyph of raylib.c: the glyph index and its x, y, no more of them than characters
+        super(TextLayout, self).__init__(12, max(len(text), 1))
+        self.font = font  # kept alive with its address, the glyphs are drawn from it
+        self.font_size = font_size
+        if not _is_wasm_function_exported(_LayoutText):
+            self._count, self.width, self.height = self._lay_out(text, spacing, width)
+            return
+        size = _scratch_arena.alloc(8)
+        self._count = _LayoutText(font._address, _scratch_arena.string(text), font_size, spacing, width,
+                                  self._address, self._length, size)
+        self.width = _heap.f32[size >> 2]
+        self.height = _heap.f32[(size + 4) >> 2]
+
+    def _lay_out(self, text: str, spacing: float, width: float) -> tuple:
+        \"\"\"LayoutText of raylib.c in python, for a raylib wasm without it: the glyph count, width and height\"\"\"
+        font_glyphs = _text_layouts.font_glyphs(self.font)
+        if not font_glyphs.advances:
+            return 0, 0.0, 0.0  # a font without glyphs, not loaded
+        scale = self.font_size / font_glyphs.base_size
+        line_height = font_glyphs.base_size * 1.5 * scale
+        glyphs = []
+        line_start = 0
+        word_start = -1
+        x = y = 0.0
+        for codepoint in map(ord, text):
+            if codepoint == 10:  # new line
+                x = 0.0
+                y += line_height
+                line_start = len(glyphs)
+                word_start = -1
+                continue
+            index = font_glyphs.index(codepoint)
+            advance = font_glyphs.advances[index] * scale
+            if codepoint in (32, 9):  # space or tab
+                if x > 0.0:
+                    x += advance + spacing  # no leading spaces
+                word_start = len(glyphs)
+                continue
+            if width > 0.0 and x + advance > width and len(glyphs) > line_start:
+                first = word_start if word_start > line_start else len(glyphs)
+                shift = glyphs[first][1] if first < len(glyphs) else x
+                glyphs[first:] = [(g, gx - shift, gy + line_height) for g, gx, gy in glyphs[first:]]
+                x -= shift
+                y += line_height
+                line_start = first
+                word_start = -1
+            glyphs.append((index, x, y))
+            x += advance + spacing
+        if glyphs:
+            data = b"".join(_text_layout_glyph.pack(*glyph) for glyph in glyphs)
+            _heap.u8.subarray(self._address, self._address + len(data)).assign(data)
+        text_width = max((gx + font_glyphs.advances[g] * scale for g, gx, gy in glyphs), default=0.0)
+        return len(glyphs), text_width, y + self.font_size if text else 0.0
+
+    def draw(self, x: float, y: float, tint: Color):
+        \"\"\"Draw the text with its top left at (x, y)\"\"\"
+        _command_buffer.flush()  # the draw calls recorded before are drawn first
+        if not _is_wasm_function_exported(_DrawTextLayout):
+            self._draw_each(x, y, tint)
+            return
+        _DrawTextLayout(self.font._address, self._address, self._count, self.font_size, x, y, tint._address)
+
+    def _draw_each(self, x: float, y: float, tint: Color):
+        \"\"\"DrawTexturePro for each glyph, for a raylib wasm without DrawTextLayout\"\"\"
+        if not self._count:
+            return
+        font_glyphs = _text_layouts.font_glyphs(self.font)
+        scale = self.font_size / font_glyphs.base_size
+        padding = font_glyphs.padding
+        data = bytearray(12 * self._count)
+        _heap.u8.subarray(self._address, self._address + len(data)).assign_to(data)
+        # the source and dest rectangles of each glyph in turn, then the origin (0, 0)
+        rectangles = _scratch_arena.alloc(40)
+        _heap.u8.subarray(rectangles + 32, rectangles + 40).assign(bytes(8))
+        texture = self.font._address + 12
+        for index, glyph_x, glyph_y in _text_layout_glyph.iter_unpack(data):
+            rec_x, rec_y, rec_width, rec_height = font_glyphs.recs[index]
+            offset_x, offset_y = font_glyphs.offsets[index]
+            source_width = rec_width + 2.0 * padding
+            source_height = rec_height + 2.0 * padding
+            _heap.u8.subarray(rectangles, rectangles + 32).assign(_text_layout_rectangles.pack(
+                rec_x - padding, rec_y - padding, source_width, source_height,
+                x + glyph_x + (offset_x - padding) * scale, y + glyph_y + (offset_y - padding) * scale,
+                source_width * scale, source_height * scale))
+            _DrawTexturePro(texture, rectangles, rectangles + 16, rectangles + 32, 0.0, tint._address)
+
+
+_text_layout_glyph = struct.Struct("<iff")  # TextLayoutGlyph of raylib.c
+_text_layout_rectangles = struct.Struct("<8f")
+
+
+class _FontGlyphs:
+    \"\"\"The glyph metrics of a font read from wasm memory at once, for the text layouts of a raylib wasm without
+    LayoutText and DrawTextLayout\"\"\"
+
+    def __init__(self, font: Font):
+        self.base_size = font.baseSize
+        self.padding = float(font.glyphPadding)
+        count = font.glyphCount
+        glyphs = bytearray(36 * count)  # GlyphInfo: value, offsetX, offsetY, advanceX, then its image
+        _heap.u8.subarray(font.glyphs, font.glyphs + len(glyphs)).assign_to(glyphs)
+        recs = bytearray(16 * count)
+        _heap.u8.subarray(font.recs, font.recs + len(recs)).assign_to(recs)
+        self.recs = list(struct.iter_unpack("<4f", recs))
+        self.offsets = []
+        self.advances = []
+        self._indexes = {}
+        for index, (value, offset_x, offset_y, advance_x) in enumerate(struct.iter_unpack("<4i20x", glyphs)):
+            self._indexes.setdefault(value, index)
+            self.offsets.append((offset_x, offset_y))
+            self.advances.append(float(advance_x) if advance_x else self.recs[index][2])
+        self._fallback = self._indexes.get(63, 0)  # '?', like GetGlyphIndex
+
+    def index(self, codepoint: int) -> int:
+        \"\"\"GetGlyphIndex of raylib\"\"\"
+        return self._indexes.get(codepoint, self._fallback)
+
+
+class TextLayoutCache:
+    \"\"\"The layouts of the texts drawn lately, by font, text, size, spacing and width, the least recently used are
+    dropped past capacity\"\"\"
+
+    def __init__(self, capacity: int = 512):
+        self.capacity = capacity
+        self._layouts = collections.OrderedDict()
+        self.counters = {"hits": 0, "misses": 0}
+        self._fonts = {}  # the _FontGlyphs by the glyphs of their font, for a raylib wasm without LayoutText
+
+    def get(self, font: Font, text: str, font_size: float, spacing: float, width: float) -> TextLayout:
+        # the glyphs of a font identify it while it is loaded, unload_font() invalidates its layouts
+        key = (font.glyphs, text, font_size, spacing, width)
+        layout = self._layouts.get(key)
+        if layout is not None:
+            self._layouts.move_to_end(key)
+            self.counters["hits"] += 1
+            return layout
+        self.counters["misses"] += 1
+        layout = self._layouts[key] = TextLayout(font, text, font_size, spacing, width)
+        if len(self._layouts) > self.capacity:
+            self._layouts.popitem(last=False)
+        return layout
+
+    def font_glyphs(self, font: Font) -> _FontGlyphs:
+        \"\"\"Get the glyph metrics of font, read once while it is loaded\"\"\"
+        font_glyphs = self._fonts.get(font.glyphs)
+        if font_glyphs is None:
+            font_glyphs = self._fonts[font.glyphs] = _FontGlyphs(font)
+        return font_glyphs
+
+    def invalidate(self, font: Font = None):
+        \"\"\"Drop the layouts of font, or all of them\"\"\"
+        if font is None:
+            self._layouts.clear()
+            self._fonts.clear()
+            return
+        glyphs = font.glyphs
+        self._fonts.pop(glyphs, None)
+        for key in [key for key in self._layouts if key[0] == glyphs]:
+            del self._layouts[key]
+
+
+_text_layouts = TextLayoutCache()
+
+
+def layout_text(font: Font, text: str, font_size: float, spacing: float, width: float = 0.0) -> TextLayout:
+    \"\"\"Get the layout of text, wrapped at the spaces in lines of at most width (0: only at \\\\n), from the cache
+    if it was laid out lately: its width and height, or draw() it\"\"\"
+    return _text_layouts.get(font, text, font_size, spacing, width)
+
+
+def draw_text_layout(font: Font, text: str, x: float, y: float, font_size: float, spacing: float, width: float,
+                     tint: Color):
+    \"\"\"Draw text wrapped in lines of at most width (0: only at \\\\n), laid out once while it is drawn every frame\"\"\"
+    _text_layouts.get(font, text, font_size, spacing, width).draw(x, y, tint)
+
+
+def invalidate_text_layouts(font: Font = None):
+    \"\"\"Drop the cached layouts of font, or all of them, unload_font() drops the ones of the font it unloads\"\"\"
+    _text_layouts.invalidate(font)
+
+
+def set_text_layouts_capacity(capacity: int):
+    \"\"\"Set how many text layouts are cached\"\"\"
+    _text_layouts.capacity = capacity
+    while len(_text_layouts._layouts) > capacity:
+        _text_layouts._layouts.popitem(last=False)
+
+
+def get_text_layout_counters() -> dict:
+    \"\"\"Get how many text layouts came from the cache (hits) and how many were laid out (misses)\"\"\"
+    return dict(_text_layouts.counters)
+"""
+
+# the exports of raylib.c the text layouts call, bound in core with the exports of its functions
+text_layout_wasm_functions_names: list[str] = ["_LayoutText", "_DrawTextLayout", "_DrawTexturePro"]
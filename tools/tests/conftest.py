@@ -0,0 +1,14 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'benchmarks'))
+
+from run_benchmarks import load_wrapper
+
+
+@pytest.fixture
+def wasmraypy():
+    """the wrapper package, imported on a new mock wasm"""
+    return load_wrapper()
@@ -0,0 +1,40 @@
+import importlib
+
+
+class MockAssets:
+    """the AssetLoader of python-raylib-web.js, every asset fetched as soon as it is asked for"""
+
+    def __init__(self):
+        self.finished = 0
+        self.urls = {}
+        self.released = []
+
+    def load(self, url: str, path: str = None) -> int:
+        asset_id = len(self.urls) + 1
+        self.urls[asset_id] = url
+        self.finished += 1
+        return asset_id
+
+    def status(self, asset_id: int) -> int:
+        return 1
+
+    def release(self, asset_id: int):
+        self.released.append(asset_id)
+
+
+def test_poll_fails_only_the_asset_a_decoder_fails(wasmraypy):
+    assets = importlib.import_module("wasmraypy.assets")
+    wasmraypy.core._mod.assets = MockAssets()
+    loader = assets.AssetLoader(decode_budget=1.0)
+
+    def broken_decoder(loader, asset_id, url, path):
+        raise RuntimeError("broken")
+
+    broken = loader._load("broken.bin", broken_decoder)
+    file = loader.file("data.bin")
+    loader.poll()
+
+    assert broken.error == "broken.bin: RuntimeError: broken"
+    assert file.value == "/assets/data.bin"
+    assert loader.done
+    loader.poll()  # nothing left to decode
@@ -0,0 +1,25 @@
+import importlib
+
+import numpy
+import pytest
+
+
+@pytest.fixture
+def raymath(wasmraypy):
+    return importlib.import_module("raymath")
+
+
+def test_struct_array_next_to_a_numpy_array(wasmraypy, raymath):
+    v1 = wasmraypy.StructArray(wasmraypy.Vector2, 2)
+    v1[:] = numpy.array([[1, 2], [3, 4]], numpy.float32)
+    result = raymath.vector2_add_array(v1, numpy.array([[10, 20], [30, 40]], numpy.float32))
+    assert isinstance(result, wasmraypy.StructArray)
+    assert result.as_numpy().tolist() == [(11, 22), (33, 44)]
+
+
+def test_struct_arrays_of_another_struct(wasmraypy, raymath):
+    v1 = wasmraypy.StructArray(wasmraypy.Vector2, 2)
+    with pytest.raises(TypeError):
+        raymath.vector2_add_array(v1, wasmraypy.StructArray(wasmraypy.Vector3, 2))
+    with pytest.raises(TypeError):
+        raymath.vector2_lerp_array(v1, wasmraypy.StructArray(wasmraypy.Vector3, 2), 0.5)
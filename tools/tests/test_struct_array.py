@@ -0,0 +1,51 @@
+import numpy
+import pytest
+
+
+def items(vectors) -> list[tuple]:
+    return [(vectors[i].x, vectors[i].y) for i in range(len(vectors))]
+
+
+def test_slice_assignment_of_struct_instances(wasmraypy):
+    vectors = wasmraypy.StructArray(wasmraypy.Vector2, 4)
+    vectors[1:4] = [wasmraypy.Vector2(1, 2), wasmraypy.Vector2Shadow(3, 4), wasmraypy.Vector2(5, 6)]
+    assert items(vectors) == [(0, 0), (1, 2), (3, 4), (5, 6)]
+
+
+def test_slice_assignment_of_a_struct_array(wasmraypy):
+    source = wasmraypy.StructArray(wasmraypy.Vector2, 2)
+    source[:] = [(1, 2), (3, 4)]
+    vectors = wasmraypy.StructArray(wasmraypy.Vector2, 3)
+    vectors[1:] = source
+    assert items(vectors) == [(0, 0), (1, 2), (3, 4)]
+
+    with pytest.raises(TypeError):
+        vectors[:1] = wasmraypy.StructArray(wasmraypy.Vector3, 1)
+
+
+def test_slice_assignment_of_float_rows(wasmraypy):
+    vectors = wasmraypy.StructArray(wasmraypy.Vector2, 3)
+    vectors[1:] = numpy.array([[1, 2], [3, 4]], numpy.float32)
+    assert items(vectors) == [(0, 0), (1, 2), (3, 4)]
+
+    vectors[:2] = numpy.array([[5, 6], [7, 8]])  # converted to float32
+    assert items(vectors) == [(5, 6), (7, 8), (3, 4)]
+
+    colors = wasmraypy.StructArray(wasmraypy.Color, 1)
+    colors[:] = numpy.array([[1, 2, 3, 4]], numpy.uint8)
+    assert (colors[0].r, colors[0].g, colors[0].b, colors[0].a) == (1, 2, 3, 4)
+
+
+def test_slice_assignment_of_the_wrong_count(wasmraypy):
+    vectors = wasmraypy.StructArray(wasmraypy.Vector2, 3)
+    with pytest.raises(ValueError):
+        vectors[:] = [wasmraypy.Vector2(1, 2)]
+    with pytest.raises(ValueError):
+        vectors[:] = numpy.zeros((3, 3), numpy.float32)  # rows of Vector3
+
+
+def test_iteration(wasmraypy):
+    vectors = wasmraypy.StructArray(wasmraypy.Vector2, 2)
+    vectors[:] = [(1, 2), (3, 4)]
+    assert [(vector.x, vector.y) for vector in vectors] == [(1, 2), (3, 4)]
+    assert list(wasmraypy.FloatArray(3)) == [0, 0, 0]
@@ -0,0 +1,34 @@
+import importlib
+
+import pytest
+
+
+@pytest.fixture
+def shapes(wasmraypy, monkeypatch):
+    """the shapes module, with a GetCollisionRec that returns the rectangle 1, 2, 3, 4"""
+    shapes = importlib.import_module("wasmraypy.shapes")
+    f32 = wasmraypy.core._heap.f32
+
+    def get_collision_rec(address, rec1_address, rec2_address):
+        for i, value in enumerate((1.0, 2.0, 3.0, 4.0)):
+            f32[(address >> 2) + i] = value
+
+    monkeypatch.setitem(shapes.__dict__, "_GetCollisionRec", get_collision_rec)
+    return shapes
+
+
+def fields(rectangle) -> tuple:
+    return rectangle.x, rectangle.y, rectangle.width, rectangle.height
+
+
+@pytest.mark.parametrize("out_type", ["Rectangle", "RectangleShadow"])
+def test_out(wasmraypy, shapes, out_type):
+    out = getattr(wasmraypy, out_type)()
+    assert shapes.get_collision_rec(wasmraypy.Rectangle(), wasmraypy.Rectangle(), out=out) is out
+    assert fields(out) == (1, 2, 3, 4)
+
+
+def test_out_that_is_an_argument(wasmraypy, shapes):
+    rec1 = wasmraypy.Rectangle()
+    assert shapes.get_collision_rec(rec1, wasmraypy.Rectangle(), out=rec1) is rec1
+    assert fields(rec1) == (1, 2, 3, 4)
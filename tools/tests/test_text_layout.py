@@ -0,0 +1,53 @@
+import importlib
+import struct
+
+import pytest
+
+
+@pytest.fixture
+def core(wasmraypy, monkeypatch):
+    """the core module of a raylib wasm without LayoutText and DrawTextLayout, DrawTexturePro recording its calls"""
+    core = importlib.import_module("wasmraypy.core")
+    monkeypatch.setitem(core.__dict__, "_LayoutText", core._missing_wasm_function("_LayoutText"))
+    monkeypatch.setitem(core.__dict__, "_DrawTextLayout", core._missing_wasm_function("_DrawTextLayout"))
+    core.draws = []
+
+    def draw_texture_pro(texture, source, dest, origin, rotation, tint):
+        core.draws.append(([core._heap.f32[(source >> 2) + i] for i in range(4)],
+                           [core._heap.f32[(dest >> 2) + i] for i in range(4)]))
+
+    monkeypatch.setitem(core.__dict__, "_DrawTexturePro", draw_texture_pro)
+    core._text_layouts.invalidate()
+    return core
+
+
+def font_of(core, codepoints: str):
+    """a font of base size 10, each glyph 10 wide (advanceX 0) and at x 10 * its index in the texture"""
+    font = core.Font()
+    font.baseSize = 10
+    font.glyphCount = len(codepoints)
+    font.glyphs = core._mod._malloc(36 * len(codepoints))
+    font.recs = core._mod._malloc(16 * len(codepoints))
+    for index, codepoint in enumerate(codepoints):
+        core._heap.u8.subarray(font.glyphs + 36 * index, font.glyphs + 36 * index + 16).assign(
+            struct.pack("<4i", ord(codepoint), 0, 1, 0))
+        core._heap.u8.subarray(font.recs + 16 * index, font.recs + 16 * index + 16).assign(
+            struct.pack("<4f", 10 * index, 0, 10, 10))
+    return font
+
+
+def test_layout_wraps_at_spaces(core):
+    font = font_of(core, "ab ?")
+    layout = core.layout_text(font, "ab ab\nb", 20, 0, 100)
+    # 20 wide glyphs at font size 20, "ab ab" is 100 wide and fits, \n starts a line 30 lower
+    assert (layout._count, layout.width, layout.height) == (5, 100, 50)
+    wrapped = core.layout_text(font, "ab ab", 20, 0, 90)
+    assert (wrapped._count, wrapped.width, wrapped.height) == (4, 40, 50)
+    assert core.layout_text(font, "", 20, 0, 90).height == 0
+
+
+def test_draw_glyph_by_glyph(core):
+    font = font_of(core, "ab ?")
+    core.draw_text_layout(font, "bz", 5, 6, 20, 1, 0, core.Color())
+    # z isn't in the font, it is drawn as '?'
+    assert core.draws == [([10, 0, 10, 10], [5, 8, 20, 20]), ([30, 0, 10, 10], [26, 8, 20, 20])]